@@ -80,6 +80,12 @@ except ImportError as e:
     def profile_function(name): return lambda f: f  # Decorator passthrough
     def monitor_performance(func): return func  # Decorator passthrough
 
+# Rerun cost management: per-session query memo and render block timings
+from utils.app_resources import (
+    session_query, invalidate_session_queries, render_block,
+    start_rerun_timings, render_timing_overlay
+)
+
 # License management imports - PROTECTED
 try:
     from services.license_integration import (
@@ -260,6 +266,7 @@ try:
     # Compatibility wrapper functions with proper signatures
     def track_scan_completed_wrapper_safe(scanner_type, user_id, session_id, findings_count=0, files_scanned=0, compliance_score=0, **kwargs):
         """Safe wrapper for scan completion tracking"""
+        invalidate_session_queries()  # dashboard/results/history must show the new scan
         try:
             username = st.session_state.get('username', user_id)
             return activity_track_completed(
@@ -484,6 +491,8 @@ def main():
                 # Use st.rerun() but don't call set_page_config again on rerun
                 st.rerun()
             
+            start_rerun_timings()
+            
             # Initialize internationalization and basic session state
             from utils.i18n import initialize, detect_browser_language
             
@@ -503,18 +512,20 @@ def main():
                 st.session_state.language = detected_lang
             
             # Initialize i18n system (cached)
-            initialize()
+            with render_block("i18n"):
+                initialize()
             
             # Initialize enterprise integration (process-global, non-breaking)
-            try:
-                from services.enterprise_orchestrator import initialize_enterprise_integration
-                # This function now handles process-global singleton initialization internally
-                initialize_enterprise_integration(use_redis=False)
-                logger.info("Enterprise integration initialized successfully")
-            except ImportError:
-                logger.debug("Enterprise integration not available (development mode)")
-            except Exception as e:
-                logger.warning(f"Enterprise integration initialization failed: {e}")
+            with render_block("enterprise integration"):
+                try:
+                    from services.enterprise_orchestrator import initialize_enterprise_integration
+                    # This function now handles process-global singleton initialization internally
+                    initialize_enterprise_integration(use_redis=False)
+                    logger.info("Enterprise integration initialized successfully")
+                except ImportError:
+                    logger.debug("Enterprise integration not available (development mode)")
+                except Exception as e:
+                    logger.warning(f"Enterprise integration initialization failed: {e}")
             
             if 'authenticated' not in st.session_state:
                 st.session_state.authenticated = False
@@ -529,12 +540,18 @@ def main():
                 streamlit_session.init_session(st.session_state.get('username', 'unknown'), user_data)
             
             # Check authentication status with JWT validation
-            if not is_authenticated():
-                render_landing_page()
+            with render_block("authentication"):
+                authenticated = is_authenticated()
+            if not authenticated:
+                with render_block("landing page"):
+                    render_landing_page()
+                render_timing_overlay()
                 return
             
             # Initialize license check after authentication
-            if not require_license_check():
+            with render_block("license check"):
+                license_ok = require_license_check()
+            if not license_ok:
                 return  # License check will handle showing upgrade prompt
             
             # Track page view activity
@@ -542,7 +559,9 @@ def main():
                 streamlit_session.track_scan_activity('page_view', {'page': 'dashboard'})
             
             # Authenticated user interface
-            render_authenticated_interface()
+            with render_block("authenticated interface"):
+                render_authenticated_interface()
+            render_timing_overlay()
             
         except Exception as e:
             # Comprehensive error handling with profiling
@@ -1133,57 +1152,54 @@ def render_authenticated_interface():
     
     # Language-aware navigation mapping to prevent state loss during language switching
     # Create mapping from all possible language variants to internal keys
+    from utils.i18n import get_language_translations
     nav_mapping = {}
     for lang_code in ['en', 'nl']:
-        try:
-            with open(f'translations/{lang_code}.json', 'r', encoding='utf-8') as f:
-                temp_translations = json.load(f)
-                
-                # Map all possible navigation texts to internal keys
-                if 'sidebar' in temp_translations:
-                    nav_mapping[temp_translations['sidebar'].get('dashboard', '')] = 'dashboard'
-                    nav_mapping[temp_translations['sidebar'].get('settings', '')] = 'settings'
-                    nav_mapping[temp_translations['sidebar'].get('privacy_rights', '')] = 'privacy_rights'
-                if 'scan' in temp_translations:
-                    nav_mapping[temp_translations['scan'].get('new_scan_title', '')] = 'scan'
-                    nav_mapping[temp_translations['scan'].get('title', '')] = 'scan'
-                if 'results' in temp_translations:
-                    nav_mapping[temp_translations['results'].get('title', '')] = 'results'
-                if 'history' in temp_translations:
-                    nav_mapping[temp_translations['history'].get('title', '')] = 'history'
-                if 'admin' in temp_translations:
-                    nav_mapping[temp_translations['admin'].get('title', '')] = 'admin'
-                    
-                # Additional common navigation terms
-                nav_mapping['Dashboard'] = 'dashboard'
-                nav_mapping['🏠 Dashboard'] = 'dashboard'
-                nav_mapping['New Scan'] = 'scan'
-                nav_mapping['🔍 New Scan'] = 'scan'
-                nav_mapping['Nieuwe Scan'] = 'scan'
-                nav_mapping['Results'] = 'results'
-                nav_mapping['📊 Results'] = 'results'
-                nav_mapping['Resultaten'] = 'results'
-                nav_mapping['History'] = 'history'
-                nav_mapping['📋 History'] = 'history'
-                nav_mapping['Geschiedenis'] = 'history'
-                nav_mapping['Settings'] = 'settings'
-                nav_mapping['⚙️ Settings'] = 'settings'
-                nav_mapping['Instellingen'] = 'settings'
-                nav_mapping['Admin'] = 'admin'
-                nav_mapping['👥 Admin'] = 'admin'
-                nav_mapping['Privacy Rights'] = 'privacy_rights'
-                nav_mapping['🔒 Privacy Rights'] = 'privacy_rights'
-                nav_mapping['Privacyrechten'] = 'privacy_rights'
-                # Scanner Logs should be mapped before generic scan terms
-                nav_mapping['🔍 Scanner Logs'] = 'scanner_logs'
-                nav_mapping['Scanner Logs'] = 'scanner_logs'
-                nav_mapping['📈 Performance Dashboard'] = 'performance_dashboard'
-                nav_mapping['Performance Dashboard'] = 'performance_dashboard'
-                nav_mapping['🤖 Predictive Analytics'] = 'predictive_analytics'
-                nav_mapping['Predictive Analytics'] = 'predictive_analytics'
-                
-        except (FileNotFoundError, json.JSONDecodeError):
-            continue
+        temp_translations = get_language_translations(lang_code)
+        
+        # Map all possible navigation texts to internal keys
+        if 'sidebar' in temp_translations:
+            nav_mapping[temp_translations['sidebar'].get('dashboard', '')] = 'dashboard'
+            nav_mapping[temp_translations['sidebar'].get('settings', '')] = 'settings'
+            nav_mapping[temp_translations['sidebar'].get('privacy_rights', '')] = 'privacy_rights'
+        if 'scan' in temp_translations:
+            nav_mapping[temp_translations['scan'].get('new_scan_title', '')] = 'scan'
+            nav_mapping[temp_translations['scan'].get('title', '')] = 'scan'
+        if 'results' in temp_translations:
+            nav_mapping[temp_translations['results'].get('title', '')] = 'results'
+        if 'history' in temp_translations:
+            nav_mapping[temp_translations['history'].get('title', '')] = 'history'
+        if 'admin' in temp_translations:
+            nav_mapping[temp_translations['admin'].get('title', '')] = 'admin'
+            
+        # Additional common navigation terms
+        nav_mapping['Dashboard'] = 'dashboard'
+        nav_mapping['🏠 Dashboard'] = 'dashboard'
+        nav_mapping['New Scan'] = 'scan'
+        nav_mapping['🔍 New Scan'] = 'scan'
+        nav_mapping['Nieuwe Scan'] = 'scan'
+        nav_mapping['Results'] = 'results'
+        nav_mapping['📊 Results'] = 'results'
+        nav_mapping['Resultaten'] = 'results'
+        nav_mapping['History'] = 'history'
+        nav_mapping['📋 History'] = 'history'
+        nav_mapping['Geschiedenis'] = 'history'
+        nav_mapping['Settings'] = 'settings'
+        nav_mapping['⚙️ Settings'] = 'settings'
+        nav_mapping['Instellingen'] = 'settings'
+        nav_mapping['Admin'] = 'admin'
+        nav_mapping['👥 Admin'] = 'admin'
+        nav_mapping['Privacy Rights'] = 'privacy_rights'
+        nav_mapping['🔒 Privacy Rights'] = 'privacy_rights'
+        nav_mapping['Privacyrechten'] = 'privacy_rights'
+        # Scanner Logs should be mapped before generic scan terms
+        nav_mapping['🔍 Scanner Logs'] = 'scanner_logs'
+        nav_mapping['Scanner Logs'] = 'scanner_logs'
+        nav_mapping['📈 Performance Dashboard'] = 'performance_dashboard'
+        nav_mapping['Performance Dashboard'] = 'performance_dashboard'
+        nav_mapping['🤖 Predictive Analytics'] = 'predictive_analytics'
+        nav_mapping['Predictive Analytics'] = 'predictive_analytics'
+        
     
     # Determine the current internal navigation key
     current_nav_key = None
@@ -1232,38 +1248,39 @@ def render_authenticated_interface():
             selected_nav = current_lang_nav
     
     # Main content based on internal navigation keys (language-independent)
-    if current_nav_key == 'dashboard':
-        render_dashboard()
-    elif current_nav_key == 'scan':
-        render_scanner_interface_safe()
-    elif current_nav_key == 'results':
-        render_results_page()
-    elif current_nav_key == 'history':
-        render_history_page()
-    elif current_nav_key == 'settings':
-        render_settings_page()
-    elif current_nav_key == 'privacy_rights':
-        render_privacy_rights_page()
-    elif current_nav_key == 'admin':
-        render_admin_page()
-    elif current_nav_key == 'scanner_logs':
-        render_log_dashboard()
-    elif current_nav_key == 'performance_dashboard':
-        render_performance_dashboard_safe()
-    elif current_nav_key == 'predictive_analytics':
-        render_predictive_analytics()
-    elif selected_nav and "💳 iDEAL Payment Test" in selected_nav:
-        render_ideal_payment_test()
-    elif selected_nav and "💰 Pricing & Plans" in selected_nav:
-        render_pricing_page()
-    elif selected_nav and "🚀 Upgrade License" in selected_nav:
-        render_upgrade_page()
-    elif st.session_state.get('show_upgrade', False):
-        st.session_state['show_upgrade'] = False
-        render_upgrade_page()
-    else:
-        # Fallback: if no navigation key is determined, default to dashboard
-        render_dashboard()
+    with render_block(f"page: {current_nav_key or selected_nav}"):
+        if current_nav_key == 'dashboard':
+            render_dashboard()
+        elif current_nav_key == 'scan':
+            render_scanner_interface_safe()
+        elif current_nav_key == 'results':
+            render_results_page()
+        elif current_nav_key == 'history':
+            render_history_page()
+        elif current_nav_key == 'settings':
+            render_settings_page()
+        elif current_nav_key == 'privacy_rights':
+            render_privacy_rights_page()
+        elif current_nav_key == 'admin':
+            render_admin_page()
+        elif current_nav_key == 'scanner_logs':
+            render_log_dashboard()
+        elif current_nav_key == 'performance_dashboard':
+            render_performance_dashboard_safe()
+        elif current_nav_key == 'predictive_analytics':
+            render_predictive_analytics()
+        elif selected_nav and "💳 iDEAL Payment Test" in selected_nav:
+            render_ideal_payment_test()
+        elif selected_nav and "💰 Pricing & Plans" in selected_nav:
+            render_pricing_page()
+        elif selected_nav and "🚀 Upgrade License" in selected_nav:
+            render_upgrade_page()
+        elif st.session_state.get('show_upgrade', False):
+            st.session_state['show_upgrade'] = False
+            render_upgrade_page()
+        else:
+            # Fallback: if no navigation key is determined, default to dashboard
+            render_dashboard()
 
 def generate_predictive_analytics_html_report(prediction, scan_history, username):
     """Generate HTML report for predictive analytics results"""
@@ -1398,8 +1415,9 @@ def render_predictive_analytics():
     st.markdown("### AI-Powered Risk Forecasting & Compliance Prediction")
     
     try:
-        from services.predictive_compliance_engine import PredictiveComplianceEngine
-        from services.results_aggregator import ResultsAggregator
+        from services.predictive_compliance_engine import PredictiveComplianceEngine, predict_tenant_compliance
+        from services.results_aggregator import get_results_aggregator
+        from services.scan_rollups import risk_adjusted_score
         from datetime import datetime, timedelta
         import plotly.graph_objects as go
         import plotly.express as px
@@ -1409,7 +1427,7 @@ def render_predictive_analytics():
         
         # Get historical scan data - same as Dashboard Recent Scan Activity
         username = st.session_state.get('username', 'anonymous')
-        aggregator = ResultsAggregator()
+        aggregator = get_results_aggregator()
         
         # Initialize with a clean status container
         status_container = st.container()
@@ -1427,10 +1445,8 @@ def render_predictive_analytics():
                 for scan in scan_metadata:
                     # Calculate compliance score from metadata
                     # Higher PII/risk = lower compliance score
-                    base_score = 85
-                    pii_penalty = min(scan.get('total_pii_found', 0) * 0.5, 30)
-                    risk_penalty = min(scan.get('high_risk_count', 0) * 2, 20)
-                    calculated_score = max(base_score - pii_penalty - risk_penalty, 40)
+                    calculated_score = risk_adjusted_score(scan.get('total_pii_found', 0) or 0,
+                                                           scan.get('high_risk_count', 0) or 0)
                     
                     enriched_scan = {
                         'scan_id': scan['scan_id'],
@@ -1446,9 +1462,17 @@ def render_predictive_analytics():
                     scan_history.append(enriched_scan)
                 
                 logger.info(f"Predictive Analytics: Prepared {len(scan_history)} scans for analysis")
+                
+                # Forecasts use the tenant's whole daily series (cached until its next scan)
+                prediction, series_rows = predict_tenant_compliance(
+                    aggregator, username, org_id, forecast_days=30
+                )
         
         # Clean success message
-        if scan_history:
+        if series_rows:
+            st.info(f"📊 Analyzing {sum(row[1] for row in series_rows)} scans over "
+                    f"{len(series_rows)} days for predictive insights")
+        elif scan_history:
             st.info(f"📊 Analyzing {len(scan_history)} scans for predictive insights")
         
         if not scan_history:
@@ -1477,8 +1501,8 @@ def render_predictive_analytics():
             ]
             
             prediction = engine.predict_compliance_trajectory(sample_data, forecast_days=30)
-        else:
-            # Generate real predictions with clean spinner
+        elif prediction is None:
+            # Daily series unavailable: predict from the recent scans
             with st.spinner("🤖 Computing AI predictions..."):
                 prediction = engine.predict_compliance_trajectory(scan_history, forecast_days=30)
         
@@ -1875,7 +1899,7 @@ def render_privacy_rights_page():
 
 def render_dashboard():
     """Render the main dashboard with real-time data from scan results and activity tracker"""
-    from services.results_aggregator import ResultsAggregator
+    from services.results_aggregator import get_results_aggregator
     from utils.activity_tracker import get_dashboard_metrics, get_activity_tracker
     from datetime import datetime, timedelta
     import pandas as pd
@@ -1894,6 +1918,7 @@ def render_dashboard():
     col_refresh, col_spacer = st.columns([2, 8])
     with col_refresh:
         if st.button("🔄 Refresh Dashboard", help="Update dashboard with latest scan results"):
+            invalidate_session_queries()
             st.rerun()
     
     # Initialize scan count tracking per user
@@ -1904,33 +1929,32 @@ def render_dashboard():
         username = st.session_state.get('username', 'anonymous')
         user_id = st.session_state.get('user_id', username)
         
-        # Primary data source: ResultsAggregator (database-backed scan results)
-        # Force fresh connection and disable file storage fallback for accurate counts
-        aggregator = ResultsAggregator()
-        aggregator.use_file_storage = False  # Force database mode for real-time data
+        # Primary data source: shared ResultsAggregator (database-backed scan results)
+        aggregator = get_results_aggregator()
         
-        # Clear any caching to ensure fresh data
-        # Note: clear_cache method not available in current ResultsAggregator
+        # Get organization ID for tenant isolation
+        org_id = get_organization_id()
         
-        # Get all recent scans for current user (expanded timeframe to ensure we get all scans)
-        recent_scans = aggregator.get_recent_scans(days=365, username=username)  # Get all scans for user
-        logger.info(f"Dashboard: Retrieved {len(recent_scans)} total scans for user {username}")
+        # Dashboard totals come from the daily rollup tables (one indexed query,
+        # memoised for the session until a scan is stored)
+        metrics = session_query(aggregator.get_dashboard_metrics, days=365, username=username,
+                                organization_id=org_id, tenant=org_id)
+        logger.info(f"Dashboard: Rollups report {metrics['total_scans']} scans for user {username} (org: {org_id})")
         
-        # If no scans found for current user, get all recent scans to avoid empty dashboard
-        if len(recent_scans) == 0:
-            logger.info(f"Dashboard: No scans found for user {username}, getting all recent scans")
-            recent_scans = aggregator.get_recent_scans(days=30)  # No username filter
-            if recent_scans:
-                logger.info(f"Dashboard: Found {len(recent_scans)} total scans from all users")
+        # If no scans found for current user, use organization-wide metrics to avoid empty dashboard
+        if metrics['total_scans'] == 0:
+            logger.info(f"Dashboard: No scans found for user {username}, using organization-wide metrics")
+            metrics = session_query(aggregator.get_dashboard_metrics, days=30, organization_id=org_id, tenant=org_id)
         
-        # Debug: Log actual scan retrieval
-        logger.info(f"Dashboard: Raw aggregator returned {len(recent_scans)} scans for user {username}")
+        # Recent scan list is loaded further down for the activity section
+        recent_scans = []
         
         # Initialize totals from aggregator (primary source)
-        total_scans = len(recent_scans)
-        total_pii = 0
-        high_risk_issues = 0
-        compliance_scores = []
+        total_scans = metrics['total_scans']
+        total_pii = metrics['total_pii_found']
+        high_risk_issues = metrics['high_risk_count']
+        compliance_score_count = metrics['compliance_score_count']
+        compliance_score_sum = metrics['compliance_score_sum']
         
         # Update scan count for notifications (user-specific to avoid cross-session contamination)
         user_scan_key = f'last_known_scan_count_{username}'
@@ -1940,90 +1964,9 @@ def render_dashboard():
             st.info(f"✨ Dashboard updated with {current_scan_count - last_known_count} new scan(s)!")
         st.session_state[user_scan_key] = current_scan_count
         
-        logger.info(f"Dashboard: Processing {total_scans} completed scans from aggregator")
-        
-        # Calculate metrics from stored scan results - Fix double counting issue
-        for scan in recent_scans:
-            result = scan.get('result', {})
-            if isinstance(result, dict):
-                # Use direct counts from scan metadata first (more reliable)
-                scan_pii = scan.get('total_pii_found', 0)
-                scan_high_risk = scan.get('high_risk_count', 0)
-                
-                # If no direct counts, fall back to analyzing findings
-                if scan_pii == 0:
-                    findings = result.get('findings', [])
-                    if isinstance(findings, list):
-                        scan_pii = len(findings)
-                        # Count high-risk findings
-                        for finding in findings:
-                            if isinstance(finding, dict) and finding.get('severity', '').lower() in ['high', 'critical']:
-                                scan_high_risk += 1
-                
-                # If still no direct counts from scan, check result level
-                if scan_pii == 0:
-                    scan_pii = result.get('total_pii_found', 0)
-                if scan_high_risk == 0:
-                    scan_high_risk = result.get('high_risk_count', 0)
-                
-                total_pii += scan_pii
-                high_risk_issues += scan_high_risk
-                
-                # Collect compliance scores
-                comp_score = result.get('compliance_score', 0)
-                if comp_score > 0:
-                    compliance_scores.append(comp_score)
-        
-        # Force refresh: Check database directly for most accurate count
-        try:
-            from services.results_aggregator import ResultsAggregator
-            fresh_aggregator = ResultsAggregator()
-            fresh_aggregator.use_file_storage = False
-            
-            # Get organization ID for tenant isolation
-            org_id = get_organization_id()
-            
-            # Get absolute latest data with no caching
-            all_user_scans = fresh_aggregator.get_user_scans(username or 'anonymous', limit=50, organization_id=org_id)
-            logger.info(f"Dashboard: Direct database query found {len(all_user_scans)} total scans for user {username} (org: {org_id})")
-            
-            # If no user-specific scans, get all scans for accurate metrics
-            if len(all_user_scans) == 0:
-                all_user_scans = fresh_aggregator.get_user_scans('all_users', limit=50, organization_id=org_id)  # Get all users
-                logger.info(f"Dashboard: No user-specific scans, using {len(all_user_scans)} total scans from database (org: {org_id})")
-            
-            # Filter for recent scans (30 days) manually to ensure accuracy
-            from datetime import datetime, timedelta
-            cutoff_date = datetime.now() - timedelta(days=30)
-            
-            recent_scan_count = 0
-            for scan in all_user_scans:
-                try:
-                    if scan.get('timestamp'):
-                        scan_date = datetime.fromisoformat(scan['timestamp'].replace('Z', ''))
-                        if scan_date >= cutoff_date:
-                            recent_scan_count += 1
-                except (ValueError, AttributeError):
-                    continue
-            
-            logger.info(f"Dashboard: Manual date filtering found {recent_scan_count} scans within 30 days")
-            
-            # Update total_scans with the most accurate count
-            if recent_scan_count > total_scans:
-                logger.info(f"Dashboard: Updating scan count from {total_scans} to {recent_scan_count} (direct DB query)")
-                total_scans = recent_scan_count
-                
-                # Also refresh the recent_scans list to match
-                recent_scans = [s for s in all_user_scans if s.get('timestamp') and 
-                              datetime.fromisoformat(s['timestamp'].replace('Z', '')) >= cutoff_date]
-                recent_scans.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-                
-        except Exception as e:
-            logger.warning(f"Dashboard: Failed to get direct database count: {e}")
-        
         # Secondary data source: Activity Tracker (real-time activity logging)
         tracker = get_activity_tracker()
-        user_activities = tracker.get_user_activities(user_id, limit=10000)  # Large limit for all activities
+        user_activities = session_query(tracker.get_user_activities, user_id, limit=10000)  # Large limit for all activities
         
         # Get activity-based data for recent activities display
         scan_activities = [a for a in user_activities if hasattr(a, 'activity_type') and a.activity_type.value in ['scan_started', 'scan_completed', 'scan_failed']]
@@ -2054,15 +1997,16 @@ def render_dashboard():
             if activity_high_risk > 0:
                 high_risk_issues += activity_high_risk
             if activity_compliance > 0:
-                compliance_scores.append(activity_compliance)
+                compliance_score_sum += activity_compliance
+                compliance_score_count += 1
         
         # Add today's new activities to total scan count
         total_scans = total_scans + len(today_activities)
         
         # Calculate final compliance score
-        if compliance_scores:
-            avg_compliance = sum(compliance_scores) / len(compliance_scores)
-            logger.info(f"Dashboard: Calculated compliance from {len(compliance_scores)} scores: {avg_compliance:.1f}%")
+        if compliance_score_count:
+            avg_compliance = compliance_score_sum / compliance_score_count
+            logger.info(f"Dashboard: Calculated compliance from {compliance_score_count} scores: {avg_compliance:.1f}%")
         else:
             # Calculate based on risk if no explicit scores
             if total_scans > 0 and high_risk_issues > 0:
@@ -2090,7 +2034,7 @@ def render_dashboard():
         # Debug information for troubleshooting
         if st.checkbox("Show Debug Info", value=False):
             st.write(f"Debug: Found {len(completed_activities)} activity scans, {len(recent_scans)} aggregator scans")
-            st.write(f"Totals: {total_pii} PII, {high_risk_issues} high risk, {len(compliance_scores)} scores")
+            st.write(f"Totals: {total_pii} PII, {high_risk_issues} high risk, {compliance_score_count} scores")
             st.write(f"Username: {username}, Scan count: {total_scans}")
             st.write(f"Calculated compliance: {avg_compliance:.1f}%")
         
@@ -2101,17 +2045,16 @@ def render_dashboard():
         
         # Force refresh recent scans to get latest data including current session  
         try:
-            # Create fresh aggregator instance to bypass any caching issues
-            fresh_agg = ResultsAggregator()
-            fresh_agg.use_file_storage = False  # Force database mode
+            # Memoised per session; dropped when this session completes a scan
+            fresh_agg = get_results_aggregator()
             
             # Get most recent scans with extended timeframe to ensure we capture everything
-            fresh_scans = fresh_agg.get_recent_scans(days=30, username=username)  # Use 30 days to match metrics
+            fresh_scans = session_query(fresh_agg.get_recent_scans, days=30, username=username)  # Use 30 days to match metrics
             logger.info(f"Dashboard: Fresh aggregator returned {len(fresh_scans)} scans for recent activity display")
             
             # If still no fresh scans, try without username filter to show any available data
             if len(fresh_scans) == 0:
-                fresh_scans = fresh_agg.get_recent_scans(days=30)  # Get all scans
+                fresh_scans = session_query(fresh_agg.get_recent_scans, days=30)  # Get all scans
                 logger.info(f"Dashboard: No user-specific scans, using {len(fresh_scans)} total recent scans from all users")
                 
             # Ensure all 9 scanner types are represented in activities
@@ -2633,27 +2576,28 @@ def render_dashboard():
         
         # Enhanced fallback display with proper error handling
         try:
-            aggregator = ResultsAggregator()
+            aggregator = get_results_aggregator()
             username = st.session_state.get('username')
             
-            # Try to get basic scan count first
-            if username:
-                recent_scans = aggregator.get_recent_scans(days=30, username=username)
-            else:
-                recent_scans = []
+            # Basic totals from the daily rollups (one indexed query, no scan results loaded);
+            # organization-wide when no user is logged in
+            metrics = aggregator.get_dashboard_metrics(days=30, username=username,
+                                                       organization_id=get_organization_id())
             
-            total_scans = len(recent_scans)
+            total_scans = metrics['total_scans']
+            average_score = metrics['average_compliance_score']
             
             # Display basic metrics even in error case
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric(_('dashboard.metric.total_scans', 'Total Scans'), total_scans)
             with col2:
-                st.metric(_('dashboard.metric.total_pii', 'Total PII Found'), 0) 
+                st.metric(_('dashboard.metric.total_pii', 'Total PII Found'), metrics['total_pii_found']) 
             with col3:
-                st.metric(_('dashboard.metric.compliance_score', 'Compliance Score'), "Loading...")
+                st.metric(_('dashboard.metric.compliance_score', 'Compliance Score'),
+                          f"{average_score:.1f}%" if average_score is not None else "Loading...")
             with col4:
-                st.metric(_('dashboard.metric.active_issues', 'Active Issues'), 0)
+                st.metric(_('dashboard.metric.active_issues', 'Active Issues'), metrics['high_risk_count'])
             
             if total_scans > 0:
                 st.info(f"Found {total_scans} recent scans. Dashboard data is being processed.")
@@ -2684,6 +2628,7 @@ def render_dashboard():
                 st.rerun()
         with col2:
             if st.button("🔄 Refresh Dashboard"):
+                invalidate_session_queries()
                 st.rerun()
 
 def render_scanner_interface_safe():
@@ -3496,8 +3441,8 @@ def execute_code_scan(region, username, uploaded_files, repo_url, directory_path
         
         # Also store in results aggregator for persistence
         try:
-            from services.results_aggregator import ResultsAggregator
-            aggregator = ResultsAggregator()
+            from services.results_aggregator import get_results_aggregator
+            aggregator = get_results_aggregator()
             # Prepare complete result dictionary for storage
             complete_result = scan_results.copy()
             complete_result.update({
@@ -3856,7 +3801,7 @@ def execute_document_scan(region, username, uploaded_files):
     user_id = get_user_id()
     
     try:
-        from services.blob_scanner import BlobScanner
+        from services.scanner_registry import get_shared_scanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         from components.document_fraud_detection_display import render_fraud_summary_for_batch, render_fraud_warning_banner
         
@@ -3881,7 +3826,7 @@ def execute_document_scan(region, username, uploaded_files):
         # Track license usage
         track_scanner_usage('document', region, success=True, duration_ms=0)
         
-        scanner = BlobScanner(region=region)
+        scanner = get_shared_scanner('blob', region=region)
         progress_bar = st.progress(0)
         
         scan_results = {
@@ -3940,8 +3885,8 @@ def execute_document_scan(region, username, uploaded_files):
         
         # Store results in aggregator database (like Code Scanner does)
         try:
-            from services.results_aggregator import ResultsAggregator
-            aggregator = ResultsAggregator()
+            from services.results_aggregator import get_results_aggregator
+            aggregator = get_results_aggregator()
             
             # Prepare complete result for storage
             complete_result = {
@@ -4074,7 +4019,7 @@ def render_image_scanner_interface(region: str, username: str):
 def execute_image_scan(region, username, uploaded_files):
     """Execute image scanning with OCR simulation and activity tracking"""
     try:
-        from services.image_scanner import ImageScanner
+        from services.scanner_registry import get_shared_scanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         
         # Get session information
@@ -4098,7 +4043,7 @@ def execute_image_scan(region, username, uploaded_files):
         # Track license usage
         track_scanner_usage('image', region, success=True, duration_ms=0)
         
-        scanner = ImageScanner(region=region)
+        scanner = get_shared_scanner('image', region=region)
         progress_bar = st.progress(0)
         
         scan_results = {
@@ -4156,8 +4101,8 @@ def execute_image_scan(region, username, uploaded_files):
         
         # Store results in aggregator database (like Code Scanner does)  
         try:
-            from services.results_aggregator import ResultsAggregator
-            aggregator = ResultsAggregator()
+            from services.results_aggregator import get_results_aggregator
+            aggregator = get_results_aggregator()
             
             # Ensure variables are properly defined for storage
             user_id = st.session_state.get('user_id', username)
@@ -4582,7 +4527,7 @@ def execute_database_scan(region, username, db_type, host, port, database, usern
     user_id = st.session_state.get('user_id', username)
     
     try:
-        from services.db_scanner import DBScanner
+        from services.scanner_registry import create_scanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         
         # Get session information
@@ -4608,7 +4553,7 @@ def execute_database_scan(region, username, db_type, host, port, database, usern
         # Track license usage
         track_scanner_usage('database', region, success=True, duration_ms=0)
         
-        scanner = DBScanner(region=region)
+        scanner = create_scanner('database', region=region)
         progress_bar = st.progress(0)
         
         # Connection parameters
@@ -4751,7 +4696,7 @@ def execute_database_scan_cloud(region, username, connection_string):
     user_id = st.session_state.get('user_id', username)
     
     try:
-        from services.db_scanner import DBScanner
+        from services.scanner_registry import create_scanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         
         # Get session information
@@ -4775,7 +4720,7 @@ def execute_database_scan_cloud(region, username, connection_string):
         # Track license usage
         track_scanner_usage('database', region, success=True, duration_ms=0)
         
-        scanner = DBScanner(region=region)
+        scanner = create_scanner('database', region=region)
         progress_bar = st.progress(0)
         
         # Connection parameters using connection string
@@ -5276,7 +5221,7 @@ def execute_api_scan(region, username, base_url, endpoints, timeout):
         import requests
         import time
         import json
-        from services.api_scanner import APIScanner
+        from services.scanner_registry import create_scanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         
         # Track scan start
@@ -5298,7 +5243,8 @@ def execute_api_scan(region, username, base_url, endpoints, timeout):
         track_scanner_usage('api', region, success=True, duration_ms=0)
         
         # Initialize comprehensive API scanner
-        scanner = APIScanner(
+        scanner = create_scanner(
+            'api',
             max_endpoints=20,
             request_timeout=timeout,
             rate_limit_delay=1,
@@ -5693,7 +5639,8 @@ def execute_api_scan(region, username, base_url, endpoints, timeout):
         
         with col2:
             # Generate JSON report for API results
-            json_report = json.dumps(scan_results, indent=2, default=str)
+            from services.finding_batch import json_export_default
+            json_report = json.dumps(scan_results, indent=2, default=json_export_default)
             st.download_button(
                 label="📊 Download JSON Report",
                 data=json_report,
@@ -5718,8 +5665,8 @@ def execute_api_scan(region, username, base_url, endpoints, timeout):
         
         # Store results in aggregator database (like other scanners do)
         try:
-            from services.results_aggregator import ResultsAggregator
-            aggregator = ResultsAggregator()
+            from services.results_aggregator import get_results_aggregator
+            aggregator = get_results_aggregator()
             
             # Prepare complete result for storage
             complete_result = scan_results.copy()
@@ -5799,30 +5746,12 @@ def render_enterprise_connector_interface(region: str, username: str):
     """Enterprise Connector Scanner interface for Microsoft 365, Exact Online, Google Workspace integration"""
     # Import required modules to avoid unbound variables
     from utils.activity_tracker import ScannerType
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
     
     # Debug: Check current language and translations
     current_lang = st.session_state.get('language', 'en')
     
-    # Force reinitialize i18n to ensure fresh translations
-    from utils.i18n import initialize, set_language, _translations, load_translations
-    import json
-    import os
-    
-    # Clear translations cache completely to force reload
-    _translations.clear()
-    
-    # Manually load Dutch translations if the language is nl
-    if current_lang == 'nl':
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '.'))
-        nl_file = os.path.join(base_dir, 'translations', 'nl.json')
-        try:
-            with open(nl_file, 'r', encoding='utf-8') as f:
-                _translations['nl'] = json.load(f)
-        except Exception as e:
-            st.write(f"DEBUG: Error loading Dutch translations: {e}")
-    
-    # Explicitly set the language and reinitialize
+    # Reinitialize i18n for the current language (parsed files are cached)
+    from utils.i18n import initialize, set_language
     set_language(current_lang)
     initialize()
     
@@ -5888,7 +5817,7 @@ def render_enterprise_connector_interface(region: str, username: str):
 
 def render_microsoft365_connector(region: str, username: str):
     """Microsoft 365 connector interface"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
+    from services.scanner_registry import create_scanner
     from utils.activity_tracker import ScannerType
     
     st.subheader(_('scan.microsoft365_integration', '🏢 Microsoft 365 Integration'))
@@ -5974,7 +5903,8 @@ def render_microsoft365_connector(region: str, username: str):
             track_scanner_usage('enterprise', region, success=True, duration_ms=0)
             
             # Initialize scanner
-            scanner = EnterpriseConnectorScanner(
+            scanner = create_scanner(
+                'enterprise_connector',
                 connector_type='microsoft365',
                 credentials=credentials,
                 region=region,
@@ -6016,8 +5946,8 @@ def render_microsoft365_connector(region: str, username: str):
                 
                 # Store results in aggregator database (like Code Scanner does)
                 try:
-                    from services.results_aggregator import ResultsAggregator
-                    aggregator = ResultsAggregator()
+                    from services.results_aggregator import get_results_aggregator
+                    aggregator = get_results_aggregator()
                     
                     # Prepare complete result for storage
                     complete_result = {
@@ -6063,7 +5993,7 @@ def render_microsoft365_connector(region: str, username: str):
 
 def render_exact_online_connector(region: str, username: str):
     """Exact Online connector interface - Netherlands specialization"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
+    from services.scanner_registry import create_scanner
     
     st.subheader(_('scan.exact_online_integration', '🇳🇱 Exact Online Integration'))
     st.write(_('scan.exact_online_integration_description', 'Netherlands-specialized ERP scanning with BSN validation and KvK verification.'))
@@ -6122,7 +6052,8 @@ def render_exact_online_connector(region: str, username: str):
     
     if st.button("🚀 Start Exact Online Scan", type="primary"):
         try:
-            scanner = EnterpriseConnectorScanner(
+            scanner = create_scanner(
+                'enterprise_connector',
                 connector_type='exact_online',
                 credentials=credentials,
                 region=region
@@ -6145,8 +6076,8 @@ def render_exact_online_connector(region: str, username: str):
             if scan_results.get('success'):
                 # Store results in aggregator database (like Code Scanner does)
                 try:
-                    from services.results_aggregator import ResultsAggregator
-                    aggregator = ResultsAggregator()
+                    from services.results_aggregator import get_results_aggregator
+                    aggregator = get_results_aggregator()
                     
                     # Prepare complete result for storage
                     complete_result = {
@@ -6186,7 +6117,7 @@ def render_exact_online_connector(region: str, username: str):
 
 def render_google_workspace_connector(region: str, username: str):
     """Google Workspace connector interface"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
+    from services.scanner_registry import create_scanner
     
     st.subheader(_('scan.google_workspace_integration', '📊 Google Workspace Integration'))
     st.write(_('scan.google_workspace_integration_description', 'Scan Google Drive, Gmail, and Docs for PII with enterprise-grade accuracy.'))
@@ -6226,7 +6157,8 @@ def render_google_workspace_connector(region: str, username: str):
     
     if st.button("🚀 Start Google Workspace Scan", type="primary"):
         try:
-            scanner = EnterpriseConnectorScanner(
+            scanner = create_scanner(
+                'enterprise_connector',
                 connector_type='google_workspace',
                 credentials=credentials,
                 region=region
@@ -6245,8 +6177,8 @@ def render_google_workspace_connector(region: str, username: str):
             if scan_results.get('success'):
                 # Store results in aggregator database (like Code Scanner does)
                 try:
-                    from services.results_aggregator import ResultsAggregator
-                    aggregator = ResultsAggregator()
+                    from services.results_aggregator import get_results_aggregator
+                    aggregator = get_results_aggregator()
                     
                     # Prepare complete result for storage
                     complete_result = {
@@ -6279,7 +6211,6 @@ def render_google_workspace_connector(region: str, username: str):
 
 def render_dutch_banking_connector(region: str, username: str):
     """Dutch banking connector interface (PSD2 APIs)"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
     
     st.subheader(_('scan.dutch_banking_integration', '🏦 Dutch Banking Integration'))
     st.write(_('scan.dutch_banking_integration_description', 'PSD2-compliant integration with major Dutch banks for transaction analysis.'))
@@ -6301,7 +6232,7 @@ def render_dutch_banking_connector(region: str, username: str):
 
 def render_salesforce_connector(region: str, username: str):
     """Salesforce CRM connector interface"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
+    from services.scanner_registry import create_scanner
     from utils.activity_tracker import ScannerType
     
     st.subheader("💼 Salesforce CRM Integration")
@@ -6362,7 +6293,8 @@ def render_salesforce_connector(region: str, username: str):
     
     if st.button("🚀 Start Salesforce Scan", type="primary"):
         try:
-            scanner = EnterpriseConnectorScanner(
+            scanner = create_scanner(
+                'enterprise_connector',
                 connector_type='salesforce',
                 credentials=credentials,
                 region=region
@@ -6385,8 +6317,8 @@ def render_salesforce_connector(region: str, username: str):
             if scan_results.get('success'):
                 # Store results in aggregator database
                 try:
-                    from services.results_aggregator import ResultsAggregator
-                    aggregator = ResultsAggregator()
+                    from services.results_aggregator import get_results_aggregator
+                    aggregator = get_results_aggregator()
                     
                     complete_result = {
                         **scan_results,
@@ -6421,7 +6353,7 @@ def render_salesforce_connector(region: str, username: str):
 
 def render_sap_connector(region: str, username: str):
     """SAP ERP connector interface"""
-    from services.enterprise_connector_scanner import EnterpriseConnectorScanner
+    from services.scanner_registry import create_scanner
     from utils.activity_tracker import ScannerType
     
     st.subheader("🏭 SAP ERP Integration")
@@ -6489,7 +6421,8 @@ def render_sap_connector(region: str, username: str):
     
     if st.button("🚀 Start SAP Scan", type="primary"):
         try:
-            scanner = EnterpriseConnectorScanner(
+            scanner = create_scanner(
+                'enterprise_connector',
                 connector_type='sap',
                 credentials=credentials,
                 region=region,
@@ -6515,8 +6448,8 @@ def render_sap_connector(region: str, username: str):
             if scan_results.get('success'):
                 # Store results in aggregator database
                 try:
-                    from services.results_aggregator import ResultsAggregator
-                    aggregator = ResultsAggregator()
+                    from services.results_aggregator import get_results_aggregator
+                    aggregator = get_results_aggregator()
                     
                     complete_result = {
                         **scan_results,
@@ -7068,8 +7001,8 @@ def execute_ai_model_scan(region, username, model_source, uploaded_model, repo_u
             # Initialize AI model scanner
             status.update(label="Initializing AI model analysis framework...")
             
-            from services.ai_model_scanner import AIModelScanner
-            scanner = AIModelScanner(region=region)
+            from services.scanner_registry import create_scanner
+            scanner = create_scanner('ai_model', region=region)
             
             progress_bar = st.progress(0)
             
@@ -7384,8 +7317,8 @@ def execute_ai_model_scan(region, username, model_source, uploaded_model, repo_u
             
             # Save to results aggregator for dashboard integration
             try:
-                from services.results_aggregator import ResultsAggregator
-                aggregator = ResultsAggregator()
+                from services.results_aggregator import get_results_aggregator
+                aggregator = get_results_aggregator()
                 aggregator.save_scan_result(
                     username=username,
                     result=scan_results
@@ -7598,8 +7531,8 @@ def execute_soc2_scan(region, username, repo_url, repo_source, branch, soc2_type
             # Initialize SOC2 scanner
             status.update(label="Initializing SOC2 compliance framework...")
             
-            from services.enhanced_soc2_scanner import EnhancedSOC2Scanner
-            scanner = EnhancedSOC2Scanner()
+            from services.scanner_registry import create_scanner
+            scanner = create_scanner('soc2')
             
             progress_bar = st.progress(0)
             
@@ -7809,7 +7742,8 @@ def execute_soc2_scan(region, username, repo_url, repo_source, branch, soc2_type
             findings_count = len(scan_results["findings"])
             high_risk_count = sum(1 for f in scan_results["findings"] if f.get('severity') in ['Critical', 'High'])
             
-            # Track successful completion
+            # Track successful completion (and drop this session's memoised queries)
+            invalidate_session_queries()
             track_scan_completed(
                 session_id=session_id,
                 user_id=user_id,
@@ -8482,7 +8416,8 @@ def execute_website_scan(region, username, url, scan_config):
         findings_count = len(scan_results["findings"])
         high_risk_count = sum(1 for f in scan_results["findings"] if f.get('severity') in ['Critical', 'High'])
         
-        # Track successful completion
+        # Track successful completion (and drop this session's memoised queries)
+        invalidate_session_queries()
         track_scan_completed(
             session_id=session_id,
             user_id=user_id,
@@ -9331,7 +9266,6 @@ def generate_dpia_recommendations(risk_score, risk_factors, responses):
 def execute_enhanced_dpia_scan(region, username, responses):
     """Execute enhanced DPIA assessment with real calculation"""
     try:
-        from services.dpia_scanner import DPIAScanner
         from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
         
         # Get session information
@@ -9411,7 +9345,8 @@ def execute_enhanced_dpia_scan(region, username, responses):
         findings_count = len(scan_results["findings"])
         high_risk_count = sum(1 for f in scan_results["findings"] if f.get('severity') in ['Critical', 'High'])
         
-        # Track successful completion
+        # Track successful completion (and drop this session's memoised queries)
+        invalidate_session_queries()
         track_scan_completed(
             session_id=session_id,
             user_id=user_id,
@@ -9585,7 +9520,8 @@ def display_enhanced_dpia_results(scan_results):
     
     with col2:
         # JSON report for technical users
-        json_report = json.dumps(scan_results, indent=2, default=str)
+        from services.finding_batch import json_export_default
+        json_report = json.dumps(scan_results, indent=2, default=json_export_default)
         st.download_button(
             label="📊 Download Assessment Data (JSON)",
             data=json_report,
@@ -10176,7 +10112,8 @@ def execute_sustainability_scan(region, username, scan_params):
         findings_count = len(scan_results["findings"])
         high_risk_count = sum(1 for f in scan_results["findings"] if f.get('severity') in ['Critical', 'High'])
         
-        # Track successful completion
+        # Track successful completion (and drop this session's memoised queries)
+        invalidate_session_queries()
         track_scan_completed(
             session_id=session_id,
             user_id=user_id,
@@ -11056,18 +10993,18 @@ def render_document_scanner_config():
 def render_results_page():
     """Render results page with real scan data"""
     from utils.translations import _
-    from services.results_aggregator import ResultsAggregator
+    from services.results_aggregator import get_results_aggregator
     import pandas as pd
     
     st.title(f"📊 {_('results.title', 'Scan Results')}")
     
     # Initialize results aggregator
     try:
-        aggregator = ResultsAggregator()
+        aggregator = get_results_aggregator()
         username = st.session_state.get('username', 'anonymous')
         
         # Get recent scans for the user
-        recent_scans = aggregator.get_recent_scans(days=30, username=username)
+        recent_scans = session_query(aggregator.get_recent_scans, days=30, username=username)
         
         if not recent_scans:
             st.info(_('results.no_results', 'No scan results available. Please run a scan first.'))
@@ -11144,14 +11081,14 @@ def render_results_page():
 def render_history_page():
     """Render scan history with real data and filtering"""
     from utils.translations import _
-    from services.results_aggregator import ResultsAggregator
+    from services.results_aggregator import get_results_aggregator
     import pandas as pd
     from datetime import datetime, timedelta
     
     st.title(f"📋 {_('history.title', 'Scan History')}")
     
     try:
-        aggregator = ResultsAggregator()
+        aggregator = get_results_aggregator()
         username = st.session_state.get('username', 'anonymous')
         
         # Filtering options
@@ -11180,7 +11117,7 @@ def render_history_page():
             )
         
         # Get historical scans
-        all_scans = aggregator.get_recent_scans(days=days_filter, username=username)
+        all_scans = session_query(aggregator.get_recent_scans, days=days_filter, username=username)
         
         # Apply filters
         filtered_scans = all_scans
@@ -11363,7 +11300,8 @@ def render_detailed_scan_view(scan_data):
         with col1:
             if st.button("📄 Export as JSON", key=f"json_export_{scan_data.get('scan_id', 'unknown')}"):
                 import json
-                json_data = json.dumps(scan_data, indent=2, default=str)
+                from services.finding_batch import json_export_default
+                json_data = json.dumps(scan_data, indent=2, default=json_export_default)
                 st.download_button(
                     label="Download JSON",
                     data=json_data,
@@ -11884,7 +11822,8 @@ def render_settings_page():
                 st.write("**Raw Scan Data**")
                 if st.button("📊 Export as JSON", key="json_export"):
                     import json
-                    json_data = json.dumps(scan_results, indent=2, default=str)
+                    from services.finding_batch import json_export_default
+                    json_data = json.dumps(scan_results, indent=2, default=json_export_default)
                     st.download_button(
                         label="💾 Download JSON",
                         data=json_data,
@@ -12326,8 +12265,8 @@ def render_ideal_payment_test():
     st.markdown("### Test real ABN AMRO card payments with iDEAL integration")
     
     # Initialize results aggregator for payment logging
-    from services.results_aggregator import ResultsAggregator
-    results_aggregator = ResultsAggregator()
+    from services.results_aggregator import get_results_aggregator
+    results_aggregator = get_results_aggregator()
     
     # Handle payment callbacks first
     from services.stripe_payment import handle_payment_callback
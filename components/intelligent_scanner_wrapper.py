@@ -16,11 +16,11 @@ import streamlit as st
 from services.intelligent_scanner_manager import intelligent_scanner_manager
 from utils.activity_tracker import track_scan_started, track_scan_completed, track_scan_failed, ScannerType
 from services.license_integration import track_scanner_usage
-from services.results_aggregator import ResultsAggregator
+from services.results_aggregator import get_results_aggregator
 
 # Enterprise integration - non-breaking import
 try:
-    from utils.event_bus import EventType, publish_event
+    from utils.event_bus import EventType, publish_event, publish_events
     ENTERPRISE_EVENTS_AVAILABLE = True
 except ImportError:
     ENTERPRISE_EVENTS_AVAILABLE = False
@@ -32,7 +32,7 @@ class IntelligentScannerWrapper:
     
     def __init__(self):
         self.scanner_manager = intelligent_scanner_manager
-        self.results_aggregator = ResultsAggregator()
+        self.results_aggregator = get_results_aggregator()
     
     def execute_code_scan_intelligent(self, region: str, username: str, 
                                     uploaded_files=None, repo_url=None, 
@@ -249,26 +249,26 @@ class IntelligentScannerWrapper:
                         }
                     )
                     
-                    # Publish individual finding events for enterprise processing
+                    # Publish individual finding events for enterprise processing (one batch)
                     findings = scan_result.get('findings', [])
+                    publish_events(
+                        event_type=EventType.FINDING_DETECTED,
+                        source="intelligent_scanner",
+                        user_id=user_id,
+                        session_id=session_id,
+                        data_items=[{
+                            'scan_id': scan_id,  # Same scan_id for correlation
+                            'scanner_type': 'code',
+                            'type': finding.get('type', 'Unknown'),
+                            'risk_level': finding.get('risk_level', finding.get('severity', 'Low')),
+                            'location': finding.get('file', finding.get('location', 'Unknown')),
+                            'description': finding.get('description', ''),
+                            'line_number': finding.get('line_number'),
+                            'finding_id': finding.get('id', str(uuid.uuid4()))
+                        } for finding in findings]
+                    )
+                    
                     for finding in findings:
-                        publish_event(
-                            event_type=EventType.FINDING_DETECTED,
-                            source="intelligent_scanner",
-                            user_id=user_id,
-                            session_id=session_id,
-                            data={
-                                'scan_id': scan_id,  # Same scan_id for correlation
-                                'scanner_type': 'code',
-                                'type': finding.get('type', 'Unknown'),
-                                'risk_level': finding.get('risk_level', finding.get('severity', 'Low')),
-                                'location': finding.get('file', finding.get('location', 'Unknown')),
-                                'description': finding.get('description', ''),
-                                'line_number': finding.get('line_number'),
-                                'finding_id': finding.get('id', str(uuid.uuid4()))
-                            }
-                        )
-                        
                         # Publish critical issue events for high-priority findings
                         if finding.get('risk_level') == 'Critical' or finding.get('severity') == 'Critical':
                             publish_event(
@@ -453,26 +453,26 @@ class IntelligentScannerWrapper:
                         }
                     )
                     
-                    # Publish individual finding events for enterprise processing
+                    # Publish individual finding events for enterprise processing (one batch)
                     findings = scan_result.get('findings', [])
+                    publish_events(
+                        event_type=EventType.FINDING_DETECTED,
+                        source="intelligent_scanner",
+                        user_id=user_id,
+                        session_id=session_id,
+                        data_items=[{
+                            'scan_id': scan_id,  # Same scan_id for correlation
+                            'scanner_type': 'image',
+                            'type': finding.get('type', 'Unknown'),
+                            'risk_level': finding.get('risk_level', finding.get('severity', 'Low')),
+                            'location': finding.get('file', finding.get('location', 'Unknown')),
+                            'description': finding.get('description', ''),
+                            'finding_id': finding.get('id', str(uuid.uuid4())),
+                            'image_metadata': finding.get('metadata', {})
+                        } for finding in findings]
+                    )
+                    
                     for finding in findings:
-                        publish_event(
-                            event_type=EventType.FINDING_DETECTED,
-                            source="intelligent_scanner",
-                            user_id=user_id,
-                            session_id=session_id,
-                            data={
-                                'scan_id': scan_id,  # Same scan_id for correlation
-                                'scanner_type': 'image',
-                                'type': finding.get('type', 'Unknown'),
-                                'risk_level': finding.get('risk_level', finding.get('severity', 'Low')),
-                                'location': finding.get('file', finding.get('location', 'Unknown')),
-                                'description': finding.get('description', ''),
-                                'finding_id': finding.get('id', str(uuid.uuid4())),
-                                'image_metadata': finding.get('metadata', {})
-                            }
-                        )
-                        
                         # Publish critical issue events for high-priority findings
                         if finding.get('risk_level') == 'Critical' or finding.get('severity') == 'Critical':
                             publish_event(
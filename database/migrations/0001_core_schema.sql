@@ -0,0 +1,94 @@
+-- Core scan storage schema
+-- Previously created by ResultsAggregator._init_db on every instantiation;
+-- users and region_rules are the PostgreSQL form of database/schema.sql.
+
+CREATE TABLE IF NOT EXISTS scans (
+    scan_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    scan_type TEXT NOT NULL,
+    region TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_pii_found INTEGER NOT NULL,
+    high_risk_count INTEGER NOT NULL,
+    result_json JSONB NOT NULL,
+    organization_id TEXT NOT NULL DEFAULT 'default_org'
+);
+
+CREATE INDEX IF NOT EXISTS idx_scans_username_timestamp ON scans(username, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_scans_organization_timestamp ON scans(organization_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_scans_scan_type ON scans(scan_type);
+CREATE INDEX IF NOT EXISTS idx_scans_timestamp ON scans(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_scans_composite ON scans(username, organization_id, timestamp DESC);
+
+CREATE TABLE IF NOT EXISTS audit_log (
+    log_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    action TEXT NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    details JSONB
+);
+
+CREATE INDEX IF NOT EXISTS idx_audit_username_timestamp ON audit_log(username, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action);
+CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp DESC);
+
+CREATE TABLE IF NOT EXISTS pii_types (
+    type_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    risk_level TEXT NOT NULL,
+    gdpr_article TEXT
+);
+
+CREATE TABLE IF NOT EXISTS compliance_scores (
+    score_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    scan_id TEXT NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    overall_score INTEGER NOT NULL,
+    principle_scores JSONB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gdpr_principles (
+    principle_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    article TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS user_sessions (
+    session_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    login_time TIMESTAMP NOT NULL,
+    last_activity TIMESTAMP NOT NULL,
+    ip_address TEXT,
+    user_agent TEXT
+);
+
+-- Default accounts from database/schema.sql are deliberately not seeded
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL,
+    email TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_login TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS region_rules (
+    region_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    minor_age_limit INTEGER NOT NULL,
+    breach_notification_hours INTEGER NOT NULL,
+    special_requirements TEXT
+);
+
+INSERT INTO region_rules (region_id, name, minor_age_limit, breach_notification_hours, special_requirements)
+VALUES
+    ('NL', 'Netherlands', 16, 72, 'Special rules for BSN, medical data. Must follow UAVG.'),
+    ('DE', 'Germany', 16, 72, 'Strict rules for data minimization. Must follow BDSG.'),
+    ('FR', 'France', 15, 72, 'Special rules for minor data.'),
+    ('BE', 'Belgium', 13, 72, 'Special rules for processing activities.')
+ON CONFLICT (region_id) DO NOTHING;
@@ -0,0 +1,36 @@
+-- Multi-tenant organization tables and tenant columns
+-- Previously created by MultiTenantService._init_tenant_schema.
+
+CREATE TABLE IF NOT EXISTS tenants (
+    organization_id VARCHAR(255) PRIMARY KEY,
+    organization_name VARCHAR(500) NOT NULL,
+    tier VARCHAR(50) NOT NULL,
+    max_users INTEGER DEFAULT 10,
+    max_scans_per_month INTEGER DEFAULT 100,
+    max_storage_gb INTEGER DEFAULT 10,
+    features JSONB DEFAULT '[]'::jsonb,
+    compliance_regions JSONB DEFAULT '["EU"]'::jsonb,
+    data_residency VARCHAR(100) DEFAULT 'EU',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    metadata JSONB DEFAULT '{}'::jsonb,
+    status VARCHAR(50) DEFAULT 'active'
+);
+
+CREATE TABLE IF NOT EXISTS tenant_usage (
+    organization_id VARCHAR(255) PRIMARY KEY,
+    current_users INTEGER DEFAULT 0,
+    scans_this_month INTEGER DEFAULT 0,
+    storage_used_gb DECIMAL(10,2) DEFAULT 0.0,
+    last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    compliance_score DECIMAL(5,2) DEFAULT 0.0,
+    monthly_reset_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (organization_id) REFERENCES tenants(organization_id) ON DELETE CASCADE
+);
+
+-- Databases created before multi-tenancy lack these columns
+ALTER TABLE scans ADD COLUMN IF NOT EXISTS organization_id TEXT NOT NULL DEFAULT 'default_org';
+ALTER TABLE audit_log ADD COLUMN IF NOT EXISTS organization_id VARCHAR(255) DEFAULT 'default_org';
+
+CREATE INDEX IF NOT EXISTS idx_scans_org_id ON scans(organization_id);
+CREATE INDEX IF NOT EXISTS idx_audit_org_id ON audit_log(organization_id);
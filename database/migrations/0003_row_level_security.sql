@@ -0,0 +1,34 @@
+-- skip-if: DISABLE_RLS=1
+-- Row Level Security for tenant isolation
+-- Previously created by MultiTenantService._init_row_level_security.
+
+ALTER TABLE scans ENABLE ROW LEVEL SECURITY;
+ALTER TABLE audit_log ENABLE ROW LEVEL SECURITY;
+
+-- Users can only access rows from their organization
+DROP POLICY IF EXISTS tenant_isolation_scans ON scans;
+CREATE POLICY tenant_isolation_scans ON scans
+    FOR ALL
+    TO PUBLIC
+    USING (organization_id = current_setting('app.current_organization_id', true));
+
+DROP POLICY IF EXISTS tenant_isolation_audit_log ON audit_log;
+CREATE POLICY tenant_isolation_audit_log ON audit_log
+    FOR ALL
+    TO PUBLIC
+    USING (organization_id = current_setting('app.current_organization_id', true));
+
+-- Administrative bypass when no organization context is set
+DROP POLICY IF EXISTS admin_access_scans ON scans;
+CREATE POLICY admin_access_scans ON scans
+    FOR ALL
+    TO PUBLIC
+    USING (current_setting('app.current_organization_id', true) = '' OR
+           current_setting('app.admin_bypass', true) = 'true');
+
+DROP POLICY IF EXISTS admin_access_audit_log ON audit_log;
+CREATE POLICY admin_access_audit_log ON audit_log
+    FOR ALL
+    TO PUBLIC
+    USING (current_setting('app.current_organization_id', true) = '' OR
+           current_setting('app.admin_bypass', true) = 'true');
@@ -0,0 +1,25 @@
+-- GDPR-compliant visitor tracking
+-- Previously created by VisitorTracker._init_database.
+
+CREATE TABLE IF NOT EXISTS visitor_events (
+    event_id VARCHAR(36) PRIMARY KEY,
+    session_id VARCHAR(36) NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    anonymized_ip VARCHAR(64) NOT NULL,
+    user_agent TEXT,
+    page_path VARCHAR(500),
+    referrer VARCHAR(500),
+    country VARCHAR(2),
+    user_id VARCHAR(36),
+    username VARCHAR(100),
+    details JSONB,
+    success BOOLEAN DEFAULT TRUE,
+    error_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_visitor_events_timestamp ON visitor_events(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_visitor_events_session ON visitor_events(session_id);
+CREATE INDEX IF NOT EXISTS idx_visitor_events_type ON visitor_events(event_type);
+CREATE INDEX IF NOT EXISTS idx_visitor_events_user ON visitor_events(user_id);
@@ -0,0 +1,89 @@
+-- Payment, subscription, invoice, analytics and certificate records
+-- Previously created by DatabaseService._initialize_database.
+
+CREATE TABLE IF NOT EXISTS payment_records (
+    id SERIAL PRIMARY KEY,
+    session_id VARCHAR(255) UNIQUE NOT NULL,
+    customer_email VARCHAR(255) NOT NULL,
+    amount DECIMAL(10,2) NOT NULL,
+    currency VARCHAR(3) DEFAULT 'EUR',
+    scan_type VARCHAR(100) NOT NULL,
+    country_code VARCHAR(2) DEFAULT 'NL',
+    payment_method VARCHAR(50),
+    status VARCHAR(50) NOT NULL,
+    metadata JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS subscription_records (
+    id SERIAL PRIMARY KEY,
+    subscription_id VARCHAR(255) UNIQUE NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    customer_email VARCHAR(255) NOT NULL,
+    plan_name VARCHAR(100) NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    amount DECIMAL(10,2) NOT NULL,
+    currency VARCHAR(3) DEFAULT 'EUR',
+    billing_interval VARCHAR(20) DEFAULT 'month',
+    current_period_start TIMESTAMP,
+    current_period_end TIMESTAMP,
+    cancel_at_period_end BOOLEAN DEFAULT FALSE,
+    metadata JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS invoice_records (
+    id SERIAL PRIMARY KEY,
+    invoice_number VARCHAR(50) UNIQUE NOT NULL,
+    customer_email VARCHAR(255) NOT NULL,
+    customer_name VARCHAR(255),
+    customer_address TEXT,
+    amount_subtotal DECIMAL(10,2) NOT NULL,
+    amount_tax DECIMAL(10,2) NOT NULL,
+    amount_total DECIMAL(10,2) NOT NULL,
+    currency VARCHAR(3) DEFAULT 'EUR',
+    tax_rate DECIMAL(5,4),
+    country_code VARCHAR(2) DEFAULT 'NL',
+    description TEXT,
+    payment_status VARCHAR(50) DEFAULT 'paid',
+    pdf_generated BOOLEAN DEFAULT FALSE,
+    metadata JSONB,
+    issue_date DATE DEFAULT CURRENT_DATE,
+    due_date DATE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS analytics_events (
+    id SERIAL PRIMARY KEY,
+    event_type VARCHAR(100) NOT NULL,
+    user_id VARCHAR(255),
+    session_id VARCHAR(255),
+    event_data JSONB,
+    ip_address INET,
+    user_agent TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS certificate_records (
+    id SERIAL PRIMARY KEY,
+    certificate_id VARCHAR(255) UNIQUE NOT NULL,
+    customer_email VARCHAR(255) NOT NULL,
+    certificate_type VARCHAR(100) NOT NULL,
+    organization_name VARCHAR(255),
+    amount_paid DECIMAL(10,2),
+    currency VARCHAR(3) DEFAULT 'EUR',
+    status VARCHAR(50) DEFAULT 'issued',
+    issue_date DATE DEFAULT CURRENT_DATE,
+    expiry_date DATE,
+    pdf_generated BOOLEAN DEFAULT FALSE,
+    metadata JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_payment_records_email ON payment_records(customer_email);
+CREATE INDEX IF NOT EXISTS idx_payment_records_status ON payment_records(status);
+CREATE INDEX IF NOT EXISTS idx_subscription_records_customer ON subscription_records(customer_id);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_type ON analytics_events(event_type);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_created ON analytics_events(created_at);
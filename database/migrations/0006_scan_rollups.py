@@ -0,0 +1,95 @@
+"""
+Backfill for 0006_scan_rollups.sql
+
+Scans stored before the migration have critical_count 0 and no
+compliance_score. Both are computed from result_json with the summary used
+when a scan is stored (services/scan_rollups.summarize_scan_result); the
+findings in result_json are encrypted, so this runs in Python. The daily
+rollups are then built once from the filled columns.
+"""
+
+from psycopg2.extras import execute_values
+
+from services.encryption_service import get_encryption_service
+from services.finding_batch import loads
+from services.scan_rollups import summarize_scan_result
+
+# Scans read and updated per round trip
+BATCH_SIZE = 500
+
+# Only rows still holding the column defaults can predate the migration
+_SELECT_UNSUMMARISED = '''
+    SELECT scan_id, result_json::text
+    FROM scans
+    WHERE scan_id > %s AND critical_count = 0 AND compliance_score IS NULL
+    ORDER BY scan_id
+    LIMIT %s
+'''
+
+_UPDATE_SUMMARIES = '''
+    UPDATE scans SET critical_count = v.critical_count, compliance_score = v.compliance_score
+    FROM (VALUES %s) AS v (scan_id, critical_count, compliance_score)
+    WHERE scans.scan_id = v.scan_id
+'''
+
+_USER_ROLLUP_BACKFILL = '''
+    INSERT INTO scan_rollups_daily_user
+        (organization_id, username, day, scan_count, total_pii_found, high_risk_count,
+         critical_count, compliance_score_sum, compliance_score_count)
+    SELECT organization_id, username, timestamp::date, COUNT(*), SUM(total_pii_found),
+           SUM(high_risk_count), SUM(critical_count), COALESCE(SUM(compliance_score), 0),
+           COUNT(compliance_score)
+    FROM scans
+    WHERE NOT EXISTS (SELECT 1 FROM scan_rollups_daily_user)
+    GROUP BY organization_id, username, timestamp::date
+    ON CONFLICT DO NOTHING
+'''
+
+_ORG_ROLLUP_BACKFILL = '''
+    INSERT INTO scan_rollups_daily_org
+        (organization_id, day, scan_count, total_pii_found, high_risk_count,
+         critical_count, compliance_score_sum, compliance_score_count)
+    SELECT organization_id, timestamp::date, COUNT(*), SUM(total_pii_found),
+           SUM(high_risk_count), SUM(critical_count), COALESCE(SUM(compliance_score), 0),
+           COUNT(compliance_score)
+    FROM scans
+    WHERE NOT EXISTS (SELECT 1 FROM scan_rollups_daily_org)
+    GROUP BY organization_id, timestamp::date
+    ON CONFLICT DO NOTHING
+'''
+
+
+def backfill_summaries(cursor) -> int:
+    """
+    Fill critical_count and compliance_score of scans stored without them.
+
+    Returns:
+        Number of scans updated
+    """
+    encryption = get_encryption_service()
+    updated = 0
+    last_scan_id = ''
+    while True:
+        cursor.execute(_SELECT_UNSUMMARISED, (last_scan_id, BATCH_SIZE))
+        rows = cursor.fetchall()
+        if not rows:
+            return updated
+        summaries = []
+        for scan_id, result_json in rows:
+            result = loads(result_json)
+            if not isinstance(result, dict):
+                continue
+            # Fields that fail to decrypt stay out of the summary, as when the scan is read
+            summary = summarize_scan_result(encryption.decrypt_scan_result(result))
+            if summary.critical_count or summary.compliance_score is not None:
+                summaries.append((scan_id, summary.critical_count, summary.compliance_score))
+        if summaries:
+            execute_values(cursor, _UPDATE_SUMMARIES, summaries, template='(%s, %s, %s::real)')
+            updated += len(summaries)
+        last_scan_id = rows[-1][0]
+
+
+def migrate(cursor) -> None:
+    backfill_summaries(cursor)
+    cursor.execute(_USER_ROLLUP_BACKFILL)
+    cursor.execute(_ORG_ROLLUP_BACKFILL)
@@ -0,0 +1,33 @@
+-- Per-scan summary columns and daily dashboard rollups (see services/scan_rollups.py)
+
+ALTER TABLE scans ADD COLUMN IF NOT EXISTS critical_count INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE scans ADD COLUMN IF NOT EXISTS compliance_score REAL;
+
+CREATE TABLE IF NOT EXISTS scan_rollups_daily_user (
+    organization_id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    day DATE NOT NULL,
+    scan_count INTEGER NOT NULL DEFAULT 0,
+    total_pii_found BIGINT NOT NULL DEFAULT 0,
+    high_risk_count BIGINT NOT NULL DEFAULT 0,
+    critical_count BIGINT NOT NULL DEFAULT 0,
+    compliance_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    compliance_score_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (organization_id, username, day)
+);
+
+CREATE TABLE IF NOT EXISTS scan_rollups_daily_org (
+    organization_id TEXT NOT NULL,
+    day DATE NOT NULL,
+    scan_count INTEGER NOT NULL DEFAULT 0,
+    total_pii_found BIGINT NOT NULL DEFAULT 0,
+    high_risk_count BIGINT NOT NULL DEFAULT 0,
+    critical_count BIGINT NOT NULL DEFAULT 0,
+    compliance_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    compliance_score_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (organization_id, day)
+);
+
+-- Scans stored before this migration are summarised and rolled up by its
+-- Python step (0006_scan_rollups.py): their findings are encrypted
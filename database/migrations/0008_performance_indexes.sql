@@ -0,0 +1,28 @@
+-- no-transaction
+-- Dashboard and analytics performance indexes (from DATABASE_INDEXES.sql)
+-- Built CONCURRENTLY so they do not block writes on large tables. An INVALID
+-- index left by an interrupted build is dropped by the runner and rebuilt.
+
+-- Dashboard queries (username + organization + time)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_user_org_time
+    ON scans(username, organization_id, timestamp DESC);
+
+-- Scan type filtering and analytics by scan type
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_org_type
+    ON scans(organization_id, scan_type);
+
+-- Predictive analytics time-series queries
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_org_timestamp
+    ON scans(organization_id, timestamp DESC);
+
+-- Audit logs and activity reports
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_log_user_time
+    ON audit_log(username, timestamp DESC);
+
+-- High-risk scan filtering
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_risk_level
+    ON scans(organization_id, high_risk_count DESC);
+
+-- PII reports and compliance calculations
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_pii_count
+    ON scans(organization_id, total_pii_found DESC);
@@ -0,0 +1,26 @@
+-- Risk-adjusted score sums for the predictive analytics daily series (see services/scan_rollups.py)
+
+ALTER TABLE scan_rollups_daily_user ADD COLUMN IF NOT EXISTS risk_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+ALTER TABLE scan_rollups_daily_org ADD COLUMN IF NOT EXISTS risk_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+-- Backfill from the per-scan summary columns (formula of scan_rollups.risk_adjusted_score)
+UPDATE scan_rollups_daily_user r
+SET risk_score_sum = s.score_sum
+FROM (
+    SELECT organization_id, username, timestamp::date AS day,
+           SUM(GREATEST(85 - LEAST(total_pii_found * 0.5, 30) - LEAST(high_risk_count * 2, 20), 40)) AS score_sum
+    FROM scans
+    GROUP BY organization_id, username, timestamp::date
+) s
+WHERE r.organization_id = s.organization_id AND r.username = s.username AND r.day = s.day;
+
+UPDATE scan_rollups_daily_org r
+SET risk_score_sum = s.score_sum
+FROM (
+    SELECT organization_id, timestamp::date AS day,
+           SUM(GREATEST(85 - LEAST(total_pii_found * 0.5, 30) - LEAST(high_risk_count * 2, 20), 40)) AS score_sum
+    FROM scans
+    GROUP BY organization_id, timestamp::date
+) s
+WHERE r.organization_id = s.organization_id AND r.day = s.day;
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+DataGuardian Pro - Finding Batch Benchmark
+Runs CodeScanner.scan_directory over a synthetic repository and compares
+the findings it returns (per-file slices of one scan-level FindingBatch)
+with per-file batches and with the finding dicts the scanner builds before
+batching them: memory held, JSON size (the encrypted result_json payload)
+and pickle size, per finding.
+
+Usage:
+    python scripts/benchmark_finding_batch.py [--files 200] [--findings-per-file 8]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Set
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import code_scanner
+from services.code_scanner import CodeScanner
+from services.finding_batch import FindingBatch, dumps
+
+FINDING_LINES = [
+    'contact_{n} = "user{m}@example.com"',
+    'SUPPORT_PHONE_{n} = "+31 6 {m:08d}"',
+    'bsn_{n} = "{bsn}"',
+    'cursor.execute("SELECT * FROM users WHERE id=" + user_{n})',
+    'iban_{n} = "NL91ABNA04171643{m:02d}"',
+]
+
+PLAIN_LINES = [
+    'def handler_{n}(request):',
+    '    value_{n} = request.get("field_{n}", {m})',
+    '    return value_{n} * {m}',
+    '',
+]
+
+
+def generate_repository(root: str, file_count: int, findings_per_file: int, seed: int = 7) -> None:
+    """Write Python files with about findings_per_file PII or vulnerability lines each."""
+    rng = random.Random(seed)
+    for i in range(file_count):
+        package = os.path.join(root, f"pkg_{i // 50}")
+        os.makedirs(package, exist_ok=True)
+        lines = []
+        for j in range(rng.randint(findings_per_file // 2, findings_per_file * 3 // 2)):
+            lines.extend(rng.choice(PLAIN_LINES).format(n=j, m=rng.randrange(1000)) for _ in range(6))
+            lines.append(rng.choice(FINDING_LINES).format(n=j, m=rng.randrange(100),
+                                                          bsn=rng.randrange(10 ** 8, 10 ** 9)))
+        with open(os.path.join(package, f"module_{i}.py"), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def deep_size(value: Any, seen: Set[int]) -> int:
+    """Bytes held by value and everything it references, each object counted once."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif isinstance(value, FindingBatch):
+        size += sum(deep_size(getattr(value, slot), seen) for slot in FindingBatch.__slots__)
+    elif isinstance(value, np.ndarray) and value.base is not None:
+        size += deep_size(value.base, seen)
+    return size
+
+
+class CapturingBatch(FindingBatch):
+    """FindingBatch that keeps the finding dicts the scanner built"""
+    captured: Dict[str, List[Dict[str, Any]]] = {}
+    current = ''
+
+    @classmethod
+    def from_dicts(cls, findings):
+        findings = list(findings)
+        if findings:
+            cls.captured[cls.current] = findings
+        return FindingBatch.from_dicts(findings)
+
+
+def scan_as_dicts(root: str, region: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Each file's findings as the dicts CodeScanner builds before batching them"""
+    scanner = CodeScanner(region=region)
+    code_scanner.FindingBatch = CapturingBatch
+    try:
+        for directory, _, names in os.walk(root):
+            for name in sorted(names):
+                CapturingBatch.current = os.path.join(directory, name)
+                scanner.scan_file(CapturingBatch.current)
+    finally:
+        code_scanner.FindingBatch = FindingBatch
+    return CapturingBatch.captured
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Finding batch benchmark")
+    parser.add_argument("--files", type=int, default=200, help="number of synthetic source files")
+    parser.add_argument("--findings-per-file", type=int, default=8, help="average finding lines per file")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="finding_batch_bench_")
+    try:
+        generate_repository(root, args.files, args.findings_per_file)
+        by_file = scan_as_dicts(root, "Netherlands")
+
+        start = time.perf_counter()
+        result = CodeScanner(region="Netherlands").scan_directory(root, smart_sampling=False)
+        seconds = time.perf_counter() - start
+        merged = {f['file_path']: f['pii_found'] for f in result['findings']}
+        paths = sorted(merged)
+        finding_count = sum(len(merged[path]) for path in paths)
+        print(f"Scan: {len(paths)} files with findings, {finding_count} findings in {seconds:.1f} s")
+
+        dicts = [by_file[path] for path in paths]
+        per_file = [FindingBatch.from_dicts(found) for found in dicts]
+        scan_level = [merged[path] for path in paths]
+        identical = dicts == [found.to_dicts() for found in scan_level] == [found.to_dicts() for found in per_file]
+        print(f"Identical findings: {identical}")
+
+        shapes = [
+            ('dicts', dicts, len(json.dumps(dicts, default=str))),
+            ('per-file batches', per_file, len(dumps(per_file))),
+            ('scan-level batch', scan_level, len(dumps(scan_level))),
+        ]
+        print(f"{'per finding':22}{'memory':>12}{'JSON':>12}{'pickle':>12}")
+        baseline = None
+        for name, findings, json_size in shapes:
+            sizes = (deep_size(findings, set()), json_size, len(pickle.dumps(findings)))
+            print(f"{name:22}" + "".join(f"{size / finding_count:10.0f} B" for size in sizes))
+            if baseline is None:
+                baseline = sizes
+            else:
+                print(f"{'  smaller than dicts':22}" + "".join(f"{old / new:11.1f}x" for old, new in zip(baseline, sizes)))
+        return 0 if identical else 1
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+DataGuardian Pro - SOC2 IaC Scanning Benchmark
+Compares the original per-file regex loop with the batched IaC engine
+(precompiled rule sets, literal prefilter, bisect line mapping, process pool)
+on a synthetic Terraform/Kubernetes corpus and checks results are identical.
+
+Usage:
+    python scripts/benchmark_soc2_iac.py [--files 2000] [--workers 4]
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Any, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.soc2_scanner import (
+    IaC_RISK_PATTERNS, FINDING_TO_TSC_MAP, CATEGORY_TO_TSC_MAP, SOC2_TSC_MAPPING,
+    scan_iac_files
+)
+
+TERRAFORM_BLOCKS = [
+    'resource "aws_instance" "web_{n}" {{\n  ami           = "ami-{n:08d}"\n  instance_type = "t3.micro"\n'
+    '  monitoring    = {flag}\n  disable_api_termination = {flag}\n  tags = {{\n    Name = "web-{n}"\n  }}\n}}\n',
+    'resource "aws_s3_bucket" "data_{n}" {{\n  bucket = "data-{n}"\n  acl    = "{acl}"\n'
+    '  versioning {{\n    enabled = true\n  }}\n}}\n',
+    'resource "aws_security_group" "sg_{n}" {{\n  name = "sg-{n}"\n  ingress {{\n    from_port = 443\n'
+    '    to_port   = 443\n    protocol  = "tcp"\n    cidr_blocks = ["{cidr}"]\n  }}\n}}\n',
+    'resource "aws_db_instance" "db_{n}" {{\n  engine = "postgres"\n  storage_encrypted = true\n'
+    '  backup_retention_period = 7\n  username = "app"\n}}\n',
+    'variable "region_{n}" {{\n  type    = string\n  default = "eu-west-1"\n}}\n',
+]
+
+KUBERNETES_BLOCK = (
+    'apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: svc-{n}\n  namespace: {namespace}\n'
+    'spec:\n  template:\n    spec:\n      containers:\n        - name: app\n          image: registry/app:{n}\n'
+    '          securityContext:\n            privileged: {flag}\n            runAsNonRoot: true\n---\n'
+)
+
+
+def generate_corpus(root: str, file_count: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """Write a synthetic Terraform/Kubernetes monorepo and return (path, tech) pairs."""
+    rng = random.Random(seed)
+    files = []
+    for i in range(file_count):
+        module_dir = os.path.join(root, f"module_{i // 50}")
+        os.makedirs(module_dir, exist_ok=True)
+        if i % 4 == 3:
+            path = os.path.join(module_dir, f"deploy_{i}.yaml")
+            tech = "kubernetes"
+            body = "".join(
+                KUBERNETES_BLOCK.format(
+                    n=i * 100 + j,
+                    namespace=rng.choice(["default", "prod", "staging"]),
+                    flag=rng.choice(["true", "false", "false"]),
+                )
+                for j in range(rng.randint(5, 30))
+            )
+        else:
+            path = os.path.join(module_dir, f"main_{i}.tf")
+            tech = "terraform"
+            body = 'provider "aws" {\n  region = "eu-west-1"\n}\n' + "".join(
+                rng.choice(TERRAFORM_BLOCKS).format(
+                    n=i * 100 + j,
+                    flag=rng.choice(["true", "false"]),
+                    acl=rng.choice(["private", "private", "public-read"]),
+                    cidr=rng.choice(["10.0.0.0/16", "0.0.0.0/0"]),
+                )
+                for j in range(rng.randint(10, 80))
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+        files.append((path, tech))
+    return files
+
+
+def legacy_scan_iac_file(file_path: str, tech: str) -> List[Dict[str, Any]]:
+    """The original scan_iac_file loop, kept here as the benchmark baseline."""
+    findings = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    for pattern, (description, severity, recommendation, category) in IaC_RISK_PATTERNS[tech].items():
+        for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+            line_num = content[:match.start()].count('\n') + 1
+            context_start = max(0, content.rfind('\n', 0, match.start()) + 1)
+            context_end = content.find('\n', match.end())
+            if context_end == -1:
+                context_end = len(content)
+            tsc_criteria = FINDING_TO_TSC_MAP.get(description) or CATEGORY_TO_TSC_MAP.get(category, [])
+            findings.append({
+                "file": file_path,
+                "line": line_num,
+                "description": description,
+                "risk_level": severity,
+                "recommendation": recommendation,
+                "category": category,
+                "location": f"{os.path.basename(file_path)}:{line_num}",
+                "code_snippet": content[context_start:context_end].strip(),
+                "technology": tech,
+                "soc2_tsc_criteria": tsc_criteria,
+                "soc2_tsc_details": [
+                    {"criterion": c, "description": SOC2_TSC_MAPPING.get(c, "")} for c in tsc_criteria
+                ],
+            })
+    return findings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SOC2 IaC scanning benchmark")
+    parser.add_argument("--files", type=int, default=2000, help="number of synthetic IaC files")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="soc2_iac_bench_")
+    try:
+        files = generate_corpus(root, args.files)
+        total_bytes = sum(os.path.getsize(path) for path, _ in files)
+        print(f"Corpus: {len(files)} files, {total_bytes / 1e6:.1f} MB in {root}")
+
+        start = time.perf_counter()
+        legacy = [legacy_scan_iac_file(path, tech) for path, tech in files]
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        serial = scan_iac_files(files, max_workers=1)
+        serial_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = scan_iac_files(files, max_workers=args.workers)
+        batched_seconds = time.perf_counter() - start
+
+        identical = legacy == [f for _, f in serial] == [f for _, f in batched]
+        finding_count = sum(len(f) for f in legacy)
+        print(f"Findings: {finding_count} (identical results: {identical})")
+        print(f"Legacy per-file loop : {legacy_seconds:8.2f} s")
+        print(f"Compiled, serial     : {serial_seconds:8.2f} s  ({legacy_seconds / serial_seconds:.1f}x)")
+        print(f"Compiled, pool       : {batched_seconds:8.2f} s  ({legacy_seconds / batched_seconds:.1f}x)")
+        return 0 if identical else 1
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+DataGuardian Pro - Startup Import Report
+Measures the import cost of the landing page path with `python -X importtime`
+and flags heavy ML/PDF/plotting stacks that should only load on first use.
+
+Usage:
+    python scripts/startup_import_report.py [--top 25] [--budget-ms 2500] [--json]
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, 'app.py')
+
+# Modules main() imports inside functions before render_landing_page()
+# returns for an anonymous visitor (app.py's module-level imports are read
+# from the file)
+MAIN_PATH_MODULES = [
+    'services.download_reports',
+    'utils.i18n',
+    'services.enterprise_orchestrator',
+    'services.scanner_registry',
+]
+
+# Packages that must never be imported on the landing page path
+HEAVY_MODULES = [
+    'torch',
+    'tensorflow',
+    'onnx',
+    'onnxruntime',
+    'reportlab',
+    'weasyprint',
+    'plotly',
+    'cv2',
+    'pytesseract',
+    'sklearn',
+    'matplotlib',
+]
+
+DEFAULT_BUDGET_MS = float(os.environ.get('DG_STARTUP_IMPORT_BUDGET_MS', '2500'))
+
+
+def module_level_imports(path: str = APP_PATH) -> List[str]:
+    """
+    Project modules a file imports at module level, in order.
+
+    Imports inside try/if/with blocks count; imports in function and class
+    bodies and in except handlers (fallbacks) do not. Standard library and
+    third-party modules are left out.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    modules: List[str] = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            blocks = [getattr(node, field, []) for field in ('body', 'orelse', 'finalbody')]
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                pending[0:0] = [child for block in blocks for child in block]
+            continue
+        for name in names:
+            top = name.split('.')[0]
+            is_project = os.path.isdir(os.path.join(PROJECT_ROOT, top)) or \
+                os.path.isfile(os.path.join(PROJECT_ROOT, top + '.py'))
+            if is_project and name not in modules:
+                modules.append(name)
+    return modules
+
+
+# Modules imported by app.py at module level plus the ones main() touches
+# before render_landing_page() returns for an anonymous visitor.
+_APP_MODULES = module_level_imports()
+LANDING_PAGE_MODULES = _APP_MODULES + [module for module in MAIN_PATH_MODULES if module not in _APP_MODULES]
+
+
+@dataclass
+class ImportRecord:
+    """Single line of `-X importtime` output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the stderr produced by `python -X importtime`."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip(' ')
+        depth = (len(name) - len(stripped)) // 2
+        records.append(ImportRecord(stripped, self_us, cumulative_us, depth))
+    return records
+
+
+def run_importtime(modules: List[str], python: Optional[str] = None) -> List[ImportRecord]:
+    """Import modules in a fresh interpreter and return the import timings."""
+    statement = '; '.join(f'import {module}' for module in modules)
+    proc = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ['unknown error']
+        raise RuntimeError(f"Landing page imports failed: {tail[0]}")
+    return parse_importtime(proc.stderr)
+
+
+def build_report(records: List[ImportRecord], top: int = 25,
+                 budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, Any]:
+    """Summarise import timings into a startup report."""
+    total_us = sum(r.cumulative_us for r in records if r.depth == 0)
+    heavy = sorted({
+        r.module for r in records
+        if r.module.split('.')[0] in HEAVY_MODULES
+    })
+    slowest = sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+    return {
+        'total_ms': round(total_us / 1000, 1),
+        'budget_ms': budget_ms,
+        'within_budget': total_us / 1000 <= budget_ms,
+        'module_count': len(records),
+        'heavy_modules': heavy,
+        'slowest': [asdict(r) for r in slowest],
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a human readable startup report."""
+    print("=" * 72)
+    print("DataGuardian Pro - Landing Page Startup Import Report")
+    print("=" * 72)
+    print(f"Modules imported : {report['module_count']}")
+    print(f"Total import time: {report['total_ms']:.1f} ms (budget {report['budget_ms']:.0f} ms)")
+    print(f"Within budget    : {'yes' if report['within_budget'] else 'NO'}")
+    if report['heavy_modules']:
+        print(f"Heavy modules    : {', '.join(report['heavy_modules'])}")
+    print("-" * 72)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for r in report['slowest']:
+        print(f"{r['cumulative_us'] / 1000:>14.1f} {r['self_us'] / 1000:>9.1f}  {'  ' * r['depth']}{r['module']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--top', type=int, default=25, help='number of slowest imports to show')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='total import budget')
+    parser.add_argument('--json', action='store_true', help='emit JSON instead of a table')
+    args = parser.parse_args()
+
+    report = build_report(run_importtime(LANDING_PAGE_MODULES), args.top, args.budget_ms)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0 if report['within_budget'] and not report['heavy_modules'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
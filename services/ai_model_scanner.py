@@ -34,35 +34,32 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 import streamlit as st
 
-# ML Framework imports for enhanced analysis
-try:
-    import torch
-    import torch.nn as nn
-    TORCH_AVAILABLE = True
-except ImportError:
-    class MockTorch:
-        nn = None
-        def load(self, *args, **kwargs):
-            raise ImportError("PyTorch not available")
-    torch = MockTorch()
-    nn = None
-    TORCH_AVAILABLE = False
+# ML framework imports are deferred until a model of that framework is
+# analysed: importing torch/tensorflow/onnxruntime at module load adds
+# seconds to the first render of the AI Model Scanner page.
+_ML_FRAMEWORK_CACHE: Dict[str, Any] = {}
 
-try:
-    import tensorflow as tf
-    TF_AVAILABLE = True
-except ImportError:
-    tf = None
-    TF_AVAILABLE = False
 
-try:
-    import onnx
-    import onnxruntime as ort
-    ONNX_AVAILABLE = True
-except ImportError:
-    onnx = None
-    ort = None
-    ONNX_AVAILABLE = False
+def _load_ml_framework(name: str) -> Any:
+    """Import an optional ML framework on first use; returns None if missing."""
+    if name not in _ML_FRAMEWORK_CACHE:
+        try:
+            if name == 'torch':
+                import torch
+                import torch.nn as nn
+                _ML_FRAMEWORK_CACHE[name] = (torch, nn)
+            elif name == 'tensorflow':
+                import tensorflow as tf
+                _ML_FRAMEWORK_CACHE[name] = tf
+            elif name == 'onnx':
+                import onnx
+                import onnxruntime as ort
+                _ML_FRAMEWORK_CACHE[name] = (onnx, ort)
+            else:
+                raise ValueError(f"Unknown ML framework: {name}")
+        except ImportError:
+            _ML_FRAMEWORK_CACHE[name] = None
+    return _ML_FRAMEWORK_CACHE[name]
 
 try:
     import joblib
@@ -669,7 +666,8 @@ class AIModelScanner:
     
     def _analyze_pytorch_model(self, model_path: str, status=None):
         """Analyze PyTorch model for privacy risks"""
-        if not TORCH_AVAILABLE or torch is None:
+        torch_modules = _load_ml_framework('torch')
+        if torch_modules is None:
             return {
                 'framework': 'PyTorch',
                 'analysis_error': 'PyTorch not available',
@@ -683,6 +681,7 @@ class AIModelScanner:
             }
         
         try:
+            torch, nn = torch_modules
             # Load model
             model = torch.load(model_path, map_location='cpu')
             
@@ -724,7 +723,8 @@ class AIModelScanner:
     
     def _analyze_tensorflow_model(self, model_path: str, status=None):
         """Analyze TensorFlow model for privacy risks"""
-        if not TF_AVAILABLE or tf is None:
+        tf = _load_ml_framework('tensorflow')
+        if tf is None:
             return {
                 'framework': 'TensorFlow',
                 'analysis_error': 'TensorFlow not available',
@@ -740,7 +740,7 @@ class AIModelScanner:
         try:
             # Load model safely with TensorFlow availability check
             model = None
-            if TF_AVAILABLE and tf:
+            if tf:
                 try:
                     # Try to load with Keras first
                     keras_module = getattr(tf, 'keras', None)
@@ -792,7 +792,8 @@ class AIModelScanner:
     
     def _analyze_onnx_model(self, model_path: str, status=None):
         """Analyze ONNX model for privacy risks"""
-        if not ONNX_AVAILABLE or onnx is None or ort is None:
+        onnx_modules = _load_ml_framework('onnx')
+        if onnx_modules is None:
             return {
                 'framework': 'ONNX',
                 'analysis_error': 'ONNX not available',
@@ -806,6 +807,7 @@ class AIModelScanner:
             }
         
         try:
+            onnx, ort = onnx_modules
             # Load ONNX model
             model = onnx.load(model_path)
             session = ort.InferenceSession(model_path)
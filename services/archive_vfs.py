@@ -0,0 +1,529 @@
+"""
+Archive VFS - Streaming Archive Members Without Extraction
+
+Uploaded zip, tar (plain, gz, bz2, xz), single-file gzip/bz2/xz, 7z and
+Office packages used to be skipped as opaque binaries or unpacked into a
+temporary directory before scanning. ArchiveWalker instead walks an
+archive as a virtual filesystem: members are decompressed as streams and
+handed to the scanners one at a time, with a provenance path such as
+``uploads/export.zip!/hr/staff.tar.gz!/staff.csv``. Archives nested inside
+archives are walked the same way up to a configurable depth.
+
+Office Open XML and OpenDocument packages (docx, xlsx, pptx, odt, ...) are
+presented as one member whose content is the text of their document parts,
+streamed out of the package XML.
+
+Tar streams are read strictly sequentially. Zip and 7z need random access,
+so a nested one is spooled into a SpooledTemporaryFile (memory up to
+SPOOL_MEMORY_BYTES); nothing is written next to the upload.
+
+Zip-bomb limits are enforced on the bytes actually decompressed, not on
+the sizes an archive declares: a shared budget caps the number of entries,
+the total decompressed size and the expansion ratio against the archive's
+size on disk. Exceeding one raises ArchiveLimitError and the archive is
+rejected.
+
+scan_archive() feeds members to a scanner's scan_member() in a process
+pool, keeping at most a few members per worker in flight.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import multiprocessing
+import os
+import re
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+try:
+    import py7zr
+    PY7ZR_AVAILABLE = True
+except ImportError:
+    PY7ZR_AVAILABLE = False
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("archive_vfs")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEPTH = int(os.environ.get('DG_ARCHIVE_MAX_DEPTH', '3'))
+DEFAULT_MAX_RATIO = float(os.environ.get('DG_ARCHIVE_MAX_RATIO', '100'))
+DEFAULT_MAX_TOTAL_BYTES = int(os.environ.get('DG_ARCHIVE_MAX_TOTAL_BYTES', str(2 * 1024 * 1024 * 1024)))
+DEFAULT_MAX_ENTRIES = int(os.environ.get('DG_ARCHIVE_MAX_ENTRIES', '10000'))
+DEFAULT_MAX_MEMBER_BYTES = int(os.environ.get('DG_ARCHIVE_MAX_MEMBER_BYTES', str(50 * 1024 * 1024)))
+DEFAULT_WORKERS = int(os.environ.get('DG_ARCHIVE_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# The ratio limit applies once this much has been decompressed, so small
+# archives of very compressible text are not rejected
+RATIO_FLOOR_BYTES = 1024 * 1024
+
+# Nested zip/7z archives are spooled in memory up to this size, then to disk
+SPOOL_MEMORY_BYTES = 16 * 1024 * 1024
+
+# Members in flight per worker
+QUEUE_DEPTH_PER_WORKER = 2
+
+MEMBER_SEPARATOR = '!/'
+
+ARCHIVE_EXTENSIONS = ('.zip', '.jar', '.war', '.tar', '.tgz', '.tbz2', '.txz', '.gz', '.bz2', '.xz', '.7z')
+OFFICE_EXTENSIONS = ('.docx', '.docm', '.xlsx', '.xlsm', '.pptx', '.pptm', '.odt', '.ods', '.odp')
+
+# Package parts that hold document text
+_OFFICE_TEXT_PART = re.compile(
+    r'^(?:word/(?:document|footnotes|endnotes|comments|header\d*|footer\d*)\.xml'
+    r'|xl/sharedStrings\.xml|xl/worksheets/sheet\d+\.xml'
+    r'|ppt/(?:slides/slide\d+|notesSlides/notesSlide\d+)\.xml'
+    r'|docProps/(?:core|app)\.xml|content\.xml|meta\.xml)$'
+)
+
+# XML elements that end a line of document text (paragraphs, rows)
+_OFFICE_LINE_ELEMENTS = frozenset({'p', 'row', 'h', 'tr'})
+
+_SINGLE_STREAM_SUFFIXES = {'.gz': '', '.bz2': '', '.xz': '', '.tgz': '.tar', '.tbz2': '.tar', '.txz': '.tar'}
+
+
+class ArchiveLimitError(Exception):
+    """An archive exceeded the zip-bomb limits and was rejected."""
+    pass
+
+
+class MemberTooLargeError(ArchiveLimitError):
+    """One member is larger than max_member_bytes; only that member is skipped."""
+    pass
+
+
+@dataclass
+class ArchiveLimits:
+    """Zip-bomb and nesting limits for one archive walk."""
+    max_depth: int = DEFAULT_MAX_DEPTH
+    max_ratio: float = DEFAULT_MAX_RATIO
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_member_bytes: int = DEFAULT_MAX_MEMBER_BYTES
+
+
+class _Budget:
+    """Entries and decompressed bytes consumed by one archive walk."""
+
+    def __init__(self, limits: ArchiveLimits, archive_bytes: int):
+        self.limits = limits
+        self.archive_bytes = max(archive_bytes, 1)
+        self.entries = 0
+        self.total_bytes = 0
+
+    def entry(self, path: str) -> None:
+        self.entries += 1
+        if self.entries > self.limits.max_entries:
+            raise ArchiveLimitError(f"More than {self.limits.max_entries} entries (at {path})")
+
+    def consume(self, count: int) -> None:
+        self.total_bytes += count
+        if self.total_bytes > self.limits.max_total_bytes:
+            raise ArchiveLimitError(
+                f"Decompressed size exceeds {self.limits.max_total_bytes} bytes")
+        if (self.total_bytes > RATIO_FLOOR_BYTES
+                and self.total_bytes > self.archive_bytes * self.limits.max_ratio):
+            raise ArchiveLimitError(
+                f"Expansion ratio exceeds {self.limits.max_ratio:g}:1 "
+                f"({self.total_bytes} bytes from a {self.archive_bytes} byte archive)")
+
+
+class _CountingReader(io.RawIOBase):
+    """Read-only stream that charges every decompressed byte to the budget."""
+
+    def __init__(self, raw, budget: _Budget):
+        self._raw = raw
+        self._budget = budget
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        count = len(data)
+        buffer[:count] = data
+        if count:
+            self._budget.consume(count)
+        return count
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Stream that replays already-peeked bytes before the rest of `raw`."""
+
+    def __init__(self, head: bytes, raw):
+        self._head = head
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._head:
+            count = min(len(buffer), len(self._head))
+            buffer[:count] = self._head[:count]
+            self._head = self._head[count:]
+            return count
+        data = self._raw.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _peek(stream, size: int) -> Tuple[bytes, Any]:
+    """First `size` bytes of a stream, and a stream that still starts with them."""
+    head = b''
+    while len(head) < size:
+        data = stream.read(size - len(head))
+        if not data:
+            break
+        head += data
+    return head, io.BufferedReader(_PrefixedReader(head, stream))
+
+
+def _container_kind(name: str, head: bytes) -> Optional[str]:
+    """Container format of a member from its name and first bytes."""
+    lower = name.lower()
+    if head[:4] in (b'PK\x03\x04', b'PK\x05\x06'):
+        return 'office' if lower.endswith(OFFICE_EXTENSIONS) else 'zip'
+    if head[:2] == b'\x1f\x8b':
+        return 'gzip'
+    if head[:3] == b'BZh' and head[3:4].isdigit():
+        return 'bz2'
+    if head[:6] == b'\xfd7zXZ\x00':
+        return 'xz'
+    if head[:6] == b'7z\xbc\xaf\x27\x1c':
+        return '7z'
+    if head[257:262] == b'ustar':
+        return 'tar'
+    return None
+
+
+def is_archive_path(path: str) -> bool:
+    """Whether a file is an archive the walker opens (by extension)."""
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _strip_single_stream_suffix(name: str) -> str:
+    base, ext = os.path.splitext(name)
+    ext = ext.lower()
+    return base + _SINGLE_STREAM_SUFFIXES[ext] if ext in _SINGLE_STREAM_SUFFIXES else name
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _office_part_text(stream) -> str:
+    """Text nodes of one package XML part, a line per paragraph or row."""
+    pieces: List[str] = []
+    for _, element in ElementTree.iterparse(stream, events=('end',)):
+        if element.text and element.text.strip():
+            pieces.append(element.text)
+            pieces.append(' ')
+        if _local_name(element.tag) in _OFFICE_LINE_ELEMENTS:
+            pieces.append('\n')
+        element.clear()
+    return ''.join(pieces)
+
+
+class ArchiveMember:
+    """
+    One file inside an archive.
+
+    The stream is only valid until the walk moves to the next member.
+    """
+    __slots__ = ('path', 'name', 'size', 'depth', 'kind', '_stream', '_limit')
+
+    def __init__(self, path: str, name: str, size: Optional[int], depth: int, stream,
+                 limit: int, kind: str = 'file'):
+        self.path = path
+        self.name = name
+        self.size = size
+        self.depth = depth
+        self.kind = kind
+        self._stream = stream
+        self._limit = limit
+
+    def open(self):
+        """Binary stream of the member's content."""
+        return self._stream
+
+    def read(self) -> bytes:
+        """
+        Whole member content; for Office packages, their text as UTF-8.
+
+        Raises:
+            MemberTooLargeError: If the member is larger than max_member_bytes
+        """
+        data = self._stream.read(self._limit + 1)
+        if len(data) > self._limit:
+            raise MemberTooLargeError(f"larger than {self._limit} bytes")
+        return data
+
+
+class ArchiveWalker:
+    """
+    Iterate the members of an archive, and of archives nested in it, as streams.
+
+    Members that cannot be read (encrypted, too large, nested too deep, or
+    7z without py7zr) are skipped and listed in `skipped`.
+    """
+
+    def __init__(self, limits: Optional[ArchiveLimits] = None):
+        self.limits = limits or ArchiveLimits()
+        self.skipped: List[Dict[str, str]] = []
+
+    def walk(self, archive_path: str) -> Iterator[ArchiveMember]:
+        """
+        Members of an archive on disk, in archive order.
+
+        Args:
+            archive_path: Path to the archive
+
+        Raises:
+            ArchiveLimitError: If the archive exceeds the zip-bomb limits
+        """
+        self.skipped = []
+        budget = _Budget(self.limits, os.path.getsize(archive_path))
+        with open(archive_path, 'rb') as f:
+            head, _ = _peek(f, 512)
+            f.seek(0)
+            kind = _container_kind(archive_path, head)
+            if kind is None:
+                raise ValueError(f"Not a supported archive: {archive_path}")
+            yield from self._container(kind, f, archive_path, os.path.basename(archive_path), 0, budget,
+                                       counted=False)
+
+    def skip(self, path: str, reason: str) -> None:
+        """Record a member that was not scanned."""
+        logger.info(f"Skipping archive member {path}: {reason}")
+        self.skipped.append({'path': path, 'reason': reason})
+
+    def _member(self, stream, path: str, name: str, size: Optional[int], depth: int,
+                budget: _Budget) -> Iterator[ArchiveMember]:
+        """A (budget-charged) member stream: descended into if it is a container, yielded otherwise."""
+        head, stream = _peek(stream, 512)
+        kind = _container_kind(name, head)
+        if kind is None:
+            yield ArchiveMember(path, name, size, depth, stream, self.limits.max_member_bytes)
+        elif kind != 'office' and depth >= self.limits.max_depth:
+            self.skip(path, f"nested deeper than {self.limits.max_depth} archives")
+        else:
+            yield from self._container(kind, stream, path, name, depth, budget, counted=True)
+
+    def _container(self, kind: str, stream, path: str, name: str, depth: int,
+                   budget: _Budget, counted: bool) -> Iterator[ArchiveMember]:
+        # `counted`: bytes read from `stream` are already charged to the budget
+        if kind in ('zip', 'office', '7z') and not stream.seekable():
+            with self._spool(stream) as spooled:
+                yield from self._container(kind, spooled, path, name, depth, budget, counted)
+            return
+        if kind == 'zip':
+            yield from self._zip(stream, path, depth, budget)
+        elif kind == 'office':
+            yield from self._office(stream, path, name, depth, budget)
+        elif kind == 'tar':
+            yield from self._tar(stream, path, depth, budget, counted)
+        elif kind == '7z':
+            yield from self._sevenzip(stream, path, depth, budget)
+        else:
+            opener = {'gzip': gzip.GzipFile, 'bz2': bz2.BZ2File, 'xz': lzma.LZMAFile}[kind]
+            decompressed = io.BufferedReader(_CountingReader(opener(fileobj=stream) if kind == 'gzip'
+                                                             else opener(stream), budget))
+            head, decompressed = _peek(decompressed, 512)
+            if head[257:262] == b'ustar':
+                yield from self._tar(decompressed, path, depth, budget, counted=True)
+            else:
+                inner = _strip_single_stream_suffix(name.rsplit('/', 1)[-1])
+                budget.entry(path)
+                yield from self._member(decompressed, f"{path}{MEMBER_SEPARATOR}{inner}", inner, None,
+                                        depth + 1, budget)
+
+    @staticmethod
+    def _spool(stream):
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+        while True:
+            chunk = stream.read(1024 * 1024)
+            if not chunk:
+                break
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled
+
+    def _zip(self, stream, path: str, depth: int, budget: _Budget) -> Iterator[ArchiveMember]:
+        with zipfile.ZipFile(stream) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                member_path = f"{path}{MEMBER_SEPARATOR}{info.filename}"
+                budget.entry(member_path)
+                if info.flag_bits & 0x1:
+                    self.skip(member_path, 'encrypted')
+                    continue
+                if (info.file_size > RATIO_FLOOR_BYTES
+                        and info.file_size > max(info.compress_size, 1) * self.limits.max_ratio):
+                    raise ArchiveLimitError(
+                        f"Member {member_path} declares a {info.file_size // max(info.compress_size, 1)}:1 ratio")
+                if info.file_size > self.limits.max_member_bytes and not is_archive_path(info.filename):
+                    self.skip(member_path, f"larger than {self.limits.max_member_bytes} bytes")
+                    continue
+                with archive.open(info) as raw:
+                    member_stream = io.BufferedReader(_CountingReader(raw, budget))
+                    yield from self._member(member_stream, member_path, info.filename, info.file_size,
+                                            depth + 1, budget)
+
+    def _tar(self, stream, path: str, depth: int, budget: _Budget, counted: bool) -> Iterator[ArchiveMember]:
+        # Read as a sequential stream, also when the tar is a file on disk
+        with tarfile.open(fileobj=stream, mode='r|') as archive:
+            for info in archive:
+                if not info.isfile():
+                    continue
+                member_path = f"{path}{MEMBER_SEPARATOR}{info.name}"
+                budget.entry(member_path)
+                if info.size > self.limits.max_member_bytes and not is_archive_path(info.name):
+                    self.skip(member_path, f"larger than {self.limits.max_member_bytes} bytes")
+                    continue
+                raw = archive.extractfile(info)
+                member_stream = raw if counted else io.BufferedReader(_CountingReader(raw, budget))
+                yield from self._member(member_stream, member_path, info.name, info.size, depth + 1, budget)
+
+    def _office(self, stream, path: str, name: str, depth: int, budget: _Budget) -> Iterator[ArchiveMember]:
+        parts: List[str] = []
+        with zipfile.ZipFile(stream) as package:
+            for info in package.infolist():
+                if not _OFFICE_TEXT_PART.match(info.filename):
+                    continue
+                budget.entry(f"{path}{MEMBER_SEPARATOR}{info.filename}")
+                with package.open(info) as raw:
+                    try:
+                        parts.append(_office_part_text(io.BufferedReader(_CountingReader(raw, budget))))
+                    except ElementTree.ParseError as e:
+                        self.skip(f"{path}{MEMBER_SEPARATOR}{info.filename}", f"unreadable XML: {e}")
+        text = '\n'.join(part for part in parts if part).encode('utf-8')
+        yield ArchiveMember(path, name, len(text), depth, io.BytesIO(text), self.limits.max_member_bytes,
+                            kind='office')
+
+    def _sevenzip(self, stream, path: str, depth: int, budget: _Budget) -> Iterator[ArchiveMember]:
+        if not PY7ZR_AVAILABLE:
+            self.skip(path, '7z archives require py7zr')
+            return
+        with py7zr.SevenZipFile(stream, mode='r') as archive:
+            infos = [info for info in archive.list() if not info.is_directory]
+            for info in infos:
+                member_path = f"{path}{MEMBER_SEPARATOR}{info.filename}"
+                budget.entry(member_path)
+                if info.uncompressed > self.limits.max_member_bytes and not is_archive_path(info.filename):
+                    self.skip(member_path, f"larger than {self.limits.max_member_bytes} bytes")
+                    continue
+                archive.reset()
+                extracted = archive.read([info.filename]) or {}
+                data = extracted.get(info.filename)
+                if data is None:
+                    continue
+                member_stream = io.BufferedReader(_CountingReader(data, budget))
+                yield from self._member(member_stream, member_path, info.filename, info.uncompressed,
+                                        depth + 1, budget)
+
+
+# Scanner of the current pool worker, set once per process by the initializer
+_worker_scanner = None
+
+
+def _init_worker(scanner) -> None:
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _scan_in_worker(path: str, data: bytes, kind: str) -> Dict[str, Any]:
+    return _worker_scanner.scan_member(path, data, kind)
+
+
+def scan_archive(archive_path: str, scanner, limits: Optional[ArchiveLimits] = None,
+                 max_workers: Optional[int] = None,
+                 accept: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+    """
+    Scan every member of an archive with a scanner's scan_member().
+
+    Members are read in archive order by this process and scanned in a
+    process pool (the scanner is sent to each worker once). Inside a pool
+    worker, or with max_workers <= 1, members are scanned inline.
+
+    Args:
+        archive_path: Path to the archive
+        scanner: Object with scan_member(path, data, kind) -> result dict
+        limits: Zip-bomb and nesting limits
+        max_workers: Worker processes (default DG_ARCHIVE_WORKERS)
+        accept: Optional filter on member paths; other members are not read
+
+    Returns:
+        Dictionary with status ('completed' or 'rejected'), member results
+        in archive order, skipped members and, if rejected, the error
+    """
+    walker = ArchiveWalker(limits)
+    workers = DEFAULT_WORKERS if max_workers is None else max_workers
+    if multiprocessing.current_process().daemon:
+        workers = 1
+    results: Dict[int, Dict[str, Any]] = {}
+    status, error = 'completed', None
+    filtered = 0
+
+    def collect(done):
+        for future in done:
+            index = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.warning(f"Scanning archive member failed: {e}")
+
+    pending: Dict[Any, int] = {}
+    executor = (ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scanner,))
+                if workers > 1 else None)
+    members = walker.walk(archive_path)
+    try:
+        for index, member in enumerate(members):
+            if accept is not None and not accept(member.path):
+                filtered += 1
+                continue
+            try:
+                data = member.read()
+            except MemberTooLargeError as e:
+                walker.skip(member.path, str(e))
+                continue
+            if executor is None:
+                results[index] = scanner.scan_member(member.path, data, member.kind)
+                continue
+            pending[executor.submit(_scan_in_worker, member.path, data, member.kind)] = index
+            if len(pending) >= workers * QUEUE_DEPTH_PER_WORKER:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                collect(done)
+    except ArchiveLimitError as e:
+        logger.warning(f"Rejected archive {archive_path}: {e}")
+        status, error = 'rejected', str(e)
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError, lzma.LZMAError, ValueError) as e:
+        logger.warning(f"Unreadable archive {archive_path}: {e}")
+        status, error = 'error', str(e)
+    finally:
+        members.close()
+        if executor is not None:
+            if status != 'completed':
+                for future in pending:
+                    future.cancel()
+            collect([future for future in list(pending) if not future.cancelled()])
+            executor.shutdown()
+    return {
+        'archive': archive_path,
+        'status': status,
+        'error': error,
+        'members': [results[index] for index in sorted(results)],
+        'members_scanned': len(results),
+        'members_filtered': filtered,
+        'skipped_members': walker.skipped,
+    }
@@ -1,3 +1,4 @@
+import io
 import os
 import tempfile
 import re
@@ -22,6 +23,7 @@ from utils.gdpr_rules import get_region_rules, evaluate_risk_level
 from utils.netherlands_gdpr import detect_nl_violations
 from utils.comprehensive_gdpr_validator import validate_comprehensive_gdpr_compliance
 from utils.eu_ai_act_compliance import detect_ai_act_violations, generate_ai_act_compliance_report
+from services.archive_vfs import ArchiveLimits, is_archive_path, scan_archive
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -151,6 +153,10 @@ class BlobScanner:
                 'pii_found': []
             }
         
+        # Archives are walked in place; their members are scanned as streams
+        if is_archive_path(file_path):
+            return self.scan_archive(file_path)
+        
         # Get filename for checks
         file_name = os.path.basename(file_path)
         
@@ -188,7 +194,30 @@ class BlobScanner:
         try:
             # Extract text based on file type
             text = self._extract_text(file_path, file_type)
+        except Exception as e:
+            return {
+                'file_name': os.path.basename(file_path),
+                'status': 'error',
+                'error': str(e),
+                'pii_found': []
+            }
+        
+        return self._scan_extracted_text(file_path, file_type, text, os.path.getsize(file_path))
+    
+    def _scan_extracted_text(self, file_path: str, file_type: str, text: str, file_size: int) -> Dict[str, Any]:
+        """
+        Scan the text extracted from a document for PII and compliance issues.
+        
+        Args:
+            file_path: Path of the document (or archive member provenance path)
+            file_type: Type of the document (PDF, DOCX, etc.)
+            text: Extracted text content
+            file_size: Size of the document in bytes
             
+        Returns:
+            Dictionary containing scan results
+        """
+        try:
             if not text:
                 return {
                     'file_name': os.path.basename(file_path),
@@ -262,7 +291,7 @@ class BlobScanner:
                 'file_path': file_path,
                 'status': 'scanned',
                 'file_type': file_type,
-                'file_size': os.path.getsize(file_path),
+                'file_size': file_size,
                 'pii_found': pii_items,
                 'findings': pii_items,  # Add findings field for compatibility
                 'pii_count': len(pii_items),
@@ -272,7 +301,6 @@ class BlobScanner:
                 'compliance_notes': compliance_notes,
                 'scan_timestamp': datetime.now().isoformat(),
                 'region': self.region,
-                'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0,
                 'text_length': len(text) if text else 0,
                 # Enhanced compliance reporting
                 'gdpr_compliance': {
@@ -307,6 +335,92 @@ class BlobScanner:
                 'pii_found': []
             }
     
+    def scan_archive(self, archive_path: str, max_workers: Optional[int] = None,
+                     limits: Optional[ArchiveLimits] = None) -> Dict[str, Any]:
+        """
+        Scan the documents inside an archive (and nested archives) without extracting it.
+        
+        Args:
+            archive_path: Path to the zip/tar/gz/bz2/xz/7z archive
+            max_workers: Worker processes for member scanning (default DG_ARCHIVE_WORKERS)
+            limits: Zip-bomb and nesting limits
+            
+        Returns:
+            Dictionary containing scan results for the archive; each finding
+            carries the 'archive_member' it was found in, and 'members' holds
+            the per-member results
+        """
+        outcome = scan_archive(archive_path, self, limits=limits, max_workers=max_workers,
+                               accept=lambda path: self._member_file_type(path) is not None)
+        members = outcome['members']
+        pii_items = [
+            dict(finding, archive_member=member.get('file_path'))
+            for member in members for finding in member.get('pii_found', [])
+        ]
+        risk_assessment = self._calculate_risk_score(pii_items)
+        
+        return {
+            'file_name': os.path.basename(archive_path),
+            'file_path': archive_path,
+            'status': 'scanned' if outcome['status'] == 'completed' else 'error',
+            'error': outcome['error'],
+            'file_type': 'ARCHIVE',
+            'file_size': os.path.getsize(archive_path),
+            'pii_found': pii_items,
+            'findings': pii_items,
+            'pii_count': len(pii_items),
+            'risk_assessment': risk_assessment,
+            'risk_level': risk_assessment.get('level', 'Low'),
+            'gdpr_categories': self._get_gdpr_categories(pii_items),
+            'members': members,
+            'members_scanned': outcome['members_scanned'],
+            'skipped_members': outcome['skipped_members'],
+            'archive_status': outcome['status'],
+            'scan_timestamp': datetime.now().isoformat(),
+            'region': self.region
+        }
+    
+    def scan_member(self, member_path: str, data: bytes, kind: str = 'file') -> Dict[str, Any]:
+        """
+        Scan one archive member's content (called by the archive walker).
+        
+        Args:
+            member_path: Provenance path ('export.zip!/hr/contract.pdf')
+            data: Member content; for Office packages, their text
+            kind: 'office' when data is the text of an Office package
+            
+        Returns:
+            Dictionary containing scan results for the member
+        """
+        file_type = self._member_file_type(member_path) or 'TXT'
+        try:
+            if kind == 'office':
+                text = data.decode('utf-8', errors='ignore')
+            elif file_type == 'PDF':
+                text = self._extract_pdf_text(io.BytesIO(data))
+            else:
+                text = data.decode('utf-8', errors='ignore')
+        except Exception as e:
+            return {
+                'file_name': os.path.basename(member_path),
+                'file_path': member_path,
+                'status': 'error',
+                'error': str(e),
+                'pii_found': []
+            }
+        return self._scan_extracted_text(member_path, file_type, text, len(data))
+    
+    def _member_file_type(self, member_path: str) -> Optional[str]:
+        """File type of an archive member, or None if it is not scanned."""
+        file_name = os.path.basename(member_path)
+        is_high_risk = any(file_name.endswith(ext) for ext in self.high_risk_files) or any(pattern in file_name.lower() for pattern in ['secret', 'password', 'credential', 'token', 'key', 'auth'])
+        file_type = self.extension_map.get(os.path.splitext(file_name)[1].lower())
+        if file_type is None:
+            return 'TXT' if is_high_risk else None
+        if file_type not in self.file_types and not is_high_risk:
+            return None
+        return file_type
+    
     def _extract_text(self, file_path: str, file_type: str) -> str:
         """
         Extract text content from a document file.
@@ -404,12 +518,12 @@ class BlobScanner:
             print(f"Error extracting text from {file_path}: {str(e)}")
             return f"[ERROR: Could not extract text from {file_name} - {str(e)}]"
     
-    def _extract_pdf_text(self, pdf_path: str) -> str:
+    def _extract_pdf_text(self, pdf_path) -> str:
         """
         Extract text from a PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or a binary stream (archive member)
             
         Returns:
             Extracted text content
@@ -417,15 +531,14 @@ class BlobScanner:
         text = ""
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n"
+            if isinstance(pdf_path, str):
+                with open(pdf_path, 'rb') as file:
+                    text = self._read_pdf_pages(file)
+            else:
+                text = self._read_pdf_pages(pdf_path)
                     
             # If no text was extracted (e.g., scanned PDF), try OCR if available
-            if not text.strip():
+            if not text.strip() and isinstance(pdf_path, str):
                 try:
                     # Attempt to use textract as a fallback for OCR
                     return textract.process(pdf_path).decode('utf-8', errors='ignore')
@@ -437,6 +550,16 @@ class BlobScanner:
             print(f"Error extracting text from PDF: {str(e)}")
             return ""
     
+    @staticmethod
+    def _read_pdf_pages(file) -> str:
+        """Text of every page of an open PDF."""
+        pdf_reader = PyPDF2.PdfReader(file)
+        text = ""
+        for page_num in range(len(pdf_reader.pages)):
+            page = pdf_reader.pages[page_num]
+            text += page.extract_text() + "\n"
+        return text
+    
     def _scan_text(self, text: str, file_path: str) -> List[Dict[str, Any]]:
         """
         Enhanced text scanning for PII and compliance violations.
@@ -179,8 +179,8 @@ class CertificateGenerator:
         # If scan_id_or_results is a string (scan ID), get the actual results
         if isinstance(scan_id_or_results, str):
             try:
-                from services.results_aggregator import ResultsAggregator
-                results_aggregator = ResultsAggregator()
+                from services.results_aggregator import get_results_aggregator
+                results_aggregator = get_results_aggregator()
                 scan_results = results_aggregator.get_scan_by_id(scan_id_or_results)
                 if not scan_results:
                     return False
@@ -459,8 +459,8 @@ class CertificateGenerator:
         """
         try:
             # Load scan results from database
-            from services.results_aggregator import ResultsAggregator
-            aggregator = ResultsAggregator()
+            from services.results_aggregator import get_results_aggregator
+            aggregator = get_results_aggregator()
             scan_results = aggregator.get_scan_by_id(scan_id)
             
             if not scan_results:
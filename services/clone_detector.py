@@ -0,0 +1,256 @@
+"""
+Clone Detector - Rolling-Hash Duplicate Code Detection
+
+Finds duplicated code blocks within and across files in near-linear time.
+Each source line is normalised into a token stream (whitespace-insensitive,
+blank and comment lines dropped) and hashed; a Rabin-Karp rolling hash over
+every window of `block_size` normalised lines produces block fingerprints,
+optionally thinned by winnowing. All fingerprints go into one index shared
+by every file added, so a block copied between modules is found the same
+way as a block repeated inside one file. Adjacent matching windows are
+merged into a single clone region. Files shorter than MIN_FILE_LINES are
+counted but not indexed.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+
+# Mersenne prime modulus and base for the polynomial rolling hash
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+
+# Files with fewer lines are too small to be worth reporting clones in
+MIN_FILE_LINES = 20
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_COMMENT_PREFIXES = ('#', '//', '/*', '*', '--')
+
+
+def normalize_line(line: str) -> str:
+    """Normalise a source line to a single-spaced token stream ('' if trivial)."""
+    stripped = line.strip()
+    if not stripped or stripped.startswith(_COMMENT_PREFIXES):
+        return ""
+    return " ".join(_TOKEN_PATTERN.findall(stripped))
+
+
+def _line_hash(normalized: str) -> int:
+    """Stable 61-bit hash of a normalised line (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % _HASH_MOD
+
+
+@dataclass
+class CloneMatch:
+    """A duplicated region and the earlier region it duplicates."""
+    source_file: str
+    source_start: int
+    source_end: int
+    clone_file: str
+    clone_start: int
+    clone_end: int
+    line_count: int
+
+    @property
+    def cross_file(self) -> bool:
+        return self.source_file != self.clone_file
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result['cross_file'] = self.cross_file
+        return result
+
+
+class CloneIndex:
+    """
+    Fingerprint index shared across all files of a scan.
+
+    Args:
+        block_size: Minimum clone length in normalised lines
+        winnow_window: Winnowing window in fingerprints. 1 keeps every
+            fingerprint (exact for clones of block_size lines); larger
+            values shrink the index and still guarantee detection of
+            clones of at least block_size + winnow_window - 1 lines.
+        min_file_lines: Files with fewer lines are counted but not indexed
+    """
+
+    def __init__(self, block_size: int = 5, winnow_window: int = 1, min_file_lines: int = MIN_FILE_LINES):
+        if block_size < 1 or winnow_window < 1:
+            raise ValueError("block_size and winnow_window must be positive")
+        self.block_size = block_size
+        self.winnow_window = winnow_window
+        self.min_file_lines = min_file_lines
+        self._files: List[str] = []
+        self._line_numbers: List[List[int]] = []
+        self._normalized: List[List[str]] = []
+        self._source_lines: List[List[str]] = []
+        self._fingerprints: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        self.total_lines = 0
+        self._high_power = pow(_HASH_BASE, block_size - 1, _HASH_MOD)
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def add_file(self, file_path: str, content: str) -> None:
+        """Normalise, fingerprint and index one file."""
+        file_id = len(self._files)
+        line_numbers: List[int] = []
+        normalized: List[str] = []
+        source_lines: List[str] = []
+        raw_lines = content.split('\n')
+        self.total_lines += len(raw_lines)
+        if len(raw_lines) < self.min_file_lines:
+            return
+        for line_no, line in enumerate(raw_lines, 1):
+            norm = normalize_line(line)
+            if norm:
+                line_numbers.append(line_no)
+                normalized.append(norm)
+                source_lines.append(line.rstrip())
+
+        self._files.append(file_path)
+        self._line_numbers.append(line_numbers)
+        self._normalized.append(normalized)
+        self._source_lines.append(source_lines)
+
+        for position, fingerprint in self._select_fingerprints(self._rolling_hashes(normalized)):
+            self._fingerprints[fingerprint].append((file_id, position))
+
+    def _rolling_hashes(self, normalized: List[str]) -> List[int]:
+        """Rabin-Karp hashes of every window of block_size normalised lines."""
+        k = self.block_size
+        if len(normalized) < k:
+            return []
+        line_hashes = [_line_hash(line) for line in normalized]
+        window_hash = 0
+        for h in line_hashes[:k]:
+            window_hash = (window_hash * _HASH_BASE + h) % _HASH_MOD
+        hashes = [window_hash]
+        for i in range(k, len(line_hashes)):
+            window_hash = (window_hash - line_hashes[i - k] * self._high_power) % _HASH_MOD
+            window_hash = (window_hash * _HASH_BASE + line_hashes[i]) % _HASH_MOD
+            hashes.append(window_hash)
+        return hashes
+
+    def _select_fingerprints(self, hashes: List[int]) -> List[Tuple[int, int]]:
+        """Winnowing: keep the rightmost minimum hash of each window."""
+        w = self.winnow_window
+        if w == 1:
+            return list(enumerate(hashes))
+        selected: List[Tuple[int, int]] = []
+        last_position = -1
+        for start in range(max(1, len(hashes) - w + 1)):
+            position = start
+            for candidate in range(start, min(start + w, len(hashes))):
+                if hashes[candidate] <= hashes[position]:
+                    position = candidate
+            if position < len(hashes) and position != last_position:
+                selected.append((position, hashes[position]))
+                last_position = position
+        return selected
+
+    def _same_block(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        """Guard against hash collisions by comparing the normalised lines."""
+        k = self.block_size
+        (fa, pa), (fb, pb) = a, b
+        return self._normalized[fa][pa:pa + k] == self._normalized[fb][pb:pb + k]
+
+    def find_clones(self) -> List[CloneMatch]:
+        """
+        Return merged clone regions. Every later occurrence of a block is
+        reported against its first occurrence (in file insertion order), so
+        N copies of a block yield N-1 matches rather than N^2 pairs. Blocks
+        sharing a fingerprint are told apart by their normalised lines, so
+        a hash collision neither hides a clone nor reports a false one.
+        """
+        k = self.block_size
+        # (clone file, clone position, source file, source position) per duplicated window
+        windows: List[Tuple[int, int, int, int]] = []
+        for occurrences in self._fingerprints.values():
+            if len(occurrences) < 2:
+                continue
+            origins: List[Tuple[int, int]] = []
+            for occurrence in occurrences:
+                origin = next((o for o in origins if self._same_block(o, occurrence)), None)
+                if origin is None:
+                    origins.append(occurrence)
+                # Overlapping windows of one repeated run are not clones
+                elif occurrence[0] != origin[0] or occurrence[1] - origin[1] >= k:
+                    windows.append((occurrence[0], occurrence[1], origin[0], origin[1]))
+
+        # Windows closer than this still cover a contiguous verified region
+        max_gap = min(self.winnow_window, k)
+        windows.sort()
+        clones: List[CloneMatch] = []
+        run: Optional[List[int]] = None
+        for dup_file, dup_pos, src_file, src_pos in windows:
+            if run is not None and run[2] == dup_file and dup_pos - run[4] <= max_gap:
+                # The region continues if the source carries on alongside it,
+                # even where this window was first seen somewhere else
+                source = (run[0], run[1] + dup_pos - run[3])
+                if source[1] + k <= len(self._normalized[source[0]]) and \
+                        self._same_block(source, (dup_file, dup_pos)):
+                    run[4] = dup_pos
+                    continue
+            if run is not None:
+                clones.append(self._to_match(run))
+            run = [src_file, src_pos, dup_file, dup_pos, dup_pos]
+        if run is not None:
+            clones.append(self._to_match(run))
+        return clones
+
+    def _to_match(self, run: List[int]) -> CloneMatch:
+        src_file, src_pos, dup_file, dup_pos, last_dup_pos = run
+        span = last_dup_pos - dup_pos + self.block_size
+        src_lines = self._line_numbers[src_file]
+        dup_lines = self._line_numbers[dup_file]
+        return CloneMatch(
+            source_file=self._files[src_file],
+            source_start=src_lines[src_pos],
+            source_end=src_lines[src_pos + span - 1],
+            clone_file=self._files[dup_file],
+            clone_start=dup_lines[dup_pos],
+            clone_end=dup_lines[dup_pos + span - 1],
+            line_count=span,
+        )
+
+    def block_content(self, match: CloneMatch, max_lines: int = 5) -> str:
+        """Source text of the first lines of a clone, for reports."""
+        file_id = self._files.index(match.clone_file)
+        start = self._line_numbers[file_id].index(match.clone_start)
+        return "\n".join(self._source_lines[file_id][start:start + min(max_lines, match.line_count)])
+
+    def duplication_summary(self, clones: Optional[List[CloneMatch]] = None) -> Dict[str, Any]:
+        """Aggregate duplication metrics for scoring and reports."""
+        if clones is None:
+            clones = self.find_clones()
+        duplicated_lines = 0
+        covered: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for clone in clones:
+            covered[clone.clone_file].append((clone.clone_start, clone.clone_end))
+        for intervals in covered.values():
+            intervals.sort()
+            current_start, current_end = intervals[0]
+            for start, end in intervals[1:]:
+                if start > current_end:
+                    duplicated_lines += current_end - current_start + 1
+                    current_start, current_end = start, end
+                else:
+                    current_end = max(current_end, end)
+            duplicated_lines += current_end - current_start + 1
+
+        code_lines = sum(len(lines) for lines in self._line_numbers)
+        return {
+            'files_indexed': self.file_count,
+            'total_lines': self.total_lines,
+            'code_lines': code_lines,
+            'clone_count': len(clones),
+            'cross_file_clone_count': sum(1 for c in clones if c.cross_file),
+            'duplicated_lines': duplicated_lines,
+            'duplication_percentage': round(duplicated_lines / code_lines * 100, 2) if code_lines else 0.0,
+            'files_with_clones': len(covered),
+        }
@@ -0,0 +1,220 @@
+"""
+Cloud Inventory Helpers
+
+Building blocks for collecting cloud resource inventories quickly and
+completely:
+
+- bounded_map: fan work out over a bounded thread pool, keeping input order
+- ArmClient: Azure Resource Manager client that follows nextLink pagination,
+  retries throttled requests, revalidates unchanged list pages with
+  ETag/If-None-Match and queries Azure Resource Graph for all subscriptions
+  at once
+- EtagCache: process-wide cache of list pages, so repeated scans of an
+  unchanged estate transfer (almost) nothing
+
+The ARM endpoint can be pointed at a local mock with DG_AZURE_ARM_ENDPOINT.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("cloud_inventory")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+ARM_ENDPOINT = os.environ.get("DG_AZURE_ARM_ENDPOINT", "https://management.azure.com").rstrip('/')
+
+# Concurrent requests per inventory (subscriptions x resource types, regions, VMs)
+INVENTORY_WORKERS = int(os.environ.get("DG_CLOUD_INVENTORY_WORKERS", "16"))
+
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 4
+MAX_RETRY_AFTER = 30.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+RESOURCE_GRAPH_API_VERSION = "2021-03-01"
+# Service limits: rows per page and subscriptions per query
+RESOURCE_GRAPH_PAGE_SIZE = 1000
+RESOURCE_GRAPH_MAX_SUBSCRIPTIONS = 1000
+
+ETAG_CACHE_ENTRIES = 4096
+
+
+def bounded_map(func: Callable[[Any], Any], items: Iterable[Any],
+                max_workers: int = INVENTORY_WORKERS) -> List[Any]:
+    """
+    Apply func to every item with at most max_workers running at once.
+
+    Returns:
+        Results in the order of items (exceptions propagate)
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class EtagCache:
+    """Bounded LRU of url -> (etag, payload), shared between scans."""
+
+    def __init__(self, max_entries: int = ETAG_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, etag: str, payload: Any) -> None:
+        with self._lock:
+            self._entries[key] = (etag, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_etag_cache = EtagCache()
+
+
+class ArmClient:
+    """Azure Resource Manager REST client for inventory collection"""
+
+    def __init__(self, token: str, endpoint: str = ARM_ENDPOINT,
+                 max_workers: int = INVENTORY_WORKERS, cache: Optional[EtagCache] = None):
+        self.endpoint = endpoint.rstrip('/')
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else _etag_cache
+        self._headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json'
+        }
+        self._local = threading.local()
+        self.stats = {'requests': 0, 'not_modified': 0, 'retries': 0}
+        self._stats_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Thread-local session so each worker keeps its connection alive"""
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(self._headers)
+        return self._local.session
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def url(self, path: str) -> str:
+        return path if path.startswith('http') else f"{self.endpoint}{path}"
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying throttling and transient server errors"""
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        for attempt in range(MAX_RETRIES + 1):
+            self._count('requests')
+            response = self._get_session().request(method, self.url(url), **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            self._count('retries')
+            try:
+                delay = float(response.headers.get('Retry-After', ''))
+            except ValueError:
+                delay = 0.5 * (2 ** attempt)
+            time.sleep(min(delay, MAX_RETRY_AFTER))
+        return response
+
+    def get_json(self, url: str, params: Optional[Dict[str, str]] = None,
+                 use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        GET a JSON document, revalidating a cached copy with If-None-Match.
+
+        Returns:
+            Parsed JSON, or None if the request failed
+        """
+        full_url = requests.Request('GET', self.url(url), params=params).prepare().url
+        cached = self.cache.get(full_url) if use_cache else None
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self.request('GET', full_url, headers=headers)
+        if response.status_code == 304 and cached:
+            self._count('not_modified')
+            return cached[1]
+        if response.status_code != 200:
+            logger.warning(f"ARM request failed ({response.status_code}): {full_url}")
+            return None
+        payload = response.json()
+        etag = response.headers.get('ETag')
+        if use_cache and etag:
+            self.cache.put(full_url, etag, payload)
+        return payload
+
+    def list_all(self, url: str, params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """All items of an ARM list operation, following nextLink"""
+        items: List[Dict[str, Any]] = []
+        while url:
+            payload = self.get_json(url, params)
+            if payload is None:
+                break
+            items.extend(payload.get('value', []))
+            url = payload.get('nextLink') or payload.get('@odata.nextLink')
+            params = None  # nextLink already carries the query string
+        return items
+
+    def list_subscriptions(self) -> List[str]:
+        return [sub['subscriptionId'] for sub in
+                self.list_all('/subscriptions', {'api-version': '2020-01-01'}) if sub.get('subscriptionId')]
+
+    def resource_graph(self, subscriptions: List[str], resource_types: Iterable[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Resources of the given types across subscriptions through Azure Resource Graph.
+
+        Returns:
+            Resources in ARM shape, or None if Resource Graph is not available
+            (the caller then lists per subscription)
+        """
+        type_list = ', '.join(f"'{resource_type.lower()}'" for resource_type in resource_types)
+        query = (f"Resources | where type in~ ({type_list}) "
+                 "| project id, name, type, location, tags, sku, kind, properties, subscriptionId "
+                 "| order by id asc")
+        chunks = [subscriptions[i:i + RESOURCE_GRAPH_MAX_SUBSCRIPTIONS]
+                  for i in range(0, len(subscriptions), RESOURCE_GRAPH_MAX_SUBSCRIPTIONS)]
+        pages = bounded_map(lambda chunk: self._resource_graph_pages(chunk, query), chunks, self.max_workers)
+        if any(page is None for page in pages):
+            return None
+        return [row for page in pages for row in page]
+
+    def _resource_graph_pages(self, subscriptions: List[str], query: str) -> Optional[List[Dict[str, Any]]]:
+        url = f"/providers/Microsoft.ResourceGraph/resources?api-version={RESOURCE_GRAPH_API_VERSION}"
+        rows: List[Dict[str, Any]] = []
+        skip_token = None
+        while True:
+            options: Dict[str, Any] = {'$top': RESOURCE_GRAPH_PAGE_SIZE, 'resultFormat': 'objectArray'}
+            if skip_token:
+                options['$skipToken'] = skip_token
+            response = self.request('POST', url, json={'subscriptions': subscriptions, 'query': query,
+                                                       'options': options})
+            if response.status_code != 200:
+                logger.info(f"Resource Graph unavailable ({response.status_code}); listing per subscription")
+                return None
+            payload = response.json()
+            data = payload.get('data', [])
+            rows.extend(data if isinstance(data, list) else data.get('rows', []))
+            skip_token = payload.get('$skipToken')
+            if not skip_token:
+                return rows
@@ -24,6 +24,8 @@ import pandas as pd
 import requests
 import importlib.util
 
+from services.cloud_inventory import ArmClient, bounded_map
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
@@ -71,6 +73,23 @@ WATTS_PER_VCPU = {
     'default': 14.0
 }
 
+# Azure resource types collected for the inventory and their list API versions
+AZURE_RESOURCE_TYPES = {
+    'virtual_machines': 'Microsoft.Compute/virtualMachines',
+    'disks': 'Microsoft.Compute/disks',
+    'snapshots': 'Microsoft.Compute/snapshots',
+    'storage_accounts': 'Microsoft.Storage/storageAccounts',
+}
+AZURE_API_VERSIONS = {
+    'Microsoft.Compute/virtualMachines': '2023-03-01',
+    'Microsoft.Compute/disks': '2023-01-02',
+    'Microsoft.Compute/snapshots': '2023-01-02',
+    'Microsoft.Storage/storageAccounts': '2023-01-01',
+}
+
+# Custom EC2 endpoint (e.g. a local mock) for AWS inventory collection
+AWS_ENDPOINT_URL = os.environ.get("DG_AWS_ENDPOINT_URL") or None
+
 # Default thresholds for resource optimization
 DEFAULT_THRESHOLDS = {
     'idle_cpu_percent': 5.0,  # CPU usage below this % is considered idle
@@ -125,6 +144,8 @@ class CloudResourcesScanner:
         self.auth_time = None
         self.resources_by_type = {}
         self.carbon_data = {}
+        self._arm_client = None
+        self._arm_client_token = None
         
         # Validate cloud provider
         valid_providers = ['azure', 'aws', 'gcp', 'none']
@@ -350,6 +371,10 @@ class CloudResourcesScanner:
         """
         Collect resources from Azure.
         
+        One Resource Graph query covers all subscriptions and resource types;
+        if Resource Graph is not available, every (subscription, resource type)
+        list operation runs concurrently. All pages are followed.
+        
         Returns:
             Dictionary of Azure resources by resource type
         """
@@ -363,120 +388,127 @@ class CloudResourcesScanner:
             'app_services': []
         }
         
-        # Get auth token
-        token = self._get_auth_token()
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        client = self._get_arm_client()
         
         # Get list of Azure subscriptions if subscription_id not provided
-        subscriptions = [self.subscription_id] if self.subscription_id else []
+        subscriptions = [self.subscription_id] if self.subscription_id else client.list_subscriptions()
         if not subscriptions:
-            subs_url = "https://management.azure.com/subscriptions?api-version=2020-01-01"
-            response = requests.get(subs_url, headers=headers)
-            if response.status_code == 200:
-                subs_data = response.json()
-                subscriptions = [sub['subscriptionId'] for sub in subs_data.get('value', [])]
-        
-        # Collect resources for each subscription
-        for subscription_id in subscriptions:
-            # Get virtual machines
-            vms_url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.Compute/virtualMachines?api-version=2023-03-01"
-            response = requests.get(vms_url, headers=headers)
-            if response.status_code == 200:
-                vms_data = response.json()
-                
-                for vm in vms_data.get('value', []):
-                    vm_info = {
-                        'id': vm.get('id'),
-                        'name': vm.get('name'),
-                        'region': vm.get('location'),
-                        'type': 'Microsoft.Compute/virtualMachines',
-                        'size': vm.get('properties', {}).get('hardwareProfile', {}).get('vmSize'),
-                        'status': vm.get('properties', {}).get('provisioningState'),
-                        'os_type': vm.get('properties', {}).get('storageProfile', {}).get('osDisk', {}).get('osType'),
-                        'creation_time': vm.get('properties', {}).get('timeCreated'),
-                        'tags': vm.get('tags', {})
-                    }
-                    resources['virtual_machines'].append(vm_info)
-            
-            # Get managed disks
-            disks_url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.Compute/disks?api-version=2023-01-02"
-            response = requests.get(disks_url, headers=headers)
-            if response.status_code == 200:
-                disks_data = response.json()
-                
-                for disk in disks_data.get('value', []):
-                    # Check if disk is attached to a VM
-                    is_attached = bool(disk.get('properties', {}).get('managedBy'))
-                    
-                    disk_info = {
-                        'id': disk.get('id'),
-                        'name': disk.get('name'),
-                        'region': disk.get('location'),
-                        'type': 'Microsoft.Compute/disks',
-                        'size_gb': disk.get('properties', {}).get('diskSizeGB'),
-                        'sku': disk.get('sku', {}).get('name'),
-                        'status': disk.get('properties', {}).get('provisioningState'),
-                        'is_attached': is_attached,
-                        'managed_by': disk.get('properties', {}).get('managedBy'),
-                        'creation_time': disk.get('properties', {}).get('timeCreated'),
-                        'tags': disk.get('tags', {})
-                    }
-                    resources['disks'].append(disk_info)
-            
-            # Get snapshots
-            snapshots_url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.Compute/snapshots?api-version=2023-01-02"
-            response = requests.get(snapshots_url, headers=headers)
-            if response.status_code == 200:
-                snapshots_data = response.json()
-                
-                for snapshot in snapshots_data.get('value', []):
-                    creation_time_str = snapshot.get('properties', {}).get('timeCreated')
-                    creation_time = datetime.fromisoformat(creation_time_str[:-1]) if creation_time_str else None
-                    age_days = (datetime.now() - creation_time).days if creation_time else None
-                    
-                    snapshot_info = {
-                        'id': snapshot.get('id'),
-                        'name': snapshot.get('name'),
-                        'region': snapshot.get('location'),
-                        'type': 'Microsoft.Compute/snapshots',
-                        'size_gb': snapshot.get('properties', {}).get('diskSizeGB'),
-                        'source_disk': snapshot.get('properties', {}).get('creationData', {}).get('sourceResourceId'),
-                        'creation_time': creation_time_str,
-                        'age_days': age_days,
-                        'tags': snapshot.get('tags', {})
-                    }
-                    resources['snapshots'].append(snapshot_info)
-            
-            # Get storage accounts
-            storage_url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.Storage/storageAccounts?api-version=2023-01-01"
-            response = requests.get(storage_url, headers=headers)
-            if response.status_code == 200:
-                storage_data = response.json()
-                
-                for storage in storage_data.get('value', []):
-                    storage_info = {
-                        'id': storage.get('id'),
-                        'name': storage.get('name'),
-                        'region': storage.get('location'),
-                        'type': 'Microsoft.Storage/storageAccounts',
-                        'sku': storage.get('sku', {}).get('name'),
-                        'kind': storage.get('kind'),
-                        'creation_time': storage.get('properties', {}).get('creationTime'),
-                        'tags': storage.get('tags', {})
-                    }
-                    resources['storage_accounts'].append(storage_info)
-            
-            # Additional resource types can be added as needed
+            return resources
+        
+        raw_resources = client.resource_graph(subscriptions, AZURE_RESOURCE_TYPES.values())
+        if raw_resources is None:
+            pairs = [(subscription_id, resource_type)
+                     for subscription_id in subscriptions
+                     for resource_type in AZURE_RESOURCE_TYPES.values()]
+            pages = bounded_map(
+                lambda pair: client.list_all(
+                    f"/subscriptions/{pair[0]}/providers/{pair[1]}",
+                    {'api-version': AZURE_API_VERSIONS[pair[1]]}
+                ),
+                pairs, client.max_workers
+            )
+            raw_resources = [item for page in pages for item in page]
+        
+        builders = {
+            AZURE_RESOURCE_TYPES['virtual_machines'].lower(): ('virtual_machines', self._azure_vm_info),
+            AZURE_RESOURCE_TYPES['disks'].lower(): ('disks', self._azure_disk_info),
+            AZURE_RESOURCE_TYPES['snapshots'].lower(): ('snapshots', self._azure_snapshot_info),
+            AZURE_RESOURCE_TYPES['storage_accounts'].lower(): ('storage_accounts', self._azure_storage_info),
+        }
+        for item in raw_resources:
+            builder = builders.get(str(item.get('type', '')).lower())
+            if builder:
+                resource_type, build = builder
+                resources[resource_type].append(build(item))
         
+        # Additional resource types can be added as needed
+        
+        logger.info(f"Azure inventory: {sum(len(r) for r in resources.values())} resources in "
+                    f"{len(subscriptions)} subscriptions ({client.stats['requests']} requests, "
+                    f"{client.stats['not_modified']} unchanged pages)")
         return resources
     
+    def _get_arm_client(self) -> ArmClient:
+        """ARM client reused for the inventory and the VM metrics of one scan"""
+        token = self._get_auth_token()
+        if self._arm_client is None or self._arm_client_token != token:
+            self._arm_client = ArmClient(token)
+            self._arm_client_token = token
+        return self._arm_client
+    
+    def _azure_vm_info(self, vm: Dict[str, Any]) -> Dict[str, Any]:
+        properties = vm.get('properties') or {}
+        return {
+            'id': vm.get('id'),
+            'name': vm.get('name'),
+            'region': vm.get('location'),
+            'type': 'Microsoft.Compute/virtualMachines',
+            'size': properties.get('hardwareProfile', {}).get('vmSize'),
+            'status': properties.get('provisioningState'),
+            'os_type': properties.get('storageProfile', {}).get('osDisk', {}).get('osType'),
+            'creation_time': properties.get('timeCreated'),
+            'tags': vm.get('tags') or {}
+        }
+    
+    def _azure_disk_info(self, disk: Dict[str, Any]) -> Dict[str, Any]:
+        properties = disk.get('properties') or {}
+        # Check if disk is attached to a VM
+        is_attached = bool(properties.get('managedBy') or disk.get('managedBy'))
+        return {
+            'id': disk.get('id'),
+            'name': disk.get('name'),
+            'region': disk.get('location'),
+            'type': 'Microsoft.Compute/disks',
+            'size_gb': properties.get('diskSizeGB'),
+            'sku': (disk.get('sku') or {}).get('name'),
+            'status': properties.get('provisioningState'),
+            'is_attached': is_attached,
+            'managed_by': properties.get('managedBy') or disk.get('managedBy'),
+            'creation_time': properties.get('timeCreated'),
+            'tags': disk.get('tags') or {}
+        }
+    
+    def _azure_snapshot_info(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        properties = snapshot.get('properties') or {}
+        creation_time_str = properties.get('timeCreated')
+        creation_time = None
+        if creation_time_str:
+            try:
+                # Azure reports up to 7 fractional digits; seconds precision is enough for the age
+                creation_time = datetime.fromisoformat(creation_time_str[:19])
+            except ValueError:
+                pass
+        age_days = (datetime.now() - creation_time).days if creation_time else None
+        return {
+            'id': snapshot.get('id'),
+            'name': snapshot.get('name'),
+            'region': snapshot.get('location'),
+            'type': 'Microsoft.Compute/snapshots',
+            'size_gb': properties.get('diskSizeGB'),
+            'source_disk': properties.get('creationData', {}).get('sourceResourceId'),
+            'creation_time': creation_time_str,
+            'age_days': age_days,
+            'tags': snapshot.get('tags') or {}
+        }
+    
+    def _azure_storage_info(self, storage: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': storage.get('id'),
+            'name': storage.get('name'),
+            'region': storage.get('location'),
+            'type': 'Microsoft.Storage/storageAccounts',
+            'sku': (storage.get('sku') or {}).get('name'),
+            'kind': storage.get('kind'),
+            'creation_time': (storage.get('properties') or {}).get('creationTime'),
+            'tags': storage.get('tags') or {}
+        }
+    
     def _collect_aws_resources(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Collect resources from AWS.
         
+        Regions are collected concurrently and every describe call is paginated.
+        
         Returns:
             Dictionary of AWS resources by resource type
         """
@@ -496,39 +528,56 @@ class CloudResourcesScanner:
             return resources
         
         import boto3
-        from botocore.exceptions import ClientError
         
         try:
             # Create AWS session
             session = boto3.Session(
                 aws_access_key_id=self.client_id,
                 aws_secret_access_key=self.client_secret,
-                region_name=self.region if self.region != 'netherlands' else 'westeurope'
+                region_name=self.region if self.region != 'netherlands' else 'eu-west-1'
             )
             
             # Get list of regions if scanning in Netherlands/EU
             regions = [self.region]
             if self.region == 'netherlands':
-                ec2 = session.client('ec2')
+                ec2 = session.client('ec2', endpoint_url=AWS_ENDPOINT_URL)
                 regions = [region['RegionName'] for region in ec2.describe_regions()['Regions']]
             
             # Collect resources in each region
-            for region in regions:
-                # Create regional clients
-                regional_session = boto3.Session(
-                    aws_access_key_id=self.client_id,
-                    aws_secret_access_key=self.client_secret,
-                    region_name=region
-                )
-                
-                ec2 = regional_session.client('ec2')
-                s3 = regional_session.client('s3')
-                rds = regional_session.client('rds')
-                lambda_client = regional_session.client('lambda')
-                
-                # Get EC2 instances
-                response = ec2.describe_instances()
-                for reservation in response.get('Reservations', []):
+            for regional in bounded_map(self._collect_aws_region, regions):
+                for resource_type, items in regional.items():
+                    resources[resource_type].extend(items)
+        
+        except Exception as e:
+            logger.error(f"Error collecting AWS resources: {str(e)}")
+        
+        return resources
+    
+    def _collect_aws_region(self, region: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect the resources of one AWS region (runs in a worker thread).
+        
+        Args:
+            region: AWS region name
+            
+        Returns:
+            Dictionary of the region's resources by resource type
+        """
+        import boto3
+        
+        resources = {'ec2_instances': [], 'ebs_volumes': [], 'snapshots': []}
+        try:
+            # Sessions are not thread-safe; each region gets its own
+            regional_session = boto3.Session(
+                aws_access_key_id=self.client_id,
+                aws_secret_access_key=self.client_secret,
+                region_name=region
+            )
+            ec2 = regional_session.client('ec2', endpoint_url=AWS_ENDPOINT_URL)
+            
+            # Get EC2 instances
+            for page in ec2.get_paginator('describe_instances').paginate():
+                for reservation in page.get('Reservations', []):
                     for instance in reservation.get('Instances', []):
                         # Collect instance data
                         instance_info = {
@@ -543,10 +592,10 @@ class CloudResourcesScanner:
                             'tags': {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
                         }
                         resources['ec2_instances'].append(instance_info)
-                
-                # Get EBS volumes
-                response = ec2.describe_volumes()
-                for volume in response.get('Volumes', []):
+            
+            # Get EBS volumes
+            for page in ec2.get_paginator('describe_volumes').paginate():
+                for volume in page.get('Volumes', []):
                     # Check if volume is attached
                     attachments = volume.get('Attachments', [])
                     is_attached = any(attach.get('State') == 'attached' for attach in attachments)
@@ -565,10 +614,10 @@ class CloudResourcesScanner:
                         'tags': {tag['Key']: tag['Value'] for tag in volume.get('Tags', [])}
                     }
                     resources['ebs_volumes'].append(volume_info)
-                
-                # Get snapshots
-                response = ec2.describe_snapshots(OwnerIds=['self'])
-                for snapshot in response.get('Snapshots', []):
+            
+            # Get snapshots
+            for page in ec2.get_paginator('describe_snapshots').paginate(OwnerIds=['self']):
+                for snapshot in page.get('Snapshots', []):
                     creation_time = snapshot.get('StartTime')
                     age_days = (datetime.now(creation_time.tzinfo) - creation_time).days if creation_time else None
                     
@@ -585,11 +634,12 @@ class CloudResourcesScanner:
                         'tags': {tag['Key']: tag['Value'] for tag in snapshot.get('Tags', [])}
                     }
                     resources['snapshots'].append(snapshot_info)
-                
-                # Additional AWS resources can be collected as needed
+            
+            # Additional AWS resources can be collected as needed
         
         except Exception as e:
-            logger.error(f"Error collecting AWS resources: {str(e)}")
+            # One unreachable or disabled region does not abort the inventory
+            logger.error(f"Error collecting AWS resources in {region}: {str(e)}")
         
         return resources
     
@@ -780,14 +830,9 @@ class CloudResourcesScanner:
     
     def _get_azure_vm_metrics(self) -> None:
         """
-        Get Azure Monitor metrics for virtual machines.
+        Get Azure Monitor metrics for virtual machines (requested concurrently).
         """
-        # Get auth token
-        token = self._get_auth_token()
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        client = self._get_arm_client()
         
         # Set time range for metrics (last 30 days)
         end_time = datetime.now()
@@ -796,14 +841,12 @@ class CloudResourcesScanner:
         # Format timestamps for Azure API
         timespan = f"{start_time.isoformat()}Z/{end_time.isoformat()}Z"
         
-        # Get metrics for each VM
-        for vm in self.resources_by_type.get('virtual_machines', []):
+        def fetch_metrics(vm: Dict[str, Any]) -> None:
             vm_id = vm.get('id')
             if not vm_id:
-                continue
+                return
             
             # Get CPU utilization metrics
-            metrics_url = f"https://management.azure.com{vm_id}/providers/Microsoft.Insights/metrics"
             params = {
                 'api-version': '2018-01-01',
                 'timespan': timespan,
@@ -813,10 +856,10 @@ class CloudResourcesScanner:
             }
             
             try:
-                response = requests.get(metrics_url, headers=headers, params=params)
-                if response.status_code == 200:
-                    metrics_data = response.json()
-                    
+                # The timespan moves with every scan, so there is nothing to revalidate
+                metrics_data = client.get_json(f"{vm_id}/providers/Microsoft.Insights/metrics",
+                                               params, use_cache=False)
+                if metrics_data:
                     # Extract average CPU utilization
                     timeseries = metrics_data.get('value', [{}])[0].get('timeseries', [])
                     if timeseries:
@@ -833,6 +876,9 @@ class CloudResourcesScanner:
                         }
             except Exception as e:
                 logger.error(f"Error getting metrics for VM {vm.get('name')}: {str(e)}")
+        
+        # Get metrics for each VM
+        bounded_map(fetch_metrics, self.resources_by_type.get('virtual_machines', []), client.max_workers)
     
     def _calculate_carbon_footprint(self) -> Dict[str, Any]:
         """
@@ -1653,6 +1699,7 @@ class GithubRepoSustainabilityScanner:
         self.branch = branch
         self.progress_callback = None
         self.temp_dir = None
+        self.unused_imports_total = 0
         
     def set_progress_callback(self, callback: Callable[[int, int, str], None]) -> None:
         """
@@ -1700,12 +1747,13 @@ class GithubRepoSustainabilityScanner:
             'code_stats': {},
             'unused_imports': [],
             'large_files': [],
+            'duplication': {},
             'recommendations': [],
             'sustainability_score': 0,
             'status': 'in_progress'
         }
         
-        total_steps = 5
+        total_steps = 6
         current_step = 0
         
         try:
@@ -1767,11 +1815,12 @@ class GithubRepoSustainabilityScanner:
             
             # Step 3: Analyze Python files for unused imports
             current_step += 1
-            self._update_progress(current_step, total_steps, "Analyzing Python imports (sample-based)")
+            self._update_progress(current_step, total_steps, "Analyzing Python imports")
             
-            # Use optimized import analysis with parallelization and sampling
+            # In-process AST analysis of every Python file, cached per content hash
             unused_imports = self._find_unused_imports_optimized()
             scan_result['unused_imports'] = unused_imports
+            scan_result['unused_imports_total'] = self.unused_imports_total
             
             # Step 4: Identify large files
             current_step += 1
@@ -1780,20 +1829,31 @@ class GithubRepoSustainabilityScanner:
             large_files = self._find_large_files()
             scan_result['large_files'] = large_files
             
-            # Step 5: Generate findings and recommendations
+            # Step 5: Detect duplicated code across the repository
+            current_step += 1
+            self._update_progress(current_step, total_steps, "Detecting duplicated code")
+            
+            duplication = self._analyze_code_duplication()
+            scan_result['duplication'] = duplication
+            
+            # Step 6: Generate findings and recommendations
             current_step += 1
             self._update_progress(current_step, total_steps, "Generating recommendations")
             
-            findings, recommendations = self._generate_findings_recommendations(file_stats, unused_imports, large_files)
+            findings, recommendations = self._generate_findings_recommendations(
+                file_stats, unused_imports, large_files, duplication
+            )
             scan_result['findings'] = findings
             scan_result['recommendations'] = recommendations
             
             # Calculate sustainability score
-            scan_result['sustainability_score'] = self._calculate_sustainability_score(file_stats, unused_imports, large_files)
+            scan_result['sustainability_score'] = self._calculate_sustainability_score(
+                file_stats, unused_imports, large_files, duplication
+            )
             
             # Add additional metadata for very large repos
             if file_stats.get('total_files', 0) > 10000:
-                scan_result['note'] = "Analysis was performed using sampling techniques due to repository size."
+                scan_result['note'] = "Repository statistics were estimated by sampling due to repository size."
             
             # Mark scan as completed
             scan_result['status'] = 'completed'
@@ -2081,32 +2141,59 @@ class GithubRepoSustainabilityScanner:
         
         return file_stats
     
-    def _find_unused_imports_optimized(self) -> List[Dict[str, Any]]:
+    def _analyze_code_duplication(self, max_file_size_mb: float = 1.0) -> Dict[str, Any]:
         """
-        Find unused imports in Python files using optimized techniques for large repositories.
-        Uses sampling, parallelization, and early termination for better performance.
+        Detect duplicated code within and across all source files of the repository.
+        
+        Uses one rolling-hash clone index for the whole checkout, so the cost
+        grows roughly linearly with total lines instead of quadratically per file.
         
+        Args:
+            max_file_size_mb: Skip larger files (generated or vendored code)
+            
         Returns:
-            List of dictionaries with unused import information
+            Duplication summary with a small sample of clones
         """
-        import os
-        import subprocess
-        import random
-        import multiprocessing
-        from functools import partial
+        from services.clone_detector import CloneIndex
         
-        unused_imports = []
+        clone_index = CloneIndex()
+        max_bytes = max_file_size_mb * 1024 * 1024
         
-        # Check if pyflakes is available
-        try:
-            subprocess.run(['pyflakes', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # If pyflakes is not available, install it
-            try:
-                subprocess.run(['pip', 'install', 'pyflakes'], check=True)
-            except subprocess.CalledProcessError:
-                logger.warning("Failed to install pyflakes. Unused import detection will be limited.")
-                return unused_imports
+        for root, dirs, files in os.walk(self.temp_dir):
+            dirs[:] = [d for d in dirs if d not in ('.git', 'node_modules', '__pycache__')]
+            for file in files:
+                if not file.endswith(('.py', '.js')):
+                    continue
+                file_path = os.path.join(root, file)
+                try:
+                    if os.path.getsize(file_path) > max_bytes:
+                        continue
+                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                except OSError as e:
+                    logger.warning(f"Error reading {file_path} for duplication analysis: {str(e)}")
+                    continue
+                clone_index.add_file(os.path.relpath(file_path, self.temp_dir), content)
+        
+        clones = clone_index.find_clones()
+        summary = clone_index.duplication_summary(clones)
+        summary['clones_sample'] = [
+            clone.to_dict() for clone in sorted(clones, key=lambda c: c.line_count, reverse=True)[:5]
+        ]
+        return summary
+    
+    def _find_unused_imports_optimized(self) -> List[Dict[str, Any]]:
+        """
+        Find unused imports in all Python files of the repository.
+        
+        Uses the in-process AST analyser across a process pool with results
+        cached per file content hash, so every file is covered without
+        sampling and without spawning or installing pyflakes.
+        
+        Returns:
+            List of dictionaries with unused import information
+        """
+        from services.import_analyzer import find_unused_imports
         
         # Find Python files
         python_files = []
@@ -2122,75 +2209,16 @@ class GithubRepoSustainabilityScanner:
                         continue
                     python_files.append(os.path.join(root, file))
         
-        # For very large repos, use sampling
-        total_files = len(python_files)
-        
-        # For extremely large repos like PyTorch, limit to max 500 files
-        if total_files > 500:
-            logger.info(f"Large repository detected ({total_files} Python files). Using sampling for analysis.")
-            # Randomly sample files to keep analysis fast
-            python_files = random.sample(python_files, 500)
-        
-        # Define a function to analyze a single file with pyflakes
-        def analyze_file(file_path):
-            try:
-    # Log scan start
-    if hasattr(logger, 'scan_started'):
-        logger.scan_started('cloud_resources_scanner', 'scan_target')
-
-                result = subprocess.run(['pyflakes', file_path], capture_output=True, text=True, timeout=5)
-                file_results = []
-                
-                if result.stdout:
-                    # Parse pyflakes output
-                    for line in result.stdout.splitlines():
-                        if 'imported but unused' in line:
-                            parts = line.split(':')
-                            if len(parts) >= 3:
-                                file_rel_path = os.path.relpath(file_path, self.temp_dir)
-                                line_num = int(parts[1])
-                                message = ':'.join(parts[2:]).strip()
-                                
-                                # Extract the import name
-                                import_name = message.split("'")[1] if "'" in message else message
-                                
-                                file_results.append({
-                                    'file': file_rel_path,
-                                    'line': line_num,
-                                    'import': import_name,
-                                    'message': message
-                                })
-                return file_results
-            except Exception as e:
-                logger.warning(f"Error analyzing imports in {file_path}: {str(e)}")
-                return []
-        
-        # Use multiprocessing pool to parallelize analysis
-        # Use a reasonable number of processes based on CPU cores
-        num_processes = min(multiprocessing.cpu_count(), 4)  # Cap at 4 to avoid overloading
-        
         try:
-            # Process files in parallel batches
-            with multiprocessing.Pool(processes=num_processes) as pool:
-                results = pool.map(analyze_file, python_files)
-            
-            # Flatten results
-            for file_results in results:
-                unused_imports.extend(file_results)
-            
-            # Limit results to avoid overwhelming the report
-            if len(unused_imports) > 100:
-                unused_imports = unused_imports[:100]
+            unused_imports = find_unused_imports(python_files, base_dir=self.temp_dir)
         except Exception as e:
-            logger.error(f"Error in parallel processing of unused imports: {str(e)}")
-            # Fallback to sequential processing for a sample of files
-            if len(python_files) > 50:
-                python_files = random.sample(python_files, 50)
-            
-            for file_path in python_files:
-                unused_imports.extend(analyze_file(file_path))
-            
-        return unused_imports
+            logger.error(f"Error analyzing unused imports: {str(e)}")
+            return []
+        
+        self.unused_imports_total = len(unused_imports)
+        
+        # Limit results to avoid overwhelming the report
+        return unused_imports[:100]
     
     def _find_unused_imports(self) -> List[Dict[str, Any]]:
         """
@@ -2200,21 +2228,7 @@ class GithubRepoSustainabilityScanner:
         Returns:
             List of dictionaries with unused import information
         """
-        import os
-        import subprocess
-        
-        unused_imports = []
-        
-        # Check if pyflakes is available
-        try:
-            subprocess.run(['pyflakes', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # If pyflakes is not available, install it
-            try:
-                subprocess.run(['pip', 'install', 'pyflakes'], check=True)
-            except subprocess.CalledProcessError:
-                logger.warning("Failed to install pyflakes. Unused import detection will be limited.")
-                return unused_imports
+        from services.import_analyzer import find_unused_imports
         
         # Find Python files
         python_files = []
@@ -2227,34 +2241,7 @@ class GithubRepoSustainabilityScanner:
                 if file.endswith('.py'):
                     python_files.append(os.path.join(root, file))
         
-        # Use pyflakes to find unused imports
-        for file_path in python_files:
-            try:
-                result = subprocess.run(['pyflakes', file_path], capture_output=True, text=True)
-                
-                if result.stdout:
-                    # Parse pyflakes output
-                    for line in result.stdout.splitlines():
-                        if 'imported but unused' in line:
-                            parts = line.split(':')
-                            if len(parts) >= 3:
-                                file_rel_path = os.path.relpath(file_path, self.temp_dir)
-                                line_num = int(parts[1])
-                                message = ':'.join(parts[2:]).strip()
-                                
-                                # Extract the import name
-                                import_name = message.split("'")[1] if "'" in message else message
-                                
-                                unused_imports.append({
-                                    'file': file_rel_path,
-                                    'line': line_num,
-                                    'import': import_name,
-                                    'message': message
-                                })
-            except Exception as e:
-                logger.error(f"Error analyzing imports in {file_path}: {str(e)}")
-        
-        return unused_imports
+        return find_unused_imports(python_files, base_dir=self.temp_dir)
     
     def _find_large_files(self, threshold_mb: float = 1.0) -> List[Dict[str, Any]]:
         """
@@ -2418,7 +2405,8 @@ class GithubRepoSustainabilityScanner:
         return large_files
     
     def _generate_findings_recommendations(self, file_stats: Dict[str, Any], unused_imports: List[Dict[str, Any]], 
-                                          large_files: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+                                          large_files: List[Dict[str, Any]],
+                                          duplication: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Generate findings and recommendations based on repository analysis.
         
@@ -2426,6 +2414,7 @@ class GithubRepoSustainabilityScanner:
             file_stats: Repository file statistics
             unused_imports: List of unused imports
             large_files: List of large files
+            duplication: Optional duplication summary from _analyze_code_duplication
             
         Returns:
             Tuple of findings and recommendations lists
@@ -2471,11 +2460,11 @@ class GithubRepoSustainabilityScanner:
                 'id': f"CODE-IMPORTS-{int(time.time())}",
                 'type': 'Unused Imports',
                 'category': 'Code Efficiency',
-                'description': f"Found {len(unused_imports)} unused imports in Python files",
+                'description': f"Found {max(self.unused_imports_total, len(unused_imports))} unused imports in Python files",
                 'risk_level': 'low',
                 'location': self.repo_url,
                 'details': {
-                    'unused_imports_count': len(unused_imports),
+                    'unused_imports_count': max(self.unused_imports_total, len(unused_imports)),
                     'unused_imports_sample': unused_imports[:5]  # Sample of 5 unused imports
                 }
             })
@@ -2529,7 +2518,38 @@ class GithubRepoSustainabilityScanner:
                 ]
             })
         
-        # 4. General code efficiency recommendation
+        # 4. Finding for duplicated code
+        duplication_pct = (duplication or {}).get('duplication_percentage', 0)
+        if duplication_pct > 5:
+            findings.append({
+                'id': f"CODE-DUPLICATION-{int(time.time())}",
+                'type': 'Code Duplication',
+                'category': 'Code Efficiency',
+                'description': f"{duplication_pct:.1f}% of code lines are duplicated ({duplication['clone_count']} blocks, {duplication['cross_file_clone_count']} across files)",
+                'risk_level': 'medium' if duplication_pct > 15 else 'low',
+                'location': self.repo_url,
+                'details': {
+                    'duplicated_lines': duplication['duplicated_lines'],
+                    'code_lines': duplication['code_lines'],
+                    'files_with_clones': duplication['files_with_clones'],
+                    'clones_sample': duplication.get('clones_sample', [])
+                }
+            })
+            
+            recommendations.append({
+                'title': 'Consolidate duplicated code',
+                'description': 'Duplicated code multiplies build, test and maintenance effort and the compute spent on it.',
+                'priority': 'Medium' if duplication_pct > 15 else 'Low',
+                'impact': 'Medium',
+                'savings_potential': f"{duplication['duplicated_lines']} lines",
+                'steps': [
+                    "Extract repeated blocks into shared functions or modules",
+                    "Replace copy-pasted helpers with a single maintained implementation",
+                    "Add a duplication check to code review or CI"
+                ]
+            })
+        
+        # 5. General code efficiency recommendation
         recommendations.append({
             'title': 'Implement code efficiency best practices',
             'description': 'Improving code efficiency reduces resource usage, carbon footprint, and cloud costs.',
@@ -2547,7 +2567,8 @@ class GithubRepoSustainabilityScanner:
         return findings, recommendations
     
     def _calculate_sustainability_score(self, file_stats: Dict[str, Any], unused_imports: List[Dict[str, Any]], 
-                                       large_files: List[Dict[str, Any]]) -> int:
+                                       large_files: List[Dict[str, Any]],
+                                       duplication: Optional[Dict[str, Any]] = None) -> int:
         """
         Calculate a sustainability score for the repository.
         
@@ -2555,6 +2576,7 @@ class GithubRepoSustainabilityScanner:
             file_stats: Repository file statistics
             unused_imports: List of unused imports
             large_files: List of large files
+            duplication: Optional duplication summary from _analyze_code_duplication
             
         Returns:
             Sustainability score (0-100, higher is better)
@@ -2607,6 +2629,15 @@ class GithubRepoSustainabilityScanner:
             elif large_files_percentage > 50:
                 score -= 5   # Half of repo size is large files
         
+        # Duplicated code impact (less is better)
+        duplication_pct = (duplication or {}).get('duplication_percentage', 0)
+        if duplication_pct > 25:
+            score -= 10  # Heavy copy-paste
+        elif duplication_pct > 15:
+            score -= 5   # Noticeable duplication
+        elif duplication_pct > 5:
+            score -= 2   # Some duplication
+        
         # Ensure score is within 0-100 range
         score = max(0, min(100, score))
         
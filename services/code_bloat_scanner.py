@@ -14,6 +14,8 @@ from collections import defaultdict
 from typing import Dict, List, Any, Set, Tuple
 import logging
 
+from services.clone_detector import CloneIndex
+
 # Import centralized logging
 try:
     from utils.centralized_logger import get_scanner_logger
@@ -25,6 +27,10 @@ except ImportError:
 # Threshold for large file size in bytes
 LARGE_FILE_THRESHOLD_BYTES = 100 * 1024  # 100 KB
 
+# Minimum duplicated block length (normalised lines) and report limits
+DUPLICATION_BLOCK_SIZE = 5
+MAX_DUPLICATED_BLOCKS_PER_FILE = 3
+
 
 class CodeBloatScanner:
     """
@@ -38,6 +44,7 @@ class CodeBloatScanner:
         self.total_size_bytes = 0
         self.unused_imports = []
         self.large_files = []
+        self.clone_index = CloneIndex(block_size=DUPLICATION_BLOCK_SIZE)
         self.progress_callback = None
     
     def set_progress_callback(self, callback):
@@ -231,52 +238,56 @@ class CodeBloatScanner:
     
     def _check_duplication(self, file_path: str, content: str) -> None:
         """
-        Check for code duplication in a Python file.
+        Add a file to the scan-wide clone index.
+        
+        Duplicates are resolved once all files are indexed (see
+        _add_duplication_findings), so blocks copied between files are
+        found as well as blocks repeated within a file.
         
         Args:
             file_path: Path to the file
             content: File content as string
         """
-        # Very basic duplication check - look for repeated non-trivial code blocks
-        lines = content.split('\n')
-        line_count = len(lines)
+        self.clone_index.add_file(file_path, content)
+    
+    def _add_duplication_findings(self) -> Dict[str, Any]:
+        """
+        Resolve the clone index into per-file duplication findings.
         
-        # Skip if file is too small
-        if line_count < 20:
-            return
+        Returns:
+            Duplication summary metrics
+        """
+        clones = self.clone_index.find_clones()
         
-        # Look for blocks of 5 or more similar lines
-        block_size = 5
-        duplicated_blocks = []
+        blocks_by_file = defaultdict(list)
+        for clone in clones:
+            blocks_by_file[clone.clone_file].append(clone)
         
-        for i in range(line_count - block_size + 1):
-            block1 = '\n'.join(lines[i:i + block_size])
-            
-            # Skip empty or comment-only blocks
-            if not block1.strip() or all(line.strip().startswith('#') for line in block1.split('\n')):
-                continue
-            
-            for j in range(i + block_size, line_count - block_size + 1):
-                block2 = '\n'.join(lines[j:j + block_size])
-                
-                # Check if blocks are similar (simple string comparison)
-                if block1 == block2:
-                    duplicated_blocks.append({
-                        "block1_start": i + 1,
-                        "block1_end": i + block_size,
-                        "block2_start": j + 1,
-                        "block2_end": j + block_size,
-                        "content": block1
-                    })
-        
-        # Add findings for duplicated blocks
-        if duplicated_blocks:
+        for file_path, file_clones in blocks_by_file.items():
+            cross_file = sum(1 for clone in file_clones if clone.cross_file)
+            message = f"Found {len(file_clones)} duplicated code blocks"
+            if cross_file:
+                message += f" ({cross_file} duplicated from other files)"
             self.findings.append({
                 "type": "Code Duplication",
                 "file": file_path,
-                "message": f"Found {len(duplicated_blocks)} duplicated code blocks",
-                "duplicated_blocks": duplicated_blocks[:3]  # Include first 3 duplications
+                "message": message,
+                "duplicated_blocks": [
+                    {
+                        "block1_file": clone.source_file,
+                        "block1_start": clone.source_start,
+                        "block1_end": clone.source_end,
+                        "block2_file": clone.clone_file,
+                        "block2_start": clone.clone_start,
+                        "block2_end": clone.clone_end,
+                        "line_count": clone.line_count,
+                        "content": self.clone_index.block_content(clone)
+                    }
+                    for clone in file_clones[:MAX_DUPLICATED_BLOCKS_PER_FILE]
+                ]
             })
+        
+        return self.clone_index.duplication_summary(clones)
     
     def _check_complexity(self, file_path: str, content: str) -> None:
         """
@@ -353,6 +364,8 @@ class CodeBloatScanner:
         Returns:
             Dictionary with analysis results
         """
+        duplication = self._add_duplication_findings()
+        
         # Calculate code stats
         avg_file_size = self.total_size_bytes / self.files_analyzed if self.files_analyzed > 0 else 0
         
@@ -406,6 +419,20 @@ class CodeBloatScanner:
                 ]
             })
         
+        if duplication["duplication_percentage"] > 5:
+            recommendations.append({
+                "title": "Consolidate duplicated code",
+                "description": f"{duplication['duplication_percentage']:.1f}% of code lines are duplicated in {duplication['clone_count']} blocks ({duplication['cross_file_clone_count']} across files).",
+                "priority": "Medium",
+                "impact": "Medium",
+                "savings_potential": f"{duplication['duplicated_lines']} lines",
+                "steps": [
+                    "Extract repeated blocks into shared functions or modules",
+                    "Replace copy-pasted helpers with a single maintained implementation",
+                    "Add a duplication check to code review or CI"
+                ]
+            })
+        
         # Create findings for systematic issues
         if len(self.unused_imports) > 10:
             self.findings.append({
@@ -445,6 +472,7 @@ class CodeBloatScanner:
             "avg_file_size_kb": avg_file_size / 1024,
             "unused_imports": self.unused_imports,
             "large_files": detailed_large_files,
+            "duplication": duplication,
             "findings": self.findings,
             "recommendations": recommendations,
             "status": "completed"
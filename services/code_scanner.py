@@ -21,6 +21,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Union
 from utils.pii_detection import identify_pii_in_text
 from utils.gdpr_rules import get_region_rules, evaluate_risk_level
+from services.scan_checkpoint import CheckpointJournal, journal_path_for
+from services.finding_batch import FindingBatch, merge_file_findings
+from services.archive_vfs import ArchiveLimits, is_archive_path, scan_archive
 
 # Configure logging
 
@@ -66,7 +69,8 @@ class CodeScanner:
     def __init__(self, extensions: Optional[List[str]] = None, include_comments: bool = True, 
                  region: str = "Netherlands", use_entropy: bool = True, 
                  use_git_metadata: bool = False, include_article_refs: bool = True,
-                 max_timeout: int = 3600, checkpoint_interval: int = 300):
+                 max_timeout: int = 3600, checkpoint_interval: int = 300,
+                 checkpoint_dir: Optional[str] = None):
         """
         Initialize the code scanner with advanced detection capabilities.
         
@@ -78,13 +82,16 @@ class CodeScanner:
             use_git_metadata: Whether to collect Git metadata for findings
             include_article_refs: Whether to include regulatory article references
             max_timeout: Maximum runtime in seconds before timeout (default: 1 hour)
-            checkpoint_interval: Interval in seconds for saving scan checkpoints (default: 5 minutes)
+            checkpoint_interval: Interval in seconds between checkpoint fsyncs (default: 5 minutes)
+            checkpoint_dir: Directory for checkpoint journals (default: DG_SCAN_STATE_DIR or /tmp/dataguardian/scan_state)
         """
         # Long-running scan settings
         self.max_timeout = max_timeout
         self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_dir = checkpoint_dir
         self.start_time = None
         self.scan_checkpoint_data = {}
+        self._checkpoint_journal: Optional[CheckpointJournal] = None
         self.is_running = False
         self.progress_callback = None
         # Support for multiple languages
@@ -550,8 +557,8 @@ class CodeScanner:
         self.is_running = True
         scan_id = hashlib.md5(f"{directory_path}:{self.start_time.isoformat()}".encode()).hexdigest()[:10]
         
-        # Prepare checkpoint file path
-        checkpoint_path = f"scan_checkpoint_{scan_id}.json"
+        # Checkpoint journal lives in the state dir, keyed by the scanned directory
+        checkpoint_path = journal_path_for(directory_path, self.checkpoint_dir)
         
         # Initialize or restore checkpoint data
         self._setup_checkpoint(continue_from_checkpoint, checkpoint_path, scan_id, directory_path)
@@ -579,12 +586,23 @@ class CodeScanner:
         print(f"Total files found: {total_file_count}, files to scan: {len(filtered_files)}, files skipped: {self.scan_checkpoint_data['stats']['files_skipped']}")
         
         # Execute parallel scanning
-        self._execute_parallel_scan(
-            filtered_files, directory_path, checkpoint_path, num_workers, batch_size
+        try:
+            self._execute_parallel_scan(
+                filtered_files, directory_path, checkpoint_path, num_workers, batch_size
+            )
+        finally:
+            # Mark scan as complete
+            self.is_running = False
+            self._checkpoint_journal.close()
+        
+        completed_files = self.scan_checkpoint_data['completed_files']
+        pending_count = sum(
+            1 for file_path, _ in all_files
+            if os.path.relpath(file_path, directory_path) not in completed_files
         )
         
-        # Mark scan as complete
-        self.is_running = False
+        # Files' findings become slices of one batch sharing the scan's value table
+        merge_file_findings(self.scan_checkpoint_data['findings'])
         
         # Create final result
         result = {
@@ -598,16 +616,16 @@ class CodeScanner:
             'files_skipped': self.scan_checkpoint_data['stats']['files_skipped'],
             'total_findings': self.scan_checkpoint_data['stats']['total_findings'],
             'findings': self.scan_checkpoint_data['findings'],
-            'status': 'completed' if len(all_files) == len(self.scan_checkpoint_data['completed_files']) else 'partial',
-            'completion_percentage': int(100 * len(self.scan_checkpoint_data['completed_files']) / max(1, len(all_files)))
+            'status': 'completed' if pending_count == 0 else 'partial',
+            'completion_percentage': int(100 * len(completed_files) / max(1, len(completed_files) + pending_count))
         }
         
-        # Clean up checkpoint file if scan completed successfully
-        if result['status'] == 'completed' and os.path.exists(checkpoint_path):
+        # Clean up checkpoint journal if scan completed successfully
+        if result['status'] == 'completed':
             try:
-                os.remove(checkpoint_path)
-            except:
-                pass
+                self._checkpoint_journal.remove()
+            except OSError as e:
+                logger.warning(f"Failed to remove checkpoint journal: {e}")
         
         # Integrate cost savings analysis
         try:
@@ -623,24 +641,47 @@ class CodeScanner:
         """
         Setup or restore checkpoint data for resumable scans.
         
+        The journal is replayed into a set of completed paths and compacted,
+        so resuming costs one sequential read of the journal.
+        
         Args:
             continue_from_checkpoint: Whether to continue from existing checkpoint
-            checkpoint_path: Path to the checkpoint file
+            checkpoint_path: Path to the checkpoint journal
             scan_id: Unique scan identifier
             directory_path: Directory being scanned
         """
+        journal_options = {'fsync_interval': self.checkpoint_interval}
         if continue_from_checkpoint and os.path.exists(checkpoint_path):
             try:
-                with open(checkpoint_path, 'r') as f:
-                    self.scan_checkpoint_data = json.load(f)
-                logger.info(f"Restored scan from checkpoint, {len(self.scan_checkpoint_data.get('completed_files', []))} files already processed")
-            except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
+                self._checkpoint_journal = CheckpointJournal.resume(checkpoint_path, **journal_options)
+                state = self._checkpoint_journal.replay()
+            except (OSError, ValueError, KeyError) as e:
                 raise CheckpointError(f"Failed to load checkpoint: {e}")
-            except Exception as e:
-                logger.warning(f"Unexpected error loading checkpoint: {e}")
-                self._initialize_checkpoint_data(scan_id, directory_path)
+            
+            findings = list(state['findings'].values())
+            self.scan_checkpoint_data = {
+                'scan_id': state['scan_id'] or scan_id,
+                'start_time': state['start_time'] or self.start_time.isoformat(),
+                'directory': directory_path,
+                'completed_files': state['completed_files'],
+                'findings': findings,
+                # Skips are recounted by file discovery on every run
+                'stats': {
+                    'files_scanned': len(state['completed_files']),
+                    'files_skipped': 0,
+                    'total_findings': sum(f.get('pii_count', 0) for f in findings)
+                }
+            }
+            logger.info(f"Restored scan from checkpoint, {len(state['completed_files'])} files already processed")
         else:
             self._initialize_checkpoint_data(scan_id, directory_path)
+            try:
+                self._checkpoint_journal = CheckpointJournal.create(
+                    checkpoint_path, scan_id, self.scan_checkpoint_data['start_time'],
+                    directory_path, **journal_options
+                )
+            except OSError as e:
+                raise CheckpointError(f"Failed to create checkpoint journal: {e}")
     
     def _initialize_checkpoint_data(self, scan_id: str, directory_path: str) -> None:
         """Initialize fresh checkpoint data."""
@@ -651,7 +692,7 @@ class CodeScanner:
             'scan_id': scan_id,
             'start_time': self.start_time.isoformat(),
             'directory': directory_path,
-            'completed_files': [],
+            'completed_files': set(),
             'findings': [],
             'stats': {'files_scanned': 0, 'files_skipped': 0, 'total_findings': 0}
         }
@@ -701,7 +742,7 @@ class CodeScanner:
         # Skip certain file types and patterns that are unlikely to contain PII
         skip_extensions = {
             '.png', '.jpg', '.jpeg', '.gif', '.ico', '.svg', '.woff', '.ttf', '.eot', 
-            '.mp3', '.mp4', '.avi', '.pdf', '.zip', '.tar', '.gz', '.lock', '.pyc', 
+            '.mp3', '.mp4', '.avi', '.pdf', '.lock', '.pyc', 
             '.mo', '.class', '.jar', '.bin', '.exe', '.dll', '.so', '.o'
         }
         skip_dirs = {
@@ -856,13 +897,16 @@ class CodeScanner:
                         if result and 'file_path' in result:
                             # Mark as completed
                             rel_path = os.path.relpath(result['file_path'], directory_path)
-                            self.scan_checkpoint_data['completed_files'].append(rel_path)
+                            self.scan_checkpoint_data['completed_files'].add(rel_path)
                             
                             # Update stats
                             self.scan_checkpoint_data['stats']['files_scanned'] += 1
                             if result.get('pii_count', 0) > 0:
                                 self.scan_checkpoint_data['findings'].append(result)
                                 self.scan_checkpoint_data['stats']['total_findings'] += result.get('pii_count', 0)
+                                self._checkpoint_journal.record_file(rel_path, result)
+                            else:
+                                self._checkpoint_journal.record_file(rel_path)
                     
                     # Save checkpoint after each batch
                     self._save_checkpoint_if_needed(checkpoint_path)
@@ -872,18 +916,19 @@ class CodeScanner:
     
     def _save_checkpoint_if_needed(self, checkpoint_path: str) -> None:
         """
-        Save checkpoint if the interval has passed.
+        Append the files completed since the last checkpoint to the journal.
+        The journal fsyncs itself once checkpoint_interval seconds or its
+        size threshold have passed.
         
         Args:
-            checkpoint_path: Path to save the checkpoint
+            checkpoint_path: Path of the checkpoint journal
         """
-        if self.start_time is not None and (datetime.now() - self.start_time).total_seconds() % self.checkpoint_interval < 1:
-            try:
-                with open(checkpoint_path, 'w') as f:
-                    json.dump(self.scan_checkpoint_data, f, indent=2)
-                logger.info(f"Saved checkpoint at {datetime.now().isoformat()}")
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Failed to save checkpoint: {e}")
+        if self._checkpoint_journal is None:
+            return
+        try:
+            self._checkpoint_journal.flush()
+        except OSError as e:
+            logger.warning(f"Failed to save checkpoint to {checkpoint_path}: {e}")
     
     def _scan_file_wrapper(self, args):
         """
@@ -980,6 +1025,10 @@ class CodeScanner:
                 'pii_found': []
             }
         
+        # Archives are walked in place; their members are scanned as streams
+        if is_archive_path(file_path):
+            return self.scan_archive(file_path)
+        
         _, ext = os.path.splitext(file_path)
         if ext.lower() not in self.extensions:
             return {
@@ -1020,6 +1069,64 @@ class CodeScanner:
         except Exception as e:
             raise FileProcessingError(f"Error processing file {file_path}: {e}")
     
+    def scan_archive(self, archive_path: str, max_workers: Optional[int] = None,
+                     limits: Optional[ArchiveLimits] = None) -> Dict[str, Any]:
+        """
+        Scan the members of an archive (and nested archives) without extracting it.
+        
+        Args:
+            archive_path: Path to the zip/tar/gz/bz2/xz/7z archive
+            max_workers: Worker processes for member scanning (default DG_ARCHIVE_WORKERS)
+            limits: Zip-bomb and nesting limits
+            
+        Returns:
+            File-style scan result for the archive; each finding carries the
+            'archive_member' it was found in, and 'members' holds the
+            per-member results
+        """
+        outcome = scan_archive(archive_path, self, limits=limits, max_workers=max_workers,
+                               accept=lambda path: os.path.splitext(path)[1].lower() in self.extensions)
+        members = outcome['members']
+        pii_found = FindingBatch.from_dicts(
+            dict(finding, archive_member=member['file_path'])
+            for member in members for finding in member.get('pii_found', [])
+        )
+        risk_counts = {'Low': 0, 'Medium': 0, 'High': 0, 'Critical': 0}
+        for risk_level, count in pii_found.value_counts('risk_level', default='Medium').items():
+            risk_counts[risk_level] = risk_counts.get(risk_level, 0) + count
+        
+        return {
+            'file_name': os.path.basename(archive_path),
+            'file_path': archive_path,
+            'scan_method': 'archive-stream',
+            'status': outcome['status'],
+            'error': outcome['error'],
+            'pii_found': pii_found,
+            'pii_count': len(pii_found),
+            'risk_summary': risk_counts,
+            'members': members,
+            'members_scanned': outcome['members_scanned'],
+            'skipped_members': outcome['skipped_members'],
+            'file_size_bytes': os.path.getsize(archive_path),
+            'scan_timestamp': datetime.now().isoformat(),
+            'region': self.region
+        }
+    
+    def scan_member(self, member_path: str, data: bytes, kind: str = 'file') -> Dict[str, Any]:
+        """
+        Scan one archive member's content (called by the archive walker).
+        
+        Args:
+            member_path: Provenance path ('repo.zip!/src/settings.py')
+            data: Member content
+            kind: Member kind reported by the walker
+            
+        Returns:
+            Scan results dictionary for the member
+        """
+        content = data.decode('utf-8', errors='ignore')
+        return self._scan_file_content(member_path, content, {'size_bytes': len(data), 'archive_member': True})
+    
     def _scan_file_content(self, file_path: str, content: str, file_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Scan file content for PII and secrets (in-memory processing).
@@ -1279,19 +1386,21 @@ class CodeScanner:
         except Exception as e:
             logger.warning(f"Netherlands GDPR/UAVG violation detection failed: {e}")
         
+        # Findings leave the scanner as a columnar batch (compact to pickle and journal)
+        pii_found = FindingBatch.from_dicts(all_pii)
+        
         # Calculate risk metrics
         risk_counts = {'Low': 0, 'Medium': 0, 'High': 0, 'Critical': 0}
-        for finding in all_pii:
-            risk_level = finding.get('risk_level', 'Medium')
-            risk_counts[risk_level] = risk_counts.get(risk_level, 0) + 1
+        for risk_level, count in pii_found.value_counts('risk_level', default='Medium').items():
+            risk_counts[risk_level] = risk_counts.get(risk_level, 0) + count
         
         return {
             'file_name': os.path.basename(file_path),
             'file_path': file_path,
             'scan_method': scan_method,
             'status': 'completed',
-            'pii_found': all_pii,
-            'pii_count': len(all_pii),
+            'pii_found': pii_found,
+            'pii_count': len(pii_found),
             'risk_summary': risk_counts,
             'file_size_bytes': file_metadata.get('size_bytes', 0),
             'scan_timestamp': datetime.now().isoformat(),
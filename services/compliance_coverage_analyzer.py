@@ -7,7 +7,7 @@ import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-from services.results_aggregator import ResultsAggregator
+from services.results_aggregator import get_results_aggregator
 
 class ComplianceCoverageAnalyzer:
     """
@@ -17,7 +17,7 @@ class ComplianceCoverageAnalyzer:
     
     def __init__(self, region: str = "Netherlands"):
         self.region = region
-        self.results_aggregator = ResultsAggregator()
+        self.results_aggregator = get_results_aggregator()
         
         # GDPR Article mapping to scan capabilities
         self.gdpr_article_mapping = {
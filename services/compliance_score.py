@@ -66,10 +66,10 @@ class ComplianceScoreManager:
             Dict containing overall score and component scores
         """
         # Import here to avoid circular import
-        from services.results_aggregator import ResultsAggregator
+        from services.results_aggregator import get_results_aggregator
         
         # Get recent scan results
-        aggregator = ResultsAggregator()
+        aggregator = get_results_aggregator()
         recent_scans = aggregator.get_recent_scans(days=30)
         
         # Initialize component scores
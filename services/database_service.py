@@ -20,6 +20,8 @@ from typing import Dict, Any, List, Optional, Union
 import json
 from contextlib import contextmanager
 
+from services.schema_migrations import ensure_schema
+
 
 
 class DatabaseService:
@@ -38,133 +40,13 @@ class DatabaseService:
             self._initialize_database()
     
     def _initialize_database(self):
-        """Initialize database tables if they don't exist"""
+        """Ensure database tables exist (versioned migrations, applied once per process)"""
         if not self.enabled:
             return
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Create payment records table
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS payment_records (
-                            id SERIAL PRIMARY KEY,
-                            session_id VARCHAR(255) UNIQUE NOT NULL,
-                            customer_email VARCHAR(255) NOT NULL,
-                            amount DECIMAL(10,2) NOT NULL,
-                            currency VARCHAR(3) DEFAULT 'EUR',
-                            scan_type VARCHAR(100) NOT NULL,
-                            country_code VARCHAR(2) DEFAULT 'NL',
-                            payment_method VARCHAR(50),
-                            status VARCHAR(50) NOT NULL,
-                            metadata JSONB,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Create subscription records table
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS subscription_records (
-                            id SERIAL PRIMARY KEY,
-                            subscription_id VARCHAR(255) UNIQUE NOT NULL,
-                            customer_id VARCHAR(255) NOT NULL,
-                            customer_email VARCHAR(255) NOT NULL,
-                            plan_name VARCHAR(100) NOT NULL,
-                            status VARCHAR(50) NOT NULL,
-                            amount DECIMAL(10,2) NOT NULL,
-                            currency VARCHAR(3) DEFAULT 'EUR',
-                            billing_interval VARCHAR(20) DEFAULT 'month',
-                            current_period_start TIMESTAMP,
-                            current_period_end TIMESTAMP,
-                            cancel_at_period_end BOOLEAN DEFAULT FALSE,
-                            metadata JSONB,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Create invoice records table
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS invoice_records (
-                            id SERIAL PRIMARY KEY,
-                            invoice_number VARCHAR(50) UNIQUE NOT NULL,
-                            customer_email VARCHAR(255) NOT NULL,
-                            customer_name VARCHAR(255),
-                            customer_address TEXT,
-                            amount_subtotal DECIMAL(10,2) NOT NULL,
-                            amount_tax DECIMAL(10,2) NOT NULL,
-                            amount_total DECIMAL(10,2) NOT NULL,
-                            currency VARCHAR(3) DEFAULT 'EUR',
-                            tax_rate DECIMAL(5,4),
-                            country_code VARCHAR(2) DEFAULT 'NL',
-                            description TEXT,
-                            payment_status VARCHAR(50) DEFAULT 'paid',
-                            pdf_generated BOOLEAN DEFAULT FALSE,
-                            metadata JSONB,
-                            issue_date DATE DEFAULT CURRENT_DATE,
-                            due_date DATE,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Create analytics events table
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS analytics_events (
-                            id SERIAL PRIMARY KEY,
-                            event_type VARCHAR(100) NOT NULL,
-                            user_id VARCHAR(255),
-                            session_id VARCHAR(255),
-                            event_data JSONB,
-                            ip_address INET,
-                            user_agent TEXT,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Create certificate records table
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS certificate_records (
-                            id SERIAL PRIMARY KEY,
-                            certificate_id VARCHAR(255) UNIQUE NOT NULL,
-                            customer_email VARCHAR(255) NOT NULL,
-                            certificate_type VARCHAR(100) NOT NULL,
-                            organization_name VARCHAR(255),
-                            amount_paid DECIMAL(10,2),
-                            currency VARCHAR(3) DEFAULT 'EUR',
-                            status VARCHAR(50) DEFAULT 'issued',
-                            issue_date DATE DEFAULT CURRENT_DATE,
-                            expiry_date DATE,
-                            pdf_generated BOOLEAN DEFAULT FALSE,
-                            metadata JSONB,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Create indexes for better performance
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_payment_records_email 
-                        ON payment_records(customer_email)
-                    """)
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_payment_records_status 
-                        ON payment_records(status)
-                    """)
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_subscription_records_customer 
-                        ON subscription_records(customer_id)
-                    """)
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_analytics_events_type 
-                        ON analytics_events(event_type)
-                    """)
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_analytics_events_created 
-                        ON analytics_events(created_at)
-                    """)
-                    
-                conn.commit()
-                logger.info("Database tables initialized successfully")
+            ensure_schema(self.database_url)
+            logger.info("Database tables initialized successfully")
                 
         except Exception as e:
             logger.error(f"Failed to initialize database: {str(e)}")
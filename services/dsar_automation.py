@@ -8,13 +8,33 @@ import json
 import hashlib
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from .subject_index import SubjectIndex, get_subject_index
+    from .redaction_engine import RedactionEngine, RedactionManifest, get_redaction_engine
+except ImportError:
+    # Fallback for direct execution
+    from subject_index import SubjectIndex, get_subject_index
+    from redaction_engine import RedactionEngine, RedactionManifest, get_redaction_engine
+
 logger = logging.getLogger(__name__)
 
+# Identifiers besides email and name that a request may carry in request_details
+SUBJECT_IDENTIFIER_FIELDS = ('bsn', 'phone', 'iban')
+
+# Estimated size of one record per location data type
+RECORD_SIZE_MB = {
+    "database_record": 0.001,
+    "file": 0.5,
+    "cloud_data": 0.1,
+    "api_data": 0.002
+}
+
 class DSARType(Enum):
     """GDPR Data Subject Request Types"""
     ACCESS = "access"                    # Article 15 - Right of access
@@ -120,8 +140,20 @@ class DSARRequest:
 class DSARAutomationEngine:
     """Enterprise DSAR automation engine"""
     
-    def __init__(self, region: str = "Netherlands"):
+    def __init__(self, region: str = "Netherlands", organization_id: str = "default_org",
+                 subject_index: Optional[SubjectIndex] = None, live_verification: bool = False):
+        """
+        Args:
+            region: Region whose verification rules apply
+            organization_id: Tenant searched in the subject index
+            subject_index: Index of subject identifiers (default: process-wide index)
+            live_verification: Also search the source systems for every request
+                (requests can override with request_details['live_verification'])
+        """
         self.region = region
+        self.organization_id = organization_id
+        self.live_verification = live_verification
+        self._subject_index = subject_index
         self.active_requests: Dict[str, DSARRequest] = {}
         self.verification_providers = self._init_verification_providers()
         self.data_discovery_engines = self._init_data_discovery()
@@ -183,6 +215,10 @@ class DSARAutomationEngine:
                 "enabled": True,
                 "secure_deletion": True,
                 "backup_retention_days": 30
+            },
+            "masking": {
+                "enabled": True,
+                "engine": get_redaction_engine()
             }
         }
     
@@ -399,23 +435,19 @@ class DSARAutomationEngine:
         search_email = request.data_subject_email
         search_name = request.data_subject_name
         
-        data_locations = []
-        
-        # 1. Database Discovery
-        db_locations = self._discover_database_data(search_email, search_name)
-        data_locations.extend(db_locations)
-        
-        # 2. File System Discovery
-        file_locations = self._discover_file_data(search_email, search_name)
-        data_locations.extend(file_locations)
+        # 1. Indexed lookup of the locations earlier scans found the subject in
+        #    (always the service's own tenant, never one named in the request)
+        data_locations = self._discover_indexed_data(self.organization_id, self._subject_identifiers(request))
+        indexed_count = len(data_locations)
         
-        # 3. Cloud System Discovery
-        cloud_locations = self._discover_cloud_data(search_email, search_name)
-        data_locations.extend(cloud_locations)
-        
-        # 4. API/Application Discovery
-        api_locations = self._discover_api_data(search_email, search_name)
-        data_locations.extend(api_locations)
+        # 2. Live search of the source systems, when asked for or nothing is indexed
+        live_verification = request.request_details.get("live_verification", self.live_verification)
+        if live_verification or not data_locations:
+            known_paths = {location.location_path for location in data_locations}
+            for location in self._discover_live_data(search_email, search_name):
+                if location.location_path not in known_paths:
+                    known_paths.add(location.location_path)
+                    data_locations.append(location)
         
         request.data_locations = data_locations
         request.status = DSARStatus.DATA_LOCATED
@@ -423,7 +455,7 @@ class DSARAutomationEngine:
         request.communication_log.append({
             "timestamp": datetime.now().isoformat(),
             "type": "data_discovery_completed",
-            "details": f"Discovered data in {len(data_locations)} locations",
+            "details": f"Discovered data in {len(data_locations)} locations ({indexed_count} from the subject index)",
             "automated": True
         })
         
@@ -433,6 +465,64 @@ class DSARAutomationEngine:
         logger.info(f"Data discovery completed for DSAR {request_id}, found {len(data_locations)} locations")
         return data_locations
     
+    @property
+    def subject_index(self) -> SubjectIndex:
+        if self._subject_index is None:
+            self._subject_index = get_subject_index()
+        return self._subject_index
+    
+    def _subject_identifiers(self, request: DSARRequest) -> Dict[str, Any]:
+        """
+        Identifiers of the data subject, by identifier type.
+        
+        Names are shared between people, so they are only matched when the
+        request opts in with request_details['match_name'].
+        """
+        identifiers = {"email": request.data_subject_email}
+        if request.data_subject_name and request.request_details.get("match_name"):
+            identifiers["name"] = request.data_subject_name
+        for field in SUBJECT_IDENTIFIER_FIELDS:
+            if request.request_details.get(field):
+                identifiers[field] = request.request_details[field]
+        return identifiers
+    
+    def _discover_indexed_data(self, organization_id: str, identifiers: Dict[str, Any]) -> List[DSARDataLocation]:
+        """Locations recorded for the subject in the subject index"""
+        try:
+            entries = self.subject_index.lookup(organization_id, identifiers)
+        except Exception as e:
+            logger.warning(f"Subject index lookup failed, falling back to live discovery: {e}")
+            return []
+        
+        return [
+            DSARDataLocation(
+                location_id=entry["location_id"],
+                system_name=entry["system_name"],
+                data_type=entry["data_type"],
+                location_path=entry["location_path"],
+                record_count=entry["record_count"],
+                estimated_size_mb=entry["record_count"] * RECORD_SIZE_MB.get(entry["data_type"], 0.001),
+                sensitivity_level=entry["sensitivity_level"]
+            )
+            for entry in entries
+        ]
+    
+    def _discover_live_data(self, email: str, name: Optional[str]) -> List[DSARDataLocation]:
+        """Search all source systems concurrently; a failing source is logged and skipped"""
+        discoverers = [self._discover_database_data, self._discover_file_data,
+                       self._discover_cloud_data, self._discover_api_data]
+        
+        def discover(discoverer: Callable[[str, Optional[str]], List[DSARDataLocation]]) -> List[DSARDataLocation]:
+            try:
+                return discoverer(email, name)
+            except Exception as e:
+                logger.warning(f"Live DSAR discovery failed in {discoverer.__name__}: {e}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=len(discoverers)) as executor:
+            results = list(executor.map(discover, discoverers))
+        return [location for locations in results for location in locations]
+    
     def _discover_database_data(self, email: str, name: Optional[str]) -> List[DSARDataLocation]:
         """Discover data in databases"""
         locations = []
@@ -708,6 +798,57 @@ class DSARAutomationEngine:
         logger.info(f"Data erasure prepared for DSAR {request_id}")
         return fulfillment_package
     
+    def redact_export(self, request_id: str, task_id: str, source_path: str, target_path: str,
+                      manifest_path: Optional[str] = None) -> RedactionManifest:
+        """
+        Run a redaction task over a file or database export of its location.
+        
+        The export is streamed through the masking engine, so exports of any
+        size are redacted with constant memory.
+        
+        Args:
+            request_id: DSAR request the task belongs to
+            task_id: Redaction task to run
+            source_path: Export of the task's location
+            target_path: Where the redacted export is written
+            manifest_path: Optional JSON-lines audit file with one entry per redaction
+        
+        Returns:
+            Manifest of the redaction run
+        """
+        if request_id not in self.active_requests:
+            raise ValueError(f"DSAR request {request_id} not found")
+        request = self.active_requests[request_id]
+        task = next((task for task in request.redaction_tasks if task.task_id == task_id), None)
+        if task is None:
+            raise ValueError(f"Redaction task {task_id} not found in DSAR {request_id}")
+        
+        engine: RedactionEngine = self.redaction_engines["masking"]["engine"]
+        task.status = "in_progress"
+        try:
+            manifest = engine.redact_file(source_path, target_path, entries_path=manifest_path)
+        except Exception:
+            task.status = "failed"
+            raise
+        
+        task.status = "completed"
+        task.redaction_timestamp = datetime.now()
+        task.redacted_records = manifest.redactions
+        task.redacted_fields = sorted(manifest.rule_counts)
+        if all(task.status == "completed" for task in request.redaction_tasks):
+            request.status = DSARStatus.REDACTION_COMPLETE
+        
+        request.communication_log.append({
+            "timestamp": datetime.now().isoformat(),
+            "type": "export_redacted",
+            "details": f"Redacted {manifest.redactions} values in export of {task.location.location_path}",
+            "manifest": manifest.to_dict(),
+            "automated": True
+        })
+        
+        logger.info(f"Redaction task {task_id} completed for DSAR {request_id}")
+        return manifest
+    
     def _prepare_data_portability(self, request_id: str) -> DSARFulfillmentPackage:
         """Prepare structured data export for portability (Article 20)"""
         
@@ -814,6 +955,13 @@ class DSARAutomationEngine:
         request = self.active_requests[request_id]
         request.status = DSARStatus.COMPLETED
         
+        # Erased data must no longer be reported by the subject index
+        if request.request_type == DSARType.ERASURE:
+            try:
+                self.subject_index.forget_subject(self.organization_id, self._subject_identifiers(request))
+            except Exception as e:
+                logger.warning(f"Could not remove erased subject from index for DSAR {request_id}: {e}")
+        
         request.communication_log.append({
             "timestamp": datetime.now().isoformat(),
             "type": "request_completed",
@@ -19,6 +19,11 @@ from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidTag
 
+try:
+    from .finding_batch import FindingBatch, dumps as finding_batch_dumps, loads as finding_batch_loads
+except ImportError:
+    from finding_batch import FindingBatch, dumps as finding_batch_dumps, loads as finding_batch_loads
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -329,8 +334,9 @@ class EncryptionService:
         """
         try:
             # Convert data to JSON string if it's a dictionary or list
-            if isinstance(data, (dict, list)):
-                data_str = json.dumps(data, separators=(',', ':'))
+            if isinstance(data, (dict, list, FindingBatch)):
+                # Finding batches are encrypted in their columnar form, shared tables once
+                data_str = finding_batch_dumps(data, separators=(',', ':'))
             else:
                 data_str = str(data)
             
@@ -455,7 +461,7 @@ class EncryptionService:
             
             # Try to parse as JSON, return as string if not valid JSON
             try:
-                return json.loads(decrypted_str)
+                return finding_batch_loads(decrypted_str)
             except json.JSONDecodeError:
                 return decrypted_str
                 
@@ -499,7 +505,7 @@ class EncryptionService:
                 if field in encrypted_result and encrypted_result[field]:
                     # Only encrypt non-empty fields
                     field_data = encrypted_result[field]
-                    if ((isinstance(field_data, (dict, list)) and len(field_data) > 0) or
+                    if ((isinstance(field_data, (dict, list, FindingBatch)) and len(field_data) > 0) or
                         (isinstance(field_data, str) and field_data.strip())):
                         
                         encrypted_field_name = f"{field}_encrypted"
@@ -69,7 +69,7 @@ class EnterpriseOrchestrator:
                 self.event_bus.subscribe(EventType.SCAN_COMPLETED, self._on_scan_completed)
             )
             self._listener_ids.append(
-                self.event_bus.subscribe(EventType.FINDING_DETECTED, self._on_finding_detected)
+                self.event_bus.subscribe_batch(EventType.FINDING_DETECTED, self._on_findings_detected)
             )
             self._listener_ids.append(
                 self.event_bus.subscribe(EventType.CRITICAL_ISSUE_FOUND, self._on_critical_issue)
@@ -155,39 +155,54 @@ class EnterpriseOrchestrator:
         except Exception as e:
             logger.error(f"EnterpriseOrchestrator: Error delegating scan completion: {e}")
     
-    def _on_finding_detected(self, event: Event) -> None:
-        """Handle individual finding detection events"""
+    def _on_findings_detected(self, events: List[Event]) -> None:
+        """
+        Handle a batch of finding detection events: the findings of each
+        scan in the batch are recorded with one RoPA and one SOC2 write
+        """
+        by_scan: Dict[str, List[Event]] = {}
+        for event in events:
+            by_scan.setdefault(event.data.get('scan_id') or event.event_id, []).append(event)
+        for scan_id, scan_events in by_scan.items():
+            self._on_scan_findings(scan_id, scan_events)
+    
+    def _on_scan_findings(self, scan_id: str, events: List[Event]) -> None:
+        """Record the findings of one scan in the RoPA inventory and SOC2 evidence"""
         try:
-            data = event.data
-            finding_type = data.get('type', 'Unknown')
-            risk_level = data.get('risk_level', 'Low')
-            location = data.get('location', 'Unknown')
-            
-            # Add to RoPA data inventory if PII-related
-            if 'pii' in finding_type.lower() or 'personal' in finding_type.lower():
-                if hasattr(self.ropa_service, 'add_data_finding'):
-                    self.ropa_service.add_data_finding({
-                        'scan_id': event.event_id,
+            data_findings = []
+            security_findings = []
+            for event in events:
+                data = event.data
+                finding_type = data.get('type', 'Unknown')
+                risk_level = data.get('risk_level', 'Low')
+                location = data.get('location', 'Unknown')
+                
+                # RoPA data inventory takes PII-related findings
+                if 'pii' in finding_type.lower() or 'personal' in finding_type.lower():
+                    data_findings.append({
                         'finding_type': finding_type,
                         'location': location,
                         'risk_level': risk_level,
                         'detected_at': event.timestamp.isoformat()
                     })
-            
-            # Track for SOC2 evidence if security-related
-            if risk_level in ['Critical', 'High']:
-                if hasattr(self.soc2_service, 'add_security_finding'):
-                    self.soc2_service.add_security_finding({
-                        'scan_id': event.event_id,
+                
+                # SOC2 evidence takes security-related findings
+                if risk_level in ['Critical', 'High']:
+                    security_findings.append({
                         'finding_type': finding_type,
                         'risk_level': risk_level,
                         'location': location
                     })
             
-            logger.debug(f"EnterpriseOrchestrator: Processed {risk_level} finding: {finding_type}")
+            if data_findings and hasattr(self.ropa_service, 'add_data_findings'):
+                self.ropa_service.add_data_findings(scan_id, data_findings)
+            if security_findings and hasattr(self.soc2_service, 'add_security_findings'):
+                self.soc2_service.add_security_findings(scan_id, security_findings)
+            
+            logger.debug(f"EnterpriseOrchestrator: Processed {len(events)} findings of scan {scan_id}")
             
         except Exception as e:
-            logger.error(f"EnterpriseOrchestrator: Error handling finding detected: {e}")
+            logger.error(f"EnterpriseOrchestrator: Error handling findings of scan {scan_id}: {e}")
     
     def _on_critical_issue(self, event: Event) -> None:
         """Handle critical issues - delegate to enterprise listener"""
@@ -299,6 +314,7 @@ class EnterpriseOrchestrator:
             'listeners_registered': self.listeners_registered,
             'listener_count': len(self._listener_ids),
             'event_bus_stats': self.event_bus.get_all_listener_counts(),
+            'event_bus_metrics': self.event_bus.get_listener_metrics(),
             'services_status': {
                 'dsar': bool(self.dsar_service),
                 'ropa': bool(self.ropa_service),
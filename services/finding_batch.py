@@ -0,0 +1,633 @@
+"""
+Finding Batch - Compact Columnar Scan Findings
+
+Scanners used to hand every finding around as its own dict: a hash table
+per finding holding freshly formatted type, location and reason strings,
+most of them repeated thousands of times per scan, and the whole list was
+pickled between scanner processes, journalled and JSON-encoded again before
+encryption.
+
+A FindingBatch stores findings column by column: one NumPy array of small
+unsigned codes per (finding, key) into a table of distinct values, so a
+repeated type, severity, location or reason is kept once per table. The
+table's strings are packed into a single UTF-8 buffer with offsets. Pickling
+(process pool) and the JSON payload (journal, encryption) carry only the
+table and the code array, the payload's codes zlib-compressed.
+
+A scanner builds one batch per file. Once a directory scan is done,
+merge_file_findings() joins them into one scan-level batch and gives each
+file a slice of it: the slices share the scan's value table, so a value
+repeated across files is kept once per scan. dumps() writes a table shared
+by several batches once per document, and loads() restores the sharing.
+
+A batch is a read-only Sequence of dicts: legacy consumers and the UI index
+or iterate it and get the same dicts the scanner produced, built on access.
+Those dicts are FrozenFinding views: a write to one would be lost with the
+dict, so it raises instead. to_dicts() returns plain dicts to modify.
+Aggregations (severity and type counts) and report tables read the columns
+directly. Finding is the typed view of one row with its severity interned
+as a Severity enum.
+"""
+
+import base64
+import json
+import sys
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+PAYLOAD_MARKER = '__finding_batch__'
+PAYLOAD_VERSION = 2
+
+# Version 1 payloads (always self-contained) are still read
+READABLE_PAYLOAD_VERSIONS = (1, 2)
+
+# Keys that carry a finding's severity, in order of preference
+SEVERITY_KEYS = ('risk_level', 'severity')
+
+_CODE_DTYPES = (np.uint8, np.uint16, np.uint32)
+
+
+class Severity(IntEnum):
+    """Interned finding severity, ordered from least to most severe."""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    @property
+    def label(self) -> str:
+        """Severity as the scanners spell it ('High')."""
+        return self.name.title()
+
+    @classmethod
+    def parse(cls, value: Any) -> Optional['Severity']:
+        """Severity for a label in any case ('high', 'High'), or None."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls.__members__.get(value.strip().upper())
+        return None
+
+
+@dataclass(slots=True)
+class Finding:
+    """Typed view of one finding."""
+    type: str
+    severity: Optional[Severity] = None
+    value: Any = None
+    location: Any = None
+    reason: Any = None
+    category: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, finding: Dict[str, Any]) -> 'Finding':
+        """Build the typed view of a scanner finding dict."""
+        extra = dict(finding)
+        severity = None
+        for key in SEVERITY_KEYS:
+            if key in extra:
+                severity = Severity.parse(extra.pop(key)) or severity
+        return cls(
+            type=extra.pop('type', ''),
+            severity=severity,
+            value=extra.pop('value', None),
+            location=extra.pop('location', None),
+            reason=extra.pop('reason', None),
+            category=extra.pop('category', None),
+            extra=extra,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Finding dict in the shape the scanners produce."""
+        finding = {'type': self.type, 'value': self.value, 'location': self.location,
+                   'risk_level': self.severity.label if self.severity else None,
+                   'reason': self.reason}
+        if self.category is not None:
+            finding['category'] = self.category
+        finding.update(self.extra)
+        return finding
+
+
+class FrozenFinding(dict):
+    """
+    Finding dict built from a batch row. Writes raise TypeError, as they
+    would not reach the batch; copy() or dict(finding) gives a plain dict.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("findings of a FindingBatch are read-only; copy the dict or use to_dicts()")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    update = setdefault = pop = popitem = clear = _read_only
+
+    def __reduce__(self):
+        # Copies and unpickled findings are plain dicts
+        return dict, (dict(self),)
+
+
+def _intern_key(value: Any) -> Tuple[Any, ...]:
+    # Keyed by type so that True, 1 and 1.0 stay distinct values
+    try:
+        hash(value)
+        return (value.__class__, value)
+    except TypeError:
+        return (value.__class__, repr(value))
+
+
+def _code_dtype(table_size: int) -> np.dtype:
+    for dtype in _CODE_DTYPES:
+        if table_size <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"Too many distinct values in one batch: {table_size}")
+
+
+def _encode_codes(codes: np.ndarray) -> Dict[str, Any]:
+    return {
+        'length': codes.shape[0],
+        'dtype': codes.dtype.str,
+        'compression': 'zlib',
+        'codes': base64.b64encode(zlib.compress(np.ascontiguousarray(codes).tobytes())).decode('ascii'),
+    }
+
+
+def _decode_codes(payload: Dict[str, Any], width: int) -> np.ndarray:
+    data = base64.b64decode(payload['codes'])
+    if payload.get('compression') == 'zlib':
+        data = zlib.decompress(data)
+    return np.frombuffer(data, dtype=np.dtype(payload['dtype'])).reshape(payload['length'], width).copy()
+
+
+def _pack_strings(strings: List[str]) -> Tuple[bytes, np.ndarray]:
+    encoded = [value.encode('utf-8', 'surrogatepass') for value in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    data = b''.join(encoded)
+    return data, offsets.astype(np.uint32) if len(data) <= np.iinfo(np.uint32).max else offsets
+
+
+class FindingBatch(Sequence):
+    """
+    Read-only columnar batch of findings.
+
+    Codes are an (findings x keys) array: 0 where a finding lacks the key,
+    otherwise 1 + the index of its value in the batch's table of distinct
+    values (strings first, packed; then any other values). Indexing returns
+    the finding as a FrozenFinding, slicing returns a batch sharing the table
+    and the code array, holding only the (start, stop) of its rows. The table
+    may hold values none of the batch's findings use (a slice of a scan-level
+    batch); only used values are decoded.
+    """
+    __slots__ = ('_keys', '_all_codes', '_start', '_stop', '_strings', '_offsets', '_objects')
+
+    def __init__(self, keys: Tuple[str, ...] = (), codes: Optional[np.ndarray] = None,
+                 strings: bytes = b'', offsets: Optional[np.ndarray] = None, objects: Tuple[Any, ...] = (),
+                 span: Optional[Tuple[int, int]] = None):
+        self._keys = tuple(keys)
+        self._all_codes = codes if codes is not None else np.zeros((0, len(self._keys)), dtype=np.uint8)
+        # Rows of _all_codes this batch holds; _start is None for all of them
+        self._start, self._stop = span if span is not None else (None, None)
+        self._strings = strings
+        self._offsets = offsets if offsets is not None else np.zeros(1, dtype=np.uint32)
+        self._objects = objects
+
+    @property
+    def _codes(self) -> np.ndarray:
+        """Codes of this batch's findings (a view for slices)."""
+        if self._start is None:
+            return self._all_codes
+        return self._all_codes[self._start:self._stop]
+
+    @classmethod
+    def from_dicts(cls, findings: Iterable[Dict[str, Any]]) -> 'FindingBatch':
+        """
+        Build a batch from finding dicts.
+
+        Args:
+            findings: Finding dicts as produced by the scanners
+
+        Returns:
+            FindingBatch holding the same findings
+        """
+        if isinstance(findings, FindingBatch):
+            return findings
+        columns: Dict[str, int] = {}
+        index_of: Dict[Any, int] = {}
+        values: List[Any] = []
+        rows: List[List[int]] = []
+        for finding in findings:
+            row = [0] * len(columns)
+            for key, value in finding.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = len(columns)
+                    row.append(0)
+                intern_key = _intern_key(value)
+                code = index_of.get(intern_key)
+                if code is None:
+                    values.append(value)
+                    code = index_of[intern_key] = len(values)
+                row[column] = code
+            rows.append(row)
+        width = len(columns)
+        for row in rows:
+            if len(row) < width:
+                row.extend([0] * (width - len(row)))
+        codes = np.array(rows, dtype=_code_dtype(len(values))).reshape(len(rows), width)
+        return cls._from_table(tuple(columns), values, codes)
+
+    @classmethod
+    def concat(cls, batches: Iterable[Any]) -> 'FindingBatch':
+        """
+        Join batches into one batch with a single table of distinct values.
+
+        Args:
+            batches: FindingBatches or lists of finding dicts
+
+        Returns:
+            FindingBatch holding their findings in order
+        """
+        batches = [cls.from_dicts(batch) for batch in batches]
+        columns: Dict[str, int] = {}
+        for batch in batches:
+            for key in batch._keys:
+                columns.setdefault(key, len(columns))
+        dtype = _code_dtype(sum(batch._table_size() for batch in batches))
+        codes = np.zeros((sum(len(batch) for batch in batches), len(columns)), dtype=dtype)
+        index_of: Dict[Any, int] = {}
+        values: List[Any] = []
+        start = 0
+        for batch in batches:
+            used = batch._used_codes()
+            remap = np.zeros(batch._table_size() + 1, dtype=dtype)
+            for code in used.tolist():
+                value = batch._value(code)
+                intern_key = _intern_key(value)
+                merged = index_of.get(intern_key)
+                if merged is None:
+                    values.append(value)
+                    merged = index_of[intern_key] = len(values)
+                remap[code] = merged
+            end = start + len(batch)
+            codes[start:end, [columns[key] for key in batch._keys]] = remap[batch._codes]
+            start = end
+        return cls._from_table(tuple(columns), values, codes)
+
+    @classmethod
+    def _from_table(cls, keys: Tuple[str, ...], values: List[Any], codes: np.ndarray) -> 'FindingBatch':
+        """Batch from codes into values (1-based, 0 where a key is missing)."""
+        # Renumber so that strings come first and can be packed
+        is_string = [type(value) is str for value in values]
+        order = [i for i, flag in enumerate(is_string) if flag] + [i for i, flag in enumerate(is_string) if not flag]
+        renumber = np.zeros(len(values) + 1, dtype=_code_dtype(len(values)))
+        renumber[np.array(order, dtype=np.int64) + 1] = np.arange(1, len(values) + 1)
+        codes = renumber[codes]
+
+        string_count = sum(is_string)
+        strings, offsets = _pack_strings([values[i] for i in order[:string_count]])
+        objects = tuple(values[i] for i in order[string_count:])
+        return cls(keys, codes, strings, offsets, objects)
+
+    @classmethod
+    def from_findings(cls, findings: Iterable[Finding]) -> 'FindingBatch':
+        """Build a batch from typed findings."""
+        return cls.from_dicts(finding.to_dict() for finding in findings)
+
+    def _table_size(self) -> int:
+        return len(self._offsets) - 1 + len(self._objects)
+
+    def _used_codes(self, codes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Distinct non-zero codes, ascending."""
+        used = np.unique(self._codes if codes is None else codes)
+        return used[used > 0]
+
+    def _lookup(self, codes: np.ndarray, default: Any = None) -> Dict[int, Any]:
+        """Decoded value of each code in `codes`, `default` for 0."""
+        lookup = {0: default}
+        for code in self._used_codes(codes).tolist():
+            lookup[code] = self._value(code)
+        return lookup
+
+    def _value(self, code: int) -> Any:
+        index = code - 1
+        if index < len(self._offsets) - 1:
+            start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+            return self._strings[start:end].decode('utf-8', 'surrogatepass')
+        return self._objects[index - len(self._offsets) + 1]
+
+    def __len__(self) -> int:
+        if self._start is None:
+            return self._all_codes.shape[0]
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.take(np.arange(start, stop, step))
+            offset = self._start or 0
+            return FindingBatch(self._keys, self._all_codes, self._strings, self._offsets, self._objects,
+                                (offset + start, offset + max(start, stop)))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('finding index out of range')
+        return FrozenFinding([(key, self._value(code))
+                              for key, code in zip(self._keys, self._codes[index].tolist()) if code])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._rows(FrozenFinding)
+
+    def _rows(self, factory) -> Iterator[Dict[str, Any]]:
+        keys = self._keys
+        table = self._lookup(self._codes)
+        for row in self._codes.tolist():
+            yield factory([(key, table[code]) for key, code in zip(keys, row) if code])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (FindingBatch, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FindingBatch({len(self)} findings, keys={list(self._keys)})"
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Finding dicts (plain, modifiable), for the UI and other dict consumers."""
+        return list(self._rows(dict))
+
+    def records(self) -> Iterator[Finding]:
+        """Typed findings."""
+        for finding in self:
+            yield Finding.from_dict(finding)
+
+    @property
+    def keys(self) -> List[str]:
+        """Keys present in at least one finding."""
+        return list(self._keys)
+
+    def take(self, indices) -> 'FindingBatch':
+        """Batch of the findings at `indices` (or where a boolean mask is set)."""
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        return FindingBatch(self._keys, self._codes[indices.astype(np.int64)], self._strings,
+                            self._offsets, self._objects)
+
+    def column(self, key: str, default: Any = None) -> List[Any]:
+        """All values of one key, `default` where a finding lacks it."""
+        if key not in self._keys:
+            return [default] * len(self)
+        codes = self._codes[:, self._keys.index(key)]
+        table = self._lookup(codes, default)
+        return [table[code] for code in codes.tolist()]
+
+    def rows(self, keys: Iterable[str], default: Any = None) -> List[Tuple[Any, ...]]:
+        """Tuples of the given keys per finding, read column by column."""
+        return list(zip(*(self.column(key, default) for key in keys))) if len(self) else []
+
+    def value_counts(self, key: str, default: Any = None) -> Dict[Any, int]:
+        """Count of each value of a key with hashable values; findings lacking it count as `default`."""
+        if key not in self._keys:
+            return {default: len(self)} if len(self) else {}
+        counts = np.bincount(self._codes[:, self._keys.index(key)])
+        result: Dict[Any, int] = {}
+        for code in np.flatnonzero(counts).tolist():
+            value = self._value(code) if code else default
+            result[value] = result.get(value, 0) + int(counts[code])
+        return result
+
+    def severities(self) -> np.ndarray:
+        """Severity per finding as uint8 (0 where unknown)."""
+        result = np.zeros(len(self), dtype=np.uint8)
+        present = [self._keys.index(key) for key in SEVERITY_KEYS if key in self._keys]
+        if not present:
+            return result
+        lookup = np.zeros(self._table_size() + 1, dtype=np.uint8)
+        for code in self._used_codes(self._codes[:, present]).tolist():
+            lookup[code] = Severity.parse(self._value(code)) or 0
+        # The first severity key a finding carries wins
+        for column in reversed(present):
+            severity = lookup[self._codes[:, column]]
+            result = np.where(severity > 0, severity, result)
+        return result
+
+    def severity_counts(self) -> Dict[Severity, int]:
+        """Count of findings per Severity."""
+        counts = np.bincount(self.severities(), minlength=len(Severity) + 1).tolist()
+        return {severity: counts[severity] for severity in Severity}
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the codes and value table."""
+        objects = sys.getsizeof(self._objects) + sum(sys.getsizeof(value) for value in self._objects)
+        return self._all_codes.nbytes + len(self._strings) + self._offsets.nbytes + objects
+
+    def compact(self) -> 'FindingBatch':
+        """The batch with a table of only the values its findings use."""
+        used = self._used_codes()
+        if len(used) == self._table_size():
+            return self
+        remap = np.zeros(self._table_size() + 1, dtype=_code_dtype(len(used)))
+        remap[used] = np.arange(1, len(used) + 1)
+        return FindingBatch._from_table(self._keys, [self._value(code) for code in used.tolist()],
+                                        remap[self._codes])
+
+    def _table_payload(self) -> Dict[str, Any]:
+        string_count = len(self._offsets) - 1
+        table = [self._value(code) for code in range(1, self._table_size() + 1)]
+        return {'keys': list(self._keys), 'strings': table[:string_count], 'objects': table[string_count:]}
+
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON-serialisable columnar form of the batch, with the values it uses."""
+        batch = self.compact()
+        payload = {PAYLOAD_MARKER: PAYLOAD_VERSION}
+        payload.update(batch._table_payload())
+        payload.update(_encode_codes(batch._codes))
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'FindingBatch':
+        """
+        Rebuild a batch from to_payload() output.
+
+        Raises:
+            ValueError: If the payload version is not supported
+        """
+        return cls._from_payload(payload, {})
+
+    @classmethod
+    def _from_payload(cls, payload: Dict[str, Any], tables: Dict[int, Tuple[Any, ...]]) -> 'FindingBatch':
+        if payload.get(PAYLOAD_MARKER) not in READABLE_PAYLOAD_VERSIONS:
+            raise ValueError(f"Unsupported finding batch payload version: {payload.get(PAYLOAD_MARKER)}")
+        if 'table_ref' in payload:
+            table = tables.get(payload['table_ref'])
+            if table is None:
+                raise ValueError(f"Finding batch refers to a table not in the document: {payload['table_ref']}")
+        else:
+            keys = tuple(payload['keys'])
+            strings, offsets = _pack_strings(payload['strings'])
+            base = _decode_codes(payload['base'], len(keys)) if 'base' in payload else None
+            table = (keys, strings, offsets, tuple(payload['objects']), base)
+            if 'table' in payload:
+                tables[payload['table']] = table
+        keys, strings, offsets, objects, base = table
+        if 'span' in payload:
+            return cls(keys, base, strings, offsets, objects, tuple(payload['span']))
+        keys = tuple(payload.get('keys', keys))
+        return cls(keys, _decode_codes(payload, len(keys)), strings, offsets, objects)
+
+    def __getstate__(self):
+        # Slices pickled together share their table and code array
+        return self._keys, self._all_codes, self._strings, self._offsets, self._objects, self._start, self._stop
+
+    def __setstate__(self, state) -> None:
+        if len(state) == 5:
+            state += (None, None)
+        self._keys, self._all_codes, self._strings, self._offsets, self._objects, self._start, self._stop = state
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps `default` hook writing batches as their columnar payload."""
+    if isinstance(value, FindingBatch):
+        return value.to_payload()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _count_tables(value: Any, counts: Dict[int, int]) -> None:
+    if isinstance(value, FindingBatch):
+        counts[id(value._offsets)] = counts.get(id(value._offsets), 0) + 1
+    elif isinstance(value, dict):
+        for item in value.values():
+            _count_tables(item, counts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _count_tables(item, counts)
+
+
+class _SharedTableWriter:
+    """
+    json.dumps `default` hook for one document: a value table shared by
+    several batches is written with the first of them and referred to by
+    number from the others. Slices of one code array are written as the
+    (start, stop) of their rows in it, the array once with the table.
+    """
+
+    def __init__(self, document: Any):
+        counts: Dict[int, int] = {}
+        _count_tables(document, counts)
+        self._shared = {table for table, count in counts.items() if count > 1}
+        # table id -> (number, keys, code array written with the table)
+        self._written: Dict[int, Tuple[int, Tuple[str, ...], Optional[np.ndarray]]] = {}
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, FindingBatch):
+            return json_default(value)
+        table = id(value._offsets)
+        if table not in self._shared:
+            return value.to_payload()
+        payload: Dict[str, Any] = {PAYLOAD_MARKER: PAYLOAD_VERSION}
+        written = self._written.get(table)
+        if written is None:
+            base = value._all_codes if value._start is not None else None
+            written = self._written[table] = (len(self._written), value._keys, base)
+            payload['table'] = written[0]
+            payload.update(value._table_payload())
+            if base is not None:
+                payload['base'] = _encode_codes(base)
+        else:
+            payload['table_ref'] = written[0]
+        number, keys, base = written
+        if value._start is not None and value._all_codes is base and value._keys == keys:
+            payload['span'] = [value._start, value._stop]
+        else:
+            payload['keys'] = list(value._keys)
+            payload.update(_encode_codes(value._codes))
+        return payload
+
+
+class _SharedTableReader:
+    """json.loads `object_hook` for one document, restoring shared tables."""
+
+    def __init__(self):
+        self._tables: Dict[int, Tuple[Any, ...]] = {}
+
+    def __call__(self, value: Dict[str, Any]) -> Any:
+        if PAYLOAD_MARKER in value:
+            return FindingBatch._from_payload(value, self._tables)
+        return value
+
+
+def json_export_default(value: Any) -> Any:
+    """
+    json.dumps `default` hook for user-facing exports: batches are written
+    as their finding dicts, anything else as str() (the exports' former
+    default=str).
+    """
+    if isinstance(value, FindingBatch):
+        return value.to_dicts()
+    return str(value)
+
+
+def json_object_hook(value: Dict[str, Any]) -> Any:
+    """json.loads `object_hook` turning columnar payloads back into batches."""
+    if PAYLOAD_MARKER in value:
+        return FindingBatch.from_payload(value)
+    return value
+
+
+def dumps(value: Any, **kwargs) -> str:
+    """json.dumps that writes finding batches compactly, each shared value table once."""
+    return json.dumps(value, default=_SharedTableWriter(value), **kwargs)
+
+
+def loads(data: str) -> Any:
+    """json.loads that restores finding batches and the tables they share."""
+    return json.loads(data, object_hook=_SharedTableReader())
+
+
+def merge_file_findings(file_results: List[Dict[str, Any]], key: str = 'pii_found') -> List[Dict[str, Any]]:
+    """
+    Give the file results of one scan slices of a single scan-level batch.
+
+    Each result's findings (a batch or a list of dicts) are replaced, in
+    place, by its slice of the concatenation; the slices share one value
+    table, so a value repeated across files is stored once per scan.
+
+    Args:
+        file_results: Per-file scan results
+        key: Key of the findings in each result
+
+    Returns:
+        file_results
+    """
+    merging = [result for result in file_results if isinstance(result.get(key), (FindingBatch, list))]
+    if not merging:
+        return file_results
+    batch = FindingBatch.concat(result[key] for result in merging)
+    start = 0
+    for result in merging:
+        end = start + len(result[key])
+        result[key] = batch[start:end]
+        start = end
+    return file_results
+
+
+def finding_rows(findings: Iterable[Dict[str, Any]], keys: Iterable[str],
+                 default: Any = None) -> List[Tuple[Any, ...]]:
+    """
+    Tuples of the given keys per finding, for report tables.
+
+    Reads a FindingBatch column by column; plain lists of dicts are read
+    finding by finding.
+    """
+    keys = tuple(keys)
+    if isinstance(findings, FindingBatch):
+        return findings.rows(keys, default)
+    return [tuple(finding.get(key, default) for key in keys) for finding in findings]
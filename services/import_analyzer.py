@@ -0,0 +1,249 @@
+"""
+Import Analyzer - In-Process Unused Import Detection
+
+AST-based replacement for running pyflakes as a subprocess. Python files are
+analysed across a process pool with no sampling, and results are cached per
+file content hash in a local SQLite database so unchanged files are not
+re-parsed on repeat scans. No network access or runtime package installation
+is ever needed.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the analysis logic changes so cached results are recomputed
+ANALYZER_VERSION = 1
+
+DEFAULT_CACHE_PATH = os.path.join("/tmp/repo_cache", "import_analysis.sqlite")
+
+# Files larger than this are almost always generated code
+MAX_FILE_SIZE_BYTES = 2 * 1024 * 1024
+
+# String constants that could be a forward-reference annotation
+_ANNOTATION_STRING = re.compile(r'^[\w.\[\], |]+$')
+
+# Below this many uncached files a process pool costs more than it saves
+MIN_FILES_FOR_POOL = 32
+
+
+class _ImportUsageVisitor(ast.NodeVisitor):
+    """Collect import bindings and every name that is read."""
+
+    def __init__(self):
+        self.imports: List[Tuple[str, str, int]] = []  # (bound name, display name, line)
+        self.used_names: Set[str] = set()
+        self.exported_names: Set[str] = set()
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self.imports.append((alias.asname, f"{alias.name} as {alias.asname}", node.lineno))
+            else:
+                # `import os.path` binds `os`
+                self.imports.append((alias.name.split('.')[0], alias.name, node.lineno))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module == '__future__':
+            return
+        module = '.' * node.level + (node.module or '')
+        for alias in node.names:
+            if alias.name == '*':
+                continue
+            bound = alias.asname or alias.name
+            display = f"{module}.{alias.name}" if node.module else f"{module}{alias.name}"
+            if alias.asname:
+                display += f" as {alias.asname}"
+            self.imports.append((bound, display, node.lineno))
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.used_names.add(node.id)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == '__all__':
+                self._collect_exports(node.value)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        if isinstance(node.target, ast.Name) and node.target.id == '__all__':
+            self._collect_exports(node.value)
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        # String annotations ("Optional[Foo]") and typing.cast targets
+        if isinstance(node.value, str) and len(node.value) <= 200 and _ANNOTATION_STRING.match(node.value):
+            try:
+                expr = ast.parse(node.value, mode='eval')
+            except SyntaxError:
+                return
+            for child in ast.walk(expr):
+                if isinstance(child, ast.Name):
+                    self.used_names.add(child.id)
+
+    def _collect_exports(self, value: ast.AST) -> None:
+        if isinstance(value, (ast.List, ast.Tuple)):
+            for element in value.elts:
+                if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                    self.exported_names.add(element.value)
+
+
+def analyze_source(source: str) -> List[Dict[str, Any]]:
+    """
+    Find unused imports in Python source.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        List of {'line', 'import', 'message'} dicts in pyflakes message format.
+        Files that do not parse yield no results.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    visitor = _ImportUsageVisitor()
+    visitor.visit(tree)
+    referenced = visitor.used_names | visitor.exported_names
+
+    results = []
+    seen: Set[Tuple[str, int]] = set()
+    for bound, display, line in visitor.imports:
+        if bound in referenced or (bound, line) in seen:
+            continue
+        seen.add((bound, line))
+        results.append({
+            'line': line,
+            'import': display,
+            'message': f"'{display}' imported but unused"
+        })
+    return results
+
+
+def _analyze_task(task: Tuple[str, str]) -> Tuple[str, List[Dict[str, Any]]]:
+    """Process pool task: (content hash, source) -> (content hash, results)."""
+    content_hash, source = task
+    return content_hash, analyze_source(source)
+
+
+class ImportAnalysisCache:
+    """SQLite cache of analysis results keyed by file content hash."""
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS import_analysis ("
+                    "content_hash TEXT PRIMARY KEY, version INTEGER NOT NULL, results TEXT NOT NULL)"
+                )
+                self._conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Import analysis cache disabled ({db_path}): {e}")
+                self._conn = None
+
+    def get_many(self, content_hashes: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return cached results for the given hashes."""
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        if self._conn is None or not content_hashes:
+            return found
+        with self._lock:
+            for start in range(0, len(content_hashes), 500):
+                chunk = content_hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT content_hash, results FROM import_analysis "
+                    f"WHERE version = ? AND content_hash IN ({placeholders})",
+                    [ANALYZER_VERSION, *chunk]
+                ).fetchall()
+                for content_hash, results in rows:
+                    found[content_hash] = json.loads(results)
+        return found
+
+    def put_many(self, entries: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Store results for the given hashes."""
+        if self._conn is None or not entries:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO import_analysis (content_hash, version, results) VALUES (?, ?, ?)",
+                [(h, ANALYZER_VERSION, json.dumps(r)) for h, r in entries.items()]
+            )
+            self._conn.commit()
+
+
+def find_unused_imports(file_paths: List[str], base_dir: Optional[str] = None,
+                        max_workers: Optional[int] = None,
+                        cache: Optional[ImportAnalysisCache] = None) -> List[Dict[str, Any]]:
+    """
+    Find unused imports in every given Python file.
+
+    Args:
+        file_paths: Python files to analyse (all of them, no sampling)
+        base_dir: If given, reported paths are relative to it
+        max_workers: Process pool size (defaults to the CPU count)
+        cache: Result cache; defaults to the shared on-disk cache
+
+    Returns:
+        List of {'file', 'line', 'import', 'message'} dicts ordered by file
+    """
+    if cache is None:
+        cache = ImportAnalysisCache()
+
+    hashes: List[Tuple[str, str]] = []  # (file path, content hash)
+    pending: Dict[str, str] = {}
+    for file_path in file_paths:
+        try:
+            if os.path.getsize(file_path) > MAX_FILE_SIZE_BYTES:
+                continue
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            logger.warning(f"Error reading {file_path}: {str(e)}")
+            continue
+        content_hash = hashlib.sha256(raw).hexdigest()
+        hashes.append((file_path, content_hash))
+        if content_hash not in pending:
+            pending[content_hash] = raw.decode('utf-8', errors='replace')
+
+    results_by_hash = cache.get_many(list(pending))
+    tasks = [(h, source) for h, source in pending.items() if h not in results_by_hash]
+
+    computed: Dict[str, List[Dict[str, Any]]] = {}
+    workers = max_workers or os.cpu_count() or 1
+    if len(tasks) >= MIN_FILES_FOR_POOL and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(tasks) // (workers * 8))
+                computed.update(executor.map(_analyze_task, tasks, chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Import analysis pool unavailable, analysing serially: {e}")
+    for task in tasks:
+        if task[0] not in computed:
+            computed[task[0]] = analyze_source(task[1])
+
+    cache.put_many(computed)
+    results_by_hash.update(computed)
+
+    unused_imports = []
+    for file_path, content_hash in hashes:
+        display_path = os.path.relpath(file_path, base_dir) if base_dir else file_path
+        for result in results_by_hash.get(content_hash, []):
+            unused_imports.append({'file': display_path, **result})
+    return unused_imports
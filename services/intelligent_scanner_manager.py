@@ -22,11 +22,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable, Union
 import uuid
 
-from services.intelligent_repo_scanner import IntelligentRepoScanner
-from services.intelligent_blob_scanner import IntelligentBlobScanner
-from services.intelligent_image_scanner import IntelligentImageScanner
-from services.intelligent_website_scanner import IntelligentWebsiteScanner
-from services.intelligent_db_scanner import IntelligentDBScanner
+from services.scanner_registry import create_scanner
 
 logger = logging.getLogger("services.intelligent_scanner_manager")
 
@@ -220,10 +216,8 @@ class IntelligentScannerManager:
                                    progress_callback: Optional[Callable],
                                    **kwargs) -> Dict[str, Any]:
         """Intelligent repository scanning."""
-        from services.code_scanner import CodeScanner
-        
-        code_scanner = CodeScanner()
-        intelligent_scanner = IntelligentRepoScanner(code_scanner)
+        code_scanner = create_scanner('code')
+        intelligent_scanner = create_scanner('intelligent_repo', code_scanner)
         
         return intelligent_scanner.scan_repository_intelligent(
             repo_url, kwargs.get('branch'), scan_mode, max_files, progress_callback
@@ -234,10 +228,8 @@ class IntelligentScannerManager:
                                   progress_callback: Optional[Callable],
                                   **kwargs) -> Dict[str, Any]:
         """Intelligent document scanning."""
-        from services.blob_scanner import BlobScanner
-        
-        blob_scanner = BlobScanner()
-        intelligent_scanner = IntelligentBlobScanner(blob_scanner)
+        blob_scanner = create_scanner('blob')
+        intelligent_scanner = create_scanner('intelligent_blob', blob_scanner)
         
         return intelligent_scanner.scan_documents_intelligent(
             file_paths, scan_mode, max_files, progress_callback
@@ -248,10 +240,8 @@ class IntelligentScannerManager:
                                progress_callback: Optional[Callable],
                                **kwargs) -> Dict[str, Any]:
         """Intelligent image scanning."""
-        from services.image_scanner import ImageScanner
-        
-        image_scanner = ImageScanner()
-        intelligent_scanner = IntelligentImageScanner(image_scanner)
+        image_scanner = create_scanner('image')
+        intelligent_scanner = create_scanner('intelligent_image', image_scanner)
         
         return intelligent_scanner.scan_images_intelligent(
             image_paths, scan_mode, max_files, progress_callback
@@ -262,10 +252,8 @@ class IntelligentScannerManager:
                                 progress_callback: Optional[Callable],
                                 **kwargs) -> Dict[str, Any]:
         """Intelligent website scanning."""
-        from services.website_scanner import WebsiteScanner
-        
-        website_scanner = WebsiteScanner()
-        intelligent_scanner = IntelligentWebsiteScanner(website_scanner)
+        website_scanner = create_scanner('website')
+        intelligent_scanner = create_scanner('intelligent_website', website_scanner)
         
         return intelligent_scanner.scan_website_intelligent(
             base_url, scan_mode, max_pages, kwargs.get('max_depth'), progress_callback
@@ -276,10 +264,8 @@ class IntelligentScannerManager:
                                  progress_callback: Optional[Callable],
                                  **kwargs) -> Dict[str, Any]:
         """Intelligent database scanning."""
-        from services.db_scanner import DBScanner
-        
-        db_scanner = DBScanner()
-        intelligent_scanner = IntelligentDBScanner(db_scanner)
+        db_scanner = create_scanner('database')
+        intelligent_scanner = create_scanner('intelligent_db', db_scanner)
         
         return intelligent_scanner.scan_database_intelligent(
             connection_params, scan_mode, max_tables, progress_callback
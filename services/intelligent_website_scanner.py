@@ -24,9 +24,10 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable, Set
 from urllib.parse import urlparse, urljoin
 import uuid
-import requests
 from collections import deque
 
+from services.site_scan_context import SiteScanContext
+
 logger = logging.getLogger("services.intelligent_website_scanner")
 
 class IntelligentWebsiteScanner:
@@ -134,9 +135,13 @@ class IntelligentWebsiteScanner:
             'status': 'completed'
         }
         
+        # Session, robots rules, sitemap and site checks shared by all page workers
+        context = SiteScanContext(base_url, self.website_scanner,
+                                  pool_size=self.PARALLEL_WORKERS, timeout=self.REQUEST_TIMEOUT)
+        
         try:
             # Step 1: Initial site analysis
-            site_analysis = self._analyze_website_structure(base_url)
+            site_analysis = self._analyze_website_structure(base_url, context)
             
             # Step 2: Select crawling strategy
             strategy = self._select_crawling_strategy(site_analysis, scan_mode, max_pages, max_depth)
@@ -146,12 +151,15 @@ class IntelligentWebsiteScanner:
                 progress_callback(10, 100, "Website analyzed, starting intelligent crawl...")
             
             # Step 3: Discover and prioritize pages
-            pages_to_scan = self._discover_pages_intelligent(base_url, strategy)
+            pages_to_scan = self._discover_pages_intelligent(base_url, strategy, context)
             scan_results['pages_discovered'] = len(pages_to_scan)
             
+            # Site-level checks run once, not per page
+            scan_results['site_checks'] = context.site_checks()
+            
             # Step 4: Scan pages in parallel
             findings, metrics, all_cookies, all_trackers = self._scan_pages_parallel(
-                pages_to_scan, scan_results, progress_callback
+                pages_to_scan, scan_results, progress_callback, context
             )
             
             scan_results['findings'] = findings
@@ -213,10 +221,12 @@ class IntelligentWebsiteScanner:
             logger.error(f"Intelligent website scan failed: {str(e)}")
             scan_results['status'] = 'failed'
             scan_results['error'] = str(e)
+        finally:
+            context.close()
         
         return scan_results
 
-    def _analyze_website_structure(self, base_url: str) -> Dict[str, Any]:
+    def _analyze_website_structure(self, base_url: str, context: SiteScanContext) -> Dict[str, Any]:
         """Analyze website structure to determine optimal crawling strategy."""
         analysis = {
             'base_domain': urlparse(base_url).netloc,
@@ -231,35 +241,22 @@ class IntelligentWebsiteScanner:
         try:
             # Test basic connectivity and response time
             start_time = time.time()
-            response = requests.get(base_url, timeout=self.REQUEST_TIMEOUT)
+            # Kept in the context so the page scan does not fetch it again
+            response = context.fetch(base_url, keep=True)
             analysis['response_time'] = time.time() - start_time
             analysis['accessible'] = response.status_code == 200
             
             if analysis['accessible']:
-                # Check for sitemap
-                sitemap_urls = [
-                    urljoin(base_url, '/sitemap.xml'),
-                    urljoin(base_url, '/sitemap_index.xml'),
-                    urljoin(base_url, '/sitemaps.xml')
-                ]
-                
-                for sitemap_url in sitemap_urls:
-                    try:
-                        sitemap_response = requests.get(sitemap_url, timeout=5)
-                        if sitemap_response.status_code == 200:
-                            analysis['has_sitemap'] = True
-                            # Rough estimate of pages from sitemap
-                            analysis['estimated_pages'] = sitemap_response.text.count('<url>')
-                            break
-                    except:
-                        continue
+                # Check for sitemap (fetched once, reused for page discovery)
+                sitemap = context.sitemap()
+                if sitemap:
+                    analysis['has_sitemap'] = True
+                    # Rough estimate of pages from sitemap
+                    analysis['estimated_pages'] = sitemap[1].count('<url>')
                 
                 # Check robots.txt
-                try:
-                    robots_response = requests.get(urljoin(base_url, '/robots.txt'), timeout=5)
-                    analysis['has_robots_txt'] = robots_response.status_code == 200
-                except:
-                    pass
+                context.robots()
+                analysis['has_robots_txt'] = context.has_robots_txt
                 
                 # If no sitemap, estimate based on main page links
                 if not analysis['has_sitemap']:
@@ -325,7 +322,8 @@ class IntelligentWebsiteScanner:
             'reasoning': f"Selected {strategy_type} for ~{estimated_pages} pages with {response_time:.1f}s response time"
         }
 
-    def _discover_pages_intelligent(self, base_url: str, strategy: Dict[str, Any]) -> List[str]:
+    def _discover_pages_intelligent(self, base_url: str, strategy: Dict[str, Any],
+                                    context: SiteScanContext) -> List[str]:
         """Discover and prioritize pages for scanning."""
         
         discovered_pages = set()
@@ -336,17 +334,19 @@ class IntelligentWebsiteScanner:
         
         # Use sitemap if available and strategy allows
         if strategy['use_sitemap']:
-            sitemap_pages = self._extract_sitemap_urls(base_url)
+            sitemap_pages = self._extract_sitemap_urls(base_url, context)
             discovered_pages.update(sitemap_pages)
         
         # Crawl from base page to discover more
         additional_pages = self._crawl_for_links(
-            base_url, strategy['max_depth'], strategy['target_pages'] * 2
+            base_url, strategy['max_depth'], strategy['target_pages'] * 2, context
         )
         discovered_pages.update(additional_pages)
         
-        # Prioritize discovered pages
+        # Prioritize discovered pages, leaving out those robots.txt disallows
         for page_url in discovered_pages:
+            if page_url != base_url and not context.allowed(page_url):
+                continue
             priority = self._calculate_page_priority(page_url)
             prioritized_pages.append((page_url, priority))
         
@@ -414,7 +414,8 @@ class IntelligentWebsiteScanner:
         
         return max(priority, 0.1)  # Minimum priority
 
-    def _crawl_for_links(self, base_url: str, max_depth: int, max_links: int) -> Set[str]:
+    def _crawl_for_links(self, base_url: str, max_depth: int, max_links: int,
+                         context: SiteScanContext) -> Set[str]:
         """Crawl website to discover additional links."""
         from collections import deque
         from typing import Tuple
@@ -432,9 +433,12 @@ class IntelligentWebsiteScanner:
                 continue
             
             crawled.add(current_url)
+            if current_url != base_url and not context.allowed(current_url):
+                continue
             
             try:
-                response = requests.get(current_url, timeout=self.REQUEST_TIMEOUT)
+                # Kept in the context for the page worker that scans this URL
+                response = context.fetch(current_url, keep=True)
                 if response.status_code == 200:
                     from bs4 import BeautifulSoup
                     soup = BeautifulSoup(response.content, 'html.parser')
@@ -470,32 +474,15 @@ class IntelligentWebsiteScanner:
         except:
             return False
 
-    def _extract_sitemap_urls(self, base_url: str) -> Set[str]:
+    def _extract_sitemap_urls(self, base_url: str, context: SiteScanContext) -> Set[str]:
         """Extract URLs from sitemap."""
-        urls = set()
-        sitemap_urls = [
-            urljoin(base_url, '/sitemap.xml'),
-            urljoin(base_url, '/sitemap_index.xml')
-        ]
-        
-        for sitemap_url in sitemap_urls:
-            try:
-                response = requests.get(sitemap_url, timeout=10)
-                if response.status_code == 200:
-                    # Simple XML parsing for URLs
-                    import re
-                    url_pattern = r'<loc>(.*?)</loc>'
-                    found_urls = re.findall(url_pattern, response.text)
-                    urls.update(found_urls[:100])  # Limit to first 100 URLs
-                    break
-            except Exception as e:
-                logger.warning(f"Error fetching sitemap {sitemap_url}: {str(e)}")
-        
-        return urls
+        # The sitemap was fetched once by the context during site analysis
+        return set(context.sitemap_urls())  # First 100 URLs
 
     def _scan_pages_parallel(self, pages_to_scan: List[str],
                            scan_results: Dict[str, Any],
-                           progress_callback: Optional[Callable]) -> tuple:
+                           progress_callback: Optional[Callable],
+                           context: SiteScanContext) -> tuple:
         """Scan pages in parallel with progress tracking."""
         
         all_findings = []
@@ -511,7 +498,7 @@ class IntelligentWebsiteScanner:
         with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
             # Submit all page scanning tasks
             future_to_page = {
-                executor.submit(self._scan_single_page, page_url): page_url
+                executor.submit(self._scan_single_page, page_url, context): page_url
                 for page_url in pages_to_scan
             }
             
@@ -558,17 +545,11 @@ class IntelligentWebsiteScanner:
         
         return all_findings, metrics, all_cookies, all_trackers
 
-    def _scan_single_page(self, page_url: str) -> Optional[tuple]:
+    def _scan_single_page(self, page_url: str, context: SiteScanContext) -> Optional[tuple]:
         """Scan a single page for privacy compliance issues."""
         try:
-            # Import WebsiteScanner and create a temporary scanner for single page analysis
-            from services.website_scanner import WebsiteScanner
-            temp_scanner = WebsiteScanner(region=self.website_scanner.region)
-            temp_scanner.max_pages = 1
-            temp_scanner.max_depth = 1
-            
-            # Use the existing website scanner's scan_website method for single page
-            result = temp_scanner.scan_website(page_url, follow_links=False)
+            # Fetch and parse only; session, databases and site checks are shared
+            result = context.analyze_page(page_url)
             
             # Extract findings, cookies, and trackers from result
             findings = []
@@ -30,7 +30,7 @@ from services.license_manager import (
 )
 from config.pricing_config import get_pricing_config, PricingTier, BillingCycle
 from services.usage_analytics import (
-    UsageAnalytics, UsageEventType, track_usage_event, 
+    UsageEventType, usage_analytics, track_usage_event, 
     get_usage_stats, get_compliance_report
 )
 from utils.activity_tracker import ScannerType
@@ -42,7 +42,8 @@ class LicenseIntegration:
     
     def __init__(self):
         self.license_manager = LicenseManager()
-        self.usage_analytics = UsageAnalytics()
+        # Shared instance: one background writer per database file
+        self.usage_analytics = usage_analytics
     
     def get_usage_summary(self) -> Dict[str, Any]:
         """Get usage summary for the Downloads section"""
@@ -73,8 +74,9 @@ class LicenseIntegration:
                 self.show_license_upgrade_prompt()
                 return False
             
-            # Track application start
-            if 'user_id' in st.session_state:
+            # Track application start once per session, not on every rerun
+            if 'user_id' in st.session_state and not st.session_state.get('_license_start_tracked'):
+                st.session_state['_license_start_tracked'] = True
                 track_usage_event(
                     event_type=UsageEventType.USER_LOGIN,
                     user_id=st.session_state['user_id'],
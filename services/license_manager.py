@@ -24,9 +24,12 @@ License Manager for DataGuardian Pro
 Comprehensive licensing and usage control system
 """
 
+import atexit
 import os
 import json
 import hashlib
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -36,8 +39,13 @@ import logging
 from cryptography.fernet import Fernet
 import base64
 
+from services.usage_meter import UsageMeter, get_usage_meter, period_bucket
+
 logger = logging.getLogger(__name__)
 
+# How often metered usage is written back into the license file
+USAGE_RECONCILE_INTERVAL_SECONDS = int(os.environ.get('DG_USAGE_RECONCILE_SECONDS', '60'))
+
 class LicenseType(Enum):
     """License types aligned with pricing tiers"""
     TRIAL = "trial"
@@ -104,6 +112,11 @@ class LicenseManager:
         self.current_license: Optional[LicenseConfig] = None
         self.usage_tracker: Dict[str, Any] = {}
         self.session_tracker: Dict[str, datetime] = {}
+        self._usage_meter: Optional[UsageMeter] = None
+        self._seeded_buckets: set = set()
+        self._usage_dirty = False
+        self._last_usage_reconcile = time.monotonic()
+        self._reconcile_lock = threading.Lock()
         
         # Generate or load encryption key only if encryption is enabled
         if self.encrypt_license:
@@ -591,6 +604,31 @@ class LicenseManager:
         
         return region in self.current_license.allowed_regions
     
+    @property
+    def usage_meter(self) -> UsageMeter:
+        if self._usage_meter is None:
+            self._usage_meter = get_usage_meter()
+        return self._usage_meter
+    
+    def _find_limit(self, limit_type: UsageLimitType) -> Optional[UsageLimit]:
+        for limit in self.current_license.usage_limits:
+            if limit.limit_type == limit_type:
+                return limit
+        return None
+    
+    def _usage_bucket(self, limit: UsageLimit) -> Tuple[str, int]:
+        """Meter bucket of the limit's current period; a new period starts from zero"""
+        bucket, ttl = period_bucket(limit.reset_period)
+        key = (self.current_license.license_id, limit.limit_type.value, bucket)
+        if key not in self._seeded_buckets:
+            # Carry over usage saved in the license file for the same period
+            if limit.current_usage and limit.last_reset and \
+                    period_bucket(limit.reset_period, limit.last_reset)[0] == bucket:
+                self.usage_meter.seed(self.current_license.license_id, bucket,
+                                      {limit.limit_type.value: limit.current_usage}, ttl)
+            self._seeded_buckets.add(key)
+        return bucket, ttl
+    
     def check_usage_limit(self, limit_type: UsageLimitType) -> Tuple[bool, int, int]:
         """Check usage limit - returns (allowed, current, limit)"""
         if not self.current_license:
@@ -600,52 +638,96 @@ class LicenseManager:
         if not is_valid:
             return False, 0, 0
         
-        # Find the limit
-        for limit in self.current_license.usage_limits:
-            if limit.limit_type == limit_type:
-                # Check if reset is needed
-                self._check_reset_usage(limit)
-                return limit.current_usage < limit.limit_value, limit.current_usage, limit.limit_value
+        limit = self._find_limit(limit_type)
+        if limit is None:
+            return True, 0, 999999  # No limit set
         
-        return True, 0, 999999  # No limit set
+        self._check_reset_usage(limit)
+        return limit.current_usage < limit.limit_value, limit.current_usage, limit.limit_value
     
     def _check_reset_usage(self, limit: UsageLimit):
-        """Check if usage should be reset based on period"""
-        if not limit.last_reset:
-            limit.last_reset = datetime.now()
+        """Refresh the limit's usage from the meter (period resets follow from the bucket)"""
+        try:
+            bucket, _ = self._usage_bucket(limit)
+            current = self.usage_meter.counts(self.current_license.license_id, bucket).get(
+                limit.limit_type.value, 0)
+        except Exception as e:
+            logger.error(f"Failed to read usage counter {limit.limit_type.value}: {e}")
             return
+        if current < limit.current_usage or limit.last_reset is None:
+            # New period (or first use): the stored count belongs to an earlier one
+            limit.last_reset = datetime.now()
+        limit.current_usage = current
+    
+    def consume_usage(self, limit_type: UsageLimitType, amount: int = 1) -> Tuple[bool, int, int]:
+        """
+        Check and increment usage in one atomic step - returns (allowed, current, limit).
+        Nothing is counted when the increment would exceed the limit.
+        """
+        if not self.current_license:
+            return False, 0, 0
         
-        now = datetime.now()
-        should_reset = False
-        
-        if limit.reset_period == "daily":
-            should_reset = now.date() > limit.last_reset.date()
-        elif limit.reset_period == "weekly":
-            should_reset = now.isocalendar()[1] > limit.last_reset.isocalendar()[1]
-        elif limit.reset_period == "monthly":
-            should_reset = now.month > limit.last_reset.month or now.year > limit.last_reset.year
-        elif limit.reset_period == "yearly":
-            should_reset = now.year > limit.last_reset.year
+        limit = self._find_limit(limit_type)
+        if limit is None:
+            return True, 0, 999999  # No limit set
         
-        if should_reset:
-            limit.current_usage = 0
-            limit.last_reset = now
-            if self.current_license:
-                self.save_license(self.current_license)
+        bucket, ttl = self._usage_bucket(limit)
+        allowed, current = self.usage_meter.consume(
+            self.current_license.license_id, bucket, (limit_type.value,),
+            amount=amount, limit=limit.limit_value, ttl=ttl
+        )
+        if allowed:
+            limit.current_usage = current
+            self._usage_dirty = True
+            self._maybe_reconcile_usage()
+        return allowed, current, limit.limit_value
     
     def increment_usage(self, limit_type: UsageLimitType, amount: int = 1) -> bool:
         """Increment usage counter"""
         if not self.current_license:
             return False
         
-        for limit in self.current_license.usage_limits:
-            if limit.limit_type == limit_type:
-                limit.current_usage += amount
-                if self.current_license:
-                    self.save_license(self.current_license)
-                return True
+        limit = self._find_limit(limit_type)
+        if limit is None:
+            return True  # No limit set
         
-        return True  # No limit set
+        try:
+            bucket, ttl = self._usage_bucket(limit)
+            _, limit.current_usage = self.usage_meter.consume(
+                self.current_license.license_id, bucket, (limit_type.value,), amount=amount, ttl=ttl
+            )
+        except Exception as e:
+            logger.error(f"Failed to increment usage counter {limit_type.value}: {e}")
+            return False
+        self._usage_dirty = True
+        self._maybe_reconcile_usage()
+        return True
+    
+    def _maybe_reconcile_usage(self):
+        if time.monotonic() - self._last_usage_reconcile >= USAGE_RECONCILE_INTERVAL_SECONDS:
+            self.reconcile_usage()
+    
+    def reconcile_usage(self) -> bool:
+        """Write metered usage back into the license file (one save for all limits)"""
+        with self._reconcile_lock:
+            self._last_usage_reconcile = time.monotonic()
+            if not self.current_license or not self._usage_dirty:
+                return True
+            self._usage_dirty = False
+            for limit in self.current_license.usage_limits:
+                self._check_reset_usage(limit)
+            if self.save_license(self.current_license):
+                return True
+            self._usage_dirty = True
+            return False
+    
+    def reset_usage(self, limit: UsageLimit):
+        """Reset a limit's usage for its current period"""
+        if self.current_license:
+            bucket, _ = self._usage_bucket(limit)
+            self.usage_meter.reset(self.current_license.license_id, bucket, [limit.limit_type.value])
+        limit.current_usage = 0
+        limit.last_reset = datetime.now()
     
     def get_license_info(self) -> Dict[str, Any]:
         """Get license information"""
@@ -705,6 +787,7 @@ class LicenseManager:
 
 # Global license manager instance
 license_manager = LicenseManager()
+atexit.register(license_manager.reconcile_usage)
 
 # Convenience functions
 def check_license() -> Tuple[bool, str]:
@@ -731,6 +814,10 @@ def increment_usage(limit_type: UsageLimitType, amount: int = 1) -> bool:
     """Increment usage counter"""
     return license_manager.increment_usage(limit_type, amount)
 
+def consume_usage(limit_type: UsageLimitType, amount: int = 1) -> Tuple[bool, int, int]:
+    """Atomically check and increment usage"""
+    return license_manager.consume_usage(limit_type, amount)
+
 def get_license_info() -> Dict[str, Any]:
     """Get license information"""
     return license_manager.get_license_info()
@@ -885,8 +972,7 @@ def reset_monthly_usage(subscription_id: str) -> bool:
         # Reset monthly usage counters
         for limit in current_license.usage_limits:
             if limit.reset_period == "monthly":
-                limit.current_usage = 0
-                limit.last_reset = datetime.now()
+                license_manager.reset_usage(limit)
         
         # Save updated license
         success = license_manager.save_license(current_license)
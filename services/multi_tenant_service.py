@@ -12,6 +12,12 @@ from typing import Dict, Any, Optional, List, Set
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from .schema_migrations import ensure_schema
+except ImportError:
+    # Fallback for direct execution
+    from schema_migrations import ensure_schema
+
 logger = logging.getLogger(__name__)
 
 class TenantTier(Enum):
@@ -74,166 +80,28 @@ class MultiTenantService:
         logger.info("Multi-tenant service initialized with organization isolation")
     
     def _init_tenant_schema(self) -> None:
-        """Initialize database schema for multi-tenancy."""
-        try:
-            conn = psycopg2.connect(self.db_url, sslmode='require')
-            cursor = conn.cursor()
-            
-            # Create tenants table for organization management
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tenants (
-                organization_id VARCHAR(255) PRIMARY KEY,
-                organization_name VARCHAR(500) NOT NULL,
-                tier VARCHAR(50) NOT NULL,
-                max_users INTEGER DEFAULT 10,
-                max_scans_per_month INTEGER DEFAULT 100,
-                max_storage_gb INTEGER DEFAULT 10,
-                features JSONB DEFAULT '[]'::jsonb,
-                compliance_regions JSONB DEFAULT '["EU"]'::jsonb,
-                data_residency VARCHAR(100) DEFAULT 'EU',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                metadata JSONB DEFAULT '{}'::jsonb,
-                status VARCHAR(50) DEFAULT 'active'
-            )
-            """)
-            
-            # Create tenant usage tracking table
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tenant_usage (
-                organization_id VARCHAR(255) PRIMARY KEY,
-                current_users INTEGER DEFAULT 0,
-                scans_this_month INTEGER DEFAULT 0,
-                storage_used_gb DECIMAL(10,2) DEFAULT 0.0,
-                last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                compliance_score DECIMAL(5,2) DEFAULT 0.0,
-                monthly_reset_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (organization_id) REFERENCES tenants(organization_id) ON DELETE CASCADE
-            )
-            """)
-            
-            # Add organization_id to existing tables for tenant isolation
-            try:
-                cursor.execute("""
-                ALTER TABLE scans ADD COLUMN IF NOT EXISTS organization_id VARCHAR(255) DEFAULT 'default_org';
-                """)
-                
-                cursor.execute("""
-                ALTER TABLE audit_log ADD COLUMN IF NOT EXISTS organization_id VARCHAR(255) DEFAULT 'default_org';
-                """)
-                
-                # Create indexes for performance
-                cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_scans_org_id ON scans(organization_id);
-                """)
-                
-                cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_audit_org_id ON audit_log(organization_id);
-                """)
-                
-            except psycopg2.Error as e:
-                # Columns might already exist
-                logger.info(f"Tenant isolation columns may already exist: {str(e)}")
-            
-            # Initialize Row Level Security (RLS) for tenant isolation
-            # Allow disabling RLS for production deployments via environment variable
-            if os.getenv("DISABLE_RLS") != "1":
-                self._init_row_level_security(cursor)
-            else:
-                logger.warning("RLS DISABLED via DISABLE_RLS environment variable - tenant isolation not enforced")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
-            logger.info("Multi-tenant database schema initialized successfully with RLS")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize tenant schema: {str(e)}")
-            raise RuntimeError(f"Multi-tenant schema initialization failed: {str(e)}")
-    
-    def _init_row_level_security(self, cursor) -> None:
         """
-        Initialize Row Level Security (RLS) for tenant isolation.
+        Ensure the multi-tenancy schema is current.
         
-        Implements database-level security policies to prevent cross-tenant data access.
+        Tenant tables, tenant columns and Row Level Security policies are
+        versioned migrations (database/migrations 0002 and 0003); RLS stays
+        pending while DISABLE_RLS=1.
+        
+        A migration failure is logged and the service runs on the existing
+        schema; set DG_REQUIRE_TENANT_SCHEMA=1 to fail instead.
+        
+        Raises:
+            RuntimeError: If the migrations fail and DG_REQUIRE_TENANT_SCHEMA=1
         """
+        if os.getenv("DISABLE_RLS") == "1":
+            logger.warning("RLS DISABLED via DISABLE_RLS environment variable - tenant isolation not enforced")
         try:
-            logger.info("Initializing Row Level Security for tenant isolation")
-            
-            # Enable RLS on scans table
-            cursor.execute("ALTER TABLE scans ENABLE ROW LEVEL SECURITY;")
-            
-            # Enable RLS on audit_log table  
-            cursor.execute("ALTER TABLE audit_log ENABLE ROW LEVEL SECURITY;")
-            
-            # Drop existing policies if they exist (for idempotency)
-            cursor.execute("DROP POLICY IF EXISTS tenant_isolation_scans ON scans;")
-            cursor.execute("DROP POLICY IF EXISTS tenant_isolation_audit_log ON audit_log;")
-            
-            # Create RLS policies for tenant isolation (idempotent)
-            # Users can only access scans from their organization
-            cursor.execute("""
-            DO $$ 
-            BEGIN
-                IF NOT EXISTS (SELECT 1 FROM pg_policies WHERE tablename = 'scans' AND policyname = 'tenant_isolation_scans') THEN
-                    CREATE POLICY tenant_isolation_scans ON scans
-                    FOR ALL
-                    TO PUBLIC
-                    USING (organization_id = current_setting('app.current_organization_id', true));
-                END IF;
-            END $$;
-            """)
-            
-            # Users can only access audit logs from their organization
-            cursor.execute("""
-            DO $$ 
-            BEGIN
-                IF NOT EXISTS (SELECT 1 FROM pg_policies WHERE tablename = 'audit_log' AND policyname = 'tenant_isolation_audit_log') THEN
-                    CREATE POLICY tenant_isolation_audit_log ON audit_log
-                    FOR ALL
-                    TO PUBLIC
-                    USING (organization_id = current_setting('app.current_organization_id', true));
-                END IF;
-            END $$;
-            """)
-            
-            # Create administrative bypass policies for system operations (idempotent)
-            # These allow operations when no organization context is set (for admin tasks)
-            cursor.execute("""
-            DO $$ 
-            BEGIN
-                IF NOT EXISTS (SELECT 1 FROM pg_policies WHERE tablename = 'scans' AND policyname = 'admin_access_scans') THEN
-                    CREATE POLICY admin_access_scans ON scans
-                    FOR ALL
-                    TO PUBLIC
-                    USING (current_setting('app.current_organization_id', true) = '' OR 
-                           current_setting('app.admin_bypass', true) = 'true');
-                END IF;
-            END $$;
-            """)
-            
-            cursor.execute("""
-            DO $$ 
-            BEGIN
-                IF NOT EXISTS (SELECT 1 FROM pg_policies WHERE tablename = 'audit_log' AND policyname = 'admin_access_audit_log') THEN
-                    CREATE POLICY admin_access_audit_log ON audit_log
-                    FOR ALL
-                    TO PUBLIC
-                    USING (current_setting('app.current_organization_id', true) = '' OR 
-                           current_setting('app.admin_bypass', true) = 'true');
-                END IF;
-            END $$;
-            """)
-            
-            logger.info("Row Level Security policies created successfully")
-            
+            ensure_schema(self.db_url)
         except Exception as e:
-            logger.error(f"Failed to initialize Row Level Security: {str(e)}")
-            # Don't raise exception here to avoid breaking schema initialization
-            # RLS can be configured later if needed
-            # Note: Transaction rollback is handled by the calling method
-            logger.warning("Continuing without RLS - manual configuration may be required")
+            if os.getenv("DG_REQUIRE_TENANT_SCHEMA") == "1":
+                logger.error(f"Failed to initialize tenant schema: {str(e)}")
+                raise RuntimeError(f"Multi-tenant schema initialization failed: {str(e)}")
+            logger.error(f"Tenant schema not updated, continuing with the existing schema: {str(e)}")
     
     def get_secure_connection(self, organization_id: str, admin_bypass: bool = False):
         """
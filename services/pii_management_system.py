@@ -1,15 +1,36 @@
 """
 PII Management System - Comprehensive management for 1,350+ PII items
 Handles categorization, masking, suppression, and lifecycle management of PII findings.
+
+Items and their audit trail live in an indexed SQLite inventory
+(data/pii_inventory.db) instead of JSON files held in memory:
+
+- category and status/priority indexes serve the inventory pages with keyset
+  pagination, so a page costs the same at 10M items as at 1,000
+- per-category/status counters are maintained by triggers, so summaries and
+  compliance metrics never count the whole table
+- bulk actions are one set-based transaction that also writes the audit trail
+- the audit trail is append-only and indexed by item and by date
+
+Masking rules are compiled into one services.redaction_engine.RedactionEngine,
+so content is masked in a single pass with format-preserving masks.
 """
 
 import json
 import logging
+import os
+import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from .redaction_engine import RedactionEngine, RedactionRule
+except ImportError:
+    from services.redaction_engine import RedactionEngine, RedactionRule
+
 logger = logging.getLogger(__name__)
 
 class PIICategory(Enum):
@@ -50,6 +71,260 @@ class PIIMaskingRule:
     replacement: str
     category: PIICategory
     enabled: bool = True
+    style: str = 'fixed'  # redaction_engine mask style: fixed, full, last4 or email
+
+CATEGORY_PRIORITY = {
+    PIICategory.CRITICAL: 4,
+    PIICategory.HIGH: 3,
+    PIICategory.MEDIUM: 2,
+    PIICategory.LOW: 1
+}
+
+HANDLED_STATUSES = ('approved', 'masked', 'suppressed', 'remediated')
+
+# PIIItem field order
+_ITEM_COLUMNS = ("id, content, category, scan_id, file_path, line_number, confidence, timestamp, "
+                 "status, action_taken, action_timestamp, reviewer, notes")
+_INSERT_COLUMNS = ("id, content, category, priority, scan_id, file_path, line_number, confidence, timestamp, "
+                   "status, action_taken, action_timestamp, reviewer, notes")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pii_items (
+        seq INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        content TEXT NOT NULL,
+        category TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        scan_id TEXT NOT NULL,
+        file_path TEXT NOT NULL,
+        line_number INTEGER NOT NULL,
+        confidence REAL NOT NULL,
+        timestamp TEXT NOT NULL,
+        status TEXT NOT NULL,
+        action_taken TEXT,
+        action_timestamp TEXT,
+        reviewer TEXT,
+        notes TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_pii_items_category ON pii_items(category, seq);
+    CREATE INDEX IF NOT EXISTS idx_pii_items_status_priority
+        ON pii_items(status, priority, confidence, seq);
+    CREATE INDEX IF NOT EXISTS idx_pii_items_status_timestamp ON pii_items(status, timestamp);
+
+    CREATE TABLE IF NOT EXISTS pii_counts (
+        category TEXT NOT NULL,
+        status TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (category, status)
+    ) WITHOUT ROWID;
+    CREATE TRIGGER IF NOT EXISTS pii_items_count_insert AFTER INSERT ON pii_items BEGIN
+        INSERT INTO pii_counts VALUES (NEW.category, NEW.status, 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS pii_items_count_delete AFTER DELETE ON pii_items BEGIN
+        UPDATE pii_counts SET count = count - 1 WHERE category = OLD.category AND status = OLD.status;
+    END;
+    CREATE TRIGGER IF NOT EXISTS pii_items_count_update AFTER UPDATE OF category, status ON pii_items
+    WHEN OLD.category != NEW.category OR OLD.status != NEW.status BEGIN
+        UPDATE pii_counts SET count = count - 1 WHERE category = OLD.category AND status = OLD.status;
+        INSERT INTO pii_counts VALUES (NEW.category, NEW.status, 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+    END;
+
+    CREATE TABLE IF NOT EXISTS pii_audit (
+        seq INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        item_id TEXT NOT NULL,
+        action TEXT NOT NULL,
+        reviewer TEXT,
+        notes TEXT,
+        previous_status TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_pii_audit_item ON pii_audit(item_id, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_pii_audit_timestamp ON pii_audit(timestamp);
+    CREATE TRIGGER IF NOT EXISTS pii_audit_no_update BEFORE UPDATE ON pii_audit BEGIN
+        SELECT RAISE(ABORT, 'pii_audit is append-only');
+    END;
+    CREATE TRIGGER IF NOT EXISTS pii_audit_no_delete BEFORE DELETE ON pii_audit BEGIN
+        SELECT RAISE(ABORT, 'pii_audit is append-only');
+    END;
+
+    CREATE TABLE IF NOT EXISTS pii_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+"""
+
+
+def _encode_cursor(*values: Any) -> str:
+    return ':'.join(str(value) for value in values)
+
+
+def _row_to_item(row: Tuple) -> PIIItem:
+    item = PIIItem(*row)
+    item.category = PIICategory(item.category)
+    if item.action_taken:
+        item.action_taken = PIIAction(item.action_taken)
+    return item
+
+
+def _item_to_row(item: PIIItem) -> Tuple:
+    category = item.category if isinstance(item.category, PIICategory) else PIICategory(item.category)
+    action = item.action_taken.value if isinstance(item.action_taken, PIIAction) else item.action_taken
+    return (item.id, item.content, category.value, CATEGORY_PRIORITY[category], item.scan_id,
+            item.file_path, item.line_number, item.confidence, item.timestamp, item.status,
+            action, item.action_timestamp, item.reviewer, item.notes)
+
+
+class PIIInventoryStore:
+    """Indexed SQLite store of PII items and their append-only audit trail"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def add_items(self, items: Iterable[PIIItem]) -> int:
+        """Insert items, skipping ids already tracked. Returns the number added."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = conn.executemany(f"""
+                INSERT INTO pii_items ({_INSERT_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO NOTHING
+            """, (_item_to_row(item) for item in items)).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def get_item(self, item_id: str) -> Optional[PIIItem]:
+        row = self._conn().execute(f"SELECT {_ITEM_COLUMNS} FROM pii_items WHERE id = ?", (item_id,)).fetchone()
+        return _row_to_item(row) if row else None
+
+    def counts(self) -> Dict[Tuple[str, str], int]:
+        """(category, status) -> number of items"""
+        return {(category, status): count for category, status, count in
+                self._conn().execute("SELECT category, status, count FROM pii_counts WHERE count > 0")}
+
+    def page_by_category(self, category: PIICategory, limit: int = 100,
+                         cursor: Optional[str] = None) -> Tuple[List[PIIItem], Optional[str]]:
+        """Items of a category in insertion order, one keyset page at a time"""
+        after = int(cursor) if cursor else 0
+        rows = self._conn().execute(f"""
+            SELECT seq, {_ITEM_COLUMNS} FROM pii_items
+            WHERE category = ? AND seq > ? ORDER BY seq LIMIT ?
+        """, (category.value, after, limit)).fetchall()
+        next_cursor = _encode_cursor(rows[-1][0]) if len(rows) == limit else None
+        return [_row_to_item(row[1:]) for row in rows], next_cursor
+
+    def page_by_status(self, status: str, priorities: Optional[List[int]] = None, limit: int = 100,
+                       cursor: Optional[str] = None) -> Tuple[List[PIIItem], Optional[str]]:
+        """
+        Items with a status, highest priority and confidence first.
+
+        The cursor is the (priority, confidence, seq) of the last item returned,
+        so each page is a range read of idx_pii_items_status_priority.
+        """
+        conditions = ["status = ?"]
+        params: List[Any] = [status]
+        if priorities:
+            conditions.append(f"priority IN ({','.join('?' * len(priorities))})")
+            params.extend(priorities)
+        if cursor:
+            priority, confidence, seq = cursor.split(':')
+            conditions.append("(priority, confidence, seq) < (?, ?, ?)")
+            params.extend([int(priority), float(confidence), int(seq)])
+        rows = self._conn().execute(f"""
+            SELECT priority, confidence, seq, {_ITEM_COLUMNS} FROM pii_items
+            WHERE {' AND '.join(conditions)}
+            ORDER BY priority DESC, confidence DESC, seq DESC LIMIT ?
+        """, params + [limit]).fetchall()
+        next_cursor = _encode_cursor(*rows[-1][:3]) if len(rows) == limit else None
+        return [_row_to_item(row[3:]) for row in rows], next_cursor
+
+    def count_status_since(self, status: str, timestamp: str) -> int:
+        """Items with a status created at or after a timestamp (a range of idx_pii_items_status_timestamp)"""
+        return self._conn().execute("SELECT COUNT(*) FROM pii_items WHERE status = ? AND timestamp >= ?",
+                                    (status, timestamp)).fetchone()[0]
+
+    def apply_action(self, item_ids: Iterable[str], status: str, action: str, reviewer: str,
+                     notes: str, action_timestamp: str) -> int:
+        """
+        Set the status of items and record the change in the audit trail,
+        as one set-based transaction.
+
+        Returns:
+            Number of items updated
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS bulk_item_ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+            conn.execute("DELETE FROM temp.bulk_item_ids")
+            conn.executemany("INSERT OR IGNORE INTO temp.bulk_item_ids VALUES (?)", ((i,) for i in item_ids))
+            conn.execute("""
+                INSERT INTO pii_audit (timestamp, item_id, action, reviewer, notes, previous_status)
+                SELECT ?, i.id, ?, ?, ?, i.status
+                FROM temp.bulk_item_ids b JOIN pii_items i ON i.id = b.id
+            """, (action_timestamp, action, reviewer, notes))
+            updated = conn.execute("""
+                UPDATE pii_items
+                SET status = ?, action_taken = ?, action_timestamp = ?, reviewer = ?, notes = ?
+                WHERE id IN (SELECT id FROM temp.bulk_item_ids)
+            """, (status, action, action_timestamp, reviewer, notes)).rowcount
+            conn.execute("DELETE FROM temp.bulk_item_ids")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return updated
+
+    def append_audit(self, entries: Iterable[Dict[str, Any]]) -> None:
+        self._conn().executemany("""
+            INSERT INTO pii_audit (timestamp, item_id, action, reviewer, notes, previous_status)
+            VALUES (:timestamp, :item_id, :action, :reviewer, :notes, :previous_status)
+        """, ({'timestamp': entry.get('timestamp', ''), 'item_id': entry.get('item_id', ''),
+               'action': entry.get('action', ''), 'reviewer': entry.get('reviewer'),
+               'notes': entry.get('notes'), 'previous_status': entry.get('previous_status')}
+              for entry in entries))
+
+    def audit_trail(self, item_id: Optional[str], since: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Audit entries since a timestamp, newest first (by item_id or date index)"""
+        query = "SELECT timestamp, item_id, action, reviewer, notes, previous_status FROM pii_audit WHERE timestamp >= ?"
+        params: List[Any] = [since]
+        if item_id:
+            query += " AND item_id = ?"
+            params.append(item_id)
+        query += " ORDER BY timestamp DESC, seq DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        keys = ('timestamp', 'item_id', 'action', 'reviewer', 'notes', 'previous_status')
+        return [dict(zip(keys, row)) for row in self._conn().execute(query, params)]
+
+    def is_empty(self, table: str) -> bool:
+        return self._conn().execute(f"SELECT NOT EXISTS (SELECT 1 FROM {table})").fetchone()[0] == 1
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM pii_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._conn().execute("INSERT INTO pii_meta VALUES (?, ?) ON CONFLICT DO UPDATE SET value = excluded.value",
+                             (key, value))
+
 
 class PIIManagementSystem:
     """
@@ -57,81 +332,91 @@ class PIIManagementSystem:
     Handles discovery, classification, masking, and lifecycle management.
     """
     
+    # Days of scans imported when the inventory is first built
+    SCAN_IMPORT_DAYS = 90
+    
     def __init__(self, data_dir: str = "data"):
         """Initialize PII management system."""
         self.data_dir = data_dir
         self.pii_file = f"{data_dir}/pii_items.json"
         self.audit_file = f"{data_dir}/pii_audit.json"
-        self.pii_items: List[PIIItem] = []
+        os.makedirs(data_dir, exist_ok=True)
+        self.store = PIIInventoryStore(f"{data_dir}/pii_inventory.db")
         self.masking_rules: List[PIIMaskingRule] = []
-        self.audit_log: List[Dict[str, Any]] = []
+        self._masking_engine = RedactionEngine([])
         self._load_data()
         self._setup_default_masking_rules()
     
     def _load_data(self):
-        """Load existing PII data and masking rules."""
-        import os
-        
-        # Load persisted PII items first
-        if os.path.exists(self.pii_file):
+        """Import legacy JSON files once, then pick up PII from new scans."""
+        if self.store.is_empty('pii_items') and os.path.exists(self.pii_file):
             try:
                 with open(self.pii_file, 'r') as f:
-                    data = json.load(f)
-                    for item_data in data:
-                        item = PIIItem(**item_data)
-                        item.category = PIICategory(item.category) if isinstance(item.category, str) else item.category
-                        if item.action_taken:
-                            item.action_taken = PIIAction(item.action_taken) if isinstance(item.action_taken, str) else item.action_taken
-                        self.pii_items.append(item)
+                    self.store.add_items(PIIItem(**item_data) for item_data in json.load(f))
+                logger.info(f"Imported {self.pii_file} into the PII inventory")
             except Exception as e:
                 logger.warning(f"Could not load PII items: {e}")
         
-        # Load audit log
-        if os.path.exists(self.audit_file):
+        if self.store.is_empty('pii_audit') and os.path.exists(self.audit_file):
             try:
                 with open(self.audit_file, 'r') as f:
-                    self.audit_log = json.load(f)
+                    self.store.append_audit(json.load(f))
             except Exception as e:
                 logger.warning(f"Could not load audit log: {e}")
         
-        # If no persisted items, extract from scans
-        if not self.pii_items:
-            try:
-                from services.results_aggregator import ResultsAggregator
-                aggregator = ResultsAggregator()
-                recent_scans = aggregator.get_recent_scans(days=90)
-                
-                for scan in recent_scans:
-                    self._extract_pii_from_scan(scan)
-                    
-                # Save extracted items
-                self._save_data()
-                    
-            except Exception as e:
-                logger.warning(f"Could not load scan data: {e}")
+        try:
+            self.sync_from_scans()
+        except Exception as e:
+            logger.warning(f"Could not load scan data: {e}")
+    
+    def sync_from_scans(self) -> int:
+        """
+        Add PII items from scans stored since the last sync (the last 90 days
+        on first use). Item ids are stable per scan, so re-reading a scan adds
+        nothing.
+        
+        Returns:
+            Number of items added
+        """
+        from services.results_aggregator import get_results_aggregator
+        
+        synced_at = datetime.now()
+        last_sync = self.store.get_meta('scans_synced_at')
+        days = self.SCAN_IMPORT_DAYS
+        if last_sync:
+            days = min(days, (synced_at - datetime.fromisoformat(last_sync)).days + 1)
+        
+        recent_scans = get_results_aggregator().get_recent_scans(days=days)
+        added = self.store.add_items(item for scan in recent_scans for item in self._extract_pii_from_scan(scan))
+        self.store.set_meta('scans_synced_at', synced_at.isoformat())
+        return added
     
-    def _extract_pii_from_scan(self, scan: Dict[str, Any]):
+    def _extract_pii_from_scan(self, scan: Dict[str, Any]) -> List[PIIItem]:
         """Extract PII items from scan results."""
         scan_id = scan.get('scan_id', 'unknown')
+        timestamp = scan.get('timestamp') or datetime.now().isoformat()
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        items = []
         
         # Extract from scan results
         result = scan.get('result', {})
         if isinstance(result, dict):
             findings = result.get('findings', [])
-            for finding in findings:
+            for index, finding in enumerate(findings):
                 if self._is_pii_finding(finding):
-                    pii_item = PIIItem(
-                        id=f"{scan_id}_{len(self.pii_items)}",
+                    items.append(PIIItem(
+                        id=f"{scan_id}_{index}",
                         content=finding.get('code_snippet', ''),
                         category=self._classify_pii(finding),
                         scan_id=scan_id,
                         file_path=finding.get('file', 'unknown'),
                         line_number=finding.get('line', 0),
                         confidence=finding.get('confidence', 0.8),
-                        timestamp=scan.get('timestamp', datetime.now().isoformat())
-                    )
-                    self.pii_items.append(pii_item)
-    
+                        timestamp=timestamp
+                    ))
+        return items
+
     def _is_pii_finding(self, finding: Dict[str, Any]) -> bool:
         """Determine if a finding contains PII."""
         pii_indicators = [
@@ -171,52 +456,56 @@ class PIIManagementSystem:
             PIIMaskingRule(
                 pattern=r'\b\d{3}-\d{2}-\d{4}\b',
                 replacement='***-**-****',
-                category=PIICategory.CRITICAL
+                category=PIICategory.CRITICAL,
+                style='full'
             ),
             PIIMaskingRule(
                 pattern=r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
                 replacement='***@***.***',
-                category=PIICategory.HIGH
+                category=PIICategory.HIGH,
+                style='email'
             ),
             PIIMaskingRule(
                 pattern=r'\b\d{3}-\d{3}-\d{4}\b',
                 replacement='***-***-****',
-                category=PIICategory.HIGH
+                category=PIICategory.HIGH,
+                style='last4'
             ),
             PIIMaskingRule(
                 pattern=r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b',
                 replacement='****-****-****-****',
-                category=PIICategory.CRITICAL
+                category=PIICategory.CRITICAL,
+                style='last4'
             )
         ]
         
         self.masking_rules.extend(default_rules)
+        self.compile_masking_rules()
+    
+    def compile_masking_rules(self):
+        """Compile the enabled masking rules into one redaction engine (call after changing them)."""
+        self._masking_engine = RedactionEngine([
+            RedactionRule(f"{rule.category.value}_{index}", rule.pattern, rule.style, rule.replacement)
+            for index, rule in enumerate(self.masking_rules) if rule.enabled
+        ])
+    
+    def _status_totals(self) -> Tuple[int, Dict[str, int], Dict[str, int], Dict[Tuple[str, str], int]]:
+        """Total, per-category and per-status counts from the trigger-maintained counters"""
+        counts = self.store.counts()
+        category_counts = {category.value: 0 for category in PIICategory}
+        status_counts = {status: 0 for status in ('pending',) + HANDLED_STATUSES}
+        for (category, status), count in counts.items():
+            category_counts[category] = category_counts.get(category, 0) + count
+            status_counts[status] = status_counts.get(status, 0) + count
+        return sum(counts.values()), category_counts, status_counts, counts
     
     def get_pii_summary(self) -> Dict[str, Any]:
         """Get comprehensive PII summary statistics."""
-        total_items = len(self.pii_items)
-        
-        # Count by category
-        category_counts = {}
-        for category in PIICategory:
-            category_counts[category.value] = sum(
-                1 for item in self.pii_items if item.category == category
-            )
-        
-        # Count by status
-        status_counts = {}
-        statuses = ['pending', 'approved', 'masked', 'suppressed', 'remediated']
-        for status in statuses:
-            status_counts[status] = sum(
-                1 for item in self.pii_items if item.status == status
-            )
+        total_items, category_counts, status_counts, counts = self._status_totals()
         
         # High-risk items needing attention
-        high_risk_items = sum(
-            1 for item in self.pii_items 
-            if item.category in [PIICategory.CRITICAL, PIICategory.HIGH] 
-            and item.status == 'pending'
-        )
+        high_risk_items = (counts.get((PIICategory.CRITICAL.value, 'pending'), 0) +
+                           counts.get((PIICategory.HIGH.value, 'pending'), 0))
         
         return {
             'total_items': total_items,
@@ -227,93 +516,67 @@ class PIIManagementSystem:
             'last_updated': datetime.now().isoformat()
         }
     
+    def _status_share(self, statuses: Tuple[str, ...]) -> float:
+        """Percentage of items in the given statuses (100 when nothing is tracked)"""
+        total_items, _, status_counts, _ = self._status_totals()
+        if not total_items:
+            return 100.0
+        return sum(status_counts.get(status, 0) for status in statuses) / total_items * 100
+    
     def _calculate_compliance_coverage(self) -> float:
         """Calculate percentage of PII items properly handled."""
-        if not self.pii_items:
-            return 100.0
-        
-        handled_items = sum(
-            1 for item in self.pii_items 
-            if item.status in ['approved', 'masked', 'suppressed', 'remediated']
-        )
-        
-        return (handled_items / len(self.pii_items)) * 100
+        return self._status_share(HANDLED_STATUSES)
     
     def apply_masking_rules(self, content: str) -> str:
-        """Apply masking rules to content."""
-        masked_content = content
-        
-        for rule in self.masking_rules:
-            if rule.enabled:
-                import re
-                masked_content = re.sub(rule.pattern, rule.replacement, masked_content)
-        
-        return masked_content
+        """Apply masking rules to content in one pass."""
+        return self._masking_engine.redact_text(content)
     
     def bulk_action(self, item_ids: List[str], action: PIIAction, reviewer: str, notes: str = "") -> int:
-        """Apply bulk action to multiple PII items."""
-        updated_count = 0
-        action_timestamp = datetime.now().isoformat()
-        
-        for item in self.pii_items:
-            if item.id in item_ids:
-                # Log the action
-                self.audit_log.append({
-                    'timestamp': action_timestamp,
-                    'item_id': item.id,
-                    'action': action.value,
-                    'reviewer': reviewer,
-                    'notes': notes,
-                    'previous_status': item.status
-                })
-                
-                item.action_taken = action
-                item.action_timestamp = action_timestamp
-                item.reviewer = reviewer
-                item.notes = notes
-                item.status = action.value
-                updated_count += 1
-        
-        # Save changes
-        self._save_data()
-        return updated_count
+        """Apply bulk action to multiple PII items (one transaction, audited)."""
+        return self.store.apply_action(item_ids, status=action.value, action=action.value, reviewer=reviewer,
+                                       notes=notes, action_timestamp=datetime.now().isoformat())
     
-    def get_items_by_category(self, category: PIICategory, limit: int = 100) -> List[PIIItem]:
-        """Get PII items filtered by category."""
-        items = [item for item in self.pii_items if item.category == category]
-        return items[:limit]
+    def get_item(self, item_id: str) -> Optional[PIIItem]:
+        """Get a single PII item by id."""
+        return self.store.get_item(item_id)
     
-    def get_pending_items(self, priority_categories: List[PIICategory] = None) -> List[PIIItem]:
-        """Get pending PII items, optionally filtered by priority categories."""
-        pending_items = [item for item in self.pii_items if item.status == 'pending']
-        
-        if priority_categories:
-            pending_items = [item for item in pending_items if item.category in priority_categories]
-        
-        # Sort by category severity and confidence
-        category_priority = {
-            PIICategory.CRITICAL: 4,
-            PIICategory.HIGH: 3,
-            PIICategory.MEDIUM: 2,
-            PIICategory.LOW: 1
-        }
-        
-        pending_items.sort(
-            key=lambda x: (category_priority[x.category], x.confidence),
-            reverse=True
-        )
-        
-        return pending_items
+    def get_items_by_category(self, category: PIICategory, limit: int = 100,
+                              cursor: Optional[str] = None) -> List[PIIItem]:
+        """Get PII items filtered by category (pass the page cursor to continue)."""
+        return self.store.page_by_category(category, limit=limit, cursor=cursor)[0]
+    
+    def get_items_page(self, category: PIICategory, limit: int = 100,
+                       cursor: Optional[str] = None) -> Tuple[List[PIIItem], Optional[str]]:
+        """
+        One inventory page of a category.
+        
+        Returns:
+            Tuple of (items, cursor of the next page or None)
+        """
+        return self.store.page_by_category(category, limit=limit, cursor=cursor)
+    
+    def get_pending_items(self, priority_categories: List[PIICategory] = None,
+                          limit: int = 100, cursor: Optional[str] = None) -> List[PIIItem]:
+        """Get pending PII items by category severity and confidence, optionally filtered by priority categories."""
+        return self.get_pending_page(priority_categories, limit=limit, cursor=cursor)[0]
+    
+    def get_pending_page(self, priority_categories: List[PIICategory] = None, limit: int = 100,
+                         cursor: Optional[str] = None) -> Tuple[List[PIIItem], Optional[str]]:
+        """
+        One page of the review queue, most severe and confident items first.
+        
+        Returns:
+            Tuple of (items, cursor of the next page or None)
+        """
+        priorities = [CATEGORY_PRIORITY[category] for category in priority_categories] if priority_categories else None
+        return self.store.page_by_status('pending', priorities=priorities, limit=limit, cursor=cursor)
     
     def generate_compliance_report(self) -> Dict[str, Any]:
         """Generate comprehensive compliance report for PII management."""
         summary = self.get_pii_summary()
         
         # Calculate risk metrics
-        critical_pending = sum(
-            1 for item in self.pii_items 
-            if item.category == PIICategory.CRITICAL and item.status == 'pending'
-        )
+        critical_pending = self.store.counts().get((PIICategory.CRITICAL.value, 'pending'), 0)
         
         # GDPR compliance metrics
         gdpr_metrics = {
@@ -332,42 +595,27 @@ class PIIManagementSystem:
     
     def _calculate_data_minimization_score(self) -> float:
         """Calculate data minimization compliance score."""
-        if not self.pii_items:
-            return 100.0
-        
         # Items that are approved (necessary) or properly handled
-        compliant_items = sum(
-            1 for item in self.pii_items 
-            if item.status in ['approved', 'suppressed', 'remediated']
-        )
-        
-        return (compliant_items / len(self.pii_items)) * 100
+        return self._status_share(('approved', 'suppressed', 'remediated'))
     
     def _calculate_retention_compliance(self) -> float:
         """Calculate retention policy compliance."""
-        # Based on age of pending items (older items should be handled)
-        cutoff_date = datetime.now() - timedelta(days=30)
-        old_pending = sum(
-            1 for item in self.pii_items 
-            if (item.status == 'pending' and 
-                datetime.fromisoformat(item.timestamp.replace('Z', '+00:00').replace('+00:00', '')) < cutoff_date)
-        )
-        
-        if not self.pii_items:
+        total_items, _, status_counts, _ = self._status_totals()
+        if not total_items:
             return 100.0
         
-        compliance_rate = 1 - (old_pending / len(self.pii_items))
+        # Based on age of pending items (older items should be handled); the
+        # recent ones are the smaller range to count
+        cutoff_date = (datetime.now() - timedelta(days=30)).isoformat()
+        old_pending = status_counts['pending'] - self.store.count_status_since('pending', cutoff_date)
+        
+        compliance_rate = 1 - (old_pending / total_items)
         return max(0, compliance_rate * 100)
     
     def _calculate_consent_coverage(self) -> float:
         """Calculate consent management coverage."""
         # Simplified: items that are approved have implicit consent
-        approved_items = sum(1 for item in self.pii_items if item.status == 'approved')
-        
-        if not self.pii_items:
-            return 100.0
-        
-        return (approved_items / len(self.pii_items)) * 100
+        return self._status_share(('approved',))
     
     def _generate_recommendations(self) -> List[str]:
         """Generate actionable recommendations for PII management."""
@@ -394,47 +642,8 @@ class PIIManagementSystem:
         
         return recommendations
     
-    def _save_data(self):
-        """Save PII items and audit log to persistent storage."""
-        import os
-        
-        # Ensure data directory exists
-        os.makedirs(self.data_dir, exist_ok=True)
-        
-        # Save PII items
-        try:
-            pii_data = []
-            for item in self.pii_items:
-                item_dict = asdict(item)
-                # Convert enums to strings for JSON serialization
-                if isinstance(item_dict['category'], PIICategory):
-                    item_dict['category'] = item_dict['category'].value
-                if item_dict['action_taken'] and isinstance(item_dict['action_taken'], PIIAction):
-                    item_dict['action_taken'] = item_dict['action_taken'].value
-                pii_data.append(item_dict)
-            
-            with open(self.pii_file, 'w') as f:
-                json.dump(pii_data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save PII items: {e}")
-        
-        # Save audit log
-        try:
-            with open(self.audit_file, 'w') as f:
-                json.dump(self.audit_log, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save audit log: {e}")
-    
-    def get_audit_trail(self, item_id: Optional[str] = None, days: int = 30) -> List[Dict[str, Any]]:
-        """Get audit trail for specific item or all items."""
+    def get_audit_trail(self, item_id: Optional[str] = None, days: int = 30,
+                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get audit trail for specific item or all items, newest first."""
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
-        
-        filtered_log = [
-            entry for entry in self.audit_log
-            if entry.get('timestamp', '') >= cutoff_date
-        ]
-        
-        if item_id:
-            filtered_log = [entry for entry in filtered_log if entry.get('item_id') == item_id]
-        
-        return sorted(filtered_log, key=lambda x: x.get('timestamp', ''), reverse=True)
\ No newline at end of file
+        return self.store.audit_trail(item_id, cutoff_date, limit=limit)
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from enum import Enum
 import hashlib
 
+from utils.redis_cache import get_compliance_cache
+
 class ComplianceTrend(Enum):
     IMPROVING = "Improving"
     STABLE = "Stable"
@@ -259,61 +261,97 @@ class PredictiveComplianceEngine:
             if time_series_data is None or len(time_series_data) == 0:
                 return self._generate_baseline_prediction(forecast_days)
             
-            # Calculate current trend with fallback
-            try:
-                current_trend = self._calculate_compliance_trend(time_series_data)
-            except Exception as e:
-                print(f"Warning: Trend calculation failed: {e}, using stable trend")
-                current_trend = ComplianceTrend.STABLE
-            
-            # Predict future compliance score with error handling
-            try:
-                future_score, confidence_interval = self._forecast_compliance_score(
-                    time_series_data, forecast_days
-                )
-            except Exception as e:
-                print(f"Warning: Score forecasting failed: {e}, using baseline")
-                future_score = 75.0
-                confidence_interval = (65.0, 85.0)
-            
-            # Identify risk factors with validation
-            try:
-                risk_factors = self._identify_risk_factors(validated_scan_history, time_series_data)
-            except Exception as e:
-                print(f"Warning: Risk factor identification failed: {e}")
-                risk_factors = ["Data quality insufficient for detailed risk analysis"]
-            
-            # Predict specific violations with fallback
-            try:
-                predicted_violations = self._predict_future_violations(validated_scan_history, risk_factors)
-            except Exception as e:
-                print(f"Warning: Violation prediction failed: {e}")
-                predicted_violations = []
-            
-            # Determine action priority with safe defaults
-            try:
-                recommendation_priority, time_to_action = self._calculate_action_priority(
-                    future_score, current_trend, risk_factors
-                )
-            except Exception as e:
-                print(f"Warning: Priority calculation failed: {e}")
-                recommendation_priority, time_to_action = "Medium", "Review in 30 days"
-            
-            return CompliancePrediction(
-                future_score=future_score,
-                confidence_interval=confidence_interval,
-                trend=current_trend,
-                risk_factors=risk_factors,
-                predicted_violations=predicted_violations,
-                recommendation_priority=recommendation_priority,
-                time_to_action=time_to_action
-            )
+            return self._build_prediction(time_series_data, forecast_days, validated_scan_history)
             
         except Exception as e:
             print(f"Critical error in compliance prediction: {e}")
             # Return safe fallback prediction
             return self._generate_baseline_prediction(forecast_days)
     
+    def predict_compliance_from_series(self, series_rows: List[Any],
+                                       forecast_days: int = 30) -> CompliancePrediction:
+        """
+        Predict future compliance trajectory from a precomputed daily series.
+        
+        Trends, EMA and forecasts are fitted on arrays built directly from the
+        rows, so years of history cost about as much as a few weeks.
+        
+        Args:
+            series_rows: (day, scan_count, total_pii_found, high_risk_count,
+                critical_count, risk_score_sum) rows, as returned by
+                ResultsAggregator.get_compliance_series
+            forecast_days: Number of days to forecast ahead
+            
+        Returns:
+            Compliance prediction with recommendations
+        """
+        try:
+            time_series_data = self._series_to_time_series(series_rows)
+            if len(time_series_data) == 0:
+                return self._generate_baseline_prediction(forecast_days)
+            return self._build_prediction(time_series_data, forecast_days)
+        except Exception as e:
+            print(f"Critical error in compliance prediction: {e}")
+            return self._generate_baseline_prediction(forecast_days)
+    
+    def _build_prediction(self, time_series_data: pd.DataFrame, forecast_days: int,
+                          scan_history: Optional[List[Dict[str, Any]]] = None) -> CompliancePrediction:
+        """Trend, forecast, risk factors and priority for a prepared daily time series"""
+        scan_history = scan_history or []
+        
+        # Calculate current trend with fallback
+        try:
+            current_trend = self._calculate_compliance_trend(time_series_data)
+        except Exception as e:
+            print(f"Warning: Trend calculation failed: {e}, using stable trend")
+            current_trend = ComplianceTrend.STABLE
+        
+        # Predict future compliance score with error handling
+        try:
+            future_score, confidence_interval = self._forecast_compliance_score(
+                time_series_data, forecast_days
+            )
+        except Exception as e:
+            print(f"Warning: Score forecasting failed: {e}, using baseline")
+            future_score = 75.0
+            confidence_interval = (65.0, 85.0)
+        
+        # Identify risk factors with validation
+        try:
+            if scan_history:
+                risk_factors = self._identify_risk_factors(scan_history, time_series_data)
+            else:
+                risk_factors = self._time_series_risk_factors(time_series_data)
+        except Exception as e:
+            print(f"Warning: Risk factor identification failed: {e}")
+            risk_factors = ["Data quality insufficient for detailed risk analysis"]
+        
+        # Predict specific violations with fallback
+        try:
+            predicted_violations = self._predict_future_violations(scan_history, risk_factors)
+        except Exception as e:
+            print(f"Warning: Violation prediction failed: {e}")
+            predicted_violations = []
+        
+        # Determine action priority with safe defaults
+        try:
+            recommendation_priority, time_to_action = self._calculate_action_priority(
+                future_score, current_trend, risk_factors
+            )
+        except Exception as e:
+            print(f"Warning: Priority calculation failed: {e}")
+            recommendation_priority, time_to_action = "Medium", "Review in 30 days"
+        
+        return CompliancePrediction(
+            future_score=future_score,
+            confidence_interval=confidence_interval,
+            trend=current_trend,
+            risk_factors=risk_factors,
+            predicted_violations=predicted_violations,
+            recommendation_priority=recommendation_priority,
+            time_to_action=time_to_action
+        )
+    
     def forecast_regulatory_risk(self, current_state: Dict[str, Any],
                                business_context: Dict[str, Any]) -> List[RiskForecast]:
         """
@@ -412,35 +450,94 @@ class PredictiveComplianceEngine:
             # Forward fill gaps up to 3 days
             daily_aggregated = daily_aggregated.ffill(limit=3)
         
+        return self._smooth_time_series(daily_aggregated)
+    
+    def _series_to_time_series(self, series_rows: List[Any]) -> pd.DataFrame:
+        """
+        Build the daily time series from precomputed daily rollup rows.
+        
+        Each day's score is the mean risk-adjusted score of its scans; gaps of
+        up to 3 days are forward filled, as for scan histories.
+        """
+        if not series_rows:
+            return pd.DataFrame()
+        
+        days = np.array([str(row[0])[:10] for row in series_rows], dtype='datetime64[D]')
+        values = np.asarray([row[1:6] for row in series_rows], dtype=np.float64)
+        present = values[:, 0] > 0
+        days, values = days[present], values[present]
+        if len(days) == 0:
+            return pd.DataFrame()
+        order = np.argsort(days, kind='stable')
+        days, values = days[order], values[order]
+        
+        scan_counts = values[:, 0]
+        daily = np.column_stack([
+            values[:, 4] / scan_counts,                  # compliance_score
+            values[:, 1] / scan_counts,                  # total_findings
+            values[:, 3] / scan_counts,                  # critical_findings
+            (values[:, 2] - values[:, 3]) / scan_counts  # high_findings (excluding critical)
+        ])
+        
+        # Continuous daily range; duplicate days keep their last row
+        offsets = (days - days[0]).astype(np.int64)
+        full = np.full((int(offsets[-1]) + 1, daily.shape[1]), np.nan)
+        full[offsets] = daily
+        day_scan_counts = np.zeros(len(full))
+        day_scan_counts[offsets] = scan_counts
+        
+        # Forward fill gaps up to 3 days
+        positions = np.arange(len(full))
+        last_present = np.maximum.accumulate(np.where(np.isnan(full[:, 0]), 0, positions))
+        fill = np.isnan(full[:, 0]) & (positions - last_present <= 3)
+        full[fill] = full[last_present[fill]]
+        
+        daily_aggregated = pd.DataFrame({
+            'date': (days[0] + positions).astype(object),
+            'compliance_score': full[:, 0],
+            'total_findings': full[:, 1],
+            'critical_findings': full[:, 2],
+            'high_findings': full[:, 3],
+            'scan_count': day_scan_counts
+        })
+        return self._smooth_time_series(daily_aggregated)
+    
+    def _smooth_time_series(self, daily_aggregated: pd.DataFrame) -> pd.DataFrame:
+        """Replace MAD outliers, apply a 7-day EMA and cap daily changes of the scores"""
         # Step 4: Apply 7-day EMA with outlier detection using MAD
         if len(daily_aggregated) >= 3:
-            scores = daily_aggregated['compliance_score'].values
+            scores = daily_aggregated['compliance_score'].to_numpy(dtype=np.float64)
             
-            # Calculate rolling median and MAD for outlier detection
+            # Centred rolling median and MAD (aligned like pandas' centred rolling window)
             window = min(7, len(scores))
-            rolling_median = pd.Series(scores).rolling(window=window, center=True).median()
-            rolling_mad = pd.Series(scores).rolling(window=window, center=True).apply(
-                lambda x: np.median(np.abs(x - np.median(x))) * 1.4826  # MAD to std conversion
-            )
+            windows = np.lib.stride_tricks.sliding_window_view(scores, window)
+            offset = window // 2
+            rolling_median = np.full(len(scores), np.nan)
+            rolling_mad = np.full(len(scores), np.nan)
+            window_medians = np.median(windows, axis=1)
+            rolling_median[offset:offset + len(windows)] = window_medians
+            rolling_mad[offset:offset + len(windows)] = np.median(
+                np.abs(windows - window_medians[:, None]), axis=1
+            ) * 1.4826  # MAD to std conversion
             
             # Detect and replace outliers (|x - median| > 2.5 * MAD)
-            cleaned_scores = scores.copy()
-            for i in range(len(scores)):
-                if not pd.isna(rolling_median.iloc[i]) and not pd.isna(rolling_mad.iloc[i]):
-                    if abs(scores[i] - rolling_median.iloc[i]) > 2.5 * rolling_mad.iloc[i]:
-                        cleaned_scores[i] = rolling_median.iloc[i]
+            with np.errstate(invalid='ignore'):
+                outliers = np.abs(scores - rolling_median) > 2.5 * rolling_mad
+            cleaned_scores = np.where(outliers, rolling_median, scores)
             
             # Apply 7-day EMA
-            smoothed_scores = pd.Series(cleaned_scores).ewm(span=7, adjust=False).mean().values
+            smoothed_scores = pd.Series(cleaned_scores).ewm(span=7, adjust=False).mean().to_numpy()
             
             # Step 5: Apply delta cap (±6 points max daily change)
             max_delta = 6.0
-            final_scores = [smoothed_scores[0]]
-            for i in range(1, len(smoothed_scores)):
-                prev_score = final_scores[i-1]
-                curr_score = smoothed_scores[i]
-                capped_score = np.clip(curr_score, prev_score - max_delta, prev_score + max_delta)
-                final_scores.append(capped_score)
+            final_scores = smoothed_scores.copy()
+            prev_score = final_scores[0]
+            for i in range(1, len(final_scores)):
+                if final_scores[i] > prev_score + max_delta:
+                    final_scores[i] = prev_score + max_delta
+                elif final_scores[i] < prev_score - max_delta:
+                    final_scores[i] = prev_score - max_delta
+                prev_score = final_scores[i]
             
             daily_aggregated['smoothed_compliance_score'] = final_scores
             daily_aggregated['raw_compliance_score'] = daily_aggregated['compliance_score']
@@ -578,9 +675,8 @@ class PredictiveComplianceEngine:
         
         return forecast, confidence_interval
     
-    def _identify_risk_factors(self, scan_history: List[Dict[str, Any]], 
-                             time_series_data: pd.DataFrame) -> List[str]:
-        """Identify key risk factors based on historical patterns"""
+    def _time_series_risk_factors(self, time_series_data: pd.DataFrame) -> List[str]:
+        """Risk factors visible in the daily time series itself"""
         risk_factors = []
         
         if len(time_series_data) >= 3:
@@ -595,6 +691,19 @@ class PredictiveComplianceEngine:
             if score_change < -10:
                 risk_factors.append("Declining compliance scores")
         
+        # Scan frequency analysis (series built from daily rollups)
+        if 'scan_count' in time_series_data.columns:
+            scan_days = time_series_data['timestamp'][time_series_data['scan_count'] > 0]
+            if len(scan_days) >= 2 and (scan_days.iloc[-1] - scan_days.iloc[-2]).days > 60:
+                risk_factors.append("Infrequent compliance monitoring")
+        
+        return risk_factors
+    
+    def _identify_risk_factors(self, scan_history: List[Dict[str, Any]], 
+                             time_series_data: pd.DataFrame) -> List[str]:
+        """Identify key risk factors based on historical patterns"""
+        risk_factors = self._time_series_risk_factors(time_series_data)
+        
         # Scan frequency analysis
         if len(scan_history) >= 2:
             last_scan = pd.to_datetime(scan_history[-1]['timestamp'])
@@ -1033,4 +1142,48 @@ def predict_compliance_future(scan_history: List[Dict[str, Any]],
     # Generate comprehensive report
     report = engine.generate_predictive_report(prediction, risk_forecasts)
     
-    return prediction, risk_forecasts, report
\ No newline at end of file
+    return prediction, risk_forecasts, report
+
+def predict_tenant_compliance(aggregator, username: Optional[str] = None,
+                              organization_id: str = 'default_org', forecast_days: int = 30,
+                              region: str = "Netherlands") -> Tuple[Optional[CompliancePrediction], List[List[Any]]]:
+    """
+    Forecast a tenant's compliance from its whole daily series.
+    
+    Predictions are cached per tenant and invalidated when it stores a scan.
+    
+    Args:
+        aggregator: ResultsAggregator providing get_compliance_series
+        username: Optional username filter (organization-wide if None)
+        organization_id: Organization ID for tenant isolation
+        forecast_days: Number of days to forecast ahead
+        region: Regulatory region for compliance focus
+        
+    Returns:
+        Tuple of (compliance prediction or None without history, series rows)
+    """
+    series_rows = aggregator.get_compliance_series(username, organization_id)
+    if not series_rows:
+        return None, series_rows
+    
+    compliance_cache = get_compliance_cache()
+    cache_key = f"forecast:{region}:{username or '*'}:{forecast_days}"
+    cached = compliance_cache.get(organization_id, cache_key)
+    if cached is not None:
+        cached['trend'] = ComplianceTrend(cached['trend'])
+        cached['confidence_interval'] = tuple(cached['confidence_interval'])
+        return CompliancePrediction(**cached), series_rows
+    
+    engine = PredictiveComplianceEngine(region=region)
+    prediction = engine.predict_compliance_from_series(series_rows, forecast_days)
+    payload = {
+        'future_score': float(prediction.future_score),
+        'confidence_interval': [float(bound) for bound in prediction.confidence_interval],
+        'trend': prediction.trend.value,
+        'risk_factors': prediction.risk_factors,
+        'predicted_violations': prediction.predicted_violations,
+        'recommendation_priority': prediction.recommendation_priority,
+        'time_to_action': prediction.time_to_action
+    }
+    compliance_cache.set(organization_id, cache_key, payload)
+    return prediction, series_rows
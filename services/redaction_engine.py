@@ -0,0 +1,310 @@
+"""
+Redaction Engine
+
+Masks personal data in text, files and database exports in a single pass:
+
+- All rules are compiled once into one alternation of named groups, so each
+  chunk is scanned once however many rules there are.
+- Streams are processed in chunks with an overlap window: a match is only
+  finalised once enough text follows it, so matches spanning chunk
+  boundaries are redacted exactly as in the whole text, and memory stays
+  constant for exports of any size.
+- Masks are format preserving and, except for 'fixed' replacements, keep the
+  length of the value, so offsets in the output equal offsets in the input:
+  'full' masks every character but separators, 'last4' keeps the last four
+  digits, 'email' keeps the domain.
+- Every run produces a RedactionManifest (counts per rule, output digest)
+  and can stream one JSON line per redaction (rule, offsets, line) to an
+  audit file. The manifest never contains the redacted values.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+MASK_CHAR = '*'
+
+# Characters read per chunk when streaming
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Longest value any rule can match; text this close to the end of a chunk
+# waits for the next chunk before matches in it are finalised
+DEFAULT_MAX_MATCH_LENGTH = 512
+
+# Already written text kept in front of a chunk for lookbehinds and \b
+CONTEXT_CHARS = 64
+
+MASK_STYLES = ('full', 'last4', 'email', 'fixed')
+
+_NON_DIGIT = re.compile(r'\D')
+# Separators stay unmasked so a masked value keeps its shape
+_MASKABLE = re.compile(r'[^ \-./()+@_:]')
+_MASKABLE_NON_DIGIT = re.compile(r'[^ \-./()+@_:0-9]')
+# Start of the last four digits of a value
+_LAST4 = re.compile(r'\d(?=(?:\D*\d){3}\D*$)')
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def luhn_valid(value: str) -> bool:
+    """Luhn checksum of the digits in value (card numbers)"""
+    digits = _NON_DIGIT.sub('', value)
+    if len(digits) < 12:
+        return False
+    total = sum(map(int, digits[-1::-2])) + sum(_LUHN_DOUBLED[int(d)] for d in digits[-2::-2])
+    return total % 10 == 0
+
+
+def bsn_valid(value: str) -> bool:
+    """Dutch BSN eleven-test (elfproef)"""
+    digits = [int(c) for c in _NON_DIGIT.sub('', value)]
+    if len(digits) != 9:
+        return False
+    total = sum(d * w for d, w in zip(digits, (9, 8, 7, 6, 5, 4, 3, 2, -1)))
+    return total != 0 and total % 11 == 0
+
+
+@dataclass
+class RedactionRule:
+    """A pattern and how to mask what it matches"""
+    name: str
+    pattern: str
+    style: str = 'full'
+    replacement: str = ''
+    validator: Optional[Callable[[str], bool]] = None
+
+
+DEFAULT_REDACTION_RULES = [
+    RedactionRule('email', r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,8}\.[A-Za-z]{2,24}\b',
+                  style='email'),
+    RedactionRule('iban', r'\b[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?\b', style='last4'),
+    RedactionRule('credit_card', r'\b\d{4}(?:[ -]?\d{4}){2}[ -]?\d{1,7}\b', style='last4', validator=luhn_valid),
+    RedactionRule('ssn', r'\b\d{3}-\d{2}-\d{4}\b', style='full'),
+    RedactionRule('phone', r'(?:(?<![\w+])\+|\b00)\d{1,3}(?:[ -]?\d){7,12}\b|\b0\d(?:[ -]?\d){8}\b', style='last4'),
+    RedactionRule('bsn', r'\b\d{4}\.?\d{2}\.?\d{3}\b', style='full', validator=bsn_valid),
+]
+
+
+def mask_value(value: str, style: str, replacement: str = '') -> str:
+    """Mask one matched value in the given style"""
+    if style == 'fixed':
+        return replacement
+    if style == 'email':
+        local, at, domain = value.rpartition('@')
+        return MASK_CHAR * len(local) + at + domain if at else MASK_CHAR * len(value)
+    if style == 'last4':
+        last4 = _LAST4.search(value)
+        if last4 is not None:
+            split = last4.start()
+            return _MASKABLE.sub(MASK_CHAR, value[:split]) + _MASKABLE_NON_DIGIT.sub(MASK_CHAR, value[split:])
+    return _MASKABLE.sub(MASK_CHAR, value)
+
+
+@dataclass
+class RedactionManifest:
+    """Audit record of a redaction run (no redacted values)"""
+    source: str
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished_at: Optional[str] = None
+    characters: int = 0
+    redactions: int = 0
+    rule_counts: Dict[str, int] = field(default_factory=dict)
+    output_sha256: Optional[str] = None
+    entries_path: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _Run:
+    """Bookkeeping of one redaction run: counts, output digest, audit entries"""
+
+    def __init__(self, manifest: RedactionManifest, entries: Optional[TextIO]):
+        self.manifest = manifest
+        self.entries = entries
+        self.digest = hashlib.sha256()
+
+    def record(self, rule: str, start: int, end: int, **location: Any) -> None:
+        manifest = self.manifest
+        manifest.redactions += 1
+        manifest.rule_counts[rule] = manifest.rule_counts.get(rule, 0) + 1
+        if self.entries is not None:
+            entry = {'rule': rule, 'start': start, 'end': end}
+            entry.update(location)
+            self.entries.write(json.dumps(entry) + '\n')
+
+    def emit(self, text: str, sink: Optional[TextIO] = None) -> None:
+        self.digest.update(text.encode('utf-8', 'surrogateescape'))
+        if sink is not None:
+            sink.write(text)
+
+    def finish(self) -> RedactionManifest:
+        self.manifest.output_sha256 = self.digest.hexdigest()
+        self.manifest.finished_at = datetime.now().isoformat()
+        return self.manifest
+
+
+class RedactionEngine:
+    """Compiled multi-rule redactor for strings, streams, files and row exports"""
+
+    def __init__(self, rules: Optional[Sequence[RedactionRule]] = None,
+                 max_match_length: int = DEFAULT_MAX_MATCH_LENGTH):
+        self.rules = list(DEFAULT_REDACTION_RULES if rules is None else rules)
+        self.max_match_length = max_match_length
+        self._by_group: Dict[str, RedactionRule] = {}
+        alternatives = []
+        for index, rule in enumerate(self.rules):
+            if rule.style not in MASK_STYLES:
+                raise ValueError(f"Unknown mask style '{rule.style}' for rule '{rule.name}'")
+            if '(?P<' in rule.pattern:
+                raise ValueError(f"Rule '{rule.name}' must not use named groups")
+            group = f"r{index}"
+            self._by_group[group] = rule
+            alternatives.append(f"(?P<{group}>{rule.pattern})")
+        self._regex = re.compile('|'.join(alternatives)) if alternatives else None
+
+    def _mask(self, match: 're.Match') -> Tuple[Optional[RedactionRule], str]:
+        rule = self._by_group[match.lastgroup]
+        value = match.group()
+        if rule.validator is not None and not rule.validator(value):
+            return None, value
+        return rule, mask_value(value, rule.style, rule.replacement)
+
+    def redact_text(self, text: str, run: Optional[_Run] = None, **location: Any) -> str:
+        """Redact a whole string (offsets in the audit entries are within text)"""
+        if self._regex is None or not text:
+            return text
+        pieces = []
+        cursor = 0
+        for match in self._regex.finditer(text):
+            rule, masked = self._mask(match)
+            if rule is None:
+                continue
+            start, end = match.span()
+            pieces.append(text[cursor:start])
+            pieces.append(masked)
+            cursor = end
+            if run is not None:
+                run.record(rule.name, start, end, **location)
+        pieces.append(text[cursor:])
+        return ''.join(pieces)
+
+    def redact_stream(self, source: TextIO, sink: TextIO, name: str = "stream",
+                      entries: Optional[TextIO] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> RedactionManifest:
+        """
+        Redact a text stream into sink with constant memory.
+
+        Args:
+            source: Readable text stream
+            sink: Writable text stream
+            name: Source name for the manifest
+            entries: Optional text stream receiving one JSON line per redaction
+                (rule, start, end, line) with offsets into the source
+            chunk_size: Characters read per chunk
+
+        Returns:
+            Manifest of the run
+        """
+        run = _Run(RedactionManifest(source=name), entries)
+        overlap = self.max_match_length + 1
+        buffer = ''
+        base = 0          # source offset of buffer[0]
+        start = 0         # first buffer position not yet written
+        line = 1          # line number at buffer[start]
+        while True:
+            chunk = source.read(chunk_size)
+            final = not chunk
+            buffer += chunk
+            run.manifest.characters += len(chunk)
+            limit = len(buffer) if final else len(buffer) - overlap
+            if limit > start:
+                start, line = self._redact_window(buffer, start, limit, final, base, line, run, sink)
+            if final:
+                break
+            # Keep the unwritten tail plus some written context for lookbehinds
+            keep_from = max(0, start - CONTEXT_CHARS)
+            buffer = buffer[keep_from:]
+            base += keep_from
+            start -= keep_from
+        return run.finish()
+
+    def _redact_window(self, buffer: str, start: int, limit: int, final: bool, base: int, line: int,
+                       run: _Run, sink: TextIO) -> Tuple[int, int]:
+        """Write buffer[start:] up to limit, redacting matches that start before limit."""
+        pieces = []
+        cursor = start
+        line_cursor = start
+        stop = limit
+        end_of_buffer = len(buffer)
+        for match in self._regex.finditer(buffer, start) if self._regex is not None else ():
+            match_start, match_end = match.span()
+            if match_start >= limit or (not final and match_end >= end_of_buffer):
+                # May still grow or change with the next chunk
+                stop = min(limit, match_start)
+                break
+            rule, masked = self._mask(match)
+            if rule is not None:
+                line += buffer.count('\n', line_cursor, match_start)
+                line_cursor = match_start
+                run.record(rule.name, base + match_start, base + match_end, line=line)
+            # Rejected candidates are written as they are, but still consumed so
+            # the next window does not rescan their tail
+            pieces.append(buffer[cursor:match_start])
+            pieces.append(masked)
+            cursor = match_end
+        stop = max(stop, cursor)
+        pieces.append(buffer[cursor:stop])
+        run.emit(''.join(pieces), sink)
+        line += buffer.count('\n', line_cursor, stop)
+        return stop, line
+
+    def redact_file(self, source_path: str, target_path: str, entries_path: Optional[str] = None,
+                    encoding: str = 'utf-8', chunk_size: int = DEFAULT_CHUNK_SIZE) -> RedactionManifest:
+        """
+        Redact a file of any size into target_path.
+
+        Undecodable bytes are carried through unchanged (surrogateescape), so
+        binary noise in an export does not stop the redaction.
+        """
+        with open(source_path, 'r', encoding=encoding, errors='surrogateescape', newline='') as source, \
+                open(target_path, 'w', encoding=encoding, errors='surrogateescape', newline='') as sink:
+            if entries_path:
+                with open(entries_path, 'w', encoding='utf-8') as entries:
+                    manifest = self.redact_stream(source, sink, name=source_path, entries=entries,
+                                                  chunk_size=chunk_size)
+                manifest.entries_path = entries_path
+                return manifest
+            return self.redact_stream(source, sink, name=source_path, chunk_size=chunk_size)
+
+    def redact_rows(self, rows: Iterable[Sequence[Any]], manifest: RedactionManifest,
+                    entries: Optional[TextIO] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        Redact the string values of database rows as they stream past.
+
+        Audit entries locate redactions by row, column and offset in the value.
+        The manifest is complete once the generator is exhausted.
+        """
+        run = _Run(manifest, entries)
+        for row_number, row in enumerate(rows):
+            redacted = []
+            for column, value in enumerate(row):
+                if isinstance(value, str):
+                    manifest.characters += len(value)
+                    value = self.redact_text(value, run, row=row_number, column=column)
+                    run.emit(value)
+                redacted.append(value)
+            yield tuple(redacted)
+        run.finish()
+
+
+_default_engine: Optional[RedactionEngine] = None
+
+
+def get_redaction_engine() -> RedactionEngine:
+    """Process-wide engine with the default rules"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = RedactionEngine()
+    return _default_engine
@@ -25,6 +25,7 @@ from datetime import datetime
 import uuid
 
 from services.code_scanner import CodeScanner
+from services.finding_batch import FindingBatch, Severity
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -625,10 +626,10 @@ class RepoScanner:
                 
                 try:
                     # Process each file individually using the code scanner's file scanning method
-                    file_findings = self.code_scanner.scan_single_file(file_path)
+                    file_findings = self.code_scanner.scan_file(file_path)
                     
                     # Skip if no findings
-                    if not file_findings or not file_findings.get('findings'):
+                    if not file_findings or not file_findings.get('pii_found'):
                         scan_results['processed_files'] += 1
                         continue
                     
@@ -636,14 +637,11 @@ class RepoScanner:
                     rel_path = os.path.relpath(file_path, repo_path)
                     file_findings['file_path'] = rel_path
                     
-                    # Count risk levels
-                    for finding in file_findings.get('findings', []):
-                        if finding.get('risk_level') == 'high':
-                            scan_results['high_risk_count'] += 1
-                        elif finding.get('risk_level') == 'medium':
-                            scan_results['medium_risk_count'] += 1
-                        elif finding.get('risk_level') == 'low':
-                            scan_results['low_risk_count'] += 1
+                    # Count risk levels from the batch's severity codes
+                    risk_counts = FindingBatch.from_dicts(file_findings['pii_found']).severity_counts()
+                    scan_results['high_risk_count'] += risk_counts[Severity.HIGH]
+                    scan_results['medium_risk_count'] += risk_counts[Severity.MEDIUM]
+                    scan_results['low_risk_count'] += risk_counts[Severity.LOW]
                     
                     # Add file findings to overall results
                     scan_results['findings'].append(file_findings)
@@ -27,6 +27,7 @@ import uuid
 
 # Import translation utilities
 from utils.i18n import get_text, _
+from services.finding_batch import finding_rows
 
 class SustainabilityCertificateHeader(Flowable):
     """Professional certificate-style header for sustainability reports"""
@@ -2185,9 +2186,11 @@ def _generate_report_internal(scan_data: Dict[str, Any],
             for file_result in scan_data['detailed_results']:
                 file_name = file_result.get('file_name', 'Unknown')
                 
-                for pii_item in file_result.get('pii_found', []):
+                # Columnar batches are read column by column
+                pii_rows = finding_rows(file_result.get('pii_found', []),
+                                        ('type', 'value', 'location', 'risk_level'), 'Unknown')
+                for pii_type, pii_value, pii_location, original_risk_level in pii_rows:
                     # Translate risk level for display if needed
-                    original_risk_level = pii_item.get('risk_level', 'Unknown')
                     if current_lang == 'nl' and original_risk_level in ['High', 'Medium', 'Low']:
                         if original_risk_level == 'High':
                             displayed_risk_level = 'Hoog'
@@ -2200,9 +2203,9 @@ def _generate_report_internal(scan_data: Dict[str, Any],
                     
                     pii_item_data = [
                         file_name,
-                        pii_item.get('type', 'Unknown'),
-                        pii_item.get('value', 'Unknown'),
-                        pii_item.get('location', 'Unknown'),
+                        pii_type,
+                        pii_value,
+                        pii_location,
                         displayed_risk_level
                     ]
                     all_pii_items.append(pii_item_data)
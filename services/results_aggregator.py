@@ -1,20 +1,37 @@
 import os
 import json
 import uuid
+import threading
 import psycopg2
 import logging
 from psycopg2.extras import Json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 
 # Import encryption service for PII protection
 try:
     from .encryption_service import get_encryption_service
+    from .finding_batch import dumps as finding_batch_dumps
     from .multi_tenant_service import MultiTenantService
+    from .scan_rollups import (
+        USER_METRICS_SQL, ORG_METRICS_SQL, USER_SERIES_SQL, ORG_SERIES_SQL,
+        summarize_scan_result, apply_rollup_delta, metrics_from_row, ScanSummary
+    )
+    from .schema_migrations import ensure_schema
+    from .subject_index import get_subject_index
 except ImportError:
     # Fallback for direct execution
     from encryption_service import get_encryption_service
+    from finding_batch import dumps as finding_batch_dumps
     from multi_tenant_service import MultiTenantService
+    from scan_rollups import (
+        USER_METRICS_SQL, ORG_METRICS_SQL, USER_SERIES_SQL, ORG_SERIES_SQL,
+        summarize_scan_result, apply_rollup_delta, metrics_from_row, ScanSummary
+    )
+    from schema_migrations import ensure_schema
+    from subject_index import get_subject_index
+
+from utils.redis_cache import get_compliance_cache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +46,10 @@ def _get_cached_multi_tenant_service():
         logger.info("Multi-tenant service initialized (cached globally)")
     return _cached_multi_tenant_service
 
+# Process-wide shared aggregator
+_shared_results_aggregator = None
+_shared_results_aggregator_lock = threading.Lock()
+
 class ResultsAggregator:
     """
     Aggregates and stores scan results in a PostgreSQL database with enterprise-grade security.
@@ -107,146 +128,19 @@ class ResultsAggregator:
         os.makedirs('reports', exist_ok=True)
     
     def _init_db(self):
-        """Initialize the database with required tables if they don't exist."""
-        conn = self._get_secure_connection('system_admin', admin_bypass=True)
-        if not conn:
-            print("No database connection available. Using file-based storage.")
-            self.use_file_storage = True
-            self._init_file_storage()
-            return
-            
+        """
+        Ensure the database schema is current.
+        
+        Tables and indexes are managed by the versioned migrations in
+        database/migrations, which run once per process (or at deploy time),
+        so constructing an aggregator issues no DDL.
+        """
+        if not self.db_url:
+            raise RuntimeError("DATABASE_URL environment variable required for enterprise deployment")
         try:
-            cursor = conn.cursor()
-            
-            # Create optimized scans table with performance indexes
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS scans (
-                scan_id TEXT PRIMARY KEY,
-                username TEXT NOT NULL,
-                timestamp TIMESTAMP NOT NULL,
-                scan_type TEXT NOT NULL,
-                region TEXT NOT NULL,
-                file_count INTEGER NOT NULL,
-                total_pii_found INTEGER NOT NULL,
-                high_risk_count INTEGER NOT NULL,
-                result_json JSONB NOT NULL,
-                organization_id TEXT NOT NULL DEFAULT 'default_org'
-            )
-            ''')
-            
-            # Add performance indexes for common queries
-            performance_indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_scans_username_timestamp ON scans(username, timestamp DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_scans_organization_timestamp ON scans(organization_id, timestamp DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_scans_scan_type ON scans(scan_type)",
-                "CREATE INDEX IF NOT EXISTS idx_scans_timestamp ON scans(timestamp DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_scans_composite ON scans(username, organization_id, timestamp DESC)"
-            ]
-            
-            for index_sql in performance_indexes:
-                try:
-                    cursor.execute(index_sql)
-                    logger.debug(f"Created performance index: {index_sql.split()[5]}")
-                except Exception as index_error:
-                    logger.debug(f"Index creation note: {index_error}")
-            
-            # Migration: Add organization_id column if it doesn't exist (for existing databases)
-            # Note: Check if column exists first to avoid transaction abort
-            try:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name='scans' AND column_name='organization_id'
-                """)
-                if cursor.fetchone() is None:
-                    cursor.execute('''
-                    ALTER TABLE scans ADD COLUMN organization_id TEXT NOT NULL DEFAULT 'default_org'
-                    ''')
-                    logger.info("Added organization_id column to existing scans table")
-                else:
-                    logger.debug("Migration note: organization_id column already exists")
-            except Exception as migration_error:
-                # If check fails, rollback and continue
-                conn.rollback()
-                logger.debug(f"Migration note: {migration_error}")
-            
-            # Create optimized audit log table with performance indexes
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS audit_log (
-                log_id TEXT PRIMARY KEY,
-                username TEXT NOT NULL,
-                action TEXT NOT NULL,
-                timestamp TIMESTAMP NOT NULL,
-                details JSONB
-            )
-            ''')
-            
-            # Add performance indexes for audit log
-            audit_indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_audit_username_timestamp ON audit_log(username, timestamp DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action)",
-                "CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp DESC)"
-            ]
-            
-            for index_sql in audit_indexes:
-                try:
-                    cursor.execute(index_sql)
-                except Exception as index_error:
-                    logger.debug(f"Audit index note: {index_error}")
-            
-            # Create PII types reference table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS pii_types (
-                type_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                risk_level TEXT NOT NULL,
-                gdpr_article TEXT
-            )
-            ''')
-            
-            # Create compliance scores table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS compliance_scores (
-                score_id TEXT PRIMARY KEY,
-                username TEXT NOT NULL,
-                repo_name TEXT NOT NULL,
-                scan_id TEXT NOT NULL,
-                timestamp TIMESTAMP NOT NULL,
-                overall_score INTEGER NOT NULL,
-                principle_scores JSONB NOT NULL
-            )
-            ''')
-            
-            # Create GDPR principles reference table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS gdpr_principles (
-                principle_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT NOT NULL,
-                article TEXT NOT NULL
-            )
-            ''')
-            
-            # Create user sessions table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_sessions (
-                session_id TEXT PRIMARY KEY,
-                username TEXT NOT NULL,
-                login_time TIMESTAMP NOT NULL,
-                last_activity TIMESTAMP NOT NULL,
-                ip_address TEXT,
-                user_agent TEXT
-            )
-            ''')
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            ensure_schema(self.db_url)
         except Exception as e:
-            logger.error(f"Error creating database tables: {str(e)}")
-            if conn:
-                conn.close()
+            logger.error(f"Error applying database migrations: {str(e)}")
             # Enterprise security: Fail secure - no file fallback for PII data
             raise RuntimeError(f"Database initialization required for enterprise security compliance: {str(e)}")
     
@@ -284,8 +178,10 @@ class ResultsAggregator:
         scan_type = result.get('scan_type', 'unknown')
         region = result.get('region', 'Netherlands')  # Default to Netherlands for GDPR
         file_count = result.get('files_scanned', 0)
-        total_pii = result.get('total_pii_found', 0)
-        high_risk = result.get('high_risk_count', 0)
+        
+        # Summary values are computed once here, before findings are encrypted
+        summary = summarize_scan_result(result)
+        timestamp = datetime.now()
         
         try:
             # Validate tenant access
@@ -300,36 +196,75 @@ class ResultsAggregator:
             conn = self._get_secure_connection(organization_id)
             cursor = conn.cursor()
             
+            # Serialise stores of the same scan: FOR UPDATE cannot lock a row that
+            # does not exist yet, so two first inserts would both add to the rollups
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (scan_id,))
+            
+            # A re-stored scan replaces its previous contribution to the rollups
+            cursor.execute("""
+            SELECT username, organization_id, timestamp, total_pii_found, high_risk_count,
+                   critical_count, compliance_score
+            FROM scans WHERE scan_id = %s
+            FOR UPDATE
+            """, (scan_id,))
+            previous = cursor.fetchone()
+            if previous:
+                apply_rollup_delta(cursor, previous[1], previous[0], previous[2].date(),
+                                   ScanSummary(previous[3], previous[4], previous[5], previous[6]),
+                                   sign=-1)
+            
             # Store encrypted result in database with organization_id for tenant isolation
             cursor.execute("""
             INSERT INTO scans 
-            (scan_id, username, timestamp, scan_type, region, file_count, total_pii_found, high_risk_count, result_json, organization_id)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            (scan_id, username, timestamp, scan_type, region, file_count, total_pii_found, high_risk_count,
+             critical_count, compliance_score, result_json, organization_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON CONFLICT (scan_id) DO UPDATE SET
             timestamp = EXCLUDED.timestamp,
             region = EXCLUDED.region,
             file_count = EXCLUDED.file_count,
             total_pii_found = EXCLUDED.total_pii_found,
             high_risk_count = EXCLUDED.high_risk_count,
+            critical_count = EXCLUDED.critical_count,
+            compliance_score = EXCLUDED.compliance_score,
             result_json = EXCLUDED.result_json,
             organization_id = EXCLUDED.organization_id
             """, (
                 scan_id,
                 username,
-                datetime.now(),
+                timestamp,
                 scan_type,
                 region,
                 file_count,
-                total_pii,
-                high_risk,
-                Json(encrypted_result),  # Store encrypted version
+                summary.total_pii_found,
+                summary.high_risk_count,
+                summary.critical_count,
+                summary.compliance_score,
+                Json(encrypted_result, dumps=finding_batch_dumps),  # Store encrypted version
                 organization_id  # Add organization_id for tenant isolation
             ))
             
+            # Username is not updated on conflict, so the stored owner keeps the scan
+            owner = previous[0] if previous else username
+            apply_rollup_delta(cursor, organization_id, owner, timestamp.date(), summary)
+            
             conn.commit()
             cursor.close()
             conn.close()
             
+            # Cached compliance series and forecasts now miss this scan
+            compliance_cache = get_compliance_cache()
+            compliance_cache.invalidate_tenant(organization_id)
+            if previous and previous[1] != organization_id:
+                compliance_cache.invalidate_tenant(previous[1])
+            
+            # Subject identifiers in the findings feed DSAR discovery; the scan is
+            # already stored, so an index failure only costs a later live search
+            try:
+                get_subject_index().index_scan_result(organization_id, result)
+            except Exception as e:
+                logger.warning(f"Subject index update failed for scan {scan_id}: {e}")
+            
             # Update tenant usage statistics
             self.multi_tenant_service.update_tenant_usage(organization_id, increment_scans=1)
             
@@ -461,7 +396,7 @@ class ResultsAggregator:
                         UPDATE scans 
                         SET result_json = %s 
                         WHERE scan_id = %s
-                    """, (Json(encrypted_result), scan_id))
+                    """, (Json(encrypted_result, dumps=finding_batch_dumps), scan_id))
                     
                     migrated_count += 1
                     logger.info(f"Migrated legacy record: {scan_id}")
@@ -527,7 +462,6 @@ class ResultsAggregator:
             return scans
         except Exception as e:
             print(f"Error retrieving user scans: {str(e)}")
-            self.use_file_storage = True
             return self._get_user_scans_file(username, limit)
     
     def _get_user_scans_file(self, username: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -647,9 +581,85 @@ class ResultsAggregator:
             return scans
         except Exception as e:
             print(f"Error retrieving recent scans: {str(e)}")
-            self.use_file_storage = True
             return self._get_recent_scans_file(days, username)
     
+    def get_dashboard_metrics(self, days: int = 30, username: Optional[str] = None,
+                              organization_id: str = 'default_org') -> Dict[str, Any]:
+        """
+        Get dashboard metrics from the daily rollup tables in one indexed query.
+        
+        Cost depends on the number of days in the window, not on the number
+        of stored scans.
+        
+        Args:
+            days: Number of days to look back
+            username: Optional username filter (organization-wide if None)
+            organization_id: Organization ID for tenant isolation
+            
+        Returns:
+            Dictionary with total_scans, total_pii_found, high_risk_count,
+            critical_count, compliance_score_sum, compliance_score_count and
+            average_compliance_score
+        """
+        cutoff_day = (datetime.now() - timedelta(days=days)).date()
+        try:
+            conn = self._get_secure_connection(organization_id)
+            cursor = conn.cursor()
+            if username:
+                cursor.execute(USER_METRICS_SQL, (organization_id, username, cutoff_day))
+            else:
+                cursor.execute(ORG_METRICS_SQL, (organization_id, cutoff_day))
+            row = cursor.fetchone()
+            cursor.close()
+            conn.close()
+            return metrics_from_row(row)
+        except Exception as e:
+            logger.error(f"Error retrieving dashboard metrics: {str(e)}")
+            return metrics_from_row(None)
+    
+    def get_compliance_series(self, username: Optional[str] = None, organization_id: str = 'default_org',
+                              days: Optional[int] = None) -> List[List[Any]]:
+        """
+        Get the daily compliance series from the rollup tables.
+        
+        Rows are cached per tenant until its next stored scan, so repeated
+        forecasts over years of history cost one cache read.
+        
+        Args:
+            username: Optional username filter (organization-wide if None)
+            organization_id: Organization ID for tenant isolation
+            days: Number of days to look back (whole history if None)
+            
+        Returns:
+            [day (ISO date), scan_count, total_pii_found, high_risk_count,
+            critical_count, risk_score_sum] rows in day order
+        """
+        compliance_cache = get_compliance_cache()
+        cache_key = f"series:{username or '*'}:{days or 'all'}"
+        rows = compliance_cache.get(organization_id, cache_key)
+        if rows is not None:
+            return rows
+        
+        cutoff_day = (datetime.now() - timedelta(days=days)).date() if days else date.min
+        try:
+            conn = self._get_secure_connection(organization_id)
+            cursor = conn.cursor()
+            if username:
+                cursor.execute(USER_SERIES_SQL, (organization_id, username, cutoff_day))
+            else:
+                cursor.execute(ORG_SERIES_SQL, (organization_id, cutoff_day))
+            rows = [[day.isoformat(), int(scan_count), int(total_pii), int(high_risk), int(critical),
+                     float(score_sum)]
+                    for day, scan_count, total_pii, high_risk, critical, score_sum in cursor.fetchall()]
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error retrieving compliance series: {str(e)}")
+            return []
+        
+        compliance_cache.set(organization_id, cache_key, rows)
+        return rows
+    
     def _get_recent_scans_file(self, days: int = 30, username: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get recent scans from file storage."""
         try:
@@ -726,7 +736,6 @@ class ResultsAggregator:
             logger.info(f"Audit event logged for organization {organization_id}: {action} by {username}")
         except Exception as e:
             print(f"Error logging audit event: {str(e)}")
-            self.use_file_storage = True
             self._log_user_action_file(log_id, username, action, details)
     
     # For backward compatibility
@@ -800,7 +809,6 @@ class ResultsAggregator:
         try:
             conn = self._get_secure_connection(organization_id)
             if not conn:
-                self.use_file_storage = True
                 return self._get_scan_by_id_file(scan_id)
             
             cursor = conn.cursor()
@@ -830,7 +838,6 @@ class ResultsAggregator:
             
         except Exception as e:
             print(f"Error retrieving scan by ID: {str(e)}")
-            self.use_file_storage = True
             return self._get_scan_by_id_file(scan_id)
     
     def _get_scan_by_id_file(self, scan_id: str) -> Optional[Dict[str, Any]]:
@@ -871,7 +878,6 @@ class ResultsAggregator:
         try:
             conn = self._get_secure_connection(organization_id)
             if not conn:
-                self.use_file_storage = True
                 self._store_compliance_score_file(score_id, username, repo_name, scan_id,
                                               overall_score, principle_scores)
                 return
@@ -898,7 +904,6 @@ class ResultsAggregator:
             conn.close()
         except Exception as e:
             print(f"Error storing compliance score: {str(e)}")
-            self.use_file_storage = True
             self._store_compliance_score_file(score_id, username, repo_name, scan_id,
                                           overall_score, principle_scores)
     
@@ -953,7 +958,6 @@ class ResultsAggregator:
         try:
             conn = self._get_secure_connection(organization_id)
             if not conn:
-                self.use_file_storage = True
                 return self._get_user_compliance_history_file(username, repo_name, days)
             
             cursor = conn.cursor()
@@ -996,7 +1000,6 @@ class ResultsAggregator:
             return history
         except Exception as e:
             print(f"Error retrieving compliance history: {str(e)}")
-            self.use_file_storage = True
             return self._get_user_compliance_history_file(username, repo_name, days)
     
     def _get_user_compliance_history_file(self, username: str, repo_name: Optional[str] = None,
@@ -1046,4 +1049,19 @@ class ResultsAggregator:
         Returns:
             List of scan metadata dictionaries
         """
-        return self.get_user_scans(username, limit)
\ No newline at end of file
+        return self.get_user_scans(username, limit)
+
+
+def get_results_aggregator() -> ResultsAggregator:
+    """
+    Get the process-wide shared ResultsAggregator instance.
+
+    The instance is shared by every session: a failed database call falls
+    back to file storage for that call only and never changes its storage mode.
+    """
+    global _shared_results_aggregator
+    if _shared_results_aggregator is None:
+        with _shared_results_aggregator_lock:
+            if _shared_results_aggregator is None:
+                _shared_results_aggregator = ResultsAggregator()
+    return _shared_results_aggregator
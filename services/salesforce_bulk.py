@@ -0,0 +1,316 @@
+"""
+Salesforce Bulk API 2.0 Helpers
+
+Building blocks for scanning whole Salesforce objects instead of samples:
+
+- BulkQueryClient: runs Bulk API 2.0 query jobs and streams the CSV result
+  pages row by row (Sforce-Locator paging), with a REST query fallback that
+  follows nextRecordsUrl for objects the Bulk API does not support
+- ApiBudgetGovernor: shared budget of API calls and concurrent requests for
+  all objects scanned in parallel, seeded from the org's DailyApiRequests
+  limit so a scan never exhausts the calls other integrations depend on
+- WatermarkStore: highest SystemModstamp seen per org and object, so
+  rescans only read records modified since the last complete scan
+
+Result pages are decoded straight from the socket; memory does not grow
+with the size of the object.
+"""
+
+import codecs
+import csv
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("salesforce_bulk")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Objects scanned at once
+SALESFORCE_WORKERS = int(os.environ.get("DG_SALESFORCE_WORKERS", "4"))
+
+# Share of the daily API limit left untouched for other integrations
+API_BUDGET_RESERVE = float(os.environ.get("DG_SALESFORCE_API_RESERVE", "0.2"))
+
+WATERMARK_PATH = os.environ.get("DG_SALESFORCE_WATERMARKS", os.path.join("data", "salesforce_watermarks.json"))
+
+REQUEST_TIMEOUT = 60
+# Records per Bulk API result page (service maximum is much higher; pages
+# are streamed, so this only bounds the calls per object)
+BULK_PAGE_RECORDS = 100000
+BULK_POLL_INTERVAL = 1.0
+BULK_POLL_MAX_INTERVAL = 10.0
+BULK_JOB_TIMEOUT = 3600
+
+STREAM_CHUNK_BYTES = 256 * 1024
+CSV_FIELD_LIMIT = 32 * 1024 * 1024  # long text areas
+
+
+def _iter_lines(response: requests.Response) -> Iterator[str]:
+    """Decoded lines of a streamed response, newline kept (csv needs it inside quoted fields)"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    tail = ''
+    for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+        *lines, tail = (tail + decoder.decode(chunk)).split('\n')
+        for line in lines:
+            yield line + '\n'
+    tail += decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+class ApiBudgetExceeded(Exception):
+    """The scan used up its share of the org's API calls"""
+
+
+class BulkQueryError(Exception):
+    """A Bulk API query job could not be created or failed"""
+
+
+class ApiBudgetGovernor:
+    """API call budget and concurrency limit shared by parallel object scans"""
+
+    def __init__(self, max_calls: Optional[int] = None, max_concurrent: int = SALESFORCE_WORKERS):
+        """
+        Args:
+            max_calls: Calls the scan may make (None: unlimited until synced)
+            max_concurrent: Requests in flight at once
+        """
+        self.remaining = max_calls
+        self.used = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+
+    def sync_from_limits(self, limits: Dict[str, Any], reserve: float = API_BUDGET_RESERVE) -> Optional[int]:
+        """
+        Cap the budget by the org's remaining daily API requests.
+
+        Args:
+            limits: Response of the /limits resource
+            reserve: Share of the daily maximum kept for other integrations
+
+        Returns:
+            Calls left for the scan, or None if the org reported no limit
+        """
+        daily = limits.get('DailyApiRequests') or {}
+        if 'Remaining' not in daily:
+            return self.remaining
+        allowed = max(0, int(daily['Remaining']) - int(int(daily.get('Max', 0)) * reserve))
+        with self._lock:
+            self.remaining = allowed if self.remaining is None else min(self.remaining, allowed)
+            return self.remaining
+
+    @contextmanager
+    def call(self) -> Iterator[None]:
+        """Reserve one API call and a concurrency slot for its duration."""
+        with self._lock:
+            if self.remaining is not None:
+                if self.remaining <= 0:
+                    raise ApiBudgetExceeded(f"API budget exhausted after {self.used} calls")
+                self.remaining -= 1
+            self.used += 1
+        with self._slots:
+            yield
+
+
+class WatermarkStore:
+    """JSON file of the highest SystemModstamp per org and object"""
+
+    def __init__(self, path: str = WATERMARK_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._marks: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        if self._marks is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._marks = json.load(f)
+            except (OSError, ValueError):
+                self._marks = {}
+        return self._marks
+
+    @staticmethod
+    def key(org: str, object_name: str) -> str:
+        return f"{org}|{object_name}"
+
+    def get(self, org: str, object_name: str) -> Optional[str]:
+        with self._lock:
+            return self._load().get(self.key(org, object_name))
+
+    def _write(self, marks: Dict[str, str]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(marks, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def set(self, org: str, object_name: str, watermark: str) -> None:
+        with self._lock:
+            marks = self._load()
+            marks[self.key(org, object_name)] = watermark
+            self._write(marks)
+
+    def clear(self, org: str, object_name: str) -> None:
+        with self._lock:
+            marks = self._load()
+            if marks.pop(self.key(org, object_name), None) is not None:
+                self._write(marks)
+
+
+class BulkQueryClient:
+    """Bulk API 2.0 query jobs and paged REST queries for one org"""
+
+    def __init__(self, instance_url: str, api_version: str, token_provider: Callable[[bool], Optional[str]],
+                 governor: Optional[ApiBudgetGovernor] = None, poll_interval: float = BULK_POLL_INTERVAL,
+                 page_records: int = BULK_PAGE_RECORDS):
+        """
+        Args:
+            instance_url: Org instance URL
+            api_version: REST API version, e.g. "v58.0"
+            token_provider: Returns the access token; called with True to
+                force re-authentication after a 401
+            governor: Shared API budget (default: unlimited)
+            poll_interval: Initial delay between job status polls
+            page_records: Records per result page
+        """
+        self.instance_url = instance_url.rstrip('/')
+        self.base_url = f"{self.instance_url}/services/data/{api_version}"
+        self.token_provider = token_provider
+        self.governor = governor or ApiBudgetGovernor()
+        self.poll_interval = poll_interval
+        self.page_records = page_records
+        self._local = threading.local()
+        csv.field_size_limit(CSV_FIELD_LIMIT)
+
+    def _get_session(self) -> requests.Session:
+        """Thread-local session so each worker keeps its connection alive"""
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a budgeted request, re-authenticating once on 401"""
+        if path.startswith('http'):
+            url = path
+        elif path.startswith('/services/'):
+            url = f"{self.instance_url}{path}"  # nextRecordsUrl
+        else:
+            url = f"{self.base_url}/{path}"
+        headers = kwargs.pop('headers', None) or {}
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        for attempt in range(2):
+            token = self.token_provider(attempt > 0)
+            if not token:
+                raise BulkQueryError("Salesforce authentication failed")
+            with self.governor.call():
+                response = self._get_session().request(
+                    method, url, headers=dict(headers, Authorization=f'Bearer {token}'), **kwargs)
+            if response.status_code != 401:
+                break
+            response.close()
+        return response
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        response = self.request('GET', path, params=params)
+        if response.status_code != 200:
+            logger.warning(f"Salesforce request failed ({response.status_code}): {path}")
+            return None
+        return response.json()
+
+    def create_query_job(self, soql: str) -> str:
+        response = self.request('POST', 'jobs/query', json={
+            'operation': 'query', 'query': soql, 'contentType': 'CSV',
+            'columnDelimiter': 'COMMA', 'lineEnding': 'LF'
+        })
+        if response.status_code not in (200, 201):
+            raise BulkQueryError(f"Query job rejected ({response.status_code}): {response.text[:500]}")
+        return response.json()['id']
+
+    def wait_for_job(self, job_id: str, timeout: float = BULK_JOB_TIMEOUT) -> Dict[str, Any]:
+        """Poll the job with growing intervals until it completes."""
+        deadline = time.monotonic() + timeout
+        delay = self.poll_interval
+        while True:
+            job = self.get_json(f'jobs/query/{job_id}')
+            if job is None:
+                raise BulkQueryError(f"Could not read status of query job {job_id}")
+            state = job.get('state')
+            if state == 'JobComplete':
+                return job
+            if state in ('Failed', 'Aborted'):
+                raise BulkQueryError(f"Query job {job_id} {state.lower()}: {job.get('errorMessage', '')}")
+            if time.monotonic() + delay > deadline:
+                raise BulkQueryError(f"Query job {job_id} did not complete within {timeout:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, BULK_POLL_MAX_INTERVAL)
+
+    def iter_job_results(self, job_id: str) -> Iterator[List[str]]:
+        """
+        Stream the CSV result pages of a completed job.
+
+        Yields:
+            The header row, then every record as a list of strings
+        """
+        locator = None
+        header_sent = False
+        while True:
+            params = {'maxRecords': self.page_records}
+            if locator:
+                params['locator'] = locator
+            response = self.request('GET', f'jobs/query/{job_id}/results', params=params, stream=True,
+                                    headers={'Accept': 'text/csv'})
+            if response.status_code != 200:
+                response.close()
+                raise BulkQueryError(f"Result page of job {job_id} failed ({response.status_code})")
+            try:
+                rows = csv.reader(_iter_lines(response))
+                header = next(rows, None)
+                if header is not None and not header_sent:
+                    header_sent = True
+                    yield header
+                yield from rows
+            finally:
+                response.close()
+            locator = response.headers.get('Sforce-Locator')
+            if not locator or locator == 'null':
+                return
+
+    def job_rows(self, job_id: str) -> Iterator[List[str]]:
+        """Wait for a query job and stream its rows (header first)."""
+        job = self.wait_for_job(job_id)
+        logger.info(f"Query job {job_id} complete: {job.get('numberRecordsProcessed', '?')} records")
+        yield from self.iter_job_results(job_id)
+
+    def rest_query_rows(self, soql: str, columns: List[str]) -> Iterator[List[str]]:
+        """
+        Run soql through the REST query resource, following nextRecordsUrl.
+
+        Yields:
+            columns, then every record as a list of strings in that order
+
+        Raises:
+            BulkQueryError: If a page cannot be read, so a partial read is
+                never taken for the whole result
+        """
+        yield columns
+        payload = self.get_json('query', params={'q': soql})
+        while True:
+            if payload is None:
+                raise BulkQueryError(f"REST query page failed: {soql[:200]}")
+            for record in payload.get('records', []):
+                yield ['' if record.get(column) is None else str(record[column]) for column in columns]
+            next_url = payload.get('nextRecordsUrl')
+            if not next_url:
+                return
+            payload = self.get_json(next_url)
@@ -1,17 +1,64 @@
 """
 Salesforce Connector for DataGuardian Pro
 Enterprise-grade integration for Salesforce data privacy scanning
+
+Object data is read in full through Bulk API 2.0 query jobs whose CSV
+result pages are streamed and classified column by column in batches
+(services.salesforce_bulk). Objects are scanned in parallel under one
+shared API budget, and SystemModstamp watermarks let rescans read only
+records modified since the last complete scan.
 """
 
 import os
+import re
 import json
+import logging
+import threading
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import compress, islice
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 import base64
 import urllib.parse
 from dataclasses import dataclass
-import streamlit as st
+
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
+try:
+    from .salesforce_bulk import (ApiBudgetExceeded, ApiBudgetGovernor, BulkQueryClient, BulkQueryError,
+                                  WatermarkStore, SALESFORCE_WORKERS)
+    from .cloud_inventory import bounded_map
+except ImportError:
+    from services.salesforce_bulk import (ApiBudgetExceeded, ApiBudgetGovernor, BulkQueryClient, BulkQueryError,
+                                          WatermarkStore, SALESFORCE_WORKERS)
+    from services.cloud_inventory import bounded_map
+
+logger = logging.getLogger(__name__)
+
+# Records classified together, column by column
+CLASSIFY_BATCH_ROWS = 10000
+
+# Masked example findings kept per field (counts cover every record)
+MAX_SAMPLES_PER_FIELD = 5
+
+WATERMARK_FIELD = 'SystemModstamp'
+
+# Column matchers mirroring SalesforceConnector._is_pii_value
+_EMAIL_LIKE = r'(?=.*@)(?=.*\.)'
+_PHONE_LIKE = r'\s*(?:[ ()\-]*[^ ()\-]){10}'
+_SSN_LIKE = r'\s*(?:-*[^\-\s]){9}-*\s*\Z'
+_NAME_LIKE = r'\s*[^\W\d_](?: *[^\W\d_])*\s*\Z'
+
+
+def _report_error(message: str) -> None:
+    """Log an error and show it in the UI when running under Streamlit"""
+    logger.error(message)
+    if STREAMLIT_AVAILABLE:
+        st.error(message)
 
 @dataclass
 class SalesforceConfig:
@@ -26,6 +73,9 @@ class SalesforceConfig:
     
     @property
     def login_url(self) -> str:
+        override = os.environ.get("DG_SALESFORCE_LOGIN_URL")  # e.g. a local mock org
+        if override:
+            return override.rstrip('/')
         return "https://test.salesforce.com" if self.sandbox else "https://login.salesforce.com"
 
 @dataclass
@@ -40,12 +90,24 @@ class SalesforceObject:
 class SalesforceConnector:
     """Salesforce data connector for privacy compliance scanning"""
     
-    def __init__(self, config: SalesforceConfig):
+    def __init__(self, config: SalesforceConfig, governor: Optional[ApiBudgetGovernor] = None,
+                 watermarks: Optional[WatermarkStore] = None):
+        """
+        Args:
+            config: Connection configuration
+            governor: API budget shared by all requests of this connector
+            watermarks: SystemModstamp watermarks for incremental scans
+        """
         self.config = config
         self.session_id = None
         self.instance_url = None
         self.access_token = None
         self.token_expires_at = None
+        self.governor = governor or ApiBudgetGovernor()
+        self.watermarks = watermarks or WatermarkStore()
+        self._auth_lock = threading.Lock()
+        self._bulk_client: Optional[BulkQueryClient] = None
+        self._column_matchers: Dict[Tuple[str, bool], Tuple[Any, bool, str, str]] = {}
         
     def authenticate(self) -> bool:
         """Authenticate with Salesforce using OAuth 2.0 Username-Password flow"""
@@ -76,11 +138,11 @@ class SalesforceConnector:
                 return True
             else:
                 error_msg = response.json().get('error_description', 'Authentication failed')
-                st.error(f"Salesforce authentication failed: {error_msg}")
+                _report_error(f"Salesforce authentication failed: {error_msg}")
                 return False
                 
         except Exception as e:
-            st.error(f"Salesforce authentication error: {str(e)}")
+            _report_error(f"Salesforce authentication error: {str(e)}")
             return False
     
     def _ensure_authenticated(self) -> bool:
@@ -89,36 +151,49 @@ class SalesforceConnector:
             return self.authenticate()
         return True
     
+    def _token(self, force_refresh: bool = False) -> Optional[str]:
+        """Current access token; parallel scans share one (re-)authentication"""
+        with self._auth_lock:
+            if not (self.authenticate() if force_refresh else self._ensure_authenticated()):
+                return None
+            return self.access_token
+    
+    @property
+    def bulk_client(self) -> BulkQueryClient:
+        """Bulk API 2.0 client of the authenticated org"""
+        if self._bulk_client is None:
+            if not self._token():
+                raise BulkQueryError("Salesforce authentication failed")
+            self._bulk_client = BulkQueryClient(self.instance_url, self.config.api_version, self._token,
+                                                governor=self.governor)
+        return self._bulk_client
+    
+    def sync_api_budget(self) -> Optional[int]:
+        """Cap the scan's API budget by the org's remaining daily API requests."""
+        limits = self.bulk_client.get_json('limits')
+        return self.governor.sync_from_limits(limits) if limits else self.governor.remaining
+    
     def _make_api_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Optional[Dict]:
-        """Make authenticated API request to Salesforce"""
-        if not self._ensure_authenticated():
+        """Make authenticated API request to Salesforce (counted against the API budget)"""
+        if method not in ('GET', 'POST'):
             return None
         
-        url = f"{self.instance_url}/services/data/{self.config.api_version}/{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json'
-        }
-        
         try:
             # Add timeout for all API requests
             timeout = int(os.getenv('SALESFORCE_TIMEOUT', '30'))
-            
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data or {}, timeout=timeout)
-            else:
-                return None
+            kwargs = {'json': data or {}} if method == 'POST' else {}
+            response = self.bulk_client.request(method, endpoint, timeout=timeout, **kwargs)
             
             if response.status_code == 200:
                 return response.json()
             else:
-                st.error(f"Salesforce API error: {response.status_code} - {response.text}")
+                _report_error(f"Salesforce API error: {response.status_code} - {response.text}")
                 return None
-                
+        
+        except ApiBudgetExceeded:
+            raise
         except Exception as e:
-            st.error(f"Salesforce API request error: {str(e)}")
+            _report_error(f"Salesforce API request error: {str(e)}")
             return None
     
     def get_sobjects(self) -> List[SalesforceObject]:
@@ -204,8 +279,23 @@ class SalesforceConnector:
             return result['totalSize']
         return 0
     
-    def scan_object_data(self, object_name: str, limit: int = 100) -> Dict[str, Any]:
-        """Scan object data for PII content"""
+    def scan_object_data(self, object_name: str, limit: Optional[int] = None,
+                         incremental: bool = False) -> Dict[str, Any]:
+        """
+        Scan every record of an object for PII content.
+        
+        Records are read through a Bulk API 2.0 query job (REST query with
+        nextRecordsUrl paging for objects the Bulk API does not support) and
+        classified column by column in batches of CLASSIFY_BATCH_ROWS.
+        
+        Args:
+            object_name: sObject API name
+            limit: Optional cap on the records read (no watermark is stored)
+            incremental: Only read records modified since the last complete scan
+        
+        Returns:
+            Scan result with per-field match counts and masked sample findings
+        """
         fields = self.get_object_fields(object_name)
         high_pii_fields = [f['name'] for f in fields if f['pii_potential'] == 'HIGH']
         
@@ -214,46 +304,168 @@ class SalesforceConnector:
                 'object_name': object_name,
                 'pii_found': 0,
                 'findings': [],
-                'field_analysis': fields
+                'field_analysis': fields,
+                'records_scanned': 0
             }
         
-        # Query sample data
-        field_list = ', '.join(high_pii_fields[:10])  # Limit to 10 fields to avoid query length issues
-        query = f"SELECT {field_list} FROM {object_name} LIMIT {limit}"
-        
-        result = self._make_api_request(f'query?q={urllib.parse.quote(query)}')
-        
-        if not result:
-            return {
-                'object_name': object_name,
-                'pii_found': 0,
-                'findings': [],
-                'field_analysis': fields
-            }
-        
-        findings = []
-        records = result.get('records', [])
-        
-        for record in records:
-            for field_name in high_pii_fields:
-                value = record.get(field_name)
-                if value and self._is_pii_value(value, field_name):
-                    findings.append({
-                        'field': field_name,
-                        'type': self._classify_pii_type(field_name, value),
-                        'value_sample': self._mask_value(value),
-                        'record_id': record.get('Id', 'Unknown'),
-                        'severity': 'HIGH' if field_name.lower() in ['email', 'phone', 'ssn'] else 'MEDIUM'
-                    })
+        field_names = {f['name'] for f in fields}
+        columns = ['Id'] + [name for name in high_pii_fields if name != 'Id']
+        has_watermark = WATERMARK_FIELD in field_names
+        if has_watermark and WATERMARK_FIELD not in columns:
+            columns.append(WATERMARK_FIELD)
+        
+        org = self.instance_url or self.config.username
+        previous_watermark = self.watermarks.get(org, object_name) if incremental and has_watermark else None
+        query = f"SELECT {', '.join(columns)} FROM {object_name}"
+        if previous_watermark:
+            query += f" WHERE {WATERMARK_FIELD} > {previous_watermark}"
+        if has_watermark:
+            query += f" ORDER BY {WATERMARK_FIELD}"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        
+        rows, mode = self._query_rows(query, columns)
+        header = next(rows, columns)
+        position = {name: index for index, name in enumerate(header)}
+        
+        summary: Dict[str, Dict[str, Any]] = {}
+        findings: List[Dict[str, Any]] = []
+        records_scanned = 0
+        watermark = previous_watermark
+        while True:
+            batch = list(islice(rows, CLASSIFY_BATCH_ROWS))
+            if not batch:
+                break
+            records_scanned += len(batch)
+            batch_columns = list(zip(*batch))
+            self._classify_batch(batch_columns, position, high_pii_fields, summary, findings)
+            if WATERMARK_FIELD in position:
+                batch_max = max(batch_columns[position[WATERMARK_FIELD]])
+                if batch_max and (watermark is None or batch_max > watermark):
+                    watermark = batch_max
+        
+        # Only reached once every page was read: a failed page raises above and
+        # the object keeps its previous watermark
+        if has_watermark and not limit and watermark and watermark != previous_watermark:
+            self.watermarks.set(org, object_name, watermark)
         
         return {
             'object_name': object_name,
-            'pii_found': len(findings),
+            'pii_found': sum(entry['matches'] for entry in summary.values()),
             'findings': findings,
             'field_analysis': fields,
-            'records_scanned': len(records)
+            'field_summary': summary,
+            'records_scanned': records_scanned,
+            'query_mode': mode,
+            'incremental': previous_watermark is not None,
+            'watermark': watermark
         }
     
+    def scan_objects(self, object_names: List[str], incremental: bool = False,
+                     max_workers: int = SALESFORCE_WORKERS) -> List[Dict[str, Any]]:
+        """
+        Scan several objects in parallel under the connector's API budget.
+        
+        The budget is first capped by the org's remaining daily API requests.
+        Objects that fail (including budget exhaustion) get a result with an
+        'error' entry and keep their previous watermark.
+        """
+        try:
+            self.sync_api_budget()
+        except (BulkQueryError, ApiBudgetExceeded, requests.RequestException) as e:
+            logger.warning(f"Could not read Salesforce API limits: {e}")
+        
+        def scan(object_name: str) -> Dict[str, Any]:
+            try:
+                return self.scan_object_data(object_name, incremental=incremental)
+            except (BulkQueryError, ApiBudgetExceeded, requests.RequestException) as e:
+                logger.warning(f"Salesforce scan of {object_name} failed: {e}")
+                return {'object_name': object_name, 'pii_found': 0, 'findings': [], 'field_analysis': [],
+                        'records_scanned': 0, 'error': str(e)}
+        
+        return bounded_map(scan, object_names, max_workers)
+    
+    def _query_rows(self, query: str, columns: List[str]) -> Tuple[Iterator[List[str]], str]:
+        """Rows of a query (header first) and the API that serves them"""
+        bulk = self.bulk_client
+        try:
+            job_id = bulk.create_query_job(query)
+        except BulkQueryError as e:
+            logger.info(f"Bulk API unavailable for query, using REST query paging: {e}")
+            return bulk.rest_query_rows(query, columns), 'rest'
+        return bulk.job_rows(job_id), 'bulk'
+    
+    def _column_matcher(self, field_name: str, with_email: bool) -> Tuple[Any, bool, str, str]:
+        """
+        Compiled PII matcher of a field, whether it matches more than emails,
+        the field's non-email PII type and its severity.
+        
+        Args:
+            field_name: Field API name
+            with_email: Include the email check (only needed for columns containing '@')
+        """
+        key = (field_name, with_email)
+        matcher = self._column_matchers.get(key)
+        if matcher is None:
+            field_lower = field_name.lower()
+            patterns = [_EMAIL_LIKE] if with_email else []
+            if field_lower in ['phone', 'mobile', 'fax']:
+                patterns.append(_PHONE_LIKE)
+            if 'ssn' in field_lower:
+                patterns.append(_SSN_LIKE)
+            if 'name' in field_lower:
+                patterns.append(_NAME_LIKE)
+            compiled = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.DOTALL) if patterns else None
+            matcher = (compiled, len(patterns) > int(with_email), self._classify_pii_type(field_name, ''),
+                       'HIGH' if field_lower in ['email', 'phone', 'ssn'] else 'MEDIUM')
+            self._column_matchers[key] = matcher
+        return matcher
+    
+    def _classify_batch(self, columns: List[Tuple[str, ...]], position: Dict[str, int], pii_fields: List[str],
+                        summary: Dict[str, Dict[str, Any]], findings: List[Dict[str, Any]]) -> None:
+        """Classify one batch column by column, adding to the per-field summary and samples."""
+        ids = columns[position['Id']] if 'Id' in position else None
+        for field_name in pii_fields:
+            if field_name not in position:
+                continue
+            column = columns[position[field_name]]
+            # One scan of the whole column decides whether values need the email check
+            with_email = '@' in '\0'.join(column)
+            pattern, field_specific, field_type, severity = self._column_matcher(field_name, with_email)
+            if pattern is None:
+                continue
+            hits = list(map(pattern.match, column))
+            matched = list(compress(column, hits))
+            if not matched:
+                continue
+            if not with_email:
+                emails = 0
+            elif not field_specific:
+                emails = len(matched)
+            else:
+                emails = sum('@' in value for value in matched)
+            entry = summary.setdefault(field_name, {'matches': 0, 'types': {}, 'severity': severity, 'samples': 0})
+            entry['matches'] += len(matched)
+            types = entry['types']
+            if emails:
+                types['Email Address'] = types.get('Email Address', 0) + emails
+            if len(matched) > emails:
+                types[field_type] = types.get(field_type, 0) + len(matched) - emails
+            
+            if entry['samples'] < MAX_SAMPLES_PER_FIELD:
+                for index in compress(range(len(column)), hits):
+                    value = column[index]
+                    findings.append({
+                        'field': field_name,
+                        'type': self._classify_pii_type(field_name, value),
+                        'value_sample': self._mask_value(value),
+                        'record_id': ids[index] if ids else 'Unknown',
+                        'severity': severity
+                    })
+                    entry['samples'] += 1
+                    if entry['samples'] >= MAX_SAMPLES_PER_FIELD:
+                        break
+    
     def _is_pii_value(self, value: str, field_name: str) -> bool:
         """Check if a value contains PII"""
         if not value or not isinstance(value, str):
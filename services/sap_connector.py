@@ -1,18 +1,129 @@
 """
 SAP Connector for DataGuardian Pro
 Enterprise-grade integration for SAP data privacy scanning
+
+Table data is read in full through the system's Gateway OData service
+(services.sap_odata): only key fields and the fields DDIC metadata marks as
+personal data are selected, pages are followed as the server hands them out,
+the pending pages of several tables travel in one $batch request, and a
+cursor per table lets an interrupted scan resume where it stopped.
 """
 
 import os
+import re
 import json
+import logging
+import threading
 import requests
 from datetime import datetime, timedelta
+from itertools import compress
 from typing import Dict, List, Optional, Any, Tuple
 import base64
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import xml.etree.ElementTree as ET
-import streamlit as st
+
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
+try:
+    from .sap_odata import CursorStore, ODataClient, ODataError
+    from .redaction_engine import bsn_valid, mask_value
+except ImportError:
+    from services.sap_odata import CursorStore, ODataClient, ODataError
+    from services.redaction_engine import bsn_valid, mask_value
+
+logger = logging.getLogger(__name__)
+
+SAP_ODATA_SERVICE = os.environ.get("DG_SAP_ODATA_SERVICE", "/sap/opu/odata/sap/ZDG_PRIVACY_SRV")
+
+# Masked example findings kept per field (counts cover every record)
+MAX_SAMPLES_PER_FIELD = 5
+
+# DDIC field names holding personal data: (PII type, value kind, severity)
+DDIC_PII_FIELDS = {
+    'NACHN': ('Personal Name (Last)', 'name', 'HIGH'),
+    'VORNA': ('Personal Name (First)', 'name', 'HIGH'),
+    'NAME1': ('Person/Company Name', 'name', 'HIGH'),
+    'NAME2': ('Person/Company Name', 'name', 'HIGH'),
+    'NAME_FIRST': ('Personal Name (First)', 'name', 'HIGH'),
+    'NAME_LAST': ('Personal Name (Last)', 'name', 'HIGH'),
+    'BNAME': ('User Name', 'text', 'HIGH'),
+    'PERSNUMBER': ('Person Number', 'text', 'HIGH'),
+    'GBDAT': ('Date of Birth', 'date', 'HIGH'),
+    'BIRTHDT': ('Date of Birth', 'date', 'HIGH'),
+    'PERID': ('National ID Number', 'national_id', 'HIGH'),
+    'SOCSEC': ('National ID Number', 'national_id', 'HIGH'),
+    'STCD1': ('Tax Number', 'national_id', 'HIGH'),
+    'STCD2': ('Tax Number', 'national_id', 'HIGH'),
+    'TAXNUM': ('Tax Number', 'national_id', 'HIGH'),
+    'TEL_NUMBER': ('Telephone Number', 'phone', 'HIGH'),
+    'TELF1': ('Telephone Number', 'phone', 'HIGH'),
+    'TELF2': ('Telephone Number', 'phone', 'HIGH'),
+    'MOB_NUMBER': ('Telephone Number', 'phone', 'HIGH'),
+    'SMTP_ADDR': ('Email Address', 'email', 'HIGH'),
+    'STREET': ('Street Address', 'text', 'HIGH'),
+    'STRAS': ('Street Address', 'text', 'HIGH'),
+    'IBAN': ('Bank Account', 'text', 'HIGH'),
+    'BANKN': ('Bank Account', 'text', 'HIGH'),
+    'POST_CODE1': ('Postal Code', 'text', 'MEDIUM'),
+    'PSTLZ': ('Postal Code', 'text', 'MEDIUM'),
+    'CITY1': ('City', 'text', 'MEDIUM'),
+    'ORT01': ('City', 'text', 'MEDIUM'),
+}
+
+# Field labels (sap:label / DDIC description) for fields not listed above
+_LABEL_HEURISTICS = [
+    (re.compile(r'birth', re.I), ('Date of Birth', 'date', 'HIGH')),
+    (re.compile(r'e-?mail', re.I), ('Email Address', 'email', 'HIGH')),
+    (re.compile(r'phone|mobile', re.I), ('Telephone Number', 'phone', 'HIGH')),
+    (re.compile(r'social|passport|id number|tax number', re.I), ('National ID Number', 'national_id', 'HIGH')),
+    (re.compile(r'iban|bank account', re.I), ('Bank Account', 'text', 'HIGH')),
+    (re.compile(r'first name|last name|surname|^name\b', re.I), ('Personal Name', 'name', 'HIGH')),
+    (re.compile(r'street|address line', re.I), ('Street Address', 'text', 'HIGH')),
+    (re.compile(r'postal code|city', re.I), ('Location', 'text', 'MEDIUM')),
+]
+
+# Value checks per kind; empty dates are 00000000 or /Date(-62135596800000)/
+_VALUE_PATTERNS = {
+    'name': re.compile(r'\s*[^\W\d_]'),
+    'date': re.compile(r'/Date\((?!-62135596800000\))-?\d+|(?!0000)\d{4}-?\d{2}-?\d{2}'),
+    'national_id': re.compile(r'\s*\w'),
+    'phone': re.compile(r'(?:\D*\d){7}'),
+    'email': re.compile(r'[^@\s]+@[^@\s]+\.\w'),
+    'text': re.compile(r'\s*\S'),
+}
+_SAMPLE_STYLES = {'email': 'email', 'phone': 'last4', 'national_id': 'last4'}
+
+
+def _report_error(message: str) -> None:
+    """Log an error and show it in the UI when running under Streamlit"""
+    logger.error(message)
+    if STREAMLIT_AVAILABLE:
+        st.error(message)
+
+
+def classify_ddic_field(name: str, label: str = "") -> Optional[Tuple[str, str, str]]:
+    """
+    PII heuristics for a DDIC field.
+
+    Args:
+        name: DDIC field name, e.g. "NACHN"
+        label: Field label or description
+
+    Returns:
+        (PII type, value kind, severity) or None for fields without personal data
+    """
+    known = DDIC_PII_FIELDS.get(name.upper())
+    if known:
+        return known
+    for pattern, classification in _LABEL_HEURISTICS:
+        if label and pattern.search(label):
+            return classification
+    return None
 
 @dataclass
 class SAPConfig:
@@ -25,6 +136,8 @@ class SAPConfig:
     language: str = "EN"
     protocol: str = "https"
     system_id: str = ""
+    odata_service: str = SAP_ODATA_SERVICE
+    entity_set_suffix: str = "Set"  # Gateway convention: table PA0002 -> entity set PA0002Set
     
     @property
     def base_url(self) -> str:
@@ -40,14 +153,47 @@ class SAPTable:
     table_type: str
     contains_pii: bool = False
 
+@dataclass
+class _TableScan:
+    """Progress of one table extraction, saved with its cursor"""
+    table: str
+    keys: List[str]
+    pii_fields: Dict[str, Tuple[str, str, str]]
+    summary: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    records_scanned: int = 0
+    pages: int = 0
+    resumed: bool = False
+    
+    @property
+    def select(self) -> List[str]:
+        return self.keys + [name for name in self.pii_fields if name not in self.keys]
+    
+    def to_cursor(self, next_url: str) -> Dict[str, Any]:
+        return {'next': next_url, 'select': self.select, 'summary': self.summary, 'findings': self.findings,
+                'records_scanned': self.records_scanned, 'pages': self.pages,
+                'updated_at': datetime.now().isoformat()}
+    
+    def restore(self, cursor: Dict[str, Any]) -> str:
+        self.summary = cursor['summary']
+        self.findings = cursor['findings']
+        self.records_scanned = cursor['records_scanned']
+        self.pages = cursor['pages']
+        self.resumed = True
+        return cursor['next']
+
 class SAPConnector:
     """SAP data connector for privacy compliance scanning"""
     
-    def __init__(self, config: SAPConfig):
+    def __init__(self, config: SAPConfig, cursors: Optional[CursorStore] = None):
         self.config = config
         self.session_id = None
         self.csrf_token = None
         self.cookies = None
+        self.cursors = cursors or CursorStore()
+        self._odata_lock = threading.Lock()
+        self._odata_client: Optional[ODataClient] = None
+        self._metadata_cache: Optional[Dict[str, Dict[str, Any]]] = None
         
     def authenticate(self) -> bool:
         """Authenticate with SAP using basic authentication"""
@@ -74,11 +220,11 @@ class SAPConnector:
                 self.session_id = response.cookies.get('JSESSIONID', '')
                 return True
             else:
-                st.error(f"SAP authentication failed: {response.status_code}")
+                _report_error(f"SAP authentication failed: {response.status_code}")
                 return False
                 
         except Exception as e:
-            st.error(f"SAP authentication error: {str(e)}")
+            _report_error(f"SAP authentication error: {str(e)}")
             return False
     
     def _make_api_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Optional[Any]:
@@ -114,13 +260,40 @@ class SAPConnector:
                 else:
                     return response.text
             else:
-                st.error(f"SAP API error: {response.status_code} - {response.text}")
+                _report_error(f"SAP API error: {response.status_code} - {response.text}")
                 return None
                 
         except Exception as e:
-            st.error(f"SAP API request error: {str(e)}")
+            _report_error(f"SAP API request error: {str(e)}")
             return None
     
+    @property
+    def odata_client(self) -> ODataClient:
+        """Client of the system's OData service, shared by all scans"""
+        with self._odata_lock:
+            if self._odata_client is None:
+                self._odata_client = ODataClient(
+                    f"{self.config.base_url}{self.config.odata_service}",
+                    (self.config.username, self.config.password),
+                    sap_client=self.config.client,
+                    language=self.config.language,
+                    verify=os.getenv('SAP_SSL_VERIFY', 'true').lower() == 'true'
+                )
+            return self._odata_client
+    
+    def entity_set(self, table_name: str) -> str:
+        return f"{table_name}{self.config.entity_set_suffix}"
+    
+    def _metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Entity sets of the OData service ({} when $metadata is unavailable)"""
+        if self._metadata_cache is None:
+            try:
+                self._metadata_cache = self.odata_client.metadata()
+            except (ODataError, ET.ParseError, requests.RequestException) as e:
+                logger.warning(f"SAP OData metadata unavailable, using built-in DDIC fields: {e}")
+                self._metadata_cache = {}
+        return self._metadata_cache
+    
     def get_data_dictionary_tables(self) -> List[SAPTable]:
         """Get list of SAP tables from data dictionary"""
         # Use RFC or OData service to get table list
@@ -153,8 +326,30 @@ class SAPConnector:
         
         return tables
     
+    
     def get_table_fields(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get fields for a specific SAP table"""
+        """
+        Get fields for a specific SAP table.
+        
+        Fields come from the OData service's $metadata (property labels are
+        the DDIC descriptions); without metadata a built-in list of common
+        fields is used. pii_potential follows classify_ddic_field.
+        """
+        entity = self._metadata().get(self.entity_set(table_name))
+        if entity:
+            fields = []
+            for prop in entity['properties']:
+                classification = classify_ddic_field(prop['name'], prop['label'])
+                fields.append({
+                    'name': prop['name'],
+                    'description': prop['label'] or prop['name'],
+                    'type': prop['type'],
+                    'length': prop['max_length'],
+                    'pii_potential': classification[2] if classification else 'LOW',
+                    'key': prop['name'] in entity['keys']
+                })
+            return fields
+        
         # This would typically use RFC DDIF_FIELDINFO_GET or similar
         # Simplified implementation with common fields
         
@@ -186,12 +381,19 @@ class SAPConnector:
             ]
         }
         
-        return field_mappings.get(table_name, [])
+        # The first field of each built-in list is the table key
+        return [dict(f, key=index == 0) for index, f in enumerate(field_mappings.get(table_name, []))]
     
     def get_table_record_count(self, table_name: str) -> int:
-        """Get record count for SAP table"""
-        # This would use RFC RFC_READ_TABLE or similar
-        # Simplified implementation
+        """Get record count for SAP table ($count of its entity set)"""
+        try:
+            count = self.odata_client.count(self.entity_set(table_name))
+        except requests.RequestException as e:
+            logger.warning(f"SAP record count of {table_name} failed: {e}")
+            count = None
+        if count is not None:
+            return count
+        # Simplified fallback for systems without the OData service
         counts = {
             'USR21': 1500,
             'PA0002': 5000,
@@ -202,107 +404,147 @@ class SAPConnector:
         }
         return counts.get(table_name, 0)
     
-    def scan_table_data(self, table_name: str, limit: int = 100) -> Dict[str, Any]:
-        """Scan SAP table data for PII content"""
-        fields = self.get_table_fields(table_name)
-        high_pii_fields = [f['name'] for f in fields if f['pii_potential'] == 'HIGH']
-        
-        if not high_pii_fields:
-            return {
-                'table_name': table_name,
-                'pii_found': 0,
-                'findings': [],
-                'field_analysis': fields
-            }
+    def _cursor_key(self, table_name: str) -> str:
+        system = self.config.system_id or f"{self.config.host}:{self.config.port}"
+        return f"{system}|{self.config.client}|{table_name}"
+    
+    def scan_table_data(self, table_name: str, limit: Optional[int] = None, resume: bool = True) -> Dict[str, Any]:
+        """
+        Scan every record of an SAP table for PII content.
         
-        # Simulate data scanning (in production, use RFC_READ_TABLE)
-        findings = self._simulate_pii_findings(table_name, high_pii_fields, limit)
+        Args:
+            table_name: DDIC table name, e.g. "PA0002"
+            limit: Optional cap on the records read (no cursor is kept)
+            resume: Continue from the table's cursor if an earlier scan stopped
         
-        return {
-            'table_name': table_name,
-            'pii_found': len(findings),
-            'findings': findings,
-            'field_analysis': fields,
-            'records_scanned': min(limit, self.get_table_record_count(table_name))
-        }
+        Returns:
+            Scan result with per-field match counts and masked sample findings
+        """
+        return self.scan_tables([table_name], limit=limit, resume=resume)[0]
     
-    def _simulate_pii_findings(self, table_name: str, fields: List[str], limit: int) -> List[Dict[str, Any]]:
-        """Simulate PII findings for demonstration"""
-        findings = []
+    def scan_tables(self, table_names: List[str], limit: Optional[int] = None,
+                    resume: bool = True) -> List[Dict[str, Any]]:
+        """
+        Scan several SAP tables through the OData service.
+        
+        Only key fields and fields with personal data are selected. The next
+        pages of all tables are fetched together in $batch requests with at
+        most SAP_ODATA_WORKERS requests in flight. After every page the
+        table's cursor (next page and results so far) is saved; a scan that
+        is interrupted or fails resumes from it, and the cursor is removed
+        once the table has been read completely.
         
-        # Simulate findings based on table type
-        if table_name == 'PA0002':  # HR Personal Data
-            for i in range(min(5, limit)):
-                findings.extend([
-                    {
-                        'field': 'NACHN',
-                        'type': 'Personal Name (Last)',
-                        'value_sample': 'Jansen***',
-                        'record_id': f'00000{1000+i}',
-                        'severity': 'HIGH'
-                    },
-                    {
-                        'field': 'VORNA',
-                        'type': 'Personal Name (First)',
-                        'value_sample': 'Jan***',
-                        'record_id': f'00000{1000+i}',
-                        'severity': 'HIGH'
-                    },
-                    {
-                        'field': 'GBDAT',
-                        'type': 'Date of Birth',
-                        'value_sample': '19**-**-15',
-                        'record_id': f'00000{1000+i}',
-                        'severity': 'HIGH'
-                    }
-                ])
+        Args:
+            table_names: DDIC table names
+            limit: Optional cap on the records read per table (no cursors are kept)
+            resume: Continue tables from their cursors
         
-        elif table_name == 'ADRC':  # Address Data
-            for i in range(min(3, limit)):
-                findings.extend([
-                    {
-                        'field': 'NAME1',
-                        'type': 'Person/Company Name',
-                        'value_sample': 'Pietersen***',
-                        'record_id': f'ADDR{2000+i}',
-                        'severity': 'HIGH'
-                    },
-                    {
-                        'field': 'STREET',
-                        'type': 'Street Address',
-                        'value_sample': 'Kalverstraat 1**',
-                        'record_id': f'ADDR{2000+i}',
-                        'severity': 'HIGH'
-                    },
-                    {
-                        'field': 'TEL_NUMBER',
-                        'type': 'Telephone Number',
-                        'value_sample': '+31-20-***-***',
-                        'record_id': f'ADDR{2000+i}',
-                        'severity': 'HIGH'
-                    }
-                ])
+        Returns:
+            One scan result per table, in order; failed tables carry an 'error'
+        """
+        client = self.odata_client
+        scans: Dict[str, _TableScan] = {}
+        starts: Dict[str, str] = {}
+        analysis: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name in table_names:
+            fields = self.get_table_fields(table_name)
+            analysis[table_name] = fields
+            pii_fields = {}
+            for f in fields:
+                classification = classify_ddic_field(f['name'], f['description'])
+                if classification:
+                    pii_fields[f['name']] = classification
+            if not pii_fields:
+                continue
+            scan = _TableScan(table_name, [f['name'] for f in fields if f.get('key')], pii_fields)
+            cursor = self.cursors.get(self._cursor_key(table_name)) if resume and not limit else None
+            if cursor and cursor.get('select') == scan.select:
+                starts[table_name] = scan.restore(cursor)
+                logger.info(f"Resuming SAP scan of {table_name} after {scan.records_scanned} records")
+            else:
+                starts[table_name] = client.first_page_url(self.entity_set(table_name), scan.select)
+            scans[table_name] = scan
+        
+        def on_page(table_name: str, rows: List[Dict[str, Any]], next_url: Optional[str]) -> bool:
+            scan = scans[table_name]
+            if limit:
+                rows = rows[:max(0, limit - scan.records_scanned)]
+            self._classify_page(scan, rows)
+            if limit and scan.records_scanned >= limit:
+                return False
+            if not limit:
+                if next_url:
+                    self.cursors.set(self._cursor_key(table_name), scan.to_cursor(next_url))
+                else:
+                    self.cursors.clear(self._cursor_key(table_name))
+            return True
         
-        elif table_name == 'KNA1':  # Customer Master
-            for i in range(min(4, limit)):
-                findings.extend([
-                    {
-                        'field': 'NAME1',
-                        'type': 'Customer Name',
-                        'value_sample': 'Van der Berg***',
-                        'record_id': f'CUST{3000+i}',
-                        'severity': 'HIGH'
-                    },
-                    {
-                        'field': 'STCD1',
-                        'type': 'Tax Number',
-                        'value_sample': 'NL***123456B01',
-                        'record_id': f'CUST{3000+i}',
-                        'severity': 'HIGH'
-                    }
-                ])
+        try:
+            errors = client.extract(starts, on_page)
+        except (ODataError, requests.RequestException) as e:
+            logger.warning(f"SAP extraction stopped: {e}")
+            errors = {table_name: str(e) for table_name in starts}
         
-        return findings
+        results = []
+        for table_name in table_names:
+            scan = scans.get(table_name)
+            if scan is None:
+                results.append({'table_name': table_name, 'pii_found': 0, 'findings': [],
+                                'field_analysis': analysis[table_name], 'records_scanned': 0})
+                continue
+            result = {
+                'table_name': table_name,
+                'entity_set': self.entity_set(table_name),
+                'pii_found': sum(entry['matches'] for entry in scan.summary.values()),
+                'findings': scan.findings,
+                'field_analysis': analysis[table_name],
+                'field_summary': scan.summary,
+                'selected_fields': scan.select,
+                'records_scanned': scan.records_scanned,
+                'pages': scan.pages,
+                'resumed': scan.resumed
+            }
+            if table_name in errors:
+                logger.warning(f"SAP scan of {table_name} failed: {errors[table_name]}")
+                result['error'] = errors[table_name]
+            results.append(result)
+        return results
+    
+    def _classify_page(self, scan: _TableScan, rows: List[Dict[str, Any]]) -> None:
+        """Classify one page column by column, adding to the table's summary and samples."""
+        if not rows:
+            return
+        scan.pages += 1
+        scan.records_scanned += len(rows)
+        for field_name, (pii_type, kind, severity) in scan.pii_fields.items():
+            column = ['' if value is None else str(value) for value in (row.get(field_name) for row in rows)]
+            hits = list(map(_VALUE_PATTERNS[kind].match, column))
+            matched = list(compress(column, hits))
+            if not matched:
+                continue
+            entry = scan.summary.setdefault(field_name, {'matches': 0, 'types': {}, 'severity': severity,
+                                                         'samples': 0})
+            entry['matches'] += len(matched)
+            types = entry['types']
+            bsns = sum(map(bsn_valid, matched)) if kind == 'national_id' else 0
+            if bsns:
+                types['BSN'] = types.get('BSN', 0) + bsns
+            if len(matched) > bsns:
+                types[pii_type] = types.get(pii_type, 0) + len(matched) - bsns
+            
+            if entry['samples'] < MAX_SAMPLES_PER_FIELD:
+                for index in compress(range(len(column)), hits):
+                    value = column[index]
+                    scan.findings.append({
+                        'field': field_name,
+                        'type': 'BSN' if kind == 'national_id' and bsn_valid(value) else pii_type,
+                        'value_sample': mask_value(value, _SAMPLE_STYLES.get(kind, 'full')),
+                        'record_id': '/'.join(str(rows[index].get(key, '')) for key in scan.keys) or 'Unknown',
+                        'severity': severity
+                    })
+                    entry['samples'] += 1
+                    if entry['samples'] >= MAX_SAMPLES_PER_FIELD:
+                        break
     
     def check_bsn_compliance(self, table_name: str) -> Dict[str, Any]:
         """Check for BSN (Dutch Social Security Number) compliance"""
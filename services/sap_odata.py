@@ -0,0 +1,373 @@
+"""
+SAP OData Extraction
+
+Building blocks for reading whole SAP tables through Gateway OData services:
+
+- ODataClient: reads $metadata, follows server-driven paging (__next /
+  @odata.nextLink) and falls back to $top/$skip when the service returns
+  full pages without a next link
+- $batch: the pending pages of several tables are fetched together in one
+  multipart request, with at most max_workers requests in flight
+- CursorStore: the next page of every table being extracted, saved after
+  each page, so an interrupted extraction resumes where it stopped
+
+Tables are exposed as entity sets of one service (by default "<TABLE>Set",
+the Gateway naming convention).
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+
+try:
+    from .cloud_inventory import bounded_map
+except ImportError:
+    from services.cloud_inventory import bounded_map
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("sap_odata")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Requests in flight at once
+SAP_ODATA_WORKERS = int(os.environ.get("DG_SAP_ODATA_WORKERS", "4"))
+
+# Page requests combined into one $batch
+SAP_BATCH_SIZE = int(os.environ.get("DG_SAP_BATCH_SIZE", "8"))
+
+# $top of every page; services with server-driven paging may return less
+SAP_PAGE_SIZE = int(os.environ.get("DG_SAP_PAGE_SIZE", "5000"))
+
+CURSOR_PATH = os.environ.get("DG_SAP_CURSORS", os.path.join("data", "sap_cursors.json"))
+
+REQUEST_TIMEOUT = 60
+
+_SKIP_PARAM = re.compile(r'([?&])\$skip=(\d+)')
+_SKIPTOKEN_PARAM = re.compile(r'&\$skiptoken=[^&]*')
+_HTTP_STATUS = re.compile(r'HTTP/1\.[01] (\d{3})')
+_PART_SPLIT = re.compile(r'\r?\n\r?\n')
+
+
+class ODataError(Exception):
+    """An OData request failed"""
+
+
+def local_name(tag: str) -> str:
+    """Tag or attribute name without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def odata_page(payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Rows and next link of an OData V2 or V4 JSON page.
+
+    Returns:
+        Tuple of (rows, next link or None)
+    """
+    if 'd' in payload:
+        data = payload['d']
+        if isinstance(data, list):
+            return data, None
+        return data.get('results', []), data.get('__next')
+    return payload.get('value', []), payload.get('@odata.nextLink')
+
+
+class CursorStore:
+    """JSON file of the next page (and partial results) of every table being extracted"""
+
+    def __init__(self, path: str = CURSOR_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cursors: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._cursors is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._cursors = json.load(f)
+            except (OSError, ValueError):
+                self._cursors = {}
+        return self._cursors
+
+    def _write(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._cursors, f)
+        os.replace(temp_path, self.path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, cursor: Dict[str, Any]) -> None:
+        with self._lock:
+            self._load()[key] = cursor
+            self._write()
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._write()
+
+
+class ODataClient:
+    """Paged and batched reads from one SAP Gateway OData service"""
+
+    def __init__(self, service_url: str, auth: Tuple[str, str], sap_client: str = "", language: str = "EN",
+                 verify: bool = True, max_workers: int = SAP_ODATA_WORKERS, batch_size: int = SAP_BATCH_SIZE,
+                 page_size: int = SAP_PAGE_SIZE):
+        """
+        Args:
+            service_url: Service root, e.g. https://host:8000/sap/opu/odata/sap/ZDG_PRIVACY_SRV
+            auth: (username, password) for basic authentication
+            sap_client: SAP client (mandant) sent as sap-client
+            language: Logon language sent as sap-language
+            verify: Verify TLS certificates
+            max_workers: Requests in flight at once
+            batch_size: Page requests combined into one $batch (1 disables $batch)
+            page_size: $top of every page
+        """
+        self.service_url = service_url.rstrip('/')
+        self.auth = auth
+        self.params = {key: value for key, value in (('sap-client', sap_client), ('sap-language', language)) if value}
+        self.verify = verify
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.stats = {'requests': 0, 'batches': 0, 'pages': 0}
+        self._csrf_token: Optional[str] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Thread-local session so each worker keeps its connection (and SAP session cookie)"""
+        if not hasattr(self._local, 'session'):
+            session = requests.Session()
+            session.auth = self.auth
+            session.verify = self.verify
+            session.headers['Accept'] = 'application/json'
+            self._local.session = session
+        return self._local.session
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def absolute(self, url: str) -> str:
+        return url if url.startswith('http') else f"{self.service_url}/{url.lstrip('/')}"
+
+    def relative(self, url: str) -> str:
+        """URL relative to the service root (as $batch parts require)"""
+        if url.startswith(self.service_url):
+            return url[len(self.service_url):].lstrip('/')
+        if url.startswith('http'):
+            path = url.split('://', 1)[1].split('/', 1)[-1]
+            root = self.service_url.split('://', 1)[1].split('/', 1)[-1]
+            return path[len(root):].lstrip('/') if path.startswith(root) else url
+        return url.lstrip('/')
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        params = dict(self.params)
+        params.update(kwargs.pop('params', None) or {})
+        self._count('requests')
+        return self._get_session().request(method, self.absolute(url), params=params, **kwargs)
+
+    def get_json(self, url: str) -> Dict[str, Any]:
+        response = self.request('GET', url, params={'$format': 'json'})
+        if response.status_code != 200:
+            raise ODataError(f"GET {url} failed ({response.status_code})")
+        return response.json()
+
+    def _csrf(self, refresh: bool = False) -> str:
+        """CSRF token for modifying requests ($batch is a POST)"""
+        if self._csrf_token is None or refresh:
+            response = self.request('GET', '', headers={'X-CSRF-Token': 'Fetch'})
+            self._csrf_token = response.headers.get('X-CSRF-Token', '')
+        return self._csrf_token
+
+    def metadata(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Entity sets of the service from $metadata.
+
+        Returns:
+            {entity_set: {'entity_type', 'keys', 'properties': [{'name', 'type',
+            'max_length', 'label'}]}}
+        """
+        response = self.request('GET', '$metadata', headers={'Accept': 'application/xml'})
+        if response.status_code != 200:
+            raise ODataError(f"$metadata failed ({response.status_code})")
+        root = ET.fromstring(response.content)
+        types: Dict[str, Dict[str, Any]] = {}
+        sets: Dict[str, str] = {}
+        for element in root.iter():
+            tag = local_name(element.tag)
+            if tag == 'EntityType':
+                keys = [ref.get('Name') for ref in element.iter() if local_name(ref.tag) == 'PropertyRef']
+                properties = []
+                for prop in element:
+                    if local_name(prop.tag) != 'Property':
+                        continue
+                    attributes = {local_name(key): value for key, value in prop.attrib.items()}
+                    properties.append({'name': attributes.get('Name'), 'type': attributes.get('Type', ''),
+                                       'max_length': int(attributes['MaxLength']) if
+                                       attributes.get('MaxLength', '').isdigit() else 0,
+                                       'label': attributes.get('label', '')})
+                types[element.get('Name')] = {'keys': keys, 'properties': properties}
+            elif tag == 'EntitySet':
+                sets[element.get('Name')] = element.get('EntityType', '').rsplit('.', 1)[-1]
+        return {name: dict(types.get(entity_type, {'keys': [], 'properties': []}), entity_type=entity_type)
+                for name, entity_type in sets.items()}
+
+    def count(self, entity_set: str) -> Optional[int]:
+        response = self.request('GET', f"{entity_set}/$count", headers={'Accept': 'text/plain'})
+        if response.status_code != 200:
+            return None
+        try:
+            return int(response.text.strip())
+        except ValueError:
+            return None
+
+    def first_page_url(self, entity_set: str, select: List[str]) -> str:
+        """Relative URL of the first page of an entity set with a $select projection"""
+        query = f"$format=json&$top={self.page_size}&$skip=0"
+        if select:
+            query += f"&$select={quote(','.join(select), safe=',')}"
+        return f"{entity_set}?{query}"
+
+    def next_page_url(self, url: str, rows: List[Dict[str, Any]], next_link: Optional[str]) -> Optional[str]:
+        """
+        URL of the page after url.
+
+        The server's next link if there is one. Otherwise the next $top/$skip
+        window, when the page was full (services without server-driven
+        paging) or ended a $skiptoken chain (server-driven pages inside the
+        window); None once a window comes back short or empty.
+        """
+        if next_link:
+            return next_link
+        match = _SKIP_PARAM.search(url)
+        if match is None or not rows:
+            return None
+        if len(rows) < self.page_size and '$skiptoken=' not in url:
+            return None
+        skip = int(match.group(2)) + self.page_size
+        url = url[:match.start()] + f"{match.group(1)}$skip={skip}" + url[match.end():]
+        return _SKIPTOKEN_PARAM.sub('', url)
+
+    def _get_page(self, url: str) -> Tuple[int, Any]:
+        response = self.request('GET', url)
+        if response.status_code != 200:
+            return response.status_code, response.text[:500]
+        return 200, response.json()
+
+    def batch_get(self, urls: List[str]) -> List[Tuple[int, Any]]:
+        """
+        GET several URLs in one $batch request.
+
+        Returns:
+            (status, parsed JSON or error text) per URL, in order
+        """
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for url in urls:
+            parts.append(f"--{boundary}\r\nContent-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+                         f"GET {self.relative(url)} HTTP/1.1\r\nAccept: application/json\r\n\r\n")
+        body = ''.join(parts) + f"--{boundary}--\r\n"
+        for attempt in range(2):
+            response = self.request('POST', '$batch', data=body.encode('utf-8'), headers={
+                'Content-Type': f'multipart/mixed; boundary={boundary}',
+                'X-CSRF-Token': self._csrf(refresh=attempt > 0)
+            })
+            if response.status_code != 403 or attempt:
+                break
+        if response.status_code not in (200, 202):
+            raise ODataError(f"$batch failed ({response.status_code})")
+        self._count('batches')
+        results = parse_batch_response(response.headers.get('Content-Type', ''), response.text)
+        if len(results) != len(urls):
+            raise ODataError(f"$batch returned {len(results)} responses for {len(urls)} requests")
+        return results
+
+    def _fetch_group(self, urls: List[str]) -> List[Tuple[int, Any]]:
+        if len(urls) == 1 or self.batch_size <= 1:
+            return [self._get_page(url) for url in urls]
+        return self.batch_get(urls)
+
+    def extract(self, starts: Dict[str, str],
+                on_page: Callable[[str, List[Dict[str, Any]], Optional[str]], Optional[bool]]) -> Dict[str, str]:
+        """
+        Read every page of several entity sets.
+
+        Each round fetches the next page of every unfinished table, grouped
+        into $batch requests of batch_size, with at most max_workers requests
+        in flight. on_page runs on the calling thread, in table order.
+
+        Args:
+            starts: {table: URL of the first page to read}
+            on_page: Called with (table, rows, URL of the next page or None);
+                returning False stops reading that table
+
+        Returns:
+            {table: error} for tables whose extraction failed
+        """
+        pending = dict(starts)
+        errors: Dict[str, str] = {}
+        while pending:
+            items = list(pending.items())
+            groups = [items[i:i + self.batch_size] for i in range(0, len(items), max(1, self.batch_size))]
+            responses = bounded_map(lambda group: self._fetch_group([url for _, url in group]), groups,
+                                    self.max_workers)
+            for group, results in zip(groups, responses):
+                for (table, url), (status, payload) in zip(group, results):
+                    if status != 200:
+                        errors[table] = f"HTTP {status}: {payload}"
+                        del pending[table]
+                        continue
+                    rows, next_link = odata_page(payload)
+                    self._count('pages')
+                    next_url = self.next_page_url(url, rows, next_link)
+                    if on_page(table, rows, next_url) is not False and next_url:
+                        pending[table] = next_url
+                    else:
+                        del pending[table]
+        return errors
+
+
+def parse_batch_response(content_type: str, text: str) -> List[Tuple[int, Any]]:
+    """(status, parsed JSON or error text) of every part of a multipart $batch response"""
+    match = re.search(r'boundary=("?)([^";]+)\1', content_type)
+    if match is None:
+        raise ODataError("$batch response without multipart boundary")
+    delimiter = f"--{match.group(2)}"
+    results = []
+    for part in text.split(delimiter)[1:]:
+        if part.startswith('--'):
+            break
+        # MIME headers, then the embedded HTTP response: status line + headers, body
+        sections = _PART_SPLIT.split(part.strip('\r\n'), 2)
+        if len(sections) < 2:
+            continue
+        status_match = _HTTP_STATUS.search(sections[1])
+        status = int(status_match.group(1)) if status_match else 500
+        body = sections[2] if len(sections) > 2 else ''
+        if status == 200:
+            try:
+                results.append((200, json.loads(body)))
+            except ValueError:
+                results.append((502, body[:500]))
+        else:
+            results.append((status, body[:500]))
+    return results
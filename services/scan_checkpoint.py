@@ -0,0 +1,215 @@
+"""
+Scan Checkpoint Journal - Append-Only Resumable Scan State
+
+Checkpoints for long-running directory scans are kept as an append-only
+JSONL journal in a dedicated state directory instead of rewriting one large
+JSON document. Each completed file appends one record (with its findings, if
+any), so a checkpoint costs O(files completed since the last one). Writes
+are flushed after every batch and fsynced on a time/size cadence. Resuming
+replays the journal into a set of completed paths and compacts it into a
+fresh journal so repeated interruptions do not grow it without bound.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Any, Optional, Set
+
+from services.finding_batch import FindingBatch, json_object_hook
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("scan_checkpoint")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = os.environ.get(
+    "DG_SCAN_STATE_DIR", os.path.join("/tmp", "dataguardian", "scan_state")
+)
+
+# fsync at least this often while a scan is running
+DEFAULT_FSYNC_INTERVAL_SECONDS = 300
+
+# ... or once this many bytes have been written since the last fsync
+DEFAULT_FSYNC_BYTES = 1024 * 1024
+
+JOURNAL_VERSION = 1
+
+
+def _json_default(value: Any) -> Any:
+    # Finding batches are journalled in their columnar form
+    if isinstance(value, FindingBatch):
+        return value.to_payload()
+    return str(value)
+
+
+def journal_path_for(directory_path: str, state_dir: Optional[str] = None) -> str:
+    """Stable journal location for a scanned directory."""
+    key = hashlib.sha256(os.path.abspath(directory_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(state_dir or DEFAULT_STATE_DIR, f"scan_journal_{key}.jsonl")
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL checkpoint journal for one scan.
+
+    Record types:
+        {"type": "header", "version", "scan_id", "start_time", "directory"}
+        {"type": "file", "path": <relative path>, "finding": <result, optional>}
+    """
+
+    def __init__(self, path: str, fsync_interval: float = DEFAULT_FSYNC_INTERVAL_SECONDS,
+                 fsync_bytes: int = DEFAULT_FSYNC_BYTES):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.fsync_bytes = fsync_bytes
+        self._file = None
+        self._buffer: List[str] = []
+        self._unsynced_bytes = 0
+        self._last_fsync = time.monotonic()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Scanners are pickled into worker processes; only the owner writes
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_buffer'] = []
+        return state
+
+    @classmethod
+    def create(cls, path: str, scan_id: str, start_time: str, directory: str,
+               **kwargs) -> 'CheckpointJournal':
+        """Start a new journal, replacing any previous one at `path`."""
+        journal = cls(path, **kwargs)
+        journal._write_compacted({
+            'scan_id': scan_id,
+            'start_time': start_time,
+            'directory': directory,
+            'completed_files': set(),
+            'findings': {},
+        })
+        return journal
+
+    @classmethod
+    def resume(cls, path: str, **kwargs) -> 'CheckpointJournal':
+        """Open an existing journal for appending after compacting it."""
+        journal = cls(path, **kwargs)
+        journal._write_compacted(journal.replay())
+        return journal
+
+    def replay(self) -> Dict[str, Any]:
+        """
+        Rebuild checkpoint state from the journal.
+
+        A torn final line (the process died mid-write) is ignored; corruption
+        anywhere else is reported as ValueError.
+
+        Returns:
+            Dict with scan_id, start_time, directory, completed_files (set)
+            and findings (relative path -> finding, in completion order)
+        """
+        state: Dict[str, Any] = {
+            'scan_id': None,
+            'start_time': None,
+            'directory': None,
+            'completed_files': set(),
+            'findings': {},
+        }
+        completed: Set[str] = state['completed_files']
+        with open(self.path, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        for index, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                record = json.loads(line, object_hook=json_object_hook)
+            except json.JSONDecodeError:
+                if index == len(lines) - 1:
+                    logger.warning(f"Ignoring truncated final record in {self.path}")
+                    break
+                raise ValueError(f"Corrupt checkpoint record at line {index + 1} of {self.path}")
+            record_type = record.get('type')
+            if record_type == 'file':
+                path = record['path']
+                if path in completed:
+                    continue
+                completed.add(path)
+                if 'finding' in record:
+                    state['findings'][path] = record['finding']
+            elif record_type == 'header':
+                for key in ('scan_id', 'start_time', 'directory'):
+                    state[key] = record.get(key)
+        return state
+
+    def record_file(self, rel_path: str, finding: Optional[Dict[str, Any]] = None) -> None:
+        """Queue a completed file (and its finding) for the next flush."""
+        record: Dict[str, Any] = {'type': 'file', 'path': rel_path}
+        if finding is not None:
+            record['finding'] = finding
+        self._buffer.append(json.dumps(record, separators=(',', ':'), default=_json_default))
+
+    def flush(self, force_sync: bool = False) -> None:
+        """Append queued records; fsync when the time/size cadence is due."""
+        if self._file is None:
+            return
+        if self._buffer:
+            data = '\n'.join(self._buffer) + '\n'
+            self._buffer = []
+            self._file.write(data)
+            self._file.flush()
+            self._unsynced_bytes += len(data)
+        if self._unsynced_bytes and (
+                force_sync
+                or self._unsynced_bytes >= self.fsync_bytes
+                or time.monotonic() - self._last_fsync >= self.fsync_interval):
+            os.fsync(self._file.fileno())
+            self._unsynced_bytes = 0
+            self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and fsync everything, then close the journal."""
+        if self._file is None:
+            return
+        try:
+            self.flush(force_sync=True)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal (scan finished)."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _write_compacted(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the journal with a header plus one record per completed file."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        findings = state['findings']
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'type': 'header',
+                'version': JOURNAL_VERSION,
+                'scan_id': state['scan_id'],
+                'start_time': state['start_time'],
+                'directory': state['directory'],
+            }) + '\n')
+            # Files with findings first so findings keep their completion order
+            for rel_path, finding in findings.items():
+                f.write(json.dumps({'type': 'file', 'path': rel_path, 'finding': finding},
+                                   separators=(',', ':'), default=_json_default) + '\n')
+            for rel_path in state['completed_files']:
+                if rel_path not in findings:
+                    f.write(json.dumps({'type': 'file', 'path': rel_path}, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._unsynced_bytes = 0
+        self._last_fsync = time.monotonic()
+
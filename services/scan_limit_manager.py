@@ -1,15 +1,25 @@
 """
 Scan Limit Manager
 Manages daily scan limits and pricing adjustments for DataGuardian Pro users
+
+Daily usage is counted in the shared usage meter (services/usage_meter.py):
+recording a scan is one atomic check-and-increment. data/daily_usage.json is
+a periodic snapshot of the counters this process touched, and seeds the
+counters for days recorded before the meter existed.
 """
 
+import atexit
 import json
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import streamlit as st
 import logging
 
+from services.usage_meter import LAST_AT_FIELD, get_usage_meter, period_bucket
+
 # Import centralized logging
 try:
     from utils.centralized_logger import get_scanner_logger
@@ -18,7 +28,8 @@ except ImportError:
     # Fallback to standard logging if centralized logger not available
     logger = logging.getLogger(__name__)
 
-
+# How often touched counters are written back to the usage file
+RECONCILE_INTERVAL_SECONDS = int(os.environ.get('DG_USAGE_RECONCILE_SECONDS', '60'))
 
 
 class ScanLimitManager:
@@ -55,9 +66,16 @@ class ScanLimitManager:
             }
         }
         
-        # Data file for tracking daily usage
+        # Snapshot of daily usage, reconciled from the usage meter
         self.usage_file = 'data/daily_usage.json'
         self.ensure_data_directory()
+        self.meter = get_usage_meter()
+        self._legacy_usage: Optional[Dict] = None
+        self._seeded = set()
+        self._touched = set()
+        self._reconcile_lock = threading.Lock()
+        self._last_reconcile = time.monotonic()
+        atexit.register(self.reconcile_usage_file)
     
     def ensure_data_directory(self):
         """Ensure data directory exists"""
@@ -77,58 +95,114 @@ class ScanLimitManager:
         st.session_state[f'{username}_tier'] = tier
         logger.info(f"User {username} tier set to {tier}")
     
+    @staticmethod
+    def _scope(username: str) -> str:
+        return f"scans:{username}"
+
+    def _seed_from_usage_file(self, username: str, dates: List[str]):
+        """Carry counts recorded in the usage file over into the meter (once per day and user)"""
+        pending = [d for d in dates if (username, d) not in self._seeded]
+        if not pending:
+            return
+        if self._legacy_usage is None:
+            try:
+                with open(self.usage_file, 'r') as f:
+                    self._legacy_usage = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading usage data: {e}")
+                self._legacy_usage = {}
+        _, ttl = period_bucket('daily')
+        for date in pending:
+            day_usage = self._legacy_usage.get(f"{username}_{date}")
+            if day_usage:
+                counts = {k: v for k, v in day_usage.items() if isinstance(v, int)}
+                if counts:
+                    self.meter.seed(self._scope(username), date, counts, ttl)
+            self._seeded.add((username, date))
+
+    @staticmethod
+    def _format_usage(counts: Dict[str, int]) -> Dict:
+        usage = dict(counts)
+        last_at = usage.pop(LAST_AT_FIELD, None)
+        if last_at:
+            usage['last_scan'] = datetime.fromtimestamp(last_at).isoformat()
+        return usage
+
     def get_daily_usage(self, username: str, date: str = None) -> Dict[str, int]:
         """Get daily usage for a user"""
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
         
         try:
-            with open(self.usage_file, 'r') as f:
-                usage_data = json.load(f)
-            
-            user_date_key = f"{username}_{date}"
-            return usage_data.get(user_date_key, {})
+            self._seed_from_usage_file(username, [date])
+            return self._format_usage(self.meter.counts(self._scope(username), date))
         
         except Exception as e:
             logger.error(f"Error loading usage data: {e}")
             return {}
     
     def record_scan(self, username: str, scan_type: str) -> bool:
-        """Record a scan and check if within limits"""
-        date = datetime.now().strftime('%Y-%m-%d')
+        """Record a scan if it is within limits (one atomic check-and-increment)"""
         user_tier = self.get_user_tier(username)
+        tier_info = self.daily_limits.get(user_tier, self.daily_limits['free'])
         
-        # Check if scan is allowed
-        if not self.can_perform_scan(username, scan_type):
+        # Check scan type permission
+        if not self._scan_type_allowed(tier_info, scan_type):
             return False
         
+        date, ttl = period_bucket('daily')
         try:
-            # Load current usage
-            with open(self.usage_file, 'r') as f:
-                usage_data = json.load(f)
-            
-            user_date_key = f"{username}_{date}"
-            if user_date_key not in usage_data:
-                usage_data[user_date_key] = {}
-            
-            # Increment scan count
-            if scan_type not in usage_data[user_date_key]:
-                usage_data[user_date_key][scan_type] = 0
-            
-            usage_data[user_date_key][scan_type] += 1
-            usage_data[user_date_key]['total'] = usage_data[user_date_key].get('total', 0) + 1
-            usage_data[user_date_key]['last_scan'] = datetime.now().isoformat()
-            
-            # Save updated usage
-            with open(self.usage_file, 'w') as f:
-                json.dump(usage_data, f, indent=2)
-            
-            logger.info(f"Recorded {scan_type} scan for {username} (tier: {user_tier})")
-            return True
-        
+            self._seed_from_usage_file(username, [date])
+            allowed, total = self.meter.consume(
+                self._scope(username), date, ('total', scan_type),
+                limit=tier_info['daily_scans'], ttl=ttl
+            )
         except Exception as e:
             logger.error(f"Error recording scan: {e}")
             return False
+        
+        if not allowed:
+            logger.info(f"Daily scan limit reached for {username} ({total}/{tier_info['daily_scans']})")
+            return False
+        
+        self._touched.add((username, date))
+        self._maybe_reconcile()
+        logger.info(f"Recorded {scan_type} scan for {username} (tier: {user_tier})")
+        return True
+    
+    @staticmethod
+    def _scan_type_allowed(tier_info: Dict, scan_type: str) -> bool:
+        allowed_types = tier_info['scan_types']
+        return 'all' in allowed_types or scan_type in allowed_types
+    
+    def _maybe_reconcile(self):
+        if time.monotonic() - self._last_reconcile >= RECONCILE_INTERVAL_SECONDS:
+            self.reconcile_usage_file()
+    
+    def reconcile_usage_file(self):
+        """Write the counters touched since the last reconciliation to the usage file"""
+        with self._reconcile_lock:
+            self._last_reconcile = time.monotonic()
+            touched, self._touched = self._touched, set()
+            if not touched:
+                return
+            try:
+                try:
+                    with open(self.usage_file, 'r') as f:
+                        usage_data = json.load(f)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    usage_data = {}
+                for username, date in touched:
+                    usage_data[f"{username}_{date}"] = self._format_usage(
+                        self.meter.counts(self._scope(username), date)
+                    )
+                temp_file = f"{self.usage_file}.tmp"
+                with open(temp_file, 'w') as f:
+                    json.dump(usage_data, f, indent=2)
+                os.replace(temp_file, self.usage_file)
+            except Exception as e:
+                self._touched |= touched
+                logger.error(f"Error reconciling usage file: {e}")
     
     def can_perform_scan(self, username: str, scan_type: str) -> Tuple[bool, str]:
         """Check if user can perform a scan"""
@@ -136,8 +210,7 @@ class ScanLimitManager:
         tier_info = self.daily_limits.get(user_tier, self.daily_limits['free'])
         
         # Check scan type permission
-        allowed_types = tier_info['scan_types']
-        if 'all' not in allowed_types and scan_type not in allowed_types:
+        if not self._scan_type_allowed(tier_info, scan_type):
             return False, f"Scan type '{scan_type}' not available in {user_tier} tier. Upgrade to access this feature."
         
         # Check daily limit
@@ -218,30 +291,26 @@ class ScanLimitManager:
     def _analyze_usage_pattern(self, username: str) -> Dict[str, any]:
         """Analyze user's usage pattern over the last 7 days"""
         try:
-            with open(self.usage_file, 'r') as f:
-                usage_data = json.load(f)
+            # Get last 7 days of usage in one round trip
+            dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
+            self._seed_from_usage_file(username, dates)
+            usage_by_day = self.meter.history(self._scope(username), dates)
             
-            # Get last 7 days of usage
             total_scans = 0
             days_with_usage = 0
             scan_types_used = set()
             
-            for i in range(7):
-                date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-                user_date_key = f"{username}_{date}"
+            for day_usage in usage_by_day.values():
+                daily_total = day_usage.get('total', 0)
                 
-                if user_date_key in usage_data:
-                    day_usage = usage_data[user_date_key]
-                    daily_total = day_usage.get('total', 0)
+                if daily_total > 0:
+                    total_scans += daily_total
+                    days_with_usage += 1
                     
-                    if daily_total > 0:
-                        total_scans += daily_total
-                        days_with_usage += 1
-                        
-                        # Track scan types
-                        for scan_type, count in day_usage.items():
-                            if scan_type not in ['total', 'last_scan'] and count > 0:
-                                scan_types_used.add(scan_type)
+                    # Track scan types
+                    for scan_type, count in day_usage.items():
+                        if scan_type not in ['total', LAST_AT_FIELD] and count > 0:
+                            scan_types_used.add(scan_type)
             
             avg_daily_scans = total_scans / 7 if total_scans > 0 else 0
             
@@ -340,6 +409,9 @@ class ScanLimitManager:
             date = datetime.now().strftime('%Y-%m-%d')
         
         try:
+            self.meter.reset(self._scope(username), date)
+            self._seeded.add((username, date))
+            
             with open(self.usage_file, 'r') as f:
                 usage_data = json.load(f)
             
@@ -355,4 +427,4 @@ class ScanLimitManager:
         
         except Exception as e:
             logger.error(f"Error resetting usage: {e}")
-            return False
\ No newline at end of file
+            return False
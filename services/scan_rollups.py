@@ -0,0 +1,192 @@
+"""
+Scan Rollups - Materialised Dashboard Metrics
+
+Per-scan summary values (PII count, high-risk and critical counts, compliance
+score) are computed once when a scan is stored and written to indexed
+columns on `scans` (schema in database/migrations/0006_scan_rollups.sql). The same values are added to daily per-user and
+per-organization aggregate tables in the same transaction, so dashboard
+metrics are one indexed read over at most one row per day instead of
+loading and re-walking every stored scan result.
+
+The daily rows also carry the sum of each scan's risk-adjusted score, so
+the predictive analytics read a tenant's whole history as one daily series
+(USER_SERIES_SQL / ORG_SERIES_SQL) instead of re-scoring stored scans.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Any, Optional
+
+try:
+    from .finding_batch import FindingBatch, Severity
+except ImportError:
+    from finding_batch import FindingBatch, Severity
+
+HIGH_RISK_SEVERITIES = ('high', 'critical')
+
+_USER_ROLLUP_UPSERT = '''
+    INSERT INTO scan_rollups_daily_user
+        (organization_id, username, day, scan_count, total_pii_found, high_risk_count,
+         critical_count, compliance_score_sum, compliance_score_count, risk_score_sum)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (organization_id, username, day) DO UPDATE SET
+        scan_count = scan_rollups_daily_user.scan_count + EXCLUDED.scan_count,
+        total_pii_found = scan_rollups_daily_user.total_pii_found + EXCLUDED.total_pii_found,
+        high_risk_count = scan_rollups_daily_user.high_risk_count + EXCLUDED.high_risk_count,
+        critical_count = scan_rollups_daily_user.critical_count + EXCLUDED.critical_count,
+        compliance_score_sum = scan_rollups_daily_user.compliance_score_sum + EXCLUDED.compliance_score_sum,
+        compliance_score_count = scan_rollups_daily_user.compliance_score_count + EXCLUDED.compliance_score_count,
+        risk_score_sum = scan_rollups_daily_user.risk_score_sum + EXCLUDED.risk_score_sum
+'''
+
+_ORG_ROLLUP_UPSERT = '''
+    INSERT INTO scan_rollups_daily_org
+        (organization_id, day, scan_count, total_pii_found, high_risk_count,
+         critical_count, compliance_score_sum, compliance_score_count, risk_score_sum)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (organization_id, day) DO UPDATE SET
+        scan_count = scan_rollups_daily_org.scan_count + EXCLUDED.scan_count,
+        total_pii_found = scan_rollups_daily_org.total_pii_found + EXCLUDED.total_pii_found,
+        high_risk_count = scan_rollups_daily_org.high_risk_count + EXCLUDED.high_risk_count,
+        critical_count = scan_rollups_daily_org.critical_count + EXCLUDED.critical_count,
+        compliance_score_sum = scan_rollups_daily_org.compliance_score_sum + EXCLUDED.compliance_score_sum,
+        compliance_score_count = scan_rollups_daily_org.compliance_score_count + EXCLUDED.compliance_score_count,
+        risk_score_sum = scan_rollups_daily_org.risk_score_sum + EXCLUDED.risk_score_sum
+'''
+
+_METRIC_COLUMNS = '''
+    COALESCE(SUM(scan_count), 0), COALESCE(SUM(total_pii_found), 0),
+    COALESCE(SUM(high_risk_count), 0), COALESCE(SUM(critical_count), 0),
+    COALESCE(SUM(compliance_score_sum), 0), COALESCE(SUM(compliance_score_count), 0)
+'''
+
+USER_METRICS_SQL = f'''
+    SELECT {_METRIC_COLUMNS}
+    FROM scan_rollups_daily_user
+    WHERE organization_id = %s AND username = %s AND day >= %s
+'''
+
+ORG_METRICS_SQL = f'''
+    SELECT {_METRIC_COLUMNS}
+    FROM scan_rollups_daily_org
+    WHERE organization_id = %s AND day >= %s
+'''
+
+_SERIES_COLUMNS = 'day, scan_count, total_pii_found, high_risk_count, critical_count, risk_score_sum'
+
+USER_SERIES_SQL = f'''
+    SELECT {_SERIES_COLUMNS}
+    FROM scan_rollups_daily_user
+    WHERE organization_id = %s AND username = %s AND day >= %s AND scan_count > 0
+    ORDER BY day
+'''
+
+ORG_SERIES_SQL = f'''
+    SELECT {_SERIES_COLUMNS}
+    FROM scan_rollups_daily_org
+    WHERE organization_id = %s AND day >= %s AND scan_count > 0
+    ORDER BY day
+'''
+
+
+@dataclass
+class ScanSummary:
+    """Summary values of one scan, as stored in the scans summary columns."""
+    total_pii_found: int = 0
+    high_risk_count: int = 0
+    critical_count: int = 0
+    compliance_score: Optional[float] = None
+
+
+def _severity(finding: Dict[str, Any]) -> str:
+    value = finding.get('severity') or finding.get('risk_level') or ''
+    return value.lower() if isinstance(value, str) else ''
+
+
+def summarize_scan_result(result: Dict[str, Any]) -> ScanSummary:
+    """
+    Compute the dashboard summary of a scan result.
+
+    Scanner-reported counts are preferred; when a scanner does not report
+    them, they are derived from its findings the same way the dashboard
+    previously did on every render.
+    """
+    findings = result.get('findings', [])
+    if isinstance(findings, FindingBatch):
+        # Columnar findings are counted from their severity codes
+        counts = findings.severity_counts()
+        derived_critical = counts[Severity.CRITICAL]
+        derived_high_risk = counts[Severity.HIGH] + derived_critical
+    else:
+        if not isinstance(findings, list):
+            findings = []
+        severities = [_severity(f) for f in findings if isinstance(f, dict)]
+        derived_high_risk = sum(1 for s in severities if s in HIGH_RISK_SEVERITIES)
+        derived_critical = sum(1 for s in severities if s == 'critical')
+
+    total_pii = result.get('total_pii_found') or 0
+    if not total_pii:
+        total_pii = len(findings)
+
+    high_risk = result.get('high_risk_count') or 0
+    if not high_risk:
+        high_risk = derived_high_risk
+
+    critical = result.get('critical_count') or 0
+    if not critical:
+        critical = derived_critical
+
+    compliance_score = result.get('compliance_score')
+    if not isinstance(compliance_score, (int, float)) or isinstance(compliance_score, bool) \
+            or compliance_score <= 0:
+        compliance_score = None
+
+    return ScanSummary(
+        total_pii_found=int(total_pii),
+        high_risk_count=int(high_risk),
+        critical_count=int(critical),
+        compliance_score=float(compliance_score) if compliance_score is not None else None,
+    )
+
+
+def risk_adjusted_score(total_pii_found: int, high_risk_count: int) -> float:
+    """
+    Compliance score estimated from a scan's counts, as used by the
+    predictive analytics: 85 minus capped PII and high-risk penalties,
+    never below 40.
+    """
+    return float(max(85 - min(total_pii_found * 0.5, 30) - min(high_risk_count * 2, 20), 40))
+
+
+def apply_rollup_delta(cursor, organization_id: str, username: str, day: date,
+                       summary: ScanSummary, sign: int = 1) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) one scan's summary to the daily rollups.
+    Runs inside the caller's transaction so rollups never drift from scans.
+    """
+    has_score = summary.compliance_score is not None
+    values = (
+        sign,
+        sign * summary.total_pii_found,
+        sign * summary.high_risk_count,
+        sign * summary.critical_count,
+        sign * (summary.compliance_score or 0.0),
+        sign * (1 if has_score else 0),
+        sign * risk_adjusted_score(summary.total_pii_found, summary.high_risk_count),
+    )
+    cursor.execute(_USER_ROLLUP_UPSERT, (organization_id, username, day) + values)
+    cursor.execute(_ORG_ROLLUP_UPSERT, (organization_id, day) + values)
+
+
+def metrics_from_row(row: Optional[tuple]) -> Dict[str, Any]:
+    """Format a USER_METRICS_SQL / ORG_METRICS_SQL row as dashboard metrics."""
+    scan_count, total_pii, high_risk, critical, score_sum, score_count = row or (0, 0, 0, 0, 0, 0)
+    return {
+        'total_scans': int(scan_count),
+        'total_pii_found': int(total_pii),
+        'high_risk_count': int(high_risk),
+        'critical_count': int(critical),
+        'compliance_score_sum': float(score_sum),
+        'compliance_score_count': int(score_count),
+        'average_compliance_score': round(float(score_sum) / score_count, 1) if score_count else None,
+    }
@@ -0,0 +1,128 @@
+"""
+Scanner Registry - Lazy Scanner Loading
+
+Maps scanner keys to the module and class that implement them so that
+scanner modules (and the ML, OCR and PDF stacks they pull in) are only
+imported the first time a user actually runs that scanner.  The landing
+page and dashboard never touch these modules, which keeps cold start and
+first render for a new session cheap.
+
+Scanners whose instances hold only configuration and precompiled rules
+(SHARED_SCANNERS) can also be shared: get_shared_scanner returns one
+process-wide instance per configuration instead of rebuilding it for every
+scan.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# scanner key -> (module path, class name)
+SCANNER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'code': ('services.code_scanner', 'CodeScanner'),
+    'blob': ('services.blob_scanner', 'BlobScanner'),
+    'image': ('services.image_scanner', 'ImageScanner'),
+    'database': ('services.db_scanner', 'DBScanner'),
+    'api': ('services.api_scanner', 'APIScanner'),
+    'website': ('services.website_scanner', 'WebsiteScanner'),
+    'ai_model': ('services.ai_model_scanner', 'AIModelScanner'),
+    'dpia': ('services.dpia_scanner', 'DPIAScanner'),
+    'soc2': ('services.enhanced_soc2_scanner', 'EnhancedSOC2Scanner'),
+    'sustainability': ('services.cloud_resources_scanner', 'GithubRepoSustainabilityScanner'),
+    'cloud_resources': ('services.cloud_resources_scanner', 'CloudResourcesScanner'),
+    'code_bloat': ('services.code_bloat_scanner', 'CodeBloatScanner'),
+    'enterprise_connector': ('services.enterprise_connector_scanner', 'EnterpriseConnectorScanner'),
+    'intelligent_repo': ('services.intelligent_repo_scanner', 'IntelligentRepoScanner'),
+    'intelligent_blob': ('services.intelligent_blob_scanner', 'IntelligentBlobScanner'),
+    'intelligent_image': ('services.intelligent_image_scanner', 'IntelligentImageScanner'),
+    'intelligent_website': ('services.intelligent_website_scanner', 'IntelligentWebsiteScanner'),
+    'intelligent_db': ('services.intelligent_db_scanner', 'IntelligentDBScanner'),
+}
+
+# Scanners without per-scan instance state, safe to share between sessions
+SHARED_SCANNERS = frozenset({'blob', 'image'})
+
+_loaded_classes: Dict[str, type] = {}
+_load_lock = threading.Lock()
+
+_shared_instances: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+_shared_lock = threading.Lock()
+
+
+def get_scanner_class(scanner_key: str) -> type:
+    """
+    Return the scanner class for a key, importing its module on first use.
+
+    Args:
+        scanner_key: Key from SCANNER_REGISTRY (e.g. 'ai_model', 'blob')
+
+    Returns:
+        Scanner class
+
+    Raises:
+        KeyError: If the scanner key is not registered
+        ImportError: If the scanner module cannot be imported
+    """
+    scanner_class = _loaded_classes.get(scanner_key)
+    if scanner_class is not None:
+        return scanner_class
+
+    if scanner_key not in SCANNER_REGISTRY:
+        raise KeyError(f"Unknown scanner: {scanner_key}")
+
+    module_path, class_name = SCANNER_REGISTRY[scanner_key]
+    with _load_lock:
+        scanner_class = _loaded_classes.get(scanner_key)
+        if scanner_class is None:
+            module = importlib.import_module(module_path)
+            scanner_class = getattr(module, class_name)
+            _loaded_classes[scanner_key] = scanner_class
+            logger.debug(f"Loaded scanner '{scanner_key}' from {module_path}")
+    return scanner_class
+
+
+def create_scanner(scanner_key: str, *args: Any, **kwargs: Any) -> Any:
+    """Instantiate a registered scanner, importing it on first use."""
+    return get_scanner_class(scanner_key)(*args, **kwargs)
+
+
+def get_shared_scanner(scanner_key: str, **config: Any) -> Any:
+    """
+    Return a process-wide scanner instance for a configuration.
+
+    Scanners not in SHARED_SCANNERS keep per-scan state, so a new instance
+    is created for them on every call.
+
+    Args:
+        scanner_key: Key from SCANNER_REGISTRY
+        **config: Constructor keyword arguments (must be hashable)
+
+    Returns:
+        Scanner instance
+    """
+    if scanner_key not in SHARED_SCANNERS:
+        return create_scanner(scanner_key, **config)
+
+    key = (scanner_key, tuple(sorted(config.items())))
+    scanner = _shared_instances.get(key)
+    if scanner is not None:
+        return scanner
+    with _shared_lock:
+        scanner = _shared_instances.get(key)
+        if scanner is None:
+            scanner = create_scanner(scanner_key, **config)
+            _shared_instances[key] = scanner
+    return scanner
+
+
+def is_scanner_loaded(scanner_key: str) -> bool:
+    """Check whether a scanner module has already been imported."""
+    return scanner_key in _loaded_classes
+
+
+def get_loaded_scanners() -> List[str]:
+    """Return the keys of all scanners imported so far in this process."""
+    return sorted(_loaded_classes)
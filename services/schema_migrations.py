@@ -0,0 +1,382 @@
+"""
+Schema Migrations - Versioned PostgreSQL Schema Management
+
+Applies the ordered SQL files in database/migrations once per database and
+records them in a `schema_version` table, replacing the CREATE TABLE/INDEX
+and ALTER TABLE statements that services used to run on every
+instantiation. Migrations run at deploy time (`python -m
+services.schema_migrations`) or on first use in a process via
+`ensure_schema()`; after that, constructing a service costs no DDL.
+
+Migration files are named `NNNN_description.sql`. A migration whose data
+step cannot be written in SQL (e.g. it reads encrypted result_json) adds
+`NNNN_description.py` next to it, defining `migrate(cursor)`; the step runs
+after the SQL, in the same transaction. Header directives:
+    -- no-transaction        run statement by statement outside a
+                             transaction (needed for CREATE INDEX CONCURRENTLY)
+    -- skip-if: NAME=value   leave the migration pending while the environment
+                             variable has that value
+
+A CREATE INDEX CONCURRENTLY that fails leaves an INVALID index behind, which
+IF NOT EXISTS would then keep forever; the runner drops such an index before
+building it again.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "database", "migrations")
+
+# pg_advisory_lock key serialising concurrent runners (app replicas starting together)
+MIGRATION_LOCK_KEY = 82714401
+
+_MIGRATION_FILE = re.compile(r'^(\d+)_([\w-]+)\.sql$')
+_STEP_FILE = re.compile(r'^(\d+)_([\w-]+)\.py$')
+_SKIP_IF = re.compile(r'^--\s*skip-if:\s*(\w+)=(.*)$', re.MULTILINE)
+
+# Seconds ensure_schema() waits before retrying migrations that failed
+MIGRATION_RETRY_SECONDS = int(os.environ.get('DG_MIGRATION_RETRY_SECONDS', '300'))
+
+_CONCURRENT_INDEX = re.compile(
+    r'^CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+("?[\w.]+"?)', re.IGNORECASE
+)
+
+_ensured_urls: Set[str] = set()
+_failed_urls: Dict[str, Tuple[float, Exception]] = {}
+_ensure_lock = threading.Lock()
+
+
+@dataclass
+class Migration:
+    """One migration file, with its Python step if it has one."""
+    version: int
+    name: str
+    path: str
+    sql: str
+    step_path: Optional[str] = None
+    step_source: str = ''
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256((self.sql + self.step_source).encode('utf-8')).hexdigest()
+
+    @property
+    def transactional(self) -> bool:
+        return not re.search(r'^--\s*no-transaction\s*$', self.sql, re.MULTILINE)
+
+    def skip_reason(self) -> Optional[str]:
+        """Why the migration must stay pending in this environment, if it must."""
+        for name, value in _SKIP_IF.findall(self.sql):
+            if os.environ.get(name) == value.strip():
+                return f"{name}={value.strip()}"
+        return None
+
+    def load_step(self):
+        """The module of the Python step, None when the migration has none."""
+        if self.step_path is None:
+            return None
+        spec = importlib.util.spec_from_file_location(f"_migration_{self.version:04d}_{self.name}", self.step_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def run_step(self, cursor) -> None:
+        """Run the Python step's migrate(cursor), if the migration has one."""
+        module = self.load_step()
+        if module is not None:
+            module.migrate(cursor)
+
+
+def discover_migrations(migrations_dir: str = MIGRATIONS_DIR) -> List[Migration]:
+    """Load migration files (and their Python steps) ordered by version."""
+    migrations = []
+    steps = {}
+    for filename in os.listdir(migrations_dir):
+        match = _MIGRATION_FILE.match(filename)
+        step = _STEP_FILE.match(filename)
+        if not match and not step:
+            continue
+        path = os.path.join(migrations_dir, filename)
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), path, source))
+        else:
+            steps[(int(step.group(1)), step.group(2))] = (path, source)
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {migrations_dir}")
+    for migration in migrations:
+        step = steps.pop((migration.version, migration.name), None)
+        if step is not None:
+            migration.step_path, migration.step_source = step
+    if steps:
+        raise ValueError(f"Python migration steps without an SQL file in {migrations_dir}: "
+                         f"{sorted(os.path.basename(path) for path, _ in steps.values())}")
+    return migrations
+
+
+def split_sql_statements(sql: str) -> List[str]:
+    """
+    Split a SQL script into statements on top-level semicolons, respecting
+    quoted strings, dollar-quoted bodies and comments.
+    """
+    statements = []
+    current: List[str] = []
+    i = 0
+    length = len(sql)
+    while i < length:
+        char = sql[i]
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = length if end == -1 else end + 1
+            current.append('\n')
+            continue
+        if sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        if char in ("'", '"'):
+            end = i + 1
+            while end < length:
+                if sql[end] == char:
+                    if end + 1 < length and sql[end + 1] == char:
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        if char == '$':
+            tag = re.match(r'\$(\w*)\$', sql[i:])
+            if tag:
+                end = sql.find(tag.group(0), i + len(tag.group(0)))
+                end = length if end == -1 else end + len(tag.group(0))
+                current.append(sql[i:end])
+                i = end
+                continue
+        if char == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += 1
+            continue
+        current.append(char)
+        i += 1
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def _connect(db_url: str):
+    import psycopg2
+    # sslmode comes from the URL (?sslmode=require), as for the services
+    return psycopg2.connect(db_url)
+
+
+def _drop_invalid_index(cursor, statement: str) -> None:
+    """Drop the INVALID index left by an earlier failed CREATE INDEX CONCURRENTLY."""
+    match = _CONCURRENT_INDEX.match(statement)
+    if not match:
+        return
+    index_name = match.group(1)
+    cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (index_name,))
+    row = cursor.fetchone()
+    if row is not None and not row[0]:
+        logger.warning(f"Dropping invalid index {index_name} left by an interrupted build")
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def _applied_versions(cursor) -> dict:
+    cursor.execute("SELECT version, checksum FROM schema_version")
+    return {version: checksum for version, checksum in cursor.fetchall()}
+
+
+def run_migrations(db_url: Optional[str] = None, conn=None,
+                   migrations_dir: str = MIGRATIONS_DIR) -> List[int]:
+    """
+    Apply pending migrations in version order.
+
+    Each transactional migration and its schema_version row commit together,
+    so a failure leaves the database at the previous version. A session
+    advisory lock makes concurrent runners wait for each other.
+
+    Args:
+        db_url: PostgreSQL URL (defaults to DATABASE_URL)
+        conn: Existing connection to use instead of db_url
+        migrations_dir: Directory holding the migration files
+
+    Returns:
+        Versions applied by this call
+    """
+    owns_connection = conn is None
+    if owns_connection:
+        db_url = db_url or os.environ.get('DATABASE_URL')
+        if not db_url:
+            raise RuntimeError("DATABASE_URL environment variable required for schema migrations")
+        conn = _connect(db_url)
+
+    applied_now: List[int] = []
+    try:
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    checksum TEXT NOT NULL,
+                    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            applied = _applied_versions(cursor)
+
+            for migration in discover_migrations(migrations_dir):
+                if migration.version in applied:
+                    if applied[migration.version] != migration.checksum:
+                        logger.warning(f"Migration {migration.version}_{migration.name} changed after it was applied")
+                    continue
+                skip_reason = migration.skip_reason()
+                if skip_reason:
+                    logger.warning(f"Skipping migration {migration.version}_{migration.name} ({skip_reason})")
+                    continue
+
+                logger.info(f"Applying migration {migration.version}_{migration.name}")
+                if migration.transactional:
+                    conn.autocommit = False
+                    try:
+                        cursor.execute(migration.sql)
+                        migration.run_step(cursor)
+                        cursor.execute(
+                            "INSERT INTO schema_version (version, name, checksum) VALUES (%s, %s, %s)",
+                            (migration.version, migration.name, migration.checksum)
+                        )
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    finally:
+                        conn.autocommit = True
+                else:
+                    # Statements must be idempotent: a failure part-way is retried in full
+                    for statement in split_sql_statements(migration.sql):
+                        _drop_invalid_index(cursor, statement)
+                        cursor.execute(statement)
+                    migration.run_step(cursor)
+                    cursor.execute(
+                        "INSERT INTO schema_version (version, name, checksum) VALUES (%s, %s, %s)",
+                        (migration.version, migration.name, migration.checksum)
+                    )
+                applied_now.append(migration.version)
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+            cursor.close()
+    finally:
+        if owns_connection:
+            conn.close()
+
+    if applied_now:
+        logger.info(f"Applied schema migrations: {applied_now}")
+    return applied_now
+
+
+def ensure_schema(db_url: Optional[str] = None) -> None:
+    """
+    Bring the schema up to date once per process and database.
+
+    Services call this instead of running their own DDL; every call after
+    the first is a set lookup. Set DG_SKIP_STARTUP_MIGRATIONS=1 when
+    migrations are run as a separate deploy step.
+
+    A failed run is remembered per database: calls within
+    MIGRATION_RETRY_SECONDS raise the recorded failure instead of running
+    the migrations again.
+
+    Raises:
+        RuntimeError: If the migrations failed (now or within the retry window)
+    """
+    db_url = db_url or os.environ.get('DATABASE_URL')
+    if not db_url or db_url in _ensured_urls:
+        return
+    if os.environ.get('DG_SKIP_STARTUP_MIGRATIONS', '0').lower() in ('1', 'true', 'yes'):
+        _ensured_urls.add(db_url)
+        return
+    with _ensure_lock:
+        if db_url in _ensured_urls:
+            return
+        failed = _failed_urls.get(db_url)
+        if failed is not None and time.monotonic() - failed[0] < MIGRATION_RETRY_SECONDS:
+            raise RuntimeError(f"Schema migrations failed, retrying after {MIGRATION_RETRY_SECONDS}s: {failed[1]}")
+        try:
+            run_migrations(db_url)
+        except Exception as e:
+            _failed_urls[db_url] = (time.monotonic(), e)
+            raise RuntimeError(f"Schema migrations failed: {str(e)}") from e
+        _failed_urls.pop(db_url, None)
+        _ensured_urls.add(db_url)
+
+
+def migration_status(db_url: Optional[str] = None,
+                     migrations_dir: str = MIGRATIONS_DIR) -> List[dict]:
+    """Applied/pending state of every migration file."""
+    db_url = db_url or os.environ.get('DATABASE_URL')
+    if not db_url:
+        raise RuntimeError("DATABASE_URL environment variable required for schema migrations")
+    conn = _connect(db_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT to_regclass('schema_version')")
+        applied = _applied_versions(cursor) if cursor.fetchone()[0] else {}
+        cursor.close()
+    finally:
+        conn.close()
+    return [
+        {
+            'version': m.version,
+            'name': m.name,
+            'applied': m.version in applied,
+            'modified': m.version in applied and applied[m.version] != m.checksum,
+        }
+        for m in discover_migrations(migrations_dir)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Apply DataGuardian Pro database migrations")
+    parser.add_argument("--status", action="store_true", help="show applied and pending migrations")
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    if args.status:
+        for entry in migration_status(args.database_url):
+            state = 'applied' if entry['applied'] else 'pending'
+            if entry['modified']:
+                state += ' (modified)'
+            print(f"{entry['version']:04d}_{entry['name']:<32} {state}")
+        return 0
+
+    applied = run_migrations(args.database_url)
+    print(f"Applied {len(applied)} migration(s)" + (f": {applied}" if applied else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""
+Site Scan Context - Shared Per-Site State for Page Workers
+
+IntelligentWebsiteScanner used to build a new WebsiteScanner for every
+page it scanned and run a one-page scan_website() on it. Every page paid
+for reloading the tracker and cookie databases, a WHOIS/DNS lookup, an
+SSL check and a fresh HTTP session with new connections, and the site
+analysis and page discovery each downloaded the sitemap separately.
+
+A SiteScanContext is created once per scan and shared by the page
+workers. It holds:
+
+- one requests session whose connection pool is sized for the workers
+- the site's robots.txt rules and its sitemap, each fetched once
+- site-level checks (SSL, WHOIS/DNS, security headers, privacy policy
+  discovery) run once
+- the WebsiteScanner and its compiled tracker index
+
+Responses fetched while discovering pages are kept (up to
+MAX_CACHED_RESPONSES) and handed to the page worker that analyzes the
+same URL, so analyze_page() costs at most one fetch plus the parse.
+analyze_page() is safe to call from several threads at once.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("site_scan_context")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT = 10
+
+# Where sitemaps are looked for after the ones robots.txt lists
+SITEMAP_PATHS = ('/sitemap.xml', '/sitemap_index.xml', '/sitemaps.xml')
+
+# URLs taken from the sitemap
+MAX_SITEMAP_URLS = 100
+
+# Discovery responses kept for the page workers
+MAX_CACHED_RESPONSES = 256
+
+SECURITY_HEADERS = (
+    'Strict-Transport-Security',
+    'Content-Security-Policy',
+    'X-Content-Type-Options',
+    'X-Frame-Options',
+    'Referrer-Policy',
+    'Permissions-Policy',
+)
+
+_SITEMAP_LOC = re.compile(r'<loc>(.*?)</loc>')
+
+
+class SiteScanContext:
+    """Session, robots rules, sitemap and site checks shared by a scan's page workers"""
+
+    def __init__(self, base_url: str, website_scanner=None,
+                 pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Create the context for one site.
+
+        Args:
+            base_url: URL the scan starts from
+            website_scanner: WebsiteScanner whose page analysis, databases and
+                settings are used (default: a WebsiteScanner created on first use)
+            pool_size: Concurrent connections kept to the site, normally the
+                number of page workers
+            timeout: Request timeout in seconds
+        """
+        parsed = urlparse(base_url if '://' in base_url else f"https://{base_url}")
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.base_domain = parsed.netloc
+        self.timeout = timeout
+        self._website_scanner = website_scanner
+
+        self.session = requests.Session()
+        scanner_session = getattr(website_scanner, 'session', None)
+        if scanner_session is not None:
+            self.session.headers.update(scanner_session.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 1))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.requests_made = 0
+        self._lock = threading.Lock()
+        self._setup_lock = threading.RLock()
+        self._responses: 'OrderedDict[str, requests.Response]' = OrderedDict()
+        self._next_request_at = 0.0
+        self._robots: Optional[RobotFileParser] = None
+        self.has_robots_txt = False
+        self._sitemap: Optional[Tuple[str, str]] = None
+        self._sitemap_loaded = False
+        self._site_checks: Optional[Dict[str, Any]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Release pooled connections and cached responses"""
+        with self._lock:
+            self._responses.clear()
+        self.session.close()
+
+    @property
+    def website_scanner(self):
+        """The WebsiteScanner pages are analyzed with"""
+        if self._website_scanner is None:
+            from services.website_scanner import WebsiteScanner
+            self._website_scanner = WebsiteScanner()
+        return self._website_scanner
+
+    @property
+    def tracker_index(self):
+        """Compiled tracker index shared by all pages"""
+        return self.website_scanner.tracker_index
+
+    @property
+    def user_agent(self) -> str:
+        return self.session.headers.get('User-Agent', '*')
+
+    def fetch(self, url: str, timeout: Optional[float] = None, keep: bool = False) -> requests.Response:
+        """
+        GET a URL through the pooled session.
+
+        A response kept by an earlier fetch is returned instead of fetching
+        again; it is handed out once unless keep is set again.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout (default: the context's timeout)
+            keep: Keep the response for the next fetch of the same URL
+
+        Returns:
+            The response
+        """
+        with self._lock:
+            response = self._responses.get(url) if keep else self._responses.pop(url, None)
+            if response is not None:
+                return response
+            robots = self._robots
+            delay = float(robots.crawl_delay(self.user_agent) or 0) if robots is not None else 0
+            now = time.monotonic()
+            wait = max(self._next_request_at - now, 0)
+            self._next_request_at = now + wait + delay
+            self.requests_made += 1
+        if wait:
+            time.sleep(wait)
+
+        response = self.session.get(url, timeout=timeout or self.timeout)
+        if keep:
+            with self._lock:
+                self._responses[url] = response
+                while len(self._responses) > MAX_CACHED_RESPONSES:
+                    self._responses.popitem(last=False)
+        return response
+
+    def robots(self) -> RobotFileParser:
+        """
+        The site's robots.txt rules, fetched on first use.
+
+        Returns:
+            Parsed rules; everything is allowed if the site has no robots.txt
+        """
+        with self._setup_lock:
+            if self._robots is None:
+                self._robots = self._load_robots()
+        return self._robots
+
+    def _load_robots(self) -> RobotFileParser:
+        robots_url = urljoin(self.base_url, '/robots.txt')
+        rules = RobotFileParser(robots_url)
+        try:
+            response = self.fetch(robots_url, timeout=5)
+            if response.status_code in (401, 403):
+                rules.disallow_all = True
+            elif response.status_code == 200:
+                self.has_robots_txt = True
+                rules.parse(response.text.splitlines())
+            else:
+                rules.allow_all = True
+        except Exception as e:
+            logger.warning(f"Error fetching robots.txt for {self.base_domain}: {str(e)}")
+            rules.allow_all = True
+        return rules
+
+    def allowed(self, url: str) -> bool:
+        """Whether robots.txt allows the scanner to fetch a URL"""
+        return self.robots().can_fetch(self.user_agent, url)
+
+    @property
+    def crawl_delay(self) -> float:
+        """Seconds between requests asked for by robots.txt (0 if none)"""
+        return float(self.robots().crawl_delay(self.user_agent) or 0)
+
+    def sitemap(self) -> Optional[Tuple[str, str]]:
+        """
+        The site's sitemap, fetched on first use.
+
+        Sitemaps listed in robots.txt are tried first, then SITEMAP_PATHS.
+
+        Returns:
+            (sitemap URL, sitemap text), or None if the site has none
+        """
+        with self._setup_lock:
+            if not self._sitemap_loaded:
+                self._sitemap = self._load_sitemap()
+                self._sitemap_loaded = True
+        return self._sitemap
+
+    def _load_sitemap(self) -> Optional[Tuple[str, str]]:
+        candidates = list(self.robots().site_maps() or [])
+        candidates += [urljoin(self.base_url, path) for path in SITEMAP_PATHS]
+        for sitemap_url in dict.fromkeys(candidates):
+            try:
+                response = self.fetch(sitemap_url, timeout=5)
+                if response.status_code == 200:
+                    return sitemap_url, response.text
+            except Exception as e:
+                logger.warning(f"Error fetching sitemap {sitemap_url}: {str(e)}")
+        return None
+
+    def sitemap_urls(self, limit: int = MAX_SITEMAP_URLS) -> List[str]:
+        """
+        Page URLs listed in the sitemap.
+
+        Args:
+            limit: Maximum number of URLs returned
+
+        Returns:
+            The first limit <loc> entries of the sitemap
+        """
+        sitemap = self.sitemap()
+        if sitemap is None:
+            return []
+        return _SITEMAP_LOC.findall(sitemap[1])[:limit]
+
+    def site_checks(self) -> Dict[str, Any]:
+        """
+        Checks that hold for the whole site, run once per scan.
+
+        Returns:
+            Dictionary with ssl_info, domain_info, security_headers,
+            privacy_links, has_privacy_policy, has_robots_txt and sitemap
+        """
+        with self._setup_lock:
+            if self._site_checks is None:
+                self._site_checks = self._run_site_checks()
+        return self._site_checks
+
+    def _run_site_checks(self) -> Dict[str, Any]:
+        scanner = self.website_scanner
+        checks = {
+            'ssl_info': scanner._check_ssl(self.base_url) if scanner.check_ssl else None,
+            'domain_info': scanner._check_domain_info(self.base_domain),
+            'security_headers': {'present': [], 'missing': list(SECURITY_HEADERS)},
+            'privacy_links': {},
+            'has_privacy_policy': False,
+            'has_robots_txt': False,
+            'sitemap': None,
+        }
+        try:
+            response = self.fetch(self.base_url, keep=True)
+            checks['security_headers'] = {
+                'present': [h for h in SECURITY_HEADERS if h in response.headers],
+                'missing': [h for h in SECURITY_HEADERS if h not in response.headers],
+            }
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                page_data = scanner._analyze_page(response.url, response.text, 0)
+                checks['privacy_links'] = page_data.get('privacy_links', {})
+                checks['has_privacy_policy'] = 'privacy_policy' in checks['privacy_links']
+        except Exception as e:
+            logger.warning(f"Error checking {self.base_url}: {str(e)}")
+        self.robots()
+        checks['has_robots_txt'] = self.has_robots_txt
+        sitemap = self.sitemap()
+        checks['sitemap'] = sitemap[0] if sitemap else None
+        return checks
+
+    def analyze_page(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch and analyze one page. Safe to call from several threads.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Dictionary with url, findings, cookies (name -> cookie data),
+            trackers and page_data (None if the page is not HTML)
+        """
+        result = {'url': url, 'findings': [], 'cookies': {}, 'trackers': [], 'page_data': None}
+        scanner = self.website_scanner
+        try:
+            response = self.fetch(url)
+            if 'text/html' not in response.headers.get('Content-Type', ''):
+                return result
+
+            page_data = scanner._analyze_page(url, response.text, 0)
+            findings = result['findings']
+            result['cookies'] = scanner._extract_cookies(response, findings)
+            findings.extend(page_data.get('findings', []))
+
+            trackers = {}
+            for tracker in page_data.get('trackers', []):
+                if tracker.get('name'):
+                    trackers[tracker['name']] = tracker
+            result['trackers'] = list(trackers.values())
+            result['page_data'] = page_data
+        except Exception as e:
+            logger.error(f"Error scanning {url}: {str(e)}")
+            result['findings'].append({
+                'type': 'error',
+                'url': url,
+                'location': f"Page Access Error: {url}",
+                'element': 'page request',
+                'description': f"Failed to scan page: {str(e)}",
+                'severity': 'Medium'
+            })
+        return result
@@ -10,6 +10,8 @@ import os
 import re
 import json
 import logging
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Tuple, Optional, Set
 import tempfile
 import glob
@@ -465,6 +467,129 @@ IaC_RISK_PATTERNS = {
     # Add more as needed
 }
 
+try:
+    from re import _parser as _regex_parser
+except ImportError:  # Python < 3.11
+    import sre_parse as _regex_parser
+
+# Below this many files a process pool costs more than it saves
+IAC_BATCH_MIN_FILES_FOR_POOL = 64
+
+
+class _CompiledRiskRule:
+    """Precompiled IaC risk pattern with its literal prefilter and TSC mapping"""
+
+    __slots__ = ("regex", "required_literals", "leading_literal", "description",
+                 "severity", "recommendation", "category", "tsc_criteria", "tsc_details")
+
+    def __init__(self, pattern: str, description: str, severity: str,
+                 recommendation: str, category: str):
+        self.regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        self.required_literals, self.leading_literal = _analyze_literals(pattern)
+        self.description = description
+        self.severity = severity
+        self.recommendation = recommendation
+        self.category = category
+        if description in FINDING_TO_TSC_MAP:
+            self.tsc_criteria = FINDING_TO_TSC_MAP[description]
+        else:
+            self.tsc_criteria = CATEGORY_TO_TSC_MAP.get(category, [])
+        self.tsc_details = [
+            {"criterion": criterion, "description": SOC2_TSC_MAPPING.get(criterion, "")}
+            for criterion in self.tsc_criteria
+        ]
+
+    def may_match(self, lowered_content: str) -> bool:
+        """False only when no required literal occurs, i.e. the regex cannot match."""
+        if self.required_literals is None:
+            return True
+        return any(literal in lowered_content for literal in self.required_literals)
+
+    def finditer(self, content: str, lowered_content: Optional[str]):
+        """
+        Same matches as regex.finditer(content). When every match must start
+        with a known literal, jump between its occurrences with str.find and
+        only run the (case-insensitive, hence unaccelerated) regex there.
+        """
+        if lowered_content is None or not self.leading_literal:
+            yield from self.regex.finditer(content)
+            return
+        literal = self.leading_literal
+        pos = lowered_content.find(literal)
+        while pos != -1:
+            match = self.regex.match(content, pos)
+            if match:
+                yield match
+                pos = lowered_content.find(literal, match.end())
+            else:
+                pos = lowered_content.find(literal, pos + 1)
+
+
+def _literal_alternatives(items) -> Optional[Tuple[str, ...]]:
+    """
+    Find literals one of which must occur in any text matched by a parsed
+    regex sequence. Returns the strongest candidate (longest shortest
+    alternative) or None when no mandatory literal can be proven.
+    """
+    best: Optional[Tuple[str, ...]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[Tuple[str, ...]]):
+        nonlocal best
+        if candidate and all(candidate):
+            if best is None or min(map(len, candidate)) > min(map(len, best)):
+                best = candidate
+
+    for op, av in items:
+        if op is _regex_parser.LITERAL:
+            run.append(chr(av))
+            continue
+        consider(("".join(run).lower(),) if run else None)
+        run = []
+        if op is _regex_parser.SUBPATTERN:
+            consider(_literal_alternatives(av[-1]))
+        elif op is _regex_parser.BRANCH:
+            alternatives = [_literal_alternatives(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(tuple(literal for alt in alternatives for literal in alt))
+        elif op in (_regex_parser.MAX_REPEAT, _regex_parser.MIN_REPEAT) and av[0] >= 1:
+            consider(_literal_alternatives(av[2]))
+    consider(("".join(run).lower(),) if run else None)
+    return best
+
+
+def _analyze_literals(pattern: str) -> Tuple[Optional[Tuple[str, ...]], str]:
+    """
+    Extract the literal prefilter and the literal every match starts with
+    (empty when there is none) for a risk pattern.
+    """
+    try:
+        parsed = _regex_parser.parse(pattern, re.IGNORECASE | re.MULTILINE)
+    except Exception:
+        return None, ""
+    leading = []
+    for op, av in parsed:
+        if op is not _regex_parser.LITERAL:
+            break
+        leading.append(chr(av))
+    return _literal_alternatives(parsed), "".join(leading).lower()
+
+
+_COMPILED_RULE_SETS: Dict[str, List[_CompiledRiskRule]] = {}
+
+
+def get_compiled_rule_set(tech: str) -> List[_CompiledRiskRule]:
+    """Return the precompiled risk rules for an IaC technology (compiled once per process)."""
+    rules = _COMPILED_RULE_SETS.get(tech)
+    if rules is None:
+        rules = [
+            _CompiledRiskRule(pattern, *details)
+            for pattern, details in IaC_RISK_PATTERNS.get(tech, {}).items()
+        ]
+        _COMPILED_RULE_SETS[tech] = rules
+    return rules
+
+
 def identify_iac_technology(file_path: str) -> Optional[str]:
     """
     Identify the IaC technology used in the given file.
@@ -558,63 +683,103 @@ def scan_iac_file(file_path: str, tech: Optional[str] = None) -> List[Dict[str,
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            
-        # Get risk patterns for this technology
-        risk_patterns = IaC_RISK_PATTERNS[tech]
-        
-        # Check each pattern
-        for pattern, (description, severity, recommendation, category) in risk_patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                context_start = max(0, content.rfind('\n', 0, match.start()) + 1)
-                context_end = content.find('\n', match.end())
-                if context_end == -1:
-                    context_end = len(content)
-                    
-                code_snippet = content[context_start:context_end].strip()
-                
-                # Get SOC2 TSC criteria mapping for this finding
-                tsc_criteria = []
-                
-                # Check if we have a specific mapping for this description
-                if description in FINDING_TO_TSC_MAP:
-                    tsc_criteria = FINDING_TO_TSC_MAP[description]
-                else:
-                    # Fall back to category-based mapping
-                    tsc_criteria = CATEGORY_TO_TSC_MAP.get(category, [])
-                
-                # Create tsc_details with criterion and description pairs
-                tsc_details = []
-                for criterion in tsc_criteria:
-                    criterion_description = SOC2_TSC_MAPPING.get(criterion, "")
-                    tsc_details.append({
-                        "criterion": criterion,
-                        "description": criterion_description
-                    })
-                
-                finding = {
-                    "file": file_path,
-                    "line": line_num,
-                    "description": description,
-                    "risk_level": severity,
-                    "recommendation": recommendation,
-                    "category": category,
-                    "location": f"{os.path.basename(file_path)}:{line_num}",
-                    "code_snippet": code_snippet,
-                    "technology": tech,
-                    "soc2_tsc_criteria": tsc_criteria,
-                    "soc2_tsc_details": tsc_details
-                }
-                
-                findings.append(finding)
+
+        findings = scan_iac_content(content, file_path, tech)
     except Exception as e:
         logger.error(f"Error scanning file {file_path}: {str(e)}")
         traceback.print_exc()
         
     return findings
 
+def scan_iac_content(content: str, file_path: str, tech: str) -> List[Dict[str, Any]]:
+    """
+    Scan already-loaded IaC content with the precompiled rule set for a technology.
+    
+    Rules whose required literals do not occur in the content are skipped, and
+    line numbers come from a bisect over newline offsets rather than counting
+    newlines up to every match.
+    
+    Args:
+        content: File content
+        file_path: Path reported in the findings
+        tech: Technology identifier (key of IaC_RISK_PATTERNS)
+        
+    Returns:
+        List of findings, each a dictionary with issue details
+    """
+    findings = []
+    rules = get_compiled_rule_set(tech)
+    if not rules:
+        return findings
+
+    # str.lower() only mirrors re.IGNORECASE for ASCII text
+    lowered = content.lower() if content.isascii() else None
+    newline_offsets = None
+    file_name = os.path.basename(file_path)
+
+    for rule in rules:
+        if lowered is not None and not rule.may_match(lowered):
+            continue
+
+        for match in rule.finditer(content, lowered):
+            if newline_offsets is None:
+                newline_offsets = [m.start() for m in re.finditer('\n', content)]
+            line_num = bisect_left(newline_offsets, match.start()) + 1
+            context_start = max(0, content.rfind('\n', 0, match.start()) + 1)
+            context_end = content.find('\n', match.end())
+            if context_end == -1:
+                context_end = len(content)
+
+            findings.append({
+                "file": file_path,
+                "line": line_num,
+                "description": rule.description,
+                "risk_level": rule.severity,
+                "recommendation": rule.recommendation,
+                "category": rule.category,
+                "location": f"{file_name}:{line_num}",
+                "code_snippet": content[context_start:context_end].strip(),
+                "technology": tech,
+                "soc2_tsc_criteria": list(rule.tsc_criteria),
+                "soc2_tsc_details": [dict(detail) for detail in rule.tsc_details]
+            })
+
+    return findings
+
+def _scan_iac_file_task(task: Tuple[str, Optional[str]]) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Process pool task: identify (if needed) and scan a single file."""
+    file_path, tech = task
+    if tech is None:
+        tech = identify_iac_technology(file_path)
+        if tech is None:
+            return None, []
+    return tech, scan_iac_file(file_path, tech)
+
+def scan_iac_files(files: List[Tuple[str, Optional[str]]],
+                   max_workers: Optional[int] = None) -> List[Tuple[Optional[str], List[Dict[str, Any]]]]:
+    """
+    Scan many IaC files, fanning out over a process pool for large batches.
+    
+    Args:
+        files: (file_path, tech) pairs; tech None means detect it per file
+        max_workers: Pool size (defaults to the CPU count)
+        
+    Returns:
+        (tech, findings) per input file, in input order. tech is None for
+        files that are not recognised as IaC.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if len(files) < IAC_BATCH_MIN_FILES_FOR_POOL or workers == 1:
+        return [_scan_iac_file_task(task) for task in files]
+
+    chunksize = max(1, len(files) // (workers * 8))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_scan_iac_file_task, files, chunksize=chunksize))
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"IaC process pool unavailable, scanning serially: {e}")
+        return [_scan_iac_file_task(task) for task in files]
+
 def scan_github_repo_for_soc2(repo_url: str, branch: Optional[str] = None, token: Optional[str] = None) -> Dict[str, Any]:
     """
     Scan a GitHub repository for SOC2 compliance issues in IaC code.
@@ -724,16 +889,14 @@ def scan_github_repo_for_soc2(repo_url: str, branch: Optional[str] = None, token
         
         results["total_files_scanned"] = len(all_files)
         
-        # Scan each file
-        for file_path in all_files:
-            tech = identify_iac_technology(file_path)
+        # Identify and scan all files as one batch
+        batch_results = scan_iac_files([(file_path, None) for file_path in all_files])
+        for tech, file_findings in batch_results:
             if tech:
                 results["iac_files_found"] += 1
                 if tech not in results["technologies_detected"]:
                     results["technologies_detected"].append(tech)
                 
-                file_findings = scan_iac_file(file_path, tech)
-                
                 # Make file paths relative to repo
                 for finding in file_findings:
                     finding["file"] = os.path.relpath(finding["file"], temp_dir)
@@ -925,10 +1088,9 @@ def scan_azure_repo_for_soc2(repo_url: str, project: str, branch: Optional[str]
         
         # If we found IaC files, scan them
         if iac_files:
-            # Process each file
-            for file_path, tech, rel_path in iac_files:
-                # Scan file
-                file_findings = scan_iac_file(file_path, tech)
+            # Scan all IaC files as one batch
+            batch_results = scan_iac_files([(file_path, tech) for file_path, tech, _ in iac_files])
+            for (file_path, tech, rel_path), (_, file_findings) in zip(iac_files, batch_results):
                 
                 # Add file path to each finding
                 for finding in file_findings:
@@ -0,0 +1,389 @@
+"""
+Data Subject Index
+
+Persistent inverted index from data-subject identifiers to the locations
+holding their data, so DSAR discovery is a lookup instead of a re-scan of
+every source.
+
+- Identifiers (email, BSN, phone, IBAN, name) are normalised and stored
+  only as keyed hashes (HMAC-SHA256 over tenant, type and value), so the
+  index itself holds no readable personal data.
+- Scanners populate it as a by-product: ResultsAggregator.store_scan_result
+  indexes the findings of every stored scan.
+- Postings are keyed by (subject_key, location_id) in a WITHOUT ROWID table,
+  so a lookup is a handful of index seeks regardless of index size.
+- Re-indexing a scan updates counts in place; nothing is appended twice.
+
+The database lives at DG_SUBJECT_INDEX_DB (default data/subject_index.db).
+The hashing key comes from DG_SUBJECT_INDEX_KEY, is derived from
+DATAGUARDIAN_MASTER_KEY, or is generated once and kept next to the database.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER_TYPES = ('email', 'bsn', 'phone', 'iban', 'name')
+
+# Finding types reported by the scanners, mapped to identifier types
+_FINDING_TYPES = {
+    'email': 'email', 'email address': 'email', 'e-mail': 'email',
+    'bsn': 'bsn', 'burgerservicenummer': 'bsn',
+    'phone': 'phone', 'phone number': 'phone', 'telephone': 'phone', 'mobile': 'phone',
+    'iban': 'iban', 'bank account': 'iban',
+    'name': 'name', 'person': 'name', 'person name': 'name', 'full name': 'name',
+}
+
+# Scan types mapped to DSAR location data types
+_DATA_TYPES = {
+    'database': 'database_record', 'db': 'database_record', 'intelligent_db': 'database_record',
+    'enterprise': 'cloud_data', 'cloud': 'cloud_data', 'cloud_resources': 'cloud_data',
+    'salesforce': 'cloud_data', 'sap': 'cloud_data',
+    'api': 'api_data', 'website': 'api_data',
+}
+
+_SENSITIVITY_RANK = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+_IBAN_RE = re.compile(r'[A-Z]{2}\d{2}[A-Z0-9]{8,30}')
+_NON_DIGIT_RE = re.compile(r'\D')
+_IBAN_SEPARATOR_RE = re.compile(r'[\s-]')
+_NAME_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Subject keys are truncated HMACs; 128 bits keeps collisions out of reach
+SUBJECT_KEY_BYTES = 16
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS subject_locations (
+        id INTEGER PRIMARY KEY,
+        organization_id TEXT NOT NULL,
+        system_name TEXT NOT NULL,
+        data_type TEXT NOT NULL,
+        location_path TEXT NOT NULL,
+        sensitivity_level TEXT NOT NULL,
+        last_scan_id TEXT,
+        last_seen TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS subject_postings (
+        subject_key BLOB NOT NULL,
+        location_id INTEGER NOT NULL,
+        identifier_type TEXT NOT NULL,
+        record_count INTEGER NOT NULL,
+        PRIMARY KEY (subject_key, location_id)
+    ) WITHOUT ROWID;
+"""
+
+_UPSERT_LOCATION = """
+    INSERT INTO subject_locations
+    (id, organization_id, system_name, data_type, location_path, sensitivity_level, last_scan_id, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        system_name = excluded.system_name,
+        data_type = excluded.data_type,
+        sensitivity_level = excluded.sensitivity_level,
+        last_scan_id = excluded.last_scan_id,
+        last_seen = excluded.last_seen
+"""
+
+_UPSERT_POSTING = """
+    INSERT INTO subject_postings (subject_key, location_id, identifier_type, record_count)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT DO UPDATE SET record_count = excluded.record_count
+"""
+
+
+def identifier_type_for(finding_type: Any) -> Optional[str]:
+    """Identifier type for a scanner finding type ('EMAIL', 'Phone', ...), or None"""
+    if not finding_type:
+        return None
+    return _FINDING_TYPES.get(str(finding_type).strip().lower().replace('_', ' '))
+
+
+def normalize_identifier(identifier_type: str, value: Any) -> Optional[str]:
+    """
+    Canonical form of an identifier, so spelling variants hash alike.
+
+    Returns:
+        The normalised value, or None if it is not a valid identifier
+    """
+    if value is None:
+        return None
+    text = unicodedata.normalize('NFKC', str(value)).strip()
+    if identifier_type == 'email':
+        text = text.lower()
+        return text if _EMAIL_RE.fullmatch(text) else None
+    if identifier_type == 'bsn':
+        digits = _NON_DIGIT_RE.sub('', text)
+        return digits.zfill(9) if 8 <= len(digits) <= 9 else None
+    if identifier_type == 'phone':
+        digits = _NON_DIGIT_RE.sub('', text)
+        if not text.startswith('+'):
+            if digits.startswith('00'):
+                digits = digits[2:]
+            elif digits.startswith('0') and len(digits) == 10:
+                digits = '31' + digits[1:]  # Dutch national format
+        return digits if 8 <= len(digits) <= 15 else None
+    if identifier_type == 'iban':
+        iban = _IBAN_SEPARATOR_RE.sub('', text).upper()
+        return iban if _IBAN_RE.fullmatch(iban) else None
+    if identifier_type == 'name':
+        stripped = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+        name = ' '.join(_NAME_PUNCTUATION_RE.sub(' ', stripped.lower()).split())
+        return name if len(name) >= 3 else None
+    return None
+
+
+def _location_id(organization_id: str, location_path: str) -> int:
+    """Stable 63-bit row id of a tenant's location, so upserts need no lookup"""
+    digest = hashlib.blake2b(f"{organization_id}\x00{location_path}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 1
+
+
+def _finding_location(result: Dict[str, Any], finding: Dict[str, Any]) -> Tuple[str, str]:
+    """(system_name, location_path) of a finding within a scan result"""
+    scan_type = str(result.get('scan_type', 'unknown'))
+    system = (result.get('source') or result.get('url') or result.get('repo_url') or
+              result.get('database') or result.get('connector') or scan_type)
+    if finding.get('table_name'):
+        path = f"{finding['table_name']}.{finding.get('column_name', '*')}"
+    else:
+        path = (finding.get('file_path') or finding.get('file') or finding.get('url') or
+                finding.get('location') or '')
+    return str(system), f"{scan_type}://{system}/{path}".rstrip('/')
+
+
+def _load_key(db_path: str) -> bytes:
+    configured = os.environ.get('DG_SUBJECT_INDEX_KEY')
+    if configured:
+        return configured.encode('utf-8')
+    master = os.environ.get('DATAGUARDIAN_MASTER_KEY')
+    if master:
+        return hmac.new(master.encode('utf-8'), b'dataguardian-subject-index', hashlib.sha256).digest()
+    key_path = db_path + '.key'
+    try:
+        with open(key_path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        key = secrets.token_bytes(32)
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        logger.info(f"Generated subject index key at {key_path}")
+        return key
+
+
+class SubjectIndex:
+    """SQLite inverted index of hashed subject identifiers to data locations"""
+
+    def __init__(self, db_path: Optional[str] = None, key: Optional[bytes] = None):
+        self.db_path = db_path or os.environ.get("DG_SUBJECT_INDEX_DB") or os.path.join("data", "subject_index.db")
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._key = key if key is not None else _load_key(self.db_path)
+        self._local = threading.local()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def subject_key(self, organization_id: str, identifier_type: str, value: Any) -> Optional[bytes]:
+        """Keyed hash of a normalised identifier, or None if it is not valid"""
+        normalized = normalize_identifier(identifier_type, value)
+        if normalized is None:
+            return None
+        message = f"{organization_id}\x00{identifier_type}\x00{normalized}".encode('utf-8')
+        return hmac.digest(self._key, message, 'sha256')[:SUBJECT_KEY_BYTES]
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    def add_postings(self, organization_id: str,
+                     postings: Iterable[Tuple[str, Any, Dict[str, Any], int]],
+                     scan_id: Optional[str] = None) -> int:
+        """
+        Record that identifiers occur at locations.
+
+        Args:
+            organization_id: Tenant the locations belong to
+            postings: (identifier_type, value, location, record_count) tuples; a
+                location is a dict with system_name, data_type, location_path and
+                sensitivity_level
+            scan_id: Scan the postings come from
+
+        Returns:
+            Number of postings written
+        """
+        now = datetime.now().isoformat()
+        locations: Dict[int, Tuple] = {}
+        rows: Dict[Tuple[bytes, int], List] = {}
+        for identifier_type, value, location, record_count in postings:
+            subject_key = self.subject_key(organization_id, identifier_type, value)
+            if subject_key is None:
+                continue
+            location_id = _location_id(organization_id, location['location_path'])
+            sensitivity = str(location.get('sensitivity_level') or 'medium').lower()
+            known = locations.get(location_id)
+            if known is not None and _SENSITIVITY_RANK.get(known[5], 1) > _SENSITIVITY_RANK.get(sensitivity, 1):
+                sensitivity = known[5]
+            locations[location_id] = (location_id, organization_id, location['system_name'],
+                                      location.get('data_type', 'file'), location['location_path'],
+                                      sensitivity, scan_id, now)
+            row = rows.setdefault((subject_key, location_id), [subject_key, location_id, identifier_type, 0])
+            row[3] += record_count
+
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Key order turns bulk loads into appends to the B-trees
+            conn.executemany(_UPSERT_LOCATION, (locations[key] for key in sorted(locations)))
+            conn.executemany(_UPSERT_POSTING, (rows[key] for key in sorted(rows)))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def index_scan_result(self, organization_id: str, result: Dict[str, Any]) -> int:
+        """
+        Index the subject identifiers found by a scan.
+
+        Args:
+            organization_id: Tenant the scan belongs to
+            result: Scan result with findings carrying 'type' and 'value'
+
+        Returns:
+            Number of postings written
+        """
+        scan_type = str(result.get('scan_type', 'unknown')).lower()
+        data_type = _DATA_TYPES.get(scan_type, 'file')
+        postings = []
+        for finding in result.get('findings') or []:
+            if not isinstance(finding, dict):
+                continue
+            identifier_type = identifier_type_for(finding.get('type') or finding.get('pii_type'))
+            if identifier_type is None:
+                continue
+            system_name, location_path = _finding_location(result, finding)
+            location = {
+                'system_name': system_name,
+                'data_type': data_type,
+                'location_path': location_path,
+                'sensitivity_level': finding.get('risk_level') or finding.get('severity') or 'medium',
+            }
+            postings.append((identifier_type, finding.get('value'), location, 1))
+        if not postings:
+            return 0
+        return self.add_postings(organization_id, postings, scan_id=result.get('scan_id'))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _subject_keys(self, organization_id: str, identifiers: Dict[str, Any]) -> List[str]:
+        """Subject keys of identifier_type -> value (or list of values)"""
+        keys = []
+        for identifier_type, values in identifiers.items():
+            for value in values if isinstance(values, (list, tuple, set)) else [values]:
+                subject_key = self.subject_key(organization_id, identifier_type, value)
+                if subject_key is not None:
+                    keys.append(subject_key)
+        return keys
+
+    def lookup(self, organization_id: str, identifiers: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Locations holding data of a subject.
+
+        Args:
+            organization_id: Tenant to search
+            identifiers: identifier_type -> value (or list of values)
+
+        Returns:
+            One dict per location (system_name, data_type, location_path,
+            sensitivity_level, record_count, identifier_types, last_seen),
+            ordered by location path
+        """
+        keys = self._subject_keys(organization_id, identifiers)
+        if not keys:
+            return []
+
+        placeholders = ','.join('?' * len(keys))
+        locations: Dict[int, Dict[str, Any]] = {}
+        for (location_id, system_name, data_type, location_path, sensitivity, last_seen,
+             identifier_type, record_count) in self._conn().execute(f"""
+            SELECT l.id, l.system_name, l.data_type, l.location_path, l.sensitivity_level, l.last_seen,
+                   p.identifier_type, p.record_count
+            FROM subject_postings p JOIN subject_locations l ON l.id = p.location_id
+            WHERE p.subject_key IN ({placeholders})
+        """, keys):
+            entry = locations.setdefault(location_id, {
+                'location_id': f"IDX-{location_id:016x}",
+                'system_name': system_name,
+                'data_type': data_type,
+                'location_path': location_path,
+                'sensitivity_level': sensitivity,
+                'record_count': 0,
+                'identifier_types': [],
+                'last_seen': last_seen,
+            })
+            # Identifiers of one subject usually share records, so the largest count is kept
+            entry['record_count'] = max(entry['record_count'], record_count)
+            if identifier_type not in entry['identifier_types']:
+                entry['identifier_types'].append(identifier_type)
+                entry['identifier_types'].sort()
+        return sorted(locations.values(), key=lambda entry: entry['location_path'])
+
+    def forget_subject(self, organization_id: str, identifiers: Dict[str, Any]) -> int:
+        """
+        Remove a subject's postings (after erasure).
+
+        Args:
+            organization_id: Tenant the subject belongs to
+            identifiers: identifier_type -> value (or list of values), as for lookup
+
+        Returns:
+            Number of postings removed
+        """
+        keys = [(key,) for key in self._subject_keys(organization_id, identifiers)]
+        conn = self._conn()
+        before = conn.total_changes
+        conn.executemany("DELETE FROM subject_postings WHERE subject_key = ?", keys)
+        return conn.total_changes - before
+
+    def count_locations(self, organization_id: Optional[str] = None) -> int:
+        """Number of indexed locations (of one tenant, or all)"""
+        if organization_id is None:
+            return self._conn().execute("SELECT COUNT(*) FROM subject_locations").fetchone()[0]
+        return self._conn().execute("SELECT COUNT(*) FROM subject_locations WHERE organization_id = ?",
+                                    (organization_id,)).fetchone()[0]
+
+
+_subject_index: Optional[SubjectIndex] = None
+_subject_index_lock = threading.Lock()
+
+
+def get_subject_index() -> SubjectIndex:
+    """Process-wide subject index"""
+    global _subject_index
+    if _subject_index is None:
+        with _subject_index_lock:
+            if _subject_index is None:
+                _subject_index = SubjectIndex()
+    return _subject_index
@@ -0,0 +1,450 @@
+"""
+Tracker Index - Compiled Tracker and Cookie Classification
+
+WebsiteScanner used to walk known_trackers for every script on every page,
+testing each tracker's domains and inline patterns as substrings in turn,
+and _categorize_cookie rebuilt its name patterns on every call. Both are
+compiled here once per tracker database:
+
+- DomainTrie holds tracker domains by reversed label (com -> hotjar ->
+  static), so a URL is classified by walking its host's labels, and the
+  result is cached per host. A domain matches its subdomains but not
+  lookalikes: 'hotjar.com' matches static.hotjar.com, not nothotjar.com or
+  a query string that mentions hotjar.com.
+- SignatureAutomaton finds which inline-script signatures occur in a
+  script. Large signature sets are compiled into one trie regex scanned
+  inside the re engine, reporting every signature at every position as an
+  Aho-Corasick automaton would.
+- CookieRules classifies cookie names through exact, prefix ('_ga_*'),
+  glob and name-contains tiers, with results cached per name.
+
+Matches are resolved back to trackers in database order, each tracker
+reporting the first of its domains or patterns found, as the loops did.
+
+Large external tracker lists are merged in at startup: Disconnect-style
+JSON (services.json, grouped by category) or flat JSON in the
+known_trackers shape, listed in DG_TRACKER_LISTS (separated by
+os.pathsep). get_tracker_index() compiles each database once per process.
+"""
+
+import fnmatch
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from utils.rule_engine import trie_pattern
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("tracker_index")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+TRACKER_LIST_PATHS = [path for path in os.environ.get('DG_TRACKER_LISTS', '').split(os.pathsep) if path]
+
+# Up to this many signatures, a substring test per signature beats the regex scan
+SMALL_SIGNATURE_SET = 64
+
+# Hosts and cookie names whose classification is remembered
+HOST_CACHE_SIZE = 65536
+COOKIE_CACHE_SIZE = 65536
+
+# Disconnect categories -> what a tracker in them does
+DISCONNECT_CATEGORIES = {
+    'Advertising': ('Advertising and cross-site tracking', 'High', 'Consent required'),
+    'Analytics': ('Website analytics and user behavior tracking', 'Medium', 'Consent required'),
+    'Social': ('Social media tracking and widgets', 'High', 'Consent required'),
+    'Fingerprinting': ('Browser fingerprinting', 'High', 'Consent required'),
+    'FingerprintingInvasive': ('Browser fingerprinting', 'High', 'Consent required'),
+    'FingerprintingGeneral': ('Browser fingerprinting', 'High', 'Consent required'),
+    'Cryptomining': ('Cryptocurrency mining in the visitor\'s browser', 'High', 'Consent required'),
+    'Content': ('Embedded third-party content', 'Low', 'Legitimate interest or consent required'),
+}
+DEFAULT_CATEGORY = ('Third-party tracking', 'Medium', 'Consent or legitimate interest required')
+
+# (tracker name, tracker info, matched domain or pattern)
+TrackerMatch = Tuple[str, Dict[str, Any], str]
+
+
+class SignatureAutomaton:
+    """Finds which of a set of signatures occur in a text (case-sensitive)"""
+
+    __slots__ = ('signatures', '_regex', '_prefixes')
+
+    def __init__(self, signatures: Iterable[str]):
+        self.signatures = frozenset(signature for signature in signatures if signature)
+        self._regex = None
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        if len(self.signatures) > SMALL_SIGNATURE_SET:
+            trie: Dict[str, Any] = {}
+            for signature in self.signatures:
+                node = trie
+                for char in signature:
+                    node = node.setdefault(char, {})
+                node[''] = {}
+            # At every position, the longest signature starting there
+            self._regex = re.compile(f"(?=({trie_pattern(trie)}))")
+            # Shorter signatures starting at the same position are its prefixes
+            self._prefixes = {
+                signature: tuple(prefix for prefix in (signature[:i] for i in range(1, len(signature) + 1))
+                                 if prefix in self.signatures)
+                for signature in self.signatures
+            }
+
+    def find(self, text: str) -> Set[str]:
+        """Signatures occurring in text"""
+        if self._regex is None:
+            return {signature for signature in self.signatures if signature in text}
+        found: Set[str] = set()
+        for longest in set(self._regex.findall(text)):
+            found.update(self._prefixes[longest])
+        return found
+
+
+class DomainTrie:
+    """Domains stored by reversed label; a host matches every domain it is or is under"""
+
+    __slots__ = ('_root',)
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add(self, domain: str, value: Any):
+        node = self._root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        node.setdefault('', []).append(value)
+
+    def match(self, host: str) -> List[Any]:
+        """Values of the domains host is or is a subdomain of, shortest domain first"""
+        values: List[Any] = []
+        node = self._root
+        for label in reversed(host.lower().rstrip('.').split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            values.extend(node.get('', ()))
+        return values
+
+
+def _split_domain(entry: str) -> Tuple[str, str]:
+    """(host, path prefix) of a tracker domain entry such as 'facebook.com/tr'"""
+    entry = entry.strip().lower()
+    if '://' in entry:
+        entry = entry.split('://', 1)[1]
+    host, _, path = entry.partition('/')
+    if host.startswith('*.'):
+        host = host[2:]
+    return host.split(':')[0], f'/{path}' if path else ''
+
+
+class TrackerIndex:
+    """Known trackers compiled for classifying resource URLs and inline scripts"""
+
+    def __init__(self, known_trackers: Dict[str, Dict[str, Any]]):
+        """
+        Compile a tracker database.
+
+        Args:
+            known_trackers: Tracker name -> info with 'domains' and 'patterns' lists
+        """
+        self.known_trackers = known_trackers
+        self._trackers = [(name, info) for name, info in known_trackers.items()]
+        # needle -> [(tracker position, needle position within the tracker)]
+        self._domain_owners: Dict[str, List[Tuple[int, int]]] = {}
+        self._pattern_owners: Dict[str, List[Tuple[int, int]]] = {}
+        for position, (_, info) in enumerate(self._trackers):
+            for rank, domain in enumerate(info.get('domains') or ()):
+                self._domain_owners.setdefault(domain, []).append((position, rank))
+            for rank, pattern in enumerate(info.get('patterns') or ()):
+                self._pattern_owners.setdefault(pattern, []).append((position, rank))
+
+        self._domains = DomainTrie()
+        for domain in self._domain_owners:
+            host, path = _split_domain(domain)
+            if host:
+                self._domains.add(host, (domain, path))
+        self._signatures = SignatureAutomaton(self._pattern_owners)
+        self._hosts: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        # Matches of hosts whose tracker domains have no path prefix
+        self._host_matches: Dict[str, List[TrackerMatch]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._trackers)
+
+    def _resolve(self, present: Iterable[str], owners: Dict[str, List[Tuple[int, int]]]) -> List[TrackerMatch]:
+        # Each tracker reports the first of its needles present, in database order
+        best: Dict[int, Tuple[int, str]] = {}
+        for needle in present:
+            for position, rank in owners[needle]:
+                if position not in best or rank < best[position][0]:
+                    best[position] = (rank, needle)
+        return [(self._trackers[position][0], self._trackers[position][1], best[position][1])
+                for position in sorted(best)]
+
+    def match_host(self, host: str) -> Tuple[Tuple[str, str], ...]:
+        """(domain entry, path prefix) of every tracker domain host falls under"""
+        host = host.lower()
+        entries = self._hosts.get(host)
+        if entries is None:
+            entries = tuple(self._domains.match(host))
+            with self._lock:
+                if len(self._hosts) >= HOST_CACHE_SIZE:
+                    self._hosts.clear()
+                    self._host_matches.clear()
+                self._hosts[host] = entries
+        return entries
+
+    def match_src(self, src: str) -> List[TrackerMatch]:
+        """
+        Trackers serving a script, iframe or request URL.
+
+        Args:
+            src: Resource URL; a scheme-less 'cdn.example.com/x.js' is read as
+                '//cdn.example.com/x.js', paths starting with '/' or '.' are
+                first-party and match nothing
+
+        Returns:
+            One (name, info, domain) per matching tracker, in database order
+        """
+        try:
+            src = src.strip()
+            parts = urlsplit(src)
+            if parts.hostname is None and not parts.scheme and not src.startswith(('/', '.')):
+                parts = urlsplit('//' + src)
+            host = parts.hostname
+        except ValueError:
+            return []
+        if not host:
+            return []
+        matches = self._host_matches.get(host)
+        if matches is not None:
+            return list(matches)
+        entries = self.match_host(host)
+        if not entries:
+            return []
+        if not any(path for _, path in entries):
+            matches = self._host_matches[host] = self._resolve([domain for domain, _ in entries], self._domain_owners)
+            return list(matches)
+        present = [domain for domain, path in entries if not path or parts.path.lower().startswith(path)]
+        return self._resolve(present, self._domain_owners)
+
+    def classify_urls(self, urls: Iterable[str]) -> Dict[str, List[TrackerMatch]]:
+        """
+        Trackers serving each of many resource URLs.
+
+        Args:
+            urls: Resource URLs
+
+        Returns:
+            URL -> matches, for the URLs served by a tracker
+        """
+        classified = {}
+        for url in urls:
+            matches = self.match_src(url)
+            if matches:
+                classified[url] = matches
+        return classified
+
+    def match_inline(self, content: str) -> List[TrackerMatch]:
+        """
+        Trackers whose patterns appear in inline script content.
+
+        Args:
+            content: Script text
+
+        Returns:
+            One (name, info, pattern) per matching tracker, in database order
+        """
+        return self._resolve(self._signatures.find(content), self._pattern_owners)
+
+
+class CookieRules:
+    """A cookie database and name patterns compiled into exact, prefix, glob and contains tiers"""
+
+    def __init__(self, cookie_database: Dict[str, Dict[str, Any]],
+                 contains: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Compile cookie classification rules.
+
+        Args:
+            cookie_database: Cookie name -> info; names ending in '*' are
+                prefixes and names with other wildcards are globs
+            contains: Lower-case name fragment -> info, tried in order after
+                the database
+        """
+        self.cookie_database = cookie_database
+        self._prefixes: Dict[str, Dict[str, Any]] = {}
+        self._globs: List[Tuple[Any, Dict[str, Any]]] = []
+        for name, info in cookie_database.items():
+            stem = name[:-1]
+            if name.endswith('*') and not any(char in stem for char in '*?['):
+                self._prefixes.setdefault(stem, info)
+            elif any(char in name for char in '*?['):
+                self._globs.append((re.compile(fnmatch.translate(name)), info))
+        # Longest prefix wins
+        self._prefix_lengths = sorted({len(stem) for stem in self._prefixes}, reverse=True)
+        self._contains = list((contains or {}).items())
+        self._contains_rank = {fragment: rank for rank, (fragment, _) in enumerate(self._contains)}
+        self._fragments = SignatureAutomaton(self._contains_rank)
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def _lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        info = self.cookie_database.get(name)
+        if info is not None:
+            return info
+        for length in self._prefix_lengths:
+            info = self._prefixes.get(name[:length])
+            if info is not None and len(name) >= length:
+                return info
+        for regex, info in self._globs:
+            if regex.match(name):
+                return info
+        fragments = self._fragments.find(name.lower())
+        if fragments:
+            return self._contains[min(self._contains_rank[fragment] for fragment in fragments)][1]
+        return None
+
+    def classify(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Classification of a cookie name.
+
+        Args:
+            name: Cookie name
+
+        Returns:
+            The matching rule's info, or None if no rule matches
+        """
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        info = self._lookup(name)
+        if len(self._cache) >= COOKIE_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[name] = info
+        return info
+
+
+def load_tracker_list(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read an external tracker list.
+
+    Args:
+        path: Disconnect-style JSON ({"categories": {category: [{company:
+            {site: [domains]}}]}}) or flat JSON in the known_trackers shape
+
+    Returns:
+        Tracker name -> info with domains, patterns, purpose, privacy_risk,
+        gdpr_basis and category
+
+    Raises:
+        ValueError: If the file is not a tracker list
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and isinstance(data.get('categories'), dict):
+        trackers: Dict[str, Dict[str, Any]] = {}
+        for category, companies in data['categories'].items():
+            purpose, risk, basis = DISCONNECT_CATEGORIES.get(category, DEFAULT_CATEGORY)
+            for company in companies:
+                for name, sites in company.items():
+                    domains = [domain for value in sites.values() if isinstance(value, list) for domain in value]
+                    tracker = trackers.setdefault(name, {
+                        'domains': [],
+                        'patterns': [],
+                        'purpose': purpose,
+                        'privacy_risk': risk,
+                        'gdpr_basis': basis,
+                        'category': category,
+                    })
+                    tracker['domains'].extend(domain for domain in domains if domain not in tracker['domains'])
+        return trackers
+
+    if isinstance(data, dict) and all(isinstance(info, dict) for info in data.values()):
+        return {name: dict(info, domains=list(info.get('domains') or []), patterns=list(info.get('patterns') or []))
+                for name, info in data.items()}
+
+    raise ValueError(f"{path} is not a Disconnect or flat tracker list")
+
+
+def merge_tracker_lists(known_trackers: Dict[str, Dict[str, Any]],
+                        paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Add external tracker lists to a tracker database.
+
+    Trackers already known keep their info and gain the list's domains and
+    patterns; new trackers follow the known ones. Lists that cannot be read
+    are logged and skipped.
+
+    Args:
+        known_trackers: Tracker database
+        paths: Tracker list files
+
+    Returns:
+        The merged database (known_trackers is not modified)
+    """
+    merged = dict(known_trackers)
+    for path in paths:
+        try:
+            trackers = load_tracker_list(path)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load tracker list {path}: {str(e)}")
+            continue
+        for name, info in trackers.items():
+            known = merged.get(name)
+            if known is None:
+                merged[name] = info
+                continue
+            merged[name] = dict(known,
+                                domains=list(dict.fromkeys([*(known.get('domains') or []), *info['domains']])),
+                                patterns=list(dict.fromkeys([*(known.get('patterns') or []), *info['patterns']])))
+        logger.info(f"Loaded {len(trackers)} trackers from {path}")
+    return merged
+
+
+_indexes: Dict[Tuple[Any, ...], TrackerIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _list_key(paths: Iterable[str]) -> Tuple[Tuple[str, float, int], ...]:
+    key = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            key.append((path, stat.st_mtime, stat.st_size))
+        except OSError:
+            key.append((path, 0.0, -1))
+    return tuple(key)
+
+
+def get_tracker_index(known_trackers: Dict[str, Dict[str, Any]],
+                      list_paths: Optional[Iterable[str]] = None) -> TrackerIndex:
+    """
+    Compiled index of a tracker database merged with the external lists.
+
+    Compiled once per process for each database and set of list files, so
+    every WebsiteScanner shares the same index.
+
+    Args:
+        known_trackers: Tracker database
+        list_paths: External tracker lists (default: TRACKER_LIST_PATHS)
+
+    Returns:
+        TrackerIndex over the merged database
+    """
+    paths = TRACKER_LIST_PATHS if list_paths is None else list(list_paths)
+    key = (json.dumps(known_trackers, sort_keys=True, default=str), _list_key(paths))
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = _indexes[key] = TrackerIndex(merge_tracker_lists(known_trackers, paths))
+    return index
@@ -1000,9 +1000,9 @@ class UnifiedHTMLReportGenerator:
             # Safe import of predictive engine with dependencies
             try:
                 from services.predictive_compliance_engine import PredictiveComplianceEngine
-                from services.results_aggregator import ResultsAggregator
+                from services.results_aggregator import get_results_aggregator
                 engine = PredictiveComplianceEngine(region="Netherlands")
-                aggregator = ResultsAggregator()
+                aggregator = get_results_aggregator()
             except ImportError as e:
                 logger.warning(f"Predictive compliance engine not available: {e}")
                 return self._generate_fallback_forecast_section(current_score)
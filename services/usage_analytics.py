@@ -3,8 +3,10 @@ Usage Analytics and Monitoring System
 Real-time usage tracking and analytics for license management
 """
 
+import atexit
 import json
 import sqlite3
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -65,68 +67,242 @@ class UsageStatistics:
     usage_by_day: Dict[str, int]
     error_rate: float
 
+SCAN_EVENT_TYPES = ('scan_started', 'scan_completed', 'scan_failed')
+
+# Events held in memory before the oldest are dropped
+DEFAULT_BUFFER_SIZE = 100000
+
+# Events per write transaction, and the longest an event waits to be written
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+ROLLUP_SCHEMA_VERSION = 2
+
+_INSERT_EVENT = """
+    INSERT OR IGNORE INTO usage_events
+    (event_id, event_type, timestamp, user_id, session_id, scanner_type,
+     region, feature, details, duration_ms, success, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_HOURLY = """
+    INSERT INTO usage_rollup_hourly
+        (hour, event_type, scanner_type, region, feature, events, successes, failures,
+         duration_sum, duration_count, duration_min, duration_max)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (hour, event_type, scanner_type, region, feature) DO UPDATE SET
+        events = events + excluded.events,
+        successes = successes + excluded.successes,
+        failures = failures + excluded.failures,
+        duration_sum = duration_sum + excluded.duration_sum,
+        duration_count = duration_count + excluded.duration_count,
+        duration_min = CASE WHEN duration_min IS NULL THEN excluded.duration_min
+                            WHEN excluded.duration_min IS NULL THEN duration_min
+                            ELSE MIN(duration_min, excluded.duration_min) END,
+        duration_max = CASE WHEN duration_max IS NULL THEN excluded.duration_max
+                            WHEN excluded.duration_max IS NULL THEN duration_max
+                            ELSE MAX(duration_max, excluded.duration_max) END
+"""
+
+_INSERT_DAILY_USER = """
+    INSERT INTO usage_rollup_daily_users (day, scanner_type, user_id)
+    VALUES (?, ?, ?) ON CONFLICT DO NOTHING
+"""
+
+# Aggregate columns shared by the raw-event and rollup range queries
+_RAW_AGGREGATE = """
+    SELECT substr(timestamp, 1, 13) AS hour, event_type, COALESCE(scanner_type, ''),
+           COALESCE(region, ''), COALESCE(feature, ''), COUNT(*),
+           SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END),
+           COALESCE(SUM(duration_ms), 0), COUNT(duration_ms), MIN(duration_ms), MAX(duration_ms)
+    FROM usage_events
+    WHERE timestamp >= ? AND timestamp {end_op} ? {filters}
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+_ROLLUP_AGGREGATE = """
+    SELECT hour, event_type, scanner_type, region, feature, events, successes, failures,
+           duration_sum, duration_count, duration_min, duration_max
+    FROM usage_rollup_hourly
+    WHERE hour >= ? AND hour < ? {filters}
+"""
+
+
+def _hour_key(when: datetime) -> str:
+    """Rollup bucket of a timestamp, matching substr(isoformat, 1, 13)"""
+    return when.strftime('%Y-%m-%dT%H')
+
+
 class UsageAnalytics:
-    """Usage analytics and monitoring system"""
-    
-    def __init__(self, db_file: str = "usage_analytics.db"):
+    """
+    Usage analytics and monitoring system
+
+    track_event only appends a row to an in-memory ring buffer; a background
+    writer drains it in batched transactions on one WAL-mode connection and
+    maintains hourly rollups in the same transactions. Statistics read the
+    rollups for whole hours and the raw events (through a covering index)
+    only for the partial hours at either end of the range.
+    """
+
+    def __init__(self, db_file: str = "usage_analytics.db", buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
         self.db_file = db_file
         self.lock = threading.Lock()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._wake = threading.Event()
+        self._stopped = False
+        self._local = threading.local()
+        self.dropped_events = 0
+        self.write_errors = 0
         self.init_database()
         self.current_users: Dict[str, datetime] = {}
-    
-    def track_event(self, event_type: UsageEventType, user_id: str, session_id: str, 
+        self._writer = threading.Thread(target=self._writer_loop, name="usage-analytics-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_file, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """Per-thread reader connection (WAL readers do not block the writer)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def track_event(self, event_type: UsageEventType, user_id: str, session_id: str,
                    scanner_type: Optional[str] = None, region: Optional[str] = None,
                    feature: Optional[str] = None, details: Optional[Dict[str, Any]] = None,
                    duration_ms: Optional[int] = None, success: bool = True,
                    error_message: Optional[str] = None) -> bool:
-        """Track a usage event"""
+        """Track a usage event (buffered; written by the background writer)"""
+        return self._enqueue(
+            str(uuid.uuid4()), event_type, datetime.now(), user_id, session_id, scanner_type,
+            region, feature, details, duration_ms, success, error_message
+        )
+
+    def _enqueue(self, event_id: str, event_type: UsageEventType, timestamp: datetime,
+                 user_id: str, session_id: str, scanner_type: Optional[str], region: Optional[str],
+                 feature: Optional[str], details: Optional[Dict[str, Any]], duration_ms: Optional[int],
+                 success: bool, error_message: Optional[str]) -> bool:
         try:
-            event = UsageEvent(
-                event_id=str(uuid.uuid4()),
-                event_type=event_type,
-                timestamp=datetime.now(),
-                user_id=user_id,
-                session_id=session_id,
-                scanner_type=scanner_type,
-                region=region,
-                feature=feature,
-                details=details,
-                duration_ms=duration_ms,
-                success=success,
-                error_message=error_message
-            )
-            
-            with self.lock:
-                conn = sqlite3.connect(self.db_file)
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    INSERT INTO usage_events 
-                    (event_id, event_type, timestamp, user_id, session_id, scanner_type, 
-                     region, feature, details, duration_ms, success, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event.event_id, event.event_type.value, event.timestamp.isoformat(),
-                    event.user_id, event.session_id, event.scanner_type, event.region,
-                    event.feature, json.dumps(event.details) if event.details else None,
-                    event.duration_ms, event.success, event.error_message
-                ))
-                
-                conn.commit()
-                conn.close()
-                
-                logger.info(f"Usage event tracked: {event_type.value} for user {user_id}")
-                return True
-                
+            buffer = self._buffer
+            if len(buffer) == buffer.maxlen:
+                self.dropped_events += 1
+            buffer.append((
+                event_id, event_type.value, timestamp.isoformat(), user_id, session_id,
+                scanner_type, region, feature, json.dumps(details) if details else None,
+                duration_ms, success, error_message
+            ))
+            if len(buffer) >= self.batch_size:
+                self._wake.set()
+            return True
         except Exception as e:
             logger.error(f"Failed to track usage event: {e}")
             return False
-        
+
+    def _writer_loop(self):
+        conn = self._connect()
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain(conn)
+            if self._stopped:
+                self._drain(conn)
+                conn.close()
+                return
+
+    def _drain(self, conn: sqlite3.Connection):
+        buffer = self._buffer
+        while buffer:
+            rows = []
+            markers = []
+            try:
+                while len(rows) < self.batch_size:
+                    item = buffer.popleft()
+                    if isinstance(item, threading.Event):
+                        markers.append(item)
+                    else:
+                        rows.append(item)
+            except IndexError:
+                pass
+            if rows:
+                try:
+                    self._write_batch(conn, rows)
+                except Exception as e:
+                    self.write_errors += 1
+                    logger.error(f"Failed to write {len(rows)} usage events: {e}")
+            for marker in markers:
+                marker.set()
+
+    def _write_batch(self, conn: sqlite3.Connection, rows: List[tuple]):
+        """Insert events and fold them into the rollups in one transaction"""
+        with conn:
+            cursor = conn.cursor()
+            # Replayed events (event_id already stored) are ignored and not rolled up again
+            inserted = []
+            for row in rows:
+                cursor.execute(_INSERT_EVENT, row)
+                if cursor.rowcount:
+                    inserted.append(row)
+            hourly, daily_users = self._aggregate(inserted)
+            cursor.executemany(_UPSERT_HOURLY, [key + tuple(agg) for key, agg in hourly.items()])
+            cursor.executemany(_INSERT_DAILY_USER, list(daily_users))
+
+    @staticmethod
+    def _aggregate(rows: List[tuple]) -> Tuple[Dict[tuple, list], set]:
+        """Hourly rollup deltas and (day, scanner_type, user_id) keys of event rows"""
+        hourly: Dict[tuple, list] = {}
+        daily_users = set()
+        for row in rows:
+            timestamp, event_type, user_id = row[2], row[1], row[3]
+            scanner_type, region, feature = row[5] or '', row[6] or '', row[7] or ''
+            duration, success = row[9], row[10]
+            key = (timestamp[:13], event_type, scanner_type, region, feature)
+            agg = hourly.get(key)
+            if agg is None:
+                agg = hourly[key] = [0, 0, 0, 0, 0, None, None]
+            agg[0] += 1
+            if success:
+                agg[1] += 1
+            else:
+                agg[2] += 1
+            if duration is not None:
+                agg[3] += duration
+                agg[4] += 1
+                agg[5] = duration if agg[5] is None else min(agg[5], duration)
+                agg[6] = duration if agg[6] is None else max(agg[6], duration)
+            daily_users.add((timestamp[:10], scanner_type, user_id))
+        return hourly, daily_users
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until events tracked so far are written"""
+        if self._stopped or not self._writer.is_alive():
+            return not self._buffer
+        marker = threading.Event()
+        self._buffer.append(marker)
+        self._wake.set()
+        return marker.wait(timeout)
+
+    def close(self):
+        """Write buffered events and stop the writer"""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        self._writer.join(10)
+
     def init_database(self):
         """Initialize SQLite database for usage tracking"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
-        
+
         # Create usage events table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS usage_events (
@@ -144,7 +320,7 @@ class UsageAnalytics:
                 error_message TEXT
             )
         """)
-        
+
         # Create usage summary table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS usage_summary (
@@ -160,148 +336,168 @@ class UsageAnalytics:
                 regions_used TEXT
             )
         """)
-        
-        # Create indexes for performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON usage_events(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_id ON usage_events(user_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_event_type ON usage_events(event_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_scanner_type ON usage_events(scanner_type)")
-        
+
+        # Hourly rollups ('' stands for a missing scanner/region/feature)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS usage_rollup_hourly (
+                hour TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                scanner_type TEXT NOT NULL,
+                region TEXT NOT NULL,
+                feature TEXT NOT NULL,
+                events INTEGER NOT NULL,
+                successes INTEGER NOT NULL,
+                failures INTEGER NOT NULL,
+                duration_sum INTEGER NOT NULL,
+                duration_count INTEGER NOT NULL,
+                duration_min INTEGER,
+                duration_max INTEGER,
+                PRIMARY KEY (hour, event_type, scanner_type, region, feature)
+            ) WITHOUT ROWID
+        """)
+
+        # Distinct users per day and scanner, for unique-user counts
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS usage_rollup_daily_users (
+                day TEXT NOT NULL,
+                scanner_type TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                PRIMARY KEY (scanner_type, day, user_id)
+            ) WITHOUT ROWID
+        """)
+
+        # Covering indexes for the partial-hour range scans and per-user queries;
+        # they replace the single-column indexes, which every insert had to maintain
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_usage_events_ts_type_scanner
+            ON usage_events(timestamp, event_type, scanner_type, success, duration_ms)
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_usage_events_user_ts ON usage_events(user_id, timestamp)")
+        for index in ('idx_timestamp', 'idx_user_id', 'idx_event_type', 'idx_scanner_type'):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
         conn.commit()
+
+        self._backfill_rollups(conn)
         conn.close()
-    
+
+    def _backfill_rollups(self, conn: sqlite3.Connection):
+        """Build the rollups from events recorded before they existed (once per database)"""
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= ROLLUP_SCHEMA_VERSION:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < ROLLUP_SCHEMA_VERSION:
+                conn.execute("DELETE FROM usage_rollup_hourly")
+                conn.execute("DELETE FROM usage_rollup_daily_users")
+                conn.execute(f"""
+                    INSERT INTO usage_rollup_hourly
+                    {_RAW_AGGREGATE.format(end_op='<=', filters='')}
+                """, ('', '\uffff'))
+                conn.execute("""
+                    INSERT INTO usage_rollup_daily_users (day, scanner_type, user_id)
+                    SELECT DISTINCT substr(timestamp, 1, 10), COALESCE(scanner_type, ''), user_id
+                    FROM usage_events
+                """)
+                conn.execute(f"PRAGMA user_version = {ROLLUP_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
     def track_event_object(self, event: UsageEvent):
         """Track a usage event object (legacy method)"""
-        return self.track_event(
-            event_type=event.event_type,
-            user_id=event.user_id,
-            session_id=event.session_id,
-            scanner_type=event.scanner_type,
-            region=event.region,
-            feature=event.feature,
-            details=event.details,
-            duration_ms=event.duration_ms,
-            success=event.success,
-            error_message=event.error_message
+        return self._enqueue(
+            event.event_id, event.event_type, event.timestamp, event.user_id, event.session_id,
+            event.scanner_type, event.region, event.feature, event.details, event.duration_ms,
+            event.success, event.error_message
         )
-    
-    def get_usage_statistics(self, 
+
+    def _range_rows(self, start_date: datetime, end_date: datetime,
+                    user_id: Optional[str] = None, scanner_type: Optional[str] = None) -> List[tuple]:
+        """
+        Aggregated rows (hour, event_type, scanner_type, region, feature, events,
+        successes, failures, duration_sum, duration_count, duration_min, duration_max)
+        for events with start_date <= timestamp <= end_date.
+        """
+        self.flush()
+        conn = self._read_conn()
+        start, end = start_date.isoformat(), end_date.isoformat()
+        raw_filters, rollup_filters, extra = '', '', []
+        if scanner_type is not None:
+            raw_filters += " AND scanner_type = ?"
+            rollup_filters += " AND scanner_type = ?"
+            extra.append(scanner_type)
+
+        if user_id is not None:
+            # Rollups are not per user; a user's events are one index range
+            sql = _RAW_AGGREGATE.format(end_op='<=', filters=raw_filters + " AND user_id = ?")
+            return conn.execute(sql, [start, end] + extra + [user_id]).fetchall()
+
+        # Whole hours come from the rollup, the partial hours at each end from raw events
+        first_hour = start_date.replace(minute=0, second=0, microsecond=0)
+        if first_hour < start_date:
+            first_hour += timedelta(hours=1)
+        last_hour = end_date.replace(minute=0, second=0, microsecond=0)
+        if first_hour >= last_hour:
+            sql = _RAW_AGGREGATE.format(end_op='<=', filters=raw_filters)
+            return conn.execute(sql, [start, end] + extra).fetchall()
+
+        rows = conn.execute(_RAW_AGGREGATE.format(end_op='<', filters=raw_filters),
+                            [start, first_hour.isoformat()] + extra).fetchall()
+        rows += conn.execute(_ROLLUP_AGGREGATE.format(filters=rollup_filters),
+                             [_hour_key(first_hour), _hour_key(last_hour)] + extra).fetchall()
+        rows += conn.execute(_RAW_AGGREGATE.format(end_op='<=', filters=raw_filters),
+                             [last_hour.isoformat(), end] + extra).fetchall()
+        return rows
+
+    def get_usage_statistics(self,
                            start_date: Optional[datetime] = None,
                            end_date: Optional[datetime] = None,
                            user_id: Optional[str] = None) -> UsageStatistics:
         """Get usage statistics for a period"""
-        
+
         if not start_date:
             start_date = datetime.now() - timedelta(days=30)
         if not end_date:
             end_date = datetime.now()
-        
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        # Base query with optional filters
-        where_clause = "WHERE timestamp BETWEEN ? AND ?"
-        params = [start_date.isoformat(), end_date.isoformat()]
-        
-        if user_id:
-            where_clause += " AND user_id = ?"
-            params.append(user_id)
-        
-        # Get scan statistics
-        cursor.execute(f"""
-            SELECT 
-                COUNT(*) as total_scans,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_scans,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_scans,
-                AVG(duration_ms) as avg_duration
-            FROM usage_events 
-            {where_clause}
-            AND event_type IN ('scan_started', 'scan_completed', 'scan_failed')
-        """, params)
-        
-        scan_stats = cursor.fetchone()
-        total_scans = scan_stats[0] or 0
-        successful_scans = scan_stats[1] or 0
-        failed_scans = scan_stats[2] or 0
-        avg_duration = scan_stats[3] or 0
-        
-        # Get report statistics
-        cursor.execute(f"""
-            SELECT 
-                SUM(CASE WHEN event_type = 'report_generated' THEN 1 ELSE 0 END) as reports_generated,
-                SUM(CASE WHEN event_type = 'report_downloaded' THEN 1 ELSE 0 END) as reports_downloaded
-            FROM usage_events 
-            {where_clause}
-        """, params)
-        
-        report_stats = cursor.fetchone()
-        reports_generated = report_stats[0] or 0
-        reports_downloaded = report_stats[1] or 0
-        
-        # Get unique features used
-        cursor.execute(f"""
-            SELECT DISTINCT feature 
-            FROM usage_events 
-            {where_clause}
-            AND feature IS NOT NULL
-        """, params)
-        
-        features_used = [row[0] for row in cursor.fetchall()]
-        
-        # Get unique scanners used
-        cursor.execute(f"""
-            SELECT DISTINCT scanner_type 
-            FROM usage_events 
-            {where_clause}
-            AND scanner_type IS NOT NULL
-        """, params)
-        
-        scanners_used = [row[0] for row in cursor.fetchall()]
-        
-        # Get unique regions used
-        cursor.execute(f"""
-            SELECT DISTINCT region 
-            FROM usage_events 
-            {where_clause}
-            AND region IS NOT NULL
-        """, params)
-        
-        regions_used = [row[0] for row in cursor.fetchall()]
-        
-        # Get usage by hour
-        cursor.execute(f"""
-            SELECT 
-                CAST(strftime('%H', timestamp) AS INTEGER) as hour,
-                COUNT(*) as count
-            FROM usage_events 
-            {where_clause}
-            GROUP BY hour
-            ORDER BY hour
-        """, params)
-        
-        usage_by_hour = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Get usage by day
-        cursor.execute(f"""
-            SELECT 
-                DATE(timestamp) as date,
-                COUNT(*) as count
-            FROM usage_events 
-            {where_clause}
-            GROUP BY date
-            ORDER BY date
-        """, params)
-        
-        usage_by_day = {row[0]: row[1] for row in cursor.fetchall()}
-        
+
+        total_scans = successful_scans = failed_scans = 0
+        duration_sum = duration_count = 0
+        reports_generated = reports_downloaded = 0
+        features_used, scanners_used, regions_used = set(), set(), set()
+        usage_by_hour: Dict[int, int] = {}
+        usage_by_day: Dict[str, int] = {}
+
+        for (hour, event_type, scanner, region, feature, events, successes, failures,
+             d_sum, d_count, _, _) in self._range_rows(start_date, end_date, user_id):
+            if event_type in SCAN_EVENT_TYPES:
+                total_scans += events
+                successful_scans += successes
+                failed_scans += failures
+                duration_sum += d_sum
+                duration_count += d_count
+            elif event_type == 'report_generated':
+                reports_generated += events
+            elif event_type == 'report_downloaded':
+                reports_downloaded += events
+            if feature:
+                features_used.add(feature)
+            if scanner:
+                scanners_used.add(scanner)
+            if region:
+                regions_used.add(region)
+            hour_of_day = int(hour[11:13])
+            usage_by_hour[hour_of_day] = usage_by_hour.get(hour_of_day, 0) + events
+            usage_by_day[hour[:10]] = usage_by_day.get(hour[:10], 0) + events
+
+        avg_duration = duration_sum / duration_count if duration_count else 0
+
         # Calculate peak concurrent users (approximate)
         peak_concurrent = len(self.current_users)
-        
+
         # Calculate error rate
         error_rate = (failed_scans / max(total_scans, 1)) * 100
-        
-        conn.close()
-        
+
         return UsageStatistics(
             total_scans=total_scans,
             successful_scans=successful_scans,
@@ -310,104 +506,14 @@ class UsageAnalytics:
             peak_concurrent_users=peak_concurrent,
             total_reports_generated=reports_generated,
             total_reports_downloaded=reports_downloaded,
-            features_used=features_used,
-            scanners_used=scanners_used,
-            regions_used=regions_used,
-            usage_by_hour=usage_by_hour,
-            usage_by_day=usage_by_day,
+            features_used=sorted(features_used),
+            scanners_used=sorted(scanners_used),
+            regions_used=sorted(regions_used),
+            usage_by_hour=dict(sorted(usage_by_hour.items())),
+            usage_by_day=dict(sorted(usage_by_day.items())),
             error_rate=error_rate
         )
-    
-    def get_user_activity(self, user_id: str, limit: int = 100) -> List[UsageEvent]:
-        """Get recent activity for a user"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM usage_events 
-            WHERE user_id = ? 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        """, (user_id, limit))
-        
-        events = []
-        for row in cursor.fetchall():
-            events.append(UsageEvent(
-                event_id=row[0],
-                event_type=UsageEventType(row[1]),
-                timestamp=datetime.fromisoformat(row[2]),
-                user_id=row[3],
-                session_id=row[4],
-                scanner_type=row[5],
-                region=row[6],
-                feature=row[7],
-                details=json.loads(row[8]) if row[8] else None,
-                duration_ms=row[9],
-                success=bool(row[10]),
-                error_message=row[11]
-            ))
-        
-        conn.close()
-        return events
-    
-    def get_scanner_usage(self, scanner_type: str, 
-                         start_date: Optional[datetime] = None,
-                         end_date: Optional[datetime] = None) -> Dict[str, Any]:
-        """Get usage statistics for a specific scanner"""
-        
-        if not start_date:
-            start_date = datetime.now() - timedelta(days=30)
-        if not end_date:
-            end_date = datetime.now()
-        
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_uses,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_uses,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_uses,
-                AVG(duration_ms) as avg_duration,
-                MIN(duration_ms) as min_duration,
-                MAX(duration_ms) as max_duration,
-                COUNT(DISTINCT user_id) as unique_users
-            FROM usage_events 
-            WHERE scanner_type = ? 
-            AND timestamp BETWEEN ? AND ?
-        """, (scanner_type, start_date.isoformat(), end_date.isoformat()))
-        
-        stats = cursor.fetchone()
-        
-        # Get usage by day
-        cursor.execute("""
-            SELECT 
-                DATE(timestamp) as date,
-                COUNT(*) as count
-            FROM usage_events 
-            WHERE scanner_type = ? 
-            AND timestamp BETWEEN ? AND ?
-            GROUP BY date
-            ORDER BY date
-        """, (scanner_type, start_date.isoformat(), end_date.isoformat()))
-        
-        usage_by_day = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        conn.close()
-        
-        return {
-            "scanner_type": scanner_type,
-            "total_uses": stats[0] or 0,
-            "successful_uses": stats[1] or 0,
-            "failed_uses": stats[2] or 0,
-            "success_rate": (stats[1] / max(stats[0], 1)) * 100,
-            "average_duration_ms": stats[3] or 0,
-            "min_duration_ms": stats[4] or 0,
-            "max_duration_ms": stats[5] or 0,
-            "unique_users": stats[6] or 0,
-            "usage_by_day": usage_by_day
-        }
-    
+
     def get_license_compliance_report(self, license_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate license compliance report"""
         stats = self.get_usage_statistics()
@@ -455,11 +561,96 @@ class UsageAnalytics:
             "days_remaining": license_info.get("days_remaining")
         }
     
+    def get_user_activity(self, user_id: str, limit: int = 100) -> List[UsageEvent]:
+        """Get recent activity for a user"""
+        self.flush()
+        cursor = self._read_conn().execute("""
+            SELECT * FROM usage_events 
+            WHERE user_id = ? 
+            ORDER BY timestamp DESC 
+            LIMIT ?
+        """, (user_id, limit))
+        
+        events = []
+        for row in cursor.fetchall():
+            events.append(UsageEvent(
+                event_id=row[0],
+                event_type=UsageEventType(row[1]),
+                timestamp=datetime.fromisoformat(row[2]),
+                user_id=row[3],
+                session_id=row[4],
+                scanner_type=row[5],
+                region=row[6],
+                feature=row[7],
+                details=json.loads(row[8]) if row[8] else None,
+                duration_ms=row[9],
+                success=bool(row[10]),
+                error_message=row[11]
+            ))
+        
+        return events
+    
+    def _unique_users(self, scanner_type: str, start_date: datetime, end_date: datetime) -> int:
+        """Distinct users of a scanner: daily rollup for whole days, raw events for the first and last day"""
+        first_day = (start_date + timedelta(days=1)).date().isoformat()
+        last_day = end_date.date().isoformat()
+        cursor = self._read_conn().execute("""
+            SELECT COUNT(*) FROM (
+                SELECT user_id FROM usage_rollup_daily_users
+                WHERE scanner_type = ? AND day >= ? AND day < ?
+                UNION
+                SELECT user_id FROM usage_events
+                WHERE scanner_type = ? AND timestamp >= ? AND timestamp <= ?
+                AND (timestamp < ? OR timestamp >= ?)
+            )
+        """, (scanner_type, first_day, last_day,
+              scanner_type, start_date.isoformat(), end_date.isoformat(), first_day, last_day))
+        return cursor.fetchone()[0]
+
+    def get_scanner_usage(self, scanner_type: str, 
+                         start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """Get usage statistics for a specific scanner"""
+        
+        if not start_date:
+            start_date = datetime.now() - timedelta(days=30)
+        if not end_date:
+            end_date = datetime.now()
+        
+        total = successful = failed = duration_sum = duration_count = 0
+        min_duration = max_duration = None
+        usage_by_day: Dict[str, int] = {}
+        for (hour, _, _, _, _, events, successes, failures, d_sum, d_count, d_min, d_max) in \
+                self._range_rows(start_date, end_date, scanner_type=scanner_type):
+            total += events
+            successful += successes
+            failed += failures
+            duration_sum += d_sum
+            duration_count += d_count
+            if d_min is not None:
+                min_duration = d_min if min_duration is None else min(min_duration, d_min)
+                max_duration = d_max if max_duration is None else max(max_duration, d_max)
+            usage_by_day[hour[:10]] = usage_by_day.get(hour[:10], 0) + events
+        
+        return {
+            "scanner_type": scanner_type,
+            "total_uses": total,
+            "successful_uses": successful,
+            "failed_uses": failed,
+            "success_rate": (successful / max(total, 1)) * 100,
+            "average_duration_ms": duration_sum / duration_count if duration_count else 0,
+            "min_duration_ms": min_duration or 0,
+            "max_duration_ms": max_duration or 0,
+            "unique_users": self._unique_users(scanner_type, start_date, end_date),
+            "usage_by_day": dict(sorted(usage_by_day.items()))
+        }
+    
     def cleanup_old_events(self, days_to_keep: int = 90):
-        """Clean up old usage events"""
+        """Clean up old usage events (the hourly and daily rollups are kept)"""
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         
-        conn = sqlite3.connect(self.db_file)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -485,6 +676,7 @@ class UsageAnalytics:
         if not end_date:
             end_date = datetime.now()
         
+        self.flush()
         conn = sqlite3.connect(self.db_file)
         cursor = conn.cursor()
         
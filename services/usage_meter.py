@@ -0,0 +1,314 @@
+"""
+Usage Meter - Atomic Usage Counters
+
+Counters for scan limits and license usage, kept outside the JSON usage
+and license files so recording usage never rewrites a whole document.
+Each (scope, bucket) pair is a small set of named counters, where the bucket
+is the period the counters belong to (e.g. '2025-03-14' or '2025-03'), so
+period resets happen by moving to a new bucket and old buckets expire.
+
+Backends:
+- Redis: one hash per scope and bucket, updated by a Lua script so a
+  check-and-increment is a single atomic round trip (shared by replicas)
+- SQLite in WAL mode with UPSERTs, for single-node deployments
+
+The JSON usage and license files are updated from the counters periodically
+by their owners (ScanLimitManager, LicenseManager) instead of on every scan.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+try:
+    from utils.centralized_logger import get_scanner_logger
+    logger = get_scanner_logger("usage_meter")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.environ.get("DG_USAGE_DB", os.path.join("data", "usage_counters.db"))
+
+# Field holding the epoch second of the last increment
+LAST_AT_FIELD = 'last_at'
+
+# Bucket format and retention per reset period
+PERIOD_BUCKETS = {
+    'daily': ('%Y-%m-%d', 35 * 86400),
+    'weekly': ('%G-W%V', 120 * 86400),
+    'monthly': ('%Y-%m', 400 * 86400),
+    'yearly': ('%Y', 800 * 86400),
+}
+
+
+def period_bucket(period: str, when: Optional[datetime] = None) -> Tuple[str, int]:
+    """
+    Bucket name and retention (seconds, 0 = keep) for a reset period.
+    Unknown periods map to a single bucket that never resets.
+    """
+    if period not in PERIOD_BUCKETS:
+        return 'all', 0
+    fmt, ttl = PERIOD_BUCKETS[period]
+    return (when or datetime.now()).strftime(fmt), ttl
+
+
+class UsageMeter:
+    """Interface shared by the counter backends."""
+
+    backend = 'none'
+
+    def consume(self, scope: str, bucket: str, fields: Sequence[str], amount: int = 1,
+                limit: Optional[int] = None, ttl: int = 0) -> Tuple[bool, int]:
+        """
+        Atomically add `amount` to every field in `fields`.
+
+        With a limit, nothing is added if fields[0] would exceed it.
+
+        Returns:
+            (allowed, value of fields[0] afterwards)
+        """
+        raise NotImplementedError
+
+    def counts(self, scope: str, bucket: str) -> Dict[str, int]:
+        """All counters of one bucket."""
+        return self.history(scope, [bucket])[bucket]
+
+    def history(self, scope: str, buckets: Sequence[str]) -> Dict[str, Dict[str, int]]:
+        """Counters of several buckets in one round trip."""
+        raise NotImplementedError
+
+    def seed(self, scope: str, bucket: str, values: Dict[str, int], ttl: int = 0) -> None:
+        """Set counters that do not exist yet (migrating counts from the old stores)."""
+        raise NotImplementedError
+
+    def reset(self, scope: str, bucket: str, fields: Optional[Iterable[str]] = None) -> None:
+        """Remove some or all counters of a bucket."""
+        raise NotImplementedError
+
+
+_CONSUME_LUA = """
+local amount = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[5]) or '0')
+if limit >= 0 and current + amount > limit then
+    return {0, current}
+end
+for i = 5, #ARGV do
+    local value = redis.call('HINCRBY', KEYS[1], ARGV[i], amount)
+    if i == 5 then current = value end
+end
+redis.call('HSET', KEYS[1], 'last_at', ARGV[4])
+if tonumber(ARGV[3]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {1, current}
+"""
+
+
+class RedisUsageMeter(UsageMeter):
+    """Counters as Redis hashes `{prefix}:{scope}:{bucket}`."""
+
+    backend = 'redis'
+
+    def __init__(self, client, prefix: str = "usage"):
+        self.client = client
+        self.prefix = prefix
+        self._consume = client.register_script(_CONSUME_LUA)
+
+    def _key(self, scope: str, bucket: str) -> str:
+        return f"{self.prefix}:{scope}:{bucket}"
+
+    def consume(self, scope, bucket, fields, amount=1, limit=None, ttl=0):
+        allowed, current = self._consume(
+            keys=[self._key(scope, bucket)],
+            args=[amount, -1 if limit is None else limit, ttl, int(time.time()), *fields],
+        )
+        return bool(allowed), int(current)
+
+    def history(self, scope, buckets):
+        pipe = self.client.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.hgetall(self._key(scope, bucket))
+        return {
+            bucket: {_text(k): int(v) for k, v in (values or {}).items()}
+            for bucket, values in zip(buckets, pipe.execute())
+        }
+
+    def seed(self, scope, bucket, values, ttl=0):
+        key = self._key(scope, bucket)
+        pipe = self.client.pipeline(transaction=False)
+        for field, value in values.items():
+            pipe.hsetnx(key, field, int(value))
+        if ttl > 0:
+            pipe.expire(key, ttl)
+        pipe.execute()
+
+    def reset(self, scope, bucket, fields=None):
+        key = self._key(scope, bucket)
+        if fields is None:
+            self.client.delete(key)
+        else:
+            fields = list(fields)
+            if fields:
+                self.client.hdel(key, *fields)
+
+
+def _text(value) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+class SQLiteUsageMeter(UsageMeter):
+    """
+    Counters in a SQLite table in WAL mode.
+
+    Each thread uses its own connection; BEGIN IMMEDIATE serialises writers
+    (threads or processes) so a check-and-increment cannot interleave.
+    """
+
+    backend = 'sqlite'
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS usage_counters (
+            scope TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            field TEXT NOT NULL,
+            value INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (scope, bucket, field)
+        ) WITHOUT ROWID
+    """
+
+    _INCREMENT = """
+        INSERT INTO usage_counters (scope, bucket, field, value, expires_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (scope, bucket, field) DO UPDATE SET
+            value = usage_counters.value + excluded.value,
+            expires_at = excluded.expires_at
+        RETURNING value
+    """
+
+    _INCREMENT_WITHIN_LIMIT = """
+        INSERT INTO usage_counters (scope, bucket, field, value, expires_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (scope, bucket, field) DO UPDATE SET
+            value = usage_counters.value + excluded.value,
+            expires_at = excluded.expires_at
+        WHERE usage_counters.value + excluded.value <= ?
+        RETURNING value
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute(self._SCHEMA)
+        conn.execute("DELETE FROM usage_counters WHERE expires_at > 0 AND expires_at < ?",
+                     (int(time.time()),))
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def consume(self, scope, bucket, fields, amount=1, limit=None, ttl=0):
+        now = int(time.time())
+        expires_at = now + ttl if ttl > 0 else 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            first, rest = fields[0], fields[1:]
+            if limit is None:
+                current = conn.execute(self._INCREMENT, (scope, bucket, first, amount, expires_at)).fetchone()[0]
+            else:
+                row = None
+                if amount <= limit:
+                    row = conn.execute(self._INCREMENT_WITHIN_LIMIT,
+                                       (scope, bucket, first, amount, expires_at, limit)).fetchone()
+                if row is None:
+                    existing = conn.execute(
+                        "SELECT value FROM usage_counters WHERE scope = ? AND bucket = ? AND field = ?",
+                        (scope, bucket, first)
+                    ).fetchone()
+                    conn.execute("ROLLBACK")
+                    return False, existing[0] if existing else 0
+                current = row[0]
+            for field in rest:
+                conn.execute(self._INCREMENT, (scope, bucket, field, amount, expires_at)).fetchone()
+            conn.execute(
+                """INSERT INTO usage_counters (scope, bucket, field, value, expires_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (scope, bucket, field) DO UPDATE SET value = excluded.value""",
+                (scope, bucket, LAST_AT_FIELD, now, expires_at)
+            )
+            conn.execute("COMMIT")
+            return True, current
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def history(self, scope, buckets):
+        result: Dict[str, Dict[str, int]] = {bucket: {} for bucket in buckets}
+        if not buckets:
+            return result
+        placeholders = ','.join('?' * len(buckets))
+        rows = self._conn().execute(
+            f"SELECT bucket, field, value FROM usage_counters WHERE scope = ? AND bucket IN ({placeholders})",
+            (scope, *buckets)
+        )
+        for bucket, field, value in rows:
+            result[bucket][field] = value
+        return result
+
+    def seed(self, scope, bucket, values, ttl=0):
+        expires_at = int(time.time()) + ttl if ttl > 0 else 0
+        self._conn().executemany(
+            """INSERT INTO usage_counters (scope, bucket, field, value, expires_at)
+               VALUES (?, ?, ?, ?, ?) ON CONFLICT (scope, bucket, field) DO NOTHING""",
+            [(scope, bucket, field, int(value), expires_at) for field, value in values.items()]
+        )
+
+    def reset(self, scope, bucket, fields=None):
+        conn = self._conn()
+        if fields is None:
+            conn.execute("DELETE FROM usage_counters WHERE scope = ? AND bucket = ?", (scope, bucket))
+        else:
+            conn.executemany("DELETE FROM usage_counters WHERE scope = ? AND bucket = ? AND field = ?",
+                             [(scope, bucket, field) for field in fields])
+
+
+_usage_meter: Optional[UsageMeter] = None
+_usage_meter_lock = threading.Lock()
+
+
+def _create_usage_meter() -> UsageMeter:
+    backend = os.environ.get('DG_USAGE_BACKEND', 'auto').lower()
+    if backend in ('auto', 'redis'):
+        try:
+            from utils.redis_cache import get_cache
+            client = getattr(get_cache(), 'redis_client', None)
+            if client is not None:
+                return RedisUsageMeter(client)
+        except Exception as e:
+            logger.warning(f"Redis usage counters unavailable: {e}")
+        if backend == 'redis':
+            logger.warning("DG_USAGE_BACKEND=redis but Redis is not connected; using SQLite")
+    return SQLiteUsageMeter()
+
+
+def get_usage_meter() -> UsageMeter:
+    """Process-wide usage meter (Redis when connected, else SQLite)."""
+    global _usage_meter
+    if _usage_meter is None:
+        with _usage_meter_lock:
+            if _usage_meter is None:
+                _usage_meter = _create_usage_meter()
+                logger.info(f"Usage counters using {_usage_meter.backend} backend")
+    return _usage_meter
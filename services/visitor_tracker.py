@@ -24,6 +24,8 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 import os
 
+from services.schema_migrations import ensure_schema
+
 logger = logging.getLogger(__name__)
 
 class VisitorEventType(Enum):
@@ -85,59 +87,14 @@ class VisitorTracker:
         self._init_database()
         
     def _init_database(self):
-        """Initialize PostgreSQL tables for visitor tracking"""
+        """Ensure the visitor tracking tables exist (versioned migration 0004)"""
         try:
             db_url = os.getenv('DATABASE_URL')
             if not db_url:
                 logger.warning("DATABASE_URL not set - using in-memory tracking only")
                 return
-                
-            conn = psycopg2.connect(db_url)
-            cursor = conn.cursor()
-            
-            # Create visitor_events table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS visitor_events (
-                    event_id VARCHAR(36) PRIMARY KEY,
-                    session_id VARCHAR(36) NOT NULL,
-                    event_type VARCHAR(50) NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
-                    anonymized_ip VARCHAR(64) NOT NULL,
-                    user_agent TEXT,
-                    page_path VARCHAR(500),
-                    referrer VARCHAR(500),
-                    country VARCHAR(2),
-                    user_id VARCHAR(36),
-                    username VARCHAR(100),
-                    details JSONB,
-                    success BOOLEAN DEFAULT TRUE,
-                    error_message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create indexes for performance
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_visitor_events_timestamp 
-                ON visitor_events(timestamp DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_visitor_events_session 
-                ON visitor_events(session_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_visitor_events_type 
-                ON visitor_events(event_type)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_visitor_events_user 
-                ON visitor_events(user_id)
-            """)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
             
+            ensure_schema(db_url)
             logger.info("✅ Visitor tracking database initialized")
             
         except Exception as e:
@@ -32,9 +32,101 @@ from trafilatura import fetch_url, extract
 import whois
 import dns.resolver
 
+from services.tracker_index import CookieRules, get_tracker_index
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Cookie name fragments (lower case) for cookies not in the cookie database,
+# tried in this order
+COOKIE_NAME_PATTERNS = {
+    # Session cookies
+    'session': {
+        'category': 'Essential',
+        'purpose': 'Session management for website functionality',
+        'persistent': False,
+        'expiry': 'Session',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    },
+    'sess': {
+        'category': 'Essential',
+        'purpose': 'Session identifier for website functionality',
+        'persistent': False,
+        'expiry': 'Session',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    },
+    # Security cookies
+    'csrf': {
+        'category': 'Security',
+        'purpose': 'Cross-site request forgery protection',
+        'persistent': False,
+        'expiry': 'Session',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    },
+    'xsrf': {
+        'category': 'Security',
+        'purpose': 'Cross-site request forgery protection',
+        'persistent': False,
+        'expiry': 'Session',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    },
+    # Analytics patterns
+    'analytics': {
+        'category': 'Analytics',
+        'purpose': 'Website analytics and user behavior tracking',
+        'persistent': True,
+        'expiry': 'Variable',
+        'privacy_risk': 'Medium',
+        'gdpr_basis': 'Consent required'
+    },
+    'utm': {
+        'category': 'Analytics',
+        'purpose': 'Campaign tracking and attribution',
+        'persistent': True,
+        'expiry': 'Variable',
+        'privacy_risk': 'Medium',
+        'gdpr_basis': 'Consent required'
+    },
+    # Marketing cookies
+    'fb': {
+        'category': 'Marketing',
+        'purpose': 'Facebook advertising and tracking',
+        'persistent': True,
+        'expiry': 'Variable',
+        'privacy_risk': 'High',
+        'gdpr_basis': 'Consent required'
+    },
+    'google': {
+        'category': 'Marketing',
+        'purpose': 'Google advertising and tracking',
+        'persistent': True,
+        'expiry': 'Variable',
+        'privacy_risk': 'Medium',
+        'gdpr_basis': 'Consent required'
+    },
+    # Consent cookies
+    'consent': {
+        'category': 'Functional',
+        'purpose': 'Cookie consent preferences storage',
+        'persistent': True,
+        'expiry': '1 year',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    },
+    'cookie': {
+        'category': 'Functional',
+        'purpose': 'Cookie preferences and settings',
+        'persistent': True,
+        'expiry': '1 year',
+        'privacy_risk': 'Low',
+        'gdpr_basis': 'Strictly necessary'
+    }
+}
+
 
 class WebsiteScanner:
     """
@@ -285,6 +377,10 @@ class WebsiteScanner:
         except Exception as e:
             logger.warning(f"Failed to load trackers database: {str(e)}")
         
+        # Merged with the external lists in DG_TRACKER_LISTS and compiled once per process
+        self.tracker_index = get_tracker_index(self.known_trackers)
+        self.known_trackers = self.tracker_index.known_trackers
+        
         # Define comprehensive cookie database with categorization
         self.cookie_database = {
             # Cloudflare cookies
@@ -422,6 +518,7 @@ class WebsiteScanner:
                 'gdpr_basis': 'Consent required'
             }
         }
+        self.cookie_rules = CookieRules(self.cookie_database, COOKIE_NAME_PATTERNS)
     
     def _categorize_cookie(self, cookie_name: str, cookie_value: str = "") -> Dict[str, Any]:
         """
@@ -434,109 +531,10 @@ class WebsiteScanner:
         Returns:
             Dictionary with category, purpose, persistent status, and expiry information
         """
-        cookie_name_lower = cookie_name.lower()
-        
-        # Check exact matches first
-        if cookie_name in self.cookie_database:
-            return self.cookie_database[cookie_name]
-        
-        # Check pattern matches for Google Analytics cookies
-        if cookie_name.startswith('_ga_'):
-            return self.cookie_database['_ga_*']
-        
-        # Pattern-based matching for common cookie types
-        patterns = {
-            # Session cookies
-            'session': {
-                'category': 'Essential',
-                'purpose': 'Session management for website functionality',
-                'persistent': False,
-                'expiry': 'Session',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            },
-            'sess': {
-                'category': 'Essential',
-                'purpose': 'Session identifier for website functionality',
-                'persistent': False,
-                'expiry': 'Session',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            },
-            # Security cookies
-            'csrf': {
-                'category': 'Security',
-                'purpose': 'Cross-site request forgery protection',
-                'persistent': False,
-                'expiry': 'Session',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            },
-            'xsrf': {
-                'category': 'Security',
-                'purpose': 'Cross-site request forgery protection',
-                'persistent': False,
-                'expiry': 'Session',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            },
-            # Analytics patterns
-            'analytics': {
-                'category': 'Analytics',
-                'purpose': 'Website analytics and user behavior tracking',
-                'persistent': True,
-                'expiry': 'Variable',
-                'privacy_risk': 'Medium',
-                'gdpr_basis': 'Consent required'
-            },
-            'utm': {
-                'category': 'Analytics',
-                'purpose': 'Campaign tracking and attribution',
-                'persistent': True,
-                'expiry': 'Variable',
-                'privacy_risk': 'Medium',
-                'gdpr_basis': 'Consent required'
-            },
-            # Marketing cookies
-            'fb': {
-                'category': 'Marketing',
-                'purpose': 'Facebook advertising and tracking',
-                'persistent': True,
-                'expiry': 'Variable',
-                'privacy_risk': 'High',
-                'gdpr_basis': 'Consent required'
-            },
-            'google': {
-                'category': 'Marketing',
-                'purpose': 'Google advertising and tracking',
-                'persistent': True,
-                'expiry': 'Variable',
-                'privacy_risk': 'Medium',
-                'gdpr_basis': 'Consent required'
-            },
-            # Consent cookies
-            'consent': {
-                'category': 'Functional',
-                'purpose': 'Cookie consent preferences storage',
-                'persistent': True,
-                'expiry': '1 year',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            },
-            'cookie': {
-                'category': 'Functional',
-                'purpose': 'Cookie preferences and settings',
-                'persistent': True,
-                'expiry': '1 year',
-                'privacy_risk': 'Low',
-                'gdpr_basis': 'Strictly necessary'
-            }
-        }
-        
-        # Check for pattern matches
-        for pattern, info in patterns.items():
-            if pattern in cookie_name_lower:
-                return info
+        # Exact, prefix ('_ga_*'), glob and name-fragment rules, compiled once
+        info = self.cookie_rules.classify(cookie_name)
+        if info is not None:
+            return info
         
         # Default categorization for unknown cookies
         return {
@@ -809,75 +807,48 @@ class WebsiteScanner:
         trackers = []
         findings = []
         
-        # Check for inline scripts containing tracker patterns
+        # Check scripts against the compiled tracker index
         for script in scripts:
             # Check for src attribute
             src = script.get('src', '')
             if src:
-                # Check external script sources against known trackers
-                for tracker_name, tracker_info in self.known_trackers.items():
-                    for domain_pattern in tracker_info['domains']:
-                        if domain_pattern in src:
-                            trackers.append({
-                                'name': tracker_name,
-                                'url': src,
-                                'type': 'external',
-                                'found_on': url,
-                                'purpose': tracker_info.get('purpose', 'Analytics and tracking'),
-                                'privacy_risk': tracker_info.get('privacy_risk', 'Medium'),
-                                'data_collected': tracker_info.get('data_collected', 'User behavior data'),
-                                'gdpr_basis': tracker_info.get('gdpr_basis', 'Consent or legitimate interest required')
-                            })
-                            # Map privacy_risk to severity level
-                            privacy_risk = tracker_info.get('privacy_risk', 'Medium')
-                            severity_map = {'High': 'Critical', 'Medium': 'High', 'Low': 'Medium'}
-                            severity = severity_map.get(privacy_risk, 'Medium')
-                            
-                            findings.append({
-                                'type': 'tracker',
-                                'subtype': tracker_name,
-                                'url': url,
-                                'location': f"External Script: {src}",
-                                'element': 'script[src]',
-                                'description': f"External tracker script from {tracker_name}",
-                                'severity': severity,
-                                'privacy_risk': privacy_risk,
-                                'gdpr_article': 'Art. 6(1)(a), Art. 7'
-                            })
-                            break
-            
-            # Check inline script content for tracker patterns
+                matches = self.tracker_index.match_src(src)
             elif script.string:
-                script_content = script.string
-                for tracker_name, tracker_info in self.known_trackers.items():
-                    for pattern in tracker_info['patterns']:
-                        if pattern in script_content:
-                            trackers.append({
-                                'name': tracker_name,
-                                'type': 'inline',
-                                'found_on': url,
-                                'purpose': tracker_info.get('purpose', 'Analytics and tracking'),
-                                'privacy_risk': tracker_info.get('privacy_risk', 'Medium'),
-                                'data_collected': tracker_info.get('data_collected', 'User behavior data'),
-                                'gdpr_basis': tracker_info.get('gdpr_basis', 'Consent or legitimate interest required')
-                            })
-                            # Map privacy_risk to severity level
-                            privacy_risk = tracker_info.get('privacy_risk', 'Medium')
-                            severity_map = {'High': 'Critical', 'Medium': 'High', 'Low': 'Medium'}
-                            severity = severity_map.get(privacy_risk, 'Medium')
-                            
-                            findings.append({
-                                'type': 'tracker',
-                                'subtype': tracker_name,
-                                'url': url,
-                                'location': f"Inline Script Pattern: {pattern}",
-                                'element': 'script[inline]',
-                                'description': f"Inline tracker script for {tracker_name}",
-                                'severity': severity,
-                                'privacy_risk': privacy_risk,
-                                'gdpr_article': 'Art. 6(1)(a), Art. 7'
-                            })
-                            break
+                matches = self.tracker_index.match_inline(script.string)
+            else:
+                continue
+
+            for tracker_name, tracker_info, matched in matches:
+                tracker = {
+                    'name': tracker_name,
+                    'type': 'external' if src else 'inline',
+                    'found_on': url,
+                    'purpose': tracker_info.get('purpose', 'Analytics and tracking'),
+                    'privacy_risk': tracker_info.get('privacy_risk', 'Medium'),
+                    'data_collected': tracker_info.get('data_collected', 'User behavior data'),
+                    'gdpr_basis': tracker_info.get('gdpr_basis', 'Consent or legitimate interest required')
+                }
+                if src:
+                    tracker = {'name': tracker_name, 'url': src, **tracker}
+                trackers.append(tracker)
+
+                # Map privacy_risk to severity level
+                privacy_risk = tracker_info.get('privacy_risk', 'Medium')
+                severity_map = {'High': 'Critical', 'Medium': 'High', 'Low': 'Medium'}
+                severity = severity_map.get(privacy_risk, 'Medium')
+
+                findings.append({
+                    'type': 'tracker',
+                    'subtype': tracker_name,
+                    'url': url,
+                    'location': f"External Script: {src}" if src else f"Inline Script Pattern: {matched}",
+                    'element': 'script[src]' if src else 'script[inline]',
+                    'description': (f"External tracker script from {tracker_name}" if src
+                                    else f"Inline tracker script for {tracker_name}"),
+                    'severity': severity,
+                    'privacy_risk': privacy_risk,
+                    'gdpr_article': 'Art. 6(1)(a), Art. 7'
+                })
         
         # Detect consent management platforms
         consent_management = []
@@ -993,12 +964,14 @@ class WebsiteScanner:
             'findings': findings
         }
     
-    def _extract_cookies(self, response) -> Dict[str, Any]:
+    def _extract_cookies(self, response, findings: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Extract cookies from a response.
         
         Args:
             response: The HTTP response object
+            findings: List to append high-risk cookie findings to (default:
+                the scan's _current_findings)
             
         Returns:
             Dictionary of cookies with metadata
@@ -1078,7 +1051,9 @@ class WebsiteScanner:
                 
                 # Add to page findings if we have access to findings list
                 # This will be captured by the calling function
-                if hasattr(self, '_current_findings'):
+                if findings is not None:
+                    findings.append(cookie_finding)
+                elif hasattr(self, '_current_findings'):
                     self._current_findings.append(cookie_finding)
         
         return cookies
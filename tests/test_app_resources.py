@@ -0,0 +1,88 @@
+"""
+App Resources Tests
+Checks session query memoisation (tenant generations, explicit invalidation,
+TTL) and the per-rerun render block timings.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import app_resources
+from utils.app_resources import (
+    invalidate_session_queries, render_block, rerun_timings, session_query, start_rerun_timings
+)
+from utils.redis_cache import ComplianceSeriesCache, RedisCache
+
+
+class CountingQuery:
+    """Returns its call count, so repeated results show memoisation"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, days=30, username=None):
+        self.calls += 1
+        return [username, days, self.calls]
+
+
+class TestSessionQuery(unittest.TestCase):
+    """Per-session memo of read queries"""
+
+    def setUp(self):
+        self.state = {}
+        self.cache = ComplianceSeriesCache(RedisCache())
+        for name, replacement in (('_session_state', lambda: self.state),
+                                  ('get_compliance_cache', lambda: self.cache)):
+            patcher = patch.object(app_resources, name, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.query = CountingQuery()
+
+    def test_repeated_query_is_memoised_per_arguments(self):
+        first = session_query(self.query, days=30, username='alice', tenant='org1')
+        self.assertIs(session_query(self.query, days=30, username='alice', tenant='org1'), first)
+        session_query(self.query, days=7, username='alice', tenant='org1')
+        self.assertEqual(self.query.calls, 2)
+
+    def test_new_tenant_generation_reruns_query(self):
+        session_query(self.query, username='alice', tenant='org1')
+        self.cache.invalidate_tenant('org2')
+        session_query(self.query, username='alice', tenant='org1')
+        self.assertEqual(self.query.calls, 1)
+        self.cache.invalidate_tenant('org1')
+        self.assertEqual(session_query(self.query, username='alice', tenant='org1')[2], 2)
+
+    def test_explicit_invalidation(self):
+        session_query(self.query, username='alice')
+        invalidate_session_queries()
+        session_query(self.query, username='alice')
+        self.assertEqual(self.query.calls, 2)
+
+    def test_expired_entries_are_refreshed(self):
+        with patch.object(app_resources, 'SESSION_QUERY_TTL', 0):
+            session_query(self.query, username='alice')
+            session_query(self.query, username='alice')
+        self.assertEqual(self.query.calls, 2)
+
+    def test_rerun_timings_count_hits_and_nest_blocks(self):
+        start_rerun_timings()
+        with render_block("page"):
+            session_query(self.query, username='alice')
+            with render_block("metrics"):
+                session_query(self.query, username='alice')
+        with render_block("overlay"):
+            pass
+        _, blocks, queries = rerun_timings()
+        self.assertEqual([(depth, name) for depth, name, _ in blocks],
+                         [(0, 'page'), (1, 'metrics'), (0, 'overlay')])
+        self.assertGreaterEqual(blocks[0][2], blocks[1][2])
+        self.assertEqual(queries, {'hits': 1, 'misses': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
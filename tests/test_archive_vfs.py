@@ -0,0 +1,195 @@
+"""
+Archive VFS Tests
+Streaming walk of nested archives with member provenance, Office package
+text, zip-bomb limits, and member scanning through CodeScanner and
+BlobScanner in a worker pool.
+"""
+
+import gzip
+import io
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.archive_vfs import (MEMBER_SEPARATOR, ArchiveLimits, ArchiveWalker, ArchiveLimitError,
+                                  is_archive_path)
+from services.code_scanner import CodeScanner
+
+try:
+    from services.blob_scanner import BlobScanner
+    BLOB_SCANNER_AVAILABLE = True
+except ImportError:
+    BLOB_SCANNER_AVAILABLE = False
+
+DOCUMENT_XML = ('<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+                '<w:p><w:r><w:t>Contract for Jan Jansen</w:t></w:r></w:p>'
+                '<w:p><w:r><w:t>Contact: jan.jansen@example.com</w:t></w:r></w:p>'
+                '</w:body></w:document>')
+
+
+def tar_gz(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for name, data in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def zip_bytes(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class ArchiveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="archive_vfs_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def upload(self):
+        """upload.zip holding a docx, a tar.gz with a nested zip, a .gz and plain files"""
+        docx = zip_bytes([('[Content_Types].xml', '<Types/>'), ('word/document.xml', DOCUMENT_XML),
+                          ('word/media/image1.png', b'\x89PNG')])
+        vendor = tar_gz([('lib/config.py', b'email = "piet@example.nl"\n'),
+                         ('lib/inner.zip', zip_bytes([('deep/settings.py', 'query = "SELECT * FROM t WHERE id=" + uid\n')]))])
+        return self.write('upload.zip', zip_bytes([
+            ('docs/contract.docx', docx),
+            ('vendor.tar.gz', vendor),
+            ('logs/app.log.gz', gzip.compress(b'login by bob@example.com\n')),
+            ('src/app.py', 'print("hello")\n'),
+            ('empty/', ''),
+        ]))
+
+
+class TestArchiveWalker(ArchiveTestCase):
+    """Members as streams with provenance"""
+
+    def test_nested_members_and_provenance(self):
+        path = self.upload()
+        walker = ArchiveWalker()
+        members = {member.path[len(path):]: (member.kind, member.depth, member.read())
+                   for member in walker.walk(path)}
+        sep = MEMBER_SEPARATOR
+        self.assertEqual(sorted(members), sorted([
+            f'{sep}docs/contract.docx',
+            f'{sep}vendor.tar.gz{sep}lib/config.py',
+            f'{sep}vendor.tar.gz{sep}lib/inner.zip{sep}deep/settings.py',
+            f'{sep}logs/app.log.gz{sep}app.log',
+            f'{sep}src/app.py',
+        ]))
+        kind, depth, text = members[f'{sep}docs/contract.docx']
+        self.assertEqual((kind, depth), ('office', 1))
+        self.assertEqual(text.decode('utf-8').split(), 'Contract for Jan Jansen Contact: jan.jansen@example.com'.split())
+        self.assertEqual(members[f'{sep}vendor.tar.gz{sep}lib/inner.zip{sep}deep/settings.py'][1], 3)
+        self.assertEqual(members[f'{sep}logs/app.log.gz{sep}app.log'][2], b'login by bob@example.com\n')
+        self.assertEqual(walker.skipped, [])
+
+    def test_depth_limit_skips_deeper_archives(self):
+        path = self.upload()
+        walker = ArchiveWalker(ArchiveLimits(max_depth=2))
+        paths = [member.path for member in walker.walk(path)]
+        self.assertFalse(any('deep/settings.py' in p for p in paths))
+        self.assertTrue(any(p.endswith('lib/config.py') for p in paths))
+        self.assertEqual([s['path'][len(path):] for s in walker.skipped],
+                         [f'{MEMBER_SEPARATOR}vendor.tar.gz{MEMBER_SEPARATOR}lib/inner.zip'])
+
+    def test_plain_tar_and_single_gzip(self):
+        tar_path = self.write('bundle.tar', b'')
+        with tarfile.open(tar_path, 'w') as archive:
+            data = b'iban NL91ABNA0417164300\n'
+            info = tarfile.TarInfo('pay.txt')
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+        self.assertEqual([m.read() for m in ArchiveWalker().walk(tar_path)], [b'iban NL91ABNA0417164300\n'])
+        gz_path = self.write('dump.sql.gz', gzip.compress(b'INSERT INTO users VALUES (1);\n'))
+        self.assertEqual([m.path for m in ArchiveWalker().walk(gz_path)], [gz_path + MEMBER_SEPARATOR + 'dump.sql'])
+        self.assertTrue(is_archive_path('x.TGZ'))
+        self.assertFalse(is_archive_path('report.docx'))
+
+
+class TestZipBombLimits(ArchiveTestCase):
+    """Limits on entries, size and expansion ratio"""
+
+    def test_declared_ratio(self):
+        path = self.write('bomb.zip', zip_bytes([('zeros.txt', b'\0' * (20 * 1024 * 1024))]))
+        with self.assertRaises(ArchiveLimitError):
+            for member in ArchiveWalker().walk(path):
+                member.read()
+
+    def test_streamed_ratio_without_declared_sizes(self):
+        path = self.write('bomb.txt.gz', gzip.compress(b'\0' * (20 * 1024 * 1024)))
+        with self.assertRaises(ArchiveLimitError):
+            for member in ArchiveWalker(ArchiveLimits(max_member_bytes=64 * 1024 * 1024)).walk(path):
+                member.read()
+
+    def test_nested_ratio_counts_decompressed_bytes(self):
+        inner = gzip.compress(b'A' * (8 * 1024 * 1024))
+        path = self.write('nested.zip', zip_bytes([(f'part{i}.gz', inner) for i in range(4)]))
+        with self.assertRaises(ArchiveLimitError):
+            for member in ArchiveWalker().walk(path):
+                member.read()
+
+    def test_entry_count_and_total_size(self):
+        path = self.write('many.zip', zip_bytes([(f'f{i}.txt', 'x') for i in range(50)]))
+        with self.assertRaises(ArchiveLimitError):
+            list(ArchiveWalker(ArchiveLimits(max_entries=20)).walk(path))
+        path = self.write('big.zip', zip_bytes([(f'f{i}.txt', os.urandom(4096)) for i in range(10)]))
+        with self.assertRaises(ArchiveLimitError):
+            for member in ArchiveWalker(ArchiveLimits(max_total_bytes=16 * 1024)).walk(path):
+                member.read()
+
+
+class TestArchiveScanning(ArchiveTestCase):
+    """Members fed to the scanners"""
+
+    def test_code_scanner_members_in_pool(self):
+        path = self.upload()
+        scanner = CodeScanner()
+        pooled = scanner.scan_archive(path, max_workers=2)
+        inline = scanner.scan_archive(path, max_workers=1)
+        self.assertEqual(pooled['status'], 'completed')
+        self.assertEqual(pooled['pii_found'], inline['pii_found'])
+        members = {f['archive_member'][len(path):] for f in pooled['pii_found']}
+        self.assertIn(f'{MEMBER_SEPARATOR}vendor.tar.gz{MEMBER_SEPARATOR}lib/inner.zip{MEMBER_SEPARATOR}'
+                      'deep/settings.py', members)
+        # Only members with code extensions are read
+        self.assertFalse(any(m['file_path'].endswith('.docx') for m in pooled['members']))
+        self.assertEqual(scanner.scan_file(path)['pii_count'], pooled['pii_count'])
+
+    def test_rejected_archive_is_reported(self):
+        path = self.write('bomb.zip', zip_bytes([('zeros.py', b'\0' * (20 * 1024 * 1024))]))
+        result = CodeScanner().scan_archive(path, max_workers=1)
+        self.assertEqual(result['status'], 'rejected')
+        self.assertIn('ratio', result['error'])
+
+    @unittest.skipUnless(BLOB_SCANNER_AVAILABLE, "BlobScanner dependencies not installed")
+    def test_blob_scanner_reads_office_text(self):
+        path = self.upload()
+        result = BlobScanner().scan_archive(path, max_workers=1)
+        self.assertEqual(result['status'], 'scanned')
+        docx_findings = [f for f in result['pii_found'] if f['archive_member'].endswith('contract.docx')]
+        self.assertTrue(docx_findings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Clone Detector Tests
+Clones found through the shared fingerprint index: hash collisions told
+apart by the normalised lines, adjacent windows merged into one region, and
+files too small to report skipped.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.clone_detector import MIN_FILE_LINES, CloneIndex
+
+
+def source(name, count, start=0):
+    return [f"{name}_{i} = compute({i}, '{name}')" for i in range(start, start + count)]
+
+
+def join(*blocks):
+    return '\n'.join(line for block in blocks for line in block)
+
+
+class TestCloneIndex(unittest.TestCase):
+
+    def test_copied_region_is_one_clone(self):
+        original = source('original', 30)
+        index = CloneIndex()
+        index.add_file('a.py', join(original))
+        index.add_file('b.py', join(source('other', 10), original[5:25], source('other', 10, 10)))
+        clones = index.find_clones()
+        self.assertEqual([(c.source_file, c.source_start, c.source_end, c.clone_file, c.clone_start, c.clone_end,
+                           c.line_count) for c in clones],
+                         [('a.py', 6, 25, 'b.py', 11, 30, 20)])
+        self.assertTrue(clones[0].cross_file)
+
+    def test_region_stays_merged_where_windows_were_first_seen_elsewhere(self):
+        original = source('original', 30)
+        index = CloneIndex()
+        # An earlier file already holds a few of the original's lines
+        index.add_file('early.py', join(source('early', 10), original[10:16], source('early', 10, 10)))
+        index.add_file('a.py', join(original))
+        index.add_file('b.py', join(original))
+        copies = [(c.source_file, c.clone_file, c.clone_start, c.clone_end)
+                  for c in index.find_clones() if c.clone_file == 'b.py']
+        self.assertEqual(copies, [('a.py', 'b.py', 1, 30)])
+
+    def test_hash_collisions(self):
+        # Every line hashes alike, so every window shares one fingerprint
+        with mock.patch('services.clone_detector._line_hash', return_value=1):
+            index = CloneIndex()
+            block = source('block', 25)
+            index.add_file('unique.py', join(source('unique', 25)))
+            index.add_file('a.py', join(block))
+            index.add_file('b.py', join(block))
+            clones = index.find_clones()
+        self.assertEqual([(c.source_file, c.clone_file, c.line_count) for c in clones], [('a.py', 'b.py', 25)])
+
+    def test_n_copies_are_reported_against_the_first(self):
+        block = source('block', 20)
+        index = CloneIndex()
+        for name in ('a.py', 'b.py', 'c.py'):
+            index.add_file(name, join(block))
+        clones = index.find_clones()
+        self.assertEqual([(c.source_file, c.clone_file) for c in clones], [('a.py', 'b.py'), ('a.py', 'c.py')])
+
+    def test_repeated_run_in_one_file_is_not_a_clone_of_itself(self):
+        index = CloneIndex()
+        index.add_file('a.py', join(['x = 1'] * 25))
+        self.assertEqual([(c.source_start, c.clone_start, c.line_count) for c in index.find_clones()],
+                         [(1, 6, 20)])
+
+    def test_small_files_are_counted_but_not_indexed(self):
+        small = source('small', MIN_FILE_LINES - 5)
+        index = CloneIndex()
+        index.add_file('a.py', join(small))
+        index.add_file('b.py', join(small))
+        index.add_file('c.py', join(small, source('c', 10)))
+        self.assertEqual(index.find_clones(), [])
+        summary = index.duplication_summary()
+        self.assertEqual(summary['files_indexed'], 1)
+        self.assertEqual(summary['total_lines'], 2 * (MIN_FILE_LINES - 5) + MIN_FILE_LINES + 5)
+
+        index = CloneIndex(min_file_lines=0)
+        index.add_file('a.py', join(small))
+        index.add_file('b.py', join(small))
+        self.assertEqual(len(index.find_clones()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
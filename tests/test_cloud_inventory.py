@@ -0,0 +1,142 @@
+"""
+Cloud Inventory Tests
+Runs the ARM client against a local mock ARM endpoint: nextLink pagination,
+ETag revalidation, Resource Graph paging and throttling retries.
+"""
+
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from services.cloud_inventory import ArmClient, EtagCache, bounded_map
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+PAGE_SIZE = 3
+
+
+class MockArm(BaseHTTPRequestHandler):
+    """Pages of VMs per subscription, Resource Graph and one throttled route"""
+
+    vms_per_subscription = 7
+    graph_enabled = True
+    throttled = set()
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        MockArm.requests_seen.append(self.path)
+        if url.path == '/throttled' and self.path not in MockArm.throttled:
+            MockArm.throttled.add(self.path)
+            return self._send(429, {}, {'Retry-After': '0'})
+        if url.path == '/subscriptions':
+            return self._send(200, {'value': [{'subscriptionId': 'sub-a'}, {'subscriptionId': 'sub-b'}]})
+        parts = url.path.split('/')
+        if len(parts) > 2 and parts[1] == 'subscriptions':
+            subscription = parts[2]
+            start = int(query.get('skip', ['0'])[0])
+            items = [{'id': f'/subscriptions/{subscription}/vm{i}', 'name': f'vm{i}',
+                      'type': 'Microsoft.Compute/virtualMachines', 'location': 'westeurope'}
+                     for i in range(start, min(start + PAGE_SIZE, self.vms_per_subscription))]
+            payload = {'value': items}
+            if start + PAGE_SIZE < self.vms_per_subscription:
+                payload['nextLink'] = (f"http://{self.headers['Host']}{url.path}"
+                                       f"?api-version=2023-03-01&skip={start + PAGE_SIZE}")
+            etag = f'"{subscription}-{start}"'
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304)
+            return self._send(200, payload, {'ETag': etag})
+        return self._send(404, {})
+
+    def do_POST(self):
+        MockArm.requests_seen.append(self.path)
+        if not self.graph_enabled:
+            return self._send(403, {'error': 'forbidden'})
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        rows = [{'id': f'/subscriptions/{sub}/disk{i}', 'type': 'microsoft.compute/disks'}
+                for sub in request['subscriptions'] for i in range(4)]
+        start = int(request['options'].get('$skipToken') or 0)
+        payload = {'data': rows[start:start + 5]}
+        if start + 5 < len(rows):
+            payload['$skipToken'] = str(start + 5)
+        return self._send(200, payload)
+
+
+@unittest.skipUnless(REQUESTS_AVAILABLE, "requests not installed")
+class TestArmClient(unittest.TestCase):
+    """ARM client behaviour against the mock endpoint"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockArm)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        MockArm.requests_seen = []
+        MockArm.graph_enabled = True
+        self.client = ArmClient('token', endpoint=self.endpoint, max_workers=4, cache=EtagCache())
+
+    def test_list_follows_next_link(self):
+        vms = self.client.list_all('/subscriptions/sub-a/providers/Microsoft.Compute/virtualMachines',
+                                   {'api-version': '2023-03-01'})
+        self.assertEqual([vm['name'] for vm in vms], [f'vm{i}' for i in range(7)])
+
+    def test_unchanged_pages_are_revalidated(self):
+        path = '/subscriptions/sub-a/providers/Microsoft.Compute/virtualMachines'
+        first = self.client.list_all(path, {'api-version': '2023-03-01'})
+        second = self.client.list_all(path, {'api-version': '2023-03-01'})
+        self.assertEqual(first, second)
+        self.assertEqual(self.client.stats['not_modified'], 3)
+
+    def test_resource_graph_pages_across_subscriptions(self):
+        rows = self.client.resource_graph(['sub-a', 'sub-b', 'sub-c'], ['Microsoft.Compute/disks'])
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(len({row['id'] for row in rows}), 12)
+
+    def test_resource_graph_unavailable_returns_none(self):
+        MockArm.graph_enabled = False
+        self.assertIsNone(self.client.resource_graph(['sub-a'], ['Microsoft.Compute/disks']))
+
+    def test_throttled_request_is_retried(self):
+        self.assertIsNone(self.client.get_json('/throttled'))  # 404 after the retried 429
+        self.assertEqual(self.client.stats['retries'], 1)
+
+    def test_subscriptions_fan_out_in_order(self):
+        subscriptions = self.client.list_subscriptions()
+        pages = bounded_map(
+            lambda sub: self.client.list_all(f'/subscriptions/{sub}/providers/Microsoft.Compute/virtualMachines'),
+            subscriptions, 4
+        )
+        self.assertEqual([page[0]['id'].split('/')[2] for page in pages], ['sub-a', 'sub-b'])
+        self.assertEqual(sum(len(page) for page in pages), 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
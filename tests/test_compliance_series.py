@@ -0,0 +1,125 @@
+"""
+Compliance Series Tests
+Checks that forecasts fitted on the precomputed daily series match the
+scan-history path, and that cached tenant forecasts are invalidated when the
+tenant stores a scan.
+"""
+
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+    from services.predictive_compliance_engine import (
+        PredictiveComplianceEngine, predict_tenant_compliance
+    )
+    ENGINE_AVAILABLE = True
+except ImportError:
+    ENGINE_AVAILABLE = False
+
+from utils.redis_cache import ComplianceSeriesCache, RedisCache
+
+START = date(2024, 1, 1)
+SCORES = [80, 78, 81, 30, 79, 77, 74, 72, 70, 69, 66, 65]
+
+
+def series_rows(scores=SCORES, gap_after=None, gap_days=0):
+    """One scan per day with the given risk-adjusted scores"""
+    rows = []
+    day = START
+    for i, score in enumerate(scores):
+        rows.append([day.isoformat(), 1, 10, 3, 1, float(score)])
+        day += timedelta(days=1 + (gap_days if i == gap_after else 0))
+    return rows
+
+
+class FakeAggregator:
+    """Serves a fixed series and counts the reads"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.reads = 0
+
+    def get_compliance_series(self, username=None, organization_id='default_org', days=None):
+        self.reads += 1
+        return self.rows
+
+
+@unittest.skipUnless(ENGINE_AVAILABLE, "numpy/pandas not installed")
+class TestSeriesPrediction(unittest.TestCase):
+    """Engine path over daily rollup rows"""
+
+    def setUp(self):
+        self.engine = PredictiveComplianceEngine()
+
+    def test_series_matches_scan_history_scores(self):
+        history = [{'timestamp': datetime(2024, 1, 1 + i, 12).isoformat(), 'scan_type': 'code',
+                    'compliance_score': score, 'findings': []} for i, score in enumerate(SCORES)]
+        from_scans = self.engine._prepare_time_series_data(history)
+        from_series = self.engine._series_to_time_series(series_rows())
+        np.testing.assert_allclose(from_series['compliance_score'].to_numpy(float),
+                                   from_scans['compliance_score'].to_numpy(float))
+
+        scan_prediction = self.engine.predict_compliance_trajectory(history)
+        series_prediction = self.engine.predict_compliance_from_series(series_rows())
+        self.assertAlmostEqual(series_prediction.future_score, scan_prediction.future_score)
+        self.assertEqual(series_prediction.trend, scan_prediction.trend)
+
+    def test_daily_values_are_means_and_short_gaps_are_filled(self):
+        rows = [['2024-01-01', 2, 10, 4, 2, 150.0], ['2024-01-04', 1, 1, 1, 0, 80.0],
+                ['2024-01-10', 1, 0, 0, 0, 85.0]]
+        frame = self.engine._series_to_time_series(rows)
+        self.assertEqual(len(frame), 10)
+        self.assertEqual(frame['raw_compliance_score'].iloc[0], 75.0)
+        self.assertEqual(frame['high_findings'].iloc[0], 1.0)
+        # Jan 5-7 forward filled, Jan 8-9 left empty
+        self.assertEqual(frame['raw_compliance_score'].iloc[6], 80.0)
+        self.assertTrue(np.isnan(frame['raw_compliance_score'].iloc[7]))
+
+    def test_infrequent_monitoring_from_series(self):
+        prediction = self.engine.predict_compliance_from_series(
+            series_rows(SCORES[:4], gap_after=2, gap_days=90))
+        self.assertIn("Infrequent compliance monitoring", prediction.risk_factors)
+
+    def test_empty_series_gives_baseline(self):
+        self.assertEqual(self.engine.predict_compliance_from_series([]).future_score, 70.0)
+
+
+@unittest.skipUnless(ENGINE_AVAILABLE, "numpy/pandas not installed")
+class TestTenantForecastCache(unittest.TestCase):
+    """Forecasts cached per tenant until its next scan"""
+
+    def setUp(self):
+        import services.predictive_compliance_engine as engine_module
+        self.cache = ComplianceSeriesCache(RedisCache())
+        self._original = engine_module.get_compliance_cache
+        engine_module.get_compliance_cache = lambda: self.cache
+        self.addCleanup(setattr, engine_module, 'get_compliance_cache', self._original)
+
+    def test_forecast_is_cached_until_invalidated(self):
+        aggregator = FakeAggregator(series_rows())
+        first, _ = predict_tenant_compliance(aggregator, 'alice', 'org1')
+        aggregator.rows = series_rows([90] * 12)
+        cached, _ = predict_tenant_compliance(aggregator, 'alice', 'org1')
+        self.assertEqual(cached, first)
+
+        self.cache.invalidate_tenant('org2')
+        self.assertEqual(predict_tenant_compliance(aggregator, 'alice', 'org1')[0], first)
+
+        self.cache.invalidate_tenant('org1')
+        fresh, _ = predict_tenant_compliance(aggregator, 'alice', 'org1')
+        self.assertNotEqual(fresh.future_score, first.future_score)
+
+    def test_no_history_returns_none(self):
+        prediction, rows = predict_tenant_compliance(FakeAggregator([]), 'alice', 'org1')
+        self.assertIsNone(prediction)
+        self.assertEqual(rows, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
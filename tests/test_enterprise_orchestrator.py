@@ -0,0 +1,59 @@
+"""
+Enterprise Orchestrator Tests
+Checks that a batch of finding events is recorded with one RoPA and one
+SOC2 write per scan rather than one per finding.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.event_bus import EventBus, EventType
+
+try:
+    from services.enterprise_orchestrator import EnterpriseOrchestrator
+    ORCHESTRATOR_AVAILABLE = True
+except ImportError:
+    ORCHESTRATOR_AVAILABLE = False
+
+
+@unittest.skipUnless(ORCHESTRATOR_AVAILABLE, "application dependencies not installed")
+class TestFindingBatches(unittest.TestCase):
+    """Finding events arrive in batches from subscribe_batch"""
+
+    def setUp(self):
+        # The handler only needs the RoPA and SOC2 services
+        self.orchestrator = EnterpriseOrchestrator.__new__(EnterpriseOrchestrator)
+        self.orchestrator.ropa_service = mock.Mock(spec=['add_data_findings'])
+        self.orchestrator.soc2_service = mock.Mock(spec=['add_security_findings'])
+        self.bus = EventBus()
+
+    def _finding(self, scan_id, finding_type, risk_level):
+        return self.bus.create_event(EventType.FINDING_DETECTED, 'test', 'user', 'session', {
+            'scan_id': scan_id, 'type': finding_type, 'risk_level': risk_level, 'location': 'app.py'
+        })
+
+    def test_one_write_per_scan(self):
+        events = [self._finding('scan_a', 'PII Email', 'High') for _ in range(5)]
+        events += [self._finding('scan_b', 'Personal BSN', 'Low'), self._finding('scan_b', 'Secret', 'Critical')]
+        self.orchestrator._on_findings_detected(events)
+
+        ropa = self.orchestrator.ropa_service.add_data_findings
+        soc2 = self.orchestrator.soc2_service.add_security_findings
+        self.assertEqual([(call.args[0], len(call.args[1])) for call in ropa.call_args_list],
+                         [('scan_a', 5), ('scan_b', 1)])
+        self.assertEqual([(call.args[0], len(call.args[1])) for call in soc2.call_args_list],
+                         [('scan_a', 5), ('scan_b', 1)])
+
+    def test_scan_without_matching_findings_is_not_written(self):
+        self.orchestrator._on_findings_detected([self._finding('scan_a', 'Secret', 'Low')])
+        self.orchestrator.ropa_service.add_data_findings.assert_not_called()
+        self.orchestrator.soc2_service.add_security_findings.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
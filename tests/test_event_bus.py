@@ -0,0 +1,204 @@
+"""
+Event Bus Tests
+Checks asynchronous per-listener delivery, batching, bounded queues, metrics
+and the Redis Streams backend. Redis is replaced by a small in-memory stand-in
+implementing the stream commands the backend uses.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.event_bus import EventBus, EventType, RedisStreamsBackend
+
+
+class StreamsRedis:
+    """In-memory stand-in for XADD/XGROUP CREATE/XREADGROUP/XACK."""
+
+    def __init__(self):
+        self.streams = {}
+        self.groups = {}
+        self._next_id = 0
+
+    def xgroup_create(self, name, groupname, id='$', mkstream=False):
+        self.streams.setdefault(name, [])
+        if (name, groupname) in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.groups[(name, groupname)] = {'delivered': 0, 'pending': {}}
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self._next_id += 1
+        entry_id = f"{self._next_id}-0".encode()
+        self.streams.setdefault(name, []).append((entry_id, {k.encode(): v.encode() for k, v in fields.items()}))
+        return entry_id
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def xadd(self, *args, **kwargs):
+                self.calls.append((args, kwargs))
+
+            def execute(self):
+                return [client.xadd(*args, **kwargs) for args, kwargs in self.calls]
+
+        return Pipeline()
+
+    def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        response = []
+        for name, cursor in streams.items():
+            group = self.groups[(name, groupname)]
+            pending = group['pending'].setdefault(consumername, [])
+            if cursor == '>':
+                entries = self.streams[name][group['delivered']:group['delivered'] + (count or 10 ** 9)]
+                group['delivered'] += len(entries)
+                pending.extend(entry_id for entry_id, _ in entries)
+                if entries:
+                    response.append((name.encode(), entries))
+            else:
+                after = int(cursor.split('-')[0])
+                by_id = dict(self.streams[name])
+                ids = [i for i in pending if int(i.decode().split('-')[0]) > after][:count]
+                response.append((name.encode(), [(i, by_id[i]) for i in ids]))
+        return response
+
+    def xack(self, name, groupname, *ids):
+        pending = self.groups[(name, groupname)]['pending']
+        for consumer_ids in pending.values():
+            for entry_id in ids:
+                if entry_id.encode() in consumer_ids:
+                    consumer_ids.remove(entry_id.encode())
+        return len(ids)
+
+    def pending_count(self, name, groupname):
+        return sum(len(ids) for ids in self.groups[(name, groupname)]['pending'].values())
+
+
+def make_event(bus, event_type=EventType.FINDING_DETECTED, **data):
+    return bus.create_event(event_type, 'test', 'user', 'session', data)
+
+
+class TestAsyncDelivery(unittest.TestCase):
+    """In-process delivery through per-listener queues"""
+
+    def setUp(self):
+        self.bus = EventBus(asynchronous=True)
+
+    def tearDown(self):
+        self.bus.shutdown(timeout=2)
+
+    def test_publish_does_not_wait_for_listeners(self):
+        received = []
+
+        def slow(event):
+            time.sleep(0.2)
+            received.append(event.event_id)
+
+        self.bus.subscribe(EventType.SCAN_COMPLETED, slow)
+        started = time.monotonic()
+        self.bus.publish(make_event(self.bus, EventType.SCAN_COMPLETED))
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertTrue(self.bus.flush(timeout=2))
+        self.assertEqual(len(received), 1)
+
+    def test_batch_listener(self):
+        batches = []
+        self.bus.subscribe_batch(EventType.FINDING_DETECTED, lambda events: batches.append(len(events)),
+                                 max_batch=100)
+        self.bus.publish_batch([make_event(self.bus, index=i) for i in range(250)])
+        self.assertTrue(self.bus.flush(timeout=2))
+        self.assertEqual(sum(batches), 250)
+        self.assertLessEqual(max(batches), 100)
+        self.assertLess(len(batches), 250)
+
+    def test_failing_listener_is_isolated(self):
+        received = []
+
+        def fail(event):
+            raise RuntimeError("boom")
+
+        failing_id = self.bus.subscribe(EventType.SCAN_STARTED, fail)
+        healthy_id = self.bus.subscribe(EventType.SCAN_STARTED, lambda e: received.append(e))
+        for _ in range(3):
+            self.bus.publish(make_event(self.bus, EventType.SCAN_STARTED))
+        self.assertTrue(self.bus.flush(timeout=2))
+        metrics = self.bus.get_listener_metrics()
+        self.assertEqual(metrics[failing_id]['failed'], 3)
+        self.assertEqual(metrics[healthy_id]['delivered'], 3)
+        self.assertEqual(len(received), 3)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        gate = threading.Event()
+        listener_id = self.bus.subscribe(EventType.SCAN_STARTED, lambda e: gate.wait(2), max_queue=1)
+        self.bus.put_timeout = 0.01
+        for _ in range(5):
+            self.bus.publish(make_event(self.bus, EventType.SCAN_STARTED))
+        metrics = self.bus.get_listener_metrics()[listener_id]
+        gate.set()
+        self.assertGreater(metrics['dropped'], 0)
+        self.assertEqual(metrics['queue_capacity'], 1)
+
+    def test_unsubscribe(self):
+        listener_id = self.bus.subscribe(EventType.SCAN_STARTED, lambda e: None)
+        self.assertEqual(self.bus.get_listener_count(EventType.SCAN_STARTED), 1)
+        self.assertTrue(self.bus.unsubscribe(EventType.SCAN_STARTED, listener_id))
+        self.assertEqual(self.bus.get_listener_count(EventType.SCAN_STARTED), 0)
+
+
+class TestRedisStreams(unittest.TestCase):
+    """Durable delivery through consumer groups"""
+
+    def setUp(self):
+        self.redis = StreamsRedis()
+
+    def _bus(self, consumer='replica-1', group='dataguardian'):
+        backend = RedisStreamsBackend(self.redis, group=group, consumer=consumer)
+        return EventBus(asynchronous=False, streams_backend=backend), backend
+
+    def test_events_are_delivered_and_acknowledged(self):
+        bus, backend = self._bus()
+        received = []
+        bus.subscribe(EventType.SCAN_COMPLETED, lambda e: received.append(e.data['n']))
+        bus.publish_batch([make_event(bus, EventType.SCAN_COMPLETED, n=i) for i in range(3)])
+        self.assertEqual(received, [])  # Delivered by the stream consumer, not on publish
+        while bus.poll_streams():
+            pass
+        self.assertEqual(received, [0, 1, 2])
+        self.assertEqual(self.redis.pending_count(backend.stream_name(EventType.SCAN_COMPLETED),
+                                                  'dataguardian'), 0)
+
+    def test_unacknowledged_entries_are_redelivered_after_restart(self):
+        bus, backend = self._bus()
+        bus.subscribe(EventType.SCAN_COMPLETED, lambda e: None)
+        bus.publish(make_event(bus, EventType.SCAN_COMPLETED, n=1))
+        backend.read(10, 0)  # read but never handled: process "crashed"
+
+        restarted, _ = self._bus()
+        received = []
+        restarted.subscribe(EventType.SCAN_COMPLETED, lambda e: received.append(e.data['n']))
+        while restarted.poll_streams():
+            pass
+        self.assertEqual(received, [1])
+
+    def test_separate_groups_fan_out(self):
+        first, _ = self._bus(group='reporting')
+        second, _ = self._bus(group='ticketing')
+        received = []
+        first.subscribe(EventType.SCAN_COMPLETED, lambda e: received.append('reporting'))
+        second.subscribe(EventType.SCAN_COMPLETED, lambda e: received.append('ticketing'))
+        first.publish(make_event(first, EventType.SCAN_COMPLETED))
+        first.poll_streams()
+        second.poll_streams()
+        self.assertEqual(sorted(received), ['reporting', 'ticketing'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+"""
+Finding Batch Tests
+Columnar findings round-trip to the scanner's dicts, refuse in-place
+writes, aggregate from their codes, survive pickling, the checkpoint
+journal and the JSON payload, export as finding dicts, and - merged into
+one scan-level batch the way scan_directory returns them - cost close to
+an order of magnitude less memory and over ten times less JSON than dicts.
+"""
+
+import base64
+import copy
+import json
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.code_scanner import CodeScanner
+from services.finding_batch import (PAYLOAD_MARKER, Finding, FindingBatch, Severity, dumps, finding_rows,
+                                    json_default, json_export_default, loads, merge_file_findings)
+from services.scan_checkpoint import CheckpointJournal, journal_path_for
+from services.scan_rollups import summarize_scan_result
+
+
+def make_findings(count, rng):
+    """Findings shaped like CodeScanner's PII, UAVG and vulnerability findings"""
+    findings = []
+    for _ in range(count):
+        line = rng.randrange(1, 2000)
+        kind = rng.randrange(3)
+        if kind == 0:
+            findings.append({
+                'type': 'Email',
+                'value': f'user{rng.randrange(500)}@example.com',
+                'location': f'Line {line} (code)',
+                'risk_level': 'Medium',
+                'reason': 'Email addresses are personal data under GDPR Article 4(1).',
+            })
+        elif kind == 1:
+            vuln_type = 'sql_injection'
+            findings.append({
+                'type': f'Vulnerability:{vuln_type.replace("_", " ").title()}',
+                'value': 'cursor.execute("SELECT * FROM users WHERE id=" + uid)',
+                'location': f'Line {line} (code)',
+                'risk_level': 'High',
+                'reason': f'Potential security vulnerability: {vuln_type.replace("_", " ")}. '
+                          'This pattern is commonly found in intentionally vulnerable applications.',
+            })
+        else:
+            findings.append({
+                'type': 'UAVG-Bsn',
+                'value': str(rng.randrange(10 ** 8, 10 ** 9)),
+                'location': f'Line {line} (code)',
+                'risk_level': 'Critical',
+                'reason': 'BSN processing requires a legal basis under UAVG Article 46.',
+                'compliance_frameworks': ['GDPR', 'UAVG'],
+                'netherlands_specific': True,
+            })
+    return findings
+
+
+class TestFindingBatch(unittest.TestCase):
+    """Columnar storage behind the Sequence of dicts"""
+
+    def setUp(self):
+        self.findings = make_findings(300, random.Random(3))
+        self.findings[7]['entropy'] = 4.5
+        self.findings[8]['entropy'] = '4.5'
+        self.findings[9]['provider'] = None
+        self.batch = FindingBatch.from_dicts(self.findings)
+
+    def test_sequence_of_the_same_dicts(self):
+        self.assertEqual(len(self.batch), 300)
+        self.assertEqual(list(self.batch), self.findings)
+        self.assertEqual(self.batch[7], self.findings[7])
+        self.assertEqual(self.batch[-1], self.findings[-1])
+        self.assertEqual(self.batch[10:20], self.findings[10:20])
+        self.assertIsInstance(self.batch[10:20], FindingBatch)
+        self.assertEqual(self.batch.to_dicts(), self.findings)
+        self.assertFalse(FindingBatch.from_dicts([]))
+        with self.assertRaises(IndexError):
+            self.batch[300]
+
+    def test_rows_are_read_only(self):
+        for finding in (self.batch[0], next(iter(self.batch))):
+            with self.assertRaises(TypeError):
+                finding['risk_level'] = 'Low'
+            with self.assertRaises(TypeError):
+                finding.update(risk_level='Low')
+            with self.assertRaises(TypeError):
+                finding.pop('type')
+            self.assertIsInstance(finding, dict)
+            self.assertEqual(finding, self.findings[0])
+        for writable in (self.batch[0].copy(), dict(self.batch[0]), copy.deepcopy(self.batch[0]),
+                         pickle.loads(pickle.dumps(self.batch[0])), self.batch.to_dicts()[0]):
+            writable['risk_level'] = 'Low'
+            self.assertEqual(writable['risk_level'], 'Low')
+        self.assertEqual(self.batch[0]['risk_level'], self.findings[0]['risk_level'])
+
+    def test_values_keep_their_type(self):
+        self.assertEqual(self.batch[7]['entropy'], 4.5)
+        self.assertEqual(self.batch[8]['entropy'], '4.5')
+        self.assertIn('provider', self.batch[9])
+        self.assertNotIn('provider', self.batch[10])
+        flags = FindingBatch.from_dicts([{'a': True}, {'a': 1}, {'a': 1.0}])
+        self.assertEqual([type(f['a']) for f in flags], [bool, int, float])
+
+    def test_columns_and_counts(self):
+        self.assertEqual(self.batch.column('type'), [f['type'] for f in self.findings])
+        self.assertEqual(self.batch.column('netherlands_specific', False),
+                         [f.get('netherlands_specific', False) for f in self.findings])
+        keys = ('type', 'location', 'risk_level')
+        self.assertEqual(finding_rows(self.batch, keys), finding_rows(self.findings, keys))
+
+        expected = {}
+        for finding in self.findings:
+            expected[finding['risk_level']] = expected.get(finding['risk_level'], 0) + 1
+        self.assertEqual(self.batch.value_counts('risk_level'), expected)
+        counts = self.batch.severity_counts()
+        self.assertEqual(counts[Severity.CRITICAL], expected['Critical'])
+        self.assertEqual(counts[Severity.HIGH], expected['High'])
+        self.assertEqual(counts[Severity.LOW], 0)
+
+    def test_severity_keys_and_case(self):
+        batch = FindingBatch.from_dicts([{'severity': 'high'}, {'risk_level': 'LOW', 'severity': 'critical'},
+                                         {'risk_level': 'unknown'}, {}])
+        self.assertEqual(batch.severities().tolist(), [3, 1, 0, 0])
+
+    def test_take_with_mask(self):
+        critical = self.batch.take(self.batch.severities() == Severity.CRITICAL)
+        self.assertEqual(critical.to_dicts(), [f for f in self.findings if f['risk_level'] == 'Critical'])
+
+    def test_typed_findings(self):
+        record = next(self.batch.records())
+        self.assertIsInstance(record, Finding)
+        self.assertEqual(record.severity, Severity.parse(self.findings[0]['risk_level']))
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(FindingBatch.from_findings(self.batch.records()).column('risk_level'),
+                         self.batch.column('risk_level'))
+
+    def test_pickle_and_payload_round_trip(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.batch)), self.findings)
+        document = {'findings': [{'file_path': 'a.py', 'pii_found': self.batch}]}
+        restored = loads(dumps(document))
+        self.assertIsInstance(restored['findings'][0]['pii_found'], FindingBatch)
+        self.assertEqual(restored['findings'][0]['pii_found'], self.findings)
+        with self.assertRaises(TypeError):
+            json.dumps(self.batch)
+
+    def test_version_1_payload(self):
+        batch = FindingBatch.from_dicts([{'type': 'Email', 'risk_level': 'Low'}, {'type': 'Email', 'flag': True}])
+        codes = batch._codes
+        payload = {PAYLOAD_MARKER: 1, 'keys': batch.keys, 'length': len(batch), 'dtype': codes.dtype.str,
+                   'codes': base64.b64encode(codes.tobytes()).decode('ascii'),
+                   'strings': ['Email', 'Low'], 'objects': [True]}
+        self.assertEqual(FindingBatch.from_payload(payload), batch)
+
+    def test_export_writes_finding_dicts(self):
+        document = {'findings': [{'pii_found': self.batch}], 'finished': object()}
+        exported = json.loads(json.dumps(document, default=json_export_default))
+        self.assertEqual(exported['findings'][0]['pii_found'], self.findings)
+        self.assertIsInstance(exported['finished'], str)
+
+
+class TestScanLevelBatch(unittest.TestCase):
+    """Per-file slices of one batch sharing the scan's value table"""
+
+    def setUp(self):
+        rng = random.Random(4)
+        self.files = [make_findings(rng.randint(0, 6), rng) for _ in range(40)]
+        self.results = merge_file_findings([{'file_path': f'{i}.py', 'pii_found': FindingBatch.from_dicts(found)}
+                                            for i, found in enumerate(self.files)] + [{'status': 'error'}])
+
+    def test_slices_hold_each_files_findings(self):
+        self.assertEqual([r['pii_found'] for r in self.results[:-1]], self.files)
+        self.assertEqual(self.results[-1], {'status': 'error'})
+        for result, found in zip(self.results, self.files):
+            self.assertIsInstance(result['pii_found'], FindingBatch)
+            self.assertEqual(result['pii_found'].value_counts('risk_level'),
+                             FindingBatch.from_dicts(found).value_counts('risk_level'))
+            self.assertEqual(result['pii_found'].severities().tolist(),
+                             FindingBatch.from_dicts(found).severities().tolist())
+        merged = FindingBatch.concat(self.files)
+        everything = [f for found in self.files for f in found]
+        self.assertEqual(merged, everything)
+        self.assertEqual(merged[30:60][5:10], everything[35:40])
+        self.assertEqual(merged[5:80:7], everything[5:80:7])
+        self.assertEqual(merged[60:30], [])
+
+    def test_lists_of_dicts_are_merged_too(self):
+        results = merge_file_findings([{'pii_found': found} for found in self.files[:5]])
+        self.assertEqual([r['pii_found'] for r in results], self.files[:5])
+        self.assertEqual(merge_file_findings([]), [])
+
+    def test_document_writes_the_shared_table_once(self):
+        restored = loads(dumps(self.results))
+        self.assertEqual([r['pii_found'] for r in restored[:-1]], self.files)
+        self.assertLess(len(dumps(self.results)),
+                        len(dumps([{'pii_found': FindingBatch.from_dicts(found)} for found in self.files])) / 2)
+        # A slice written on its own carries only the values it uses
+        alone = json.loads(json.dumps(self.results[3]['pii_found'], default=json_default))
+        self.assertEqual(FindingBatch.from_payload(alone), self.files[3])
+        self.assertLessEqual(len(alone['strings']) + len(alone['objects']), 5 * len(self.files[3]))
+        self.assertEqual(pickle.loads(pickle.dumps(self.results)), self.results)
+
+    def test_reference_to_a_missing_table(self):
+        with self.assertRaises(ValueError):
+            FindingBatch.from_payload({PAYLOAD_MARKER: 2, 'table_ref': 0, 'span': [0, 1]})
+
+    def test_scan_directory_returns_slices(self):
+        root = tempfile.mkdtemp(prefix="finding_batch_repo_")
+        self.addCleanup(shutil.rmtree, root, True)
+        for i in range(3):
+            with open(os.path.join(root, f'module_{i}.py'), 'w') as f:
+                f.write(f'contact = "user{i}@example.com"\n'
+                        'cursor.execute("SELECT * FROM users WHERE id=" + uid)\n')
+        state = tempfile.mkdtemp(prefix="finding_batch_state_")
+        self.addCleanup(shutil.rmtree, state, True)
+        result = CodeScanner(checkpoint_dir=state).scan_directory(root)
+        self.assertEqual(len(result['findings']), 3)
+        expected = {f['file_path']: CodeScanner().scan_file(f['file_path'])['pii_found'] for f in result['findings']}
+        for file_result in result['findings']:
+            self.assertEqual(file_result['pii_found'], expected[file_result['file_path']])
+        self.assertEqual(len(loads(dumps(result['findings']))), 3)
+
+
+class TestFindingBatchPipeline(unittest.TestCase):
+    """Scanner output, journal and rollups with batches"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="finding_batch_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_code_scanner_emits_batches(self):
+        path = os.path.join(self.temp_dir, 'settings.py')
+        with open(path, 'w') as f:
+            f.write('query = "SELECT * FROM users WHERE id=" + uid\n')
+        result = CodeScanner().scan_file(path)
+        self.assertIsInstance(result['pii_found'], FindingBatch)
+        self.assertEqual(result['pii_count'], len(result['pii_found']))
+        self.assertEqual(sum(result['risk_summary'].values()), len(result['pii_found']))
+        self.assertTrue(any(f['type'].startswith('Vulnerability:') for f in result['pii_found']))
+
+    def test_journal_round_trip(self):
+        batch = FindingBatch.from_dicts(make_findings(50, random.Random(5)))
+        journal = CheckpointJournal.create(journal_path_for('/data/repo', self.temp_dir),
+                                           'scan1', '2024-01-01T00:00:00', '/data/repo')
+        journal.record_file('a.py', {'file_path': '/data/repo/a.py', 'pii_found': batch})
+        journal.close()
+        state = CheckpointJournal(journal.path).replay()
+        restored = state['findings']['a.py']['pii_found']
+        self.assertIsInstance(restored, FindingBatch)
+        self.assertEqual(restored, batch)
+
+    def test_rollup_summary_from_batch(self):
+        findings = make_findings(200, random.Random(9))
+        from_batch = summarize_scan_result({'findings': FindingBatch.from_dicts(findings)})
+        from_dicts = summarize_scan_result({'findings': [dict(f, risk_level=f['risk_level'].lower())
+                                                         for f in findings]})
+        self.assertEqual(from_batch, from_dicts)
+
+
+class TestFindingBatchCost(unittest.TestCase):
+    """Memory and serialised size per finding against dicts, in the shape scan_directory returns"""
+
+    def test_order_of_magnitude_smaller(self):
+        # About a dozen findings per file: what CodeScanner reports for a file
+        # with one to three PII lines. scripts/benchmark_finding_batch.py
+        # measures the same against the scanner's own dicts.
+        rng = random.Random(1)
+        merge_file_findings([{'pii_found': make_findings(10, rng)} for _ in range(10)])
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            files = [make_findings(rng.randint(6, 18), rng) for _ in range(2000)]
+            dict_bytes = tracemalloc.get_traced_memory()[0] - before
+            before = tracemalloc.get_traced_memory()[0]
+            merged = [r['pii_found'] for r in merge_file_findings([{'pii_found': found} for found in files])]
+            batch_bytes = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(dict_bytes / batch_bytes, 8)
+        self.assertGreater(len(json.dumps(files)) / len(dumps(merged)), 10)
+        self.assertGreater(len(pickle.dumps(files)) / len(pickle.dumps(merged)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
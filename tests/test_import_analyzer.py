@@ -0,0 +1,115 @@
+"""
+Import Analyzer Tests
+analyze_source on plain, aliased and from-imports, names kept alive by
+__all__ and string annotations, and source that does not parse; plus
+find_unused_imports reading files through the content-hash cache.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.import_analyzer import ImportAnalysisCache, analyze_source, find_unused_imports
+
+
+def unused(source):
+    return [(result['line'], result['import']) for result in analyze_source(textwrap.dedent(source))]
+
+
+class TestAnalyzeSource(unittest.TestCase):
+
+    def test_plain_imports(self):
+        self.assertEqual(unused("""
+            import os
+            import sys
+            import os.path
+            print(sys.argv)
+        """), [(2, 'os'), (4, 'os.path')])
+        self.assertEqual(unused("""
+            import os.path
+            os.path.join('a', 'b')
+        """), [])
+
+    def test_aliased_imports(self):
+        self.assertEqual(unused("""
+            import numpy as np
+            import pandas as pd
+            import json as json_module
+            np.zeros(3)
+            json = None
+        """), [(3, 'pandas as pd'), (4, 'json as json_module')])
+
+    def test_from_imports(self):
+        self.assertEqual(unused("""
+            from __future__ import annotations
+            from collections import OrderedDict, defaultdict
+            from typing import List as TypingList, Optional
+            from . import sibling
+            from ..package.module import helper
+            from os.path import *
+            counts = defaultdict(int)
+            value: Optional[int] = None
+        """), [(3, 'collections.OrderedDict'), (4, 'typing.List as TypingList'), (5, '.sibling'),
+               (6, '..package.module.helper')])
+
+    def test_names_kept_by_exports_and_annotations(self):
+        self.assertEqual(unused("""
+            from models import User, Group, Role
+            __all__ = ['User']
+            __all__ += ('Group',)
+            def find(name) -> "Optional[Role]":
+                pass
+        """), [])
+
+    def test_one_result_per_binding_and_line(self):
+        self.assertEqual(unused("import os, os\n"), [(1, 'os')])
+        self.assertEqual(analyze_source("import os\n"),
+                         [{'line': 1, 'import': 'os', 'message': "'os' imported but unused"}])
+
+    def test_source_that_does_not_parse(self):
+        self.assertEqual(analyze_source("import os\ndef broken(:\n"), [])
+        self.assertEqual(analyze_source("import os\x00\n"), [])
+        self.assertEqual(analyze_source("print 'python 2'\nimport os\n"), [])
+
+
+class TestFindUnusedImports(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ImportAnalysisCache(os.path.join(self.directory, 'cache', 'imports.sqlite'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, name, source):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        return path
+
+    def test_results_by_file_and_cached_by_content(self):
+        paths = [self.write('a.py', 'import os\n'), self.write('b.py', 'import os\n'),
+                 self.write('c.py', 'import sys\nsys.exit()\n'), self.write('d.py', 'def broken(:\n')]
+        expected = [{'file': 'a.py', 'line': 1, 'import': 'os', 'message': "'os' imported but unused"},
+                    {'file': 'b.py', 'line': 1, 'import': 'os', 'message': "'os' imported but unused"}]
+        self.assertEqual(find_unused_imports(paths, base_dir=self.directory, max_workers=1, cache=self.cache),
+                         expected)
+        hashes = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                hashes.append(hashlib.sha256(f.read()).hexdigest())
+        # a.py and b.py share one entry; files that do not parse are cached too
+        self.assertEqual(len(self.cache.get_many(hashes)), 3)
+        self.assertEqual(find_unused_imports(paths, base_dir=self.directory, max_workers=1, cache=self.cache),
+                         expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Log Index Tests
+Checks incremental tailing (partial lines, rotation, truncation), windowed
+queries, full-text search and the precomputed error and scanner counters.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.log_index import LogIndex
+
+try:
+    from utils.log_monitor import LogAnalyzer
+    LOG_MONITOR_AVAILABLE = True
+except ImportError:
+    LOG_MONITOR_AVAILABLE = False
+
+
+def log_line(minutes_ago=0, level='INFO', message='Working', **fields):
+    timestamp = (datetime.utcnow() - timedelta(minutes=minutes_ago)).isoformat() + "Z"
+    entry = {"timestamp": timestamp, "level": level, "message": message, "module": "scanner",
+             "category": "scanner", "scanner_type": "unknown"}
+    entry.update(fields)
+    return json.dumps(entry) + "\n"
+
+
+class TestLogIndex(unittest.TestCase):
+    """Incremental indexing and queries"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="log_index_test_")
+        self.index = LogIndex(self.directory)
+        self.live = os.path.join(self.directory, "dataguardian_scanner.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _append(self, *lines, path=None):
+        with open(path or self.live, 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+
+    def test_refresh_reads_only_new_complete_lines(self):
+        self._append(log_line(message='first'), log_line(message='second'))
+        self.assertEqual(self.index.refresh(), 2)
+        self.assertEqual(self.index.refresh(), 0)
+
+        partial = log_line(message='third')
+        self._append(partial[:20])
+        self.assertEqual(self.index.refresh(), 0)
+        self._append(partial[20:], "not json\n")
+        self.assertEqual(self.index.refresh(), 1)
+        self.assertEqual([e['message'] for e in self.index.recent_entries()], ['third', 'second', 'first'])
+
+    def test_rotation_finishes_the_old_file_without_duplicates(self):
+        self._append(log_line(message='before'))
+        self.index.refresh()
+        self._append(log_line(message='late write'))
+        os.rename(self.live, self.live + ".1")
+        self._append(log_line(message='after'))
+        self.assertEqual(self.index.refresh(), 2)
+        self.assertEqual(sorted(e['message'] for e in self.index.recent_entries(category='scanner')),
+                         ['after', 'before', 'late write'])
+
+    def test_truncated_file_is_read_again(self):
+        self._append(log_line(message='old'), log_line(message='old'))
+        self.index.refresh()
+        with open(self.live, 'w', encoding='utf-8') as f:
+            f.write(log_line(message='new'))
+        self.assertEqual(self.index.refresh(), 1)
+
+    def test_window_level_and_category_filters(self):
+        self._append(log_line(minutes_ago=30, level='ERROR'), log_line(minutes_ago=60 * 30, level='ERROR'),
+                     log_line(minutes_ago=5))
+        self._append(log_line(message='denied'), path=os.path.join(self.directory, "dataguardian_security.log"))
+        self.index.refresh()
+        self.assertEqual(len(self.index.recent_entries(hours=24)), 3)
+        self.assertEqual(len(self.index.recent_entries(hours=48, levels=['error'])), 2)
+        self.assertEqual(len(self.index.recent_entries(category='security')), 1)
+
+    def test_search_matches_substrings_in_any_text_field(self):
+        self._append(log_line(message='Scan completed for Repository'),
+                     log_line(message='other', request_id='req-XYZ-42'),
+                     log_line(message='a_b 100% done'))
+        self.index.refresh()
+        self.assertEqual(len(self.index.recent_entries(query='repos')), 1)
+        self.assertEqual(len(self.index.recent_entries(query='xyz-4')), 1)
+        self.assertEqual(len(self.index.recent_entries(query='0%')), 1)
+        self.assertEqual(len(self.index.recent_entries(query='a_')), 1)
+        self.assertEqual(len(self.index.recent_entries(query='')), 3)
+
+    def test_counters_cover_whole_and_partial_hours(self):
+        # Events just inside and just outside the start of a 3-hour window
+        self._append(
+            log_line(minutes_ago=179, level='ERROR', module='code_scanner', scanner_type='code'),
+            log_line(minutes_ago=181, level='ERROR', module='code_scanner', scanner_type='code'),
+            log_line(minutes_ago=10, level='CRITICAL', module='db'),
+            log_line(minutes_ago=170, message='Scan completed', scanner_type='code',
+                     execution_time=2.0, results_count=3),
+            log_line(minutes_ago=20, message='Scan completed', scanner_type='code',
+                     execution_time=4.0, results_count=1),
+            log_line(minutes_ago=15, message='Scan failed', scanner_type='code'),
+        )
+        self.index.refresh()
+        errors = {}
+        for _, module, _, _, count in self.index.error_counts(hours=3):
+            errors[module] = errors.get(module, 0) + count
+        self.assertEqual(errors, {'code_scanner': 1, 'db': 1})
+        self.assertEqual(self.index.scanner_counts('scanner', hours=3), {'code': [2, 1, 6.0, 4]})
+
+
+
+@unittest.skipUnless(LOG_MONITOR_AVAILABLE, "streamlit not installed")
+class TestErrorSummary(unittest.TestCase):
+    """The dashboard's error summary read from the index aggregates"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="log_monitor_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_error_summary(self):
+        lines = [log_line(minutes_ago=5 + i, level='ERROR', module='code_scanner', scanner_type='code')
+                 for i in range(12)]
+        lines += [log_line(minutes_ago=200, level='CRITICAL', module='db', category='security', scanner_type=''),
+                  log_line(minutes_ago=1, message='Not an error')]
+        with open(os.path.join(self.directory, "dataguardian_scanner.log"), 'w') as f:
+            f.writelines(lines)
+        summary = LogAnalyzer(self.directory).get_error_summary(hours=24)
+        self.assertEqual(summary['total_errors'], 13)
+        self.assertEqual(summary['error_categories'], {'scanner': 12, 'security': 1})
+        self.assertEqual(summary['scanner_errors'], {'code': 12})
+        self.assertEqual(summary['module_errors'], {'code_scanner': 12, 'db': 1})
+        self.assertEqual(summary['level_errors'], {'ERROR': 12, 'CRITICAL': 1})
+        self.assertEqual(len(summary['recent_errors']), 10)
+        self.assertEqual(summary['recent_errors'][0]['timestamp'], json.loads(lines[0])['timestamp'])
+
+
+if __name__ == '__main__':
+    unittest.main()
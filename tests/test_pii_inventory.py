@@ -0,0 +1,134 @@
+"""
+PII Inventory Tests
+Checks the SQLite-backed PII inventory: legacy JSON import, keyset pages,
+set-based bulk actions with their audit trail, trigger-maintained counters
+and index-only query plans for the inventory pages.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.pii_management_system import PIIAction, PIICategory, PIIItem, PIIManagementSystem
+
+CATEGORIES = [PIICategory.CRITICAL, PIICategory.HIGH, PIICategory.MEDIUM, PIICategory.LOW]
+
+
+def make_item(i, category=None, confidence=None, days_old=0):
+    return PIIItem(
+        id=f"scan_{i}", content=f"value {i}",
+        category=category or CATEGORIES[i % 4], scan_id="scan", file_path="app.py", line_number=i,
+        confidence=confidence if confidence is not None else (i % 10) / 10,
+        timestamp=(datetime.now() - timedelta(days=days_old)).isoformat()
+    )
+
+
+class TestPIIInventory(unittest.TestCase):
+    """Inventory store behind PIIManagementSystem"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="pii_inventory_test_")
+        self.system = PIIManagementSystem(data_dir=self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_legacy_json_files_are_imported_once(self):
+        directory = tempfile.mkdtemp(prefix="pii_inventory_test_")
+        self.addCleanup(shutil.rmtree, directory, True)
+        items = [{'id': 'a', 'content': 'x', 'category': 'high', 'scan_id': 's', 'file_path': 'f',
+                  'line_number': 1, 'confidence': 0.9, 'timestamp': datetime.now().isoformat(),
+                  'status': 'masked', 'action_taken': 'masked'}]
+        with open(os.path.join(directory, 'pii_items.json'), 'w') as f:
+            json.dump(items, f)
+        with open(os.path.join(directory, 'pii_audit.json'), 'w') as f:
+            json.dump([{'timestamp': datetime.now().isoformat(), 'item_id': 'a', 'action': 'masked'}], f)
+
+        PIIManagementSystem(data_dir=directory)
+        system = PIIManagementSystem(data_dir=directory)
+        self.assertEqual(system.get_pii_summary()['status_breakdown']['masked'], 1)
+        self.assertEqual(system.get_item('a').action_taken, PIIAction.MASK)
+        self.assertEqual(len(system.get_audit_trail(item_id='a')), 1)
+
+    def test_pending_pages_follow_priority_and_confidence(self):
+        self.system.store.add_items(make_item(i) for i in range(250))
+        seen, cursor = [], None
+        while True:
+            page, cursor = self.system.get_pending_page(limit=40, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+        self.assertEqual(len({item.id for item in seen}), 250)
+        keys = [(-CATEGORIES.index(item.category), item.confidence) for item in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+        critical = self.system.get_pending_items([PIICategory.CRITICAL], limit=1000)
+        self.assertEqual(len(critical), 63)
+        self.assertTrue(all(item.category == PIICategory.CRITICAL for item in critical))
+
+    def test_category_pages(self):
+        self.system.store.add_items(make_item(i) for i in range(20))
+        first, cursor = self.system.get_items_page(PIICategory.HIGH, limit=3)
+        second, _ = self.system.get_items_page(PIICategory.HIGH, limit=3, cursor=cursor)
+        self.assertEqual([item.id for item in first + second],
+                         ['scan_1', 'scan_5', 'scan_9', 'scan_13', 'scan_17'])
+
+    def test_bulk_action_updates_counters_and_audit(self):
+        self.system.store.add_items(make_item(i, category=PIICategory.CRITICAL) for i in range(10))
+        updated = self.system.bulk_action(['scan_1', 'scan_2', 'scan_2', 'missing'], PIIAction.SUPPRESS, 'dpo')
+        self.assertEqual(updated, 2)
+
+        summary = self.system.get_pii_summary()
+        self.assertEqual(summary['status_breakdown']['suppressed'], 2)
+        self.assertEqual(summary['high_risk_pending'], 8)
+        self.assertAlmostEqual(summary['compliance_coverage'], 20.0)
+
+        trail = self.system.get_audit_trail(item_id='scan_2')
+        self.assertEqual([(entry['action'], entry['previous_status']) for entry in trail], [('suppressed', 'pending')])
+        self.assertEqual(self.system.get_item('scan_2').reviewer, 'dpo')
+
+    def test_audit_trail_is_append_only(self):
+        self.system.store.add_items([make_item(1)])
+        self.system.bulk_action(['scan_1'], PIIAction.APPROVE, 'dpo')
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.system.store._conn().execute("DELETE FROM pii_audit")
+
+    def test_retention_compliance_counts_old_pending_items(self):
+        self.system.store.add_items([make_item(1, days_old=60), make_item(2), make_item(3), make_item(4)])
+        self.assertAlmostEqual(self.system._calculate_retention_compliance(), 75.0)
+
+    def test_scan_extraction_ids_are_stable(self):
+        scan = {'scan_id': 's1', 'timestamp': datetime(2024, 1, 1),
+                'result': {'findings': [{'description': 'Email address found', 'file': 'a.py'},
+                                        {'description': 'Hardcoded timeout'},
+                                        {'description': 'Sensitive medical record'}]}}
+        items = self.system._extract_pii_from_scan(scan)
+        self.assertEqual([item.id for item in items], ['s1_0', 's1_2'])
+        self.assertEqual(self.system.store.add_items(items), 2)
+        self.assertEqual(self.system.store.add_items(self.system._extract_pii_from_scan(scan)), 0)
+        self.assertEqual(self.system.get_item('s1_2').category, PIICategory.CRITICAL)
+
+    def test_inventory_pages_read_indexes_only(self):
+        conn = self.system.store._conn()
+        queries = [
+            "SELECT seq FROM pii_items WHERE category = 'high' AND seq > 10 ORDER BY seq LIMIT 100",
+            "SELECT id FROM pii_items WHERE status = 'pending' AND priority IN (4, 3) "
+            "AND (priority, confidence, seq) < (4, 0.5, 99) ORDER BY priority DESC, confidence DESC, seq DESC LIMIT 100",
+            "SELECT * FROM pii_audit WHERE timestamp >= '2024' AND item_id = 'a' ORDER BY timestamp DESC, seq DESC",
+        ]
+        for query in queries:
+            plan = ' '.join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query))
+            self.assertIn("USING", plan, query)
+            self.assertNotIn("TEMP B-TREE", plan, query)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Redaction Engine Tests
+Checks format-preserving masks, chunk-boundary safety of streaming redaction,
+source offsets in the audit entries, row exports, constant memory over a
+large export and the DSAR and PII management integrations.
+"""
+
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.redaction_engine import RedactionEngine, RedactionManifest, RedactionRule, mask_value
+
+SAMPLE_LINE = "id;jan.jansen@example.nl;4111 1111 1111 1111;+31 6 12345678;123-45-6789;free text\n"
+
+
+def mixed_text(seed):
+    rng = random.Random(seed)
+    parts = []
+    for i in range(2000):
+        parts.append(rng.choice([
+            "x" * rng.randint(0, 40), f"user{i}@example.nl", "4111-1111-1111-1111", "123-45-6789",
+            "\n", " ", f"+31 6 1234567{i % 10}", "NL91 ABNA 0417 1643 00", "111222333", "4111111111111112",
+        ]))
+    return "".join(parts)
+
+
+class GeneratedExport(io.TextIOBase):
+    """Readable export of count lines that is never held in memory"""
+
+    def __init__(self, count):
+        self.remaining = count
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        lines = min(self.remaining, max(1, size // len(SAMPLE_LINE)))
+        self.remaining -= lines
+        return SAMPLE_LINE * lines
+
+
+class DigestSink(io.TextIOBase):
+    """Writable stream that only counts characters"""
+
+    def __init__(self):
+        self.characters = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.characters += len(text)
+        return len(text)
+
+
+class TestMasks(unittest.TestCase):
+    """Format-preserving masks"""
+
+    def test_mask_styles(self):
+        self.assertEqual(mask_value('4111 1111 1111 1234', 'last4'), '**** **** **** 1234')
+        self.assertEqual(mask_value('NL91ABNA0417164300', 'last4'), '**************4300')
+        self.assertEqual(mask_value('jan.jansen@example.nl', 'email'), '**********@example.nl')
+        self.assertEqual(mask_value('123-45-6789', 'full'), '***-**-****')
+        self.assertEqual(mask_value('123-45-6789', 'fixed', '[SSN]'), '[SSN]')
+
+    def test_default_rules(self):
+        engine = RedactionEngine()
+        text = ("Mail jan.jansen@example.nl, card 4111 1111 1111 1111, tel 06-12345678, "
+                "BSN 111222333, order 123456789, card-like 4111 1111 1111 1112")
+        self.assertEqual(engine.redact_text(text),
+                         "Mail **********@example.nl, card **** **** **** 1111, tel **-****5678, "
+                         "BSN *********, order 123456789, card-like 4111 1111 1111 1112")
+
+    def test_rules_are_validated(self):
+        with self.assertRaises(ValueError):
+            RedactionEngine([RedactionRule('x', r'\d+', style='hash')])
+        with self.assertRaises(ValueError):
+            RedactionEngine([RedactionRule('x', r'(?P<n>\d+)')])
+
+
+class TestStreaming(unittest.TestCase):
+    """Chunked redaction of streams and files"""
+
+    def setUp(self):
+        self.engine = RedactionEngine()
+
+    def test_stream_matches_whole_text_at_any_chunk_size(self):
+        for seed in range(3):
+            text = mixed_text(seed)
+            expected = self.engine.redact_text(text)
+            for chunk_size in (1, 7, 64, 4096):
+                sink = io.StringIO()
+                manifest = self.engine.redact_stream(io.StringIO(text), sink, chunk_size=chunk_size)
+                self.assertEqual(sink.getvalue(), expected, (seed, chunk_size))
+                self.assertEqual(manifest.characters, len(text))
+
+    def test_entries_locate_values_in_the_source(self):
+        text = mixed_text(7)
+        entries = io.StringIO()
+        sink = io.StringIO()
+        manifest = self.engine.redact_stream(io.StringIO(text), sink, entries=entries, chunk_size=100)
+        redacted = sink.getvalue()
+        lines = [json.loads(line) for line in entries.getvalue().splitlines()]
+        self.assertEqual(len(lines), manifest.redactions)
+        self.assertEqual(sum(manifest.rule_counts.values()), manifest.redactions)
+        for entry in lines:
+            value = text[entry['start']:entry['end']]
+            self.assertEqual(redacted[entry['start']:entry['end']], self.engine.redact_text(value))
+            self.assertNotEqual(redacted[entry['start']:entry['end']], value)
+            self.assertEqual(entry['line'], text.count('\n', 0, entry['start']) + 1)
+        self.assertNotIn('example.nl', entries.getvalue())
+
+    def test_file_round_trip_keeps_undecodable_bytes(self):
+        directory = tempfile.mkdtemp(prefix="redaction_test_")
+        self.addCleanup(shutil.rmtree, directory, True)
+        source = os.path.join(directory, "export.csv")
+        with open(source, 'wb') as f:
+            f.write(b"name;email\r\nJan;jan@example.nl\r\n\xff\xfe;123-45-6789\r\n")
+        target = os.path.join(directory, "export.redacted.csv")
+        audit = os.path.join(directory, "export.manifest.jsonl")
+
+        manifest = self.engine.redact_file(source, target, entries_path=audit, chunk_size=8)
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b"name;email\r\nJan;***@example.nl\r\n\xff\xfe;***-**-****\r\n")
+        self.assertEqual(manifest.rule_counts, {'email': 1, 'ssn': 1})
+        self.assertEqual(manifest.entries_path, audit)
+        with open(audit) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_row_export(self):
+        manifest = RedactionManifest(source='crm.customers')
+        rows = [(1, 'Jan', 'jan@example.nl'), (2, None, 'call 06-12345678')]
+        entries = io.StringIO()
+        redacted = list(self.engine.redact_rows(iter(rows), manifest, entries=entries))
+        self.assertEqual(redacted, [(1, 'Jan', '***@example.nl'), (2, None, 'call **-****5678')])
+        self.assertEqual(json.loads(entries.getvalue().splitlines()[1]),
+                         {'rule': 'phone', 'start': 5, 'end': 16, 'row': 1, 'column': 2})
+        self.assertIsNotNone(manifest.output_sha256)
+
+    def test_large_export_in_constant_memory(self):
+        lines = 50_000  # ~4 MB of dense PII, several times the peak allowed below
+        tracemalloc.start()
+        try:
+            manifest = self.engine.redact_stream(GeneratedExport(lines), DigestSink(), chunk_size=64 * 1024)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(manifest.characters, lines * len(SAMPLE_LINE))
+        self.assertEqual(manifest.redactions, lines * 4)
+        self.assertLess(peak, 1024 * 1024)
+
+
+class TestIntegrations(unittest.TestCase):
+    """PII management and DSAR erasure use the engine"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="redaction_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_masking_rules_run_in_one_pass(self):
+        from services.pii_management_system import PIIManagementSystem
+        system = PIIManagementSystem(data_dir=self.directory)
+        self.assertEqual(system.apply_masking_rules("ssn 123-45-6789, mail a.b@example.com, tel 555-123-4567"),
+                         "ssn ***-**-****, mail ***@example.com, tel ***-***-4567")
+
+    def test_erasure_task_redacts_export(self):
+        from services.dsar_automation import DSARAutomationEngine, DSARStatus, DSARType
+        from services.subject_index import SubjectIndex
+        index = SubjectIndex(os.path.join(self.directory, "subjects.db"), key=b'test-key')
+        engine = DSARAutomationEngine(organization_id='org1', subject_index=index)
+        request = engine.submit_dsar_request(DSARType.ERASURE, 'jan@example.nl', {})
+        engine._initiate_data_discovery(request.request_id)
+        engine._prepare_data_erasure(request.request_id)
+        task = request.redaction_tasks[0]
+
+        source = os.path.join(self.directory, "export.txt")
+        with open(source, 'w') as f:
+            f.write("jan@example.nl bought with 4111 1111 1111 1111\n")
+        target = os.path.join(self.directory, "export.redacted.txt")
+        manifest = engine.redact_export(request.request_id, task.task_id, source, target)
+
+        self.assertEqual(manifest.redactions, 2)
+        self.assertEqual(task.status, "completed")
+        self.assertEqual(task.redacted_fields, ['credit_card', 'email'])
+        self.assertEqual(request.communication_log[-1]['type'], 'export_redacted')
+        if len(request.redaction_tasks) == 1:
+            self.assertEqual(request.status, DSARStatus.REDACTION_COMPLETE)
+        with open(target) as f:
+            self.assertEqual(f.read(), "***@example.nl bought with **** **** **** 1111\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Redis Cache Tests
+Checks the bounded in-process tier, pipelined batch operations, single-flight
+get_or_set and per-namespace statistics. Redis itself is replaced by a small
+in-memory client recording the commands it receives.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.redis_cache import LocalCacheTier, RedisCache
+
+
+class RecordingRedis:
+    """Dict-backed stand-in for the redis client methods the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append('GET')
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.commands.append('MGET')
+        return [self.data.get(k) for k in keys]
+
+    def set(self, key, value, ex=None):
+        self.commands.append('SET')
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys):
+        self.commands.append('DEL')
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.queued = []
+
+            def set(self, key, value, ex=None):
+                self.queued.append((key, value))
+
+            def execute(self):
+                client.commands.append(f'PIPELINE:{len(self.queued)}')
+                for key, value in self.queued:
+                    client.data[key] = value
+                return [True] * len(self.queued)
+
+        return Pipeline()
+
+
+class TestLocalCacheTier(unittest.TestCase):
+    """Bounds and expiry of the in-process tier"""
+
+    def test_lru_eviction_by_entries(self):
+        removed = []
+        tier = LocalCacheTier(max_entries=2, max_bytes=10 ** 6,
+                              on_remove=lambda ns, reason: removed.append(reason))
+        tier.set('a', b'1', 60, 'ns')
+        tier.set('b', b'2', 60, 'ns')
+        tier.get('a')
+        tier.set('c', b'3', 60, 'ns')
+        self.assertEqual(tier.get('b'), None)
+        self.assertEqual(tier.get('a'), b'1')
+        self.assertEqual(removed, ['evictions'])
+
+    def test_byte_bound(self):
+        tier = LocalCacheTier(max_entries=100, max_bytes=1000)
+        for i in range(20):
+            tier.set(f'k{i}', b'x' * 200, 60, 'ns')
+        self.assertLessEqual(tier.nbytes, 1000)
+        self.assertFalse(tier.set('huge', b'x' * 2000, 60, 'ns'))
+
+    def test_expiry(self):
+        tier = LocalCacheTier()
+        tier.set('short', b'1', 0.01, 'ns')
+        tier.set('long', b'2', 60, 'ns')
+        time.sleep(0.02)
+        self.assertIsNone(tier.get('short'))
+        self.assertEqual(tier.get('long'), b'2')
+        self.assertEqual(len(tier), 1)
+
+    def test_replaced_entries_do_not_grow_heap(self):
+        tier = LocalCacheTier()
+        for _ in range(10000):
+            tier.set('same', b'1', 60, 'ns')
+        self.assertLess(len(tier._deadlines), 200)
+
+
+class TestRedisCache(unittest.TestCase):
+    """Two-tier behaviour of RedisCache"""
+
+    def setUp(self):
+        self.cache = RedisCache(auto_connect=False)
+        self.redis = RecordingRedis()
+        self.cache.redis_client = self.redis
+
+    def test_round_trip_complex_types(self):
+        value = {'when': datetime(2024, 1, 2, 3, 4), 'amount': Decimal('1.50'),
+                 'tags': {'a'}, 'raw': b'\x00\x01'}
+        self.cache.set('k', value)
+        self.assertEqual(self.cache.get('k'), value)
+        # Read through Redis once L1 no longer has it
+        self.cache._local.delete('dg:k')
+        self.assertEqual(self.cache.get('k'), value)
+
+    def test_l1_serves_repeat_reads(self):
+        self.cache.set('k', {'x': 1})
+        for _ in range(5):
+            self.assertEqual(self.cache.get('k'), {'x': 1})
+        self.assertNotIn('GET', self.redis.commands)
+
+    def test_batches_use_one_round_trip(self):
+        self.cache.set_many({f'k{i}': i for i in range(50)}, namespace='scan_results')
+        self.assertEqual(self.redis.commands, ['PIPELINE:50'])
+        self.cache._local.clear_namespace('scan_results')
+        found = self.cache.get_many([f'k{i}' for i in range(60)], namespace='scan_results')
+        self.assertEqual(len(found), 50)
+        self.assertEqual(self.redis.commands[1:], ['MGET'])
+
+    def test_namespace_stats(self):
+        self.cache.set('a', 1, namespace='sessions')
+        self.cache.get('a', namespace='sessions')
+        self.cache.get('missing', namespace='sessions')
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['namespaces']['sessions']['hits'], 1)
+        self.assertEqual(stats['namespaces']['sessions']['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_delete_removes_both_tiers(self):
+        self.cache.set('k', 1)
+        self.assertTrue(self.cache.delete('k'))
+        self.assertIsNone(self.cache.get('k'))
+
+    def test_get_or_set_single_flight(self):
+        calls = []
+
+        def generate():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'value': 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_set('k', generate)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'value': 42}] * 8)
+
+    def test_get_or_set_error_clears_inflight(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_set('k', fail)
+        self.assertEqual(self.cache._inflight, {})
+
+
+class TestWithoutRedis(unittest.TestCase):
+    """In-memory only operation"""
+
+    def test_l1_keeps_full_ttl_without_redis(self):
+        cache = RedisCache(l1_ttl=0, auto_connect=False)
+        cache.set('k', [1, 2, 3], ttl=60)
+        self.assertEqual(cache.get('k'), [1, 2, 3])
+        self.assertFalse(cache.get_stats()['connected'])
+
+
+if __name__ == '__main__':
+    unittest.main()
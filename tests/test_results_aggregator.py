@@ -0,0 +1,67 @@
+"""
+Results Aggregator Tests
+The aggregator is shared by every session in the process: a database error
+in one call falls back to file storage for that call only, and the next
+call goes to the database again.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from services import results_aggregator
+    RESULTS_AGGREGATOR_AVAILABLE = True
+except ImportError:
+    RESULTS_AGGREGATOR_AVAILABLE = False
+
+
+@unittest.skipUnless(RESULTS_AGGREGATOR_AVAILABLE, "psycopg2 not installed")
+class TestStorageMode(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(results_aggregator, 'get_encryption_service'),
+            mock.patch.object(results_aggregator, '_get_cached_multi_tenant_service'),
+            mock.patch.object(results_aggregator.ResultsAggregator, '_init_db'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.aggregator = results_aggregator.ResultsAggregator(db_url='postgresql://unused')
+        self.connect = mock.patch.object(self.aggregator, '_get_secure_connection',
+                                         side_effect=RuntimeError("connection reset")).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_database_error_does_not_change_the_next_call(self):
+        with mock.patch.object(self.aggregator, '_get_scan_by_id_file', return_value=None) as from_file:
+            self.assertIsNone(self.aggregator.get_scan_by_id('scan_1'))
+            self.assertFalse(self.aggregator.use_file_storage)
+            self.aggregator.get_scan_by_id('scan_2')
+        self.assertEqual(self.connect.call_count, 2)
+        self.assertEqual(from_file.call_count, 2)
+
+    def test_every_fallback_leaves_the_storage_mode(self):
+        calls = [
+            ('_get_user_scans_file', lambda: self.aggregator.get_user_scans('alice')),
+            ('_get_recent_scans_file', lambda: self.aggregator.get_recent_scans(username='alice')),
+            ('_log_user_action_file', lambda: self.aggregator.log_audit_event('alice', 'login')),
+            ('_store_compliance_score_file',
+             lambda: self.aggregator.store_compliance_score('alice', 'repo', 'scan_1', 80, {})),
+            ('_get_user_compliance_history_file',
+             lambda: self.aggregator.get_user_compliance_history('alice')),
+        ]
+        for fallback, call in calls:
+            with self.subTest(fallback=fallback), \
+                    mock.patch.object(self.aggregator, fallback, return_value=[]) as from_file:
+                call()
+                self.assertEqual(from_file.call_count, 1)
+                self.assertFalse(self.aggregator.use_file_storage)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+"""
+Compiled Rule Engine Tests
+Keyword extraction from rule patterns, the keyword automaton, segment-local
+matching, and answers identical to the re module for every rule of the
+registered regulatory validators.
+"""
+
+import os
+import random
+import re
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import utils.complete_gdpr_99_validator as complete_gdpr
+import utils.cloud_provider_eu_compliance as cloud_provider
+import utils.comprehensive_gdpr_validator as comprehensive_gdpr
+import utils.copyright_compliance_detector as copyright_detector
+import utils.enhanced_breach_response as breach_response
+import utils.eu_ai_act_compliance as ai_act
+import utils.netherlands_uavg_compliance as uavg
+import utils.privacy_enhancing_tech_validator as pet_validator
+import utils.real_time_compliance_monitor as compliance_monitor
+from utils.rule_engine import (LARGE_DOCUMENT_LENGTH, WORD_START, KeywordAutomaton, RuleEngine, compile_rules,
+                               fold_case, get_rule_engine, leading_literal, pattern_keywords, segment_separator,
+                               split_alternatives, table_patterns)
+
+FILLER = ("The quarterly report lists revenue per region and the roadmap for the next release. "
+          "Engineering estimates are reviewed every sprint by the product owners.\n")
+
+SNIPPETS = [
+    "We process personal data of data subjects based on consent.",
+    "The controller appoints a data protection officer (DPO) under Article 37.",
+    "Our machine learning model uses training data; human oversight applies.",
+    "Transfers to the United States rely on standard contractual clauses.",
+    "BSN 111222333 is processed only where required by law.",
+    "Cookies are used for analytics after consent, retention period two years.",
+    "Binding corporate rules cover intra-group\ntransfers to India.",
+    "Emotion recognition in the workplace and social scoring are prohibited.",
+    "Copyright (c) 2024 by Example Corp. All rights reserved.",
+    "Large language model (LLM) training\ndata sources are documented.",
+    "Autoriteit Persoonsgegevens guidance, AP guidelines 2024.",
+    "Real-time biometric identification in public spaces.",
+    "İstanbul office; ſecurity measures; KELVIN-scale logging of incidents.",
+]
+
+
+def make_document(rng, filler_lines, snippets):
+    lines = [FILLER] * filler_lines
+    for snippet in rng.sample(SNIPPETS, snippets):
+        lines.insert(rng.randrange(len(lines) + 1), snippet + '\n')
+    return ''.join(lines)
+
+
+class PlainRe:
+    """The re calls the validators made before the engine"""
+
+    patterns = set()
+
+    @staticmethod
+    def search(pattern, content, flags=re.IGNORECASE):
+        PlainRe.patterns.add(pattern)
+        return re.search(pattern, content, flags)
+
+    @staticmethod
+    def finditer(pattern, content, flags=re.IGNORECASE):
+        PlainRe.patterns.add(pattern)
+        return re.finditer(pattern, content, flags)
+
+    @staticmethod
+    def findall(pattern, content, flags=re.IGNORECASE):
+        PlainRe.patterns.add(pattern)
+        return re.findall(pattern, content, flags)
+
+
+def match_tuple(match):
+    return None if match is None else (match.span(), match.groups())
+
+
+class TestPatternKeywords(unittest.TestCase):
+    """Keywords a rule's matches must contain"""
+
+    def test_sequence_and_alternation(self):
+        self.assertEqual(pattern_keywords(r"\bdata\s+subject\b"),
+                         [frozenset({WORD_START + 'data', WORD_START + 'subject'})])
+        requirement = pattern_keywords(r"consent|lawful\s+basis")
+        self.assertCountEqual(requirement, [frozenset({'consent'}), frozenset({'lawful', WORD_START + 'basis'})])
+
+    def test_factored_prefix_is_restored(self):
+        # The parser turns binding...|bcr into b(?:inding...|cr)
+        requirement = pattern_keywords(r"\b(?:binding.*corporate.*rules|bcr)\b")
+        self.assertCountEqual(requirement, [frozenset({WORD_START + 'binding', 'corporate', 'rules'}),
+                                            frozenset({WORD_START + 'bcr'})])
+
+    def test_optional_parts_require_nothing(self):
+        self.assertEqual(pattern_keywords(r"(?:personal\s+)?data"), [frozenset({'data'})])
+        self.assertIsNone(pattern_keywords(r"\d{9}"))
+        self.assertIsNone(pattern_keywords(r"(?:gdpr)?"))
+
+    def test_segment_separator(self):
+        self.assertEqual(segment_separator(r"\bdata.*processing\b", re.IGNORECASE), '\n')
+        self.assertEqual(segment_separator(r"training\s+data"), '.')
+        self.assertEqual(segment_separator(r"(?!.*report)\berror"), '\n')
+        self.assertIsNone(segment_separator(r"re.*identification\s+risk"))
+        self.assertIsNone(segment_separator(r"privacy$"))
+        self.assertIsNone(segment_separator(r"(?s)a.b"))
+        self.assertIsNone(segment_separator(r"data(?=.*\s+controller)"))
+        self.assertEqual(segment_separator(r"data(?=\s+controller)"), '.')
+
+    def test_split_alternatives(self):
+        self.assertEqual(split_alternatives(r"consent|lawful\s+basis"), ["consent", r"lawful\s+basis"])
+        self.assertEqual(split_alternatives(r"\b(?:pre.*contractual\s+measures|contract)\b"),
+                         [r"\b(?:pre.*contractual\s+measures)\b", r"\b(?:contract)\b"])
+        self.assertEqual(split_alternatives(r"ai\s+(system|model)s?"), [r"ai\s+(?:system)s?", r"ai\s+(?:model)s?"])
+        self.assertEqual(split_alternatives(r"[|(]x(?:a|b)"), [r"[|(]x(?:a)", r"[|(]x(?:b)"])
+        self.assertIsNone(split_alternatives(r"(?:a|b)+c"))
+        self.assertIsNone(split_alternatives(r"(a|b)\1"))
+        self.assertIsNone(split_alternatives(r"(?i)a|b"))
+        self.assertIsNone(split_alternatives(r"(?=a|b)c"))
+        self.assertIsNone(split_alternatives(r"data\s+subject"))
+
+    def test_leading_literal(self):
+        self.assertEqual(leading_literal(r"\b(?:Pre.*contractual\s+measures)\b"), 'pre')
+        self.assertEqual(leading_literal(r"(data)\s+breach"), 'data')
+        self.assertIsNone(leading_literal(r"\s*data"))
+        self.assertIsNone(leading_literal(r"(?:a|b)data"))
+        self.assertIsNone(leading_literal(r"x\d+"))
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """Keywords found in a case-folded document"""
+
+    def test_prefixes_and_word_starts(self):
+        automaton = KeywordAutomaton(['data', 'dat', WORD_START + 'ai', 'ai', 'rmation', 'data protection'])
+        found = automaton.find(fold_case("Metadata and INFORMATION about the data\nprotection officer"))
+        self.assertEqual(found, {'data', 'dat', 'rmation'})
+        found = automaton.find(fold_case("AI systems (ai) and data protection"))
+        self.assertEqual(found, {'data', 'dat', 'ai', WORD_START + 'ai', 'data protection'})
+
+    def test_ignorecase_folding(self):
+        automaton = KeywordAutomaton(['istanbul', 'security', 'kelvin'])
+        self.assertEqual(automaton.find(fold_case("İSTANBUL ſecurity Kelvin")), {'istanbul', 'security', 'kelvin'})
+        self.assertTrue(re.search('istanbul', "İSTANBUL", re.IGNORECASE))
+
+    def test_compiled_rules_are_cached_per_version(self):
+        first = compile_rules([r"\bgdpr\b", r"consent"])
+        self.assertIs(compile_rules([r"consent", r"\bgdpr\b"]), first)
+        self.assertIsNot(compile_rules([r"consent"]), first)
+
+
+class TestRuleEngineEquivalence(unittest.TestCase):
+    """Every rule of the validators answers exactly as re does"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_rule_engine()
+        cls.patterns = sorted(cls.engine.compiled().requirements)
+        rng = random.Random(7)
+        both = (re.IGNORECASE, re.IGNORECASE | re.MULTILINE)
+        cls.documents = [
+            (make_document(rng, 2, 4), both),
+            (make_document(rng, 0, len(SNIPPETS)), both),
+            (make_document(rng, 600, 5), (re.IGNORECASE,)),  # large and sparse: token index, anchored rules
+            ("Dit document beschrijft onze werkwijze.", both),
+        ]
+
+    def test_validator_rules_registered(self):
+        self.assertGreater(len(self.patterns), 500)
+        self.assertEqual(table_patterns(ai_act.ACCOUNTABILITY_PATTERNS) - set(self.patterns), set())
+        self.assertIn(uavg.RESIDENCY_DATA_PATTERN, self.patterns)
+
+    def test_search_finditer_findall(self):
+        for document, flag_sets in self.documents:
+            for pattern in self.patterns:
+                for flags in flag_sets:
+                    with self.subTest(pattern=pattern, flags=flags, length=len(document)):
+                        self.assertEqual(match_tuple(self.engine.search(pattern, document, flags)),
+                                         match_tuple(re.search(pattern, document, flags)))
+                        self.assertEqual([match_tuple(m) for m in self.engine.finditer(pattern, document, flags)],
+                                         [match_tuple(m) for m in re.finditer(pattern, document, flags)])
+                        self.assertEqual(self.engine.findall(pattern, document, flags),
+                                         re.findall(pattern, document, flags))
+
+    def test_documents_cover_every_strategy(self):
+        compiled = self.engine.compiled()
+        rules = [compiled.rule(pattern, re.IGNORECASE) for pattern in self.patterns]
+        self.assertTrue(any(rule.parts for rule in rules))
+        self.assertTrue(any(rule.anchor for rule in rules))
+        self.assertGreaterEqual(len(self.documents[2][0]), LARGE_DOCUMENT_LENGTH)
+
+    def test_unknown_patterns_fall_back_to_re(self):
+        engine = RuleEngine()
+        self.assertEqual(engine.findall(r"\d{3}", "a 123 b 456"), ['123', '456'])
+        self.assertIsNone(engine.search(r"gdpr", "no match here"))
+
+    def test_most_rules_skipped_on_unrelated_text(self):
+        scan = self.engine.scan(FILLER * 200)
+        compiled = self.engine.compiled()
+        possible = sum(scan.possible(requirement) for requirement in compiled.requirements.values())
+        self.assertLess(possible, len(compiled.requirements) * 0.2)
+
+
+class TestValidatorVerdicts(unittest.TestCase):
+    """Validators report the same findings through the engine as through re"""
+
+    @staticmethod
+    def clean(value):
+        # Findings carry the time they were made
+        if isinstance(value, dict):
+            return {key: TestValidatorVerdicts.clean(item) for key, item in value.items()
+                    if 'date' not in key and 'timestamp' not in key}
+        if isinstance(value, list):
+            return [TestValidatorVerdicts.clean(item) for item in value]
+        if isinstance(value, str):
+            return re.sub(r'\d{8,}|\d{4}-\d\d-\d\dT[\d:.]+', '<time>', value)
+        return value
+
+    def test_same_findings(self):
+        rng = random.Random(11)
+        document = make_document(rng, 300, len(SNIPPETS))
+        validators = [
+            (comprehensive_gdpr, lambda: comprehensive_gdpr.validate_comprehensive_gdpr_compliance(document)),
+            (ai_act, lambda: ai_act.detect_ai_act_violations(document)),
+            (uavg, lambda: uavg.detect_uavg_compliance_gaps(document)),
+            (complete_gdpr, lambda: complete_gdpr.validate_complete_gdpr_compliance(document)),
+            (cloud_provider, lambda: cloud_provider.CloudProviderEUComplianceValidator().detect_cloud_provider_usage(document)),
+            (copyright_detector, lambda: copyright_detector.CopyrightComplianceDetector().detect_copyright_violations(document)),
+            (pet_validator, lambda: pet_validator.PrivacyEnhancingTechValidator().validate_privacy_technologies(document)),
+            (compliance_monitor, lambda: compliance_monitor.RealTimeComplianceMonitor().perform_real_time_assessment(document)),
+        ]
+        modules = [complete_gdpr, comprehensive_gdpr, ai_act, uavg, cloud_provider, copyright_detector,
+                   pet_validator, compliance_monitor, breach_response]
+        for module, validate in validators:
+            with self.subTest(validator=module.__name__):
+                expected_rules = [m._RULES for m in modules]
+                for m in modules:
+                    m._RULES = PlainRe
+                try:
+                    expected = self.clean(validate())
+                finally:
+                    for m, rules in zip(modules, expected_rules):
+                        m._RULES = rules
+                self.assertEqual(self.clean(validate()), expected)
+        # Every rule the validators ran is in a registered table
+        self.assertEqual(PlainRe.patterns - set(get_rule_engine().compiled().requirements), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,333 @@
+"""
+Salesforce Bulk API Tests
+Runs SalesforceConnector against a local mock org with millions of synthetic
+records: Bulk API 2.0 query jobs with streamed CSV pages, REST fallback with
+nextRecordsUrl, parallel objects under a shared API budget, SystemModstamp
+watermarks and column-wise classification.
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from services.salesforce_bulk import ApiBudgetExceeded, ApiBudgetGovernor, BulkQueryError, WatermarkStore
+    from services.salesforce_connector import SalesforceConfig, SalesforceConnector
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+API = '/services/data/v58.0'
+OLD_STAMP = '2024-01-01T00:00:00.000Z'
+NEW_STAMP = '2025-06-01T12:00:00.000Z'
+QUERY = re.compile(r"SELECT (.+) FROM (\w+)(?: WHERE SystemModstamp > (\S+))?(?: ORDER BY SystemModstamp)?"
+                   r"(?: LIMIT (\d+))?$")
+REST_PAGE = 20
+
+FIELDS = [
+    {'name': 'Id', 'label': 'Contact ID', 'type': 'id'},
+    {'name': 'Name', 'label': 'Full Name', 'type': 'string'},
+    {'name': 'Email', 'label': 'Email', 'type': 'email'},
+    {'name': 'Phone', 'label': 'Business Phone', 'type': 'phone'},
+    {'name': 'MailingStreet', 'label': 'Mailing Street', 'type': 'textarea'},
+    {'name': 'SystemModstamp', 'label': 'System Modstamp', 'type': 'datetime'},
+]
+
+
+def record(index, stamp):
+    """Synthetic record: every other one has an email, every one a phone"""
+    return {
+        'Id': f'003{index:015d}',
+        'Email': f'person{index}@example.com' if index % 2 == 0 else '',
+        'Phone': f'+31 6 {index % 100000000:08d}',
+        'MailingStreet': f'Main Street {index}, Apt "{index % 7}"\nAmsterdam',
+        'SystemModstamp': stamp,
+    }
+
+
+# CSV cell templates per column, formatted once per row by the mock
+CSV_CELLS = {
+    'Id': '003{i:015d}',
+    'Email': '{email}',
+    'Phone': '+31 6 {phone:08d}',
+    'MailingStreet': '"Main Street {i}, Apt ""{apt}""\nAmsterdam"',
+    'SystemModstamp': '{stamp}',
+}
+
+
+def csv_lines(indexes, columns, stamp_of):
+    template = ','.join(CSV_CELLS[column] for column in columns)
+    return [template.format(i=i, email=f'person{i}@example.com' if i % 2 == 0 else '',
+                            phone=i % 100000000, apt=i % 7, stamp=stamp_of(i)) for i in indexes]
+
+
+class MockSalesforce(BaseHTTPRequestHandler):
+    """OAuth, describe, limits, Bulk API 2.0 query jobs and REST query paging"""
+
+    protocol_version = 'HTTP/1.1'
+    records = {}            # object -> record count
+    touched = {}            # object -> indexes modified after OLD_STAMP
+    bulk_unsupported = set()
+    failing_pages = set()   # nextRecordsUrl offsets answered with an error
+    jobs = {}
+    calls = []
+    daily_remaining = 100000
+    expire_token = False
+    tokens_issued = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, headers=None, body=None, content_type='application/json'):
+        if body is None:
+            body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        with MockSalesforce.lock:
+            if MockSalesforce.expire_token:
+                MockSalesforce.expire_token = False
+                return False
+        return self.headers.get('Authorization', '').startswith('Bearer tok-')
+
+    def _indexes(self, job):
+        if job['since']:
+            return sorted(i for i in self.touched.get(job['object'], ()) if NEW_STAMP > job['since'])
+        count = self.records[job['object']]
+        return range(min(count, job['limit'])) if job['limit'] else range(count)
+
+    def _stamp(self, object_name, index):
+        return NEW_STAMP if index in self.touched.get(object_name, ()) else OLD_STAMP
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if url.path == '/services/oauth2/token':
+            with MockSalesforce.lock:
+                MockSalesforce.tokens_issued += 1
+                token = f'tok-{MockSalesforce.tokens_issued}'
+            return self._send(200, {'access_token': token, 'id': 'user',
+                                    'instance_url': f"http://{self.headers['Host']}"})
+        MockSalesforce.calls.append(('POST', url.path))
+        if not self._authorized():
+            return self._send(401, [{'errorCode': 'INVALID_SESSION_ID'}])
+        if url.path == f'{API}/jobs/query':
+            request = json.loads(body)
+            columns, object_name, since, limit = QUERY.match(request['query']).groups()
+            if object_name in self.bulk_unsupported:
+                return self._send(400, [{'errorCode': 'INVALIDENTITY',
+                                         'message': f"Entity '{object_name}' is not supported by the Bulk API."}])
+            with MockSalesforce.lock:
+                job_id = f'750{len(MockSalesforce.jobs):015d}'
+                MockSalesforce.jobs[job_id] = {'object': object_name, 'columns': columns.split(', '),
+                                               'query': request['query'],
+                                               'since': since, 'limit': int(limit) if limit else None, 'polls': 0}
+            return self._send(200, {'id': job_id, 'state': 'UploadComplete'})
+        return self._send(404, [])
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        MockSalesforce.calls.append(('GET', url.path))
+        if not self._authorized():
+            return self._send(401, [{'errorCode': 'INVALID_SESSION_ID'}])
+        parts = url.path[len(API) + 1:].split('/')
+        if parts == ['limits']:
+            return self._send(200, {'DailyApiRequests': {'Max': 100000, 'Remaining': self.daily_remaining}})
+        if parts[0] == 'sobjects' and parts[-1] == 'describe':
+            return self._send(200, {'fields': FIELDS})
+        if parts[:2] == ['jobs', 'query'] and len(parts) == 3:
+            job = self.jobs[parts[2]]
+            job['polls'] += 1
+            state = 'InProgress' if job['polls'] == 1 else 'JobComplete'
+            return self._send(200, {'id': parts[2], 'state': state,
+                                    'numberRecordsProcessed': len(self._indexes(job))})
+        if parts[:2] == ['jobs', 'query'] and parts[3:] == ['results']:
+            job = self.jobs[parts[2]]
+            indexes = self._indexes(job)
+            start = int(query.get('locator', ['0'])[0])
+            end = min(len(indexes), start + int(query['maxRecords'][0]))
+            lines = [','.join(job['columns'])]
+            lines += csv_lines(indexes[start:end], job['columns'], lambda i: self._stamp(job['object'], i))
+            locator = str(end) if end < len(indexes) else 'null'
+            return self._send(200, body=('\n'.join(lines) + '\n').encode(), content_type='text/csv',
+                              headers={'Sforce-Locator': locator, 'Sforce-NumberOfRecords': str(end - start)})
+        if parts[0] == 'query':
+            # First page for ?q=..., later pages at nextRecordsUrl .../query/<object>-<offset>
+            if len(parts) == 1:
+                object_name, start = QUERY.match(query['q'][0]).group(2), 0
+            else:
+                object_name, start = parts[1].rsplit('-', 1)
+                start = int(start)
+                if start in self.failing_pages:
+                    return self._send(500, [{'errorCode': 'SERVER_UNAVAILABLE'}])
+            count = self.records[object_name]
+            end = min(count, start + REST_PAGE)
+            payload = {'totalSize': count, 'done': end >= count,
+                       'records': [{key: value or None for key, value in record(i, OLD_STAMP).items()}
+                                   for i in range(start, end)]}
+            if end < count:
+                payload['nextRecordsUrl'] = f"{API}/query/{object_name}-{end}"
+            return self._send(200, payload)
+        return self._send(404, [])
+
+
+@unittest.skipUnless(REQUESTS_AVAILABLE, "requests not installed")
+class TestSalesforceBulkScan(unittest.TestCase):
+    """SalesforceConnector against the mock org"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockSalesforce)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.previous_login_url = os.environ.get('DG_SALESFORCE_LOGIN_URL')
+        os.environ['DG_SALESFORCE_LOGIN_URL'] = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        if cls.previous_login_url is None:
+            os.environ.pop('DG_SALESFORCE_LOGIN_URL', None)
+        else:
+            os.environ['DG_SALESFORCE_LOGIN_URL'] = cls.previous_login_url
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="salesforce_test_")
+        MockSalesforce.records = {'Contact': 1000, 'Lead': 500, 'Task': 45}
+        MockSalesforce.touched = {}
+        MockSalesforce.bulk_unsupported = {'Task'}
+        MockSalesforce.failing_pages = set()
+        MockSalesforce.jobs = {}
+        MockSalesforce.calls = []
+        MockSalesforce.daily_remaining = 100000
+        MockSalesforce.expire_token = False
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def connector(self, governor=None):
+        connector = SalesforceConnector(
+            SalesforceConfig('client', 'secret', 'user@example.com', 'pw', 'token'),
+            governor=governor, watermarks=WatermarkStore(os.path.join(self.directory, 'marks.json')))
+        connector.bulk_client.poll_interval = 0.01
+        connector.bulk_client.page_records = 300
+        return connector
+
+    def test_bulk_scan_reads_every_record(self):
+        result = self.connector().scan_object_data('Contact')
+        self.assertEqual(result['query_mode'], 'bulk')
+        self.assertEqual(result['records_scanned'], 1000)
+        self.assertEqual(result['field_summary']['Email']['matches'], 500)
+        self.assertEqual(result['field_summary']['Phone']['types'], {'Phone Number': 1000})
+        self.assertNotIn('MailingStreet', result['field_summary'])
+        self.assertEqual(result['pii_found'], 1500)
+        self.assertEqual(len([f for f in result['findings'] if f['field'] == 'Email']), 5)
+        self.assertEqual(result['findings'][0]['record_id'], '003000000000000000')
+        self.assertEqual(result['findings'][0]['value_sample'], 'pe***@example.com')
+        pages = [call for call in MockSalesforce.calls if call[1].endswith('/results')]
+        self.assertEqual(len(pages), 4)
+
+    def test_unsupported_object_falls_back_to_rest_paging(self):
+        result = self.connector().scan_object_data('Task')
+        self.assertEqual(result['query_mode'], 'rest')
+        self.assertEqual(result['records_scanned'], 45)
+        self.assertEqual(result['field_summary']['Phone']['matches'], 45)
+
+    def test_failed_rest_page_raises_and_keeps_watermark(self):
+        connector = self.connector()
+        MockSalesforce.failing_pages = {REST_PAGE}
+        with self.assertRaises(BulkQueryError):
+            connector.scan_object_data('Task', incremental=True)
+        self.assertIsNone(connector.watermarks.get(connector.instance_url, 'Task'))
+        self.assertIn('error', connector.scan_objects(['Task'], incremental=True)[0])
+
+        MockSalesforce.failing_pages = set()
+        self.assertEqual(connector.scan_object_data('Task', incremental=True)['records_scanned'], 45)
+        self.assertEqual(connector.watermarks.get(connector.instance_url, 'Task'), OLD_STAMP)
+
+    def test_incremental_query_ordered_by_watermark(self):
+        connector = self.connector()
+        connector.scan_object_data('Contact', incremental=True)
+        MockSalesforce.touched = {'Contact': {3}}
+        connector.scan_object_data('Contact', incremental=True)
+        queries = [job['query'] for job in MockSalesforce.jobs.values()]
+        self.assertEqual(len(queries), 2)
+        for query in queries:
+            self.assertTrue(query.endswith(' ORDER BY SystemModstamp'), query)
+
+    def test_incremental_rescan_reads_modified_records_only(self):
+        connector = self.connector()
+        first = connector.scan_object_data('Contact', incremental=True)
+        self.assertFalse(first['incremental'])
+        self.assertEqual(first['watermark'], OLD_STAMP)
+
+        MockSalesforce.touched = {'Contact': {3, 10, 999}}
+        second = connector.scan_object_data('Contact', incremental=True)
+        self.assertTrue(second['incremental'])
+        self.assertEqual(second['records_scanned'], 3)
+        self.assertEqual(second['field_summary']['Email']['matches'], 1)
+        self.assertEqual(second['watermark'], NEW_STAMP)
+
+        third = connector.scan_object_data('Contact', incremental=True)
+        self.assertEqual(third['records_scanned'], 0)
+        self.assertEqual(connector.watermarks.get(connector.instance_url, 'Contact'), NEW_STAMP)
+
+    def test_limited_scan_keeps_watermark(self):
+        connector = self.connector()
+        result = connector.scan_object_data('Contact', limit=10, incremental=True)
+        self.assertEqual(result['records_scanned'], 10)
+        self.assertIsNone(connector.watermarks.get(connector.instance_url, 'Contact'))
+
+    def test_parallel_objects_share_the_budget(self):
+        MockSalesforce.daily_remaining = 20000 + 9  # 20% of the daily max stays reserved
+        connector = self.connector(ApiBudgetGovernor(max_concurrent=2))
+        results = connector.scan_objects(['Contact', 'Lead', 'Task'])
+        self.assertEqual([result['object_name'] for result in results], ['Contact', 'Lead', 'Task'])
+        self.assertTrue(any('error' in result for result in results))
+        self.assertEqual(connector.governor.remaining, 0)
+        self.assertEqual(connector.governor.used, len(MockSalesforce.calls))
+
+    def test_budget_exhaustion_raises(self):
+        governor = ApiBudgetGovernor(max_calls=1)
+        with governor.call():
+            pass
+        with self.assertRaises(ApiBudgetExceeded):
+            with governor.call():
+                pass
+
+    def test_expired_token_is_refreshed(self):
+        connector = self.connector()
+        MockSalesforce.expire_token = True
+        self.assertEqual(connector.scan_object_data('Lead')['records_scanned'], 500)
+        self.assertEqual(connector.access_token, f'tok-{MockSalesforce.tokens_issued}')
+
+    def test_millions_of_records_in_parallel(self):
+        MockSalesforce.records = {'Contact': 1_200_000, 'Lead': 800_000}
+        connector = self.connector()
+        connector.bulk_client.page_records = 250_000
+        results = connector.scan_objects(['Contact', 'Lead'], incremental=True)
+        self.assertEqual(sum(result['records_scanned'] for result in results), 2_000_000)
+        self.assertEqual(results[0]['field_summary']['Email']['matches'], 600_000)
+        self.assertEqual(results[1]['field_summary']['Phone']['matches'], 800_000)
+        self.assertEqual(connector.watermarks.get(connector.instance_url, 'Lead'), OLD_STAMP)
+
+
+if __name__ == '__main__':
+    unittest.main()
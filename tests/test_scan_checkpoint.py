@@ -0,0 +1,105 @@
+"""
+Scan Checkpoint Journal Tests
+Covers replay, torn writes, compaction on resume and resume cost for the
+append-only checkpoint journal used by CodeScanner.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.scan_checkpoint import CheckpointJournal, journal_path_for
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """Append-only checkpoint journal"""
+
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp(prefix="scan_state_test_")
+        self.path = journal_path_for("/data/repo", self.state_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def _create(self):
+        return CheckpointJournal.create(self.path, "scan1", "2024-01-01T00:00:00", "/data/repo")
+
+    def test_journal_path_is_stable_and_in_state_dir(self):
+        self.assertEqual(self.path, journal_path_for("/data/repo", self.state_dir))
+        self.assertNotEqual(self.path, journal_path_for("/data/other", self.state_dir))
+        self.assertEqual(os.path.dirname(self.path), self.state_dir)
+
+    def test_replay_after_appends(self):
+        journal = self._create()
+        journal.record_file("a.py")
+        journal.record_file("b.py", {"file_path": "/data/repo/b.py", "pii_count": 2})
+        journal.flush()
+        journal.record_file("a.py")
+        journal.close()
+
+        state = CheckpointJournal(self.path).replay()
+        self.assertEqual(state["scan_id"], "scan1")
+        self.assertEqual(state["completed_files"], {"a.py", "b.py"})
+        self.assertEqual(state["findings"]["b.py"]["pii_count"], 2)
+
+    def test_torn_final_record_is_ignored(self):
+        journal = self._create()
+        journal.record_file("a.py")
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "file", "pa')
+
+        state = CheckpointJournal(self.path).replay()
+        self.assertEqual(state["completed_files"], {"a.py"})
+
+    def test_corrupt_record_raises(self):
+        journal = self._create()
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('not json\n{"type": "file", "path": "a.py"}\n')
+        with self.assertRaises(ValueError):
+            CheckpointJournal(self.path).replay()
+
+    def test_resume_compacts_and_keeps_appending(self):
+        journal = self._create()
+        for _ in range(3):
+            for i in range(10):
+                journal.record_file(f"f{i}.py")
+            journal.flush()
+        journal.close()
+
+        journal = CheckpointJournal.resume(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 11)  # header + 10 files
+        journal.record_file("new.py")
+        journal.close()
+        self.assertIn("new.py", CheckpointJournal(self.path).replay()["completed_files"])
+
+    def test_resume_large_scan_is_fast(self):
+        journal = self._create()
+        for i in range(200_000):
+            journal.record_file(f"src/pkg_{i // 1000}/module_{i}.py")
+            if i % 1000 == 999:
+                journal.flush()
+        journal.close()
+
+        start = time.perf_counter()
+        state = CheckpointJournal.resume(self.path).replay()
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(state["completed_files"]), 200_000)
+        self.assertLess(elapsed, 5.0)
+
+    def test_remove(self):
+        journal = self._create()
+        journal.remove()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Scan Rollup Tests
+Checks the per-scan summary computed at store time and the daily rollup
+deltas that back the dashboard metrics.
+"""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.scan_rollups import (
+    ScanSummary, summarize_scan_result, apply_rollup_delta, metrics_from_row,
+    risk_adjusted_score
+)
+
+
+class RecordingCursor:
+    """Collects executed statements instead of talking to PostgreSQL."""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+
+class TestScanSummary(unittest.TestCase):
+    """Summary values written to the scans table"""
+
+    def test_reported_counts_are_preferred(self):
+        summary = summarize_scan_result({
+            'total_pii_found': 7, 'high_risk_count': 2, 'compliance_score': 81,
+            'findings': [{'severity': 'low'}]
+        })
+        self.assertEqual(summary, ScanSummary(7, 2, 0, 81.0))
+
+    def test_counts_derived_from_findings(self):
+        summary = summarize_scan_result({
+            'findings': [
+                {'severity': 'High'},
+                {'risk_level': 'critical'},
+                {'severity': 'low'},
+                'not a finding',
+            ]
+        })
+        self.assertEqual(summary.total_pii_found, 4)
+        self.assertEqual(summary.high_risk_count, 2)
+        self.assertEqual(summary.critical_count, 1)
+        self.assertIsNone(summary.compliance_score)
+
+    def test_invalid_compliance_score_is_ignored(self):
+        for score in (0, -5, 'high', True, None):
+            self.assertIsNone(summarize_scan_result({'compliance_score': score}).compliance_score)
+
+
+class TestRollupDelta(unittest.TestCase):
+    """Incremental maintenance of the daily rollup tables"""
+
+    def test_delta_updates_user_and_org_rollups(self):
+        cursor = RecordingCursor()
+        apply_rollup_delta(cursor, 'org1', 'alice', date(2024, 5, 1), ScanSummary(5, 2, 1, 90.0))
+        self.assertEqual(len(cursor.executed), 2)
+        user_sql, user_params = cursor.executed[0]
+        org_sql, org_params = cursor.executed[1]
+        self.assertIn('scan_rollups_daily_user', user_sql)
+        self.assertIn('scan_rollups_daily_org', org_sql)
+        self.assertEqual(user_params, ('org1', 'alice', date(2024, 5, 1), 1, 5, 2, 1, 90.0, 1, 78.5))
+        self.assertEqual(org_params, ('org1', date(2024, 5, 1), 1, 5, 2, 1, 90.0, 1, 78.5))
+
+    def test_negative_delta_removes_previous_contribution(self):
+        cursor = RecordingCursor()
+        apply_rollup_delta(cursor, 'org1', 'alice', date(2024, 5, 1), ScanSummary(5, 2, 0, None), sign=-1)
+        self.assertEqual(cursor.executed[0][1][3:], (-1, -5, -2, 0, 0.0, 0, -78.5))
+
+    def test_risk_adjusted_score_caps_penalties(self):
+        self.assertEqual(risk_adjusted_score(0, 0), 85.0)
+        self.assertEqual(risk_adjusted_score(10, 3), 74.0)
+        self.assertEqual(risk_adjusted_score(1000, 1000), 40.0)
+
+    def test_metrics_from_row(self):
+        metrics = metrics_from_row((4, 20, 3, 1, 170.0, 2))
+        self.assertEqual(metrics['total_scans'], 4)
+        self.assertEqual(metrics['average_compliance_score'], 85.0)
+        empty = metrics_from_row(None)
+        self.assertEqual(empty['total_scans'], 0)
+        self.assertIsNone(empty['average_compliance_score'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+Schema Migration Tests
+Checks migration discovery, header directives, Python steps, statement
+splitting, the invalid-index check and ensure_schema's retry window for the
+versioned migration runner, and the 0006 summary backfill against a
+recording cursor. Applying migrations needs PostgreSQL and is not covered
+here.
+"""
+
+import os
+import secrets
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services import schema_migrations
+from services.schema_migrations import (
+    MIGRATIONS_DIR, _drop_invalid_index, discover_migrations, ensure_schema, split_sql_statements
+)
+
+try:
+    import psycopg2  # noqa: F401  (the 0006 step uses psycopg2.extras)
+    from services import encryption_service
+    from services.finding_batch import dumps
+    BACKFILL_AVAILABLE = True
+except ImportError:
+    BACKFILL_AVAILABLE = False
+
+
+class RecordingCursor:
+    """Records statements; pg_index lookups answer with the given indisvalid"""
+
+    def __init__(self, indisvalid=None):
+        self.indisvalid = indisvalid
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchone(self):
+        return None if self.indisvalid is None else (self.indisvalid,)
+
+
+class TestMigrationFiles(unittest.TestCase):
+    """The shipped migrations in database/migrations"""
+
+    def test_versions_are_contiguous(self):
+        migrations = discover_migrations(MIGRATIONS_DIR)
+        self.assertGreater(len(migrations), 0)
+        self.assertEqual([m.version for m in migrations], list(range(1, len(migrations) + 1)))
+
+    def test_concurrent_indexes_run_outside_transaction(self):
+        for migration in discover_migrations(MIGRATIONS_DIR):
+            if 'CONCURRENTLY' in migration.sql:
+                self.assertFalse(migration.transactional, migration.name)
+
+    def test_no_sqlite_syntax(self):
+        for migration in discover_migrations(MIGRATIONS_DIR):
+            self.assertNotIn('INSERT OR IGNORE', migration.sql.upper(), migration.name)
+
+    def test_rls_stays_pending_when_disabled(self):
+        rls = [m for m in discover_migrations(MIGRATIONS_DIR) if m.name == 'row_level_security'][0]
+        with patch.dict(os.environ, {'DISABLE_RLS': '1'}):
+            self.assertEqual(rls.skip_reason(), 'DISABLE_RLS=1')
+        with patch.dict(os.environ, {'DISABLE_RLS': '0'}):
+            self.assertIsNone(rls.skip_reason())
+
+
+class TestMigrationDiscovery(unittest.TestCase):
+    """Discovery of migration files"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="migrations_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, filename, sql="SELECT 1;"):
+        with open(os.path.join(self.directory, filename), 'w') as f:
+            f.write(sql)
+
+    def test_ordered_by_version_and_ignores_other_files(self):
+        self._write("0010_later.sql")
+        self._write("0002_earlier.sql")
+        self._write("README.md")
+        self.assertEqual([m.name for m in discover_migrations(self.directory)], ['earlier', 'later'])
+
+    def test_duplicate_versions_rejected(self):
+        self._write("0001_a.sql")
+        self._write("0001_b.sql")
+        with self.assertRaises(ValueError):
+            discover_migrations(self.directory)
+
+    def test_python_step_joins_its_migration(self):
+        self._write("0001_plain.sql")
+        self._write("0001_plain.py", "def migrate(cursor):\n    cursor.execute('UPDATE t SET x = 1')\n")
+        self._write("0002_other.sql")
+        first, second = discover_migrations(self.directory)
+        self.assertIsNotNone(first.step_path)
+        self.assertIsNone(second.step_path)
+        self.assertNotEqual(first.checksum, second.checksum)
+
+        cursor = RecordingCursor()
+        first.run_step(cursor)
+        second.run_step(cursor)
+        self.assertEqual(cursor.statements, ['UPDATE t SET x = 1'])
+
+    def test_python_step_without_sql_rejected(self):
+        self._write("0001_a.sql")
+        self._write("0002_b.py", "def migrate(cursor):\n    pass\n")
+        with self.assertRaises(ValueError):
+            discover_migrations(self.directory)
+
+
+class TestSplitStatements(unittest.TestCase):
+    """Statement splitting for no-transaction migrations"""
+
+    def test_split_respects_quotes_comments_and_dollar_quotes(self):
+        sql = """
+        -- comment; not a statement
+        CREATE INDEX a ON t(x);
+        INSERT INTO t VALUES ('semi;colon', 'it''s');
+        DO $$ BEGIN PERFORM 1; END $$;
+        /* block; comment */ SELECT 2
+        """
+        statements = split_sql_statements(sql)
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(statements[0], "CREATE INDEX a ON t(x)")
+        self.assertIn("'semi;colon'", statements[1])
+        self.assertIn("PERFORM 1; END $$", statements[2])
+        self.assertEqual(statements[3], "SELECT 2")
+
+
+
+class TestInvalidIndexes(unittest.TestCase):
+    """Indexes left INVALID by an interrupted CREATE INDEX CONCURRENTLY"""
+
+    STATEMENT = "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scans_org_type\n    ON scans(organization_id, scan_type)"
+
+    def test_invalid_index_dropped(self):
+        cursor = RecordingCursor(indisvalid=False)
+        _drop_invalid_index(cursor, self.STATEMENT)
+        self.assertEqual(cursor.statements[-1], "DROP INDEX CONCURRENTLY IF EXISTS idx_scans_org_type")
+
+    def test_valid_or_missing_index_kept(self):
+        for indisvalid in (True, None):
+            cursor = RecordingCursor(indisvalid=indisvalid)
+            _drop_invalid_index(cursor, self.STATEMENT)
+            self.assertEqual(len(cursor.statements), 1)
+
+    def test_other_statements_not_checked(self):
+        cursor = RecordingCursor(indisvalid=False)
+        _drop_invalid_index(cursor, "CREATE INDEX IF NOT EXISTS idx_a ON t(x)")
+        self.assertEqual(cursor.statements, [])
+
+
+class TestEnsureSchema(unittest.TestCase):
+    """Failed startup migrations are not retried on every service instantiation"""
+
+    DB_URL = "postgresql://test@localhost/ensure_schema_test"
+
+    def tearDown(self):
+        schema_migrations._failed_urls.pop(self.DB_URL, None)
+        schema_migrations._ensured_urls.discard(self.DB_URL)
+
+    def test_failure_recorded_until_retry_window_passes(self):
+        with patch.dict(os.environ, {'DG_SKIP_STARTUP_MIGRATIONS': '0'}), \
+                patch.object(schema_migrations, 'run_migrations', side_effect=OSError("connection refused")) as run:
+            for _ in range(3):
+                with self.assertRaises(RuntimeError):
+                    ensure_schema(self.DB_URL)
+            self.assertEqual(run.call_count, 1)
+
+            with patch.object(schema_migrations, 'MIGRATION_RETRY_SECONDS', 0):
+                run.side_effect = None
+                ensure_schema(self.DB_URL)
+                ensure_schema(self.DB_URL)
+            self.assertEqual(run.call_count, 2)
+        self.assertNotIn(self.DB_URL, schema_migrations._failed_urls)
+
+
+
+class ScansCursor:
+    """Pages through (scan_id, result_json text) rows like the 0006 backfill query"""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows)
+        self.statements = []
+        self.page = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        if params is not None:
+            last_scan_id, limit = params
+            self.page = [row for row in self.rows if row[0] > last_scan_id][:limit]
+
+    def fetchall(self):
+        return self.page
+
+
+@unittest.skipUnless(BACKFILL_AVAILABLE, "psycopg2 or cryptography not installed")
+class TestScanRollupsBackfill(unittest.TestCase):
+    """0006 fills critical_count and compliance_score from result_json before the rollups"""
+
+    def setUp(self):
+        patch.dict(os.environ, {'DATAGUARDIAN_MASTER_KEY': secrets.token_urlsafe(32)}).start()
+        patch.object(encryption_service, '_encryption_service', None).start()
+        self.addCleanup(patch.stopall)
+        migration = [m for m in discover_migrations(MIGRATIONS_DIR) if m.name == 'scan_rollups'][0]
+        self.step = migration.load_step()
+
+    def test_summaries_come_from_encrypted_findings(self):
+        encrypt = encryption_service.get_encryption_service().encrypt_scan_result
+        rows = [
+            ('scan_a', dumps(encrypt({'compliance_score': 64, 'findings': [
+                {'severity': 'Critical'}, {'severity': 'critical'}, {'severity': 'low'}]}))),
+            ('scan_b', dumps({'findings': [{'severity': 'Medium'}]})),
+            ('scan_c', dumps({'critical_count': 3, 'findings': []})),
+        ]
+        updates = []
+        cursor = ScansCursor(rows)
+        with patch.object(self.step, 'BATCH_SIZE', 2), \
+                patch.object(self.step, 'execute_values',
+                             side_effect=lambda cursor, sql, values, template: updates.extend(values)):
+            self.step.migrate(cursor)
+
+        self.assertEqual(updates, [('scan_a', 2, 64.0), ('scan_c', 3, None)])
+        # The rollups are built after every page of scans was summarised
+        self.assertIn('scan_rollups_daily_user', cursor.statements[-2])
+        self.assertIn('scan_rollups_daily_org', cursor.statements[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
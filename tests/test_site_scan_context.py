@@ -0,0 +1,161 @@
+"""
+Site Scan Context Tests
+Runs SiteScanContext against a local site: one pooled session for all page
+workers, robots.txt and the sitemap fetched once, discovery responses
+handed to the page worker instead of fetched again, and the intelligent
+website scan fetching every page once.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.site_scan_context import SECURITY_HEADERS, SiteScanContext
+
+try:
+    from services.website_scanner import WebsiteScanner
+    from services.intelligent_website_scanner import IntelligentWebsiteScanner
+    WEBSITE_SCANNER_AVAILABLE = True
+except ImportError:
+    WEBSITE_SCANNER_AVAILABLE = False
+
+PAGES = 12
+
+
+def page(i):
+    links = ''.join(f'<a href="/page{j}">Page {j}</a>' for j in range(PAGES) if j != i)
+    return (f'<html><head><title>Page {i}</title>'
+            f'<script src="https://www.googletagmanager.com/gtag/js?id=G-{i}"></script></head>'
+            f'<body><a href="/privacy">Privacy policy</a>{links}'
+            f'<img src="https://px.example.net/pixel.gif" height="1" width="1"></body></html>')
+
+
+class MockSite(BaseHTTPRequestHandler):
+    """A small site with robots.txt, a sitemap and cross-linked pages"""
+
+    protocol_version = 'HTTP/1.1'
+    requests = Counter()
+    connections = set()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        body = body.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with MockSite.lock:
+            MockSite.requests[self.path] += 1
+            MockSite.connections.add(self.client_address)
+        host = self.headers['Host']
+        if self.path == '/robots.txt':
+            return self._send(200, f'User-agent: *\nDisallow: /admin\nSitemap: http://{host}/site-map.xml\n',
+                              'text/plain')
+        if self.path == '/site-map.xml':
+            locs = ''.join(f'<url><loc>http://{host}/page{i}</loc></url>' for i in range(PAGES))
+            return self._send(200, f'<urlset>{locs}<url><loc>http://{host}/admin</loc></url></urlset>',
+                              'application/xml')
+        if self.path in ('/', '/privacy') or self.path.startswith('/page'):
+            index = int(self.path[5:]) if self.path.startswith('/page') else 0
+            return self._send(200, page(index), headers={'X-Frame-Options': 'DENY',
+                                                         'Set-Cookie': '_fbp=fb.1.123; Path=/'})
+        self._send(404, 'not found')
+
+
+class SiteTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockSite)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        MockSite.requests = Counter()
+        MockSite.connections = set()
+
+
+class TestSiteScanContext(SiteTestCase):
+    """Shared session, robots rules and sitemap"""
+
+    def test_robots_and_sitemap_fetched_once(self):
+        with SiteScanContext(self.base_url) as context:
+            self.assertTrue(context.allowed(f'{self.base_url}/page1'))
+            self.assertFalse(context.allowed(f'{self.base_url}/admin'))
+            self.assertEqual(context.sitemap()[0], f'{self.base_url}/site-map.xml')
+            self.assertEqual(len(context.sitemap_urls()), PAGES + 1)
+            self.assertEqual(context.sitemap_urls(limit=3), [f'{self.base_url}/page{i}' for i in range(3)])
+            self.assertTrue(context.has_robots_txt)
+        self.assertEqual(MockSite.requests, {'/robots.txt': 1, '/site-map.xml': 1})
+
+    def test_kept_responses_are_handed_out_once(self):
+        with SiteScanContext(self.base_url) as context:
+            first = context.fetch(f'{self.base_url}/page1', keep=True)
+            self.assertIs(context.fetch(f'{self.base_url}/page1'), first)
+            context.fetch(f'{self.base_url}/page1')
+            self.assertEqual(context.requests_made, 2)
+        self.assertEqual(MockSite.requests['/page1'], 2)
+
+    def test_workers_share_pooled_connections(self):
+        urls = [f'{self.base_url}/page{i % PAGES}' for i in range(60)]
+        with SiteScanContext(self.base_url, pool_size=4) as context:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                statuses = list(executor.map(lambda url: context.fetch(url).status_code, urls))
+        self.assertEqual(statuses, [200] * 60)
+        self.assertLessEqual(len(MockSite.connections), 4)
+
+
+@unittest.skipUnless(WEBSITE_SCANNER_AVAILABLE, "WebsiteScanner dependencies not installed")
+class TestIntelligentScanWithContext(SiteTestCase):
+    """Page workers on one context"""
+
+    def test_site_checks_and_page_analysis(self):
+        scanner = WebsiteScanner(check_dns=False)
+        with SiteScanContext(self.base_url, scanner) as context:
+            checks = context.site_checks()
+            self.assertIs(context.site_checks(), checks)
+            self.assertEqual(checks['security_headers']['present'], ['X-Frame-Options'])
+            self.assertEqual(len(checks['security_headers']['missing']), len(SECURITY_HEADERS) - 1)
+            self.assertTrue(checks['has_privacy_policy'])
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(context.analyze_page, [f'{self.base_url}/page{i}' for i in range(PAGES)]))
+        for i, result in enumerate(results):
+            self.assertEqual([t['name'] for t in result['trackers']], ['Google Tag Manager'])
+            self.assertIn('_fbp', result['cookies'])
+            self.assertTrue(any(f['type'] == 'tracking_pixel' for f in result['findings']))
+
+    def test_every_page_fetched_once(self):
+        scanner = IntelligentWebsiteScanner(WebsiteScanner(check_dns=False))
+        result = scanner.scan_website_intelligent(self.base_url, scan_mode='deep', max_pages=PAGES)
+        self.assertEqual(result['status'], 'completed')
+        self.assertGreater(result['pages_scanned'], 1)
+        self.assertEqual(MockSite.requests['/robots.txt'], 1)
+        self.assertEqual(MockSite.requests['/site-map.xml'], 1)
+        self.assertEqual(MockSite.requests['/admin'], 0)
+        self.assertEqual(max(count for path, count in MockSite.requests.items() if path.startswith('/page')), 1)
+        self.assertIn('site_checks', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Startup Import Budget Tests
+Guards the landing page import path against heavy ML/PDF stacks, checks
+that the measured path follows app.py's module-level imports and that
+scanners are loaded lazily through the scanner registry.
+"""
+
+import importlib.util
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from startup_import_report import (
+    LANDING_PAGE_MODULES, DEFAULT_BUDGET_MS,
+    module_level_imports, parse_importtime, run_importtime, build_report
+)
+from services import scanner_registry
+
+STREAMLIT_AVAILABLE = importlib.util.find_spec('streamlit') is not None
+
+
+class TestImportTimeParsing(unittest.TestCase):
+    """Parsing of `python -X importtime` output"""
+
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      5000 |       9000 | torch\n"
+            "some unrelated stderr line\n"
+        )
+        records = parse_importtime(output)
+        self.assertEqual([r.module for r in records], ['_io', 'torch'])
+        self.assertEqual(records[0].depth, 1)
+        self.assertEqual(records[1].cumulative_us, 9000)
+
+        report = build_report(records, budget_ms=5)
+        self.assertEqual(report['heavy_modules'], ['torch'])
+        self.assertEqual(report['total_ms'], 9.0)
+        self.assertFalse(report['within_budget'])
+
+
+class TestLandingPageModules(unittest.TestCase):
+    """The measured modules follow app.py"""
+
+    APP_SOURCE = (
+        "import os\n"
+        "import streamlit as st\n"
+        "from utils.app_resources import session_query\n"
+        "try:\n"
+        "    from services.encryption_service import get_encryption_service\n"
+        "except ImportError:\n"
+        "    from utils.redis_cache import get_cache\n"
+        "if True:\n"
+        "    import config.pricing_config\n"
+        "def main():\n"
+        "    from services.scanner_registry import get_scanner_class\n"
+    )
+
+    def test_module_level_project_imports(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+            f.write(self.APP_SOURCE)
+        self.addCleanup(os.unlink, f.name)
+        self.assertEqual(module_level_imports(f.name),
+                         ['utils.app_resources', 'services.encryption_service', 'config.pricing_config'])
+
+    def test_every_app_import_is_measured(self):
+        self.assertIn('utils.app_resources', LANDING_PAGE_MODULES)
+        for module in module_level_imports():
+            self.assertIn(module, LANDING_PAGE_MODULES)
+
+
+class TestScannerRegistry(unittest.TestCase):
+    """Lazy scanner registry"""
+
+    def test_unknown_scanner(self):
+        with self.assertRaises(KeyError):
+            scanner_registry.get_scanner_class('does_not_exist')
+
+    def test_registry_targets_exist(self):
+        for key, (module_path, _) in scanner_registry.SCANNER_REGISTRY.items():
+            module_file = os.path.join(*module_path.split('.')) + '.py'
+            root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+            self.assertTrue(os.path.exists(os.path.join(root, module_file)), key)
+
+    def test_shared_scanner_is_reused_per_configuration(self):
+        registry = {'shared': ('collections', 'OrderedDict'), 'fresh': ('collections', 'OrderedDict')}
+        with patch.dict(scanner_registry.SCANNER_REGISTRY, registry), \
+                patch.object(scanner_registry, 'SHARED_SCANNERS', frozenset({'shared'})), \
+                patch.dict(scanner_registry._shared_instances, clear=True), \
+                patch.dict(scanner_registry._loaded_classes):
+            first = scanner_registry.get_shared_scanner('shared', region='NL')
+            self.assertIs(scanner_registry.get_shared_scanner('shared', region='NL'), first)
+            self.assertIsNot(scanner_registry.get_shared_scanner('shared', region='DE'), first)
+            self.assertIsNot(scanner_registry.get_shared_scanner('fresh', region='NL'),
+                             scanner_registry.get_shared_scanner('fresh', region='NL'))
+
+
+@unittest.skipUnless(STREAMLIT_AVAILABLE, "application dependencies not installed")
+class TestLandingPageImportBudget(unittest.TestCase):
+    """Landing page import path stays within budget"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.records = run_importtime(LANDING_PAGE_MODULES)
+        cls.report = build_report(cls.records)
+
+    def test_no_heavy_modules_on_landing_path(self):
+        self.assertEqual(self.report['heavy_modules'], [],
+                         f"Heavy modules imported at startup: {self.report['heavy_modules']}")
+
+    def test_no_scanner_modules_on_landing_path(self):
+        imported = {r.module for r in self.records}
+        for key, (module_path, _) in scanner_registry.SCANNER_REGISTRY.items():
+            self.assertNotIn(module_path, imported, f"Scanner '{key}' imported at startup")
+
+    def test_import_time_budget(self):
+        self.assertLessEqual(self.report['total_ms'], DEFAULT_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Subject Index Tests
+Checks identifier normalisation, indexing of scan findings, tenant isolation,
+DSAR discovery through the index and lookup time over a million locations.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.dsar_automation import DSARAutomationEngine, DSARType
+from services.subject_index import SubjectIndex, normalize_identifier
+
+KEY = b'test-subject-index-key'
+
+
+def scan_result(scan_id='scan-1', findings=None):
+    return {
+        'scan_id': scan_id,
+        'scan_type': 'document',
+        'findings': findings if findings is not None else [
+            {'type': 'Email', 'value': 'Jan.Jansen@Example.nl', 'file': 'contract.pdf', 'risk_level': 'Medium'},
+            {'type': 'BSN', 'value': '1112.22.333', 'file': 'contract.pdf', 'risk_level': 'High'},
+            {'type': 'Email', 'value': 'jan.jansen@example.nl', 'file': 'invoice.pdf'},
+            {'type': 'Email', 'value': 'other@example.nl', 'file': 'invoice.pdf'},
+            {'type': 'Credit Card', 'value': '4111111111111111', 'file': 'invoice.pdf'},
+        ]
+    }
+
+
+class TestSubjectIndex(unittest.TestCase):
+    """Population and lookup"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="subject_index_test_")
+        self.index = SubjectIndex(os.path.join(self.directory, "subjects.db"), key=KEY)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_normalisation(self):
+        self.assertEqual(normalize_identifier('phone', '06-12345678'), normalize_identifier('phone', '+31 6 1234 5678'))
+        self.assertEqual(normalize_identifier('iban', 'nl91 abna 0417 1643 00'), 'NL91ABNA0417164300')
+        self.assertEqual(normalize_identifier('name', ' José  Müller '), 'jose muller')
+        self.assertIsNone(normalize_identifier('email', 'not-an-email'))
+
+    def test_findings_are_indexed_without_duplicates(self):
+        self.index.index_scan_result('org1', scan_result())
+        self.index.index_scan_result('org1', scan_result())
+        locations = self.index.lookup('org1', {'email': 'JAN.JANSEN@example.nl', 'bsn': '111222333'})
+        self.assertEqual([entry['location_path'] for entry in locations],
+                         ['document://document/contract.pdf', 'document://document/invoice.pdf'])
+        self.assertEqual(locations[0]['identifier_types'], ['bsn', 'email'])
+        self.assertEqual(locations[0]['sensitivity_level'], 'high')
+        self.assertEqual(locations[1]['record_count'], 1)
+        self.assertEqual(self.index.count_locations('org1'), 2)
+
+    def test_tenants_are_isolated(self):
+        self.index.index_scan_result('org1', scan_result())
+        self.assertEqual(self.index.lookup('org2', {'email': 'jan.jansen@example.nl'}), [])
+        self.assertNotEqual(self.index.subject_key('org1', 'email', 'a@b.nl'),
+                            self.index.subject_key('org2', 'email', 'a@b.nl'))
+
+    def test_forget_subject(self):
+        self.index.index_scan_result('org1', scan_result())
+        self.assertEqual(self.index.forget_subject('org1', {'email': 'jan.jansen@example.nl'}), 2)
+        self.assertEqual(self.index.lookup('org1', {'email': 'jan.jansen@example.nl'}), [])
+        self.assertEqual(len(self.index.lookup('org1', {'email': 'other@example.nl'})), 1)
+
+    def test_forget_subject_with_list_identifiers(self):
+        self.index.index_scan_result('org1', scan_result())
+        identifiers = {'email': ['jan.jansen@example.nl', 'other@example.nl'], 'bsn': ('111222333',)}
+        self.assertEqual(self.index.forget_subject('org1', identifiers), 4)
+        self.assertEqual(self.index.lookup('org1', identifiers), [])
+
+    def test_lookup_over_a_million_locations_is_sub_second(self):
+        # Other subjects' postings, generated in SQL to keep the fixture fast
+        conn = self.index._conn()
+        conn.executescript("""
+            BEGIN;
+            WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 1000000)
+            INSERT INTO subject_locations
+            SELECT i, 'org1', 'crm', 'database_record', 'database://crm/customers/' || i, 'medium', NULL, '2024-01-01'
+            FROM n;
+            INSERT INTO subject_postings SELECT randomblob(16), id, 'email', 1 FROM subject_locations;
+            COMMIT;
+        """)
+        location = lambda i: {'system_name': 'crm', 'data_type': 'database_record',
+                              'location_path': f'database://crm/orders/{i}', 'sensitivity_level': 'medium'}
+        self.index.add_postings('org1', (('email', 'customer42@example.nl', location(i), 3) for i in range(50)))
+        self.assertGreaterEqual(self.index.count_locations('org1'), 1_000_000)
+
+        start = time.perf_counter()
+        locations = self.index.lookup('org1', {'email': 'Customer42@example.nl', 'phone': '0612345678'})
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(locations), 50)
+        self.assertEqual(locations[0]['record_count'], 3)
+        self.assertLess(elapsed, 1.0)
+
+
+class TestDSARDiscovery(unittest.TestCase):
+    """DSARAutomationEngine discovery through the subject index"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="subject_index_test_")
+        self.index = SubjectIndex(os.path.join(self.directory, "subjects.db"), key=KEY)
+        self.index.index_scan_result('org1', scan_result())
+        self.engine = DSARAutomationEngine(organization_id='org1', subject_index=self.index)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _discover(self, email, **details):
+        request = self.engine.submit_dsar_request(DSARType.ACCESS, email, details)
+        return self.engine._initiate_data_discovery(request.request_id)
+
+    def test_indexed_subject_is_found_without_live_search(self):
+        locations = self._discover('jan.jansen@example.nl')
+        self.assertEqual(len(locations), 2)
+        self.assertEqual(locations[0].record_count, 1)
+        self.assertEqual(locations[0].data_type, 'file')
+
+    def test_live_verification_adds_source_systems(self):
+        locations = self._discover('jan.jansen@example.nl', live_verification=True)
+        self.assertGreater(len(locations), 2)
+        self.assertEqual(len({location.location_path for location in locations}), len(locations))
+
+    def test_unindexed_subject_falls_back_to_live_search(self):
+        self.assertGreater(len(self._discover('unknown@example.nl')), 0)
+
+    def test_request_cannot_choose_the_tenant(self):
+        self.index.index_scan_result('org2', scan_result(findings=[
+            {'type': 'Email', 'value': 'jan.jansen@example.nl', 'file': 'org2-only.pdf'}]))
+        locations = self._discover('jan.jansen@example.nl', organization_id='org2')
+        self.assertEqual([location.location_path for location in locations],
+                         ['document://document/contract.pdf', 'document://document/invoice.pdf'])
+
+        request = self.engine.submit_dsar_request(DSARType.ERASURE, 'jan.jansen@example.nl',
+                                                  {'organization_id': 'org2'})
+        self.engine.complete_dsar_request(request.request_id)
+        self.assertEqual(self.index.lookup('org1', {'email': 'jan.jansen@example.nl'}), [])
+        self.assertEqual(len(self.index.lookup('org2', {'email': 'jan.jansen@example.nl'})), 1)
+
+    def test_completed_erasure_is_removed_from_index(self):
+        request = self.engine.submit_dsar_request(DSARType.ERASURE, 'jan.jansen@example.nl', {'bsn': '111222333'})
+        self.engine.complete_dsar_request(request.request_id)
+        self.assertEqual(self.index.lookup('org1', {'email': 'jan.jansen@example.nl', 'bsn': '111222333'}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+"""
+Tracker Index Tests
+Tracker hosts found through the reversed-label domain trie, inline-script
+signatures through the signature automaton with the same answers as the
+substring loops WebsiteScanner used before, the tiered cookie rules, and
+Disconnect-style tracker lists merged in at startup.
+"""
+
+import json
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.tracker_index import (SMALL_SIGNATURE_SET, CookieRules, DomainTrie, SignatureAutomaton,
+                                   TrackerIndex, get_tracker_index, load_tracker_list, merge_tracker_lists)
+
+KNOWN_TRACKERS = {
+    'Google Analytics': {'domains': ['google-analytics.com', 'analytics.google.com'],
+                         'patterns': ['ga', 'gtag', 'gtm', 'analytics'], 'privacy_risk': 'Medium'},
+    'Google Tag Manager': {'domains': ['googletagmanager.com', 'tagmanager.google.com'],
+                           'patterns': ['gtm', 'tagmanager']},
+    'Facebook Pixel': {'domains': ['connect.facebook.net', 'facebook.com/tr'],
+                       'patterns': ['fbq', 'facebook-jssdk'], 'privacy_risk': 'High'},
+    'Hotjar': {'domains': ['hotjar.com', 'static.hotjar.com'], 'patterns': ['hotjar', 'hjSettings']},
+    'Matomo': {'domains': ['matomo.org', 'matomo.cloud'], 'patterns': ['matomo', 'piwik']},
+    'Adobe Analytics': {'domains': ['omtrdc.net', 'adobe.com'], 'patterns': ['s_code', 'sc.omtrdc']},
+}
+
+# Sources on a tracker's host, where host and substring matching agree
+SOURCES = [
+    'https://www.googletagmanager.com/gtag/js?id=G-1',
+    'https://www.google-analytics.com/analytics.js',
+    'https://connect.facebook.net/en_US/fbevents.js',
+    'https://static.hotjar.com/c/hotjar-1.js',
+    'https://cdn.example.com/app.js',
+    '//cdn.matomo.cloud/example.matomo.cloud/matomo.js',
+    '/static/site.js',
+]
+
+SNIPPETS = ["gtag('config', 'G-1');", "fbq('init', '123');", "window.hjSettings={hjid:1};",
+            "var _paq = window._paq; // matomo", "console.log('hello');", "s_code.t();", "tagmanager.push"]
+
+COOKIE_DATABASE = {
+    '_ga': {'category': 'Analytics', 'name': '_ga'},
+    '_ga_*': {'category': 'Analytics', 'name': '_ga_*'},
+    '_gid': {'category': 'Analytics', 'name': '_gid'},
+    '_fbp': {'category': 'Marketing', 'name': '_fbp'},
+    'AMP_*': {'category': 'Analytics', 'name': 'AMP_*'},
+    'AMP_TOKEN': {'category': 'Analytics', 'name': 'AMP_TOKEN'},
+    'wp-settings-?': {'category': 'Functional', 'name': 'wp-settings-?'},
+}
+COOKIE_NAME_PATTERNS = {fragment: {'category': 'Fragment', 'name': fragment}
+                        for fragment in ['session', 'sess', 'csrf', 'xsrf', 'analytics', 'utm', 'fb', 'google',
+                                         'consent', 'cookie']}
+
+
+def nested_loops(known_trackers, text, key):
+    """The per-script loops WebsiteScanner ran before the index"""
+    matches = []
+    for name, info in known_trackers.items():
+        for needle in info[key]:
+            if needle in text:
+                matches.append((name, info, needle))
+                break
+    return matches
+
+
+def categorize_cookie(name):
+    """_categorize_cookie before the compiled rules"""
+    if name in COOKIE_DATABASE:
+        return COOKIE_DATABASE[name]
+    if name.startswith('_ga_'):
+        return COOKIE_DATABASE['_ga_*']
+    for pattern, info in COOKIE_NAME_PATTERNS.items():
+        if pattern in name.lower():
+            return info
+    return None
+
+
+def random_words(rng, count, alphabet=string.ascii_lowercase):
+    return list(dict.fromkeys(''.join(rng.choice(alphabet) for _ in range(rng.randrange(2, 9)))
+                              for _ in range(count)))
+
+
+def disconnect_list(rng, companies):
+    categories = {'Advertising': [], 'Analytics': [], 'Content': []}
+    for i in range(companies):
+        domains = [f'{word}{i}.{rng.choice(["com", "net", "io"])}' for word in random_words(rng, 3)]
+        category = rng.choice(sorted(categories))
+        categories[category].append({f'Company {i}': {f'http://company{i}.com/': domains, 'performance': 'true'}})
+    return {'license': 'test', 'categories': categories}
+
+
+class TestSignatureAutomaton(unittest.TestCase):
+    """Which signatures occur in a text"""
+
+    def test_same_as_substring_tests(self):
+        rng = random.Random(2)
+        for count in (10, SMALL_SIGNATURE_SET * 4):
+            signatures = random_words(rng, count, 'abcdef_.') + ['ab', 'abc', 'abcd', 'b']
+            automaton = SignatureAutomaton(signatures)
+            for _ in range(50):
+                text = ''.join(rng.choice('abcdef_. (){}') for _ in range(rng.randrange(400)))
+                self.assertEqual(automaton.find(text), {s for s in signatures if s in text})
+
+    def test_overlapping_signatures(self):
+        signatures = ['ga', 'gtag', 'tag', 'ag'] + [f'pad{i}' for i in range(SMALL_SIGNATURE_SET)]
+        self.assertEqual(SignatureAutomaton(signatures).find("gtag()"), {'gtag', 'tag', 'ag'})
+
+
+class TestTrackerIndex(unittest.TestCase):
+    """Tracker hosts and inline signatures"""
+
+    def setUp(self):
+        self.index = TrackerIndex(KNOWN_TRACKERS)
+
+    def test_inline_same_as_nested_loops(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            content = ' '.join(rng.sample(SNIPPETS, rng.randrange(len(SNIPPETS) + 1)))
+            self.assertEqual(self.index.match_inline(content), nested_loops(KNOWN_TRACKERS, content, 'patterns'))
+
+    def test_sources_on_tracker_hosts(self):
+        for src in SOURCES:
+            expected = nested_loops(KNOWN_TRACKERS, src, 'domains') if src.startswith(('https:', '//')) else []
+            self.assertEqual(self.index.match_src(src), expected, src)
+
+    def test_hosts_not_substrings(self):
+        names = lambda src: [name for name, _, _ in self.index.match_src(src)]
+        self.assertEqual(names('https://nothotjar.com/x.js'), [])
+        self.assertEqual(names('https://cdn.example.com/x.js?ref=google-analytics.com'), [])
+        self.assertEqual(names('HTTPS://SCRIPT.HOTJAR.COM:443/x.js'), ['Hotjar'])
+        self.assertEqual(names('https://www.facebook.com/tr?id=1'), ['Facebook Pixel'])
+        self.assertEqual(names('https://www.facebook.com/login'), [])
+        self.assertEqual(names('https://[::1/broken'), [])
+
+    def test_scheme_less_sources(self):
+        names = lambda src: [name for name, _, _ in self.index.match_src(src)]
+        self.assertEqual(names('static.hotjar.com/c/hotjar-1.js'), ['Hotjar'])
+        self.assertEqual(names(' www.google-analytics.com/analytics.js'), ['Google Analytics'])
+        self.assertEqual(names('www.facebook.com/tr?id=1'), ['Facebook Pixel'])
+        self.assertEqual(names('./hotjar.com/x.js'), [])
+        self.assertEqual(names('/hotjar.com/x.js'), [])
+        self.assertEqual(names('js/app.js'), [])
+
+    def test_first_needle_in_tracker_order(self):
+        matches = self.index.match_inline("gtag(); gtm.start; tagmanager")
+        self.assertEqual([(name, needle) for name, _, needle in matches],
+                         [('Google Analytics', 'gtag'), ('Google Tag Manager', 'gtm')])
+        self.assertEqual(len(TrackerIndex({'Bare': {}})), 1)
+
+    def test_domain_trie(self):
+        trie = DomainTrie()
+        trie.add('example.com', 1)
+        trie.add('ads.example.com', 2)
+        self.assertEqual(trie.match('x.ads.example.com'), [1, 2])
+        self.assertEqual(trie.match('example.com.'), [1])
+        self.assertEqual(trie.match('com'), [])
+
+
+class TestCookieRules(unittest.TestCase):
+    """Exact, prefix, glob and fragment tiers"""
+
+    def setUp(self):
+        self.rules = CookieRules(COOKIE_DATABASE, COOKIE_NAME_PATTERNS)
+
+    def test_same_as_pattern_loop(self):
+        names = ['_ga', '_ga_ABC123', '_ga_', '_gid', '_fbp', 'PHPSESSID', 'sessionid', 'XSRF-TOKEN', 'utm_source',
+                 'cookie_notice', 'fb_consent', 'google_pref', 'theme', '_GA_X', 'my_analytics_id']
+        for name in names:
+            self.assertIs(self.rules.classify(name), categorize_cookie(name), name)
+
+    def test_prefix_and_glob(self):
+        self.assertEqual(self.rules.classify('AMP_TOKEN')['name'], 'AMP_TOKEN')
+        self.assertEqual(self.rules.classify('AMP_abc')['name'], 'AMP_*')
+        self.assertEqual(self.rules.classify('wp-settings-1')['name'], 'wp-settings-?')
+        self.assertIsNone(self.rules.classify('wp-settings-12'))
+        self.assertIsNone(self.rules.classify('theme'))
+
+
+class TestTrackerLists(unittest.TestCase):
+    """Disconnect-style and flat lists merged into the database"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="tracker_index_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        return path
+
+    def test_disconnect_and_flat_lists(self):
+        disconnect = self.write('services.json', {'categories': {
+            'Advertising': [{'Criteo': {'http://www.criteo.com/': ['criteo.com', 'criteo.net'], 'performance': 'true'}}],
+            'Analytics': [{'Hotjar': {'https://www.hotjar.com/': ['hotjar.io']}}],
+        }})
+        flat = self.write('extra.json', {'Plausible': {'domains': ['plausible.io'], 'patterns': ['plausible(']}})
+        broken = self.write('broken.json', '{"not": ')
+        trackers = load_tracker_list(disconnect)
+        self.assertEqual(trackers['Criteo']['domains'], ['criteo.com', 'criteo.net'])
+        self.assertEqual((trackers['Criteo']['privacy_risk'], trackers['Criteo']['category']), ('High', 'Advertising'))
+
+        merged = merge_tracker_lists(KNOWN_TRACKERS, [disconnect, flat, broken, os.path.join(self.temp_dir, 'none')])
+        self.assertEqual(list(merged)[:len(KNOWN_TRACKERS)], list(KNOWN_TRACKERS))
+        self.assertEqual(merged['Hotjar']['domains'], ['hotjar.com', 'static.hotjar.com', 'hotjar.io'])
+        self.assertEqual(KNOWN_TRACKERS['Hotjar']['domains'], ['hotjar.com', 'static.hotjar.com'])
+
+        index = get_tracker_index(KNOWN_TRACKERS, [disconnect, flat])
+        self.assertIs(get_tracker_index(dict(KNOWN_TRACKERS), [disconnect, flat]), index)
+        self.assertEqual([name for name, _, _ in index.match_src('https://static.criteo.net/js/ld.js')], ['Criteo'])
+        self.assertEqual([name for name, _, _ in index.match_inline('plausible("signup")')], ['Plausible'])
+        with self.assertRaises(ValueError):
+            load_tracker_list(self.write('list.json', ['criteo.com']))
+
+    def test_classifying_many_urls_is_cheap(self):
+        rng = random.Random(8)
+        path = self.write('services.json', disconnect_list(rng, 3000))
+        index = get_tracker_index(KNOWN_TRACKERS, [path])
+        self.assertGreater(len(index), 3000)
+        domains = [domain for info in index.known_trackers.values() for domain in info['domains']]
+        hosts = [f'cdn{i}.{rng.choice(domains)}' for i in range(200)] + [f'static{i}.example.org' for i in range(200)]
+        urls = [f'https://{rng.choice(hosts)}/px/{i}.js?v={i}' for i in range(10000)]
+
+        start = time.perf_counter()
+        classified = index.classify_urls(urls)
+        indexed = time.perf_counter() - start
+        self.assertEqual(len(classified), sum(1 for url in urls if 'example.org' not in url))
+
+        sample = urls[:500]
+        start = time.perf_counter()
+        for url in sample:
+            nested_loops(index.known_trackers, url, 'domains')
+        looped = (time.perf_counter() - start) * len(urls) / len(sample)
+        self.assertGreater(looped / indexed, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Usage Analytics Tests
+Checks buffered event tracking, and that statistics served from the hourly
+rollups (plus raw events for partial hours) match a direct count over the
+raw events, including for replayed events and for databases written before
+the rollups existed.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.usage_analytics import UsageAnalytics, UsageEvent, UsageEventType
+
+BASE = datetime(2025, 3, 10, 8, 0, 0)
+
+
+def sample_events():
+    """Events spread over three days, several hours and two scanners"""
+    events = []
+    for i in range(120):
+        event_type = [UsageEventType.SCAN_COMPLETED, UsageEventType.SCAN_FAILED,
+                      UsageEventType.REPORT_GENERATED][i % 3]
+        events.append(UsageEvent(
+            event_id=f"event-{i}",
+            event_type=event_type,
+            timestamp=BASE + timedelta(minutes=37 * i),
+            user_id=f"user-{i % 7}",
+            session_id="session",
+            scanner_type=['code', 'website', None][i % 3],
+            region='Netherlands' if i % 2 else None,
+            feature='export' if i % 5 == 0 else None,
+            duration_ms=100 + i if event_type != UsageEventType.REPORT_GENERATED else None,
+            success=event_type != UsageEventType.SCAN_FAILED,
+        ))
+    return events
+
+
+class TestUsageAnalytics(unittest.TestCase):
+    """Buffered writes and rollup-backed statistics"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="usage_analytics_test_")
+        self.path = os.path.join(self.directory, "usage.db")
+        self.analytics = UsageAnalytics(self.path, batch_size=16)
+        self.events = sample_events()
+
+    def tearDown(self):
+        self.analytics.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _raw_count(self, where, params):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM usage_events WHERE {where}", params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def _track_all(self):
+        for event in self.events:
+            self.analytics.track_event_object(event)
+        self.assertTrue(self.analytics.flush())
+
+    def test_tracked_events_are_written_on_flush(self):
+        self.assertTrue(self.analytics.track_event(UsageEventType.USER_LOGIN, 'alice', 's1'))
+        self.assertTrue(self.analytics.flush())
+        activity = self.analytics.get_user_activity('alice')
+        self.assertEqual([e.event_type for e in activity], [UsageEventType.USER_LOGIN])
+
+    def test_statistics_match_raw_events(self):
+        self._track_all()
+        # Range boundaries fall inside hours so both partial-hour paths are used
+        start, end = BASE + timedelta(hours=3, minutes=20), BASE + timedelta(hours=50, minutes=10)
+        in_range = [e for e in self.events if start <= e.timestamp <= end]
+        scans = [e for e in in_range if e.event_type != UsageEventType.REPORT_GENERATED]
+
+        stats = self.analytics.get_usage_statistics(start, end)
+        self.assertEqual(stats.total_scans, len(scans))
+        self.assertEqual(stats.failed_scans, sum(1 for e in scans if not e.success))
+        self.assertAlmostEqual(stats.average_duration_ms,
+                               sum(e.duration_ms for e in scans) / len(scans))
+        self.assertEqual(stats.total_reports_generated, len(in_range) - len(scans))
+        self.assertEqual(sum(stats.usage_by_day.values()), len(in_range))
+        self.assertEqual(stats.usage_by_hour.get(9, 0),
+                         sum(1 for e in in_range if e.timestamp.hour == 9))
+        self.assertEqual(stats.scanners_used, ['code', 'website'])
+        self.assertEqual(stats.features_used, ['export'])
+
+        user_stats = self.analytics.get_usage_statistics(start, end, user_id='user-3')
+        self.assertEqual(sum(user_stats.usage_by_day.values()),
+                         sum(1 for e in in_range if e.user_id == 'user-3'))
+
+    def test_scanner_usage_matches_raw_events(self):
+        self._track_all()
+        start, end = BASE + timedelta(minutes=50), BASE + timedelta(days=2, hours=1, minutes=5)
+        usage = self.analytics.get_scanner_usage('code', start, end)
+        code = [e for e in self.events if e.scanner_type == 'code' and start <= e.timestamp <= end]
+        self.assertEqual(usage['total_uses'], len(code))
+        self.assertEqual(usage['min_duration_ms'], min(e.duration_ms for e in code))
+        self.assertEqual(usage['max_duration_ms'], max(e.duration_ms for e in code))
+        self.assertEqual(usage['unique_users'], len({e.user_id for e in code}))
+        self.assertEqual(usage['usage_by_day'], {
+            day: sum(1 for e in code if e.timestamp.date().isoformat() == day)
+            for day in sorted({e.timestamp.date().isoformat() for e in code})
+        })
+
+    def test_replayed_events_are_counted_once(self):
+        self._track_all()
+        # The same event_ids again, in a batch with events not seen before
+        replay = self.events[:40] + sample_events()[:3]
+        for i, event in enumerate(replay[40:]):
+            event.event_id = f"new-{i}"
+        for event in replay:
+            self.analytics.track_event_object(event)
+        self.assertTrue(self.analytics.flush())
+
+        start, end = BASE, BASE + timedelta(days=5)
+        stats = self.analytics.get_usage_statistics(start, end)
+        self.assertEqual(sum(stats.usage_by_day.values()), len(self.events) + 3)
+        self.assertEqual(sum(stats.usage_by_day.values()), self._raw_count("1", ()))
+        usage = self.analytics.get_scanner_usage('code', start, end)
+        self.assertEqual(usage['total_uses'], self._raw_count("scanner_type = 'code'", ()))
+
+    def test_existing_events_are_backfilled_into_rollups(self):
+        self._track_all()
+        self.analytics.close()
+        conn = sqlite3.connect(self.path)
+        conn.execute("DELETE FROM usage_rollup_hourly")
+        conn.execute("DELETE FROM usage_rollup_daily_users")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+
+        self.analytics = UsageAnalytics(self.path)
+        stats = self.analytics.get_usage_statistics(BASE, BASE + timedelta(days=5))
+        self.assertEqual(sum(stats.usage_by_day.values()), self._raw_count("1", ()))
+        self.assertEqual(self.analytics.get_scanner_usage('website', BASE, BASE + timedelta(days=5))['unique_users'],
+                         len({e.user_id for e in self.events if e.scanner_type == 'website'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
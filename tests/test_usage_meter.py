@@ -0,0 +1,119 @@
+"""
+Usage Meter Tests
+Checks period buckets and the SQLite counter backend, including a
+concurrency stress test (threads and processes) for lost updates and limit
+overshoot. The Redis backend runs the same logic in a Lua script and needs a
+Redis server, so it is not covered here.
+"""
+
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.usage_meter import LAST_AT_FIELD, SQLiteUsageMeter, period_bucket
+
+
+def _consume_in_process(path, count, limit, results):
+    meter = SQLiteUsageMeter(path)
+    allowed = 0
+    for _ in range(count):
+        ok, _ = meter.consume('proc', '2025-01-01', ('total', 'code'), limit=limit)
+        allowed += ok
+    results.put(allowed)
+
+
+class TestPeriodBuckets(unittest.TestCase):
+    """Bucket names per reset period"""
+
+    def test_buckets(self):
+        when = datetime(2025, 3, 14, 12, 0)
+        self.assertEqual(period_bucket('daily', when)[0], '2025-03-14')
+        self.assertEqual(period_bucket('weekly', when)[0], '2025-W11')
+        self.assertEqual(period_bucket('monthly', when)[0], '2025-03')
+        self.assertEqual(period_bucket('yearly', when)[0], '2025')
+        self.assertEqual(period_bucket('lifetime', when), ('all', 0))
+
+    def test_iso_week_across_new_year(self):
+        # 2024-12-30 belongs to ISO week 1 of 2025; the old week-number
+        # comparison never reset usage across the year boundary
+        self.assertEqual(period_bucket('weekly', datetime(2024, 12, 30))[0], '2025-W01')
+
+
+class TestSQLiteUsageMeter(unittest.TestCase):
+    """Counter semantics of the SQLite backend"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="usage_meter_test_")
+        self.path = os.path.join(self.directory, "usage.db")
+        self.meter = SQLiteUsageMeter(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_consume_increments_all_fields(self):
+        self.assertEqual(self.meter.consume('alice', 'd1', ('total', 'code')), (True, 1))
+        self.assertEqual(self.meter.consume('alice', 'd1', ('total', 'document')), (True, 2))
+        counts = self.meter.counts('alice', 'd1')
+        self.assertEqual((counts['total'], counts['code'], counts['document']), (2, 1, 1))
+        self.assertIn(LAST_AT_FIELD, counts)
+
+    def test_limit_rejects_without_counting(self):
+        for _ in range(3):
+            self.assertTrue(self.meter.consume('bob', 'd1', ('total', 'code'), limit=3)[0])
+        self.assertEqual(self.meter.consume('bob', 'd1', ('total', 'code'), limit=3), (False, 3))
+        self.assertEqual(self.meter.counts('bob', 'd1')['code'], 3)
+        self.assertEqual(self.meter.consume('bob', 'd1', ('total',), amount=5, limit=1), (False, 3))
+
+    def test_seed_does_not_overwrite(self):
+        self.meter.seed('carol', 'd1', {'total': 4})
+        self.meter.seed('carol', 'd1', {'total': 9})
+        self.assertEqual(self.meter.consume('carol', 'd1', ('total',)), (True, 5))
+
+    def test_history_and_reset(self):
+        self.meter.consume('dave', 'd1', ('total',))
+        self.meter.consume('dave', 'd2', ('total',), amount=2)
+        history = self.meter.history('dave', ['d1', 'd2', 'd3'])
+        self.assertEqual((history['d1']['total'], history['d2']['total'], history['d3']), (1, 2, {}))
+        self.meter.reset('dave', 'd2')
+        self.assertEqual(self.meter.counts('dave', 'd2'), {})
+
+    def test_no_lost_updates_across_threads(self):
+        threads_count, per_thread = 16, 250
+
+        def worker():
+            for _ in range(per_thread):
+                self.meter.consume('stress', 'd1', ('total', 'code'))
+
+        threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counts = self.meter.counts('stress', 'd1')
+        self.assertEqual(counts['total'], threads_count * per_thread)
+        self.assertEqual(counts['code'], threads_count * per_thread)
+
+    def test_limit_holds_across_processes(self):
+        ctx = multiprocessing.get_context('fork')
+        results = ctx.Queue()
+        processes = [ctx.Process(target=_consume_in_process, args=(self.path, 300, 1000, results))
+                     for _ in range(4)]
+        for process in processes:
+            process.start()
+        allowed = sum(results.get(timeout=60) for _ in processes)
+        for process in processes:
+            process.join()
+        self.assertEqual(allowed, 1000)
+        self.assertEqual(self.meter.counts('proc', '2025-01-01')['total'], 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
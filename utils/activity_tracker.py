@@ -300,10 +300,10 @@ def get_dashboard_metrics(user_id: str) -> Dict[str, Any]:
     """Get dashboard metrics for a user from actual scan results"""
     try:
         # Get real scan data from database
-        from services.results_aggregator import ResultsAggregator
+        from services.results_aggregator import get_results_aggregator
         from services.compliance_score import ComplianceScoreManager
         
-        agg = ResultsAggregator()
+        agg = get_results_aggregator()
         recent_scans = agg.get_recent_scans(days=30)
         
         # Filter scans for this user - try multiple matching patterns
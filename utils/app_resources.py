@@ -0,0 +1,166 @@
+"""
+App Resources - Rerun Cost Management for the Streamlit UI
+
+Streamlit re-executes app.py on every interaction. This module keeps what
+a rerun repeats cheap:
+
+- session_query: per-session memoisation of read queries. Entries are
+  tagged with the tenant's scan-data generation (replaced whenever any
+  session stores a scan) and dropped explicitly by
+  invalidate_session_queries() when this session completes a scan.
+- render_block / render_timing_overlay: per-rerun timings of render blocks,
+  shown in the sidebar in debug mode (DG_DEBUG_RENDER_TIMINGS=1 or
+  ?debug=timings).
+
+Process-wide resources are the get_xxx() singletons of the services
+themselves and services.scanner_registry.get_shared_scanner.
+
+Outside a Streamlit session (scripts, tests) a module-level dict stands in
+for st.session_state.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    st = None
+    STREAMLIT_AVAILABLE = False
+
+from utils.redis_cache import get_compliance_cache
+
+# Upper bound on how stale a memoised query may get through changes that
+# do not replace the tenant generation (e.g. activity tracker entries)
+SESSION_QUERY_TTL = int(os.environ.get("DG_SESSION_QUERY_TTL", "60"))
+SESSION_QUERY_MAX_ENTRIES = 64
+
+DEBUG_RENDER_TIMINGS = os.environ.get("DG_DEBUG_RENDER_TIMINGS", "0").lower() in ('1', 'true', 'yes')
+
+_MEMO_KEY = '_session_query_memo'
+_TIMINGS_KEY = '_render_timings'
+
+_fallback_state: Dict[str, Any] = {}
+
+
+def _session_state():
+    if STREAMLIT_AVAILABLE:
+        try:
+            return st.session_state
+        except Exception:
+            pass
+    return _fallback_state
+
+
+def session_query(func: Callable[..., Any], *args: Any, tenant: str = 'default_org', **kwargs: Any) -> Any:
+    """
+    Run a read query once per session until its data changes.
+
+    Args:
+        func: Query function (e.g. a ResultsAggregator method)
+        *args: Positional arguments for func
+        tenant: Organization whose scan-data generation tags the result
+        **kwargs: Keyword arguments for func (must be hashable)
+
+    Returns:
+        The query result, from the session memo when still current
+    """
+    state = _session_state()
+    memo = state.setdefault(_MEMO_KEY, {})
+    key = (getattr(func, '__qualname__', repr(func)), args, tuple(sorted(kwargs.items())))
+    generation = get_compliance_cache().generation(tenant)
+    now = time.time()
+
+    entry = memo.get(key)
+    if entry is not None and entry[0] == generation and now - entry[1] < SESSION_QUERY_TTL:
+        _record_query(hit=True)
+        return entry[2]
+
+    _record_query(hit=False)
+    value = func(*args, **kwargs)
+    memo.pop(key, None)
+    memo[key] = (generation, now, value)
+    while len(memo) > SESSION_QUERY_MAX_ENTRIES:
+        memo.pop(next(iter(memo)))
+    return value
+
+
+def invalidate_session_queries() -> None:
+    """Drop every memoised query of the session (call when a scan completes)."""
+    _session_state().pop(_MEMO_KEY, None)
+
+
+def render_debug_enabled() -> bool:
+    """Whether the per-rerun timing overlay is shown"""
+    if DEBUG_RENDER_TIMINGS:
+        return True
+    if not STREAMLIT_AVAILABLE:
+        return False
+    try:
+        return st.query_params.get("debug") == "timings"
+    except Exception:
+        return False
+
+
+def start_rerun_timings() -> None:
+    """Reset the timings at the start of a rerun."""
+    _session_state()[_TIMINGS_KEY] = {'started': time.perf_counter(), 'depth': 0, 'blocks': [],
+                                      'query_hits': 0, 'query_misses': 0}
+
+
+def _record_query(hit: bool) -> None:
+    timings = _session_state().get(_TIMINGS_KEY)
+    if timings is not None:
+        timings['query_hits' if hit else 'query_misses'] += 1
+
+
+@contextmanager
+def render_block(name: str) -> Iterator[None]:
+    """Time a render block of the current rerun (nested blocks are indented)."""
+    timings = _session_state().get(_TIMINGS_KEY)
+    if timings is None:
+        yield
+        return
+    depth = timings['depth']
+    timings['depth'] = depth + 1
+    entry = [depth, name, 0.0]
+    timings['blocks'].append(entry)  # start order, so parents precede their children
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings['depth'] = depth
+        entry[2] = time.perf_counter() - start
+
+
+def rerun_timings() -> Tuple[float, List[Tuple[int, str, float]], Dict[str, int]]:
+    """
+    Timings of the current rerun.
+
+    Returns:
+        Tuple of (seconds since the rerun started, [(depth, block, seconds)]
+        in start order, session query hit/miss counts)
+    """
+    timings = _session_state().get(_TIMINGS_KEY)
+    if timings is None:
+        return 0.0, [], {'hits': 0, 'misses': 0}
+    return (time.perf_counter() - timings['started'], [tuple(entry) for entry in timings['blocks']],
+            {'hits': timings['query_hits'], 'misses': timings['query_misses']})
+
+
+def render_timing_overlay() -> None:
+    """Show the rerun's render block timings in the sidebar (debug mode only)."""
+    if not STREAMLIT_AVAILABLE or not render_debug_enabled():
+        return
+    total, blocks, queries = rerun_timings()
+    with st.sidebar.expander("⏱️ Render timings", expanded=True):
+        st.caption(f"Rerun so far: {total * 1000:.0f} ms · session queries: "
+                   f"{queries['hits']} memoised, {queries['misses']} executed")
+        rows = "\n".join(
+            f"| {'&nbsp;' * 4 * depth}{name} | {seconds * 1000:.1f} | {seconds / total * 100 if total else 0:.0f}% |"
+            for depth, name, seconds in blocks
+        )
+        st.markdown("| Block | ms | Share |\n|---|---:|---:|\n" + rows)
@@ -3,7 +3,6 @@ Cloud Provider EU-Compliance Validation
 Validates cloud provider EU residency and compliance requirements
 """
 
-import re
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Set, Tuple
@@ -11,6 +10,9 @@ from dataclasses import dataclass
 from enum import Enum
 import hashlib
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 class CloudProviderType(Enum):
     """Types of cloud providers"""
     HYPERSCALER = "hyperscaler"        # AWS, Azure, Google Cloud
@@ -54,6 +56,53 @@ class DataResidencyRequirement:
     audit_requirements: Dict[str, Any]
     compliance_evidence: List[str]
 
+
+# Identify cloud providers mentioned in content
+PROVIDER_PATTERNS = {
+    "aws": [
+        r"\b(?:amazon\s+web\s+services|aws)\b",
+        r"\b(?:ec2|s3|lambda|rds|dynamodb)\b",
+        r"\b(?:us-east-1|eu-west-1|eu-central-1)\b"
+    ],
+    "azure": [
+        r"\b(?:microsoft\s+azure|azure)\b",
+        r"\b(?:azure\s+functions|azure\s+storage|azure\s+sql)\b",
+        r"\b(?:westeurope|northeurope)\b"
+    ],
+    "google_cloud": [
+        r"\b(?:google\s+cloud|gcp|google\s+compute)\b",
+        r"\b(?:cloud\s+functions|cloud\s+storage|bigquery)\b",
+        r"\b(?:europe-west|us-central)\b"
+    ],
+    "ovh": [
+        r"\b(?:ovh|ovhcloud)\b",
+        r"\b(?:gra|sbg|rbx|wav)\b"
+    ],
+    "hetzner": [
+        r"\b(?:hetzner|hetzner\s+cloud)\b",
+        r"\b(?:nbg1|fsn1|hel1)\b"
+    ],
+    "scaleway": [
+        r"\b(?:scaleway)\b",
+        r"\b(?:par1|par2|ams1)\b"
+    ]
+}
+
+# Look for data residency indicators
+RESIDENCY_PATTERNS = [
+    r"\b(?:data\s+residency|data\s+location|data\s+sovereignty)\b",
+    r"\b(?:us-east|us-west|ap-south|ap-northeast)\b",  # Non-EU regions
+    r"\b(?:china|singapore|japan|australia)\s+(?:region|datacenter)\b"
+]
+
+# Check operational team residency compliance
+TEAM_PATTERNS = [
+    r"\b(?:support\s+team|operations\s+team|dev\s+team)\s+(?:in|located)\s+([^.\n]+)\b",
+    r"\b(?:managed\s+by|operated\s+by|staffed\s+by)\s+([^.\n]+)\b",
+    r"\b(?:24/7\s+support|round.*clock)\s+(?:from|in)\s+([^.\n]+)\b"
+]
+
+
 class CloudProviderEUComplianceValidator:
     """
     Validates cloud provider EU compliance and data sovereignty requirements
@@ -375,41 +424,12 @@ class CloudProviderEUComplianceValidator:
     
     def _identify_cloud_providers(self, content: str) -> Dict[str, List[str]]:
         """Identify cloud providers mentioned in content"""
-        provider_patterns = {
-            "aws": [
-                r"\b(?:amazon\s+web\s+services|aws)\b",
-                r"\b(?:ec2|s3|lambda|rds|dynamodb)\b",
-                r"\b(?:us-east-1|eu-west-1|eu-central-1)\b"
-            ],
-            "azure": [
-                r"\b(?:microsoft\s+azure|azure)\b",
-                r"\b(?:azure\s+functions|azure\s+storage|azure\s+sql)\b",
-                r"\b(?:westeurope|northeurope)\b"
-            ],
-            "google_cloud": [
-                r"\b(?:google\s+cloud|gcp|google\s+compute)\b",
-                r"\b(?:cloud\s+functions|cloud\s+storage|bigquery)\b",
-                r"\b(?:europe-west|us-central)\b"
-            ],
-            "ovh": [
-                r"\b(?:ovh|ovhcloud)\b",
-                r"\b(?:gra|sbg|rbx|wav)\b"
-            ],
-            "hetzner": [
-                r"\b(?:hetzner|hetzner\s+cloud)\b",
-                r"\b(?:nbg1|fsn1|hel1)\b"
-            ],
-            "scaleway": [
-                r"\b(?:scaleway)\b",
-                r"\b(?:par1|par2|ams1)\b"
-            ]
-        }
         
         detected = {}
-        for provider, patterns in provider_patterns.items():
+        for provider, patterns in PROVIDER_PATTERNS.items():
             matches = []
             for pattern in patterns:
-                found = re.findall(pattern, content, re.IGNORECASE)
+                found = _RULES.findall(pattern, content)
                 matches.extend(found)
             
             if matches:
@@ -498,16 +518,9 @@ class CloudProviderEUComplianceValidator:
         """Check data residency compliance requirements"""
         findings = []
         
-        # Look for data residency indicators
-        residency_patterns = [
-            r"\b(?:data\s+residency|data\s+location|data\s+sovereignty)\b",
-            r"\b(?:us-east|us-west|ap-south|ap-northeast)\b",  # Non-EU regions
-            r"\b(?:china|singapore|japan|australia)\s+(?:region|datacenter)\b"
-        ]
-        
         non_eu_indicators = []
-        for pattern in residency_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in RESIDENCY_PATTERNS:
+            matches = _RULES.findall(pattern, content)
             non_eu_indicators.extend(matches)
         
         if non_eu_indicators:
@@ -529,15 +542,9 @@ class CloudProviderEUComplianceValidator:
         """Check operational team residency compliance"""
         findings = []
         
-        team_patterns = [
-            r"\b(?:support\s+team|operations\s+team|dev\s+team)\s+(?:in|located)\s+([^.\n]+)\b",
-            r"\b(?:managed\s+by|operated\s+by|staffed\s+by)\s+([^.\n]+)\b",
-            r"\b(?:24/7\s+support|round.*clock)\s+(?:from|in)\s+([^.\n]+)\b"
-        ]
-        
         non_eu_teams = []
-        for pattern in team_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in TEAM_PATTERNS:
+            matches = _RULES.finditer(pattern, content)
             for match in matches:
                 location = match.group(1).strip()
                 if any(country in location.lower() for country in ["usa", "united states", "india", "china", "singapore"]):
@@ -777,4 +784,10 @@ class CloudProviderEUComplianceValidator:
         elif profile.provider_type == CloudProviderType.HYPERSCALER:
             return "Standard market rates with premium compliance features"
         else:
-            return "Variable - depends on specific requirements"
\ No newline at end of file
+            return "Variable - depends on specific requirements"
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    PROVIDER_PATTERNS, RESIDENCY_PATTERNS, TEAM_PATTERNS,
+)
@@ -6,10 +6,12 @@ Implements systematic coverage across all GDPR requirements including enhanced
 Articles 6 (lawfulness), 7 (consent), and 8 (children) validation.
 """
 
-import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 # Complete GDPR Articles Structure (1-99)
 GDPR_COMPLETE_STRUCTURE = {
     "chapter_1_general": {
@@ -171,24 +173,27 @@ def _validate_chapter_1_general_provisions(content: str) -> List[Dict[str, Any]]
     
     return findings
 
+
+# Validate Article 1: Subject-matter and objectives
+DATA_PROTECTION_PATTERNS = [
+    r"\b(?:personal\s+data|data\s+protection|processing|privacy)\b",
+    r"\b(?:individual|natural\s+person|data\s+subject)\b"
+]
+
+OBJECTIVE_PATTERNS = [
+    r"\b(?:protection.*fundamental.*rights|right.*privacy|data.*protection.*objective)\b",
+    r"\b(?:free.*movement.*personal.*data|fundamental.*rights.*freedom)\b"
+]
+
+
 def _validate_article_1_subject_matter(content: str) -> List[Dict[str, Any]]:
     """Validate Article 1: Subject-matter and objectives."""
     findings = []
     
-    data_protection_patterns = [
-        r"\b(?:personal\s+data|data\s+protection|processing|privacy)\b",
-        r"\b(?:individual|natural\s+person|data\s+subject)\b"
-    ]
-    
-    has_data_protection_scope = any(re.search(pattern, content, re.IGNORECASE) for pattern in data_protection_patterns)
+    has_data_protection_scope = any(_RULES.search(pattern, content) for pattern in DATA_PROTECTION_PATTERNS)
     
     if has_data_protection_scope:
-        objective_patterns = [
-            r"\b(?:protection.*fundamental.*rights|right.*privacy|data.*protection.*objective)\b",
-            r"\b(?:free.*movement.*personal.*data|fundamental.*rights.*freedom)\b"
-        ]
-        
-        has_clear_objectives = any(re.search(pattern, content, re.IGNORECASE) for pattern in objective_patterns)
+        has_clear_objectives = any(_RULES.search(pattern, content) for pattern in OBJECTIVE_PATTERNS)
         
         if not has_clear_objectives:
             findings.append({
@@ -203,31 +208,34 @@ def _validate_article_1_subject_matter(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Validate Article 2: Material scope
+ARTICLE_2_MATERIAL_SCOPE_PROCESSING_PATTERNS = [
+    r"\b(?:wholly.*automated|partly.*automated|structured.*filing)\b",
+    r"\b(?:personal\s+data.*processing|automated.*processing)\b"
+]
+
+# Check for scope exclusions awareness
+EXCLUSION_PATTERNS = [
+    r"\b(?:purely.*personal.*household|law.*enforcement|national.*security)\b",
+    r"\b(?:outside.*scope.*union.*law|purely.*personal.*activity)\b"
+]
+
+# Check for commercial/organizational context
+COMMERCIAL_PATTERNS = [
+    r"\b(?:business|commercial|organization|company|enterprise)\b"
+]
+
+
 def _validate_article_2_material_scope(content: str) -> List[Dict[str, Any]]:
     """Validate Article 2: Material scope."""
     findings = []
     
-    processing_patterns = [
-        r"\b(?:wholly.*automated|partly.*automated|structured.*filing)\b",
-        r"\b(?:personal\s+data.*processing|automated.*processing)\b"
-    ]
-    
-    has_processing_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing_reference = any(_RULES.search(pattern, content) for pattern in ARTICLE_2_MATERIAL_SCOPE_PROCESSING_PATTERNS)
     
     if has_processing_reference:
-        # Check for scope exclusions awareness
-        exclusion_patterns = [
-            r"\b(?:purely.*personal.*household|law.*enforcement|national.*security)\b",
-            r"\b(?:outside.*scope.*union.*law|purely.*personal.*activity)\b"
-        ]
-        
-        # Check for commercial/organizational context
-        commercial_patterns = [
-            r"\b(?:business|commercial|organization|company|enterprise)\b"
-        ]
-        
-        has_commercial_context = any(re.search(pattern, content, re.IGNORECASE) for pattern in commercial_patterns)
-        has_exclusion_awareness = any(re.search(pattern, content, re.IGNORECASE) for pattern in exclusion_patterns)
+        has_commercial_context = any(_RULES.search(pattern, content) for pattern in COMMERCIAL_PATTERNS)
+        has_exclusion_awareness = any(_RULES.search(pattern, content) for pattern in EXCLUSION_PATTERNS)
         
         if has_commercial_context and not has_exclusion_awareness:
             findings.append({
@@ -242,23 +250,26 @@ def _validate_article_2_material_scope(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Validate Article 3: Territorial scope
+TERRITORIAL_INDICATORS = [
+    r"\b(?:establishment.*union|main.*establishment|eu.*establishment)\b",
+    r"\b(?:goods.*services.*union|monitoring.*behavior.*union)\b",
+    r"\b(?:offering.*goods.*eu|targeting.*eu.*individuals)\b"
+]
+
+GEOGRAPHIC_PATTERNS = [
+    r"\b(?:european.*union|eu|europe|netherlands|germany|france|belgium)\b",
+    r"\b(?:united.*states|usa|china|international|global|worldwide)\b"
+]
+
+
 def _validate_article_3_territorial_scope(content: str) -> List[Dict[str, Any]]:
     """Validate Article 3: Territorial scope."""
     findings = []
     
-    territorial_indicators = [
-        r"\b(?:establishment.*union|main.*establishment|eu.*establishment)\b",
-        r"\b(?:goods.*services.*union|monitoring.*behavior.*union)\b",
-        r"\b(?:offering.*goods.*eu|targeting.*eu.*individuals)\b"
-    ]
-    
-    geographic_patterns = [
-        r"\b(?:european.*union|eu|europe|netherlands|germany|france|belgium)\b",
-        r"\b(?:united.*states|usa|china|international|global|worldwide)\b"
-    ]
-    
-    has_geographic_scope = any(re.search(pattern, content, re.IGNORECASE) for pattern in geographic_patterns)
-    has_territorial_clarity = any(re.search(pattern, content, re.IGNORECASE) for pattern in territorial_indicators)
+    has_geographic_scope = any(_RULES.search(pattern, content) for pattern in GEOGRAPHIC_PATTERNS)
+    has_territorial_clarity = any(_RULES.search(pattern, content) for pattern in TERRITORIAL_INDICATORS)
     
     if has_geographic_scope and not has_territorial_clarity:
         findings.append({
@@ -273,30 +284,32 @@ def _validate_article_3_territorial_scope(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Key GDPR terms that should be properly defined
+KEY_DEFINITIONS = {
+    'personal_data': r"\b(?:personal\s+data.*means|personal\s+data.*definition)\b",
+    'processing': r"\b(?:processing.*means|processing.*definition|operation.*performed)\b",
+    'controller': r"\b(?:controller.*means|controller.*definition|determines.*purposes)\b",
+    'processor': r"\b(?:processor.*means|processor.*definition|processes.*behalf)\b",
+    'data_subject': r"\b(?:data\s+subject.*means|natural\s+person.*identified)\b",
+    'consent': r"\b(?:consent.*means|freely.*given.*specific.*informed)\b"
+}
+
+ARTICLE_4_DEFINITIONS_PROCESSING_INDICATORS = [
+    r"\b(?:personal\s+data|processing|controller|processor|data\s+subject|consent)\b"
+]
+
+
 def _validate_article_4_definitions(content: str) -> List[Dict[str, Any]]:
     """Validate Article 4: Definitions."""
     findings = []
     
-    # Key GDPR terms that should be properly defined
-    key_definitions = {
-        'personal_data': r"\b(?:personal\s+data.*means|personal\s+data.*definition)\b",
-        'processing': r"\b(?:processing.*means|processing.*definition|operation.*performed)\b",
-        'controller': r"\b(?:controller.*means|controller.*definition|determines.*purposes)\b",
-        'processor': r"\b(?:processor.*means|processor.*definition|processes.*behalf)\b",
-        'data_subject': r"\b(?:data\s+subject.*means|natural\s+person.*identified)\b",
-        'consent': r"\b(?:consent.*means|freely.*given.*specific.*informed)\b"
-    }
-    
-    processing_indicators = [
-        r"\b(?:personal\s+data|processing|controller|processor|data\s+subject|consent)\b"
-    ]
-    
-    has_gdpr_terminology = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_indicators)
+    has_gdpr_terminology = any(_RULES.search(pattern, content) for pattern in ARTICLE_4_DEFINITIONS_PROCESSING_INDICATORS)
     
     if has_gdpr_terminology:
         missing_definitions = []
-        for term, pattern in key_definitions.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for term, pattern in KEY_DEFINITIONS.items():
+            if not _RULES.search(pattern, content):
                 missing_definitions.append(term.replace('_', ' '))
         
         if len(missing_definitions) > 3:
@@ -342,48 +355,52 @@ def _validate_chapter_2_principles(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Validate Article 5: Principles of processing
+ARTICLE_5_PRINCIPLES_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|processing|collect|store|use)\b"]
+
+PRINCIPLES = {
+    'lawfulness_fairness_transparency': {
+        'patterns': [r"\b(?:lawful.*fair.*transparent|lawful\s+basis|fair\s+processing|transparent\s+manner)\b"],
+        'title': 'Lawfulness, fairness and transparency principle violated'
+    },
+    'purpose_limitation': {
+        'patterns': [r"\b(?:specified.*explicit.*legitimate\s+purposes|purpose\s+limitation|compatible\s+purpose)\b"],
+        'title': 'Purpose limitation principle violated'
+    },
+    'data_minimisation': {
+        'patterns': [r"\b(?:adequate.*relevant.*limited|data\s+minimisation|necessary\s+data)\b"],
+        'title': 'Data minimisation principle violated'
+    },
+    'accuracy': {
+        'patterns': [r"\b(?:accurate.*up.*to.*date|inaccurate.*erased.*rectified|data\s+accuracy)\b"],
+        'title': 'Accuracy principle violated'
+    },
+    'storage_limitation': {
+        'patterns': [r"\b(?:no\s+longer.*necessary|storage\s+limitation|retention\s+period)\b"],
+        'title': 'Storage limitation principle violated'
+    },
+    'integrity_confidentiality': {
+        'patterns': [r"\b(?:security.*processing|integrity.*confidentiality|appropriate\s+security)\b"],
+        'title': 'Integrity and confidentiality principle violated'
+    },
+    'accountability': {
+        'patterns': [r"\b(?:demonstrate\s+compliance|accountability|responsible\s+for\s+compliance)\b"],
+        'title': 'Accountability principle violated'
+    }
+}
+
+
 def _validate_article_5_principles(content: str) -> List[Dict[str, Any]]:
     """Validate Article 5: Principles of processing."""
     findings = []
     
-    processing_patterns = [r"\b(?:personal\s+data|processing|collect|store|use)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in ARTICLE_5_PRINCIPLES_PROCESSING_PATTERNS)
     
     if has_processing:
-        principles = {
-            'lawfulness_fairness_transparency': {
-                'patterns': [r"\b(?:lawful.*fair.*transparent|lawful\s+basis|fair\s+processing|transparent\s+manner)\b"],
-                'title': 'Lawfulness, fairness and transparency principle violated'
-            },
-            'purpose_limitation': {
-                'patterns': [r"\b(?:specified.*explicit.*legitimate\s+purposes|purpose\s+limitation|compatible\s+purpose)\b"],
-                'title': 'Purpose limitation principle violated'
-            },
-            'data_minimisation': {
-                'patterns': [r"\b(?:adequate.*relevant.*limited|data\s+minimisation|necessary\s+data)\b"],
-                'title': 'Data minimisation principle violated'
-            },
-            'accuracy': {
-                'patterns': [r"\b(?:accurate.*up.*to.*date|inaccurate.*erased.*rectified|data\s+accuracy)\b"],
-                'title': 'Accuracy principle violated'
-            },
-            'storage_limitation': {
-                'patterns': [r"\b(?:no\s+longer.*necessary|storage\s+limitation|retention\s+period)\b"],
-                'title': 'Storage limitation principle violated'
-            },
-            'integrity_confidentiality': {
-                'patterns': [r"\b(?:security.*processing|integrity.*confidentiality|appropriate\s+security)\b"],
-                'title': 'Integrity and confidentiality principle violated'
-            },
-            'accountability': {
-                'patterns': [r"\b(?:demonstrate\s+compliance|accountability|responsible\s+for\s+compliance)\b"],
-                'title': 'Accountability principle violated'
-            }
-        }
-        
         violated_principles = []
-        for principle, config in principles.items():
-            has_principle = any(re.search(pattern, content, re.IGNORECASE) for pattern in config['patterns'])
+        for principle, config in PRINCIPLES.items():
+            has_principle = any(_RULES.search(pattern, content) for pattern in config['patterns'])
             if not has_principle:
                 violated_principles.append({
                     'principle': principle.replace('_', ' '),
@@ -404,49 +421,57 @@ def _validate_article_5_principles(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced validation for Article 6: Lawfulness of processing
+ARTICLE_6_LAWFULNESS_ENHANCED_PROCESSING_INDICATORS = [
+    r"\b(?:personal\s+data|processing|collect|store|use|share|transfer|analyse)\b",
+    r"\b(?:customer\s+data|user\s+information|individual\s+data|subscriber\s+data)\b"
+]
+
+# All six legal bases under Article 6(1)
+LEGAL_BASES = {
+    'consent': {
+        'patterns': [r"\b(?:consent|freely\s+given|specific|informed|unambiguous\s+indication)\b"],
+        'title': 'Consent (Article 6(1)(a))'
+    },
+    'contract': {
+        'patterns': [r"\b(?:contract|performance\s+of.*contract|pre.*contractual\s+measures)\b"],
+        'title': 'Contract (Article 6(1)(b))'
+    },
+    'legal_obligation': {
+        'patterns': [r"\b(?:legal\s+obligation|compliance.*legal\s+obligation|legal\s+requirement)\b"],
+        'title': 'Legal obligation (Article 6(1)(c))'
+    },
+    'vital_interests': {
+        'patterns': [r"\b(?:vital\s+interests|life.*death|medical\s+emergency|life.*threatening)\b"],
+        'title': 'Vital interests (Article 6(1)(d))'
+    },
+    'public_task': {
+        'patterns': [r"\b(?:public\s+task|official\s+authority|public\s+interest|exercise.*official\s+authority)\b"],
+        'title': 'Public task (Article 6(1)(e))'
+    },
+    'legitimate_interests': {
+        'patterns': [r"\b(?:legitimate\s+interests?|balancing.*test|overriding.*interests?|legitimate.*interest.*assessment)\b"],
+        'title': 'Legitimate interests (Article 6(1)(f))'
+    }
+}
+
+BALANCING_PATTERNS = [
+    r"\b(?:balancing.*test|legitimate.*interest.*assessment|overriding.*interests?.*data\s+subject)\b",
+    r"\b(?:weigh.*interests?|balance.*legitimate.*interests?|less.*intrusive.*means)\b"
+]
+
+
 def _validate_article_6_lawfulness_enhanced(content: str) -> List[Dict[str, Any]]:
     """Enhanced validation for Article 6: Lawfulness of processing."""
     findings = []
     
-    processing_indicators = [
-        r"\b(?:personal\s+data|processing|collect|store|use|share|transfer|analyse)\b",
-        r"\b(?:customer\s+data|user\s+information|individual\s+data|subscriber\s+data)\b"
-    ]
-    
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_indicators)
+    has_processing = any(_RULES.search(pattern, content) for pattern in ARTICLE_6_LAWFULNESS_ENHANCED_PROCESSING_INDICATORS)
     
     if has_processing:
-        # All six legal bases under Article 6(1)
-        legal_bases = {
-            'consent': {
-                'patterns': [r"\b(?:consent|freely\s+given|specific|informed|unambiguous\s+indication)\b"],
-                'title': 'Consent (Article 6(1)(a))'
-            },
-            'contract': {
-                'patterns': [r"\b(?:contract|performance\s+of.*contract|pre.*contractual\s+measures)\b"],
-                'title': 'Contract (Article 6(1)(b))'
-            },
-            'legal_obligation': {
-                'patterns': [r"\b(?:legal\s+obligation|compliance.*legal\s+obligation|legal\s+requirement)\b"],
-                'title': 'Legal obligation (Article 6(1)(c))'
-            },
-            'vital_interests': {
-                'patterns': [r"\b(?:vital\s+interests|life.*death|medical\s+emergency|life.*threatening)\b"],
-                'title': 'Vital interests (Article 6(1)(d))'
-            },
-            'public_task': {
-                'patterns': [r"\b(?:public\s+task|official\s+authority|public\s+interest|exercise.*official\s+authority)\b"],
-                'title': 'Public task (Article 6(1)(e))'
-            },
-            'legitimate_interests': {
-                'patterns': [r"\b(?:legitimate\s+interests?|balancing.*test|overriding.*interests?|legitimate.*interest.*assessment)\b"],
-                'title': 'Legitimate interests (Article 6(1)(f))'
-            }
-        }
-        
         identified_bases = []
-        for basis, config in legal_bases.items():
-            has_basis = any(re.search(pattern, content, re.IGNORECASE) for pattern in config['patterns'])
+        for basis, config in LEGAL_BASES.items():
+            has_basis = any(_RULES.search(pattern, content) for pattern in config['patterns'])
             if has_basis:
                 identified_bases.append(config['title'])
         
@@ -459,18 +484,13 @@ def _validate_article_6_lawfulness_enhanced(content: str) -> List[Dict[str, Any]
                 'title': 'No Legal Basis for Processing Identified',
                 'description': 'Personal data processing detected without valid Article 6(1) legal basis',
                 'article_reference': 'GDPR Article 6(1)',
-                'available_bases': list(legal_bases.keys()),
+                'available_bases': list(LEGAL_BASES.keys()),
                 'recommendation': 'Establish valid legal basis: consent, contract, legal obligation, vital interests, public task, or legitimate interests'
             })
         
         # Check for legitimate interests balancing test (Article 6(1)(f))
         if 'Legitimate interests (Article 6(1)(f))' in identified_bases:
-            balancing_patterns = [
-                r"\b(?:balancing.*test|legitimate.*interest.*assessment|overriding.*interests?.*data\s+subject)\b",
-                r"\b(?:weigh.*interests?|balance.*legitimate.*interests?|less.*intrusive.*means)\b"
-            ]
-            
-            has_balancing_test = any(re.search(pattern, content, re.IGNORECASE) for pattern in balancing_patterns)
+            has_balancing_test = any(_RULES.search(pattern, content) for pattern in BALANCING_PATTERNS)
             
             if not has_balancing_test:
                 findings.append({
@@ -498,21 +518,45 @@ def _validate_article_6_lawfulness_enhanced(content: str) -> List[Dict[str, Any]
     
     return findings
 
+
+# Enhanced validation for Article 7: Conditions for consent
+CONSENT_PATTERNS = [r"\b(?:consent|agree|accept|permission|authorization)\b"]
+
+# Article 7(1): Demonstrating consent
+DEMONSTRATION_PATTERNS = [
+    r"\b(?:demonstrate.*consent|evidence.*consent|record.*consent|proof.*consent)\b",
+    r"\b(?:consent.*record|documented.*consent|verifiable.*consent)\b"
+]
+
+# Article 7(2): Clear and plain language
+LANGUAGE_PATTERNS = [
+    r"\b(?:plain\s+language|clear.*language|easily.*understandable|intelligible)\b",
+    r"\b(?:distinguishable.*other\s+matters|clear.*consent\s+request)\b"
+]
+
+# Article 7(3): Right to withdraw consent
+WITHDRAWAL_PATTERNS = [
+    r"\b(?:withdraw\s+consent|revoke.*consent|opt.*out|unsubscribe)\b",
+    r"\b(?:easy.*withdraw|simple.*withdraw|withdraw.*easy)\b"
+]
+
+# Article 7(4): Conditional consent assessment
+CONDITIONAL_PATTERNS = [
+    r"\b(?:conditional.*consent|bundled.*consent|tied.*consent)\b",
+    r"\b(?:necessary.*performance.*contract|contract.*conditional.*consent)\b"
+]
+
+CONTRACT_PATTERNS = [r"\b(?:contract|service\s+provision|product\s+delivery)\b"]
+
+
 def _validate_article_7_consent_enhanced(content: str) -> List[Dict[str, Any]]:
     """Enhanced validation for Article 7: Conditions for consent."""
     findings = []
     
-    consent_patterns = [r"\b(?:consent|agree|accept|permission|authorization)\b"]
-    has_consent_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in consent_patterns)
+    has_consent_reference = any(_RULES.search(pattern, content) for pattern in CONSENT_PATTERNS)
     
     if has_consent_reference:
-        # Article 7(1): Demonstrating consent
-        demonstration_patterns = [
-            r"\b(?:demonstrate.*consent|evidence.*consent|record.*consent|proof.*consent)\b",
-            r"\b(?:consent.*record|documented.*consent|verifiable.*consent)\b"
-        ]
-        
-        has_demonstration = any(re.search(pattern, content, re.IGNORECASE) for pattern in demonstration_patterns)
+        has_demonstration = any(_RULES.search(pattern, content) for pattern in DEMONSTRATION_PATTERNS)
         
         if not has_demonstration:
             findings.append({
@@ -525,13 +569,7 @@ def _validate_article_7_consent_enhanced(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Implement systems to demonstrate that data subject has consented to processing'
             })
         
-        # Article 7(2): Clear and plain language
-        language_patterns = [
-            r"\b(?:plain\s+language|clear.*language|easily.*understandable|intelligible)\b",
-            r"\b(?:distinguishable.*other\s+matters|clear.*consent\s+request)\b"
-        ]
-        
-        has_clear_language = any(re.search(pattern, content, re.IGNORECASE) for pattern in language_patterns)
+        has_clear_language = any(_RULES.search(pattern, content) for pattern in LANGUAGE_PATTERNS)
         
         if not has_clear_language:
             findings.append({
@@ -544,13 +582,7 @@ def _validate_article_7_consent_enhanced(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Ensure consent requests use clear, plain language distinguishable from other matters'
             })
         
-        # Article 7(3): Right to withdraw consent
-        withdrawal_patterns = [
-            r"\b(?:withdraw\s+consent|revoke.*consent|opt.*out|unsubscribe)\b",
-            r"\b(?:easy.*withdraw|simple.*withdraw|withdraw.*easy)\b"
-        ]
-        
-        has_withdrawal = any(re.search(pattern, content, re.IGNORECASE) for pattern in withdrawal_patterns)
+        has_withdrawal = any(_RULES.search(pattern, content) for pattern in WITHDRAWAL_PATTERNS)
         
         if not has_withdrawal:
             findings.append({
@@ -563,16 +595,8 @@ def _validate_article_7_consent_enhanced(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Provide easy mechanism for data subjects to withdraw consent at any time'
             })
         
-        # Article 7(4): Conditional consent assessment
-        conditional_patterns = [
-            r"\b(?:conditional.*consent|bundled.*consent|tied.*consent)\b",
-            r"\b(?:necessary.*performance.*contract|contract.*conditional.*consent)\b"
-        ]
-        
-        contract_patterns = [r"\b(?:contract|service\s+provision|product\s+delivery)\b"]
-        
-        has_contract_context = any(re.search(pattern, content, re.IGNORECASE) for pattern in contract_patterns)
-        has_conditional_assessment = any(re.search(pattern, content, re.IGNORECASE) for pattern in conditional_patterns)
+        has_contract_context = any(_RULES.search(pattern, content) for pattern in CONTRACT_PATTERNS)
+        has_conditional_assessment = any(_RULES.search(pattern, content) for pattern in CONDITIONAL_PATTERNS)
         
         if has_contract_context and not has_conditional_assessment:
             findings.append({
@@ -587,27 +611,54 @@ def _validate_article_7_consent_enhanced(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced validation for Article 8: Conditions applicable to child's consent
+CHILDREN_PATTERNS = [
+    r"\b(?:child|children|minor|under.*16|under.*13|young\s+person)\b",
+    r"\b(?:age.*verification|parental.*consent|guardian.*approval|age.*gate)\b",
+    r"\b(?:information.*society.*service|online.*service|digital.*service)\b"
+]
+
+# Article 8(1): Age threshold (16 or lower as set by Member State)
+AGE_PATTERNS = [
+    r"\b(?:16.*years?\s+old|sixteen.*years|age.*16|minimum.*age.*16)\b",
+    r"\b(?:13.*years?\s+old|age.*13|minimum.*age.*13)\b",  # Some Member States set lower
+    r"\b(?:age.*threshold|age.*limit|age.*requirement)\b"
+]
+
+# Parental consent requirements
+PARENTAL_PATTERNS = [
+    r"\b(?:parental.*consent|parent.*approval|guardian.*consent|holder.*parental.*responsibility)\b",
+    r"\b(?:verifiable.*parental.*consent|parental.*authorization)\b"
+]
+
+# Information society services context
+ISS_PATTERNS = [
+    r"\b(?:information.*society.*service|online.*platform|digital.*service|internet.*service)\b",
+    r"\b(?:social.*media|gaming.*platform|educational.*app|entertainment.*service)\b"
+]
+
+# Check for prohibited practices targeting children
+TARGETING_PATTERNS = [
+    r"\b(?:target.*children|marketing.*children|advertis.*children|profiling.*children)\b",
+    r"\b(?:behavioral.*advertising.*children|tracking.*children)\b"
+]
+
+# Enhanced protection for children online
+PROTECTION_PATTERNS = [
+    r"\b(?:child.*protection.*measures|age.*appropriate.*design|child.*safety)\b",
+    r"\b(?:default.*privacy.*settings|minimal.*data.*collection|children.*privacy)\b"
+]
+
+
 def _validate_article_8_children_enhanced(content: str) -> List[Dict[str, Any]]:
     """Enhanced validation for Article 8: Conditions applicable to child's consent."""
     findings = []
     
-    children_patterns = [
-        r"\b(?:child|children|minor|under.*16|under.*13|young\s+person)\b",
-        r"\b(?:age.*verification|parental.*consent|guardian.*approval|age.*gate)\b",
-        r"\b(?:information.*society.*service|online.*service|digital.*service)\b"
-    ]
-    
-    has_children_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in children_patterns)
+    has_children_reference = any(_RULES.search(pattern, content) for pattern in CHILDREN_PATTERNS)
     
     if has_children_reference:
-        # Article 8(1): Age threshold (16 or lower as set by Member State)
-        age_patterns = [
-            r"\b(?:16.*years?\s+old|sixteen.*years|age.*16|minimum.*age.*16)\b",
-            r"\b(?:13.*years?\s+old|age.*13|minimum.*age.*13)\b",  # Some Member States set lower
-            r"\b(?:age.*threshold|age.*limit|age.*requirement)\b"
-        ]
-        
-        has_age_verification = any(re.search(pattern, content, re.IGNORECASE) for pattern in age_patterns)
+        has_age_verification = any(_RULES.search(pattern, content) for pattern in AGE_PATTERNS)
         
         if not has_age_verification:
             findings.append({
@@ -620,13 +671,7 @@ def _validate_article_8_children_enhanced(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Implement age verification to ensure compliance with 16-year threshold (or lower as set by Member State)'
             })
         
-        # Parental consent requirements
-        parental_patterns = [
-            r"\b(?:parental.*consent|parent.*approval|guardian.*consent|holder.*parental.*responsibility)\b",
-            r"\b(?:verifiable.*parental.*consent|parental.*authorization)\b"
-        ]
-        
-        has_parental_consent = any(re.search(pattern, content, re.IGNORECASE) for pattern in parental_patterns)
+        has_parental_consent = any(_RULES.search(pattern, content) for pattern in PARENTAL_PATTERNS)
         
         if not has_parental_consent:
             findings.append({
@@ -639,22 +684,10 @@ def _validate_article_8_children_enhanced(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Obtain and verify consent from holder of parental responsibility for children under 16'
             })
         
-        # Information society services context
-        iss_patterns = [
-            r"\b(?:information.*society.*service|online.*platform|digital.*service|internet.*service)\b",
-            r"\b(?:social.*media|gaming.*platform|educational.*app|entertainment.*service)\b"
-        ]
-        
-        has_iss_context = any(re.search(pattern, content, re.IGNORECASE) for pattern in iss_patterns)
+        has_iss_context = any(_RULES.search(pattern, content) for pattern in ISS_PATTERNS)
         
         if has_iss_context:
-            # Enhanced protection for children online
-            protection_patterns = [
-                r"\b(?:child.*protection.*measures|age.*appropriate.*design|child.*safety)\b",
-                r"\b(?:default.*privacy.*settings|minimal.*data.*collection|children.*privacy)\b"
-            ]
-            
-            has_enhanced_protection = any(re.search(pattern, content, re.IGNORECASE) for pattern in protection_patterns)
+            has_enhanced_protection = any(_RULES.search(pattern, content) for pattern in PROTECTION_PATTERNS)
             
             if not has_enhanced_protection:
                 findings.append({
@@ -667,13 +700,7 @@ def _validate_article_8_children_enhanced(content: str) -> List[Dict[str, Any]]:
                     'recommendation': 'Implement age-appropriate design and enhanced privacy protections for children using information society services'
                 })
         
-        # Check for prohibited practices targeting children
-        targeting_patterns = [
-            r"\b(?:target.*children|marketing.*children|advertis.*children|profiling.*children)\b",
-            r"\b(?:behavioral.*advertising.*children|tracking.*children)\b"
-        ]
-        
-        has_inappropriate_targeting = any(re.search(pattern, content, re.IGNORECASE) for pattern in targeting_patterns)
+        has_inappropriate_targeting = any(_RULES.search(pattern, content) for pattern in TARGETING_PATTERNS)
         
         if has_inappropriate_targeting:
             findings.append({
@@ -688,45 +715,47 @@ def _validate_article_8_children_enhanced(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Special categories under Article 9(1)
+SPECIAL_CATEGORIES = {
+    'racial_ethnic': [r"\b(?:racial.*origin|ethnic.*origin|ethnicity|race)\b"],
+    'political_opinions': [r"\b(?:political.*opinion|political.*view|political.*affiliation)\b"],
+    'religious_beliefs': [r"\b(?:religious.*belief|philosophical.*belief|religion|faith)\b"],
+    'trade_union': [r"\b(?:trade.*union.*membership|union.*membership|labor.*union)\b"],
+    'genetic_data': [r"\b(?:genetic.*data|dna|genome|genetic.*information)\b"],
+    'biometric_data': [r"\b(?:biometric.*data|fingerprint|facial.*recognition|biometric.*identification)\b"],
+    'health_data': [r"\b(?:health.*data|medical.*data|patient.*data|health.*information)\b"],
+    'sex_life': [r"\b(?:sex.*life|sexual.*orientation|sexual.*behavior|sexual.*preference)\b"]
+}
+
+# Check for Article 9(2) exceptions
+EXCEPTIONS = {
+    'explicit_consent': [r"\b(?:explicit.*consent|express.*consent|specific.*consent)\b"],
+    'employment_law': [r"\b(?:employment.*law|social.*security.*law|social.*protection)\b"],
+    'vital_interests': [r"\b(?:vital.*interests|life.*death|medical.*emergency)\b"],
+    'legitimate_activities': [r"\b(?:legitimate.*activities.*foundation|association.*union.*organization)\b"],
+    'public_domain': [r"\b(?:manifestly.*made.*public|public.*domain|publicly.*available)\b"],
+    'legal_claims': [r"\b(?:legal.*claims|establishment.*defense.*legal\s+claims)\b"],
+    'substantial_public_interest': [r"\b(?:substantial.*public.*interest|public.*health|official.*authority)\b"],
+    'medical_purposes': [r"\b(?:preventive.*medicine|medical.*diagnosis|health.*care|medical.*treatment)\b"],
+    'public_health': [r"\b(?:public.*health|serious.*cross.*border.*threats|health.*system)\b"],
+    'archiving_research': [r"\b(?:archiving.*public.*interest|scientific.*research|statistical.*purposes)\b"]
+}
+
+
 def _validate_article_9_special_categories(content: str) -> List[Dict[str, Any]]:
     """Validate Article 9: Processing of special categories of personal data."""
     findings = []
     
-    # Special categories under Article 9(1)
-    special_categories = {
-        'racial_ethnic': [r"\b(?:racial.*origin|ethnic.*origin|ethnicity|race)\b"],
-        'political_opinions': [r"\b(?:political.*opinion|political.*view|political.*affiliation)\b"],
-        'religious_beliefs': [r"\b(?:religious.*belief|philosophical.*belief|religion|faith)\b"],
-        'trade_union': [r"\b(?:trade.*union.*membership|union.*membership|labor.*union)\b"],
-        'genetic_data': [r"\b(?:genetic.*data|dna|genome|genetic.*information)\b"],
-        'biometric_data': [r"\b(?:biometric.*data|fingerprint|facial.*recognition|biometric.*identification)\b"],
-        'health_data': [r"\b(?:health.*data|medical.*data|patient.*data|health.*information)\b"],
-        'sex_life': [r"\b(?:sex.*life|sexual.*orientation|sexual.*behavior|sexual.*preference)\b"]
-    }
-    
     detected_categories = []
-    for category, patterns in special_categories.items():
-        if any(any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns) for patterns in [patterns]):
+    for category, patterns in SPECIAL_CATEGORIES.items():
+        if any(any(_RULES.search(pattern, content) for pattern in patterns) for patterns in [patterns]):
             detected_categories.append(category.replace('_', ' '))
     
     if detected_categories:
-        # Check for Article 9(2) exceptions
-        exceptions = {
-            'explicit_consent': [r"\b(?:explicit.*consent|express.*consent|specific.*consent)\b"],
-            'employment_law': [r"\b(?:employment.*law|social.*security.*law|social.*protection)\b"],
-            'vital_interests': [r"\b(?:vital.*interests|life.*death|medical.*emergency)\b"],
-            'legitimate_activities': [r"\b(?:legitimate.*activities.*foundation|association.*union.*organization)\b"],
-            'public_domain': [r"\b(?:manifestly.*made.*public|public.*domain|publicly.*available)\b"],
-            'legal_claims': [r"\b(?:legal.*claims|establishment.*defense.*legal\s+claims)\b"],
-            'substantial_public_interest': [r"\b(?:substantial.*public.*interest|public.*health|official.*authority)\b"],
-            'medical_purposes': [r"\b(?:preventive.*medicine|medical.*diagnosis|health.*care|medical.*treatment)\b"],
-            'public_health': [r"\b(?:public.*health|serious.*cross.*border.*threats|health.*system)\b"],
-            'archiving_research': [r"\b(?:archiving.*public.*interest|scientific.*research|statistical.*purposes)\b"]
-        }
-        
         valid_exceptions = []
-        for exception, patterns in exceptions.items():
-            if any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns):
+        for exception, patterns in EXCEPTIONS.items():
+            if any(_RULES.search(pattern, content) for pattern in patterns):
                 valid_exceptions.append(exception.replace('_', ' '))
         
         if not valid_exceptions:
@@ -743,25 +772,28 @@ def _validate_article_9_special_categories(content: str) -> List[Dict[str, Any]]
     
     return findings
 
+
+# Validate Article 10: Processing of personal data relating to criminal convictions and offences
+CRIMINAL_PATTERNS = [
+    r"\b(?:criminal.*conviction|criminal.*record|criminal.*offence|criminal.*offense)\b",
+    r"\b(?:court.*conviction|criminal.*history|police.*record|criminal.*background)\b"
+]
+
+# Check for official authority or legal basis
+AUTHORITY_PATTERNS = [
+    r"\b(?:official.*authority|public.*authority|competent.*authority)\b",
+    r"\b(?:union.*law|member.*state.*law|legal.*authorization)\b"
+]
+
+
 def _validate_article_10_criminal_convictions(content: str) -> List[Dict[str, Any]]:
     """Validate Article 10: Processing of personal data relating to criminal convictions and offences."""
     findings = []
     
-    criminal_patterns = [
-        r"\b(?:criminal.*conviction|criminal.*record|criminal.*offence|criminal.*offense)\b",
-        r"\b(?:court.*conviction|criminal.*history|police.*record|criminal.*background)\b"
-    ]
-    
-    has_criminal_data = any(re.search(pattern, content, re.IGNORECASE) for pattern in criminal_patterns)
+    has_criminal_data = any(_RULES.search(pattern, content) for pattern in CRIMINAL_PATTERNS)
     
     if has_criminal_data:
-        # Check for official authority or legal basis
-        authority_patterns = [
-            r"\b(?:official.*authority|public.*authority|competent.*authority)\b",
-            r"\b(?:union.*law|member.*state.*law|legal.*authorization)\b"
-        ]
-        
-        has_official_authority = any(re.search(pattern, content, re.IGNORECASE) for pattern in authority_patterns)
+        has_official_authority = any(_RULES.search(pattern, content) for pattern in AUTHORITY_PATTERNS)
         
         if not has_official_authority:
             findings.append({
@@ -776,25 +808,28 @@ def _validate_article_10_criminal_convictions(content: str) -> List[Dict[str, An
     
     return findings
 
+
+# Validate Article 11: Processing which does not require identification
+NO_IDENTIFICATION_PATTERNS = [
+    r"\b(?:not.*require.*identification|no.*identification.*necessary|anonymous.*processing)\b",
+    r"\b(?:pseudonymous.*data|anonymized.*data|de.*identified.*data)\b"
+]
+
+# Check for rights implementation limitations
+RIGHTS_PATTERNS = [
+    r"\b(?:demonstrate.*unable.*identify|additional.*information.*identification)\b",
+    r"\b(?:rights.*limitations|cannot.*fulfill.*request)\b"
+]
+
+
 def _validate_article_11_no_identification(content: str) -> List[Dict[str, Any]]:
     """Validate Article 11: Processing which does not require identification."""
     findings = []
     
-    no_identification_patterns = [
-        r"\b(?:not.*require.*identification|no.*identification.*necessary|anonymous.*processing)\b",
-        r"\b(?:pseudonymous.*data|anonymized.*data|de.*identified.*data)\b"
-    ]
-    
-    has_no_identification = any(re.search(pattern, content, re.IGNORECASE) for pattern in no_identification_patterns)
+    has_no_identification = any(_RULES.search(pattern, content) for pattern in NO_IDENTIFICATION_PATTERNS)
     
     if has_no_identification:
-        # Check for rights implementation limitations
-        rights_patterns = [
-            r"\b(?:demonstrate.*unable.*identify|additional.*information.*identification)\b",
-            r"\b(?:rights.*limitations|cannot.*fulfill.*request)\b"
-        ]
-        
-        has_rights_limitations = any(re.search(pattern, content, re.IGNORECASE) for pattern in rights_patterns)
+        has_rights_limitations = any(_RULES.search(pattern, content) for pattern in RIGHTS_PATTERNS)
         
         if not has_rights_limitations:
             findings.append({
@@ -832,26 +867,30 @@ def _validate_chapter_3_rights(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Validate Article 12: Transparent information, communication and modalities
+ARTICLE_12_TRANSPARENT_INFORMATION_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|collect|process|store)\b"]
+
+TRANSPARENCY_REQUIREMENTS = {
+    'concise': r"\b(?:concise|brief|summarized|clear.*summary)\b",
+    'transparent': r"\b(?:transparent|open|clear|evident)\b",
+    'intelligible': r"\b(?:intelligible|understandable|comprehensible|easy.*understand)\b",
+    'easily_accessible': r"\b(?:easily.*accessible|readily.*available|easy.*access)\b",
+    'plain_language': r"\b(?:plain\s+language|simple\s+language|clear\s+language)\b",
+    'free_of_charge': r"\b(?:free.*charge|no.*cost|without.*fee|complimentary)\b"
+}
+
+
 def _validate_article_12_transparent_information(content: str) -> List[Dict[str, Any]]:
     """Validate Article 12: Transparent information, communication and modalities."""
     findings = []
     
-    processing_patterns = [r"\b(?:personal\s+data|collect|process|store)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in ARTICLE_12_TRANSPARENT_INFORMATION_PROCESSING_PATTERNS)
     
     if has_processing:
-        transparency_requirements = {
-            'concise': r"\b(?:concise|brief|summarized|clear.*summary)\b",
-            'transparent': r"\b(?:transparent|open|clear|evident)\b",
-            'intelligible': r"\b(?:intelligible|understandable|comprehensible|easy.*understand)\b",
-            'easily_accessible': r"\b(?:easily.*accessible|readily.*available|easy.*access)\b",
-            'plain_language': r"\b(?:plain\s+language|simple\s+language|clear\s+language)\b",
-            'free_of_charge': r"\b(?:free.*charge|no.*cost|without.*fee|complimentary)\b"
-        }
-        
         missing_requirements = []
-        for requirement, pattern in transparency_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in TRANSPARENCY_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_requirements.append(requirement.replace('_', ' '))
         
         if len(missing_requirements) > 3:
@@ -974,16 +1013,22 @@ def _validate_chapter_4_controller_processor(content: str) -> List[Dict[str, Any
     """Validate Chapter IV: Controller and Processor (Articles 24-43)."""
     return []
 
+
+# Article 44-49: International transfer requirements
+INTERNATIONAL_PATTERNS = [r"\b(?:international.*transfer|third.*country|non.*eu.*transfer)\b"]
+
+SAFEGUARD_PATTERNS = [r"\b(?:adequacy.*decision|standard.*contractual.*clauses|binding.*corporate.*rules)\b"]
+
+# Article 50: International cooperation
+COOPERATION_PATTERNS = [r"\b(?:international.*cooperation|supervisory.*authority.*cooperation|third.*country.*authority)\b"]
+
+
 def _validate_chapter_5_transfers(content: str) -> List[Dict[str, Any]]:
     """Validate Chapter V: Transfers to Third Countries (Articles 44-50)."""
     findings = []
     
-    # Article 44-49: International transfer requirements
-    international_patterns = [r"\b(?:international.*transfer|third.*country|non.*eu.*transfer)\b"]
-    safeguard_patterns = [r"\b(?:adequacy.*decision|standard.*contractual.*clauses|binding.*corporate.*rules)\b"]
-    
-    has_international = any(re.search(pattern, content, re.IGNORECASE) for pattern in international_patterns)
-    has_safeguards = any(re.search(pattern, content, re.IGNORECASE) for pattern in safeguard_patterns)
+    has_international = any(_RULES.search(pattern, content) for pattern in INTERNATIONAL_PATTERNS)
+    has_safeguards = any(_RULES.search(pattern, content) for pattern in SAFEGUARD_PATTERNS)
     
     if has_international and not has_safeguards:
         findings.append({
@@ -996,9 +1041,7 @@ def _validate_chapter_5_transfers(content: str) -> List[Dict[str, Any]]:
             'recommendation': 'Implement adequate safeguards: adequacy decision, SCCs, BCRs, or valid derogation'
         })
     
-    # Article 50: International cooperation
-    cooperation_patterns = [r"\b(?:international.*cooperation|supervisory.*authority.*cooperation|third.*country.*authority)\b"]
-    has_cooperation = any(re.search(pattern, content, re.IGNORECASE) for pattern in cooperation_patterns)
+    has_cooperation = any(_RULES.search(pattern, content) for pattern in COOPERATION_PATTERNS)
     
     if has_international and not has_cooperation:
         findings.append({
@@ -1088,4 +1131,19 @@ def _generate_comprehensive_recommendations(findings: List[Dict[str, Any]]) -> L
     if any('lawful' in f.get('type', '').lower() for f in findings):
         recommendations.append("Establish clear legal bases for all processing activities")
     
-    return recommendations
\ No newline at end of file
+    return recommendations
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    DATA_PROTECTION_PATTERNS, OBJECTIVE_PATTERNS, ARTICLE_2_MATERIAL_SCOPE_PROCESSING_PATTERNS,
+    EXCLUSION_PATTERNS, COMMERCIAL_PATTERNS, TERRITORIAL_INDICATORS, GEOGRAPHIC_PATTERNS, KEY_DEFINITIONS,
+    ARTICLE_4_DEFINITIONS_PROCESSING_INDICATORS, ARTICLE_5_PRINCIPLES_PROCESSING_PATTERNS, PRINCIPLES,
+    ARTICLE_6_LAWFULNESS_ENHANCED_PROCESSING_INDICATORS, LEGAL_BASES, BALANCING_PATTERNS, CONSENT_PATTERNS,
+    DEMONSTRATION_PATTERNS, LANGUAGE_PATTERNS, WITHDRAWAL_PATTERNS, CONDITIONAL_PATTERNS, CONTRACT_PATTERNS,
+    CHILDREN_PATTERNS, AGE_PATTERNS, PARENTAL_PATTERNS, ISS_PATTERNS, TARGETING_PATTERNS, PROTECTION_PATTERNS,
+    SPECIAL_CATEGORIES, EXCEPTIONS, CRIMINAL_PATTERNS, AUTHORITY_PATTERNS, NO_IDENTIFICATION_PATTERNS,
+    RIGHTS_PATTERNS, ARTICLE_12_TRANSPARENT_INFORMATION_PROCESSING_PATTERNS, TRANSPARENCY_REQUIREMENTS,
+    INTERNATIONAL_PATTERNS, SAFEGUARD_PATTERNS, COOPERATION_PATTERNS,
+    fields=('patterns',),
+)
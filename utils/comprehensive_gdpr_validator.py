@@ -5,10 +5,12 @@ This module provides comprehensive validation of all GDPR principles including
 the core principles, rights, and obligations under the regulation.
 """
 
-import re
 from typing import Dict, List, Any, Set, Optional
 from datetime import datetime, timedelta
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 # GDPR Core Principles (Article 5)
 GDPR_PRINCIPLES = {
     "lawfulness": {
@@ -257,14 +259,14 @@ def _validate_gdpr_principles(content: str) -> Dict[str, Any]:
         
         # Check for positive indicators
         has_compliance_indicators = any(
-            re.search(pattern, content, re.IGNORECASE) 
+            _RULES.search(pattern, content) 
             for pattern in config['patterns']
         )
         
         # Check for violations
         violation_matches = []
         for violation_pattern in config.get('violations', []):
-            matches = list(re.finditer(violation_pattern, content, re.IGNORECASE))
+            matches = list(_RULES.finditer(violation_pattern, content))
             violation_matches.extend(matches)
         
         if violation_matches:
@@ -312,7 +314,7 @@ def _validate_data_subject_rights(content: str) -> Dict[str, Any]:
         
         # Check if the right is mentioned or implemented
         has_right_implementation = any(
-            re.search(pattern, content, re.IGNORECASE) 
+            _RULES.search(pattern, content) 
             for pattern in config['patterns']
         )
         
@@ -336,58 +338,61 @@ def _validate_data_subject_rights(content: str) -> Dict[str, Any]:
         'average_score': sum(scores.values()) / len(scores) if scores else 0
     }
 
+
+# Validate processing of special categories of personal data (Article 9)
+SPECIAL_CATEGORIES = {
+    'health_data': [
+        r"\b(?:health\s+data|medical\s+data|patient\s+data|health\s+record)\b",
+        r"\b(?:diagnosis|treatment|medication|medical\s+condition)\b"
+    ],
+    'genetic_data': [
+        r"\b(?:genetic\s+data|dna|genome|genetic\s+information)\b"
+    ],
+    'biometric_data': [
+        r"\b(?:biometric\s+data|fingerprint|facial\s+recognition|biometric\s+identification)\b"
+    ],
+    'racial_ethnic_origin': [
+        r"\b(?:racial\s+origin|ethnic\s+origin|ethnicity|race)\b"
+    ],
+    'political_opinions': [
+        r"\b(?:political\s+opinion|political\s+affiliation|political\s+view)\b"
+    ],
+    'religious_beliefs': [
+        r"\b(?:religious\s+belief|religion|faith|spiritual\s+belief)\b"
+    ],
+    'trade_union_membership': [
+        r"\b(?:trade\s+union|union\s+membership|labor\s+union)\b"
+    ],
+    'sexual_orientation': [
+        r"\b(?:sexual\s+orientation|sexual\s+preference|gender\s+identity)\b"
+    ]
+}
+
+# Check for explicit consent or other Article 9 legal basis
+SPECIAL_CATEGORIES_CONSENT_PATTERNS = [
+    r"\b(?:explicit\s+consent|specific\s+consent|clear\s+consent)\b",
+    r"\b(?:employment\s+law|social\s+security\s+law|collective\s+agreement)\b",
+    r"\b(?:vital\s+interest|life\s+or\s+death|medical\s+emergency)\b",
+    r"\b(?:public\s+interest|substantial\s+public\s+interest)\b"
+]
+
+
 def _validate_special_categories(content: str) -> Dict[str, Any]:
     """Validate processing of special categories of personal data (Article 9)."""
     findings = []
     
-    special_categories = {
-        'health_data': [
-            r"\b(?:health\s+data|medical\s+data|patient\s+data|health\s+record)\b",
-            r"\b(?:diagnosis|treatment|medication|medical\s+condition)\b"
-        ],
-        'genetic_data': [
-            r"\b(?:genetic\s+data|dna|genome|genetic\s+information)\b"
-        ],
-        'biometric_data': [
-            r"\b(?:biometric\s+data|fingerprint|facial\s+recognition|biometric\s+identification)\b"
-        ],
-        'racial_ethnic_origin': [
-            r"\b(?:racial\s+origin|ethnic\s+origin|ethnicity|race)\b"
-        ],
-        'political_opinions': [
-            r"\b(?:political\s+opinion|political\s+affiliation|political\s+view)\b"
-        ],
-        'religious_beliefs': [
-            r"\b(?:religious\s+belief|religion|faith|spiritual\s+belief)\b"
-        ],
-        'trade_union_membership': [
-            r"\b(?:trade\s+union|union\s+membership|labor\s+union)\b"
-        ],
-        'sexual_orientation': [
-            r"\b(?:sexual\s+orientation|sexual\s+preference|gender\s+identity)\b"
-        ]
-    }
-    
     detected_categories = []
-    for category, patterns in special_categories.items():
+    for category, patterns in SPECIAL_CATEGORIES.items():
         for pattern in patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content):
                 detected_categories.append(category)
                 break
     
     has_legal_basis = False  # Initialize variable
     if detected_categories:
-        # Check for explicit consent or other Article 9 legal basis
-        consent_patterns = [
-            r"\b(?:explicit\s+consent|specific\s+consent|clear\s+consent)\b",
-            r"\b(?:employment\s+law|social\s+security\s+law|collective\s+agreement)\b",
-            r"\b(?:vital\s+interest|life\s+or\s+death|medical\s+emergency)\b",
-            r"\b(?:public\s+interest|substantial\s+public\s+interest)\b"
-        ]
-        
         has_legal_basis = any(
-            re.search(pattern, content, re.IGNORECASE) 
-            for pattern in consent_patterns
+            _RULES.search(pattern, content) 
+            for pattern in SPECIAL_CATEGORIES_CONSENT_PATTERNS
         )
         
         if not has_legal_basis:
@@ -409,6 +414,77 @@ def _validate_special_categories(content: str) -> Dict[str, Any]:
         'detected_categories': detected_categories
     }
 
+
+# Enhanced detection patterns for international transfers
+TRANSFER_PATTERNS = [
+    r"\b(?:international\s+transfer|cross-?border\s+transfer|third\s+country\s+transfer)\b",
+    r"\b(?:data\s+export|overseas\s+processing|global\s+processing)\b",
+    r"\b(?:us\s+cloud|american\s+server|chinese\s+server|non-?eu\s+server)\b"
+]
+
+# Specific third countries and regions
+THIRD_COUNTRY_PATTERNS = [
+    r"\b(?:usa|united\s+states|america|us\s+server)\b",
+    r"\b(?:china|chinese\s+server|hong\s+kong)\b", 
+    r"\b(?:india|singapore|australia|japan|south\s+korea)\b",
+    r"\b(?:canada|brazil|mexico|argentina)\b",
+    r"\b(?:russia|ukraine|turkey|israel)\b",
+    r"\b(?:uk|united\s+kingdom|britain|post-?brexit)\b"
+]
+
+# Cloud providers that may involve transfers
+CLOUD_PROVIDER_PATTERNS = [
+    r"\b(?:amazon\s+web\s+services|aws|s3\.amazonaws\.com)\b",
+    r"\b(?:google\s+cloud|gcp|firebase|app\s+engine)\b",
+    r"\b(?:microsoft\s+azure|azure\.com|office\s+365)\b",
+    r"\b(?:alibaba\s+cloud|tencent\s+cloud|baidu\s+cloud)\b"
+]
+
+# Article 45: Adequacy decisions
+ADEQUACY_PATTERNS = [
+    r"\b(?:adequacy\s+decision|adequate\s+level\s+of\s+protection)\b",
+    r"\b(?:andorra|argentina|canada|faroe\s+islands|guernsey|isle\s+of\s+man|israel|japan|jersey|new\s+zealand|switzerland|uruguay|uk\s+gdpr)\b"
+]
+
+# Article 46: Appropriate safeguards
+INTERNATIONAL_TRANSFERS_SAFEGUARD_PATTERNS = [
+    r"\b(?:standard\s+contractual\s+clauses|scc|model\s+clauses)\b",
+    r"\b(?:binding\s+corporate\s+rules|bcr|intra-?group\s+agreement)\b",
+    r"\b(?:certification\s+mechanism|approved\s+code\s+of\s+conduct)\b",
+    r"\b(?:transfer\s+impact\s+assessment|tia|supplementary\s+measures)\b"
+]
+
+# Article 47: Binding corporate rules
+BCR_PATTERNS = [
+    r"\b(?:binding\s+corporate\s+rules|bcr\s+approval|supervisory\s+authority\s+approval)\b",
+    r"\b(?:multinational\s+group|corporate\s+group\s+policy|intra-?group\s+transfer)\b"
+]
+
+# Article 49: Derogations for specific situations
+DEROGATION_PATTERNS = [
+    r"\b(?:explicit\s+consent\s+for\s+transfer|informed\s+consent\s+to\s+transfer)\b",
+    r"\b(?:contract\s+performance|pre-?contractual\s+measures)\b",
+    r"\b(?:public\s+interest|vital\s+interest|legal\s+claim)\b",
+    r"\b(?:legitimate\s+interest.*compelling|occasional\s+transfer)\b"
+]
+
+# Check for Schrems II compliance (supplementary measures)
+SCHREMS_PATTERNS = [
+    r"\b(?:schrems\s+ii|surveillance\s+laws|government\s+access)\b",
+    r"\b(?:supplementary\s+measures|additional\s+safeguards|encryption\s+in\s+transit)\b",
+    r"\b(?:end-?to-?end\s+encryption|pseudonymization\s+before\s+transfer)\b"
+]
+
+# Check for US transfers requiring Schrems II compliance
+US_TRANSFER_PATTERNS = [r"\b(?:usa|united\s+states|us\s+server|american\s+cloud)\b"]
+
+# Check for prohibited transfers under Article 46
+INTERNATIONAL_TRANSFERS_PROHIBITED_PATTERNS = [
+    r"\b(?:mass\s+surveillance|government\s+backdoor|unencrypted\s+transfer)\b",
+    r"\b(?:no\s+data\s+protection|weak\s+privacy\s+laws|unrestricted\s+access)\b"
+]
+
+
 def _validate_international_transfers(content: str) -> Dict[str, Any]:
     """Validate international transfer safeguards (Articles 44-49)."""
     findings = []
@@ -419,82 +495,22 @@ def _validate_international_transfers(content: str) -> Dict[str, Any]:
     has_bcr = False
     has_derogation = False
     
-    # Enhanced detection patterns for international transfers
-    transfer_patterns = [
-        r"\b(?:international\s+transfer|cross-?border\s+transfer|third\s+country\s+transfer)\b",
-        r"\b(?:data\s+export|overseas\s+processing|global\s+processing)\b",
-        r"\b(?:us\s+cloud|american\s+server|chinese\s+server|non-?eu\s+server)\b"
-    ]
-    
-    # Specific third countries and regions
-    third_country_patterns = [
-        r"\b(?:usa|united\s+states|america|us\s+server)\b",
-        r"\b(?:china|chinese\s+server|hong\s+kong)\b", 
-        r"\b(?:india|singapore|australia|japan|south\s+korea)\b",
-        r"\b(?:canada|brazil|mexico|argentina)\b",
-        r"\b(?:russia|ukraine|turkey|israel)\b",
-        r"\b(?:uk|united\s+kingdom|britain|post-?brexit)\b"
-    ]
-    
-    # Cloud providers that may involve transfers
-    cloud_provider_patterns = [
-        r"\b(?:amazon\s+web\s+services|aws|s3\.amazonaws\.com)\b",
-        r"\b(?:google\s+cloud|gcp|firebase|app\s+engine)\b",
-        r"\b(?:microsoft\s+azure|azure\.com|office\s+365)\b",
-        r"\b(?:alibaba\s+cloud|tencent\s+cloud|baidu\s+cloud)\b"
-    ]
-    
     has_international_transfer = (
-        any(re.search(pattern, content, re.IGNORECASE) for pattern in transfer_patterns) or
-        any(re.search(pattern, content, re.IGNORECASE) for pattern in third_country_patterns) or
-        any(re.search(pattern, content, re.IGNORECASE) for pattern in cloud_provider_patterns)
+        any(_RULES.search(pattern, content) for pattern in TRANSFER_PATTERNS) or
+        any(_RULES.search(pattern, content) for pattern in THIRD_COUNTRY_PATTERNS) or
+        any(_RULES.search(pattern, content) for pattern in CLOUD_PROVIDER_PATTERNS)
     )
     
     if has_international_transfer:
-        # Article 45: Adequacy decisions
-        adequacy_patterns = [
-            r"\b(?:adequacy\s+decision|adequate\s+level\s+of\s+protection)\b",
-            r"\b(?:andorra|argentina|canada|faroe\s+islands|guernsey|isle\s+of\s+man|israel|japan|jersey|new\s+zealand|switzerland|uruguay|uk\s+gdpr)\b"
-        ]
+        has_adequacy = any(_RULES.search(pattern, content) for pattern in ADEQUACY_PATTERNS)
         
-        has_adequacy = any(re.search(pattern, content, re.IGNORECASE) for pattern in adequacy_patterns)
+        has_safeguards = any(_RULES.search(pattern, content) for pattern in INTERNATIONAL_TRANSFERS_SAFEGUARD_PATTERNS)
         
-        # Article 46: Appropriate safeguards  
-        safeguard_patterns = [
-            r"\b(?:standard\s+contractual\s+clauses|scc|model\s+clauses)\b",
-            r"\b(?:binding\s+corporate\s+rules|bcr|intra-?group\s+agreement)\b",
-            r"\b(?:certification\s+mechanism|approved\s+code\s+of\s+conduct)\b",
-            r"\b(?:transfer\s+impact\s+assessment|tia|supplementary\s+measures)\b"
-        ]
+        has_bcr = any(_RULES.search(pattern, content) for pattern in BCR_PATTERNS)
         
-        has_safeguards = any(re.search(pattern, content, re.IGNORECASE) for pattern in safeguard_patterns)
+        has_derogation = any(_RULES.search(pattern, content) for pattern in DEROGATION_PATTERNS)
         
-        # Article 47: Binding corporate rules
-        bcr_patterns = [
-            r"\b(?:binding\s+corporate\s+rules|bcr\s+approval|supervisory\s+authority\s+approval)\b",
-            r"\b(?:multinational\s+group|corporate\s+group\s+policy|intra-?group\s+transfer)\b"
-        ]
-        
-        has_bcr = any(re.search(pattern, content, re.IGNORECASE) for pattern in bcr_patterns)
-        
-        # Article 49: Derogations for specific situations
-        derogation_patterns = [
-            r"\b(?:explicit\s+consent\s+for\s+transfer|informed\s+consent\s+to\s+transfer)\b",
-            r"\b(?:contract\s+performance|pre-?contractual\s+measures)\b",
-            r"\b(?:public\s+interest|vital\s+interest|legal\s+claim)\b",
-            r"\b(?:legitimate\s+interest.*compelling|occasional\s+transfer)\b"
-        ]
-        
-        has_derogation = any(re.search(pattern, content, re.IGNORECASE) for pattern in derogation_patterns)
-        
-        # Check for Schrems II compliance (supplementary measures)
-        schrems_patterns = [
-            r"\b(?:schrems\s+ii|surveillance\s+laws|government\s+access)\b",
-            r"\b(?:supplementary\s+measures|additional\s+safeguards|encryption\s+in\s+transit)\b",
-            r"\b(?:end-?to-?end\s+encryption|pseudonymization\s+before\s+transfer)\b"
-        ]
-        
-        has_schrems_compliance = any(re.search(pattern, content, re.IGNORECASE) for pattern in schrems_patterns)
+        has_schrems_compliance = any(_RULES.search(pattern, content) for pattern in SCHREMS_PATTERNS)
         
         # Evaluate transfer compliance
         legal_basis_found = has_adequacy or has_safeguards or has_bcr or has_derogation
@@ -510,9 +526,7 @@ def _validate_international_transfers(content: str) -> Dict[str, Any]:
                 'remediation': "Establish legal basis: adequacy decision (Art. 45), appropriate safeguards (Art. 46), BCRs (Art. 47), or valid derogation (Art. 49)"
             })
         
-        # Check for US transfers requiring Schrems II compliance
-        us_transfer_patterns = [r"\b(?:usa|united\s+states|us\s+server|american\s+cloud)\b"]
-        has_us_transfer = any(re.search(pattern, content, re.IGNORECASE) for pattern in us_transfer_patterns)
+        has_us_transfer = any(_RULES.search(pattern, content) for pattern in US_TRANSFER_PATTERNS)
         
         if has_us_transfer and not has_schrems_compliance and not has_adequacy:
             findings.append({
@@ -525,13 +539,7 @@ def _validate_international_transfers(content: str) -> Dict[str, Any]:
                 'remediation': "Implement supplementary measures: end-to-end encryption, pseudonymization, contractual guarantees against surveillance"
             })
         
-        # Check for prohibited transfers under Article 46
-        prohibited_patterns = [
-            r"\b(?:mass\s+surveillance|government\s+backdoor|unencrypted\s+transfer)\b",
-            r"\b(?:no\s+data\s+protection|weak\s+privacy\s+laws|unrestricted\s+access)\b"
-        ]
-        
-        has_prohibited_transfer = any(re.search(pattern, content, re.IGNORECASE) for pattern in prohibited_patterns)
+        has_prohibited_transfer = any(_RULES.search(pattern, content) for pattern in INTERNATIONAL_TRANSFERS_PROHIBITED_PATTERNS)
         
         if has_prohibited_transfer:
             findings.append({
@@ -562,32 +570,35 @@ def _validate_international_transfers(content: str) -> Dict[str, Any]:
         'findings': findings
     }
 
+
+# Validate breach notification procedures (Articles 33-34)
+BREACH_PATTERNS = [
+    r"\b(?:data\s+breach|security\s+incident|privacy\s+breach)\b",
+    r"\b(?:unauthorized\s+access|data\s+leak|cyber\s+attack)\b"
+]
+
+# Check for notification procedures
+NOTIFICATION_PATTERNS = [
+    r"\b(?:72\s+hour|breach\s+notification|notify\s+(?:supervisory\s+)?authority)\b",
+    r"\b(?:notify\s+data\s+subject|individual\s+notification|breach\s+communication)\b",
+    r"\b(?:incident\s+response|breach\s+procedure|notification\s+process)\b"
+]
+
+
 def _validate_breach_notification(content: str) -> Dict[str, Any]:
     """Validate breach notification procedures (Articles 33-34)."""
     findings = []
     
-    breach_patterns = [
-        r"\b(?:data\s+breach|security\s+incident|privacy\s+breach)\b",
-        r"\b(?:unauthorized\s+access|data\s+leak|cyber\s+attack)\b"
-    ]
-    
     has_breach_reference = any(
-        re.search(pattern, content, re.IGNORECASE) 
-        for pattern in breach_patterns
+        _RULES.search(pattern, content) 
+        for pattern in BREACH_PATTERNS
     )
     
     has_notification_procedure = False  # Initialize variable
     if has_breach_reference:
-        # Check for notification procedures
-        notification_patterns = [
-            r"\b(?:72\s+hour|breach\s+notification|notify\s+(?:supervisory\s+)?authority)\b",
-            r"\b(?:notify\s+data\s+subject|individual\s+notification|breach\s+communication)\b",
-            r"\b(?:incident\s+response|breach\s+procedure|notification\s+process)\b"
-        ]
-        
         has_notification_procedure = any(
-            re.search(pattern, content, re.IGNORECASE) 
-            for pattern in notification_patterns
+            _RULES.search(pattern, content) 
+            for pattern in NOTIFICATION_PATTERNS
         )
         
         if not has_notification_procedure:
@@ -608,46 +619,48 @@ def _validate_breach_notification(content: str) -> Dict[str, Any]:
         'findings': findings
     }
 
+
+# Check for privacy by design indicators
+DESIGN_PATTERNS = [
+    r"\b(?:privacy\s+by\s+design|data\s+protection\s+by\s+design)\b",
+    r"\b(?:privacy\s+by\s+default|data\s+protection\s+by\s+default)\b",
+    r"\b(?:built-?in\s+privacy|privacy\s+engineering|privacy\s+architecture)\b",
+    r"\b(?:data\s+minimization\s+by\s+design|purpose\s+limitation\s+by\s+design)\b"
+]
+
+# Check for privacy engineering practices
+ENGINEERING_PATTERNS = [
+    r"\b(?:pseudonymization|anonymization|encryption\s+by\s+default)\b",
+    r"\b(?:access\s+controls?\s+by\s+design|role-?based\s+access\s+by\s+design)\b",
+    r"\b(?:audit\s+logging\s+by\s+design|monitoring\s+by\s+design)\b",
+    r"\b(?:consent\s+management\s+by\s+design|opt-?out\s+by\s+default)\b"
+]
+
+# Check for violations (systems without privacy considerations)
+VIOLATION_PATTERNS = [
+    r"\b(?:collect\s+all\s+data|store\s+everything|maximum\s+data\s+collection)\b",
+    r"\b(?:no\s+privacy\s+controls|privacy\s+not\s+considered|privacy\s+afterthought)\b",
+    r"\b(?:opt-?in\s+by\s+default|sharing\s+by\s+default|public\s+by\s+default)\b"
+]
+
+
 def _validate_data_protection_by_design(content: str) -> Dict[str, Any]:
     """Validate Data Protection by Design and by Default (Article 25)."""
     findings = []
     
-    # Check for privacy by design indicators
-    design_patterns = [
-        r"\b(?:privacy\s+by\s+design|data\s+protection\s+by\s+design)\b",
-        r"\b(?:privacy\s+by\s+default|data\s+protection\s+by\s+default)\b",
-        r"\b(?:built-?in\s+privacy|privacy\s+engineering|privacy\s+architecture)\b",
-        r"\b(?:data\s+minimization\s+by\s+design|purpose\s+limitation\s+by\s+design)\b"
-    ]
-    
-    # Check for privacy engineering practices
-    engineering_patterns = [
-        r"\b(?:pseudonymization|anonymization|encryption\s+by\s+default)\b",
-        r"\b(?:access\s+controls?\s+by\s+design|role-?based\s+access\s+by\s+design)\b",
-        r"\b(?:audit\s+logging\s+by\s+design|monitoring\s+by\s+design)\b",
-        r"\b(?:consent\s+management\s+by\s+design|opt-?out\s+by\s+default)\b"
-    ]
-    
     has_design_principles = any(
-        re.search(pattern, content, re.IGNORECASE) 
-        for pattern in design_patterns
+        _RULES.search(pattern, content) 
+        for pattern in DESIGN_PATTERNS
     )
     
     has_engineering_practices = any(
-        re.search(pattern, content, re.IGNORECASE) 
-        for pattern in engineering_patterns
+        _RULES.search(pattern, content) 
+        for pattern in ENGINEERING_PATTERNS
     )
     
-    # Check for violations (systems without privacy considerations)
-    violation_patterns = [
-        r"\b(?:collect\s+all\s+data|store\s+everything|maximum\s+data\s+collection)\b",
-        r"\b(?:no\s+privacy\s+controls|privacy\s+not\s+considered|privacy\s+afterthought)\b",
-        r"\b(?:opt-?in\s+by\s+default|sharing\s+by\s+default|public\s+by\s+default)\b"
-    ]
-    
     has_violations = any(
-        re.search(pattern, content, re.IGNORECASE) 
-        for pattern in violation_patterns
+        _RULES.search(pattern, content) 
+        for pattern in VIOLATION_PATTERNS
     )
     
     # Evaluate compliance
@@ -687,34 +700,43 @@ def _validate_data_protection_by_design(content: str) -> Dict[str, Any]:
         'findings': findings
     }
 
+
+# Check for processor relationship indicators
+PROCESSOR_PATTERNS = [
+    r"\b(?:data\s+processor|processing\s+agreement|processor\s+contract)\b",
+    r"\b(?:sub-?processor|third\s+party\s+processor|service\s+provider)\b",
+    r"\b(?:cloud\s+provider|hosting\s+provider|saas\s+provider)\b"
+]
+
+# Check for required contractual elements
+CONTRACT_PATTERNS = [
+    r"\b(?:processing\s+instructions|written\s+authorization|documented\s+instructions)\b",
+    r"\b(?:confidentiality\s+obligation|staff\s+confidentiality|employee\s+confidentiality)\b",
+    r"\b(?:security\s+measures|technical\s+safeguards|organizational\s+measures)\b",
+    r"\b(?:sub-?processor\s+authorization|sub-?contractor\s+approval)\b",
+    r"\b(?:data\s+subject\s+rights|assist\s+controller|support\s+controller)\b",
+    r"\b(?:data\s+return|data\s+deletion|end\s+of\s+processing)\b",
+    r"\b(?:audit\s+rights|inspection\s+rights|compliance\s+monitoring)\b"
+]
+
+# Check for prohibited processing
+PROCESSOR_OBLIGATIONS_PROHIBITED_PATTERNS = [
+    r"\b(?:unauthorized\s+processing|processing\s+without\s+instructions)\b",
+    r"\b(?:use\s+data\s+for\s+own\s+purposes|secondary\s+use\s+of\s+data)\b",
+    r"\b(?:retain\s+data\s+after\s+contract|keep\s+data\s+permanently)\b"
+]
+
+
 def _validate_processor_obligations(content: str) -> Dict[str, Any]:
     """Validate Processor obligations (Article 28)."""
     findings = []
     
-    # Check for processor relationship indicators
-    processor_patterns = [
-        r"\b(?:data\s+processor|processing\s+agreement|processor\s+contract)\b",
-        r"\b(?:sub-?processor|third\s+party\s+processor|service\s+provider)\b",
-        r"\b(?:cloud\s+provider|hosting\s+provider|saas\s+provider)\b"
-    ]
-    
     has_processor_relationship = any(
-        re.search(pattern, content, re.IGNORECASE) 
-        for pattern in processor_patterns
+        _RULES.search(pattern, content) 
+        for pattern in PROCESSOR_PATTERNS
     )
     
     if has_processor_relationship:
-        # Check for required contractual elements
-        contract_patterns = [
-            r"\b(?:processing\s+instructions|written\s+authorization|documented\s+instructions)\b",
-            r"\b(?:confidentiality\s+obligation|staff\s+confidentiality|employee\s+confidentiality)\b",
-            r"\b(?:security\s+measures|technical\s+safeguards|organizational\s+measures)\b",
-            r"\b(?:sub-?processor\s+authorization|sub-?contractor\s+approval)\b",
-            r"\b(?:data\s+subject\s+rights|assist\s+controller|support\s+controller)\b",
-            r"\b(?:data\s+return|data\s+deletion|end\s+of\s+processing)\b",
-            r"\b(?:audit\s+rights|inspection\s+rights|compliance\s+monitoring)\b"
-        ]
-        
         missing_elements = []
         contract_element_names = [
             "processing instructions",
@@ -726,8 +748,8 @@ def _validate_processor_obligations(content: str) -> Dict[str, Any]:
             "audit rights"
         ]
         
-        for i, pattern in enumerate(contract_patterns):
-            if not re.search(pattern, content, re.IGNORECASE):
+        for i, pattern in enumerate(CONTRACT_PATTERNS):
+            if not _RULES.search(pattern, content):
                 missing_elements.append(contract_element_names[i])
         
         if missing_elements:
@@ -741,16 +763,9 @@ def _validate_processor_obligations(content: str) -> Dict[str, Any]:
                 'remediation': "Update processor contracts to include all Article 28 requirements: instructions, confidentiality, security, sub-processors, rights assistance, data return, audits"
             })
         
-        # Check for prohibited processing
-        prohibited_patterns = [
-            r"\b(?:unauthorized\s+processing|processing\s+without\s+instructions)\b",
-            r"\b(?:use\s+data\s+for\s+own\s+purposes|secondary\s+use\s+of\s+data)\b",
-            r"\b(?:retain\s+data\s+after\s+contract|keep\s+data\s+permanently)\b"
-        ]
-        
         has_prohibited_activities = any(
-            re.search(pattern, content, re.IGNORECASE) 
-            for pattern in prohibited_patterns
+            _RULES.search(pattern, content) 
+            for pattern in PROCESSOR_OBLIGATIONS_PROHIBITED_PATTERNS
         )
         
         if has_prohibited_activities:
@@ -845,39 +860,40 @@ def _generate_comprehensive_recommendations(findings: List[Dict[str, Any]]) -> L
 
 # NEW: Enhanced GDPR Article Detection Functions
 
+
+# Technical implementation patterns for privacy by design
+PRIVACY_BY_DESIGN_INDICATORS = {
+    "encryption_at_rest": r"\b(?:encryption|encrypt|aes|rsa|tls|ssl|crypto)\b.*(?:storage|database|disk|file)",
+    "encryption_in_transit": r"\b(?:https|tls|ssl|secure.*transport|encrypted.*connection)\b",
+    "access_controls": r"\b(?:authentication|authorization|rbac|access.*control|permission|role)\b",
+    "data_minimization_code": r"\b(?:filter|select|limit|where|minimal.*data|necessary.*fields)\b",
+    "pseudonymization": r"\b(?:pseudonym|anonymiz|hash|tokeniz|mask|obfuscat)\b",
+    "audit_logging": r"\b(?:audit|log|trace|monitor|track.*access)\b",
+    "privacy_settings": r"\b(?:privacy.*setting|default.*private|opt.*in|consent)\b"
+}
+
+VIOLATIONS = {
+    "no_encryption": r"\b(?:plain.*text|unencrypted|no.*ssl|http:\/\/|clear.*text)\b",
+    "open_access": r"\b(?:public.*access|no.*auth|anonymous|unrestricted)\b",
+    "excessive_logging": r"\b(?:log.*everything|full.*data.*log|complete.*record)\b",
+    "default_public": r"\b(?:default.*public|opt.*out|automatically.*share)\b"
+}
+
+
 def _check_privacy_by_design_technical(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Enhanced technical validation for GDPR Article 25 - Privacy by Design and Default."""
     findings = []
     
-    # Technical implementation patterns for privacy by design
-    privacy_by_design_indicators = {
-        "encryption_at_rest": r"\b(?:encryption|encrypt|aes|rsa|tls|ssl|crypto)\b.*(?:storage|database|disk|file)",
-        "encryption_in_transit": r"\b(?:https|tls|ssl|secure.*transport|encrypted.*connection)\b",
-        "access_controls": r"\b(?:authentication|authorization|rbac|access.*control|permission|role)\b",
-        "data_minimization_code": r"\b(?:filter|select|limit|where|minimal.*data|necessary.*fields)\b",
-        "pseudonymization": r"\b(?:pseudonym|anonymiz|hash|tokeniz|mask|obfuscat)\b",
-        "audit_logging": r"\b(?:audit|log|trace|monitor|track.*access)\b",
-        "privacy_settings": r"\b(?:privacy.*setting|default.*private|opt.*in|consent)\b"
-    }
-    
-    violations = {
-        "no_encryption": r"\b(?:plain.*text|unencrypted|no.*ssl|http:\/\/|clear.*text)\b",
-        "open_access": r"\b(?:public.*access|no.*auth|anonymous|unrestricted)\b",
-        "excessive_logging": r"\b(?:log.*everything|full.*data.*log|complete.*record)\b",
-        "default_public": r"\b(?:default.*public|opt.*out|automatically.*share)\b"
-    }
-    
     # Check for privacy by design implementations
     implementations_found = []
-    for impl_type, pattern in privacy_by_design_indicators.items():
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
+    for impl_type, pattern in PRIVACY_BY_DESIGN_INDICATORS.items():
+        if _RULES.search(pattern, content):
             implementations_found.append(impl_type)
     
     # Check for violations
     violations_found = []
-    for violation_type, pattern in violations.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    for violation_type, pattern in VIOLATIONS.items():
+        matches = _RULES.finditer(pattern, content)
         for match in matches:
             violations_found.append({
                 'type': violation_type,
@@ -913,38 +929,40 @@ def _check_privacy_by_design_technical(content: str, metadata: Optional[Dict[str
     
     return findings
 
+
+# Required Article 30 elements
+REQUIRED_ELEMENTS = {
+    "controller_details": r"\b(?:data.*controller|controller.*contact|responsible.*person)\b",
+    "processing_purposes": r"\b(?:processing.*purpose|purpose.*statement|legitimate.*interest)\b",
+    "data_categories": r"\b(?:personal.*data.*categor|data.*type|special.*categor)\b",
+    "data_subjects": r"\b(?:data.*subject|individual|person.*affect)\b",
+    "recipients": r"\b(?:recipient|third.*party|processor|sharing)\b",
+    "international_transfers": r"\b(?:international.*transfer|third.*country|adequacy)\b",
+    "retention_periods": r"\b(?:retention.*period|storage.*duration|deletion.*schedule)\b",
+    "security_measures": r"\b(?:security.*measure|safeguard|technical.*organizational)\b"
+}
+
+# Check for documentation structure
+DOCUMENTATION_PATTERNS = [
+    r"\b(?:record.*of.*processing|ropa|processing.*register)\b",
+    r"\b(?:data.*inventory|privacy.*register|processing.*log)\b"
+]
+
+
 def _check_records_of_processing_automation(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Enhanced automation for GDPR Article 30 - Records of Processing Activities."""
     findings = []
     
-    # Required Article 30 elements
-    required_elements = {
-        "controller_details": r"\b(?:data.*controller|controller.*contact|responsible.*person)\b",
-        "processing_purposes": r"\b(?:processing.*purpose|purpose.*statement|legitimate.*interest)\b",
-        "data_categories": r"\b(?:personal.*data.*categor|data.*type|special.*categor)\b",
-        "data_subjects": r"\b(?:data.*subject|individual|person.*affect)\b",
-        "recipients": r"\b(?:recipient|third.*party|processor|sharing)\b",
-        "international_transfers": r"\b(?:international.*transfer|third.*country|adequacy)\b",
-        "retention_periods": r"\b(?:retention.*period|storage.*duration|deletion.*schedule)\b",
-        "security_measures": r"\b(?:security.*measure|safeguard|technical.*organizational)\b"
-    }
-    
     found_elements = []
     missing_elements = []
     
-    for element, pattern in required_elements.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for element, pattern in REQUIRED_ELEMENTS.items():
+        if _RULES.search(pattern, content):
             found_elements.append(element)
         else:
             missing_elements.append(element)
     
-    # Check for documentation structure
-    documentation_patterns = [
-        r"\b(?:record.*of.*processing|ropa|processing.*register)\b",
-        r"\b(?:data.*inventory|privacy.*register|processing.*log)\b"
-    ]
-    
-    has_documentation = any(re.search(pattern, content, re.IGNORECASE) for pattern in documentation_patterns)
+    has_documentation = any(_RULES.search(pattern, content) for pattern in DOCUMENTATION_PATTERNS)
     
     if len(missing_elements) > 2:
         findings.append({
@@ -972,35 +990,37 @@ def _check_records_of_processing_automation(content: str, metadata: Optional[Dic
     
     return findings
 
+
+# DPIA triggering criteria (automatic threshold detection)
+DPIA_TRIGGERS = {
+    "systematic_monitoring": r"\b(?:systematic.*monitor|surveillance|tracking|behavioral.*analysis)\b",
+    "large_scale_processing": r"\b(?:large.*scale|mass.*processing|bulk.*data|thousands|millions)\b",
+    "special_categories": r"\b(?:health.*data|biometric|genetic|racial|ethnic|political|religious|sexual)\b",
+    "automated_decision_making": r"\b(?:automated.*decision|algorithmic|profiling|ai.*decision|machine.*learning)\b",
+    "public_area_monitoring": r"\b(?:cctv|video.*surveillance|public.*monitoring|facial.*recognition)\b",
+    "vulnerable_subjects": r"\b(?:children|minors|elderly|disabled|vulnerable.*group)\b",
+    "innovative_technology": r"\b(?:new.*technology|innovative|experimental|pilot|beta|ai|machine.*learning)\b",
+    "cross_border_transfer": r"\b(?:cross.*border|international.*transfer|third.*country|us.*transfer)\b",
+    "data_matching": r"\b(?:data.*matching|cross.*reference|data.*linking|merge.*dataset)\b"
+}
+
+# Check for existing DPIA documentation
+DPIA_DOCUMENTATION = [
+    r"\b(?:dpia|data.*protection.*impact.*assessment|privacy.*impact.*assessment)\b",
+    r"\b(?:impact.*assessment|risk.*assessment|pia)\b"
+]
+
+
 def _check_enhanced_dpia_requirements(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Enhanced threshold detection for GDPR Article 35 - Data Protection Impact Assessment."""
     findings = []
     
-    # DPIA triggering criteria (automatic threshold detection)
-    dpia_triggers = {
-        "systematic_monitoring": r"\b(?:systematic.*monitor|surveillance|tracking|behavioral.*analysis)\b",
-        "large_scale_processing": r"\b(?:large.*scale|mass.*processing|bulk.*data|thousands|millions)\b",
-        "special_categories": r"\b(?:health.*data|biometric|genetic|racial|ethnic|political|religious|sexual)\b",
-        "automated_decision_making": r"\b(?:automated.*decision|algorithmic|profiling|ai.*decision|machine.*learning)\b",
-        "public_area_monitoring": r"\b(?:cctv|video.*surveillance|public.*monitoring|facial.*recognition)\b",
-        "vulnerable_subjects": r"\b(?:children|minors|elderly|disabled|vulnerable.*group)\b",
-        "innovative_technology": r"\b(?:new.*technology|innovative|experimental|pilot|beta|ai|machine.*learning)\b",
-        "cross_border_transfer": r"\b(?:cross.*border|international.*transfer|third.*country|us.*transfer)\b",
-        "data_matching": r"\b(?:data.*matching|cross.*reference|data.*linking|merge.*dataset)\b"
-    }
-    
     triggered_criteria = []
-    for criterion, pattern in dpia_triggers.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for criterion, pattern in DPIA_TRIGGERS.items():
+        if _RULES.search(pattern, content):
             triggered_criteria.append(criterion)
     
-    # Check for existing DPIA documentation
-    dpia_documentation = [
-        r"\b(?:dpia|data.*protection.*impact.*assessment|privacy.*impact.*assessment)\b",
-        r"\b(?:impact.*assessment|risk.*assessment|pia)\b"
-    ]
-    
-    has_dpia = any(re.search(pattern, content, re.IGNORECASE) for pattern in dpia_documentation)
+    has_dpia = any(_RULES.search(pattern, content) for pattern in DPIA_DOCUMENTATION)
     
     # Enhanced threshold logic: 2+ triggers require DPIA
     if len(triggered_criteria) >= 2 and not has_dpia:
@@ -1028,39 +1048,41 @@ def _check_enhanced_dpia_requirements(content: str, metadata: Optional[Dict[str,
     
     return findings
 
+
+# DPO appointment criteria
+DPO_REQUIRED_CRITERIA = {
+    "public_authority": r"\b(?:public.*authority|government|municipal|state|federal|council)\b",
+    "large_scale_monitoring": r"\b(?:large.*scale.*monitor|systematic.*monitor|surveillance.*program)\b",
+    "special_categories_large": r"\b(?:large.*scale.*special|bulk.*health|mass.*biometric|extensive.*sensitive)\b",
+    "core_activities_monitoring": r"\b(?:core.*activit.*monitor|primary.*business.*track|main.*operation.*surveillance)\b",
+    "law_enforcement": r"\b(?:law.*enforcement|police|criminal.*justice|investigation)\b"
+}
+
+# Check for DPO appointment evidence
+DPO_INDICATORS = [
+    r"\b(?:data.*protection.*officer|dpo|privacy.*officer)\b",
+    r"\b(?:dpo.*contact|dpo.*email|privacy.*contact)\b"
+]
+
+# DPO size threshold indicators (250+ employees)
+SIZE_INDICATORS = [
+    r"\b(?:\d{3,}.*employ|\d{3,}.*staff|large.*organization|enterprise|multinational)\b",
+    r"\b(?:250.*employ|500.*employ|1000.*employ|10000.*employ)\b"
+]
+
+
 def _check_dpo_appointment_requirements(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Automated assessment for GDPR Article 37 - Data Protection Officer requirements."""
     findings = []
     
-    # DPO appointment criteria
-    dpo_required_criteria = {
-        "public_authority": r"\b(?:public.*authority|government|municipal|state|federal|council)\b",
-        "large_scale_monitoring": r"\b(?:large.*scale.*monitor|systematic.*monitor|surveillance.*program)\b",
-        "special_categories_large": r"\b(?:large.*scale.*special|bulk.*health|mass.*biometric|extensive.*sensitive)\b",
-        "core_activities_monitoring": r"\b(?:core.*activit.*monitor|primary.*business.*track|main.*operation.*surveillance)\b",
-        "law_enforcement": r"\b(?:law.*enforcement|police|criminal.*justice|investigation)\b"
-    }
-    
     triggered_dpo_criteria = []
-    for criterion, pattern in dpo_required_criteria.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for criterion, pattern in DPO_REQUIRED_CRITERIA.items():
+        if _RULES.search(pattern, content):
             triggered_dpo_criteria.append(criterion)
     
-    # Check for DPO appointment evidence
-    dpo_indicators = [
-        r"\b(?:data.*protection.*officer|dpo|privacy.*officer)\b",
-        r"\b(?:dpo.*contact|dpo.*email|privacy.*contact)\b"
-    ]
-    
-    has_dpo = any(re.search(pattern, content, re.IGNORECASE) for pattern in dpo_indicators)
-    
-    # DPO size threshold indicators (250+ employees)
-    size_indicators = [
-        r"\b(?:\d{3,}.*employ|\d{3,}.*staff|large.*organization|enterprise|multinational)\b",
-        r"\b(?:250.*employ|500.*employ|1000.*employ|10000.*employ)\b"
-    ]
+    has_dpo = any(_RULES.search(pattern, content) for pattern in DPO_INDICATORS)
     
-    large_organization = any(re.search(pattern, content, re.IGNORECASE) for pattern in size_indicators)
+    large_organization = any(_RULES.search(pattern, content) for pattern in SIZE_INDICATORS)
     
     if (len(triggered_dpo_criteria) >= 1 or large_organization) and not has_dpo:
         findings.append({
@@ -1077,21 +1099,32 @@ def _check_dpo_appointment_requirements(content: str, metadata: Optional[Dict[st
     
     return findings
 
+
+# International transfer detection
+TRANSFER_INDICATORS = {
+    "us_transfers": r"\b(?:united.*states|usa|us.*server|american.*company|\.com|aws|azure|google.*cloud)\b",
+    "china_transfers": r"\b(?:china|chinese.*server|\.cn|alibaba|tencent)\b",
+    "third_countries": r"\b(?:third.*country|non.*eu|outside.*europe|international.*transfer)\b",
+    "cloud_services": r"\b(?:cloud.*service|saas|paas|iaas|aws|azure|google.*cloud|dropbox)\b"
+}
+
+# Safeguards detection
+SAFEGUARDS = {
+    "adequacy_decision": r"\b(?:adequacy.*decision|adequate.*protection|eu.*approved)\b",
+    "standard_contractual_clauses": r"\b(?:standard.*contractual.*clauses|scc|model.*clauses)\b",
+    "binding_corporate_rules": r"\b(?:binding.*corporate.*rules|bcr)\b",
+    "certification": r"\b(?:certification|approved.*code.*conduct|binding.*enforceable)\b",
+    "schrems_ii_measures": r"\b(?:schrems.*ii|supplementary.*measures|additional.*safeguards)\b"
+}
+
+
 def _check_enhanced_international_transfers(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Enhanced Schrems II compliance for GDPR Articles 44-49 - International Transfers."""
     findings = []
     
-    # International transfer detection
-    transfer_indicators = {
-        "us_transfers": r"\b(?:united.*states|usa|us.*server|american.*company|\.com|aws|azure|google.*cloud)\b",
-        "china_transfers": r"\b(?:china|chinese.*server|\.cn|alibaba|tencent)\b",
-        "third_countries": r"\b(?:third.*country|non.*eu|outside.*europe|international.*transfer)\b",
-        "cloud_services": r"\b(?:cloud.*service|saas|paas|iaas|aws|azure|google.*cloud|dropbox)\b"
-    }
-    
     detected_transfers = []
-    for transfer_type, pattern in transfer_indicators.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    for transfer_type, pattern in TRANSFER_INDICATORS.items():
+        matches = _RULES.finditer(pattern, content)
         for match in matches:
             detected_transfers.append({
                 'type': transfer_type,
@@ -1099,18 +1132,9 @@ def _check_enhanced_international_transfers(content: str, metadata: Optional[Dic
                 'matched_text': match.group()
             })
     
-    # Safeguards detection
-    safeguards = {
-        "adequacy_decision": r"\b(?:adequacy.*decision|adequate.*protection|eu.*approved)\b",
-        "standard_contractual_clauses": r"\b(?:standard.*contractual.*clauses|scc|model.*clauses)\b",
-        "binding_corporate_rules": r"\b(?:binding.*corporate.*rules|bcr)\b",
-        "certification": r"\b(?:certification|approved.*code.*conduct|binding.*enforceable)\b",
-        "schrems_ii_measures": r"\b(?:schrems.*ii|supplementary.*measures|additional.*safeguards)\b"
-    }
-    
     found_safeguards = []
-    for safeguard_type, pattern in safeguards.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for safeguard_type, pattern in SAFEGUARDS.items():
+        if _RULES.search(pattern, content):
             found_safeguards.append(safeguard_type)
     
     # Enhanced Schrems II analysis
@@ -1144,27 +1168,29 @@ def _check_enhanced_international_transfers(content: str, metadata: Optional[Dic
 
 # NEW: Critical missing GDPR article validation functions
 
+
+# Article 6 legal bases
+LEGAL_BASES = [
+    r"\b(?:consent|freely\s+given|specific|informed|unambiguous)\b",
+    r"\b(?:contract|performance\s+of\s+contract|pre-?contractual\s+measures)\b", 
+    r"\b(?:legal\s+obligation|compliance\s+with\s+legal\s+obligation)\b",
+    r"\b(?:vital\s+interests?|life\s+or\s+death|medical\s+emergency)\b",
+    r"\b(?:public\s+task|official\s+authority|public\s+interest)\b",
+    r"\b(?:legitimate\s+interests?|balancing\s+test|overriding\s+interests?)\b"
+]
+
+PROCESSING_INDICATORS = [
+    r"\b(?:personal\s+data|processing|collect|store|use|share|transfer)\b",
+    r"\b(?:customer\s+data|user\s+information|individual\s+data)\b"
+]
+
+
 def _validate_lawfulness_of_processing(content: str) -> Dict[str, Any]:
     """Validate lawfulness of processing requirements (Article 6)."""
     findings = []
     
-    # Article 6 legal bases
-    legal_bases = [
-        r"\b(?:consent|freely\s+given|specific|informed|unambiguous)\b",
-        r"\b(?:contract|performance\s+of\s+contract|pre-?contractual\s+measures)\b", 
-        r"\b(?:legal\s+obligation|compliance\s+with\s+legal\s+obligation)\b",
-        r"\b(?:vital\s+interests?|life\s+or\s+death|medical\s+emergency)\b",
-        r"\b(?:public\s+task|official\s+authority|public\s+interest)\b",
-        r"\b(?:legitimate\s+interests?|balancing\s+test|overriding\s+interests?)\b"
-    ]
-    
-    processing_indicators = [
-        r"\b(?:personal\s+data|processing|collect|store|use|share|transfer)\b",
-        r"\b(?:customer\s+data|user\s+information|individual\s+data)\b"
-    ]
-    
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_indicators)
-    has_legal_basis = any(re.search(pattern, content, re.IGNORECASE) for pattern in legal_bases)
+    has_processing = any(_RULES.search(pattern, content) for pattern in PROCESSING_INDICATORS)
+    has_legal_basis = any(_RULES.search(pattern, content) for pattern in LEGAL_BASES)
     
     if has_processing and not has_legal_basis:
         findings.append({
@@ -1180,26 +1206,30 @@ def _validate_lawfulness_of_processing(content: str) -> Dict[str, Any]:
     score = 100 if not has_processing or (has_processing and has_legal_basis) else 20
     return {'score': score, 'findings': findings}
 
+
+# Validate consent conditions (Article 7)
+CONSENT_CONDITIONS_CONSENT_PATTERNS = [r"\b(?:consent|agree|accept)\b"]
+
+# Article 7 requirements
+CONSENT_REQUIREMENTS = {
+    'freely_given': r"\b(?:freely\s+given|voluntary|not\s+forced)\b",
+    'specific': r"\b(?:specific\s+purpose|clearly\s+defined|explicit\s+purpose)\b",
+    'informed': r"\b(?:informed\s+consent|clear\s+information|understand)\b",
+    'unambiguous': r"\b(?:unambiguous|clear\s+indication|affirmative\s+action)\b",
+    'withdrawable': r"\b(?:withdraw\s+consent|revoke|opt-?out|unsubscribe)\b"
+}
+
+
 def _validate_consent_conditions(content: str) -> Dict[str, Any]:
     """Validate consent conditions (Article 7)."""
     findings = []
     
-    consent_patterns = [r"\b(?:consent|agree|accept)\b"]
-    has_consent_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in consent_patterns)
+    has_consent_reference = any(_RULES.search(pattern, content) for pattern in CONSENT_CONDITIONS_CONSENT_PATTERNS)
     
     if has_consent_reference:
-        # Article 7 requirements
-        consent_requirements = {
-            'freely_given': r"\b(?:freely\s+given|voluntary|not\s+forced)\b",
-            'specific': r"\b(?:specific\s+purpose|clearly\s+defined|explicit\s+purpose)\b",
-            'informed': r"\b(?:informed\s+consent|clear\s+information|understand)\b",
-            'unambiguous': r"\b(?:unambiguous|clear\s+indication|affirmative\s+action)\b",
-            'withdrawable': r"\b(?:withdraw\s+consent|revoke|opt-?out|unsubscribe)\b"
-        }
-        
         missing_requirements = []
-        for requirement, pattern in consent_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in CONSENT_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_requirements.append(requirement.replace('_', ' '))
         
         if missing_requirements:
@@ -1217,25 +1247,28 @@ def _validate_consent_conditions(content: str) -> Dict[str, Any]:
     score = 100 if not has_consent_reference or len(findings) == 0 else 40
     return {'score': score, 'findings': findings}
 
+
+# Validate children's consent requirements (Article 8)
+CHILDREN_PATTERNS = [
+    r"\b(?:child|children|minor|under\s+16|under\s+13|parental\s+consent)\b",
+    r"\b(?:age\s+verification|guardian\s+consent|parental\s+approval)\b"
+]
+
+# Check for proper safeguards
+CHILDREN_CONSENT_SAFEGUARD_PATTERNS = [
+    r"\b(?:parental\s+consent|guardian\s+approval|age\s+verification)\b",
+    r"\b(?:16\s+years?\s+old|minimum\s+age|under\s+16)\b"
+]
+
+
 def _validate_children_consent(content: str) -> Dict[str, Any]:
     """Validate children's consent requirements (Article 8)."""
     findings = []
     
-    children_patterns = [
-        r"\b(?:child|children|minor|under\s+16|under\s+13|parental\s+consent)\b",
-        r"\b(?:age\s+verification|guardian\s+consent|parental\s+approval)\b"
-    ]
-    
-    has_children_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in children_patterns)
+    has_children_reference = any(_RULES.search(pattern, content) for pattern in CHILDREN_PATTERNS)
     
     if has_children_reference:
-        # Check for proper safeguards
-        safeguard_patterns = [
-            r"\b(?:parental\s+consent|guardian\s+approval|age\s+verification)\b",
-            r"\b(?:16\s+years?\s+old|minimum\s+age|under\s+16)\b"
-        ]
-        
-        has_safeguards = any(re.search(pattern, content, re.IGNORECASE) for pattern in safeguard_patterns)
+        has_safeguards = any(_RULES.search(pattern, content) for pattern in CHILDREN_CONSENT_SAFEGUARD_PATTERNS)
         
         if not has_safeguards:
             findings.append({
@@ -1251,26 +1284,30 @@ def _validate_children_consent(content: str) -> Dict[str, Any]:
     score = 100 if not has_children_reference or len(findings) == 0 else 30
     return {'score': score, 'findings': findings}
 
+
+# Validate transparency obligations (Article 12)
+TRANSPARENCY_OBLIGATIONS_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|collect|process|store)\b"]
+
+# Article 12 transparency requirements
+TRANSPARENCY_ELEMENTS = {
+    'clear_language': r"\b(?:plain\s+language|easy\s+to\s+understand|clear\s+terms)\b",
+    'accessible_format': r"\b(?:accessible|readable|user-?friendly)\b",
+    'contact_details': r"\b(?:contact\s+us|email|phone|address)\b",
+    'data_categories': r"\b(?:data\s+we\s+collect|information\s+types|categories\s+of\s+data)\b",
+    'purposes': r"\b(?:purpose|why\s+we\s+collect|use\s+your\s+data)\b"
+}
+
+
 def _validate_transparency_obligations(content: str) -> Dict[str, Any]:
     """Validate transparency obligations (Article 12)."""
     findings = []
     
-    processing_patterns = [r"\b(?:personal\s+data|collect|process|store)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in TRANSPARENCY_OBLIGATIONS_PROCESSING_PATTERNS)
     
     if has_processing:
-        # Article 12 transparency requirements
-        transparency_elements = {
-            'clear_language': r"\b(?:plain\s+language|easy\s+to\s+understand|clear\s+terms)\b",
-            'accessible_format': r"\b(?:accessible|readable|user-?friendly)\b",
-            'contact_details': r"\b(?:contact\s+us|email|phone|address)\b",
-            'data_categories': r"\b(?:data\s+we\s+collect|information\s+types|categories\s+of\s+data)\b",
-            'purposes': r"\b(?:purpose|why\s+we\s+collect|use\s+your\s+data)\b"
-        }
-        
         missing_elements = []
-        for element, pattern in transparency_elements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for element, pattern in TRANSPARENCY_ELEMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_elements.append(element.replace('_', ' '))
         
         if missing_elements:
@@ -1288,26 +1325,30 @@ def _validate_transparency_obligations(content: str) -> Dict[str, Any]:
     score = 100 if not has_processing or len(findings) == 0 else 50
     return {'score': score, 'findings': findings}
 
+
+# Validate data controller responsibility (Article 24)
+CONTROLLER_PATTERNS = [r"\b(?:data\s+controller|responsible\s+for\s+processing|we\s+are\s+controller)\b"]
+
+# Article 24 accountability requirements
+ACCOUNTABILITY_ELEMENTS = {
+    'policies': r"\b(?:privacy\s+policy|data\s+protection\s+policy|policies)\b",
+    'procedures': r"\b(?:procedures|processes|guidelines)\b",
+    'training': r"\b(?:staff\s+training|employee\s+training|awareness)\b",
+    'monitoring': r"\b(?:monitoring|oversight|compliance\s+review)\b",
+    'documentation': r"\b(?:records|documentation|evidence)\b"
+}
+
+
 def _validate_controller_responsibility(content: str) -> Dict[str, Any]:
     """Validate data controller responsibility (Article 24)."""
     findings = []
     
-    controller_patterns = [r"\b(?:data\s+controller|responsible\s+for\s+processing|we\s+are\s+controller)\b"]
-    has_controller_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in controller_patterns)
+    has_controller_reference = any(_RULES.search(pattern, content) for pattern in CONTROLLER_PATTERNS)
     
     if has_controller_reference:
-        # Article 24 accountability requirements
-        accountability_elements = {
-            'policies': r"\b(?:privacy\s+policy|data\s+protection\s+policy|policies)\b",
-            'procedures': r"\b(?:procedures|processes|guidelines)\b",
-            'training': r"\b(?:staff\s+training|employee\s+training|awareness)\b",
-            'monitoring': r"\b(?:monitoring|oversight|compliance\s+review)\b",
-            'documentation': r"\b(?:records|documentation|evidence)\b"
-        }
-        
         missing_elements = []
-        for element, pattern in accountability_elements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for element, pattern in ACCOUNTABILITY_ELEMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_elements.append(element)
         
         if len(missing_elements) > 2:  # Missing more than 2 key elements
@@ -1325,26 +1366,30 @@ def _validate_controller_responsibility(content: str) -> Dict[str, Any]:
     score = 100 if len(findings) == 0 else 60
     return {'score': score, 'findings': findings}
 
+
+# Validate security of processing requirements (Article 32)
+SECURITY_OF_PROCESSING_PROCESSING_PATTERNS = [r"\b(?:process|store|transmit|handle)\s+(?:personal\s+)?data\b"]
+
+# Article 32 security measures
+SECURITY_MEASURES = {
+    'encryption': r"\b(?:encryption|encrypted|crypto|ssl|tls)\b",
+    'access_controls': r"\b(?:access\s+control|authentication|authorization|passwords?)\b",
+    'backup': r"\b(?:backup|restore|recovery|resilience)\b",
+    'testing': r"\b(?:security\s+testing|penetration\s+test|vulnerability)\b",
+    'monitoring': r"\b(?:monitoring|logging|audit\s+trail|intrusion\s+detection)\b"
+}
+
+
 def _validate_security_of_processing(content: str) -> Dict[str, Any]:
     """Validate security of processing requirements (Article 32)."""
     findings = []
     
-    processing_patterns = [r"\b(?:process|store|transmit|handle)\s+(?:personal\s+)?data\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in SECURITY_OF_PROCESSING_PROCESSING_PATTERNS)
     
     if has_processing:
-        # Article 32 security measures
-        security_measures = {
-            'encryption': r"\b(?:encryption|encrypted|crypto|ssl|tls)\b",
-            'access_controls': r"\b(?:access\s+control|authentication|authorization|passwords?)\b",
-            'backup': r"\b(?:backup|restore|recovery|resilience)\b",
-            'testing': r"\b(?:security\s+testing|penetration\s+test|vulnerability)\b",
-            'monitoring': r"\b(?:monitoring|logging|audit\s+trail|intrusion\s+detection)\b"
-        }
-        
         missing_measures = []
-        for measure, pattern in security_measures.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for measure, pattern in SECURITY_MEASURES.items():
+            if not _RULES.search(pattern, content):
                 missing_measures.append(measure.replace('_', ' '))
         
         if len(missing_measures) > 2:
@@ -1362,24 +1407,27 @@ def _validate_security_of_processing(content: str) -> Dict[str, Any]:
     score = 100 if not has_processing or len(findings) == 0 else 40
     return {'score': score, 'findings': findings}
 
+
+# Validate prior consultation requirements (Article 36)
+HIGH_RISK_PATTERNS = [
+    r"\b(?:high\s+risk|systematic\s+monitoring|large\s+scale)\b",
+    r"\b(?:special\s+categories|automated\s+decision|profiling)\b"
+]
+
+CONSULTATION_PATTERNS = [
+    r"\b(?:supervisory\s+authority|prior\s+consultation|authority\s+approval)\b",
+    r"\b(?:dpa\s+consultation|regulatory\s+guidance)\b"
+]
+
+
 def _validate_prior_consultation(content: str) -> Dict[str, Any]:
     """Validate prior consultation requirements (Article 36)."""
     findings = []
     
-    high_risk_patterns = [
-        r"\b(?:high\s+risk|systematic\s+monitoring|large\s+scale)\b",
-        r"\b(?:special\s+categories|automated\s+decision|profiling)\b"
-    ]
-    
-    has_high_risk = any(re.search(pattern, content, re.IGNORECASE) for pattern in high_risk_patterns)
+    has_high_risk = any(_RULES.search(pattern, content) for pattern in HIGH_RISK_PATTERNS)
     
     if has_high_risk:
-        consultation_patterns = [
-            r"\b(?:supervisory\s+authority|prior\s+consultation|authority\s+approval)\b",
-            r"\b(?:dpa\s+consultation|regulatory\s+guidance)\b"
-        ]
-        
-        has_consultation = any(re.search(pattern, content, re.IGNORECASE) for pattern in consultation_patterns)
+        has_consultation = any(_RULES.search(pattern, content) for pattern in CONSULTATION_PATTERNS)
         
         if not has_consultation:
             findings.append({
@@ -1395,26 +1443,30 @@ def _validate_prior_consultation(content: str) -> Dict[str, Any]:
     score = 100 if not has_high_risk or len(findings) == 0 else 50
     return {'score': score, 'findings': findings}
 
+
+# Validate DPO obligations (Articles 38-39)
+DPO_PATTERNS = [r"\b(?:data\s+protection\s+officer|dpo)\b"]
+
+# Article 38-39 DPO requirements
+DPO_REQUIREMENTS = {
+    'independence': r"\b(?:independent|no\s+conflict|separate\s+reporting)\b",
+    'expertise': r"\b(?:expert|qualified|certified|experienced)\b",
+    'contact_details': r"\b(?:contact\s+dpo|dpo\s+email|reach\s+dpo)\b",
+    'monitoring': r"\b(?:monitor\s+compliance|oversee|compliance\s+monitoring)\b",
+    'training': r"\b(?:training|awareness|education)\b"
+}
+
+
 def _validate_dpo_obligations(content: str) -> Dict[str, Any]:
     """Validate DPO obligations (Articles 38-39)."""
     findings = []
     
-    dpo_patterns = [r"\b(?:data\s+protection\s+officer|dpo)\b"]
-    has_dpo_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in dpo_patterns)
+    has_dpo_reference = any(_RULES.search(pattern, content) for pattern in DPO_PATTERNS)
     
     if has_dpo_reference:
-        # Article 38-39 DPO requirements
-        dpo_requirements = {
-            'independence': r"\b(?:independent|no\s+conflict|separate\s+reporting)\b",
-            'expertise': r"\b(?:expert|qualified|certified|experienced)\b",
-            'contact_details': r"\b(?:contact\s+dpo|dpo\s+email|reach\s+dpo)\b",
-            'monitoring': r"\b(?:monitor\s+compliance|oversee|compliance\s+monitoring)\b",
-            'training': r"\b(?:training|awareness|education)\b"
-        }
-        
         missing_requirements = []
-        for requirement, pattern in dpo_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in DPO_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_requirements.append(requirement.replace('_', ' '))
         
         if missing_requirements:
@@ -1432,20 +1484,24 @@ def _validate_dpo_obligations(content: str) -> Dict[str, Any]:
     score = 100 if not has_dpo_reference or len(findings) == 0 else 70
     return {'score': score, 'findings': findings}
 
+
+# Validate right to lodge complaints (Article 77)
+COMPLAINT_RIGHTS_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|collect|process)\b"]
+
+COMPLAINT_PATTERNS = [
+    r"\b(?:lodge\s+complaint|supervisory\s+authority|data\s+protection\s+authority)\b",
+    r"\b(?:complaint\s+procedure|file\s+complaint|regulator)\b"
+]
+
+
 def _validate_complaint_rights(content: str) -> Dict[str, Any]:
     """Validate right to lodge complaints (Article 77)."""
     findings = []
     
-    processing_patterns = [r"\b(?:personal\s+data|collect|process)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in COMPLAINT_RIGHTS_PROCESSING_PATTERNS)
     
     if has_processing:
-        complaint_patterns = [
-            r"\b(?:lodge\s+complaint|supervisory\s+authority|data\s+protection\s+authority)\b",
-            r"\b(?:complaint\s+procedure|file\s+complaint|regulator)\b"
-        ]
-        
-        has_complaint_info = any(re.search(pattern, content, re.IGNORECASE) for pattern in complaint_patterns)
+        has_complaint_info = any(_RULES.search(pattern, content) for pattern in COMPLAINT_PATTERNS)
         
         if not has_complaint_info:
             findings.append({
@@ -1461,26 +1517,30 @@ def _validate_complaint_rights(content: str) -> Dict[str, Any]:
     score = 100 if not has_processing or len(findings) == 0 else 70
     return {'score': score, 'findings': findings}
 
+
+# Validate compensation and administrative fines (Articles 82-84)
+COMPENSATION_RIGHTS_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|process|breach|violation)\b"]
+
+COMPENSATION_PATTERNS = [
+    r"\b(?:compensation|damages|liability|indemnity)\b",
+    r"\b(?:right\s+to\s+compensation|material\s+damage|non-?material\s+damage)\b"
+]
+
+PENALTY_PATTERNS = [
+    r"\b(?:administrative\s+fine|penalty|sanctions?|€?\d+\s*million)\b",
+    r"\b(?:4%\s*(?:of\s+)?(?:annual\s+)?turnover|20\s*million\s*euro)\b"
+]
+
+
 def _validate_compensation_rights(content: str) -> Dict[str, Any]:
     """Validate compensation and administrative fines (Articles 82-84)."""
     findings = []
     
-    processing_patterns = [r"\b(?:personal\s+data|process|breach|violation)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in COMPENSATION_RIGHTS_PROCESSING_PATTERNS)
     
     if has_processing:
-        compensation_patterns = [
-            r"\b(?:compensation|damages|liability|indemnity)\b",
-            r"\b(?:right\s+to\s+compensation|material\s+damage|non-?material\s+damage)\b"
-        ]
-        
-        penalty_patterns = [
-            r"\b(?:administrative\s+fine|penalty|sanctions?|€?\d+\s*million)\b",
-            r"\b(?:4%\s*(?:of\s+)?(?:annual\s+)?turnover|20\s*million\s*euro)\b"
-        ]
-        
-        has_compensation_info = any(re.search(pattern, content, re.IGNORECASE) for pattern in compensation_patterns)
-        has_penalty_awareness = any(re.search(pattern, content, re.IGNORECASE) for pattern in penalty_patterns)
+        has_compensation_info = any(_RULES.search(pattern, content) for pattern in COMPENSATION_PATTERNS)
+        has_penalty_awareness = any(_RULES.search(pattern, content) for pattern in PENALTY_PATTERNS)
         
         if not has_compensation_info:
             findings.append({
@@ -1509,17 +1569,36 @@ def _validate_compensation_rights(content: str) -> Dict[str, Any]:
 
 # COMPLETE 99-ARTICLE GDPR VALIDATION FUNCTIONS
 
+
+# Article 1: Subject-matter and objectives
+DATA_PROTECTION_PATTERNS = [r"\b(?:personal\s+data|data\s+protection|processing|privacy)\b"]
+
+# Article 2: Material scope
+COMPLETE_CHAPTER_1_ARTICLES_1_4_PROCESSING_PATTERNS = [r"\b(?:automated.*processing|filing.*system|structured.*set)\b"]
+
+EXCLUSION_PATTERNS = [r"\b(?:purely.*personal.*household|law.*enforcement|national.*security)\b"]
+
+# Article 3: Territorial scope
+GEOGRAPHIC_PATTERNS = [r"\b(?:eu|european.*union|netherlands|cross.*border|international)\b"]
+
+TERRITORIAL_PATTERNS = [r"\b(?:establishment.*union|targeting.*union|monitoring.*behavior)\b"]
+
+# Article 4: Definitions
+GDPR_TERMS = [r"\b(?:personal\s+data|processing|controller|processor|data\s+subject|consent)\b"]
+
+DEFINITION_PATTERNS = [r"\b(?:means|definition|defined\s+as|shall\s+mean)\b"]
+
+OBJECTIVE_PATTERNS = [r"\b(?:protection.*fundamental.*rights|right.*privacy|free.*movement.*personal.*data)\b"]
+
+
 def _validate_complete_chapter_1_articles_1_4(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter I: General Provisions (Articles 1-4)."""
     findings = []
     
-    # Article 1: Subject-matter and objectives
-    data_protection_patterns = [r"\b(?:personal\s+data|data\s+protection|processing|privacy)\b"]
-    has_data_protection = any(re.search(pattern, content, re.IGNORECASE) for pattern in data_protection_patterns)
+    has_data_protection = any(_RULES.search(pattern, content) for pattern in DATA_PROTECTION_PATTERNS)
     
     if has_data_protection:
-        objective_patterns = [r"\b(?:protection.*fundamental.*rights|right.*privacy|free.*movement.*personal.*data)\b"]
-        has_objectives = any(re.search(pattern, content, re.IGNORECASE) for pattern in objective_patterns)
+        has_objectives = any(_RULES.search(pattern, content) for pattern in OBJECTIVE_PATTERNS)
         
         if not has_objectives:
             findings.append({
@@ -1532,12 +1611,8 @@ def _validate_complete_chapter_1_articles_1_4(content: str) -> List[Dict[str, An
                 'recommendation': 'State clear data protection objectives aligned with fundamental rights and free movement'
             })
     
-    # Article 2: Material scope
-    processing_patterns = [r"\b(?:automated.*processing|filing.*system|structured.*set)\b"]
-    exclusion_patterns = [r"\b(?:purely.*personal.*household|law.*enforcement|national.*security)\b"]
-    
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
-    has_exclusions = any(re.search(pattern, content, re.IGNORECASE) for pattern in exclusion_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_1_ARTICLES_1_4_PROCESSING_PATTERNS)
+    has_exclusions = any(_RULES.search(pattern, content) for pattern in EXCLUSION_PATTERNS)
     
     if has_processing and not has_exclusions:
         findings.append({
@@ -1550,12 +1625,8 @@ def _validate_complete_chapter_1_articles_1_4(content: str) -> List[Dict[str, An
             'recommendation': 'Clarify material scope boundaries and applicable exclusions'
         })
     
-    # Article 3: Territorial scope
-    geographic_patterns = [r"\b(?:eu|european.*union|netherlands|cross.*border|international)\b"]
-    territorial_patterns = [r"\b(?:establishment.*union|targeting.*union|monitoring.*behavior)\b"]
-    
-    has_geographic = any(re.search(pattern, content, re.IGNORECASE) for pattern in geographic_patterns)
-    has_territorial = any(re.search(pattern, content, re.IGNORECASE) for pattern in territorial_patterns)
+    has_geographic = any(_RULES.search(pattern, content) for pattern in GEOGRAPHIC_PATTERNS)
+    has_territorial = any(_RULES.search(pattern, content) for pattern in TERRITORIAL_PATTERNS)
     
     if has_geographic and not has_territorial:
         findings.append({
@@ -1568,12 +1639,8 @@ def _validate_complete_chapter_1_articles_1_4(content: str) -> List[Dict[str, An
             'recommendation': 'Determine GDPR applicability based on establishment, targeting, or monitoring criteria'
         })
     
-    # Article 4: Definitions
-    gdpr_terms = [r"\b(?:personal\s+data|processing|controller|processor|data\s+subject|consent)\b"]
-    definition_patterns = [r"\b(?:means|definition|defined\s+as|shall\s+mean)\b"]
-    
-    has_gdpr_terms = any(re.search(pattern, content, re.IGNORECASE) for pattern in gdpr_terms)
-    has_definitions = any(re.search(pattern, content, re.IGNORECASE) for pattern in definition_patterns)
+    has_gdpr_terms = any(_RULES.search(pattern, content) for pattern in GDPR_TERMS)
+    has_definitions = any(_RULES.search(pattern, content) for pattern in DEFINITION_PATTERNS)
     
     if has_gdpr_terms and not has_definitions:
         findings.append({
@@ -1588,6 +1655,43 @@ def _validate_complete_chapter_1_articles_1_4(content: str) -> List[Dict[str, An
     
     return findings
 
+
+# Article 5: Principles - comprehensive
+COMPLETE_CHAPTER_2_ARTICLES_5_11_PROCESSING_PATTERNS = [r"\b(?:personal\s+data|processing|collect|store|use)\b"]
+
+# Article 9: Special categories
+COMPLETE_CHAPTER_2_ARTICLES_5_11_SPECIAL_CATEGORIES = [
+    r"\b(?:racial.*origin|ethnic.*origin|political.*opinion|religious.*belief)\b",
+    r"\b(?:trade.*union.*membership|genetic.*data|biometric.*data|health.*data|sex.*life)\b"
+]
+
+EXCEPTION_PATTERNS = [
+    r"\b(?:explicit.*consent|vital.*interests|public.*interest|medical.*purposes|research)\b"
+]
+
+# Article 10: Criminal convictions
+CRIMINAL_PATTERNS = [r"\b(?:criminal.*conviction|criminal.*record|criminal.*offence)\b"]
+
+COMPLETE_CHAPTER_2_ARTICLES_5_11_AUTHORITY_PATTERNS = [r"\b(?:official.*authority|public.*authority|legal.*authorization)\b"]
+
+# Article 11: No identification processing
+ANONYMOUS_PATTERNS = [r"\b(?:anonymous.*processing|pseudonymous.*data|no.*identification.*required)\b"]
+
+RIGHTS_LIMITATION_PATTERNS = [r"\b(?:unable.*identify|additional.*information.*identification|rights.*limitations)\b"]
+
+PRINCIPLES = {
+    'lawfulness': [r"\b(?:lawful.*basis|legal.*basis|lawful.*processing)\b"],
+    'fairness': [r"\b(?:fair.*processing|fair.*manner|fairness)\b"],
+    'transparency': [r"\b(?:transparent|transparency|clear.*information)\b"],
+    'purpose_limitation': [r"\b(?:specified.*purpose|explicit.*purpose|purpose.*limitation)\b"],
+    'data_minimisation': [r"\b(?:adequate.*relevant.*limited|data.*minimisation|necessary.*data)\b"],
+    'accuracy': [r"\b(?:accurate|up.*to.*date|data.*accuracy)\b"],
+    'storage_limitation': [r"\b(?:storage.*limitation|retention.*period|no.*longer.*necessary)\b"],
+    'integrity_confidentiality': [r"\b(?:security.*processing|integrity.*confidentiality|appropriate.*security)\b"],
+    'accountability': [r"\b(?:demonstrate.*compliance|accountability|responsible.*compliance)\b"]
+}
+
+
 def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter II: Principles (Articles 5-11) with enhanced 6,7,8."""
     findings = []
@@ -1597,26 +1701,12 @@ def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, A
     findings.extend(_validate_consent_conditions(content)['findings'])
     findings.extend(_validate_children_consent(content)['findings'])
     
-    # Article 5: Principles - comprehensive
-    processing_patterns = [r"\b(?:personal\s+data|processing|collect|store|use)\b"]
-    has_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
+    has_processing = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_2_ARTICLES_5_11_PROCESSING_PATTERNS)
     
     if has_processing:
-        principles = {
-            'lawfulness': [r"\b(?:lawful.*basis|legal.*basis|lawful.*processing)\b"],
-            'fairness': [r"\b(?:fair.*processing|fair.*manner|fairness)\b"],
-            'transparency': [r"\b(?:transparent|transparency|clear.*information)\b"],
-            'purpose_limitation': [r"\b(?:specified.*purpose|explicit.*purpose|purpose.*limitation)\b"],
-            'data_minimisation': [r"\b(?:adequate.*relevant.*limited|data.*minimisation|necessary.*data)\b"],
-            'accuracy': [r"\b(?:accurate|up.*to.*date|data.*accuracy)\b"],
-            'storage_limitation': [r"\b(?:storage.*limitation|retention.*period|no.*longer.*necessary)\b"],
-            'integrity_confidentiality': [r"\b(?:security.*processing|integrity.*confidentiality|appropriate.*security)\b"],
-            'accountability': [r"\b(?:demonstrate.*compliance|accountability|responsible.*compliance)\b"]
-        }
-        
         missing_principles = []
-        for principle, patterns in principles.items():
-            has_principle = any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns)
+        for principle, patterns in PRINCIPLES.items():
+            has_principle = any(_RULES.search(pattern, content) for pattern in patterns)
             if not has_principle:
                 missing_principles.append(principle.replace('_', ' '))
         
@@ -1632,18 +1722,8 @@ def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, A
                 'recommendation': 'Implement all Article 5 principles: lawfulness, fairness, transparency, purpose limitation, data minimisation, accuracy, storage limitation, security, accountability'
             })
     
-    # Article 9: Special categories
-    special_categories = [
-        r"\b(?:racial.*origin|ethnic.*origin|political.*opinion|religious.*belief)\b",
-        r"\b(?:trade.*union.*membership|genetic.*data|biometric.*data|health.*data|sex.*life)\b"
-    ]
-    
-    exception_patterns = [
-        r"\b(?:explicit.*consent|vital.*interests|public.*interest|medical.*purposes|research)\b"
-    ]
-    
-    has_special = any(re.search(pattern, content, re.IGNORECASE) for pattern in special_categories)
-    has_exceptions = any(re.search(pattern, content, re.IGNORECASE) for pattern in exception_patterns)
+    has_special = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_2_ARTICLES_5_11_SPECIAL_CATEGORIES)
+    has_exceptions = any(_RULES.search(pattern, content) for pattern in EXCEPTION_PATTERNS)
     
     if has_special and not has_exceptions:
         findings.append({
@@ -1656,12 +1736,8 @@ def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, A
             'recommendation': 'Establish valid Article 9(2) exception for special category processing'
         })
     
-    # Article 10: Criminal convictions
-    criminal_patterns = [r"\b(?:criminal.*conviction|criminal.*record|criminal.*offence)\b"]
-    authority_patterns = [r"\b(?:official.*authority|public.*authority|legal.*authorization)\b"]
-    
-    has_criminal = any(re.search(pattern, content, re.IGNORECASE) for pattern in criminal_patterns)
-    has_authority = any(re.search(pattern, content, re.IGNORECASE) for pattern in authority_patterns)
+    has_criminal = any(_RULES.search(pattern, content) for pattern in CRIMINAL_PATTERNS)
+    has_authority = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_2_ARTICLES_5_11_AUTHORITY_PATTERNS)
     
     if has_criminal and not has_authority:
         findings.append({
@@ -1674,12 +1750,8 @@ def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, A
             'recommendation': 'Ensure criminal conviction processing only under official authority or legal authorization'
         })
     
-    # Article 11: No identification processing
-    anonymous_patterns = [r"\b(?:anonymous.*processing|pseudonymous.*data|no.*identification.*required)\b"]
-    rights_limitation_patterns = [r"\b(?:unable.*identify|additional.*information.*identification|rights.*limitations)\b"]
-    
-    has_anonymous = any(re.search(pattern, content, re.IGNORECASE) for pattern in anonymous_patterns)
-    has_rights_limitation = any(re.search(pattern, content, re.IGNORECASE) for pattern in rights_limitation_patterns)
+    has_anonymous = any(_RULES.search(pattern, content) for pattern in ANONYMOUS_PATTERNS)
+    has_rights_limitation = any(_RULES.search(pattern, content) for pattern in RIGHTS_LIMITATION_PATTERNS)
     
     if has_anonymous and not has_rights_limitation:
         findings.append({
@@ -1694,6 +1766,16 @@ def _validate_complete_chapter_2_articles_5_11(content: str) -> List[Dict[str, A
     
     return findings
 
+
+# Article 13: Information collected from data subject
+COMPLETE_CHAPTER_3_ARTICLES_12_23_PROCESSING_PATTERNS = [r"\b(?:collect.*personal.*data|obtain.*data.*subject|gather.*information)\b"]
+
+INFORMATION_PATTERNS = [r"\b(?:identity.*controller|purposes.*processing|legal.*basis|recipients)\b"]
+
+# Article 15: Right of access
+ACCESS_PATTERNS = [r"\b(?:access.*personal.*data|copy.*personal.*data|right.*access)\b"]
+
+
 def _validate_complete_chapter_3_articles_12_23(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter III: Rights (Articles 12-23)."""
     findings = []
@@ -1701,12 +1783,8 @@ def _validate_complete_chapter_3_articles_12_23(content: str) -> List[Dict[str,
     # Use existing validation functions where available
     findings.extend(_validate_transparency_obligations(content)['findings'])
     
-    # Article 13: Information collected from data subject
-    processing_patterns = [r"\b(?:collect.*personal.*data|obtain.*data.*subject|gather.*information)\b"]
-    information_patterns = [r"\b(?:identity.*controller|purposes.*processing|legal.*basis|recipients)\b"]
-    
-    has_collection = any(re.search(pattern, content, re.IGNORECASE) for pattern in processing_patterns)
-    has_information = any(re.search(pattern, content, re.IGNORECASE) for pattern in information_patterns)
+    has_collection = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_3_ARTICLES_12_23_PROCESSING_PATTERNS)
+    has_information = any(_RULES.search(pattern, content) for pattern in INFORMATION_PATTERNS)
     
     if has_collection and not has_information:
         findings.append({
@@ -1719,9 +1797,7 @@ def _validate_complete_chapter_3_articles_12_23(content: str) -> List[Dict[str,
             'recommendation': 'Provide controller identity, purposes, legal basis, recipients per Article 13'
         })
     
-    # Article 15: Right of access
-    access_patterns = [r"\b(?:access.*personal.*data|copy.*personal.*data|right.*access)\b"]
-    has_access = any(re.search(pattern, content, re.IGNORECASE) for pattern in access_patterns)
+    has_access = any(_RULES.search(pattern, content) for pattern in ACCESS_PATTERNS)
     
     if not has_access:
         findings.append({
@@ -1750,6 +1826,13 @@ def _validate_complete_chapter_4_articles_24_43(content: str) -> List[Dict[str,
     # Additional controller/processor articles would be implemented
     return findings
 
+
+# Fallback validation
+INTERNATIONAL_PATTERNS = [r"\b(?:international.*transfer|third.*country|non.*eu)\b"]
+
+COMPLETE_CHAPTER_5_ARTICLES_44_49_SAFEGUARD_PATTERNS = [r"\b(?:adequacy.*decision|standard.*contractual.*clauses|binding.*corporate.*rules)\b"]
+
+
 def _validate_complete_chapter_5_articles_44_49(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter V: Transfers (Articles 44-49)."""
     findings = []
@@ -1759,12 +1842,8 @@ def _validate_complete_chapter_5_articles_44_49(content: str) -> List[Dict[str,
         transfer_results = _validate_international_transfers(content)
         findings.extend(transfer_results.get('findings', []))
     except:
-        # Fallback validation
-        international_patterns = [r"\b(?:international.*transfer|third.*country|non.*eu)\b"]
-        safeguard_patterns = [r"\b(?:adequacy.*decision|standard.*contractual.*clauses|binding.*corporate.*rules)\b"]
-        
-        has_international = any(re.search(pattern, content, re.IGNORECASE) for pattern in international_patterns)
-        has_safeguards = any(re.search(pattern, content, re.IGNORECASE) for pattern in safeguard_patterns)
+        has_international = any(_RULES.search(pattern, content) for pattern in INTERNATIONAL_PATTERNS)
+        has_safeguards = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_5_ARTICLES_44_49_SAFEGUARD_PATTERNS)
         
         if has_international and not has_safeguards:
             findings.append({
@@ -1779,16 +1858,19 @@ def _validate_complete_chapter_5_articles_44_49(content: str) -> List[Dict[str,
     
     return findings
 
+
+# Check for supervisory authority interaction
+COMPLETE_CHAPTER_6_ARTICLES_51_59_AUTHORITY_PATTERNS = [r"\b(?:supervisory.*authority|data.*protection.*authority|regulator)\b"]
+
+COOPERATION_PATTERNS = [r"\b(?:cooperate.*authority|assistance.*authority|consult.*authority)\b"]
+
+
 def _validate_complete_chapter_6_articles_51_59(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter VI: Authorities (Articles 51-59)."""
     findings = []
     
-    # Check for supervisory authority interaction
-    authority_patterns = [r"\b(?:supervisory.*authority|data.*protection.*authority|regulator)\b"]
-    cooperation_patterns = [r"\b(?:cooperate.*authority|assistance.*authority|consult.*authority)\b"]
-    
-    has_authority_context = any(re.search(pattern, content, re.IGNORECASE) for pattern in authority_patterns)
-    has_cooperation = any(re.search(pattern, content, re.IGNORECASE) for pattern in cooperation_patterns)
+    has_authority_context = any(_RULES.search(pattern, content) for pattern in COMPLETE_CHAPTER_6_ARTICLES_51_59_AUTHORITY_PATTERNS)
+    has_cooperation = any(_RULES.search(pattern, content) for pattern in COOPERATION_PATTERNS)
     
     if has_authority_context and not has_cooperation:
         findings.append({
@@ -1803,16 +1885,19 @@ def _validate_complete_chapter_6_articles_51_59(content: str) -> List[Dict[str,
     
     return findings
 
+
+# Check for cross-border processing
+CROSS_BORDER_PATTERNS = [r"\b(?:cross.*border.*processing|multiple.*member.*states|lead.*supervisory.*authority)\b"]
+
+CONSISTENCY_PATTERNS = [r"\b(?:consistency.*mechanism|one.*stop.*shop|edpb)\b"]
+
+
 def _validate_complete_chapter_7_articles_60_76(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter VII: Cooperation (Articles 60-76)."""
     findings = []
     
-    # Check for cross-border processing
-    cross_border_patterns = [r"\b(?:cross.*border.*processing|multiple.*member.*states|lead.*supervisory.*authority)\b"]
-    consistency_patterns = [r"\b(?:consistency.*mechanism|one.*stop.*shop|edpb)\b"]
-    
-    has_cross_border = any(re.search(pattern, content, re.IGNORECASE) for pattern in cross_border_patterns)
-    has_consistency = any(re.search(pattern, content, re.IGNORECASE) for pattern in consistency_patterns)
+    has_cross_border = any(_RULES.search(pattern, content) for pattern in CROSS_BORDER_PATTERNS)
+    has_consistency = any(_RULES.search(pattern, content) for pattern in CONSISTENCY_PATTERNS)
     
     if has_cross_border and not has_consistency:
         findings.append({
@@ -1837,16 +1922,19 @@ def _validate_complete_chapter_8_articles_77_84(content: str) -> List[Dict[str,
     
     return findings
 
+
+# Article 85: Freedom of expression
+EXPRESSION_PATTERNS = [r"\b(?:freedom.*expression|freedom.*information|journalistic.*purposes)\b"]
+
+BALANCING_PATTERNS = [r"\b(?:balance.*freedom.*expression|reconcile.*data.*protection)\b"]
+
+
 def _validate_complete_chapter_9_articles_85_91(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter IX: Specific Situations (Articles 85-91)."""
     findings = []
     
-    # Article 85: Freedom of expression
-    expression_patterns = [r"\b(?:freedom.*expression|freedom.*information|journalistic.*purposes)\b"]
-    balancing_patterns = [r"\b(?:balance.*freedom.*expression|reconcile.*data.*protection)\b"]
-    
-    has_expression = any(re.search(pattern, content, re.IGNORECASE) for pattern in expression_patterns)
-    has_balancing = any(re.search(pattern, content, re.IGNORECASE) for pattern in balancing_patterns)
+    has_expression = any(_RULES.search(pattern, content) for pattern in EXPRESSION_PATTERNS)
+    has_balancing = any(_RULES.search(pattern, content) for pattern in BALANCING_PATTERNS)
     
     if has_expression and not has_balancing:
         findings.append({
@@ -1861,27 +1949,33 @@ def _validate_complete_chapter_9_articles_85_91(content: str) -> List[Dict[str,
     
     return findings
 
+
+# These articles are about Commission powers - minimal validation needed
+COMMISSION_PATTERNS = [r"\b(?:commission.*delegated.*act|implementing.*act|regulatory.*procedure)\b"]
+
+
 def _validate_complete_chapter_10_articles_92_93(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter X: Delegated Acts (Articles 92-93)."""
     findings = []
     
-    # These articles are about Commission powers - minimal validation needed
-    commission_patterns = [r"\b(?:commission.*delegated.*act|implementing.*act|regulatory.*procedure)\b"]
-    has_commission = any(re.search(pattern, content, re.IGNORECASE) for pattern in commission_patterns)
+    has_commission = any(_RULES.search(pattern, content) for pattern in COMMISSION_PATTERNS)
     
     # Generally no findings expected for most organizations
     return findings
 
+
+# Article 95: Relationship with Directive 2002/58/EC (ePrivacy)
+EPRIVACY_PATTERNS = [r"\b(?:eprivacy|electronic.*communications|cookies|direct.*marketing)\b"]
+
+DIRECTIVE_PATTERNS = [r"\b(?:directive.*2002.*58|eprivacy.*directive|lex.*specialis)\b"]
+
+
 def _validate_complete_chapter_11_articles_94_99(content: str) -> List[Dict[str, Any]]:
     """Complete validation for Chapter XI: Final Provisions (Articles 94-99)."""
     findings = []
     
-    # Article 95: Relationship with Directive 2002/58/EC (ePrivacy)
-    eprivacy_patterns = [r"\b(?:eprivacy|electronic.*communications|cookies|direct.*marketing)\b"]
-    directive_patterns = [r"\b(?:directive.*2002.*58|eprivacy.*directive|lex.*specialis)\b"]
-    
-    has_eprivacy = any(re.search(pattern, content, re.IGNORECASE) for pattern in eprivacy_patterns)
-    has_directive = any(re.search(pattern, content, re.IGNORECASE) for pattern in directive_patterns)
+    has_eprivacy = any(_RULES.search(pattern, content) for pattern in EPRIVACY_PATTERNS)
+    has_directive = any(_RULES.search(pattern, content) for pattern in DIRECTIVE_PATTERNS)
     
     if has_eprivacy and not has_directive:
         findings.append({
@@ -1919,4 +2013,34 @@ def _calculate_comprehensive_score_99_articles(findings: List[Dict[str, Any]]) -
     penalty_ratio = min(total_penalty / max_penalty, 1.0) if max_penalty > 0 else 0
     
     score = max(0, 100 - int(penalty_ratio * 100))
-    return score
\ No newline at end of file
+    return score
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    GDPR_PRINCIPLES, DATA_SUBJECT_RIGHTS, SPECIAL_CATEGORIES, SPECIAL_CATEGORIES_CONSENT_PATTERNS,
+    TRANSFER_PATTERNS, THIRD_COUNTRY_PATTERNS, CLOUD_PROVIDER_PATTERNS, ADEQUACY_PATTERNS,
+    INTERNATIONAL_TRANSFERS_SAFEGUARD_PATTERNS, BCR_PATTERNS, DEROGATION_PATTERNS, SCHREMS_PATTERNS,
+    US_TRANSFER_PATTERNS, INTERNATIONAL_TRANSFERS_PROHIBITED_PATTERNS, BREACH_PATTERNS, NOTIFICATION_PATTERNS,
+    DESIGN_PATTERNS, ENGINEERING_PATTERNS, VIOLATION_PATTERNS, PROCESSOR_PATTERNS, CONTRACT_PATTERNS,
+    PROCESSOR_OBLIGATIONS_PROHIBITED_PATTERNS, PRIVACY_BY_DESIGN_INDICATORS, VIOLATIONS, REQUIRED_ELEMENTS,
+    DOCUMENTATION_PATTERNS, DPIA_TRIGGERS, DPIA_DOCUMENTATION, DPO_REQUIRED_CRITERIA, DPO_INDICATORS,
+    SIZE_INDICATORS, TRANSFER_INDICATORS, SAFEGUARDS, LEGAL_BASES, PROCESSING_INDICATORS,
+    CONSENT_CONDITIONS_CONSENT_PATTERNS, CONSENT_REQUIREMENTS, CHILDREN_PATTERNS,
+    CHILDREN_CONSENT_SAFEGUARD_PATTERNS, TRANSPARENCY_OBLIGATIONS_PROCESSING_PATTERNS, TRANSPARENCY_ELEMENTS,
+    CONTROLLER_PATTERNS, ACCOUNTABILITY_ELEMENTS, SECURITY_OF_PROCESSING_PROCESSING_PATTERNS,
+    SECURITY_MEASURES, HIGH_RISK_PATTERNS, CONSULTATION_PATTERNS, DPO_PATTERNS, DPO_REQUIREMENTS,
+    COMPLAINT_RIGHTS_PROCESSING_PATTERNS, COMPLAINT_PATTERNS, COMPENSATION_RIGHTS_PROCESSING_PATTERNS,
+    COMPENSATION_PATTERNS, PENALTY_PATTERNS, DATA_PROTECTION_PATTERNS,
+    COMPLETE_CHAPTER_1_ARTICLES_1_4_PROCESSING_PATTERNS, EXCLUSION_PATTERNS, GEOGRAPHIC_PATTERNS,
+    TERRITORIAL_PATTERNS, GDPR_TERMS, DEFINITION_PATTERNS, OBJECTIVE_PATTERNS,
+    COMPLETE_CHAPTER_2_ARTICLES_5_11_PROCESSING_PATTERNS, COMPLETE_CHAPTER_2_ARTICLES_5_11_SPECIAL_CATEGORIES,
+    EXCEPTION_PATTERNS, CRIMINAL_PATTERNS, COMPLETE_CHAPTER_2_ARTICLES_5_11_AUTHORITY_PATTERNS,
+    ANONYMOUS_PATTERNS, RIGHTS_LIMITATION_PATTERNS, PRINCIPLES,
+    COMPLETE_CHAPTER_3_ARTICLES_12_23_PROCESSING_PATTERNS, INFORMATION_PATTERNS, ACCESS_PATTERNS,
+    INTERNATIONAL_PATTERNS, COMPLETE_CHAPTER_5_ARTICLES_44_49_SAFEGUARD_PATTERNS,
+    COMPLETE_CHAPTER_6_ARTICLES_51_59_AUTHORITY_PATTERNS, COOPERATION_PATTERNS, CROSS_BORDER_PATTERNS,
+    CONSISTENCY_PATTERNS, EXPRESSION_PATTERNS, BALANCING_PATTERNS, COMMISSION_PATTERNS, EPRIVACY_PATTERNS,
+    DIRECTIVE_PATTERNS,
+    fields=('patterns', 'violations'),
+)
@@ -9,6 +9,145 @@ from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 import json
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
+
+# Detect usage of proprietary datasets
+PROPRIETARY_INDICATORS = [
+    r"\b(?:private\s+dataset|proprietary\s+data|commercial\s+dataset)\b",
+    r"\b(?:subscription\s+data|premium\s+data|paid\s+access)\b",
+    r"\b(?:internal\s+data|confidential\s+dataset|restricted\s+access)\b",
+    r"\b(?:customer\s+data|user\s+data|personal\s+information)\s+(?:training|dataset)\b"
+]
+
+# Check for fair use indicators
+FAIR_USE_INDICATORS = [
+    r"\b(?:research|educational|criticism|comment|news\s+reporting)\b",
+    r"\b(?:transformative|derivative|parody|commentary)\b",
+    r"\b(?:small\s+portion|limited\s+excerpt|brief\s+quote)\b"
+]
+
+COPYRIGHT_USAGE = [
+    r"\b(?:full\s+text|complete\s+work|entire\s+article)\b", 
+    r"\b(?:commercial\s+use|profit|revenue|monetize)\b",
+    r"\b(?:substantial\s+portion|majority|most\s+of)\b"
+]
+
+# Detect commercial content that may require licensing
+COMMERCIAL_PATTERNS = [
+    r"\b(?:getty\s+images|shutterstock|adobe\s+stock)\b",
+    r"\b(?:financial\s+times|wall\s+street\s+journal|bloomberg)\b",
+    r"\b(?:premium\s+content|subscription\s+only|paid\s+article)\b",
+    r"\b(?:licensing\s+required|commercial\s+license)\b"
+]
+
+
+# Copyright detection patterns
+COPYRIGHT_PATTERNS = {
+    "copyright_notices": {
+        "pattern": r"(?:©|\(c\)|copyright)\s*(?:\d{4}[-\d\s,]*|\d{4})\s*(?:by\s+)?([^.\n\r]+)",
+        "description": "Copyright notices and claims",
+        "severity": "high"
+    },
+    "all_rights_reserved": {
+        "pattern": r"\b(?:all\s+rights\s+reserved|proprietary|confidential)\b",
+        "description": "All rights reserved or proprietary content markers",
+        "severity": "high"
+    },
+    "trademark_content": {
+        "pattern": r"(?:™|®|\(tm\)|\(r\))\s*([^.\n\r\s]+)",
+        "description": "Trademarked content usage",
+        "severity": "medium"
+    },
+    "publisher_content": {
+        "pattern": r"\b(?:published\s+by|publisher|press|publications?)\s*:?\s*([^.\n\r]+)",
+        "description": "Published content from commercial publishers",
+        "severity": "high"
+    },
+    "book_references": {
+        "pattern": r"\b(?:isbn[-\s]?(?:10|13)?)\s*:?\s*([\d\-\s]+)",
+        "description": "Book content with ISBN identifiers",
+        "severity": "high"
+    },
+    "news_content": {
+        "pattern": r"\b(?:reuters|associated\s+press|ap\s+news|bloomberg|wall\s+street\s+journal|financial\s+times)\b",
+        "description": "Commercial news agency content",
+        "severity": "high"
+    }
+}
+
+# Open source license patterns and compliance requirements
+LICENSE_PATTERNS = {
+    "gpl_violations": {
+        "pattern": r"\b(?:gnu\s+general\s+public\s+license|gpl\s*[v\d]*)\b",
+        "description": "GPL licensed code requiring source disclosure",
+        "severity": "critical",
+        "compliance_requirement": "Source code disclosure and GPL license propagation required"
+    },
+    "mit_license": {
+        "pattern": r"\b(?:mit\s+license|permission\s+is\s+hereby\s+granted)\b",
+        "description": "MIT licensed code requiring attribution",
+        "severity": "medium", 
+        "compliance_requirement": "Attribution and license text inclusion required"
+    },
+    "apache_license": {
+        "pattern": r"\b(?:apache\s+license|apache\s+software\s+foundation)\b",
+        "description": "Apache licensed code requiring attribution",
+        "severity": "medium",
+        "compliance_requirement": "Attribution and license text inclusion required"
+    },
+    "creative_commons": {
+        "pattern": r"\b(?:creative\s+commons|cc\s+by|cc\s+sa|cc\s+nc)\b",
+        "description": "Creative Commons licensed content",
+        "severity": "medium",
+        "compliance_requirement": "Attribution and share-alike requirements"
+    },
+    "proprietary_licenses": {
+        "pattern": r"\b(?:proprietary\s+license|commercial\s+license|enterprise\s+license)\b",
+        "description": "Proprietary licensed content requiring permission",
+        "severity": "critical",
+        "compliance_requirement": "Explicit permission required for commercial use"
+    },
+    "no_license": {
+        "pattern": r"(?:no\s+license|all\s+rights\s+reserved|unlicensed)",
+        "description": "Unlicensed content with all rights reserved",
+        "severity": "critical",
+        "compliance_requirement": "Cannot be used without explicit permission"
+    }
+}
+
+# Attribution requirement patterns
+ATTRIBUTION_PATTERNS = {
+    "missing_attribution": {
+        "indicators": [
+            r"\b(?:source|author|credit|attribution)\s*:?\s*(?:unknown|missing|none|n/a)\b",
+            r"\b(?:copied\s+from|taken\s+from|extracted\s+from)\s+(?:internet|web|online)\b"
+        ],
+        "description": "Content without proper attribution",
+        "severity": "high"
+    },
+    "wikipedia_content": {
+        "pattern": r"\b(?:wikipedia|wikimedia)\b",
+        "description": "Wikipedia content requiring CC-BY-SA attribution",
+        "severity": "medium",
+        "attribution_requirement": "CC-BY-SA license and author attribution required"
+    },
+    "stackoverflow_content": {
+        "pattern": r"\b(?:stack\s*overflow|stackoverflow)\b", 
+        "description": "Stack Overflow content with CC license",
+        "severity": "medium",
+        "attribution_requirement": "CC-BY-SA license attribution required"
+    },
+    "github_content": {
+        "pattern": r"\b(?:github\.com|raw\.githubusercontent)\b",
+        "description": "GitHub hosted content requiring license compliance",
+        "severity": "medium",
+        "attribution_requirement": "Repository license compliance required"
+    }
+}
+
+
 class CopyrightComplianceDetector:
     """
     Detects copyright compliance issues in AI training data and model development.
@@ -17,117 +156,10 @@ class CopyrightComplianceDetector:
     
     def __init__(self, region: str = "Netherlands"):
         self.region = region
-        self.copyright_patterns = self._load_copyright_patterns()
-        self.license_patterns = self._load_license_patterns()
-        self.attribution_patterns = self._load_attribution_patterns()
+        self.copyright_patterns = COPYRIGHT_PATTERNS
+        self.license_patterns = LICENSE_PATTERNS
+        self.attribution_patterns = ATTRIBUTION_PATTERNS
         
-    def _load_copyright_patterns(self) -> Dict[str, Any]:
-        """Load copyright detection patterns"""
-        return {
-            "copyright_notices": {
-                "pattern": r"(?:©|\(c\)|copyright)\s*(?:\d{4}[-\d\s,]*|\d{4})\s*(?:by\s+)?([^.\n\r]+)",
-                "description": "Copyright notices and claims",
-                "severity": "high"
-            },
-            "all_rights_reserved": {
-                "pattern": r"\b(?:all\s+rights\s+reserved|proprietary|confidential)\b",
-                "description": "All rights reserved or proprietary content markers",
-                "severity": "high"
-            },
-            "trademark_content": {
-                "pattern": r"(?:™|®|\(tm\)|\(r\))\s*([^.\n\r\s]+)",
-                "description": "Trademarked content usage",
-                "severity": "medium"
-            },
-            "publisher_content": {
-                "pattern": r"\b(?:published\s+by|publisher|press|publications?)\s*:?\s*([^.\n\r]+)",
-                "description": "Published content from commercial publishers",
-                "severity": "high"
-            },
-            "book_references": {
-                "pattern": r"\b(?:isbn[-\s]?(?:10|13)?)\s*:?\s*([\d\-\s]+)",
-                "description": "Book content with ISBN identifiers",
-                "severity": "high"
-            },
-            "news_content": {
-                "pattern": r"\b(?:reuters|associated\s+press|ap\s+news|bloomberg|wall\s+street\s+journal|financial\s+times)\b",
-                "description": "Commercial news agency content",
-                "severity": "high"
-            }
-        }
-    
-    def _load_license_patterns(self) -> Dict[str, Any]:
-        """Load open source license patterns and compliance requirements"""
-        return {
-            "gpl_violations": {
-                "pattern": r"\b(?:gnu\s+general\s+public\s+license|gpl\s*[v\d]*)\b",
-                "description": "GPL licensed code requiring source disclosure",
-                "severity": "critical",
-                "compliance_requirement": "Source code disclosure and GPL license propagation required"
-            },
-            "mit_license": {
-                "pattern": r"\b(?:mit\s+license|permission\s+is\s+hereby\s+granted)\b",
-                "description": "MIT licensed code requiring attribution",
-                "severity": "medium", 
-                "compliance_requirement": "Attribution and license text inclusion required"
-            },
-            "apache_license": {
-                "pattern": r"\b(?:apache\s+license|apache\s+software\s+foundation)\b",
-                "description": "Apache licensed code requiring attribution",
-                "severity": "medium",
-                "compliance_requirement": "Attribution and license text inclusion required"
-            },
-            "creative_commons": {
-                "pattern": r"\b(?:creative\s+commons|cc\s+by|cc\s+sa|cc\s+nc)\b",
-                "description": "Creative Commons licensed content",
-                "severity": "medium",
-                "compliance_requirement": "Attribution and share-alike requirements"
-            },
-            "proprietary_licenses": {
-                "pattern": r"\b(?:proprietary\s+license|commercial\s+license|enterprise\s+license)\b",
-                "description": "Proprietary licensed content requiring permission",
-                "severity": "critical",
-                "compliance_requirement": "Explicit permission required for commercial use"
-            },
-            "no_license": {
-                "pattern": r"(?:no\s+license|all\s+rights\s+reserved|unlicensed)",
-                "description": "Unlicensed content with all rights reserved",
-                "severity": "critical",
-                "compliance_requirement": "Cannot be used without explicit permission"
-            }
-        }
-    
-    def _load_attribution_patterns(self) -> Dict[str, Any]:
-        """Load attribution requirement patterns"""
-        return {
-            "missing_attribution": {
-                "indicators": [
-                    r"\b(?:source|author|credit|attribution)\s*:?\s*(?:unknown|missing|none|n/a)\b",
-                    r"\b(?:copied\s+from|taken\s+from|extracted\s+from)\s+(?:internet|web|online)\b"
-                ],
-                "description": "Content without proper attribution",
-                "severity": "high"
-            },
-            "wikipedia_content": {
-                "pattern": r"\b(?:wikipedia|wikimedia)\b",
-                "description": "Wikipedia content requiring CC-BY-SA attribution",
-                "severity": "medium",
-                "attribution_requirement": "CC-BY-SA license and author attribution required"
-            },
-            "stackoverflow_content": {
-                "pattern": r"\b(?:stack\s*overflow|stackoverflow)\b", 
-                "description": "Stack Overflow content with CC license",
-                "severity": "medium",
-                "attribution_requirement": "CC-BY-SA license attribution required"
-            },
-            "github_content": {
-                "pattern": r"\b(?:github\.com|raw\.githubusercontent)\b",
-                "description": "GitHub hosted content requiring license compliance",
-                "severity": "medium",
-                "attribution_requirement": "Repository license compliance required"
-            }
-        }
-    
     def detect_copyright_violations(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Detect copyright compliance violations in content.
@@ -167,7 +199,7 @@ class CopyrightComplianceDetector:
         findings = []
         
         for pattern_name, config in self.copyright_patterns.items():
-            matches = re.finditer(config["pattern"], content, re.IGNORECASE | re.MULTILINE)
+            matches = _RULES.finditer(config["pattern"], content, re.IGNORECASE | re.MULTILINE)
             for match in matches:
                 findings.append({
                     'type': 'COPYRIGHT_VIOLATION',
@@ -189,7 +221,7 @@ class CopyrightComplianceDetector:
         findings = []
         
         for license_type, config in self.license_patterns.items():
-            matches = re.finditer(config["pattern"], content, re.IGNORECASE)
+            matches = _RULES.finditer(config["pattern"], content)
             for match in matches:
                 findings.append({
                     'type': 'LICENSE_VIOLATION',
@@ -215,7 +247,7 @@ class CopyrightComplianceDetector:
             if "indicators" in config:
                 # Check multiple indicators
                 for indicator in config["indicators"]:
-                    matches = re.finditer(indicator, content, re.IGNORECASE)
+                    matches = _RULES.finditer(indicator, content)
                     for match in matches:
                         findings.append({
                             'type': 'ATTRIBUTION_VIOLATION',
@@ -230,7 +262,7 @@ class CopyrightComplianceDetector:
                         })
             else:
                 # Single pattern check
-                matches = re.finditer(config["pattern"], content, re.IGNORECASE)
+                matches = _RULES.finditer(config["pattern"], content)
                 for match in matches:
                     findings.append({
                         'type': 'ATTRIBUTION_VIOLATION', 
@@ -251,15 +283,8 @@ class CopyrightComplianceDetector:
         """Detect usage of proprietary datasets"""
         findings = []
         
-        proprietary_indicators = [
-            r"\b(?:private\s+dataset|proprietary\s+data|commercial\s+dataset)\b",
-            r"\b(?:subscription\s+data|premium\s+data|paid\s+access)\b",
-            r"\b(?:internal\s+data|confidential\s+dataset|restricted\s+access)\b",
-            r"\b(?:customer\s+data|user\s+data|personal\s+information)\s+(?:training|dataset)\b"
-        ]
-        
-        for pattern in proprietary_indicators:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in PROPRIETARY_INDICATORS:
+            matches = _RULES.finditer(pattern, content)
             for match in matches:
                 findings.append({
                     'type': 'PROPRIETARY_DATASET_VIOLATION',
@@ -280,28 +305,15 @@ class CopyrightComplianceDetector:
         """Analyze fair use compliance for copyrighted content"""
         findings = []
         
-        # Check for fair use indicators
-        fair_use_indicators = [
-            r"\b(?:research|educational|criticism|comment|news\s+reporting)\b",
-            r"\b(?:transformative|derivative|parody|commentary)\b",
-            r"\b(?:small\s+portion|limited\s+excerpt|brief\s+quote)\b"
-        ]
-        
-        copyright_usage = [
-            r"\b(?:full\s+text|complete\s+work|entire\s+article)\b", 
-            r"\b(?:commercial\s+use|profit|revenue|monetize)\b",
-            r"\b(?:substantial\s+portion|majority|most\s+of)\b"
-        ]
-        
         fair_use_score = 0
         commercial_use_score = 0
         
-        for pattern in fair_use_indicators:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern in FAIR_USE_INDICATORS:
+            if _RULES.search(pattern, content):
                 fair_use_score += 1
                 
-        for pattern in copyright_usage:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern in COPYRIGHT_USAGE:
+            if _RULES.search(pattern, content):
                 commercial_use_score += 1
         
         if commercial_use_score > fair_use_score:
@@ -323,15 +335,8 @@ class CopyrightComplianceDetector:
         """Detect commercial content that may require licensing"""
         findings = []
         
-        commercial_patterns = [
-            r"\b(?:getty\s+images|shutterstock|adobe\s+stock)\b",
-            r"\b(?:financial\s+times|wall\s+street\s+journal|bloomberg)\b",
-            r"\b(?:premium\s+content|subscription\s+only|paid\s+article)\b",
-            r"\b(?:licensing\s+required|commercial\s+license)\b"
-        ]
-        
-        for pattern in commercial_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in COMMERCIAL_PATTERNS:
+            matches = _RULES.finditer(pattern, content)
             for match in matches:
                 findings.append({
                     'type': 'COMMERCIAL_CONTENT_VIOLATION',
@@ -421,4 +426,12 @@ class CopyrightComplianceDetector:
         recommendations.append("🤖 Ensure GPAI model compliance with EU AI Act Article 53 requirements")
         recommendations.append("📊 Implement ongoing copyright monitoring for training data updates")
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    PROPRIETARY_INDICATORS, FAIR_USE_INDICATORS, COPYRIGHT_USAGE, COMMERCIAL_PATTERNS, COPYRIGHT_PATTERNS,
+    LICENSE_PATTERNS, ATTRIBUTION_PATTERNS,
+    fields=('pattern', 'indicators'),
+)
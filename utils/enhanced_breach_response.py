@@ -11,6 +11,9 @@ from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 class BreachSeverity(Enum):
     """Breach severity levels for prioritization"""
     CRITICAL = "critical"      # Immediate notification required
@@ -79,6 +82,67 @@ class WhistleblowerReport:
     incentive_percentage: float  # 15-30% of collected fines
     estimated_incentive: float
 
+
+# Automated breach detection rules
+DETECTION_RULES = {
+    "critical_indicators": [
+        r"\b(?:unauthorized\s+access|data\s+breach|security\s+incident)\b",
+        r"\b(?:ransomware|malware|system\s+compromise)\b",
+        r"\b(?:data\s+exfiltration|information\s+theft)\b",
+        r"\b(?:database\s+dump|sql\s+injection|privilege\s+escalation)\b"
+    ],
+    "data_type_patterns": {
+        "personal_data": r"\b(?:personal\s+data|pii|personally\s+identifiable)\b",
+        "special_categories": r"\b(?:health\s+data|biometric|genetic|racial|ethnic|political|religious|sexual)\b",
+        "financial_data": r"\b(?:credit\s+card|bank\s+account|financial\s+data|payment)\b",
+        "children_data": r"\b(?:children|minors|under\s+16|kids|juvenile)\b",
+        "criminal_data": r"\b(?:criminal\s+records|conviction|offense)\b"
+    },
+    "severity_indicators": {
+        "critical": [
+            r"\b(?:millions?|thousands?)\s+(?:records?|individuals?)\b",
+            r"\b(?:special\s+categories|sensitive\s+data)\b",
+            r"\b(?:system\s+wide|complete\s+database)\b"
+        ],
+        "high": [
+            r"\b(?:hundreds?|thousands?)\s+(?:records?|users?)\b",
+            r"\b(?:financial|payment|medical)\s+data\b",
+            r"\b(?:ongoing|active)\s+breach\b"
+        ],
+        "medium": [
+            r"\b(?:dozens?|limited\s+number)\s+(?:records?|accounts?)\b",
+            r"\b(?:contact|email)\s+(?:information|addresses?)\b"
+        ]
+    },
+    "notification_triggers": {
+        "immediate": [
+            r"\b(?:ongoing|active|current)\s+breach\b",
+            r"\b(?:high\s+risk|significant\s+harm|severe\s+impact)\b",
+            r"\b(?:special\s+categories|children|healthcare)\b"
+        ],
+        "72_hour": [
+            r"\b(?:personal\s+data|identifiable\s+information)\b",
+            r"\b(?:unauthorized\s+access|accidental\s+disclosure)\b"
+        ]
+    }
+}
+
+# Breach categories, checked in order
+BREACH_CATEGORY_PATTERNS = {
+    BreachCategory.UNAUTHORIZED_ACCESS: [r"\b(?:unauthorized\s+access|illegal\s+entry|intrusion)\b"],
+    BreachCategory.DATA_EXFILTRATION: [r"\b(?:data\s+exfiltration|information\s+theft|stolen\s+data)\b"],
+    BreachCategory.SYSTEM_COMPROMISE: [r"\b(?:system\s+compromise|server\s+breach|network\s+intrusion)\b"],
+    BreachCategory.ACCIDENTAL_DISCLOSURE: [r"\b(?:accidental|inadvertent|unintentional|human\s+error)\b"],
+    BreachCategory.RANSOMWARE: [r"\b(?:ransomware|crypto\s+locker|encryption\s+attack)\b"],
+    BreachCategory.AI_MODEL_COMPROMISE: [r"\b(?:model\s+poisoning|ai\s+attack|algorithm\s+compromise)\b"]
+}
+
+# Scale of a breach when no record count is given
+ALL_RECORDS_PATTERN = r'\b(?:all|entire|complete|full)\s+(?:database|system|records)\b'
+THOUSANDS_PATTERN = r'\b(?:thousands?|many|multiple)\b'
+HUNDREDS_PATTERN = r'\b(?:hundreds?|several)\b'
+
+
 class EnhancedBreachResponseSystem:
     """
     Enhanced breach response system with automated notifications
@@ -87,58 +151,13 @@ class EnhancedBreachResponseSystem:
     
     def __init__(self, region: str = "Netherlands"):
         self.region = region
-        self.detection_rules = self._load_detection_rules()
+        self.detection_rules = DETECTION_RULES
         self.notification_templates = self._load_notification_templates()
         self.authority_contacts = self._load_authority_contacts()
         self.incident_database = []
         self.whistleblower_reports = []
         self.auto_response_enabled = True
         
-    def _load_detection_rules(self) -> Dict[str, Any]:
-        """Load automated breach detection rules"""
-        return {
-            "critical_indicators": [
-                r"\b(?:unauthorized\s+access|data\s+breach|security\s+incident)\b",
-                r"\b(?:ransomware|malware|system\s+compromise)\b",
-                r"\b(?:data\s+exfiltration|information\s+theft)\b",
-                r"\b(?:database\s+dump|sql\s+injection|privilege\s+escalation)\b"
-            ],
-            "data_type_patterns": {
-                "personal_data": r"\b(?:personal\s+data|pii|personally\s+identifiable)\b",
-                "special_categories": r"\b(?:health\s+data|biometric|genetic|racial|ethnic|political|religious|sexual)\b",
-                "financial_data": r"\b(?:credit\s+card|bank\s+account|financial\s+data|payment)\b",
-                "children_data": r"\b(?:children|minors|under\s+16|kids|juvenile)\b",
-                "criminal_data": r"\b(?:criminal\s+records|conviction|offense)\b"
-            },
-            "severity_indicators": {
-                "critical": [
-                    r"\b(?:millions?|thousands?)\s+(?:records?|individuals?)\b",
-                    r"\b(?:special\s+categories|sensitive\s+data)\b",
-                    r"\b(?:system\s+wide|complete\s+database)\b"
-                ],
-                "high": [
-                    r"\b(?:hundreds?|thousands?)\s+(?:records?|users?)\b",
-                    r"\b(?:financial|payment|medical)\s+data\b",
-                    r"\b(?:ongoing|active)\s+breach\b"
-                ],
-                "medium": [
-                    r"\b(?:dozens?|limited\s+number)\s+(?:records?|accounts?)\b",
-                    r"\b(?:contact|email)\s+(?:information|addresses?)\b"
-                ]
-            },
-            "notification_triggers": {
-                "immediate": [
-                    r"\b(?:ongoing|active|current)\s+breach\b",
-                    r"\b(?:high\s+risk|significant\s+harm|severe\s+impact)\b",
-                    r"\b(?:special\s+categories|children|healthcare)\b"
-                ],
-                "72_hour": [
-                    r"\b(?:personal\s+data|identifiable\s+information)\b",
-                    r"\b(?:unauthorized\s+access|accidental\s+disclosure)\b"
-                ]
-            }
-        }
-    
     def _load_notification_templates(self) -> Dict[NotificationAuthority, NotificationTemplate]:
         """Load notification templates for different authorities"""
         return {
@@ -264,7 +283,7 @@ class EnhancedBreachResponseSystem:
         # Check for critical breach indicators
         breach_detected = False
         for pattern in self.detection_rules["critical_indicators"]:
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content, re.IGNORECASE):
                 breach_detected = True
                 break
         
@@ -320,7 +339,7 @@ class EnhancedBreachResponseSystem:
         
         for severity, patterns in self.detection_rules["severity_indicators"].items():
             for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
+                if _RULES.search(pattern, content, re.IGNORECASE):
                     if severity == "critical":
                         severity_scores[BreachSeverity.CRITICAL] += 3
                     elif severity == "high":
@@ -339,17 +358,8 @@ class EnhancedBreachResponseSystem:
     
     def _classify_breach_category(self, content: str) -> BreachCategory:
         """Classify the type of breach"""
-        category_patterns = {
-            BreachCategory.UNAUTHORIZED_ACCESS: [r"\b(?:unauthorized\s+access|illegal\s+entry|intrusion)\b"],
-            BreachCategory.DATA_EXFILTRATION: [r"\b(?:data\s+exfiltration|information\s+theft|stolen\s+data)\b"],
-            BreachCategory.SYSTEM_COMPROMISE: [r"\b(?:system\s+compromise|server\s+breach|network\s+intrusion)\b"],
-            BreachCategory.ACCIDENTAL_DISCLOSURE: [r"\b(?:accidental|inadvertent|unintentional|human\s+error)\b"],
-            BreachCategory.RANSOMWARE: [r"\b(?:ransomware|crypto\s+locker|encryption\s+attack)\b"],
-            BreachCategory.AI_MODEL_COMPROMISE: [r"\b(?:model\s+poisoning|ai\s+attack|algorithm\s+compromise)\b"]
-        }
-        
-        for category, patterns in category_patterns.items():
-            if any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns):
+        for category, patterns in BREACH_CATEGORY_PATTERNS.items():
+            if any(_RULES.search(pattern, content, re.IGNORECASE) for pattern in patterns):
                 return category
         
         return BreachCategory.UNAUTHORIZED_ACCESS  # Default
@@ -359,7 +369,7 @@ class EnhancedBreachResponseSystem:
         affected_types = []
         
         for data_type, pattern in self.detection_rules["data_type_patterns"].items():
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content, re.IGNORECASE):
                 affected_types.append(data_type)
         
         return affected_types if affected_types else ["personal_data"]
@@ -371,16 +381,16 @@ class EnhancedBreachResponseSystem:
         
         numbers = re.findall(r'\b(\d+(?:,\d{3})*)\b', content)
         if numbers:
-            # Take the largest number found
-            max_num = max(int(num.replace(',', '')) for num in numbers)
+            # Take the largest number found (one int() pass over all of them)
+            max_num = max(map(int, ' '.join(numbers).replace(',', '').split()))
             return min(max_num, 10000000)  # Cap at 10M for sanity
         
         # Estimate based on keywords
-        if re.search(r'\b(?:all|entire|complete|full)\s+(?:database|system|records)\b', content, re.IGNORECASE):
+        if _RULES.search(ALL_RECORDS_PATTERN, content, re.IGNORECASE):
             return 1000000  # Assume large database
-        elif re.search(r'\b(?:thousands?|many|multiple)\b', content, re.IGNORECASE):
+        elif _RULES.search(THOUSANDS_PATTERN, content, re.IGNORECASE):
             return 5000
-        elif re.search(r'\b(?:hundreds?|several)\b', content, re.IGNORECASE):
+        elif _RULES.search(HUNDREDS_PATTERN, content, re.IGNORECASE):
             return 500
         else:
             return 100  # Conservative default
@@ -668,4 +678,9 @@ class EnhancedBreachResponseSystem:
                 "Update incident response procedures"
             ],
             "timestamp": datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(DETECTION_RULES, BREACH_CATEGORY_PATTERNS, ALL_RECORDS_PATTERN, THOUSANDS_PATTERN,
+                      HUNDREDS_PATTERN)
@@ -15,6 +15,9 @@ import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 # EU AI Act Risk Categories
 AI_RISK_CATEGORIES = {
     "prohibited": [
@@ -169,64 +172,66 @@ def detect_ai_act_violations(content: str, document_metadata: Optional[Dict[str,
     
     return findings
 
+
+# COMPLETE Article 5 Prohibited Practices (All 8 Categories Enhanced)
+PROHIBITED_PATTERNS = {
+    "subliminal_techniques": {
+        "pattern": r"\b(?:subliminal|subconscious|unconscious|implicit|covert|hidden)\s+(?:influence|manipulation|techniques|suggestion|conditioning|persuasion|messaging)\b",
+        "description": "AI systems using subliminal techniques or exploiting vulnerabilities to materially distort behavior",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["subliminal advertising", "unconscious influence", "covert manipulation"]
+    },
+    "social_scoring": {
+        "pattern": r"\b(?:social\s+scor|citizen\s+scor|behavioral\s+scor|reputation\s+system|social\s+credit|civic\s+rating|trustworthiness\s+scor|social\s+rank)\b",
+        "description": "AI systems for social scoring by public authorities or on their behalf",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["social credit system", "citizen scoring", "behavioral rating"]
+    },
+    "realtime_biometric_identification": {
+        "pattern": r"\b(?:real.?time\s+biometric|live\s+facial\s+recognition|instant\s+biometric|immediate\s+identification|continuous\s+biometric\s+monitoring)\b",
+        "description": "Real-time remote biometric identification systems in publicly accessible spaces",
+        "penalty": "Up to €35M or 7% global turnover", 
+        "examples": ["live facial recognition", "real-time biometric surveillance", "instant identification"]
+    },
+    "emotion_manipulation": {
+        "pattern": r"\b(?:emotion(?:al)?\s+(?:manipulation|exploit|influence)|psychological\s+manipulation|emotional\s+profiling|sentiment\s+manipulation|mood\s+manipulation)\b",
+        "description": "AI systems that deploy subliminal techniques or exploit vulnerabilities related to age, disability",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["emotional manipulation", "psychological exploitation", "sentiment targeting"]
+    },
+    "workplace_emotion_recognition": {
+        "pattern": r"\b(?:workplace\s+emotion|employee\s+emotion|staff\s+emotion|worker\s+sentiment|office\s+mood|employment\s+emotion)\s+(?:recognition|detection|monitoring|analysis|assessment)\b",
+        "description": "AI systems for emotion recognition in workplace and educational institutions (with exceptions)",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["employee emotion monitoring", "workplace sentiment analysis", "staff mood tracking"]
+    },
+    "biometric_categorisation": {
+        "pattern": r"\b(?:biometric\s+categoris|race\s+classification|ethnic\s+profiling|gender\s+classification|sexual\s+orientation\s+detection|political\s+opinion\s+inference)(?:ation|ing|ment)\b",
+        "description": "Biometric categorisation systems inferring race, political opinions, trade union membership, religious beliefs, sex life",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["race classification", "political opinion inference", "sexual orientation detection"]
+    },
+    "indiscriminate_data_scraping": {
+        "pattern": r"\b(?:indiscriminate\s+scraping|untargeted\s+scraping|facial\s+image\s+scraping|biometric\s+data\s+harvesting|mass\s+data\s+collection)\b",
+        "description": "Untargeted scraping of facial images from internet or CCTV footage to create facial recognition databases",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["facial image scraping", "biometric data harvesting", "mass facial collection"]
+    },
+    "risk_assessment_discriminatory": {
+        "pattern": r"\b(?:risk\s+assessment.*criminal|criminal\s+risk\s+assessment|recidivism\s+prediction|criminal\s+propensity|offense\s+prediction).*(?:natural\s+person|individual|person)\b",
+        "description": "AI systems to assess risk of criminal offenses by natural persons based solely on profiling or personality traits",
+        "penalty": "Up to €35M or 7% global turnover",
+        "examples": ["criminal risk assessment", "recidivism prediction", "offense propensity scoring"]
+    }
+}
+
+
 def _detect_prohibited_practices(content: str) -> List[Dict[str, Any]]:
     """Enhanced detection of prohibited AI practices under EU AI Act Article 5 - COMPLETE COVERAGE."""
     findings = []
     
-    # COMPLETE Article 5 Prohibited Practices (All 8 Categories Enhanced)
-    prohibited_patterns = {
-        "subliminal_techniques": {
-            "pattern": r"\b(?:subliminal|subconscious|unconscious|implicit|covert|hidden)\s+(?:influence|manipulation|techniques|suggestion|conditioning|persuasion|messaging)\b",
-            "description": "AI systems using subliminal techniques or exploiting vulnerabilities to materially distort behavior",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["subliminal advertising", "unconscious influence", "covert manipulation"]
-        },
-        "social_scoring": {
-            "pattern": r"\b(?:social\s+scor|citizen\s+scor|behavioral\s+scor|reputation\s+system|social\s+credit|civic\s+rating|trustworthiness\s+scor|social\s+rank)\b",
-            "description": "AI systems for social scoring by public authorities or on their behalf",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["social credit system", "citizen scoring", "behavioral rating"]
-        },
-        "realtime_biometric_identification": {
-            "pattern": r"\b(?:real.?time\s+biometric|live\s+facial\s+recognition|instant\s+biometric|immediate\s+identification|continuous\s+biometric\s+monitoring)\b",
-            "description": "Real-time remote biometric identification systems in publicly accessible spaces",
-            "penalty": "Up to €35M or 7% global turnover", 
-            "examples": ["live facial recognition", "real-time biometric surveillance", "instant identification"]
-        },
-        "emotion_manipulation": {
-            "pattern": r"\b(?:emotion(?:al)?\s+(?:manipulation|exploit|influence)|psychological\s+manipulation|emotional\s+profiling|sentiment\s+manipulation|mood\s+manipulation)\b",
-            "description": "AI systems that deploy subliminal techniques or exploit vulnerabilities related to age, disability",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["emotional manipulation", "psychological exploitation", "sentiment targeting"]
-        },
-        "workplace_emotion_recognition": {
-            "pattern": r"\b(?:workplace\s+emotion|employee\s+emotion|staff\s+emotion|worker\s+sentiment|office\s+mood|employment\s+emotion)\s+(?:recognition|detection|monitoring|analysis|assessment)\b",
-            "description": "AI systems for emotion recognition in workplace and educational institutions (with exceptions)",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["employee emotion monitoring", "workplace sentiment analysis", "staff mood tracking"]
-        },
-        "biometric_categorisation": {
-            "pattern": r"\b(?:biometric\s+categoris|race\s+classification|ethnic\s+profiling|gender\s+classification|sexual\s+orientation\s+detection|political\s+opinion\s+inference)(?:ation|ing|ment)\b",
-            "description": "Biometric categorisation systems inferring race, political opinions, trade union membership, religious beliefs, sex life",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["race classification", "political opinion inference", "sexual orientation detection"]
-        },
-        "indiscriminate_data_scraping": {
-            "pattern": r"\b(?:indiscriminate\s+scraping|untargeted\s+scraping|facial\s+image\s+scraping|biometric\s+data\s+harvesting|mass\s+data\s+collection)\b",
-            "description": "Untargeted scraping of facial images from internet or CCTV footage to create facial recognition databases",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["facial image scraping", "biometric data harvesting", "mass facial collection"]
-        },
-        "risk_assessment_discriminatory": {
-            "pattern": r"\b(?:risk\s+assessment.*criminal|criminal\s+risk\s+assessment|recidivism\s+prediction|criminal\s+propensity|offense\s+prediction).*(?:natural\s+person|individual|person)\b",
-            "description": "AI systems to assess risk of criminal offenses by natural persons based solely on profiling or personality traits",
-            "penalty": "Up to €35M or 7% global turnover",
-            "examples": ["criminal risk assessment", "recidivism prediction", "offense propensity scoring"]
-        }
-    }
-    
-    for violation_type, config in prohibited_patterns.items():
-        matches = re.finditer(config["pattern"], content, re.IGNORECASE)
+    for violation_type, config in PROHIBITED_PATTERNS.items():
+        matches = _RULES.finditer(config["pattern"], content)
         for match in matches:
             findings.append({
                 'type': 'AI_ACT_PROHIBITED',
@@ -244,37 +249,39 @@ def _detect_prohibited_practices(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Article 19: Quality Management System Requirements
+CONFORMITY_ASSESSMENT_VIOLATIONS_QUALITY_MANAGEMENT_INDICATORS = {
+    "quality_policy": r"\b(?:quality\s+policy|quality\s+management\s+system|qms|iso\s+9001|quality\s+assurance)\b",
+    "risk_management": r"\b(?:risk\s+management\s+system|risk\s+assessment\s+process|risk\s+mitigation)\b",
+    "data_governance": r"\b(?:data\s+governance|data\s+quality\s+management|training\s+data\s+management)\b",
+    "record_keeping": r"\b(?:record\s+keeping|documentation\s+management|compliance\s+records)\b",
+    "performance_monitoring": r"\b(?:performance\s+monitoring|system\s+performance\s+tracking|accuracy\s+monitoring)\b",
+    "change_management": r"\b(?:change\s+management|version\s+control|system\s+updates)\b"
+}
+
+# Check for high-risk AI systems that need conformity assessment
+CONFORMITY_ASSESSMENT_VIOLATIONS_HIGH_RISK_PATTERNS = [
+    r"\b(?:biometric\s+identification|facial\s+recognition|voice\s+recognition)\b",
+    r"\b(?:critical\s+infrastructure|essential\s+service|public\s+safety)\s+ai\b",
+    r"\b(?:employment|recruitment|hiring)\s+(?:ai|algorithm|system)\b",
+    r"\b(?:educational|academic|student)\s+(?:ai|assessment|evaluation)\b",
+    r"\b(?:law\s+enforcement|criminal\s+justice|police)\s+ai\b"
+]
+
+
 # NEW: Articles 19-24 - Conformity Assessment Procedures (COMPLETE IMPLEMENTATION)
 def _detect_conformity_assessment_violations(content: str) -> List[Dict[str, Any]]:
     """Complete implementation of Articles 19-24 - Conformity Assessment procedures for high-risk AI systems."""
     findings = []
     
-    # Article 19: Quality Management System Requirements
-    quality_management_indicators = {
-        "quality_policy": r"\b(?:quality\s+policy|quality\s+management\s+system|qms|iso\s+9001|quality\s+assurance)\b",
-        "risk_management": r"\b(?:risk\s+management\s+system|risk\s+assessment\s+process|risk\s+mitigation)\b",
-        "data_governance": r"\b(?:data\s+governance|data\s+quality\s+management|training\s+data\s+management)\b",
-        "record_keeping": r"\b(?:record\s+keeping|documentation\s+management|compliance\s+records)\b",
-        "performance_monitoring": r"\b(?:performance\s+monitoring|system\s+performance\s+tracking|accuracy\s+monitoring)\b",
-        "change_management": r"\b(?:change\s+management|version\s+control|system\s+updates)\b"
-    }
-    
-    # Check for high-risk AI systems that need conformity assessment
-    high_risk_patterns = [
-        r"\b(?:biometric\s+identification|facial\s+recognition|voice\s+recognition)\b",
-        r"\b(?:critical\s+infrastructure|essential\s+service|public\s+safety)\s+ai\b",
-        r"\b(?:employment|recruitment|hiring)\s+(?:ai|algorithm|system)\b",
-        r"\b(?:educational|academic|student)\s+(?:ai|assessment|evaluation)\b",
-        r"\b(?:law\s+enforcement|criminal\s+justice|police)\s+ai\b"
-    ]
-    
-    has_high_risk_ai = any(re.search(pattern, content, re.IGNORECASE) for pattern in high_risk_patterns)
+    has_high_risk_ai = any(_RULES.search(pattern, content) for pattern in CONFORMITY_ASSESSMENT_VIOLATIONS_HIGH_RISK_PATTERNS)
     
     if has_high_risk_ai:
         # Check quality management system
         missing_qms = []
-        for indicator, pattern in quality_management_indicators.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for indicator, pattern in CONFORMITY_ASSESSMENT_VIOLATIONS_QUALITY_MANAGEMENT_INDICATORS.items():
+            if not _RULES.search(pattern, content):
                 missing_qms.append(indicator)
         
         if len(missing_qms) >= 2:  # Lower threshold for better detection
@@ -363,17 +370,20 @@ def _detect_conformity_assessment_violations(content: str) -> List[Dict[str, Any
     
     return findings
 
+
+# Complete implementation of Articles 51-55 - General-Purpose AI Model obligations
+GPAI_DETECTION_PATTERNS = [
+    r"\b(?:general\s+purpose\s+ai|foundation\s+model|large\s+language\s+model|multimodal\s+model)\b",
+    r"\b(?:gpt|bert|t5|transformer|llm|vlm)\b",
+    r"\b(?:10\^25.*flops|computational\s+threshold|training\s+compute)\b"
+]
+
+
 def _detect_enhanced_gpai_compliance(content: str) -> List[Dict[str, Any]]:
     """Complete implementation of Articles 51-55 - General-Purpose AI Model obligations."""
     findings = []
     
-    gpai_detection_patterns = [
-        r"\b(?:general\s+purpose\s+ai|foundation\s+model|large\s+language\s+model|multimodal\s+model)\b",
-        r"\b(?:gpt|bert|t5|transformer|llm|vlm)\b",
-        r"\b(?:10\^25.*flops|computational\s+threshold|training\s+compute)\b"
-    ]
-    
-    has_gpai_model = any(re.search(pattern, content, re.IGNORECASE) for pattern in gpai_detection_patterns)
+    has_gpai_model = any(_RULES.search(pattern, content) for pattern in GPAI_DETECTION_PATTERNS)
     
     if has_gpai_model:
         findings.append({
@@ -390,25 +400,28 @@ def _detect_enhanced_gpai_compliance(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Complete implementation of Articles 61-68 - Post-market monitoring system requirements
+ENHANCED_POST_MARKET_MONITORING_HIGH_RISK_PATTERNS = [
+    r"\b(?:high\s+risk\s+ai|biometric\s+identification|critical\s+infrastructure)\b",
+    r"\b(?:employment\s+ai|educational\s+ai|law\s+enforcement\s+ai)\b"
+]
+
+MONITORING_INDICATORS = [
+    r"\b(?:monitoring\s+plan|post\s+market\s+monitoring|continuous\s+monitoring)\b",
+    r"\b(?:incident\s+report|serious\s+incident|safety\s+incident)\b",
+    r"\b(?:corrective\s+measures|remedial\s+action)\b"
+]
+
+
 def _detect_enhanced_post_market_monitoring(content: str) -> List[Dict[str, Any]]:
     """Complete implementation of Articles 61-68 - Post-market monitoring system requirements."""
     findings = []
     
-    high_risk_patterns = [
-        r"\b(?:high\s+risk\s+ai|biometric\s+identification|critical\s+infrastructure)\b",
-        r"\b(?:employment\s+ai|educational\s+ai|law\s+enforcement\s+ai)\b"
-    ]
-    
-    has_high_risk_ai = any(re.search(pattern, content, re.IGNORECASE) for pattern in high_risk_patterns)
+    has_high_risk_ai = any(_RULES.search(pattern, content) for pattern in ENHANCED_POST_MARKET_MONITORING_HIGH_RISK_PATTERNS)
     
     if has_high_risk_ai:
-        monitoring_indicators = [
-            r"\b(?:monitoring\s+plan|post\s+market\s+monitoring|continuous\s+monitoring)\b",
-            r"\b(?:incident\s+report|serious\s+incident|safety\s+incident)\b",
-            r"\b(?:corrective\s+measures|remedial\s+action)\b"
-        ]
-        
-        missing_monitoring = sum(1 for pattern in monitoring_indicators if not re.search(pattern, content, re.IGNORECASE))
+        missing_monitoring = sum(1 for pattern in MONITORING_INDICATORS if not _RULES.search(pattern, content))
         
         if missing_monitoring >= 2:
             findings.append({
@@ -425,25 +438,28 @@ def _detect_enhanced_post_market_monitoring(content: str) -> List[Dict[str, Any]
     
     return findings
 
+
+# Detect high-risk AI systems under EU AI Act Annex III
+HIGH_RISK_SYSTEMS_HIGH_RISK_PATTERNS = {
+    "biometric_identification": r"\b(?:facial\s+recognition|biometric\s+identification|fingerprint\s+matching|iris\s+scanning|voice\s+recognition)\b",
+    "critical_infrastructure": r"\b(?:critical\s+infrastructure|power\s+grid|water\s+supply|transport\s+control|energy\s+management)\s+(?:ai|system|control)\b",
+    "employment_ai": r"\b(?:recruitment\s+ai|hiring\s+algorithm|cv\s+screening|employee\s+monitoring|performance\s+evaluation|workforce\s+management)\b",
+    "education_ai": r"\b(?:educational\s+ai|student\s+assessment|learning\s+analytics|academic\s+scoring|admission\s+algorithm)\b",
+    "essential_services": r"\b(?:healthcare\s+access|social\s+benefit|public\s+service|essential\s+service)\s+(?:ai|algorithm|system)\b",
+    "law_enforcement": r"\b(?:law\s+enforcement|police\s+ai|criminal\s+justice|predictive\s+policing|crime\s+prediction)\b",
+    "migration_border_control": r"\b(?:border\s+control|immigration\s+ai|asylum\s+decision|visa\s+processing|migration\s+management)\b",
+    "justice_democratic": r"\b(?:judicial\s+ai|court\s+decision|legal\s+algorithm|democratic\s+process|voting\s+system)\s+(?:ai|algorithm)\b",
+    "credit_scoring": r"\b(?:credit\s+scoring|loan\s+assessment|financial\s+risk\s+model|creditworthiness\s+ai)\b",
+    "healthcare_ai": r"\b(?:medical\s+diagnosis|healthcare\s+ai|clinical\s+decision|patient\s+risk|medical\s+device\s+ai)\b"
+}
+
+
 def _detect_high_risk_systems(content: str) -> List[Dict[str, Any]]:
     """Detect high-risk AI systems under EU AI Act Annex III."""
     findings = []
     
-    high_risk_patterns = {
-        "biometric_identification": r"\b(?:facial\s+recognition|biometric\s+identification|fingerprint\s+matching|iris\s+scanning|voice\s+recognition)\b",
-        "critical_infrastructure": r"\b(?:critical\s+infrastructure|power\s+grid|water\s+supply|transport\s+control|energy\s+management)\s+(?:ai|system|control)\b",
-        "employment_ai": r"\b(?:recruitment\s+ai|hiring\s+algorithm|cv\s+screening|employee\s+monitoring|performance\s+evaluation|workforce\s+management)\b",
-        "education_ai": r"\b(?:educational\s+ai|student\s+assessment|learning\s+analytics|academic\s+scoring|admission\s+algorithm)\b",
-        "essential_services": r"\b(?:healthcare\s+access|social\s+benefit|public\s+service|essential\s+service)\s+(?:ai|algorithm|system)\b",
-        "law_enforcement": r"\b(?:law\s+enforcement|police\s+ai|criminal\s+justice|predictive\s+policing|crime\s+prediction)\b",
-        "migration_border_control": r"\b(?:border\s+control|immigration\s+ai|asylum\s+decision|visa\s+processing|migration\s+management)\b",
-        "justice_democratic": r"\b(?:judicial\s+ai|court\s+decision|legal\s+algorithm|democratic\s+process|voting\s+system)\s+(?:ai|algorithm)\b",
-        "credit_scoring": r"\b(?:credit\s+scoring|loan\s+assessment|financial\s+risk\s+model|creditworthiness\s+ai)\b",
-        "healthcare_ai": r"\b(?:medical\s+diagnosis|healthcare\s+ai|clinical\s+decision|patient\s+risk|medical\s+device\s+ai)\b"
-    }
-    
-    for system_type, pattern in high_risk_patterns.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    for system_type, pattern in HIGH_RISK_SYSTEMS_HIGH_RISK_PATTERNS.items():
+        matches = _RULES.finditer(pattern, content)
         for match in matches:
             findings.append({
                 'type': 'AI_ACT_HIGH_RISK',
@@ -464,24 +480,26 @@ def _detect_high_risk_systems(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Check for AI systems interacting with humans without disclosure
+INTERACTION_PATTERNS = [
+    r"\b(?:chatbot|virtual\s+assistant|ai\s+agent)\b",
+    r"\b(?:automated\s+(?:response|system|decision))\b",
+    r"\b(?:machine\s+learning|artificial\s+intelligence)\b"
+]
+
+TRANSPARENCY_INDICATORS = [
+    r"\b(?:this\s+is\s+an?\s+ai|powered\s+by\s+ai|ai\s+system|automated\s+system)\b",
+    r"\b(?:human\s+oversight|human\s+review|manual\s+verification)\b"
+]
+
+
 def _detect_transparency_violations(content: str) -> List[Dict[str, Any]]:
     """Detect transparency obligation violations under EU AI Act Article 13."""
     findings = []
     
-    # Check for AI systems interacting with humans without disclosure
-    interaction_patterns = [
-        r"\b(?:chatbot|virtual\s+assistant|ai\s+agent)\b",
-        r"\b(?:automated\s+(?:response|system|decision))\b",
-        r"\b(?:machine\s+learning|artificial\s+intelligence)\b"
-    ]
-    
-    transparency_indicators = [
-        r"\b(?:this\s+is\s+an?\s+ai|powered\s+by\s+ai|ai\s+system|automated\s+system)\b",
-        r"\b(?:human\s+oversight|human\s+review|manual\s+verification)\b"
-    ]
-    
-    has_ai_system = any(re.search(pattern, content, re.IGNORECASE) for pattern in interaction_patterns)
-    has_transparency_notice = any(re.search(pattern, content, re.IGNORECASE) for pattern in transparency_indicators)
+    has_ai_system = any(_RULES.search(pattern, content) for pattern in INTERACTION_PATTERNS)
+    has_transparency_notice = any(_RULES.search(pattern, content) for pattern in TRANSPARENCY_INDICATORS)
     
     if has_ai_system and not has_transparency_notice:
         findings.append({
@@ -496,19 +514,22 @@ def _detect_transparency_violations(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Detect potential fundamental rights impacts under EU AI Act
+RIGHTS_IMPACT_PATTERNS = {
+    "privacy_invasion": r"\b(?:privacy\s+violation|data\s+mining|behavioral\s+tracking)\b",
+    "discrimination": r"\b(?:discriminat|bias|unfair\s+treatment|algorithmic\s+bias)\b",
+    "freedom_expression": r"\b(?:content\s+moderation|speech\s+filtering|censorship)\b",
+    "due_process": r"\b(?:automated\s+decision|algorithmic\s+justice|due\s+process)\b"
+}
+
+
 def _detect_fundamental_rights_impact(content: str) -> List[Dict[str, Any]]:
     """Detect potential fundamental rights impacts under EU AI Act."""
     findings = []
     
-    rights_impact_patterns = {
-        "privacy_invasion": r"\b(?:privacy\s+violation|data\s+mining|behavioral\s+tracking)\b",
-        "discrimination": r"\b(?:discriminat|bias|unfair\s+treatment|algorithmic\s+bias)\b",
-        "freedom_expression": r"\b(?:content\s+moderation|speech\s+filtering|censorship)\b",
-        "due_process": r"\b(?:automated\s+decision|algorithmic\s+justice|due\s+process)\b"
-    }
-    
-    for impact_type, pattern in rights_impact_patterns.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    for impact_type, pattern in RIGHTS_IMPACT_PATTERNS.items():
+        matches = _RULES.finditer(pattern, content)
         for match in matches:
             findings.append({
                 'type': 'AI_ACT_FUNDAMENTAL_RIGHTS',
@@ -527,20 +548,23 @@ def _detect_fundamental_rights_impact(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Detect algorithmic accountability requirements
+ACCOUNTABILITY_PATTERNS = {
+    "decision_making": r"\b(?:algorithmic\s+decision|automated\s+decision|ai\s+decision)\b",
+    "model_governance": r"\b(?:model\s+governance|ai\s+governance|algorithm\s+oversight)\b",
+    "audit_trail": r"\b(?:audit\s+trail|decision\s+log|traceability)\b",
+    "explainability": r"\b(?:explainable\s+ai|interpretable|model\s+explanation)\b"
+}
+
+
 def _detect_algorithmic_accountability(content: str) -> List[Dict[str, Any]]:
     """Detect algorithmic accountability requirements."""
     findings = []
     
-    accountability_patterns = {
-        "decision_making": r"\b(?:algorithmic\s+decision|automated\s+decision|ai\s+decision)\b",
-        "model_governance": r"\b(?:model\s+governance|ai\s+governance|algorithm\s+oversight)\b",
-        "audit_trail": r"\b(?:audit\s+trail|decision\s+log|traceability)\b",
-        "explainability": r"\b(?:explainable\s+ai|interpretable|model\s+explanation)\b"
-    }
-    
-    has_decision_making = bool(re.search(accountability_patterns["decision_making"], content, re.IGNORECASE))
-    has_governance = any(re.search(pattern, content, re.IGNORECASE) 
-                        for pattern in list(accountability_patterns.values())[1:])
+    has_decision_making = bool(_RULES.search(ACCOUNTABILITY_PATTERNS["decision_making"], content))
+    has_governance = any(_RULES.search(pattern, content) 
+                        for pattern in list(ACCOUNTABILITY_PATTERNS.values())[1:])
     
     if has_decision_making and not has_governance:
         findings.append({
@@ -562,18 +586,21 @@ def _detect_algorithmic_accountability(content: str) -> List[Dict[str, Any]]:
 
 # DUPLICATE FUNCTION REMOVED - Using enhanced version at line 198
 
+
+# Detect post-market monitoring requirement violations (Articles 61-68)
+MONITORING_PATTERNS = {
+    "incident_reporting_missing": r"\b(?:malfunction|error|failure|incident)(?!.*(?:report|notif|alert|surveillance))",
+    "market_surveillance_missing": r"\b(?:ai\\s+system|product).*(?:market|commercial)(?!.*(?:surveillance|monitor|oversight|compliance\\s+check))",
+    "penalty_framework_missing": r"\b(?:non.?compliance|violation|breach)(?!.*(?:penalty|fine|sanction|enforcement))"
+}
+
+
 def _detect_post_market_monitoring(content: str) -> List[Dict[str, Any]]:
     """Detect post-market monitoring requirement violations (Articles 61-68)."""
     findings = []
     
-    monitoring_patterns = {
-        "incident_reporting_missing": r"\b(?:malfunction|error|failure|incident)(?!.*(?:report|notif|alert|surveillance))",
-        "market_surveillance_missing": r"\b(?:ai\\s+system|product).*(?:market|commercial)(?!.*(?:surveillance|monitor|oversight|compliance\\s+check))",
-        "penalty_framework_missing": r"\b(?:non.?compliance|violation|breach)(?!.*(?:penalty|fine|sanction|enforcement))"
-    }
-    
-    for violation_type, pattern in monitoring_patterns.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for violation_type, pattern in MONITORING_PATTERNS.items():
+        if _RULES.search(pattern, content):
             findings.append({
                 'type': 'AI_ACT_POST_MARKET',
                 'category': violation_type.replace('_', ' ').title(),
@@ -591,23 +618,26 @@ def _detect_post_market_monitoring(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Detect deepfake and AI-generated content disclosure violations (Article 52)
+DEEPFAKE_PATTERNS = {
+    "deepfake_creation": r"\b(?:deepfake|deep\\s+fake|synthetic\\s+media|face\\s+swap|voice\\s+cloning)\\b",
+    "ai_generated_content": r"\b(?:ai.?generated|synthetic|artificial)\\s+(?:content|image|video|audio|text)\\b",
+    "manipulated_media": r"\b(?:manipulated|altered|synthetic)\\s+(?:media|content|video|image|audio)\\b"
+}
+
+DISCLOSURE_PATTERNS = [
+    r"\b(?:ai.?generated|synthetic|artificial|deepfake)\\s+(?:content|warning|notice|disclaimer)\\b",
+    r"\b(?:this\\s+content\\s+was\\s+generated|created\\s+using\\s+ai|artificial\\s+content)\\b"
+]
+
+
 def _detect_deepfake_content_violations(content: str) -> List[Dict[str, Any]]:
     """Detect deepfake and AI-generated content disclosure violations (Article 52)."""
     findings = []
     
-    deepfake_patterns = {
-        "deepfake_creation": r"\b(?:deepfake|deep\\s+fake|synthetic\\s+media|face\\s+swap|voice\\s+cloning)\\b",
-        "ai_generated_content": r"\b(?:ai.?generated|synthetic|artificial)\\s+(?:content|image|video|audio|text)\\b",
-        "manipulated_media": r"\b(?:manipulated|altered|synthetic)\\s+(?:media|content|video|image|audio)\\b"
-    }
-    
-    disclosure_patterns = [
-        r"\b(?:ai.?generated|synthetic|artificial|deepfake)\\s+(?:content|warning|notice|disclaimer)\\b",
-        r"\b(?:this\\s+content\\s+was\\s+generated|created\\s+using\\s+ai|artificial\\s+content)\\b"
-    ]
-    
-    has_deepfake_content = any(re.search(pattern, content, re.IGNORECASE) for pattern in deepfake_patterns.values())
-    has_disclosure = any(re.search(pattern, content, re.IGNORECASE) for pattern in disclosure_patterns)
+    has_deepfake_content = any(_RULES.search(pattern, content) for pattern in DEEPFAKE_PATTERNS.values())
+    has_disclosure = any(_RULES.search(pattern, content) for pattern in DISCLOSURE_PATTERNS)
     
     if has_deepfake_content and not has_disclosure:
         findings.append({
@@ -679,20 +709,23 @@ def generate_ai_act_compliance_report(findings: List[Dict[str, Any]]) -> Dict[st
         'next_assessment_due': (datetime.now().replace(day=1, month=datetime.now().month + 3 if datetime.now().month <= 9 else datetime.now().month - 9, year=datetime.now().year + 1 if datetime.now().month > 9 else datetime.now().year)).isoformat()
     }
 
+
+# Detect General-Purpose AI model compliance issues (August 2025 requirements)
+GPAI_PATTERNS = {
+    "foundation_model": r"foundation\s+model|general\s+purpose|large\s+language\s+model|llm|gpt|bert|transformer",
+    "computational_threshold": r"flops|compute|training\s+cost|parameter\s+count|model\s+size",
+    "systemic_risk": r"systemic\s+risk|high\s+impact|widespread\s+deployment|capability\s+evaluation",
+    "copyright_disclosure": r"training\s+data|copyrighted\s+content|intellectual\s+property|data\s+sources",
+    "transparency_requirements": r"model\s+documentation|technical\s+specification|capability\s+assessment|risk\s+evaluation"
+}
+
+
 def _detect_gpai_compliance(content: str) -> List[Dict[str, Any]]:
     """Detect General-Purpose AI model compliance issues (August 2025 requirements)."""
     findings = []
     
-    gpai_patterns = {
-        "foundation_model": r"foundation\s+model|general\s+purpose|large\s+language\s+model|llm|gpt|bert|transformer",
-        "computational_threshold": r"flops|compute|training\s+cost|parameter\s+count|model\s+size",
-        "systemic_risk": r"systemic\s+risk|high\s+impact|widespread\s+deployment|capability\s+evaluation",
-        "copyright_disclosure": r"training\s+data|copyrighted\s+content|intellectual\s+property|data\s+sources",
-        "transparency_requirements": r"model\s+documentation|technical\s+specification|capability\s+assessment|risk\s+evaluation"
-    }
-    
-    for pattern_name, pattern in gpai_patterns.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+    for pattern_name, pattern in GPAI_PATTERNS.items():
+        matches = _RULES.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
         for match in matches:
             finding = {
                 'type': 'AI_ACT_GPAI_COMPLIANCE',
@@ -713,25 +746,28 @@ def _detect_gpai_compliance(content: str) -> List[Dict[str, Any]]:
 
 # NEW: Enhanced EU AI Act 2025 Article Detection Functions
 
+
+# Enhanced Article 6 - Automated Risk Classification Rules
+RISK_CLASSIFICATION_PATTERNS = {
+    "foundation_models_high_risk": r"\b(?:foundation.*model|general.*purpose.*ai|systemic.*risk)\b.*(?:high.*risk|critical.*system)",
+    "biometric_identification": r"\b(?:biometric.*identification|facial.*recognition|voice.*print|fingerprint)\b",
+    "critical_infrastructure": r"\b(?:critical.*infrastructure|essential.*service|public.*safety|energy.*grid)\b",
+    "education_vocational": r"\b(?:education.*system|vocational.*training|student.*assessment|academic.*evaluation)\b",
+    "employment_management": r"\b(?:recruitment|hr.*system|employment.*decision|worker.*evaluation)\b",
+    "essential_services": r"\b(?:essential.*service|public.*service|healthcare.*access|social.*benefit)\b",
+    "law_enforcement": r"\b(?:law.*enforcement|criminal.*justice|predictive.*policing|risk.*assessment)\b",
+    "migration_border": r"\b(?:migration|border.*control|asylum|visa.*application)\b",
+    "democratic_processes": r"\b(?:democratic.*process|election|voting.*system|political.*campaign)\b"
+}
+
+
 def _detect_automated_risk_classification(content: str) -> List[Dict[str, Any]]:
     """Enhanced Article 6 - Automated Risk Classification Rules."""
     findings = []
     
-    risk_classification_patterns = {
-        "foundation_models_high_risk": r"\b(?:foundation.*model|general.*purpose.*ai|systemic.*risk)\b.*(?:high.*risk|critical.*system)",
-        "biometric_identification": r"\b(?:biometric.*identification|facial.*recognition|voice.*print|fingerprint)\b",
-        "critical_infrastructure": r"\b(?:critical.*infrastructure|essential.*service|public.*safety|energy.*grid)\b",
-        "education_vocational": r"\b(?:education.*system|vocational.*training|student.*assessment|academic.*evaluation)\b",
-        "employment_management": r"\b(?:recruitment|hr.*system|employment.*decision|worker.*evaluation)\b",
-        "essential_services": r"\b(?:essential.*service|public.*service|healthcare.*access|social.*benefit)\b",
-        "law_enforcement": r"\b(?:law.*enforcement|criminal.*justice|predictive.*policing|risk.*assessment)\b",
-        "migration_border": r"\b(?:migration|border.*control|asylum|visa.*application)\b",
-        "democratic_processes": r"\b(?:democratic.*process|election|voting.*system|political.*campaign)\b"
-    }
-    
     detected_categories = []
-    for category, pattern in risk_classification_patterns.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for category, pattern in RISK_CLASSIFICATION_PATTERNS.items():
+        if _RULES.search(pattern, content):
             detected_categories.append(category)
     
     if detected_categories:
@@ -750,23 +786,26 @@ def _detect_automated_risk_classification(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced Article 16 - Quality Management System Detection
+QUALITY_MANAGEMENT_GAPS_QUALITY_MANAGEMENT_INDICATORS = {
+    "quality_policy": r"\b(?:quality.*policy|quality.*management|qms|iso.*9001)\b",
+    "risk_management": r"\b(?:risk.*management|risk.*assessment|risk.*mitigation)\b",
+    "data_governance": r"\b(?:data.*governance|data.*quality|data.*validation)\b",
+    "model_validation": r"\b(?:model.*validation|testing.*procedure|validation.*protocol)\b",
+    "change_control": r"\b(?:change.*control|version.*control|configuration.*management)\b",
+    "documentation": r"\b(?:technical.*documentation|system.*specification|user.*manual)\b",
+    "performance_monitoring": r"\b(?:performance.*monitor|system.*monitoring|continuous.*assessment)\b"
+}
+
+
 def _detect_quality_management_gaps(content: str) -> List[Dict[str, Any]]:
     """Enhanced Article 16 - Quality Management System Detection."""
     findings = []
     
-    quality_management_indicators = {
-        "quality_policy": r"\b(?:quality.*policy|quality.*management|qms|iso.*9001)\b",
-        "risk_management": r"\b(?:risk.*management|risk.*assessment|risk.*mitigation)\b",
-        "data_governance": r"\b(?:data.*governance|data.*quality|data.*validation)\b",
-        "model_validation": r"\b(?:model.*validation|testing.*procedure|validation.*protocol)\b",
-        "change_control": r"\b(?:change.*control|version.*control|configuration.*management)\b",
-        "documentation": r"\b(?:technical.*documentation|system.*specification|user.*manual)\b",
-        "performance_monitoring": r"\b(?:performance.*monitor|system.*monitoring|continuous.*assessment)\b"
-    }
-    
     missing_elements = []
-    for element, pattern in quality_management_indicators.items():
-        if not re.search(pattern, content, re.IGNORECASE):
+    for element, pattern in QUALITY_MANAGEMENT_GAPS_QUALITY_MANAGEMENT_INDICATORS.items():
+        if not _RULES.search(pattern, content):
             missing_elements.append(element)
     
     if len(missing_elements) >= 4:
@@ -785,23 +824,26 @@ def _detect_quality_management_gaps(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced Article 17 - Automatic Logging Requirements
+LOGGING_REQUIREMENTS = {
+    "event_logging": r"\b(?:event.*log|audit.*log|system.*log|activity.*log)\b",
+    "data_logging": r"\b(?:input.*data.*log|output.*log|prediction.*log)\b",
+    "user_interaction": r"\b(?:user.*interaction|user.*session|interaction.*log)\b",
+    "system_performance": r"\b(?:performance.*log|latency.*log|throughput.*log)\b",
+    "error_logging": r"\b(?:error.*log|exception.*log|failure.*log)\b",
+    "security_events": r"\b(?:security.*event|access.*log|authentication.*log)\b",
+    "retention_policy": r"\b(?:log.*retention|retention.*policy|log.*archival)\b"
+}
+
+
 def _detect_automatic_logging_gaps(content: str) -> List[Dict[str, Any]]:
     """Enhanced Article 17 - Automatic Logging Requirements."""
     findings = []
     
-    logging_requirements = {
-        "event_logging": r"\b(?:event.*log|audit.*log|system.*log|activity.*log)\b",
-        "data_logging": r"\b(?:input.*data.*log|output.*log|prediction.*log)\b",
-        "user_interaction": r"\b(?:user.*interaction|user.*session|interaction.*log)\b",
-        "system_performance": r"\b(?:performance.*log|latency.*log|throughput.*log)\b",
-        "error_logging": r"\b(?:error.*log|exception.*log|failure.*log)\b",
-        "security_events": r"\b(?:security.*event|access.*log|authentication.*log)\b",
-        "retention_policy": r"\b(?:log.*retention|retention.*policy|log.*archival)\b"
-    }
-    
     missing_logging = []
-    for log_type, pattern in logging_requirements.items():
-        if not re.search(pattern, content, re.IGNORECASE):
+    for log_type, pattern in LOGGING_REQUIREMENTS.items():
+        if not _RULES.search(pattern, content):
             missing_logging.append(log_type)
     
     if len(missing_logging) >= 3:
@@ -820,22 +862,25 @@ def _detect_automatic_logging_gaps(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced Article 26 - Human Oversight Requirements
+HUMAN_OVERSIGHT_PATTERNS = {
+    "human_in_the_loop": r"\b(?:human.*in.*loop|human.*intervention|manual.*review)\b",
+    "human_on_the_loop": r"\b(?:human.*on.*loop|human.*supervision|human.*monitoring)\b",
+    "human_override": r"\b(?:human.*override|manual.*override|stop.*button|emergency.*stop)\b",
+    "competent_persons": r"\b(?:competent.*person|qualified.*operator|trained.*staff)\b",
+    "monitoring_capability": r"\b(?:monitoring.*capability|oversight.*system|supervision.*system)\b",
+    "risk_interpretation": r"\b(?:risk.*interpretation|result.*interpretation|decision.*explanation)\b"
+}
+
+
 def _detect_human_oversight_gaps(content: str) -> List[Dict[str, Any]]:
     """Enhanced Article 26 - Human Oversight Requirements."""
     findings = []
     
-    human_oversight_patterns = {
-        "human_in_the_loop": r"\b(?:human.*in.*loop|human.*intervention|manual.*review)\b",
-        "human_on_the_loop": r"\b(?:human.*on.*loop|human.*supervision|human.*monitoring)\b",
-        "human_override": r"\b(?:human.*override|manual.*override|stop.*button|emergency.*stop)\b",
-        "competent_persons": r"\b(?:competent.*person|qualified.*operator|trained.*staff)\b",
-        "monitoring_capability": r"\b(?:monitoring.*capability|oversight.*system|supervision.*system)\b",
-        "risk_interpretation": r"\b(?:risk.*interpretation|result.*interpretation|decision.*explanation)\b"
-    }
-    
     oversight_gaps = []
-    for oversight_type, pattern in human_oversight_patterns.items():
-        if not re.search(pattern, content, re.IGNORECASE):
+    for oversight_type, pattern in HUMAN_OVERSIGHT_PATTERNS.items():
+        if not _RULES.search(pattern, content):
             oversight_gaps.append(oversight_type)
     
     if len(oversight_gaps) >= 3:
@@ -854,23 +899,26 @@ def _detect_human_oversight_gaps(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Enhanced Article 29 - Fundamental Rights Impact Assessment
+FUNDAMENTAL_RIGHTS_PATTERNS = {
+    "rights_impact_assessment": r"\b(?:fundamental.*rights.*impact|rights.*assessment|human.*rights.*impact)\b",
+    "non_discrimination": r"\b(?:non.*discrimination|bias.*assessment|fairness.*evaluation)\b",
+    "privacy_protection": r"\b(?:privacy.*protection|data.*protection|personal.*data)\b",
+    "freedom_of_expression": r"\b(?:freedom.*expression|speech.*rights|communication.*rights)\b",
+    "human_dignity": r"\b(?:human.*dignity|dignity.*respect|individual.*autonomy)\b",
+    "equality_assessment": r"\b(?:equality.*assessment|equal.*treatment|gender.*equality)\b",
+    "vulnerable_groups": r"\b(?:vulnerable.*group|minority.*rights|children.*rights)\b"
+}
+
+
 def _detect_fundamental_rights_gaps(content: str) -> List[Dict[str, Any]]:
     """Enhanced Article 29 - Fundamental Rights Impact Assessment."""
     findings = []
     
-    fundamental_rights_patterns = {
-        "rights_impact_assessment": r"\b(?:fundamental.*rights.*impact|rights.*assessment|human.*rights.*impact)\b",
-        "non_discrimination": r"\b(?:non.*discrimination|bias.*assessment|fairness.*evaluation)\b",
-        "privacy_protection": r"\b(?:privacy.*protection|data.*protection|personal.*data)\b",
-        "freedom_of_expression": r"\b(?:freedom.*expression|speech.*rights|communication.*rights)\b",
-        "human_dignity": r"\b(?:human.*dignity|dignity.*respect|individual.*autonomy)\b",
-        "equality_assessment": r"\b(?:equality.*assessment|equal.*treatment|gender.*equality)\b",
-        "vulnerable_groups": r"\b(?:vulnerable.*group|minority.*rights|children.*rights)\b"
-    }
-    
     rights_gaps = []
-    for rights_area, pattern in fundamental_rights_patterns.items():
-        if not re.search(pattern, content, re.IGNORECASE):
+    for rights_area, pattern in FUNDAMENTAL_RIGHTS_PATTERNS.items():
+        if not _RULES.search(pattern, content):
             rights_gaps.append(rights_area)
     
     if len(rights_gaps) >= 4:
@@ -891,30 +939,32 @@ def _detect_fundamental_rights_gaps(content: str) -> List[Dict[str, Any]]:
 
 # NEW: Critical missing AI Act articles implementation
 
+
+# Article 1-2: Scope and material coverage
+AI_SYSTEM_PATTERNS = [
+    r"\b(?:artificial.*intelligence|ai.*system|machine.*learning|neural.*network|deep.*learning)\b",
+    r"\b(?:algorithmic.*decision|automated.*system|intelligent.*system)\b"
+]
+
+# Article 3: Key definitions compliance
+DEFINITION_REQUIREMENTS = {
+    'ai_system_definition': r"\b(?:ai.*system.*definition|artificial.*intelligence.*system.*means)\b",
+    'risk_assessment_definition': r"\b(?:risk.*assessment|risk.*evaluation|risk.*analysis)\b",
+    'provider_definition': r"\b(?:ai.*provider|system.*provider|developer)\b",
+    'deployer_definition': r"\b(?:deployer|user.*ai.*system|operator)\b"
+}
+
+
 def _detect_scope_and_definitions_violations(content: str) -> List[Dict[str, Any]]:
     """Detect scope and definitions violations (Articles 1-4)."""
     findings = []
     
-    # Article 1-2: Scope and material coverage
-    ai_system_patterns = [
-        r"\b(?:artificial.*intelligence|ai.*system|machine.*learning|neural.*network|deep.*learning)\b",
-        r"\b(?:algorithmic.*decision|automated.*system|intelligent.*system)\b"
-    ]
-    
-    has_ai_system = any(re.search(pattern, content, re.IGNORECASE) for pattern in ai_system_patterns)
+    has_ai_system = any(_RULES.search(pattern, content) for pattern in AI_SYSTEM_PATTERNS)
     
     if has_ai_system:
-        # Article 3: Key definitions compliance
-        definition_requirements = {
-            'ai_system_definition': r"\b(?:ai.*system.*definition|artificial.*intelligence.*system.*means)\b",
-            'risk_assessment_definition': r"\b(?:risk.*assessment|risk.*evaluation|risk.*analysis)\b",
-            'provider_definition': r"\b(?:ai.*provider|system.*provider|developer)\b",
-            'deployer_definition': r"\b(?:deployer|user.*ai.*system|operator)\b"
-        }
-        
         missing_definitions = []
-        for definition, pattern in definition_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for definition, pattern in DEFINITION_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_definitions.append(definition.replace('_', ' '))
         
         if len(missing_definitions) > 2:
@@ -932,31 +982,33 @@ def _detect_scope_and_definitions_violations(content: str) -> List[Dict[str, Any
     
     return findings
 
+
+# Article 10: Data and data governance
+DATA_PATTERNS = [
+    r"\b(?:training.*data|dataset|data.*quality|data.*governance)\b",
+    r"\b(?:machine.*learning.*data|ai.*training.*data)\b"
+]
+
+# Data governance requirements
+GOVERNANCE_REQUIREMENTS = {
+    'data_quality_measures': r"\b(?:data.*quality|quality.*assurance|data.*validation)\b",
+    'bias_detection': r"\b(?:bias.*detection|bias.*mitigation|fairness.*assessment)\b",
+    'representative_datasets': r"\b(?:representative.*dataset|diverse.*data|balanced.*training)\b",
+    'data_provenance': r"\b(?:data.*provenance|data.*lineage|data.*source)\b",
+    'statistical_properties': r"\b(?:statistical.*properties|data.*statistics|distribution.*analysis)\b"
+}
+
+
 def _detect_data_governance_violations(content: str) -> List[Dict[str, Any]]:
     """Detect data governance violations (Articles 10-12)."""
     findings = []
     
-    # Article 10: Data and data governance
-    data_patterns = [
-        r"\b(?:training.*data|dataset|data.*quality|data.*governance)\b",
-        r"\b(?:machine.*learning.*data|ai.*training.*data)\b"
-    ]
-    
-    has_data_processing = any(re.search(pattern, content, re.IGNORECASE) for pattern in data_patterns)
+    has_data_processing = any(_RULES.search(pattern, content) for pattern in DATA_PATTERNS)
     
     if has_data_processing:
-        # Data governance requirements
-        governance_requirements = {
-            'data_quality_measures': r"\b(?:data.*quality|quality.*assurance|data.*validation)\b",
-            'bias_detection': r"\b(?:bias.*detection|bias.*mitigation|fairness.*assessment)\b",
-            'representative_datasets': r"\b(?:representative.*dataset|diverse.*data|balanced.*training)\b",
-            'data_provenance': r"\b(?:data.*provenance|data.*lineage|data.*source)\b",
-            'statistical_properties': r"\b(?:statistical.*properties|data.*statistics|distribution.*analysis)\b"
-        }
-        
         missing_governance = []
-        for requirement, pattern in governance_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in GOVERNANCE_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_governance.append(requirement.replace('_', ' '))
         
         if len(missing_governance) > 2:
@@ -975,31 +1027,33 @@ def _detect_data_governance_violations(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Article 69-75: Market surveillance and compliance
+MARKET_PATTERNS = [
+    r"\b(?:market.*surveillance|compliance.*monitoring|regulatory.*oversight)\b",
+    r"\b(?:ai.*system.*market|commercial.*ai|deployed.*ai)\b"
+]
+
+# Market surveillance requirements
+SURVEILLANCE_REQUIREMENTS = {
+    'incident_reporting': r"\b(?:incident.*report|malfunction.*report|serious.*incident)\b",
+    'corrective_measures': r"\b(?:corrective.*action|remedial.*measure|fix.*issue)\b",
+    'cooperation_authorities': r"\b(?:authority.*cooperation|regulatory.*cooperation|compliance.*authority)\b",
+    'withdrawal_procedures': r"\b(?:product.*withdrawal|market.*withdrawal|recall.*procedure)\b",
+    'risk_mitigation': r"\b(?:risk.*mitigation|safety.*measure|protective.*action)\b"
+}
+
+
 def _detect_market_surveillance_violations(content: str) -> List[Dict[str, Any]]:
     """Detect market surveillance violations (Articles 69-75)."""
     findings = []
     
-    # Article 69-75: Market surveillance and compliance
-    market_patterns = [
-        r"\b(?:market.*surveillance|compliance.*monitoring|regulatory.*oversight)\b",
-        r"\b(?:ai.*system.*market|commercial.*ai|deployed.*ai)\b"
-    ]
-    
-    has_market_presence = any(re.search(pattern, content, re.IGNORECASE) for pattern in market_patterns)
+    has_market_presence = any(_RULES.search(pattern, content) for pattern in MARKET_PATTERNS)
     
     if has_market_presence:
-        # Market surveillance requirements
-        surveillance_requirements = {
-            'incident_reporting': r"\b(?:incident.*report|malfunction.*report|serious.*incident)\b",
-            'corrective_measures': r"\b(?:corrective.*action|remedial.*measure|fix.*issue)\b",
-            'cooperation_authorities': r"\b(?:authority.*cooperation|regulatory.*cooperation|compliance.*authority)\b",
-            'withdrawal_procedures': r"\b(?:product.*withdrawal|market.*withdrawal|recall.*procedure)\b",
-            'risk_mitigation': r"\b(?:risk.*mitigation|safety.*measure|protective.*action)\b"
-        }
-        
         missing_surveillance = []
-        for requirement, pattern in surveillance_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in SURVEILLANCE_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_surveillance.append(requirement.replace('_', ' '))
         
         if len(missing_surveillance) > 2:
@@ -1018,30 +1072,32 @@ def _detect_market_surveillance_violations(content: str) -> List[Dict[str, Any]]
     
     return findings
 
+
+# Article 83: Administrative fines
+COMPLIANCE_PATTERNS = [
+    r"\b(?:ai.*act.*compliance|eu.*ai.*act|compliance.*framework)\b",
+    r"\b(?:regulatory.*compliance|legal.*compliance|ai.*regulation)\b"
+]
+
+# Penalty awareness requirements
+PENALTY_AWARENESS = {
+    'fine_framework': r"\b(?:administrative.*fine|penalty.*framework|€35.*million|7%.*global.*turnover)\b",
+    'violation_categories': r"\b(?:prohibited.*practice|high.*risk.*violation|gpai.*violation)\b",
+    'compliance_measures': r"\b(?:compliance.*program|risk.*management|conformity.*assessment)\b",
+    'enforcement_awareness': r"\b(?:supervisory.*authority|enforcement.*action|regulatory.*oversight)\b"
+}
+
+
 def _detect_penalty_framework_violations(content: str) -> List[Dict[str, Any]]:
     """Detect penalty framework violations (Articles 76-85)."""
     findings = []
     
-    # Article 83: Administrative fines
-    compliance_patterns = [
-        r"\b(?:ai.*act.*compliance|eu.*ai.*act|compliance.*framework)\b",
-        r"\b(?:regulatory.*compliance|legal.*compliance|ai.*regulation)\b"
-    ]
-    
-    has_compliance_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in compliance_patterns)
+    has_compliance_reference = any(_RULES.search(pattern, content) for pattern in COMPLIANCE_PATTERNS)
     
     if has_compliance_reference:
-        # Penalty awareness requirements
-        penalty_awareness = {
-            'fine_framework': r"\b(?:administrative.*fine|penalty.*framework|€35.*million|7%.*global.*turnover)\b",
-            'violation_categories': r"\b(?:prohibited.*practice|high.*risk.*violation|gpai.*violation)\b",
-            'compliance_measures': r"\b(?:compliance.*program|risk.*management|conformity.*assessment)\b",
-            'enforcement_awareness': r"\b(?:supervisory.*authority|enforcement.*action|regulatory.*oversight)\b"
-        }
-        
         missing_awareness = []
-        for awareness, pattern in penalty_awareness.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for awareness, pattern in PENALTY_AWARENESS.items():
+            if not _RULES.search(pattern, content):
                 missing_awareness.append(awareness.replace('_', ' '))
         
         if len(missing_awareness) > 2:
@@ -1060,31 +1116,33 @@ def _detect_penalty_framework_violations(content: str) -> List[Dict[str, Any]]:
     
     return findings
 
+
+# Article 48: CE marking requirements
+CE_PATTERNS = [
+    r"\b(?:ce.*marking|ce.*conformity|conformity.*marking)\b",
+    r"\b(?:high.*risk.*ai|ai.*system.*market|commercial.*ai)\b"
+]
+
+# CE marking requirements
+CE_REQUIREMENTS = {
+    'conformity_assessment': r"\b(?:conformity.*assessment|third.*party.*assessment|notified.*body)\b",
+    'technical_documentation': r"\b(?:technical.*documentation|system.*documentation|compliance.*documentation)\b",
+    'quality_management': r"\b(?:quality.*management.*system|qms|iso.*9001)\b",
+    'eu_declaration': r"\b(?:eu.*declaration.*conformity|declaration.*conformity|doc)\b",
+    'ce_marking_placement': r"\b(?:ce.*marking.*placement|ce.*logo|conformity.*marking)\b"
+}
+
+
 def _detect_ce_marking_violations(content: str) -> List[Dict[str, Any]]:
     """Detect CE marking violations (Articles 30-49)."""
     findings = []
     
-    # Article 48: CE marking requirements
-    ce_patterns = [
-        r"\b(?:ce.*marking|ce.*conformity|conformity.*marking)\b",
-        r"\b(?:high.*risk.*ai|ai.*system.*market|commercial.*ai)\b"
-    ]
-    
-    has_ce_relevance = any(re.search(pattern, content, re.IGNORECASE) for pattern in ce_patterns)
+    has_ce_relevance = any(_RULES.search(pattern, content) for pattern in CE_PATTERNS)
     
     if has_ce_relevance:
-        # CE marking requirements
-        ce_requirements = {
-            'conformity_assessment': r"\b(?:conformity.*assessment|third.*party.*assessment|notified.*body)\b",
-            'technical_documentation': r"\b(?:technical.*documentation|system.*documentation|compliance.*documentation)\b",
-            'quality_management': r"\b(?:quality.*management.*system|qms|iso.*9001)\b",
-            'eu_declaration': r"\b(?:eu.*declaration.*conformity|declaration.*conformity|doc)\b",
-            'ce_marking_placement': r"\b(?:ce.*marking.*placement|ce.*logo|conformity.*marking)\b"
-        }
-        
         missing_ce_requirements = []
-        for requirement, pattern in ce_requirements.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for requirement, pattern in CE_REQUIREMENTS.items():
+            if not _RULES.search(pattern, content):
                 missing_ce_requirements.append(requirement.replace('_', ' '))
         
         if len(missing_ce_requirements) > 2:
@@ -1101,4 +1159,20 @@ def _detect_ce_marking_violations(content: str) -> List[Dict[str, Any]]:
                 'recommendation': 'Complete CE marking process including conformity assessment, technical documentation, and quality management'
             })
     
-    return findings
\ No newline at end of file
+    return findings
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    PROHIBITED_PATTERNS, CONFORMITY_ASSESSMENT_VIOLATIONS_QUALITY_MANAGEMENT_INDICATORS,
+    CONFORMITY_ASSESSMENT_VIOLATIONS_HIGH_RISK_PATTERNS, GPAI_DETECTION_PATTERNS,
+    ENHANCED_POST_MARKET_MONITORING_HIGH_RISK_PATTERNS, MONITORING_INDICATORS,
+    HIGH_RISK_SYSTEMS_HIGH_RISK_PATTERNS, INTERACTION_PATTERNS, TRANSPARENCY_INDICATORS,
+    RIGHTS_IMPACT_PATTERNS, ACCOUNTABILITY_PATTERNS, MONITORING_PATTERNS, DEEPFAKE_PATTERNS,
+    DISCLOSURE_PATTERNS, GPAI_PATTERNS, RISK_CLASSIFICATION_PATTERNS,
+    QUALITY_MANAGEMENT_GAPS_QUALITY_MANAGEMENT_INDICATORS, LOGGING_REQUIREMENTS, HUMAN_OVERSIGHT_PATTERNS,
+    FUNDAMENTAL_RIGHTS_PATTERNS, AI_SYSTEM_PATTERNS, DEFINITION_REQUIREMENTS, DATA_PATTERNS,
+    GOVERNANCE_REQUIREMENTS, MARKET_PATTERNS, SURVEILLANCE_REQUIREMENTS, COMPLIANCE_PATTERNS,
+    PENALTY_AWARENESS, CE_PATTERNS, CE_REQUIREMENTS,
+    fields=('pattern',),
+)
@@ -1,12 +1,18 @@
 """
 Event Bus System for Enterprise Integration
 
-Provides in-process event handling with optional Redis pub/sub for production scaling.
+Provides asynchronous in-process event delivery with an optional durable
+Redis Streams backend for production scaling.
 Enables enterprise features to integrate without modifying core functionality.
 """
 
+import atexit
 import logging
 import json
+import os
+import queue
+import socket
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, List, Callable, Optional, Tuple, Union
@@ -14,7 +20,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
 
-# Try importing Redis for production pub/sub - graceful fallback if not available
+# Try importing Redis for production streams - graceful fallback if not available
 try:
     import redis
     from utils.redis_cache import get_cache
@@ -25,6 +31,21 @@ except ImportError:
 
 logger = logging.getLogger("utils.event_bus")
 
+# Events queued per listener before publishers wait (then drop)
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_PUT_TIMEOUT = 0.5
+
+# Events a plain listener's worker drains per wake-up
+DEFAULT_DRAIN_SIZE = 64
+
+# Batch listeners: largest batch and how long to wait for it to fill
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_WAIT = 0.05
+
+DEFAULT_STREAM_GROUP = os.environ.get('DG_EVENT_GROUP', 'dataguardian')
+DEFAULT_STREAM_MAXLEN = 100000
+STREAM_BLOCK_MS = 1000
+
 class EventType(Enum):
     """Enterprise event types for integration"""
     SCAN_STARTED = "scan_started"
@@ -80,128 +101,504 @@ class Event:
             metadata=data.get('metadata', {})
         )
 
+class _Ack:
+    """Acknowledges a stream entry once every local listener has handled it"""
+
+    def __init__(self, remaining: int, callback: Callable[[], None]):
+        self._remaining = remaining
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def done(self) -> None:
+        with self._lock:
+            self._remaining -= 1
+            finished = self._remaining == 0
+        if finished:
+            self._callback()
+
+
+class _Delivery:
+    """One queued event for one listener"""
+    __slots__ = ('event', 'enqueued_at', 'ack')
+
+    def __init__(self, event: Event, ack: Optional[_Ack] = None):
+        self.event = event
+        self.enqueued_at = time.monotonic()
+        self.ack = ack
+
+
+_STOP = object()
+
+
+class _Subscription:
+    """
+    A listener with its own bounded queue and worker thread.
+
+    A slow listener only delays its own queue; publishers wait at most
+    `put_timeout` for space before the event is dropped for that listener.
+    Batch listeners receive lists of up to `max_batch` events, collected for
+    at most `max_wait` seconds.
+    """
+
+    def __init__(self, listener_id: str, event_type: EventType, callback: Callable,
+                 batch: bool = False, max_batch: int = 1, max_wait: float = 0.0,
+                 max_queue: int = DEFAULT_QUEUE_SIZE, asynchronous: bool = True):
+        self.listener_id = listener_id
+        self.event_type = event_type
+        self.callback = callback
+        self.batch = batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self.queue: 'queue.Queue' = queue.Queue(maxsize=max_queue)
+        self.metrics = {
+            'delivered': 0,
+            'failed': 0,
+            'dropped': 0,
+            'batches': 0,
+            'handler_seconds': 0.0,
+            'max_handler_seconds': 0.0,
+            'last_lag_seconds': 0.0,
+            'max_lag_seconds': 0.0,
+        }
+        self._thread: Optional[threading.Thread] = None
+        if asynchronous:
+            self._thread = threading.Thread(
+                target=self._run, name=f"event-listener-{event_type.value}", daemon=True
+            )
+            self._thread.start()
+
+    def offer(self, delivery: _Delivery, put_timeout: float) -> bool:
+        """Queue a delivery, or handle it inline when running synchronously"""
+        if self._thread is None:
+            self._handle([delivery])
+            return True
+        try:
+            self.queue.put(delivery, timeout=put_timeout)
+            return True
+        except queue.Full:
+            self.metrics['dropped'] += 1
+            logger.warning(f"EventBus: Queue full for listener {self.listener_id} "
+                           f"({self.event_type.value}); event {delivery.event.event_id} dropped")
+            return False
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.queue.put(_STOP)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                self.queue.task_done()
+                return
+            items = [item]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait
+            while len(items) < self.max_batch:
+                try:
+                    remaining = deadline - time.monotonic()
+                    nxt = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _STOP:
+                    stopping = True
+                    break
+                items.append(nxt)
+            try:
+                self._handle(items)
+            finally:
+                for _ in items:
+                    self.queue.task_done()
+            if stopping:
+                self.queue.task_done()
+                return
+
+    def _handle(self, items: List[_Delivery]) -> None:
+        started = time.monotonic()
+        lag = started - items[0].enqueued_at
+        metrics = self.metrics
+        metrics['last_lag_seconds'] = lag
+        metrics['max_lag_seconds'] = max(metrics['max_lag_seconds'], lag)
+
+        if self.batch:
+            try:
+                self.callback([d.event for d in items])
+                metrics['delivered'] += len(items)
+            except Exception as e:
+                metrics['failed'] += len(items)
+                logger.error(f"EventBus: Batch listener {self.listener_id} failed for "
+                             f"{len(items)} {self.event_type.value} events: {e}")
+        else:
+            for delivery in items:
+                try:
+                    self.callback(delivery.event)
+                    metrics['delivered'] += 1
+                except Exception as e:
+                    metrics['failed'] += 1
+                    logger.error(f"EventBus: Listener {self.listener_id} failed for {self.event_type.value}: {e}")
+
+        elapsed = time.monotonic() - started
+        metrics['batches'] += 1
+        metrics['handler_seconds'] += elapsed
+        metrics['max_handler_seconds'] = max(metrics['max_handler_seconds'], elapsed)
+
+        # Failed events are acknowledged too: retrying a listener that raises
+        # would redeliver to every other listener as well
+        for delivery in items:
+            if delivery.ack is not None:
+                delivery.ack.done()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = self.metrics
+        batches = metrics['batches']
+        return {
+            'event_type': self.event_type.value,
+            'batch': self.batch,
+            'delivered': metrics['delivered'],
+            'failed': metrics['failed'],
+            'dropped': metrics['dropped'],
+            'queue_depth': self.queue.qsize(),
+            'queue_capacity': self.queue.maxsize,
+            'avg_latency_ms': round(metrics['handler_seconds'] / batches * 1000, 3) if batches else 0.0,
+            'max_latency_ms': round(metrics['max_handler_seconds'] * 1000, 3),
+            'lag_ms': round(metrics['last_lag_seconds'] * 1000, 3),
+            'max_lag_ms': round(metrics['max_lag_seconds'] * 1000, 3),
+        }
+
+
+class RedisStreamsBackend:
+    """
+    Durable event transport over Redis Streams.
+
+    Each event type is a stream (`{prefix}:{event_type}`) capped at roughly
+    `maxlen` entries. Buses sharing a consumer group split the events between
+    them; buses in different groups each receive every event. An entry is
+    acknowledged once all local listeners have handled it, so entries read
+    but not handled before a restart are read again from the consumer's
+    pending list when it comes back.
+    """
+
+    def __init__(self, client, group: str = DEFAULT_STREAM_GROUP, consumer: Optional[str] = None,
+                 prefix: str = "enterprise_events", maxlen: int = DEFAULT_STREAM_MAXLEN):
+        self.client = client
+        self.group = group
+        self.consumer = consumer or os.environ.get(
+            'DG_EVENT_CONSUMER', socket.gethostname()
+        )
+        self.prefix = prefix
+        self.maxlen = maxlen
+        # stream -> last pending id read while recovering, or '>' for new entries
+        self._cursors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.metrics = {'published': 0, 'read': 0, 'acked': 0, 'errors': 0}
+
+    def stream_name(self, event_type: EventType) -> str:
+        return f"{self.prefix}:{event_type.value}"
+
+    def add_stream(self, event_type: EventType) -> None:
+        """Start consuming an event type, beginning with this consumer's pending entries"""
+        stream = self.stream_name(event_type)
+        with self._lock:
+            if stream in self._cursors:
+                return
+        try:
+            self.client.xgroup_create(stream, self.group, id='0', mkstream=True)
+        except Exception as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+        with self._lock:
+            self._cursors.setdefault(stream, '0')
+
+    def publish(self, events: List[Event]) -> None:
+        """Append events to their streams in one pipelined round trip"""
+        pipe = self.client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(self.stream_name(event.event_type),
+                      {'event': json.dumps(event.to_dict(), default=str)},
+                      maxlen=self.maxlen, approximate=True)
+        pipe.execute()
+        self.metrics['published'] += len(events)
+
+    def read(self, count: int, block_ms: int) -> List[Tuple[str, str, Event]]:
+        """Read up to `count` entries per stream as (stream, entry_id, event)"""
+        with self._lock:
+            streams = dict(self._cursors)
+        if not streams:
+            return []
+        recovering = [stream for stream, cursor in streams.items() if cursor != '>']
+        response = self.client.xreadgroup(self.group, self.consumer, streams, count=count,
+                                          block=None if recovering else block_ms) or []
+
+        entries: List[Tuple[str, str, Event]] = []
+        last_ids: Dict[str, str] = {}
+        for stream, messages in response:
+            stream = _text(stream)
+            for entry_id, fields in messages:
+                entry_id = _text(entry_id)
+                last_ids[stream] = entry_id
+                if not fields:
+                    # Pending entry already trimmed from the stream
+                    self.ack(stream, entry_id)
+                    continue
+                raw = fields.get(b'event', fields.get('event'))
+                try:
+                    event = Event.from_dict(json.loads(_text(raw)))
+                except Exception as e:
+                    self.metrics['errors'] += 1
+                    logger.error(f"EventBus: Unreadable stream entry {stream}/{entry_id}: {e}")
+                    self.ack(stream, entry_id)
+                    continue
+                entries.append((stream, entry_id, event))
+                self.metrics['read'] += 1
+
+        with self._lock:
+            for stream in recovering:
+                # Page through pending entries; an empty page ends recovery
+                self._cursors[stream] = last_ids.get(stream, '>')
+        if recovering and not entries:
+            return self.read(count, block_ms)
+        return entries
+
+    def ack(self, stream: str, entry_id: str) -> None:
+        try:
+            self.client.xack(stream, self.group, entry_id)
+            self.metrics['acked'] += 1
+        except Exception as e:
+            self.metrics['errors'] += 1
+            logger.error(f"EventBus: Failed to acknowledge {stream}/{entry_id}: {e}")
+
+
+def _text(value) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
 class EventBus:
     """
     Enterprise Event Bus for loosely-coupled integration
-    
-    Supports both in-process listeners and optional Redis pub/sub for scaling.
-    Maintains existing functionality while enabling enterprise features.
+
+    Each listener has a bounded queue drained by its own worker thread, so
+    publishing never runs listener code on the publisher's thread. With a
+    Redis Streams backend, events are appended to durable streams and
+    delivered to local listeners by a consumer thread instead.
     """
-    
-    def __init__(self, use_redis: bool = False):
-        self.use_redis = use_redis and REDIS_AVAILABLE
-        self._listeners: Dict[EventType, List[Tuple[str, Callable[[Event], None]]]] = {}
+
+    def __init__(self, use_redis: bool = False, asynchronous: Optional[bool] = None,
+                 streams_backend: Optional[RedisStreamsBackend] = None,
+                 put_timeout: float = DEFAULT_PUT_TIMEOUT):
+        if asynchronous is None:
+            asynchronous = os.environ.get('DG_EVENT_BUS_SYNC', '0').lower() not in ('1', 'true', 'yes')
+        self.asynchronous = asynchronous
+        self.put_timeout = put_timeout
+        self._listeners: Dict[EventType, List[_Subscription]] = {}
         self._lock = threading.Lock()
-        self._redis_client = None
-        
-        if self.use_redis and get_cache is not None:
+        self._streams = streams_backend
+        self._consumer_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        if self._streams is None and use_redis and REDIS_AVAILABLE and get_cache is not None:
             try:
-                cache = get_cache()
-                # Check if Redis client has publish method (fallback for compatibility)
-                if cache is not None and hasattr(cache, 'publish'):
-                    self._redis_client = cache
-                    logger.info("EventBus: Redis pub/sub enabled for scaling")
+                client = getattr(get_cache(), 'redis_client', None)
+                if client is not None:
+                    self._streams = RedisStreamsBackend(client)
+                    logger.info("EventBus: Redis Streams delivery enabled")
                 else:
-                    logger.warning("EventBus: Redis cache doesn't support pub/sub, using in-process mode")
-                    self.use_redis = False
+                    logger.warning("EventBus: Redis not connected, using in-process mode")
             except Exception as e:
                 logger.warning(f"EventBus: Redis unavailable, using in-process mode: {e}")
-                self.use_redis = False
-    
-    def subscribe(self, event_type: EventType, listener: Callable[[Event], None]) -> str:
+        self.use_redis = self._streams is not None
+
+    def subscribe(self, event_type: EventType, listener: Callable[[Event], None],
+                  max_queue: int = DEFAULT_QUEUE_SIZE) -> str:
         """
         Subscribe to events of a specific type
-        
+
         Args:
             event_type: The event type to listen for
             listener: Callback function that receives Event objects
-            
+            max_queue: Events queued for this listener before publishers wait
+
         Returns:
             Listener ID for unsubscribing
         """
+        return self._add_subscription(event_type, listener, False, DEFAULT_DRAIN_SIZE, 0.0, max_queue)
+
+    def subscribe_batch(self, event_type: EventType, listener: Callable[[List[Event]], None],
+                        max_batch: int = DEFAULT_BATCH_SIZE, max_wait: float = DEFAULT_BATCH_WAIT,
+                        max_queue: int = DEFAULT_QUEUE_SIZE) -> str:
+        """
+        Subscribe to high-volume events (e.g. per-finding events) in batches
+
+        Args:
+            event_type: The event type to listen for
+            listener: Callback receiving a list of Event objects
+            max_batch: Largest batch passed to the listener
+            max_wait: Seconds to wait for a batch to fill
+            max_queue: Events queued for this listener before publishers wait
+
+        Returns:
+            Listener ID for unsubscribing
+        """
+        return self._add_subscription(event_type, listener, True, max_batch, max_wait, max_queue)
+
+    def _add_subscription(self, event_type: EventType, listener: Callable, batch: bool,
+                          max_batch: int, max_wait: float, max_queue: int) -> str:
+        listener_id = str(uuid.uuid4())
+        subscription = _Subscription(listener_id, event_type, listener, batch=batch,
+                                     max_batch=max_batch, max_wait=max_wait,
+                                     max_queue=max_queue, asynchronous=self.asynchronous)
         with self._lock:
-            if event_type not in self._listeners:
-                self._listeners[event_type] = []
-            
-            listener_id = str(uuid.uuid4())
-            # Store listener with ID for removal
-            listener_wrapper = (listener_id, listener)
-            self._listeners[event_type].append(listener_wrapper)
-            
-            logger.debug(f"EventBus: Subscribed to {event_type.value}, {len(self._listeners[event_type])} listeners")
-            return listener_id
-    
+            self._listeners.setdefault(event_type, []).append(subscription)
+            count = len(self._listeners[event_type])
+
+        if self._streams is not None:
+            self._streams.add_stream(event_type)
+            self._start_consumer()
+
+        logger.debug(f"EventBus: Subscribed to {event_type.value}, {count} listeners")
+        return listener_id
+
     def unsubscribe(self, event_type: EventType, listener_id: str) -> bool:
         """
         Unsubscribe from events
-        
+
         Args:
             event_type: The event type to unsubscribe from
             listener_id: The listener ID returned by subscribe
-            
+
         Returns:
             True if listener was found and removed
         """
         with self._lock:
             if event_type not in self._listeners:
                 return False
-            
-            original_count = len(self._listeners[event_type])
+
+            removed = [s for s in self._listeners[event_type] if s.listener_id == listener_id]
             self._listeners[event_type] = [
-                (lid, listener) for lid, listener in self._listeners[event_type]
-                if lid != listener_id
+                s for s in self._listeners[event_type] if s.listener_id != listener_id
             ]
-            
-            removed = len(self._listeners[event_type]) < original_count
-            if removed:
-                logger.debug(f"EventBus: Unsubscribed from {event_type.value}")
-            
-            return removed
-    
+
+        # Queued events are still delivered before the worker exits
+        for subscription in removed:
+            subscription.stop()
+        if removed:
+            logger.debug(f"EventBus: Unsubscribed from {event_type.value}")
+
+        return bool(removed)
+
     def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers
-        
+
         Args:
             event: The event to publish
         """
+        self.publish_batch([event])
+
+    def publish_batch(self, events: List[Event]) -> None:
+        """
+        Publish several events at once (one Redis round trip when streams are enabled)
+
+        Args:
+            events: The events to publish
+        """
+        if not events:
+            return
         try:
-            # In-process delivery to local listeners
-            self._deliver_local(event)
-            
-            # Redis pub/sub for distributed listeners (if enabled)
-            if self.use_redis and self._redis_client:
-                self._deliver_redis(event)
-                
+            if self._streams is not None:
+                try:
+                    self._streams.publish(events)
+                    return
+                except Exception as e:
+                    logger.error(f"EventBus: Stream publish failed, delivering locally: {e}")
+            for event in events:
+                self._deliver_local(event)
         except Exception as e:
-            logger.error(f"EventBus: Failed to publish {event.event_type.value}: {e}")
-    
-    def _deliver_local(self, event: Event) -> None:
-        """Deliver event to in-process listeners"""
+            logger.error(f"EventBus: Failed to publish {len(events)} events: {e}")
+
+    def _deliver_local(self, event: Event, ack: Optional[Callable[[], None]] = None) -> None:
+        """Queue event for each in-process listener"""
         event_type = event.event_type
-        
-        if event_type not in self._listeners:
+        with self._lock:
+            subscriptions = list(self._listeners.get(event_type, ()))
+
+        if not subscriptions:
             logger.debug(f"EventBus: No listeners for {event_type.value}")
+            if ack is not None:
+                ack()
             return
-        
-        listeners = self._listeners[event_type].copy()  # Thread-safe copy
-        
-        for listener_id, listener in listeners:
+
+        tracker = _Ack(len(subscriptions), ack) if ack is not None else None
+        for subscription in subscriptions:
+            subscription.offer(_Delivery(event, tracker), self.put_timeout)
+
+    def _start_consumer(self) -> None:
+        with self._lock:
+            if self._consumer_thread is not None or not self.asynchronous:
+                return
+            self._consumer_thread = threading.Thread(
+                target=self._consume_streams, name="event-bus-streams", daemon=True
+            )
+            self._consumer_thread.start()
+
+    def _consume_streams(self) -> None:
+        """Deliver stream entries to local listeners until stopped"""
+        backoff = 1.0
+        while not self._stop.is_set():
             try:
-                listener(event)
+                entries = self._streams.read(DEFAULT_BATCH_SIZE, STREAM_BLOCK_MS)
+                backoff = 1.0
             except Exception as e:
-                logger.error(f"EventBus: Listener {listener_id} failed for {event_type.value}: {e}")
-    
-    def _deliver_redis(self, event: Event) -> None:
-        """Deliver event via Redis pub/sub"""
-        try:
-            channel = f"enterprise_events:{event.event_type.value}"
-            message = json.dumps(event.to_dict())
-            self._redis_client.publish(channel, message)
-            logger.debug(f"EventBus: Published {event.event_type.value} to Redis")
-        except Exception as e:
-            logger.error(f"EventBus: Redis publish failed for {event.event_type.value}: {e}")
-    
+                self._streams.metrics['errors'] += 1
+                logger.error(f"EventBus: Stream read failed: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            for stream, entry_id, event in entries:
+                self._deliver_local(event, ack=lambda s=stream, i=entry_id: self._streams.ack(s, i))
+
+    def poll_streams(self) -> int:
+        """Read and deliver one batch of stream entries (synchronous buses)"""
+        if self._streams is None:
+            return 0
+        entries = self._streams.read(DEFAULT_BATCH_SIZE, STREAM_BLOCK_MS)
+        for stream, entry_id, event in entries:
+            self._deliver_local(event, ack=lambda s=stream, i=entry_id: self._streams.ack(s, i))
+        return len(entries)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every queued event has been handled
+
+        Returns:
+            True if all listener queues drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                subscriptions = [s for subs in self._listeners.values() for s in subs]
+            if all(s.queue.unfinished_tasks == 0 for s in subscriptions):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop consuming streams, drain listener queues and stop workers"""
+        self._stop.set()
+        if self._consumer_thread is not None:
+            self._consumer_thread.join(timeout)
+        self.flush(timeout)
+        with self._lock:
+            subscriptions = [s for subs in self._listeners.values() for s in subs]
+        for subscription in subscriptions:
+            subscription.stop()
+        for subscription in subscriptions:
+            subscription.join(timeout)
+
     def create_event(self, event_type: EventType, source: str, user_id: str, 
                     session_id: str, data: Dict[str, Any], 
                     metadata: Optional[Dict[str, Any]] = None) -> Event:
@@ -241,23 +638,41 @@ class EventBus:
             for event_type, listeners in self._listeners.items()
         }
 
+    def get_listener_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-listener delivery counts, latency, queue depth and lag"""
+        with self._lock:
+            subscriptions = [s for subs in self._listeners.values() for s in subs]
+        return {s.listener_id: s.get_metrics() for s in subscriptions}
+
+    def get_stream_metrics(self) -> Optional[Dict[str, Any]]:
+        """Redis Streams publish/read/ack counts, or None without streams"""
+        if self._streams is None:
+            return None
+        return {**self._streams.metrics, 'group': self._streams.group,
+                'consumer': self._streams.consumer}
+
+
 # Global event bus instance
 _event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
 
 def get_event_bus(use_redis: bool = False) -> EventBus:
     """
     Get or create the global event bus instance
     
     Args:
-        use_redis: Enable Redis pub/sub for distributed events
+        use_redis: Enable Redis Streams for durable, distributed events
         
     Returns:
         EventBus instance
     """
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus(use_redis=use_redis)
-        logger.info("EventBus: Initialized global event bus")
+        with _event_bus_lock:
+            if _event_bus is None:
+                _event_bus = EventBus(use_redis=use_redis)
+                atexit.register(_event_bus.shutdown)
+                logger.info("EventBus: Initialized global event bus")
     return _event_bus
 
 def publish_event(event_type: EventType, source: str, user_id: str, 
@@ -276,4 +691,24 @@ def publish_event(event_type: EventType, source: str, user_id: str,
     """
     bus = get_event_bus()
     event = bus.create_event(event_type, source, user_id, session_id, data, metadata)
-    bus.publish(event)
\ No newline at end of file
+    bus.publish(event)
+
+def publish_events(event_type: EventType, source: str, user_id: str,
+                   session_id: str, data_items: List[Dict[str, Any]],
+                   metadata: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Convenience function to publish many events of one type, e.g. one per finding
+    
+    Args:
+        event_type: Type of events to publish
+        source: Source component/service
+        user_id: User ID
+        session_id: Session ID
+        data_items: Event data, one dict per event
+        metadata: Optional metadata shared by all events
+    """
+    bus = get_event_bus()
+    bus.publish_batch([
+        bus.create_event(event_type, source, user_id, session_id, data, metadata)
+        for data in data_items
+    ])
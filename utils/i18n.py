@@ -4,7 +4,7 @@ Provides multilingual support for the application UI.
 """
 import os
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import streamlit as st
 
 # Available languages
@@ -17,6 +17,36 @@ LANGUAGES = {
 _translations = {}
 _current_language = 'en'
 
+# Parsed translation files by path, reused across reruns until the file changes
+_file_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+def _read_translation_file(path: str) -> Dict[str, Any]:
+    """Parse a translation file, serving unchanged files from memory."""
+    mtime = os.path.getmtime(path)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _file_cache[path] = (mtime, data)
+    return data
+
+def get_language_translations(lang_code: str) -> Dict[str, Any]:
+    """
+    Translations of a language without changing the current language.
+    
+    Args:
+        lang_code: The language code (e.g., 'en', 'nl')
+        
+    Returns:
+        Dictionary of translation strings (empty if unavailable)
+    """
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    try:
+        return _read_translation_file(os.path.join(base_dir, 'translations', f'{lang_code}.json'))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
 def load_translations(lang_code: str) -> Dict[str, Any]:
     """
     Load translation strings for the specified language.
@@ -76,10 +106,9 @@ def load_translations(lang_code: str) -> Dict[str, Any]:
             _translations[lang_code] = {}
             return {}
     
-    # Load translations from file
+    # Load translations from file (parsed once per process while unchanged)
     try:
-        with open(translation_file, 'r', encoding='utf-8') as f:
-            _translations[lang_code] = json.load(f)
+        _translations[lang_code] = _read_translation_file(translation_file)
     except (json.JSONDecodeError, FileNotFoundError):
         _translations[lang_code] = {}
     
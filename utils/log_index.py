@@ -0,0 +1,409 @@
+"""
+DataGuardian Pro - Incremental Log Index
+
+Keeps a SQLite index of the JSON log files written by the centralized logger
+so the log dashboard does not re-read and re-parse every file on each refresh.
+
+- Files are tailed from the byte offset reached last time. Offsets are kept
+  per inode, so rotated backups (dataguardian_x.log.1 ...) are finished from
+  where the live file was left and nothing is read twice.
+- Records are stored with their hour ('YYYY-MM-DDTHH'); queries and retention
+  work on whole hours through the (file_category, hour) index.
+- An FTS5 trigram index over message and string fields answers substring
+  searches without scanning.
+- Error and scanner-performance counters per hour are updated as lines are
+  ingested; queries read the counters for whole hours and the records only
+  for the partial hour at the start of the window.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Plain logging: messages about the index must not be written into the files it indexes
+logger = logging.getLogger(__name__)
+
+LOG_FILE_PREFIX = "dataguardian_"
+ERROR_LEVELS = ('ERROR', 'CRITICAL')
+
+# Records older than this are pruned from the index (the dashboard shows up to a week)
+RETENTION_HOURS = int(os.environ.get("DG_LOG_INDEX_RETENTION_HOURS", str(14 * 24)))
+
+# Bytes read from a log file per pass, bounding memory on first indexing
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Leading bytes identifying a file, so a reused inode is not mistaken for a known file
+HEAD_BYTES = 256
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS log_files (
+        inode INTEGER PRIMARY KEY,
+        path TEXT NOT NULL,
+        head BLOB NOT NULL,
+        offset INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS log_records (
+        id INTEGER PRIMARY KEY,
+        hour TEXT NOT NULL,
+        ts TEXT NOT NULL,
+        file_category TEXT NOT NULL,
+        level TEXT NOT NULL,
+        category TEXT NOT NULL,
+        module TEXT NOT NULL,
+        scanner_type TEXT NOT NULL,
+        message TEXT NOT NULL,
+        fields TEXT NOT NULL,
+        entry TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_log_records_file_hour ON log_records(file_category, hour, ts);
+    CREATE INDEX IF NOT EXISTS idx_log_records_level_hour ON log_records(level, hour, ts);
+    CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(
+        message, fields, content='log_records', content_rowid='id', tokenize='trigram'
+    );
+    CREATE TABLE IF NOT EXISTS log_error_counts (
+        hour TEXT NOT NULL,
+        file_category TEXT NOT NULL,
+        category TEXT NOT NULL,
+        module TEXT NOT NULL,
+        scanner_type TEXT NOT NULL,
+        level TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (hour, file_category, category, module, scanner_type, level)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS log_scanner_counts (
+        hour TEXT NOT NULL,
+        file_category TEXT NOT NULL,
+        scanner_type TEXT NOT NULL,
+        completed INTEGER NOT NULL,
+        failed INTEGER NOT NULL,
+        execution_time REAL NOT NULL,
+        findings INTEGER NOT NULL,
+        PRIMARY KEY (hour, file_category, scanner_type)
+    ) WITHOUT ROWID;
+"""
+
+_INSERT_RECORD = """
+    INSERT INTO log_records
+    (hour, ts, file_category, level, category, module, scanner_type, message, fields, entry)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_ERROR_COUNT = """
+    INSERT INTO log_error_counts (hour, file_category, category, module, scanner_type, level, count)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO UPDATE SET count = count + excluded.count
+"""
+
+_UPSERT_SCANNER_COUNT = """
+    INSERT INTO log_scanner_counts
+    (hour, file_category, scanner_type, completed, failed, execution_time, findings)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO UPDATE SET
+        completed = completed + excluded.completed,
+        failed = failed + excluded.failed,
+        execution_time = execution_time + excluded.execution_time,
+        findings = findings + excluded.findings
+"""
+
+
+def _hour_key(when: datetime) -> str:
+    return when.strftime('%Y-%m-%dT%H')
+
+
+def _number(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _file_category(path: Path) -> Optional[str]:
+    """'scanner' for dataguardian_scanner.log and its rotated backups"""
+    name = path.name
+    if not name.startswith(LOG_FILE_PREFIX) or '.log' not in name:
+        return None
+    stem, _, suffix = name[len(LOG_FILE_PREFIX):].partition('.log')
+    if suffix and not (suffix.startswith('.') and suffix[1:].isdigit()):
+        return None
+    return stem
+
+
+def _rotation_order(path: Path) -> int:
+    """Oldest backup first, live file last"""
+    suffix = path.name.rpartition('.log')[2]
+    return -int(suffix[1:]) if suffix else 0
+
+
+def _scanner_outcome(message: str) -> Tuple[int, int]:
+    if 'Scan completed' in message:
+        return 1, 0
+    if 'Scan failed' in message:
+        return 0, 1
+    return 0, 0
+
+
+class LogIndex:
+    """SQLite index over the JSON log files in a directory"""
+
+    def __init__(self, logs_dir: str = "logs", db_path: Optional[str] = None):
+        self.logs_dir = Path(logs_dir)
+        self.logs_dir.mkdir(exist_ok=True)
+        self.db_path = db_path or os.environ.get("DG_LOG_INDEX_DB") or str(self.logs_dir / "log_index.db")
+        self._local = threading.local()
+        self._pruned_hour = None
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Index lines appended since the last refresh.
+
+        Returns:
+            Number of records added
+        """
+        files = self._log_files()
+        conn = self._conn()
+        added = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            known = {row[0]: row[1:] for row in conn.execute("SELECT inode, head, offset FROM log_files")}
+            seen = set()
+            for path in files:
+                try:
+                    added += self._ingest_file(conn, path, known, seen)
+                except OSError as e:
+                    # Rotated away between listing and opening; picked up next time
+                    logger.debug(f"Skipping log file {path}: {e}")
+            # A file rotated during this pass is seen again under its new name next time
+            for path in self._log_files():
+                try:
+                    seen.add(path.stat().st_ino)
+                except OSError:
+                    pass
+            stale = [(inode,) for inode in known if inode not in seen]
+            conn.executemany("DELETE FROM log_files WHERE inode = ?", stale)
+            self._prune(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def _log_files(self) -> List[Path]:
+        return sorted(
+            (path for path in self.logs_dir.glob(f"{LOG_FILE_PREFIX}*.log*") if _file_category(path)),
+            key=lambda path: (_file_category(path), _rotation_order(path))
+        )
+
+    def _ingest_file(self, conn: sqlite3.Connection, path: Path, known: Dict, seen: set) -> int:
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            inode = stat.st_ino
+            seen.add(inode)
+            head = f.read(HEAD_BYTES)
+            stored_head, offset = known.get(inode, (b'', 0))
+            if head[:len(stored_head)] != stored_head or stat.st_size < offset:
+                # Inode reused by a different file, or the file was truncated
+                offset = 0
+            if stat.st_size == offset:
+                self._save_offset(conn, inode, path, head, offset)
+                return 0
+
+            category = _file_category(path)
+            added = 0
+            f.seek(offset)
+            pending = b''
+            while True:
+                chunk = f.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                data = pending + chunk
+                end = data.rfind(b'\n') + 1
+                # Only complete lines; a line still being written is read next time
+                pending = data[end:]
+                if end:
+                    added += self._ingest_lines(conn, category, data[:end].decode('utf-8', 'replace').splitlines())
+                    offset += end
+            self._save_offset(conn, inode, path, head, offset)
+            return added
+
+    def _save_offset(self, conn: sqlite3.Connection, inode: int, path: Path, head: bytes, offset: int):
+        conn.execute(
+            "INSERT INTO log_files (inode, path, head, offset) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (inode) DO UPDATE SET path = excluded.path, head = excluded.head, offset = excluded.offset",
+            (inode, str(path), head, offset)
+        )
+
+    def _ingest_lines(self, conn: sqlite3.Connection, file_category: str, lines: Iterable[str]) -> int:
+        records = []
+        errors: Dict[tuple, int] = {}
+        scanners: Dict[tuple, list] = {}
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Non-JSON log lines (legacy format) are not indexed
+                continue
+            if not isinstance(entry, dict):
+                continue
+
+            ts = hour = ''
+            timestamp_str = entry.get('timestamp', '')
+            if timestamp_str:
+                try:
+                    log_time = datetime.fromisoformat(str(timestamp_str).replace('Z', '+00:00')).replace(tzinfo=None)
+                    ts, hour = log_time.isoformat(), _hour_key(log_time)
+                except ValueError:
+                    continue
+
+            level = str(entry.get('level', '')).upper()
+            message = str(entry.get('message', ''))
+            category = str(entry.get('category', 'unknown'))
+            module = str(entry.get('module', 'unknown'))
+            scanner_type = str(entry.get('scanner_type') or '')
+            fields = '\n'.join(value for key, value in entry.items() if key != 'message' and isinstance(value, str))
+            records.append((hour, ts, file_category, level, category, module, scanner_type, message, fields, line))
+
+            if level in ERROR_LEVELS:
+                key = (hour, file_category, category, module, scanner_type, level)
+                errors[key] = errors.get(key, 0) + 1
+            completed, failed = _scanner_outcome(message)
+            if scanner_type and (completed or failed):
+                counts = scanners.setdefault((hour, file_category, scanner_type), [0, 0, 0.0, 0])
+                counts[0] += completed
+                counts[1] += failed
+                if completed:
+                    counts[2] += _number(entry.get('execution_time', 0))
+                    counts[3] += int(_number(entry.get('results_count', 0)))
+
+        if not records:
+            return 0
+        first_id = (conn.execute("SELECT COALESCE(MAX(id), 0) FROM log_records").fetchone()[0]) + 1
+        conn.executemany(_INSERT_RECORD, records)
+        conn.execute("INSERT INTO log_fts (rowid, message, fields) "
+                     "SELECT id, message, fields FROM log_records WHERE id >= ?", (first_id,))
+        conn.executemany(_UPSERT_ERROR_COUNT, [key + (count,) for key, count in errors.items()])
+        conn.executemany(_UPSERT_SCANNER_COUNT, [key + tuple(counts) for key, counts in scanners.items()])
+        return len(records)
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Drop hours past retention (at most once per hour)"""
+        cutoff_hour = _hour_key(datetime.utcnow() - timedelta(hours=RETENTION_HOURS))
+        if self._pruned_hour == cutoff_hour:
+            return
+        self._pruned_hour = cutoff_hour
+        conn.execute("INSERT INTO log_fts (log_fts, rowid, message, fields) "
+                     "SELECT 'delete', id, message, fields FROM log_records WHERE hour != '' AND hour < ?",
+                     (cutoff_hour,))
+        conn.execute("DELETE FROM log_records WHERE hour != '' AND hour < ?", (cutoff_hour,))
+        conn.execute("DELETE FROM log_error_counts WHERE hour != '' AND hour < ?", (cutoff_hour,))
+        conn.execute("DELETE FROM log_scanner_counts WHERE hour != '' AND hour < ?", (cutoff_hour,))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _window(hours: int) -> Tuple[str, str]:
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        return cutoff.isoformat(), _hour_key(cutoff)
+
+    @staticmethod
+    def _partial_hour(cutoff: str, cutoff_hour: str) -> Tuple[str, list]:
+        """Records in the window not covered by whole-hour counters"""
+        # Records without a timestamp are never filtered out by time
+        return "((hour = ? AND ts >= ?) OR hour = '')", [cutoff_hour, cutoff]
+
+    def recent_entries(self, category: Optional[str] = None, hours: int = 24,
+                       levels: Optional[Iterable[str]] = None, query: Optional[str] = None,
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Parsed log entries in the window, newest first"""
+        cutoff, cutoff_hour = self._window(hours)
+        partial, params = self._partial_hour(cutoff, cutoff_hour)
+        clauses = [f"(hour > ? OR {partial})"]
+        params = [cutoff_hour] + params
+        if category:
+            clauses.append("file_category = ?")
+            params.append(category)
+        if levels:
+            levels = [level.upper() for level in levels]
+            clauses.append(f"level IN ({','.join('?' * len(levels))})")
+            params.extend(levels)
+        if query is not None:
+            if len(query) >= 3:
+                # Trigram phrase match is a case-insensitive substring match
+                clauses.append("id IN (SELECT rowid FROM log_fts WHERE log_fts MATCH ?)")
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                clauses.append("(message LIKE ? ESCAPE '\\' OR fields LIKE ? ESCAPE '\\')")
+                params.extend([f"%{escaped}%"] * 2)
+        sql = f"SELECT entry FROM log_records WHERE {' AND '.join(clauses)} ORDER BY ts DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self._conn().execute(sql, params)]
+
+    def error_counts(self, hours: int = 24) -> List[Tuple[str, str, str, str, int]]:
+        """(category, module, scanner_type, level, count) of errors in the window"""
+        cutoff, cutoff_hour = self._window(hours)
+        conn = self._conn()
+        rows = conn.execute("""
+            SELECT category, module, scanner_type, level, SUM(count) FROM log_error_counts
+            WHERE hour > ? GROUP BY 1, 2, 3, 4
+        """, (cutoff_hour,)).fetchall()
+        partial, params = self._partial_hour(cutoff, cutoff_hour)
+        rows += conn.execute(f"""
+            SELECT category, module, scanner_type, level, COUNT(*) FROM log_records
+            WHERE level IN ('ERROR', 'CRITICAL') AND {partial} GROUP BY 1, 2, 3, 4
+        """, params).fetchall()
+        return rows
+
+    def scanner_counts(self, category: str = 'scanner', hours: int = 24) -> Dict[str, List[float]]:
+        """scanner_type -> [completed, failed, execution_time, findings] in the window"""
+        cutoff, cutoff_hour = self._window(hours)
+        conn = self._conn()
+        totals: Dict[str, List[float]] = {}
+        for scanner_type, completed, failed, execution_time, findings in conn.execute("""
+            SELECT scanner_type, SUM(completed), SUM(failed), SUM(execution_time), SUM(findings)
+            FROM log_scanner_counts WHERE file_category = ? AND hour > ? GROUP BY 1
+        """, (category, cutoff_hour)):
+            totals[scanner_type] = [completed, failed, execution_time, findings]
+
+        # Partial first hour from the records
+        partial, params = self._partial_hour(cutoff, cutoff_hour)
+        for scanner_type, message, entry in conn.execute(f"""
+            SELECT scanner_type, message, entry FROM log_records
+            WHERE file_category = ? AND scanner_type != '' AND {partial}
+        """, [category] + params):
+            completed, failed = _scanner_outcome(message)
+            if not (completed or failed):
+                continue
+            counts = totals.setdefault(scanner_type, [0, 0, 0.0, 0])
+            counts[0] += completed
+            counts[1] += failed
+            if completed:
+                data = json.loads(entry)
+                counts[2] += _number(data.get('execution_time', 0))
+                counts[3] += int(_number(data.get('results_count', 0)))
+        return totals
@@ -10,143 +10,80 @@ import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict, Counter
+from collections import Counter
 import streamlit as st
 
+from utils.log_index import ERROR_LEVELS, LogIndex
+
 class LogAnalyzer:
     """Analyze and monitor DataGuardian Pro logs"""
     
     def __init__(self, logs_dir: str = "logs"):
         self.logs_dir = Path(logs_dir)
         self.logs_dir.mkdir(exist_ok=True)
+        self.index = LogIndex(str(self.logs_dir))
     
-    def get_recent_logs(self, category: str = None, hours: int = 24, level: str = None) -> List[Dict[str, Any]]:
-        """Get recent log entries with filtering"""
-        entries = []
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        # Determine which log files to read
-        if category:
-            log_files = [self.logs_dir / f"dataguardian_{category}.log"]
-        else:
-            log_files = list(self.logs_dir.glob("dataguardian_*.log"))
-        
-        for log_file in log_files:
-            if log_file.exists():
-                entries.extend(self._parse_log_file(log_file, cutoff_time, level))
-        
-        # Sort by timestamp descending
-        entries.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return entries
-    
-    def _parse_log_file(self, log_file: Path, cutoff_time: datetime, level_filter: str = None) -> List[Dict[str, Any]]:
-        """Parse a single log file"""
-        entries = []
-        
+    def _refresh(self):
+        """Index lines written since the last query (only new bytes are read)"""
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        entry = json.loads(line)
-                        
-                        # Parse timestamp
-                        timestamp_str = entry.get('timestamp', '')
-                        if timestamp_str:
-                            log_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                            if log_time.replace(tzinfo=None) < cutoff_time:
-                                continue
-                        
-                        # Filter by level if specified
-                        if level_filter and entry.get('level', '').upper() != level_filter.upper():
-                            continue
-                        
-                        entries.append(entry)
-                        
-                    except json.JSONDecodeError:
-                        # Handle non-JSON log lines (legacy format)
-                        continue
-                        
+            self.index.refresh()
         except Exception as e:
-            st.error(f"Error reading log file {log_file}: {e}")
-        
-        return entries
+            st.error(f"Error indexing log files in {self.logs_dir}: {e}")
+    
+    def get_recent_logs(self, category: str = None, hours: int = 24, level: str = None) -> List[Dict[str, Any]]:
+        """Get recent log entries with filtering"""
+        self._refresh()
+        return self.index.recent_entries(category=category, hours=hours, levels=[level] if level else None)
     
     def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get summary of errors in the specified time period"""
-        error_logs = self.get_recent_logs(hours=hours, level='ERROR')
-        critical_logs = self.get_recent_logs(hours=hours, level='CRITICAL')
-        
-        all_errors = error_logs + critical_logs
+        self._refresh()
         
-        # Categorize errors
-        error_categories = defaultdict(list)
-        scanner_errors = defaultdict(int)
+        # Counts come from the index's aggregates; only the latest errors are parsed
+        error_categories = Counter()
+        scanner_errors = Counter()
         module_errors = Counter()
-        
-        for error in all_errors:
-            category = error.get('category', 'unknown')
-            error_categories[category].append(error)
-            
-            if error.get('scanner_type'):
-                scanner_errors[error['scanner_type']] += 1
-            
-            module_errors[error.get('module', 'unknown')] += 1
+        level_errors = Counter()
+        for category, module, scanner_type, level, count in self.index.error_counts(hours):
+            error_categories[category] += count
+            if scanner_type:
+                scanner_errors[scanner_type] += count
+            module_errors[module] += count
+            level_errors[level] += count
         
         return {
-            'total_errors': len(all_errors),
+            'total_errors': sum(level_errors.values()),
             'error_categories': dict(error_categories),
             'scanner_errors': dict(scanner_errors),
             'module_errors': dict(module_errors),
-            'recent_errors': all_errors[:10]  # Last 10 errors
+            'level_errors': dict(level_errors),
+            'recent_errors': self.index.recent_entries(hours=hours, levels=ERROR_LEVELS, limit=10)
         }
     
     def get_scanner_performance(self, hours: int = 24) -> Dict[str, Any]:
         """Get scanner performance metrics"""
-        scanner_logs = self.get_recent_logs(category='scanner', hours=hours)
-        
-        performance_data = defaultdict(lambda: {
-            'total_scans': 0,
-            'successful_scans': 0,
-            'failed_scans': 0,
-            'avg_execution_time': 0,
-            'total_execution_time': 0,
-            'total_findings': 0
-        })
-        
-        for log in scanner_logs:
-            scanner_type = log.get('scanner_type')
-            if not scanner_type:
-                continue
-            
-            data = performance_data[scanner_type]
+        self._refresh()
+        performance_data = {}
+        
+        for scanner_type, (completed, failed, execution_time, findings) in self.index.scanner_counts('scanner', hours).items():
+            data = {
+                'total_scans': completed + failed,
+                'successful_scans': completed,
+                'failed_scans': failed,
+                'avg_execution_time': 0,
+                'total_execution_time': execution_time,
+                'total_findings': findings
+            }
             
-            if 'Scan completed' in log.get('message', ''):
-                data['successful_scans'] += 1
-                data['total_scans'] += 1
-                
-                exec_time = log.get('execution_time', 0)
-                data['total_execution_time'] += exec_time
-                
-                results_count = log.get('results_count', 0)
-                data['total_findings'] += results_count
-                
-            elif 'Scan failed' in log.get('message', ''):
-                data['failed_scans'] += 1
-                data['total_scans'] += 1
-        
-        # Calculate averages
-        for scanner, data in performance_data.items():
-            if data['successful_scans'] > 0:
-                data['avg_execution_time'] = data['total_execution_time'] / data['successful_scans']
-                data['success_rate'] = (data['successful_scans'] / data['total_scans']) * 100
+            # Calculate averages
+            if completed > 0:
+                data['avg_execution_time'] = execution_time / completed
+                data['success_rate'] = (completed / data['total_scans']) * 100
             else:
                 data['success_rate'] = 0
+            performance_data[scanner_type] = data
         
-        return dict(performance_data)
+        return performance_data
     
     def get_security_events(self, hours: int = 24) -> Dict[str, Any]:
         """Get security-related events"""
@@ -170,25 +107,9 @@ class LogAnalyzer:
         }
     
     def search_logs(self, query: str, category: str = None, hours: int = 24) -> List[Dict[str, Any]]:
-        """Search logs for specific content"""
-        logs = self.get_recent_logs(category=category, hours=hours)
-        
-        matching_logs = []
-        query_lower = query.lower()
-        
-        for log in logs:
-            # Search in message
-            if query_lower in log.get('message', '').lower():
-                matching_logs.append(log)
-                continue
-            
-            # Search in other fields
-            for key, value in log.items():
-                if isinstance(value, str) and query_lower in value.lower():
-                    matching_logs.append(log)
-                    break
-        
-        return matching_logs
+        """Search logs for specific content (case-insensitive, message or any text field)"""
+        self._refresh()
+        return self.index.recent_entries(category=category, hours=hours, query=query)
 
 class LogDashboard:
     """Streamlit dashboard for log monitoring"""
@@ -224,7 +145,7 @@ class LogDashboard:
         with col2:
             st.metric("Scanner Errors", sum(error_summary['scanner_errors'].values()))
         with col3:
-            st.metric("Critical Issues", len([e for e in error_summary['recent_errors'] if e.get('level') == 'CRITICAL']))
+            st.metric("Critical Issues", error_summary['level_errors'].get('CRITICAL', 0))
         
         if error_summary['recent_errors']:
             with st.expander("Recent Errors", expanded=True):
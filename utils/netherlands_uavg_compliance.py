@@ -5,10 +5,12 @@ Enhanced detection for Netherlands-specific GDPR implementation (UAVG)
 including AP Guidelines 2024-2025, BSN processing rules, and cookie consent validation.
 """
 
-import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 def detect_uavg_compliance_gaps(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Comprehensive Netherlands UAVG compliance detection addressing identified gaps.
@@ -32,34 +34,36 @@ def detect_uavg_compliance_gaps(content: str, metadata: Optional[Dict[str, Any]]
     
     return findings
 
+
+# AP 2024-2025 specific requirements
+AP_REQUIREMENTS = {
+    "ai_decision_making": r"\b(?:ai.*decision|automated.*decision|algorithmic.*decision|machine.*learning.*decision)\b",
+    "children_data_protection": r"\b(?:children.*data|minor.*data|under.*16|parental.*consent|child.*protection)\b",
+    "biometric_processing": r"\b(?:biometric.*process|fingerprint|facial.*recognition|iris.*scan|voice.*print)\b",
+    "health_data_special": r"\b(?:health.*data|medical.*data|patient.*data|healthcare.*information)\b",
+    "workplace_monitoring": r"\b(?:workplace.*monitor|employee.*surveillance|staff.*tracking|worker.*monitoring)\b",
+    "cookie_consent_2024": r"\b(?:cookie.*consent|tracking.*consent|analytics.*consent|marketing.*cookie)\b",
+    "data_minimization_principle": r"\b(?:data.*minimi|necessary.*data|proportional.*processing|excessive.*data)\b",
+    "purpose_limitation_strict": r"\b(?:purpose.*limitation|processing.*purpose|secondary.*use|function.*creep)\b"
+}
+
+# Check for AP-specific compliance indicators
+AP_COMPLIANCE_INDICATORS = [
+    r"\b(?:ap.*guideline|autoriteit.*persoonsgegevens|dutch.*dpa)\b",
+    r"\b(?:netherlands.*gdpr|uavg.*compliance|dutch.*privacy.*law)\b"
+]
+
+
 def _check_ap_guidelines_2024_2025(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Check compliance with latest Netherlands AP (Autoriteit Persoonsgegevens) guidelines."""
     findings = []
     
-    # AP 2024-2025 specific requirements
-    ap_requirements = {
-        "ai_decision_making": r"\b(?:ai.*decision|automated.*decision|algorithmic.*decision|machine.*learning.*decision)\b",
-        "children_data_protection": r"\b(?:children.*data|minor.*data|under.*16|parental.*consent|child.*protection)\b",
-        "biometric_processing": r"\b(?:biometric.*process|fingerprint|facial.*recognition|iris.*scan|voice.*print)\b",
-        "health_data_special": r"\b(?:health.*data|medical.*data|patient.*data|healthcare.*information)\b",
-        "workplace_monitoring": r"\b(?:workplace.*monitor|employee.*surveillance|staff.*tracking|worker.*monitoring)\b",
-        "cookie_consent_2024": r"\b(?:cookie.*consent|tracking.*consent|analytics.*consent|marketing.*cookie)\b",
-        "data_minimization_principle": r"\b(?:data.*minimi|necessary.*data|proportional.*processing|excessive.*data)\b",
-        "purpose_limitation_strict": r"\b(?:purpose.*limitation|processing.*purpose|secondary.*use|function.*creep)\b"
-    }
-    
     ap_violations = []
-    for requirement, pattern in ap_requirements.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for requirement, pattern in AP_REQUIREMENTS.items():
+        if _RULES.search(pattern, content):
             ap_violations.append(requirement)
     
-    # Check for AP-specific compliance indicators
-    ap_compliance_indicators = [
-        r"\b(?:ap.*guideline|autoriteit.*persoonsgegevens|dutch.*dpa)\b",
-        r"\b(?:netherlands.*gdpr|uavg.*compliance|dutch.*privacy.*law)\b"
-    ]
-    
-    has_ap_compliance = any(re.search(pattern, content, re.IGNORECASE) for pattern in ap_compliance_indicators)
+    has_ap_compliance = any(_RULES.search(pattern, content) for pattern in AP_COMPLIANCE_INDICATORS)
     
     if ap_violations and not has_ap_compliance:
         findings.append({
@@ -78,42 +82,44 @@ def _check_ap_guidelines_2024_2025(content: str, metadata: Optional[Dict[str, An
     
     return findings
 
+
+# BSN detection patterns (Dutch social security numbers)
+BSN_PATTERNS = [
+    r"\b(?:bsn|burgerservicenummer|social.*security.*number)\b",
+    r"\b\d{9}\b",  # 9-digit BSN format
+    r"\b(?:citizen.*service.*number|national.*id.*number)\b"
+]
+
+# BSN-specific use cases and restrictions
+BSN_USE_CASES = {
+    "government_services": r"\b(?:government.*service|public.*administration|municipal.*service|tax.*administration)\b",
+    "healthcare_providers": r"\b(?:healthcare.*provider|hospital|medical.*practice|gp.*practice)\b",
+    "educational_institutions": r"\b(?:school|university|educational.*institution|student.*administration)\b",
+    "financial_institutions": r"\b(?:bank|financial.*institution|insurance.*company|pension.*fund)\b",
+    "employment_services": r"\b(?:employment.*agency|hr.*department|payroll.*service|uwv)\b"
+}
+
+# Check for BSN protection measures
+BSN_PROTECTION_PATTERNS = [
+    r"\b(?:encrypted.*bsn|protected.*bsn|secured.*bsn|masked.*bsn)\b",
+    r"\b(?:bsn.*encryption|bsn.*protection|bsn.*security)\b"
+]
+
+
 def _check_enhanced_bsn_processing(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Enhanced validation for BSN (Burgerservicenummer) processing rules."""
     findings = []
     
-    # BSN detection patterns (Dutch social security numbers)
-    bsn_patterns = [
-        r"\b(?:bsn|burgerservicenummer|social.*security.*number)\b",
-        r"\b\d{9}\b",  # 9-digit BSN format
-        r"\b(?:citizen.*service.*number|national.*id.*number)\b"
-    ]
-    
-    # BSN-specific use cases and restrictions
-    bsn_use_cases = {
-        "government_services": r"\b(?:government.*service|public.*administration|municipal.*service|tax.*administration)\b",
-        "healthcare_providers": r"\b(?:healthcare.*provider|hospital|medical.*practice|gp.*practice)\b",
-        "educational_institutions": r"\b(?:school|university|educational.*institution|student.*administration)\b",
-        "financial_institutions": r"\b(?:bank|financial.*institution|insurance.*company|pension.*fund)\b",
-        "employment_services": r"\b(?:employment.*agency|hr.*department|payroll.*service|uwv)\b"
-    }
-    
-    has_bsn = any(re.search(pattern, content, re.IGNORECASE) for pattern in bsn_patterns)
+    has_bsn = any(_RULES.search(pattern, content) for pattern in BSN_PATTERNS)
     
     if has_bsn:
         # Check for legitimate BSN use cases
         legitimate_uses = []
-        for use_case, pattern in bsn_use_cases.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for use_case, pattern in BSN_USE_CASES.items():
+            if _RULES.search(pattern, content):
                 legitimate_uses.append(use_case)
         
-        # Check for BSN protection measures
-        bsn_protection_patterns = [
-            r"\b(?:encrypted.*bsn|protected.*bsn|secured.*bsn|masked.*bsn)\b",
-            r"\b(?:bsn.*encryption|bsn.*protection|bsn.*security)\b"
-        ]
-        
-        has_bsn_protection = any(re.search(pattern, content, re.IGNORECASE) for pattern in bsn_protection_patterns)
+        has_bsn_protection = any(_RULES.search(pattern, content) for pattern in BSN_PROTECTION_PATTERNS)
         
         if not legitimate_uses:
             findings.append({
@@ -143,41 +149,43 @@ def _check_enhanced_bsn_processing(content: str, metadata: Optional[Dict[str, An
     
     return findings
 
+
+# Cookie and tracking technology patterns
+COOKIE_PATTERNS = [
+    r"\b(?:cookie|tracking.*pixel|web.*beacon|local.*storage)\b",
+    r"\b(?:analytics|google.*analytics|facebook.*pixel|tracking.*code)\b",
+    r"\b(?:third.*party.*cookie|advertising.*cookie|marketing.*cookie)\b"
+]
+
+# Consent mechanisms
+CONSENT_PATTERNS = {
+    "explicit_consent": r"\b(?:explicit.*consent|clear.*consent|unambiguous.*consent)\b",
+    "opt_in_mechanism": r"\b(?:opt.*in|active.*choice|user.*choice|consent.*banner)\b",
+    "granular_consent": r"\b(?:granular.*consent|specific.*consent|category.*consent)\b",
+    "withdraw_consent": r"\b(?:withdraw.*consent|revoke.*consent|opt.*out|consent.*withdrawal)\b"
+}
+
+# Check for pre-ticked boxes (forbidden)
+DARK_PATTERNS = [
+    r"\b(?:pre.*ticked|pre.*selected|default.*accept|automatically.*accept)\b",
+    r"\b(?:nudging|dark.*pattern|deceptive.*design|misleading.*consent)\b"
+]
+
+
 def _check_real_time_cookie_consent(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Real-time cookie consent validation per Netherlands AP requirements."""
     findings = []
     
-    # Cookie and tracking technology patterns
-    cookie_patterns = [
-        r"\b(?:cookie|tracking.*pixel|web.*beacon|local.*storage)\b",
-        r"\b(?:analytics|google.*analytics|facebook.*pixel|tracking.*code)\b",
-        r"\b(?:third.*party.*cookie|advertising.*cookie|marketing.*cookie)\b"
-    ]
-    
-    # Consent mechanisms
-    consent_patterns = {
-        "explicit_consent": r"\b(?:explicit.*consent|clear.*consent|unambiguous.*consent)\b",
-        "opt_in_mechanism": r"\b(?:opt.*in|active.*choice|user.*choice|consent.*banner)\b",
-        "granular_consent": r"\b(?:granular.*consent|specific.*consent|category.*consent)\b",
-        "withdraw_consent": r"\b(?:withdraw.*consent|revoke.*consent|opt.*out|consent.*withdrawal)\b"
-    }
-    
-    has_cookies = any(re.search(pattern, content, re.IGNORECASE) for pattern in cookie_patterns)
+    has_cookies = any(_RULES.search(pattern, content) for pattern in COOKIE_PATTERNS)
     
     if has_cookies:
         # Check consent implementation
         consent_gaps = []
-        for consent_type, pattern in consent_patterns.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for consent_type, pattern in CONSENT_PATTERNS.items():
+            if not _RULES.search(pattern, content):
                 consent_gaps.append(consent_type)
         
-        # Check for pre-ticked boxes (forbidden)
-        dark_patterns = [
-            r"\b(?:pre.*ticked|pre.*selected|default.*accept|automatically.*accept)\b",
-            r"\b(?:nudging|dark.*pattern|deceptive.*design|misleading.*consent)\b"
-        ]
-        
-        has_dark_patterns = any(re.search(pattern, content, re.IGNORECASE) for pattern in dark_patterns)
+        has_dark_patterns = any(_RULES.search(pattern, content) for pattern in DARK_PATTERNS)
         
         if len(consent_gaps) >= 2:
             findings.append({
@@ -207,40 +215,42 @@ def _check_real_time_cookie_consent(content: str, metadata: Optional[Dict[str, A
     
     return findings
 
+
+# Data breach indicators
+BREACH_PATTERNS = [
+    r"\b(?:data.*breach|security.*incident|privacy.*breach|cyber.*attack)\b",
+    r"\b(?:unauthorized.*access|data.*leak|system.*compromise|hacking.*incident)\b"
+]
+
+# Notification timeline patterns
+TIMELINE_PATTERNS = {
+    "72_hour_notification": r"\b(?:72.*hour|three.*day|ap.*notification|supervisory.*authority)\b",
+    "breach_register": r"\b(?:breach.*register|incident.*log|breach.*documentation)\b",
+    "impact_assessment": r"\b(?:impact.*assessment|risk.*evaluation|breach.*analysis)\b",
+    "data_subject_notification": r"\b(?:data.*subject.*notification|individual.*notification|person.*affected)\b"
+}
+
+# Check for automated notification systems
+AUTOMATION_PATTERNS = [
+    r"\b(?:automated.*notification|automatic.*breach.*reporting|incident.*response.*system)\b",
+    r"\b(?:breach.*detection.*system|monitoring.*system|alert.*system)\b"
+]
+
+
 def _check_breach_notification_timeline(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """72-hour timeline validation for data breach notifications."""
     findings = []
     
-    # Data breach indicators
-    breach_patterns = [
-        r"\b(?:data.*breach|security.*incident|privacy.*breach|cyber.*attack)\b",
-        r"\b(?:unauthorized.*access|data.*leak|system.*compromise|hacking.*incident)\b"
-    ]
-    
-    # Notification timeline patterns
-    timeline_patterns = {
-        "72_hour_notification": r"\b(?:72.*hour|three.*day|ap.*notification|supervisory.*authority)\b",
-        "breach_register": r"\b(?:breach.*register|incident.*log|breach.*documentation)\b",
-        "impact_assessment": r"\b(?:impact.*assessment|risk.*evaluation|breach.*analysis)\b",
-        "data_subject_notification": r"\b(?:data.*subject.*notification|individual.*notification|person.*affected)\b"
-    }
-    
-    has_breach_reference = any(re.search(pattern, content, re.IGNORECASE) for pattern in breach_patterns)
+    has_breach_reference = any(_RULES.search(pattern, content) for pattern in BREACH_PATTERNS)
     
     if has_breach_reference:
         # Check notification procedures
         missing_procedures = []
-        for procedure, pattern in timeline_patterns.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+        for procedure, pattern in TIMELINE_PATTERNS.items():
+            if not _RULES.search(pattern, content):
                 missing_procedures.append(procedure)
         
-        # Check for automated notification systems
-        automation_patterns = [
-            r"\b(?:automated.*notification|automatic.*breach.*reporting|incident.*response.*system)\b",
-            r"\b(?:breach.*detection.*system|monitoring.*system|alert.*system)\b"
-        ]
-        
-        has_automation = any(re.search(pattern, content, re.IGNORECASE) for pattern in automation_patterns)
+        has_automation = any(_RULES.search(pattern, content) for pattern in AUTOMATION_PATTERNS)
         
         if len(missing_procedures) >= 2:
             findings.append({
@@ -272,37 +282,42 @@ def _check_breach_notification_timeline(content: str, metadata: Optional[Dict[st
     
     return findings
 
+
+# Netherlands-specific privacy laws
+DUTCH_PRIVACY_LAWS = {
+    "telecommunications_act": r"\b(?:telecommunicatiewet|telecommunications.*act|telecom.*law)\b",
+    "electronic_communications": r"\b(?:electronic.*communication|e.*communication|digital.*communication)\b",
+    "consumer_protection": r"\b(?:consumer.*protection|consumentenbescherming|acm.*guidelines)\b",
+    "media_law": r"\b(?:media.*law|mediawet|broadcasting.*law)\b"
+}
+
+# Dutch language requirements
+DUTCH_LANGUAGE_PATTERNS = [
+    r"\b(?:privacyverklaring|privacybeleid|gegevensbescherming|toestemming)\b",
+    r"\b(?:persoonsgegevens|verwerkingsverantwoordelijke|betroffene)\b"
+]
+
+# Data residency requirements
+DATA_RESIDENCY_PATTERNS = [
+    r"\b(?:data.*residency|eu.*hosting|netherlands.*hosting|european.*server)\b",
+    r"\b(?:data.*sovereignty|local.*storage|eu.*cloud|dutch.*datacenter)\b"
+]
+
+# Personal data that data residency applies to
+RESIDENCY_DATA_PATTERN = r"\b(?:personal.*data|sensitive.*data|eu.*citizen)\b"
+
+
 def _check_netherlands_privacy_requirements(content: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Check Netherlands-specific privacy law requirements beyond GDPR."""
     findings = []
     
-    # Netherlands-specific privacy laws
-    dutch_privacy_laws = {
-        "telecommunications_act": r"\b(?:telecommunicatiewet|telecommunications.*act|telecom.*law)\b",
-        "electronic_communications": r"\b(?:electronic.*communication|e.*communication|digital.*communication)\b",
-        "consumer_protection": r"\b(?:consumer.*protection|consumentenbescherming|acm.*guidelines)\b",
-        "media_law": r"\b(?:media.*law|mediawet|broadcasting.*law)\b"
-    }
-    
-    # Dutch language requirements
-    dutch_language_patterns = [
-        r"\b(?:privacyverklaring|privacybeleid|gegevensbescherming|toestemming)\b",
-        r"\b(?:persoonsgegevens|verwerkingsverantwoordelijke|betroffene)\b"
-    ]
-    
-    # Data residency requirements
-    data_residency_patterns = [
-        r"\b(?:data.*residency|eu.*hosting|netherlands.*hosting|european.*server)\b",
-        r"\b(?:data.*sovereignty|local.*storage|eu.*cloud|dutch.*datacenter)\b"
-    ]
-    
     applicable_laws = []
-    for law, pattern in dutch_privacy_laws.items():
-        if re.search(pattern, content, re.IGNORECASE):
+    for law, pattern in DUTCH_PRIVACY_LAWS.items():
+        if _RULES.search(pattern, content):
             applicable_laws.append(law)
     
-    has_dutch_language = any(re.search(pattern, content, re.IGNORECASE) for pattern in dutch_language_patterns)
-    has_data_residency = any(re.search(pattern, content, re.IGNORECASE) for pattern in data_residency_patterns)
+    has_dutch_language = any(_RULES.search(pattern, content) for pattern in DUTCH_LANGUAGE_PATTERNS)
+    has_data_residency = any(_RULES.search(pattern, content) for pattern in DATA_RESIDENCY_PATTERNS)
     
     if applicable_laws and not has_dutch_language:
         findings.append({
@@ -316,7 +331,7 @@ def _check_netherlands_privacy_requirements(content: str, metadata: Optional[Dic
             'recommendation': 'Provide privacy notices in Dutch for Netherlands consumers'
         })
     
-    if not has_data_residency and re.search(r'\b(?:personal.*data|sensitive.*data|eu.*citizen)\b', content, re.IGNORECASE):
+    if not has_data_residency and _RULES.search(RESIDENCY_DATA_PATTERN, content):
         findings.append({
             'type': 'UAVG_DATA_RESIDENCY_CONCERN',
             'category': 'Netherlands Privacy Requirements',
@@ -328,4 +343,12 @@ def _check_netherlands_privacy_requirements(content: str, metadata: Optional[Dic
             'recommendation': 'Consider explicitly stating EU/Netherlands data residency'
         })
     
-    return findings
\ No newline at end of file
+    return findings
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    AP_REQUIREMENTS, AP_COMPLIANCE_INDICATORS, BSN_PATTERNS, BSN_USE_CASES, BSN_PROTECTION_PATTERNS,
+    COOKIE_PATTERNS, CONSENT_PATTERNS, DARK_PATTERNS, BREACH_PATTERNS, TIMELINE_PATTERNS, AUTOMATION_PATTERNS,
+    DUTCH_PRIVACY_LAWS, DUTCH_LANGUAGE_PATTERNS, DATA_RESIDENCY_PATTERNS, RESIDENCY_DATA_PATTERN,
+)
@@ -3,13 +3,15 @@ Privacy-Enhancing Technology Validation
 Detects and validates privacy-preserving techniques in AI systems
 """
 
-import re
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
 class PETType(Enum):
     """Privacy-enhancing technology types"""
     FEDERATED_LEARNING = "federated_learning"
@@ -38,6 +40,138 @@ class PETValidationResult:
     recommendations: List[str]
     regulatory_impact: Dict[str, str]
 
+
+# Detection patterns for privacy-enhancing technologies
+PET_PATTERNS = {
+    "federated_learning": {
+        "detection_patterns": [
+            r"\b(?:federated\s+learning|fl\s+training|distributed\s+training)\b",
+            r"\b(?:client.*server|parameter\s+aggregation|model\s+aggregation)\b",
+            r"\b(?:flower|tensorflow.*federated|fed.*avg|federated.*averaging)\b",
+            r"\b(?:local\s+training|on.*device\s+training|edge\s+learning)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:secure\s+aggregation|differential\s+privacy|client\s+selection)\b",
+            r"\b(?:communication\s+rounds|federated\s+optimization)\b",
+            r"\b(?:horizontal\s+federated|vertical\s+federated)\b"
+        ],
+        "quality_indicators": [
+            r"\b(?:privacy\s+budget|epsilon.*delta|noise\s+addition)\b",
+            r"\b(?:byzantine\s+robust|poisoning\s+defense)\b",
+            r"\b(?:convergence\s+guarantee|theoretical\s+analysis)\b"
+        ]
+    },
+    "differential_privacy": {
+        "detection_patterns": [
+            r"\b(?:differential\s+privacy|dp\s+mechanism|epsilon.*delta)\b",
+            r"\b(?:laplace\s+noise|gaussian\s+noise|privacy\s+budget)\b",
+            r"\b(?:global\s+sensitivity|local\s+sensitivity)\b",
+            r"\b(?:composition\s+theorem|privacy\s+accountant)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:noise\s+addition|randomized\s+response|exponential\s+mechanism)\b",
+            r"\b(?:private\s+aggregation|histogram\s+release)\b",
+            r"\b(?:renyi\s+dp|concentrated\s+dp|approximate\s+dp)\b"
+        ],
+        "quality_indicators": [
+            r"epsilon\s*[=<>]\s*\d+\.?\d*",  # Epsilon values
+            r"delta\s*[=<>]\s*\d+\.?\d*",    # Delta values
+            r"\b(?:formal\s+privacy\s+proof|privacy\s+analysis)\b"
+        ]
+    },
+    "synthetic_data": {
+        "detection_patterns": [
+            r"\b(?:synthetic\s+data|data\s+synthesis|artificial\s+data)\b",
+            r"\b(?:gan\s+training|variational\s+autoencoder|vae)\b",
+            r"\b(?:data\s+generation|generative\s+model)\b",
+            r"\b(?:synthetic\s+dataset|simulated\s+data)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:tabular\s+gan|ctgan|copulagan|pategan)\b",
+            r"\b(?:privacy\s+preserving\s+gan|dp.*gan)\b",
+            r"\b(?:conditional\s+generation|attribute\s+preservation)\b"
+        ],
+        "quality_indicators": [
+            r"\b(?:utility\s+preservation|statistical\s+fidelity)\b",
+            r"\b(?:membership\s+inference|privacy\s+attack)\b",
+            r"\b(?:synthetic\s+validation|realism\s+test)\b"
+        ]
+    },
+    "homomorphic_encryption": {
+        "detection_patterns": [
+            r"\b(?:homomorphic\s+encryption|he\s+scheme|fhe)\b",
+            r"\b(?:fully\s+homomorphic|somewhat\s+homomorphic|partial\s+homomorphic)\b",
+            r"\b(?:encrypted\s+computation|secure\s+computation)\b",
+            r"\b(?:seal|helib|palisade|concrete)\b"  # HE libraries
+        ],
+        "implementation_indicators": [
+            r"\b(?:bootstrapping|noise\s+management|parameter\s+selection)\b",
+            r"\b(?:bgv|bfv|ckks|tfhe)\s+scheme\b",
+            r"\b(?:ciphertext\s+operations|encrypted\s+inference)\b"
+        ],
+        "quality_indicators": [
+            r"\b(?:security\s+parameter|multiplicative\s+depth)\b",
+            r"\b(?:performance\s+optimization|batching\s+technique)\b",
+            r"\b(?:correctness\s+proof|security\s+analysis)\b"
+        ]
+    },
+    "secure_multiparty": {
+        "detection_patterns": [
+            r"\b(?:secure\s+multiparty|mpc|multi.*party\s+computation)\b",
+            r"\b(?:secret\s+sharing|garbled\s+circuits)\b",
+            r"\b(?:oblivious\s+transfer|private\s+set\s+intersection)\b",
+            r"\b(?:shamir\s+secret|additive\s+sharing)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:honest\s+majority|dishonest\s+majority)\b",
+            r"\b(?:semi.*honest|malicious\s+adversary)\b",
+            r"\b(?:communication\s+rounds|circuit\s+evaluation)\b"
+        ],
+        "quality_indicators": [
+            r"\b(?:security\s+proof|privacy\s+guarantee)\b",
+            r"\b(?:protocol\s+efficiency|round\s+complexity)\b",
+            r"\b(?:fault\s+tolerance|robustness\s+analysis)\b"
+        ]
+    },
+    "anonymization": {
+        "detection_patterns": [
+            r"\b(?:anonymization|k.*anonymity|l.*diversity)\b",
+            r"\b(?:t.*closeness|m.*invariance|personalization)\b",
+            r"\b(?:quasi.*identifier|sensitive\s+attribute)\b",
+            r"\b(?:generalization|suppression|perturbation)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:hierarchy\s+tree|taxonomy\s+tree)\b",
+            r"\b(?:equivalence\s+class|anonymity\s+group)\b",
+            r"\b(?:information\s+loss|utility\s+metric)\b"
+        ],
+        "quality_indicators": [
+            r"k\s*[=<>]\s*\d+",  # k-anonymity values
+            r"l\s*[=<>]\s*\d+",  # l-diversity values  
+            r"\b(?:re.*identification\s+risk|linkage\s+attack)\b"
+        ]
+    },
+    "pseudonymization": {
+        "detection_patterns": [
+            r"\b(?:pseudonymization|pseudonym|tokenization)\b",
+            r"\b(?:hash\s+function|cryptographic\s+hash)\b",
+            r"\b(?:identifier\s+replacement|data\s+masking)\b",
+            r"\b(?:reversible\s+pseudonym|irreversible\s+pseudonym)\b"
+        ],
+        "implementation_indicators": [
+            r"\b(?:salt\s+value|key\s+management|deterministic\s+hash)\b",
+            r"\b(?:format\s+preserving|referential\s+integrity)\b",
+            r"\b(?:lookup\s+table|mapping\s+function)\b"
+        ],
+        "quality_indicators": [
+            r"\b(?:collision\s+resistance|preimage\s+resistance)\b",
+            r"\b(?:key\s+rotation|cryptographic\s+strength)\b",
+            r"\b(?:unlinkability|untraceability)\b"
+        ]
+    }
+}
+
+
 class PrivacyEnhancingTechValidator:
     """
     Validates privacy-enhancing technologies in AI systems
@@ -46,140 +180,9 @@ class PrivacyEnhancingTechValidator:
     
     def __init__(self, region: str = "Netherlands"):
         self.region = region
-        self.pet_patterns = self._load_pet_patterns()
+        self.pet_patterns = PET_PATTERNS
         self.compliance_rules = self._load_compliance_rules()
         
-    def _load_pet_patterns(self) -> Dict[str, Any]:
-        """Load detection patterns for privacy-enhancing technologies"""
-        return {
-            "federated_learning": {
-                "detection_patterns": [
-                    r"\b(?:federated\s+learning|fl\s+training|distributed\s+training)\b",
-                    r"\b(?:client.*server|parameter\s+aggregation|model\s+aggregation)\b",
-                    r"\b(?:flower|tensorflow.*federated|fed.*avg|federated.*averaging)\b",
-                    r"\b(?:local\s+training|on.*device\s+training|edge\s+learning)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:secure\s+aggregation|differential\s+privacy|client\s+selection)\b",
-                    r"\b(?:communication\s+rounds|federated\s+optimization)\b",
-                    r"\b(?:horizontal\s+federated|vertical\s+federated)\b"
-                ],
-                "quality_indicators": [
-                    r"\b(?:privacy\s+budget|epsilon.*delta|noise\s+addition)\b",
-                    r"\b(?:byzantine\s+robust|poisoning\s+defense)\b",
-                    r"\b(?:convergence\s+guarantee|theoretical\s+analysis)\b"
-                ]
-            },
-            "differential_privacy": {
-                "detection_patterns": [
-                    r"\b(?:differential\s+privacy|dp\s+mechanism|epsilon.*delta)\b",
-                    r"\b(?:laplace\s+noise|gaussian\s+noise|privacy\s+budget)\b",
-                    r"\b(?:global\s+sensitivity|local\s+sensitivity)\b",
-                    r"\b(?:composition\s+theorem|privacy\s+accountant)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:noise\s+addition|randomized\s+response|exponential\s+mechanism)\b",
-                    r"\b(?:private\s+aggregation|histogram\s+release)\b",
-                    r"\b(?:renyi\s+dp|concentrated\s+dp|approximate\s+dp)\b"
-                ],
-                "quality_indicators": [
-                    r"epsilon\s*[=<>]\s*\d+\.?\d*",  # Epsilon values
-                    r"delta\s*[=<>]\s*\d+\.?\d*",    # Delta values
-                    r"\b(?:formal\s+privacy\s+proof|privacy\s+analysis)\b"
-                ]
-            },
-            "synthetic_data": {
-                "detection_patterns": [
-                    r"\b(?:synthetic\s+data|data\s+synthesis|artificial\s+data)\b",
-                    r"\b(?:gan\s+training|variational\s+autoencoder|vae)\b",
-                    r"\b(?:data\s+generation|generative\s+model)\b",
-                    r"\b(?:synthetic\s+dataset|simulated\s+data)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:tabular\s+gan|ctgan|copulagan|pategan)\b",
-                    r"\b(?:privacy\s+preserving\s+gan|dp.*gan)\b",
-                    r"\b(?:conditional\s+generation|attribute\s+preservation)\b"
-                ],
-                "quality_indicators": [
-                    r"\b(?:utility\s+preservation|statistical\s+fidelity)\b",
-                    r"\b(?:membership\s+inference|privacy\s+attack)\b",
-                    r"\b(?:synthetic\s+validation|realism\s+test)\b"
-                ]
-            },
-            "homomorphic_encryption": {
-                "detection_patterns": [
-                    r"\b(?:homomorphic\s+encryption|he\s+scheme|fhe)\b",
-                    r"\b(?:fully\s+homomorphic|somewhat\s+homomorphic|partial\s+homomorphic)\b",
-                    r"\b(?:encrypted\s+computation|secure\s+computation)\b",
-                    r"\b(?:seal|helib|palisade|concrete)\b"  # HE libraries
-                ],
-                "implementation_indicators": [
-                    r"\b(?:bootstrapping|noise\s+management|parameter\s+selection)\b",
-                    r"\b(?:bgv|bfv|ckks|tfhe)\s+scheme\b",
-                    r"\b(?:ciphertext\s+operations|encrypted\s+inference)\b"
-                ],
-                "quality_indicators": [
-                    r"\b(?:security\s+parameter|multiplicative\s+depth)\b",
-                    r"\b(?:performance\s+optimization|batching\s+technique)\b",
-                    r"\b(?:correctness\s+proof|security\s+analysis)\b"
-                ]
-            },
-            "secure_multiparty": {
-                "detection_patterns": [
-                    r"\b(?:secure\s+multiparty|mpc|multi.*party\s+computation)\b",
-                    r"\b(?:secret\s+sharing|garbled\s+circuits)\b",
-                    r"\b(?:oblivious\s+transfer|private\s+set\s+intersection)\b",
-                    r"\b(?:shamir\s+secret|additive\s+sharing)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:honest\s+majority|dishonest\s+majority)\b",
-                    r"\b(?:semi.*honest|malicious\s+adversary)\b",
-                    r"\b(?:communication\s+rounds|circuit\s+evaluation)\b"
-                ],
-                "quality_indicators": [
-                    r"\b(?:security\s+proof|privacy\s+guarantee)\b",
-                    r"\b(?:protocol\s+efficiency|round\s+complexity)\b",
-                    r"\b(?:fault\s+tolerance|robustness\s+analysis)\b"
-                ]
-            },
-            "anonymization": {
-                "detection_patterns": [
-                    r"\b(?:anonymization|k.*anonymity|l.*diversity)\b",
-                    r"\b(?:t.*closeness|m.*invariance|personalization)\b",
-                    r"\b(?:quasi.*identifier|sensitive\s+attribute)\b",
-                    r"\b(?:generalization|suppression|perturbation)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:hierarchy\s+tree|taxonomy\s+tree)\b",
-                    r"\b(?:equivalence\s+class|anonymity\s+group)\b",
-                    r"\b(?:information\s+loss|utility\s+metric)\b"
-                ],
-                "quality_indicators": [
-                    r"k\s*[=<>]\s*\d+",  # k-anonymity values
-                    r"l\s*[=<>]\s*\d+",  # l-diversity values  
-                    r"\b(?:re.*identification\s+risk|linkage\s+attack)\b"
-                ]
-            },
-            "pseudonymization": {
-                "detection_patterns": [
-                    r"\b(?:pseudonymization|pseudonym|tokenization)\b",
-                    r"\b(?:hash\s+function|cryptographic\s+hash)\b",
-                    r"\b(?:identifier\s+replacement|data\s+masking)\b",
-                    r"\b(?:reversible\s+pseudonym|irreversible\s+pseudonym)\b"
-                ],
-                "implementation_indicators": [
-                    r"\b(?:salt\s+value|key\s+management|deterministic\s+hash)\b",
-                    r"\b(?:format\s+preserving|referential\s+integrity)\b",
-                    r"\b(?:lookup\s+table|mapping\s+function)\b"
-                ],
-                "quality_indicators": [
-                    r"\b(?:collision\s+resistance|preimage\s+resistance)\b",
-                    r"\b(?:key\s+rotation|cryptographic\s+strength)\b",
-                    r"\b(?:unlinkability|untraceability)\b"
-                ]
-            }
-        }
-    
     def _load_compliance_rules(self) -> Dict[str, Any]:
         """Load compliance rules for PET implementations"""
         return {
@@ -298,7 +301,7 @@ class PrivacyEnhancingTechValidator:
         
         # Need at least one detection pattern match
         for pattern in detection_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content):
                 return True
         
         return False
@@ -315,7 +318,7 @@ class PrivacyEnhancingTechValidator:
         # Check implementation indicators (40% of score)
         impl_matches = 0
         for pattern in implementation_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content):
                 impl_matches += 1
         
         impl_score = min(40, (impl_matches / len(implementation_patterns)) * 40) if implementation_patterns else 20
@@ -323,7 +326,7 @@ class PrivacyEnhancingTechValidator:
         # Check quality indicators (60% of score)
         quality_matches = 0
         for pattern in quality_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if _RULES.search(pattern, content):
                 quality_matches += 1
                 findings.append({
                     'type': 'QUALITY_INDICATOR',
@@ -550,4 +553,11 @@ class PrivacyEnhancingTechValidator:
                 for r in validation_results
             ],
             'timestamp': datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    PET_PATTERNS,
+    fields=('detection_patterns', 'implementation_indicators', 'quality_indicators'),
+)
@@ -5,11 +5,156 @@ Implements continuous compliance checking, automated DPIA triggering,
 DPO requirements assessment, and cross-border transfer validation.
 """
 
-import re
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
+from utils.rule_engine import get_rule_engine
+_RULES = get_rule_engine()
+
+
+# AI system lifecycle monitoring
+AI_LIFECYCLE_PATTERNS = {
+    "development_phase": r"\b(?:ai.*development|model.*training|algorithm.*design|system.*development)\b",
+    "testing_phase": r"\b(?:ai.*testing|model.*validation|system.*testing|performance.*testing)\b",
+    "deployment_phase": r"\b(?:ai.*deployment|model.*deployment|production.*deployment|system.*launch)\b",
+    "monitoring_phase": r"\b(?:ai.*monitoring|model.*monitoring|performance.*monitoring|system.*monitoring)\b",
+    "maintenance_phase": r"\b(?:ai.*maintenance|model.*maintenance|system.*updates|continuous.*improvement)\b"
+}
+
+# Continuous risk assessment patterns
+RISK_INDICATORS = {
+    "high_risk_changes": r"\b(?:model.*update|algorithm.*change|data.*change|system.*modification)\b",
+    "performance_degradation": r"\b(?:performance.*degradation|accuracy.*drop|bias.*increase|error.*rate.*increase)\b",
+    "new_use_cases": r"\b(?:new.*use.*case|expanded.*functionality|additional.*purpose|scope.*change)\b",
+    "user_feedback": r"\b(?:user.*feedback|complaint|incident.*report|issue.*report)\b"
+}
+
+# Enhanced DPIA triggering algorithm
+DPIA_RISK_FACTORS = {
+    "automated_decision_making": {
+        "pattern": r"\b(?:automated.*decision|algorithmic.*decision|ai.*decision|machine.*decision)\b",
+        "weight": 25,
+        "description": "Automated decision-making detected"
+    },
+    "large_scale_processing": {
+        "pattern": r"\b(?:large.*scale|mass.*processing|bulk.*data|millions.*records|thousands.*users)\b",
+        "weight": 20,
+        "description": "Large-scale processing detected"
+    },
+    "special_categories": {
+        "pattern": r"\b(?:health.*data|biometric.*data|genetic.*data|racial.*data|political.*opinion)\b",
+        "weight": 30,
+        "description": "Special categories of personal data detected"
+    },
+    "systematic_monitoring": {
+        "pattern": r"\b(?:systematic.*monitoring|surveillance|tracking|behavioral.*analysis)\b",
+        "weight": 25,
+        "description": "Systematic monitoring detected"
+    },
+    "vulnerable_subjects": {
+        "pattern": r"\b(?:children|minors|elderly|disabled|vulnerable.*individuals)\b",
+        "weight": 20,
+        "description": "Vulnerable data subjects detected"
+    },
+    "innovative_technology": {
+        "pattern": r"\b(?:ai|machine.*learning|deep.*learning|neural.*network|innovative.*technology)\b",
+        "weight": 15,
+        "description": "Innovative technology detected"
+    },
+    "public_area_monitoring": {
+        "pattern": r"\b(?:cctv|video.*surveillance|facial.*recognition|public.*monitoring)\b",
+        "weight": 25,
+        "description": "Public area monitoring detected"
+    },
+    "cross_border_processing": {
+        "pattern": r"\b(?:cross.*border|international.*transfer|third.*country)\b",
+        "weight": 15,
+        "description": "Cross-border data processing detected"
+    }
+}
+
+# Check for existing DPIA
+EXISTING_DPIA_PATTERNS = [
+    r"\b(?:dpia|data.*protection.*impact.*assessment|privacy.*impact.*assessment)\b",
+    r"\b(?:impact.*assessment.*completed|dpia.*conducted|privacy.*assessment.*done)\b"
+]
+
+# DPO requirement scoring system
+DPO_CRITERIA = {
+    "public_authority": {
+        "pattern": r"\b(?:public.*authority|government.*body|municipal.*authority|state.*agency)\b",
+        "score": 100,
+        "mandatory": True,
+        "description": "Public authority - DPO mandatory"
+    },
+    "large_scale_monitoring": {
+        "pattern": r"\b(?:large.*scale.*monitoring|systematic.*monitoring|mass.*surveillance)\b",
+        "score": 100,
+        "mandatory": True,
+        "description": "Large-scale systematic monitoring - DPO mandatory"
+    },
+    "special_categories_core": {
+        "pattern": r"\b(?:core.*activit.*special|primary.*business.*sensitive|main.*operation.*health)\b",
+        "score": 100,
+        "mandatory": True,
+        "description": "Core activities involve special categories - DPO mandatory"
+    },
+    "employee_count_large": {
+        "pattern": r"\b(?:250.*employ|500.*employ|1000.*employ|large.*organization|enterprise)\b",
+        "score": 80,
+        "mandatory": False,
+        "description": "Large organization - DPO recommended"
+    },
+    "international_operations": {
+        "pattern": r"\b(?:international.*operation|multinational|global.*company|cross.*border.*business)\b",
+        "score": 60,
+        "mandatory": False,
+        "description": "International operations - DPO beneficial"
+    },
+    "complex_processing": {
+        "pattern": r"\b(?:complex.*processing|multiple.*data.*sources|advanced.*analytics)\b",
+        "score": 40,
+        "mandatory": False,
+        "description": "Complex processing operations"
+    }
+}
+
+# Check for existing DPO
+EXISTING_DPO_PATTERNS = [
+    r"\b(?:data.*protection.*officer|dpo.*appointed|privacy.*officer|dpo.*contact)\b",
+    r"\b(?:dpo@|privacy@|dataprotection@)\b"
+]
+
+# Transfer detection patterns
+TRANSFER_PATTERNS = {
+    "cloud_providers": r"\b(?:aws|azure|google.*cloud|oracle.*cloud|alibaba.*cloud|tencent.*cloud)\b",
+    "third_countries": r"\b(?:united.*states|usa|china|india|brazil|russia|australia|singapore)\b",
+    "data_processing": r"\b(?:data.*processing|server.*location|data.*center|hosting.*location)\b"
+}
+
+# Safeguards detection
+SAFEGUARD_PATTERNS = {
+    "adequacy_decision": r"\b(?:adequacy.*decision|adequate.*protection|commission.*decision)\b",
+    "standard_contractual_clauses": r"\b(?:standard.*contractual.*clauses|scc|model.*clauses)\b",
+    "binding_corporate_rules": r"\b(?:binding.*corporate.*rules|bcr)\b",
+    "certification": r"\b(?:certification.*scheme|approved.*certification|binding.*code)\b",
+    "schrems_ii_measures": r"\b(?:schrems.*ii|supplementary.*measures|additional.*safeguards)\b"
+}
+
+# AI governance framework components
+GOVERNANCE_COMPONENTS = {
+    "ai_policy": r"\b(?:ai.*policy|artificial.*intelligence.*policy|ai.*governance.*policy)\b",
+    "ai_committee": r"\b(?:ai.*committee|ai.*board|ai.*governance.*committee|algorithm.*committee)\b",
+    "ai_risk_assessment": r"\b(?:ai.*risk.*assessment|algorithm.*risk.*assessment|ai.*impact.*assessment)\b",
+    "ai_training": r"\b(?:ai.*training|ai.*awareness|algorithm.*training|ai.*education)\b",
+    "ai_documentation": r"\b(?:ai.*documentation|algorithm.*documentation|model.*documentation)\b",
+    "ai_monitoring": r"\b(?:ai.*monitoring|algorithm.*monitoring|model.*monitoring)\b",
+    "ai_incident_response": r"\b(?:ai.*incident|algorithm.*incident|ai.*emergency.*response)\b",
+    "ai_vendor_management": r"\b(?:ai.*vendor|algorithm.*vendor|ai.*supplier.*management)\b"
+}
+
+
 class RealTimeComplianceMonitor:
     """Real-time compliance monitoring for GDPR and EU AI Act 2025."""
     
@@ -66,31 +211,14 @@ class RealTimeComplianceMonitor:
         """Continuous monitoring of AI systems for compliance changes."""
         findings = []
         
-        # AI system lifecycle monitoring
-        ai_lifecycle_patterns = {
-            "development_phase": r"\b(?:ai.*development|model.*training|algorithm.*design|system.*development)\b",
-            "testing_phase": r"\b(?:ai.*testing|model.*validation|system.*testing|performance.*testing)\b",
-            "deployment_phase": r"\b(?:ai.*deployment|model.*deployment|production.*deployment|system.*launch)\b",
-            "monitoring_phase": r"\b(?:ai.*monitoring|model.*monitoring|performance.*monitoring|system.*monitoring)\b",
-            "maintenance_phase": r"\b(?:ai.*maintenance|model.*maintenance|system.*updates|continuous.*improvement)\b"
-        }
-        
         detected_phases = []
-        for phase, pattern in ai_lifecycle_patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for phase, pattern in AI_LIFECYCLE_PATTERNS.items():
+            if _RULES.search(pattern, content):
                 detected_phases.append(phase)
         
-        # Continuous risk assessment patterns
-        risk_indicators = {
-            "high_risk_changes": r"\b(?:model.*update|algorithm.*change|data.*change|system.*modification)\b",
-            "performance_degradation": r"\b(?:performance.*degradation|accuracy.*drop|bias.*increase|error.*rate.*increase)\b",
-            "new_use_cases": r"\b(?:new.*use.*case|expanded.*functionality|additional.*purpose|scope.*change)\b",
-            "user_feedback": r"\b(?:user.*feedback|complaint|incident.*report|issue.*report)\b"
-        }
-        
         continuous_risks = []
-        for risk_type, pattern in risk_indicators.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for risk_type, pattern in RISK_INDICATORS.items():
+            if _RULES.search(pattern, content):
                 continuous_risks.append(risk_type)
         
         if detected_phases and continuous_risks:
@@ -120,56 +248,12 @@ class RealTimeComplianceMonitor:
         """Smart threshold detection for automated DPIA triggering."""
         findings = []
         
-        # Enhanced DPIA triggering algorithm
-        dpia_risk_factors = {
-            "automated_decision_making": {
-                "pattern": r"\b(?:automated.*decision|algorithmic.*decision|ai.*decision|machine.*decision)\b",
-                "weight": 25,
-                "description": "Automated decision-making detected"
-            },
-            "large_scale_processing": {
-                "pattern": r"\b(?:large.*scale|mass.*processing|bulk.*data|millions.*records|thousands.*users)\b",
-                "weight": 20,
-                "description": "Large-scale processing detected"
-            },
-            "special_categories": {
-                "pattern": r"\b(?:health.*data|biometric.*data|genetic.*data|racial.*data|political.*opinion)\b",
-                "weight": 30,
-                "description": "Special categories of personal data detected"
-            },
-            "systematic_monitoring": {
-                "pattern": r"\b(?:systematic.*monitoring|surveillance|tracking|behavioral.*analysis)\b",
-                "weight": 25,
-                "description": "Systematic monitoring detected"
-            },
-            "vulnerable_subjects": {
-                "pattern": r"\b(?:children|minors|elderly|disabled|vulnerable.*individuals)\b",
-                "weight": 20,
-                "description": "Vulnerable data subjects detected"
-            },
-            "innovative_technology": {
-                "pattern": r"\b(?:ai|machine.*learning|deep.*learning|neural.*network|innovative.*technology)\b",
-                "weight": 15,
-                "description": "Innovative technology detected"
-            },
-            "public_area_monitoring": {
-                "pattern": r"\b(?:cctv|video.*surveillance|facial.*recognition|public.*monitoring)\b",
-                "weight": 25,
-                "description": "Public area monitoring detected"
-            },
-            "cross_border_processing": {
-                "pattern": r"\b(?:cross.*border|international.*transfer|third.*country)\b",
-                "weight": 15,
-                "description": "Cross-border data processing detected"
-            }
-        }
-        
         # Calculate DPIA risk score
         total_risk_score = 0
         triggered_factors = []
         
-        for factor, config in dpia_risk_factors.items():
-            if re.search(config["pattern"], content, re.IGNORECASE):
+        for factor, config in DPIA_RISK_FACTORS.items():
+            if _RULES.search(config["pattern"], content):
                 total_risk_score += config["weight"]
                 triggered_factors.append({
                     'factor': factor,
@@ -177,13 +261,7 @@ class RealTimeComplianceMonitor:
                     'description': config['description']
                 })
         
-        # Check for existing DPIA
-        existing_dpia_patterns = [
-            r"\b(?:dpia|data.*protection.*impact.*assessment|privacy.*impact.*assessment)\b",
-            r"\b(?:impact.*assessment.*completed|dpia.*conducted|privacy.*assessment.*done)\b"
-        ]
-        
-        has_existing_dpia = any(re.search(pattern, content, re.IGNORECASE) for pattern in existing_dpia_patterns)
+        has_existing_dpia = any(_RULES.search(pattern, content) for pattern in EXISTING_DPIA_PATTERNS)
         
         # Automated DPIA triggering logic
         if total_risk_score >= self.compliance_thresholds['dpia_trigger_score'] and not has_existing_dpia:
@@ -221,53 +299,13 @@ class RealTimeComplianceMonitor:
         """Automated assessment of Data Protection Officer appointment requirements."""
         findings = []
         
-        # DPO requirement scoring system
-        dpo_criteria = {
-            "public_authority": {
-                "pattern": r"\b(?:public.*authority|government.*body|municipal.*authority|state.*agency)\b",
-                "score": 100,
-                "mandatory": True,
-                "description": "Public authority - DPO mandatory"
-            },
-            "large_scale_monitoring": {
-                "pattern": r"\b(?:large.*scale.*monitoring|systematic.*monitoring|mass.*surveillance)\b",
-                "score": 100,
-                "mandatory": True,
-                "description": "Large-scale systematic monitoring - DPO mandatory"
-            },
-            "special_categories_core": {
-                "pattern": r"\b(?:core.*activit.*special|primary.*business.*sensitive|main.*operation.*health)\b",
-                "score": 100,
-                "mandatory": True,
-                "description": "Core activities involve special categories - DPO mandatory"
-            },
-            "employee_count_large": {
-                "pattern": r"\b(?:250.*employ|500.*employ|1000.*employ|large.*organization|enterprise)\b",
-                "score": 80,
-                "mandatory": False,
-                "description": "Large organization - DPO recommended"
-            },
-            "international_operations": {
-                "pattern": r"\b(?:international.*operation|multinational|global.*company|cross.*border.*business)\b",
-                "score": 60,
-                "mandatory": False,
-                "description": "International operations - DPO beneficial"
-            },
-            "complex_processing": {
-                "pattern": r"\b(?:complex.*processing|multiple.*data.*sources|advanced.*analytics)\b",
-                "score": 40,
-                "mandatory": False,
-                "description": "Complex processing operations"
-            }
-        }
-        
         # Calculate DPO requirement score
         dpo_score = 0
         mandatory_criteria = []
         recommended_criteria = []
         
-        for criterion, config in dpo_criteria.items():
-            if re.search(config["pattern"], content, re.IGNORECASE):
+        for criterion, config in DPO_CRITERIA.items():
+            if _RULES.search(config["pattern"], content):
                 dpo_score += config["score"]
                 if config["mandatory"]:
                     mandatory_criteria.append({
@@ -281,13 +319,7 @@ class RealTimeComplianceMonitor:
                         'description': config['description']
                     })
         
-        # Check for existing DPO
-        existing_dpo_patterns = [
-            r"\b(?:data.*protection.*officer|dpo.*appointed|privacy.*officer|dpo.*contact)\b",
-            r"\b(?:dpo@|privacy@|dataprotection@)\b"
-        ]
-        
-        has_existing_dpo = any(re.search(pattern, content, re.IGNORECASE) for pattern in existing_dpo_patterns)
+        has_existing_dpo = any(_RULES.search(pattern, content) for pattern in EXISTING_DPO_PATTERNS)
         
         # Automated DPO assessment
         if mandatory_criteria and not has_existing_dpo:
@@ -335,26 +367,10 @@ class RealTimeComplianceMonitor:
             "no_adequacy": ["china", "russia", "india", "brazil", "australia"]  # Major countries without adequacy
         }
         
-        # Transfer detection patterns
-        transfer_patterns = {
-            "cloud_providers": r"\b(?:aws|azure|google.*cloud|oracle.*cloud|alibaba.*cloud|tencent.*cloud)\b",
-            "third_countries": r"\b(?:united.*states|usa|china|india|brazil|russia|australia|singapore)\b",
-            "data_processing": r"\b(?:data.*processing|server.*location|data.*center|hosting.*location)\b"
-        }
-        
-        # Safeguards detection
-        safeguard_patterns = {
-            "adequacy_decision": r"\b(?:adequacy.*decision|adequate.*protection|commission.*decision)\b",
-            "standard_contractual_clauses": r"\b(?:standard.*contractual.*clauses|scc|model.*clauses)\b",
-            "binding_corporate_rules": r"\b(?:binding.*corporate.*rules|bcr)\b",
-            "certification": r"\b(?:certification.*scheme|approved.*certification|binding.*code)\b",
-            "schrems_ii_measures": r"\b(?:schrems.*ii|supplementary.*measures|additional.*safeguards)\b"
-        }
-        
         # Detect transfers and countries
         detected_transfers = []
-        for transfer_type, pattern in transfer_patterns.items():
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for transfer_type, pattern in TRANSFER_PATTERNS.items():
+            matches = _RULES.findall(pattern, content)
             if matches:
                 detected_transfers.extend([(transfer_type, match.lower()) for match in matches])
         
@@ -375,8 +391,8 @@ class RealTimeComplianceMonitor:
         
         # Check for implemented safeguards
         implemented_safeguards = []
-        for safeguard, pattern in safeguard_patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for safeguard, pattern in SAFEGUARD_PATTERNS.items():
+            if _RULES.search(pattern, content):
                 implemented_safeguards.append(safeguard)
         
         # Enhanced cross-border validation
@@ -391,7 +407,7 @@ class RealTimeComplianceMonitor:
                 'description': f'{len(high_risk_transfers)} high-risk transfers detected without adequate safeguards',
                 'article_reference': 'GDPR Articles 44-49',
                 'high_risk_transfers': high_risk_transfers,
-                'missing_safeguards': list(safeguard_patterns.keys()),
+                'missing_safeguards': list(SAFEGUARD_PATTERNS.keys()),
                 'adequacy_status_summary': {
                     'no_adequacy': len([t for t in transfer_analysis if t['adequacy_status'] == 'no_adequacy']),
                     'partial_adequacy': len([t for t in transfer_analysis if t['adequacy_status'] == 'partial']),
@@ -409,30 +425,18 @@ class RealTimeComplianceMonitor:
         """Detect organizational AI governance framework compliance."""
         findings = []
         
-        # AI governance framework components
-        governance_components = {
-            "ai_policy": r"\b(?:ai.*policy|artificial.*intelligence.*policy|ai.*governance.*policy)\b",
-            "ai_committee": r"\b(?:ai.*committee|ai.*board|ai.*governance.*committee|algorithm.*committee)\b",
-            "ai_risk_assessment": r"\b(?:ai.*risk.*assessment|algorithm.*risk.*assessment|ai.*impact.*assessment)\b",
-            "ai_training": r"\b(?:ai.*training|ai.*awareness|algorithm.*training|ai.*education)\b",
-            "ai_documentation": r"\b(?:ai.*documentation|algorithm.*documentation|model.*documentation)\b",
-            "ai_monitoring": r"\b(?:ai.*monitoring|algorithm.*monitoring|model.*monitoring)\b",
-            "ai_incident_response": r"\b(?:ai.*incident|algorithm.*incident|ai.*emergency.*response)\b",
-            "ai_vendor_management": r"\b(?:ai.*vendor|algorithm.*vendor|ai.*supplier.*management)\b"
-        }
-        
         # Check implementation status
         implemented_components = []
         missing_components = []
         
-        for component, pattern in governance_components.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for component, pattern in GOVERNANCE_COMPONENTS.items():
+            if _RULES.search(pattern, content):
                 implemented_components.append(component)
             else:
                 missing_components.append(component)
         
         # AI governance maturity assessment
-        governance_maturity = len(implemented_components) / len(governance_components) * 100
+        governance_maturity = len(implemented_components) / len(GOVERNANCE_COMPONENTS) * 100
         
         if governance_maturity < 50:
             findings.append({
@@ -519,4 +523,12 @@ class RealTimeComplianceMonitor:
             "Maintain up-to-date privacy and AI compliance documentation"
         ])
         
-        return recommendations[:10]  # Limit to top 10 recommendations
\ No newline at end of file
+        return recommendations[:10]  # Limit to top 10 recommendations
+
+
+# Rule tables answered by the shared rule engine
+_RULES.register_rules(
+    AI_LIFECYCLE_PATTERNS, RISK_INDICATORS, DPIA_RISK_FACTORS, EXISTING_DPIA_PATTERNS, DPO_CRITERIA,
+    EXISTING_DPO_PATTERNS, TRANSFER_PATTERNS, SAFEGUARD_PATTERNS, GOVERNANCE_COMPONENTS,
+    fields=('pattern',),
+)
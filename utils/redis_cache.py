@@ -1,27 +1,223 @@
 """
 Redis Caching Layer for DataGuardian Pro
 Provides high-performance caching for scan results and user sessions
+
+Two tiers:
+- L1: bounded in-process LRU (entry and byte limits) holding serialized
+  payloads, with heap-ordered expiry so stale entries are dropped in
+  O(log n) instead of a scan of every key per operation
+- L2: Redis, with pipelined MGET/SET for batches
+
+When Redis is connected, L1 entries live at most `l1_ttl` seconds so other
+replicas' writes and deletes become visible quickly; without Redis, L1 is
+the only store and keeps the full TTL.
 """
 
-import redis
 import json
+import heapq
 import logging
+import threading
 import time
-from typing import Any, Optional, Dict, List
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 import os
+import uuid
 import base64
 from decimal import Decimal
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-class RedisCache:
-    """High-performance Redis cache manager"""
-    
+# L1 bounds; the byte limit counts serialized payloads plus key overhead
+L1_MAX_ENTRIES = int(os.getenv('DG_CACHE_L1_MAX_ENTRIES', '10000'))
+L1_MAX_BYTES = int(os.getenv('DG_CACHE_L1_MAX_MB', '64')) * 1024 * 1024
+
+# Longest an L1 entry may shadow Redis
+L1_TTL = int(os.getenv('DG_CACHE_L1_TTL', '30'))
+
+# How long get_or_set waits for another caller computing the same key
+SINGLE_FLIGHT_TIMEOUT = 60
+
+_ENTRY_OVERHEAD_BYTES = 96
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                       | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def _json_default(obj):
+    """Encode complex types as tagged objects"""
+    if isinstance(obj, datetime):
+        return {'__datetime__': obj.isoformat()}
+    elif isinstance(obj, timedelta):
+        return {'__timedelta__': obj.total_seconds()}
+    elif isinstance(obj, Decimal):
+        return {'__decimal__': str(obj)}
+    elif isinstance(obj, set):
+        return {'__set__': list(obj)}
+    elif isinstance(obj, bytes):
+        return {'__bytes__': base64.b64encode(obj).decode('utf-8')}
+    elif hasattr(obj, '__dict__'):
+        return {'__object__': obj.__dict__, '__class__': obj.__class__.__name__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_object_hook(dct):
+    """Decode tagged objects written by _json_default"""
+    if '__datetime__' in dct:
+        return datetime.fromisoformat(dct['__datetime__'])
+    elif '__timedelta__' in dct:
+        return timedelta(seconds=dct['__timedelta__'])
+    elif '__decimal__' in dct:
+        return Decimal(dct['__decimal__'])
+    elif '__set__' in dct:
+        return set(dct['__set__'])
+    elif '__bytes__' in dct:
+        return base64.b64decode(dct['__bytes__'])
+    elif '__object__' in dct:
+        # For security, don't reconstruct arbitrary objects
+        # Return the dict instead
+        return dct['__object__']
+    return dct
+
+
+def _revive(value):
+    """Apply _json_object_hook bottom-up, as json.loads(object_hook=...) does"""
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if isinstance(v, (dict, list)):
+                value[k] = _revive(v)
+        return _json_object_hook(value)
+    if isinstance(value, list):
+        for i, v in enumerate(value):
+            if isinstance(v, (dict, list)):
+                value[i] = _revive(v)
+    return value
+
+
+class LocalCacheTier:
+    """
+    Bounded in-process LRU cache of serialized payloads.
+
+    Storing bytes rather than objects makes size accounting exact and hands
+    every caller its own copy. Deadlines sit in a min-heap with lazy
+    deletion: a replaced or deleted entry leaves its old deadline behind,
+    which is skipped when popped and dropped when the heap is rebuilt.
+    """
+
+    def __init__(self, max_entries: int = L1_MAX_ENTRIES, max_bytes: int = L1_MAX_BYTES,
+                 on_remove: Optional[Callable[[str, str], None]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._on_remove = on_remove
+        # key -> (payload, expires_at, namespace)
+        self._entries: 'OrderedDict[str, Tuple[bytes, float, str]]' = OrderedDict()
+        self._deadlines: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    @staticmethod
+    def _size(key: str, payload: bytes) -> int:
+        return len(key) + len(payload) + _ENTRY_OVERHEAD_BYTES
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, payload: bytes, ttl: float, namespace: str) -> bool:
+        size = self._size(key, payload)
+        if size > self.max_bytes or self.max_entries <= 0:
+            self.delete(key)
+            return False
+        now = time.monotonic()
+        expires_at = now + ttl
+        with self._lock:
+            self._purge_expired(now)
+            self._pop(key)
+            self._entries[key] = (payload, expires_at, namespace)
+            self._bytes += size
+            heapq.heappush(self._deadlines, (expires_at, key))
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest, 'evictions')
+            if len(self._deadlines) > 2 * len(self._entries) + 64:
+                self._deadlines = [(entry[1], k) for k, entry in self._entries.items()]
+                heapq.heapify(self._deadlines)
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._pop(key) is not None
+
+    def clear_namespace(self, namespace: str) -> int:
+        with self._lock:
+            keys = [k for k, entry in self._entries.items() if entry[2] == namespace]
+            for k in keys:
+                self._pop(k)
+            return len(keys)
+
+    def _pop(self, key: str) -> Optional[Tuple[bytes, float, str]]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= self._size(key, entry[0])
+        return entry
+
+    def _remove(self, key: str, reason: str) -> None:
+        entry = self._pop(key)
+        if entry is not None and self._on_remove:
+            self._on_remove(entry[2], reason)
+
+    def _purge_expired(self, now: float) -> None:
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            expires_at, key = heapq.heappop(deadlines)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key, 'expirations')
+
+
+class _Flight:
+    """One in-progress get_or_set computation other callers can wait on"""
+
     def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class RedisCache:
+    """High-performance two-tier (in-process LRU + Redis) cache manager"""
+
+    def __init__(self, l1_max_entries: int = L1_MAX_ENTRIES, l1_max_bytes: int = L1_MAX_BYTES,
+                 l1_ttl: int = L1_TTL, auto_connect: bool = True):
         self.redis_client = None
-        self._fallback_cache = {}
-        self._fallback_expiry = {}
         self.stats = {
             'hits': 0,
             'misses': 0,
@@ -29,6 +225,11 @@ class RedisCache:
             'deletes': 0,
             'errors': 0
         }
+        self._namespace_stats: Dict[str, Counter] = defaultdict(Counter)
+        self._local = LocalCacheTier(l1_max_entries, l1_max_bytes, on_remove=self._record)
+        self.l1_ttl = l1_ttl
+        self._inflight: Dict[str, _Flight] = {}
+        self._inflight_lock = threading.Lock()
         # Optimized TTL values for different data types
         self.ttl_config = {
             'scan_results': 7200,      # 2 hours for scan results
@@ -39,28 +240,33 @@ class RedisCache:
             'default': 3600             # 1 hour default
         }
         self.default_ttl = self.ttl_config['default']  # Maintain backward compatibility
-        self.connect()
-    
+        if auto_connect:
+            self.connect()
+
     def connect(self):
         """Connect to Redis server with retry logic and graceful fallback"""
+        if not REDIS_AVAILABLE:
+            logger.warning("redis package not installed. Using in-memory cache only.")
+            return
+
         redis_urls = [
             os.getenv('REDIS_URL', ''),
             'redis://localhost:6379/0',
             'redis://127.0.0.1:6379/0',
             'redis://redis:6379/0'  # Docker container name
         ]
-        
+
         # Filter out empty URLs
         redis_urls = [url for url in redis_urls if url]
-        
+
         for attempt in range(3):  # 3 retry attempts
             for redis_url in redis_urls:
                 try:
                     logger.info(f"Attempting Redis connection to {redis_url} (attempt {attempt + 1}/3)")
-                    
+
                     # Enhanced Redis connection with performance settings
                     self.redis_client = redis.from_url(
-                        redis_url, 
+                        redis_url,
                         decode_responses=False,
                         socket_connect_timeout=2,  # Faster timeout for retries
                         socket_timeout=2,
@@ -68,250 +274,337 @@ class RedisCache:
                         health_check_interval=30,
                         max_connections=20  # Connection pooling
                     )
-                    
+
                     # Test connection
                     self.redis_client.ping()
                     logger.info(f"Redis cache connected successfully to {redis_url}")
                     return  # Success, exit function
-                    
+
                 except Exception as e:
                     logger.debug(f"Redis connection failed for {redis_url}: {e}")
                     self.redis_client = None
                     continue
-            
+
             # Wait before next attempt (exponential backoff)
             if attempt < 2:
                 wait_time = 2 ** attempt
                 logger.debug(f"Waiting {wait_time}s before retry...")
                 time.sleep(wait_time)
-        
-        logger.warning("All Redis connection attempts failed. Using in-memory fallback.")
-        self._init_fallback_cache()
-    
-    def _init_fallback_cache(self):
-        """Initialize in-memory fallback cache"""
-        self._fallback_cache = {}
-        self._fallback_expiry = {}
-        logger.info("In-memory fallback cache initialized")
-    
-    def _cleanup_expired_fallback_entries(self):
-        """Clean up expired entries from fallback cache"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, expiry in self._fallback_expiry.items() 
-            if current_time > expiry
-        ]
-        
-        for key in expired_keys:
-            self._fallback_cache.pop(key, None)
-            self._fallback_expiry.pop(key, None)
-    
+
+        logger.warning("All Redis connection attempts failed. Using in-memory cache only.")
+
     def _get_key(self, key: str, namespace: str = "dg") -> str:
         """Get namespaced cache key"""
         return f"{namespace}:{key}"
-    
+
+    def _record(self, namespace: str, field: str, count: int = 1) -> None:
+        """Count an event for the namespace (and the global totals)"""
+        self._namespace_stats[namespace][field] += count
+        if field in self.stats:
+            self.stats[field] += count
+
+    def _local_ttl(self, ttl: int, in_redis: bool) -> int:
+        return min(ttl, self.l1_ttl) if in_redis else ttl
+
+    def _encode(self, value: Any) -> bytes:
+        """Serialize to JSON bytes (orjson when installed)"""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the json module handles them
+        return self._safe_json_dumps(value).encode('utf-8')
+
+    def _decode(self, payload: bytes, key: str) -> Any:
+        """Deserialize a payload, returning None if it is unreadable"""
+        # Use only JSON deserialization for security
+        try:
+            if ORJSON_AVAILABLE:
+                value = orjson.loads(payload)
+                return _revive(value) if b'"__' in payload else value
+            decoded_value = payload.decode('utf-8') if isinstance(payload, bytes) else str(payload)
+            return self._safe_json_loads(decoded_value)
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to deserialize cached value for key {key}: {e}")
+            return None
+
     def get(self, key: str, namespace: str = "dg") -> Any:
-        """Get value from cache with fallback support"""
+        """Get value from L1, then Redis"""
         cache_key = self._get_key(key, namespace)
-        
-        # Try Redis first
+
+        payload = self._local.get(cache_key)
+        if payload is not None:
+            self._record(namespace, 'hits')
+            self._record(namespace, 'l1_hits')
+            return self._decode(payload, key)
+
         if self.redis_client:
             try:
-                value = self.redis_client.get(cache_key)
-                
-                if value is not None:
-                    self.stats['hits'] += 1
-                    # Use only JSON deserialization for security
-                    try:
-                        decoded_value = value.decode('utf-8') if isinstance(value, bytes) else str(value)
-                        return self._safe_json_loads(decoded_value)
-                    except (json.JSONDecodeError, TypeError, UnicodeDecodeError) as e:
-                        logger.warning(f"Failed to deserialize cached value for key {key}: {e}")
-                        # Return None instead of attempting unsafe pickle deserialization
-                        return None
-                        
+                payload = self.redis_client.get(cache_key)
             except Exception as e:
                 logger.debug(f"Redis get error for key {key}: {e}")
-                self.stats['errors'] += 1
-        
-        # Fallback to in-memory cache
-        self._cleanup_expired_fallback_entries()
-        if cache_key in self._fallback_cache:
-            self.stats['hits'] += 1
-            return self._fallback_cache[cache_key]
-        
-        self.stats['misses'] += 1
+                self._record(namespace, 'errors')
+                payload = None
+            if payload is not None:
+                self._record(namespace, 'hits')
+                self._record(namespace, 'l2_hits')
+                value = self._decode(payload, key)
+                if value is not None:
+                    self._local.set(cache_key, payload, self.l1_ttl, namespace)
+                return value
+
+        self._record(namespace, 'misses')
         return None
-    
+
+    def get_many(self, keys: List[str], namespace: str = "dg") -> Dict[str, Any]:
+        """Get several values; L1 misses are fetched with a single MGET"""
+        found: Dict[str, Any] = {}
+        remote: List[str] = []
+        for key in keys:
+            payload = self._local.get(self._get_key(key, namespace))
+            if payload is None:
+                remote.append(key)
+                continue
+            value = self._decode(payload, key)
+            if value is not None:
+                found[key] = value
+                self._record(namespace, 'hits')
+                self._record(namespace, 'l1_hits')
+            else:
+                remote.append(key)
+
+        if remote and self.redis_client:
+            cache_keys = [self._get_key(key, namespace) for key in remote]
+            try:
+                payloads = self.redis_client.mget(cache_keys)
+            except Exception as e:
+                logger.debug(f"Redis mget error for {len(remote)} keys: {e}")
+                self._record(namespace, 'errors')
+                payloads = [None] * len(remote)
+            for key, cache_key, payload in zip(remote, cache_keys, payloads):
+                if payload is None:
+                    continue
+                value = self._decode(payload, key)
+                if value is not None:
+                    found[key] = value
+                    self._local.set(cache_key, payload, self.l1_ttl, namespace)
+                    self._record(namespace, 'hits')
+                    self._record(namespace, 'l2_hits')
+
+        misses = len(keys) - len(found)
+        if misses:
+            self._record(namespace, 'misses', misses)
+        return found
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None, namespace: str = "dg") -> bool:
-        """Set value in cache with fallback support"""
+        """Set value in Redis and L1"""
         cache_key = self._get_key(key, namespace)
         expiry = ttl or self.default_ttl
-        success = False
-        
-        # Try Redis first
+        try:
+            payload = self._encode(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cache value for key {key} is not serializable: {e}")
+            self._record(namespace, 'errors')
+            return False
+
+        in_redis = False
         if self.redis_client:
             try:
-                # Use only JSON serialization for security
-                serialized_value = self._safe_json_dumps(value)
-                
-                result = self.redis_client.setex(cache_key, expiry, serialized_value)
-                
-                if result:
-                    self.stats['sets'] += 1
-                    success = True
-                else:
-                    self.stats['errors'] += 1
-                    
+                in_redis = bool(self.redis_client.set(cache_key, payload, ex=expiry))
+                if not in_redis:
+                    self._record(namespace, 'errors')
             except Exception as e:
                 logger.debug(f"Redis set error for key {key}: {e}")
-                self.stats['errors'] += 1
-        
-        # Always store in fallback cache as backup (with TTL)
-        self._cleanup_expired_fallback_entries()
-        self._fallback_cache[cache_key] = value
-        self._fallback_expiry[cache_key] = time.time() + expiry
-        
-        if not success:
-            self.stats['sets'] += 1  # Count fallback as successful set
-        
-        return True  # Always return True since we have fallback
-    
+                self._record(namespace, 'errors')
+
+        self._local.set(cache_key, payload, self._local_ttl(expiry, in_redis), namespace)
+        self._record(namespace, 'sets')
+        return True
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None, namespace: str = "dg") -> bool:
+        """Set several values in one pipelined round trip"""
+        expiry = ttl or self.default_ttl
+        payloads: Dict[str, bytes] = {}
+        for key, value in items.items():
+            try:
+                payloads[self._get_key(key, namespace)] = self._encode(value)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Cache value for key {key} is not serializable: {e}")
+                self._record(namespace, 'errors')
+
+        in_redis = False
+        if payloads and self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for cache_key, payload in payloads.items():
+                    pipe.set(cache_key, payload, ex=expiry)
+                in_redis = all(pipe.execute())
+                if not in_redis:
+                    self._record(namespace, 'errors')
+            except Exception as e:
+                logger.debug(f"Redis pipelined set error for {len(payloads)} keys: {e}")
+                self._record(namespace, 'errors')
+
+        local_ttl = self._local_ttl(expiry, in_redis)
+        for cache_key, payload in payloads.items():
+            self._local.set(cache_key, payload, local_ttl, namespace)
+        if payloads:
+            self._record(namespace, 'sets', len(payloads))
+        return len(payloads) == len(items)
+
     def _safe_json_dumps(self, value: Any) -> str:
         """Safely serialize value to JSON, handling complex types"""
-        def json_serializer(obj):
-            """Custom JSON serializer for complex types"""
-            if isinstance(obj, datetime):
-                return {'__datetime__': obj.isoformat()}
-            elif isinstance(obj, timedelta):
-                return {'__timedelta__': obj.total_seconds()}
-            elif isinstance(obj, Decimal):
-                return {'__decimal__': str(obj)}
-            elif isinstance(obj, set):
-                return {'__set__': list(obj)}
-            elif isinstance(obj, bytes):
-                return {'__bytes__': base64.b64encode(obj).decode('utf-8')}
-            elif hasattr(obj, '__dict__'):
-                return {'__object__': obj.__dict__, '__class__': obj.__class__.__name__}
-            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-        
-        return json.dumps(value, default=json_serializer, ensure_ascii=False)
-    
+        return json.dumps(value, default=_json_default, ensure_ascii=False)
+
     def _safe_json_loads(self, value: str) -> Any:
         """Safely deserialize JSON value, handling complex types"""
-        def json_deserializer(dct):
-            """Custom JSON deserializer for complex types"""
-            if '__datetime__' in dct:
-                return datetime.fromisoformat(dct['__datetime__'])
-            elif '__timedelta__' in dct:
-                return timedelta(seconds=dct['__timedelta__'])
-            elif '__decimal__' in dct:
-                return Decimal(dct['__decimal__'])
-            elif '__set__' in dct:
-                return set(dct['__set__'])
-            elif '__bytes__' in dct:
-                return base64.b64decode(dct['__bytes__'])
-            elif '__object__' in dct:
-                # For security, don't reconstruct arbitrary objects
-                # Return the dict instead
-                return dct['__object__']
-            return dct
-        
-        return json.loads(value, object_hook=json_deserializer)
-    
+        return json.loads(value, object_hook=_json_object_hook)
+
     def delete(self, key: str, namespace: str = "dg") -> bool:
         """Delete value from cache"""
-        if not self.redis_client:
-            return False
-            
-        try:
-            cache_key = self._get_key(key, namespace)
-            result = self.redis_client.delete(cache_key)
-            
-            if result:
-                self.stats['deletes'] += 1
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
-            self.stats['errors'] += 1
-            return False
-    
+        cache_key = self._get_key(key, namespace)
+        deleted = self._local.delete(cache_key)
+
+        if self.redis_client:
+            try:
+                deleted = bool(self.redis_client.delete(cache_key)) or deleted
+            except Exception as e:
+                logger.error(f"Cache delete error for key {key}: {e}")
+                self._record(namespace, 'errors')
+
+        if deleted:
+            self._record(namespace, 'deletes')
+        return deleted
+
     def exists(self, key: str, namespace: str = "dg") -> bool:
         """Check if key exists in cache"""
+        cache_key = self._get_key(key, namespace)
+        if self._local.get(cache_key) is not None:
+            return True
         if not self.redis_client:
             return False
-            
+
         try:
-            cache_key = self._get_key(key, namespace)
             return bool(self.redis_client.exists(cache_key))
         except Exception as e:
             logger.error(f"Cache exists error for key {key}: {e}")
             return False
-    
+
     def get_or_set(self, key: str, generator_func, ttl: Optional[int] = None, namespace: str = "dg") -> Any:
-        """Get value from cache or generate and set it"""
+        """
+        Get value from cache or generate and set it.
+
+        Concurrent misses on the same key are coalesced: one caller runs
+        generator_func and the others wait for its result (or its exception)
+        instead of all regenerating the value.
+        """
         value = self.get(key, namespace)
-        
-        if value is None:
+        if value is not None:
+            return value
+
+        cache_key = self._get_key(key, namespace)
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[cache_key] = _Flight()
+
+        if not leader:
+            self._record(namespace, 'coalesced')
+            if flight.done.wait(SINGLE_FLIGHT_TIMEOUT):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            logger.warning(f"Timed out waiting for cache value {cache_key}; generating it")
             value = generator_func()
             self.set(key, value, ttl, namespace)
-        
-        return value
-    
+            return value
+
+        try:
+            # Another leader may have finished between our miss and now
+            payload = self._local.get(cache_key)
+            value = self._decode(payload, key) if payload is not None else None
+            if value is None:
+                value = generator_func()
+                self.set(key, value, ttl, namespace)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            flight.done.set()
+
     def increment(self, key: str, amount: int = 1, namespace: str = "dg") -> Optional[int]:
         """Increment counter in cache"""
         if not self.redis_client:
             return None
-            
+
         try:
             cache_key = self._get_key(key, namespace)
+            self._local.delete(cache_key)
             result = self.redis_client.incr(cache_key, amount)
             return int(result) if isinstance(result, (int, str)) else None
         except Exception as e:
             logger.error(f"Cache increment error for key {key}: {e}")
             return None
-    
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
+        """Get cache statistics, with a per-namespace breakdown"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        stats = {
+            **self.stats,
+            'connected': False,
+            'hit_rate': self.stats['hits'] / lookups if lookups > 0 else 0,
+            'serializer': 'orjson' if ORJSON_AVAILABLE else 'json',
+            'l1': {
+                'entries': len(self._local),
+                'bytes': self._local.nbytes,
+                'max_entries': self._local.max_entries,
+                'max_bytes': self._local.max_bytes,
+                'ttl': self.l1_ttl,
+            },
+            'namespaces': {
+                namespace: dict(counts) for namespace, counts in list(self._namespace_stats.items())
+            },
+        }
         if not self.redis_client:
-            return {**self.stats, 'connected': False}
-            
+            return stats
+
         try:
             info = self.redis_client.info()
             db_info = info.get('db0', {}) if isinstance(info, dict) else {}
-            return {
-                **self.stats,
+            stats.update({
                 'connected': True,
                 'memory_used': info.get('used_memory_human', 'N/A') if isinstance(info, dict) else 'N/A',
                 'total_keys': db_info.get('keys', 0) if isinstance(db_info, dict) else 0,
-                'hit_rate': self.stats['hits'] / (self.stats['hits'] + self.stats['misses']) if (self.stats['hits'] + self.stats['misses']) > 0 else 0
-            }
+            })
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
-            return {**self.stats, 'connected': False}
-    
+        return stats
+
     def clear_namespace(self, namespace: str = "dg") -> int:
         """Clear all keys in namespace"""
+        local_count = self._local.clear_namespace(namespace)
         if not self.redis_client:
-            return 0
-            
+            return local_count
+
         try:
-            pattern = f"{namespace}:*"
-            keys = self.redis_client.keys(pattern)
-            
-            if keys:
-                # Convert keys to list if needed for proper unpacking
-                key_list = list(keys) if keys else []
-                deleted = self.redis_client.delete(*key_list)
-                deleted_count = int(deleted) if deleted is not None else 0
-                logger.info(f"Cleared {deleted_count} keys from namespace {namespace}")
-                return deleted_count
-            else:
-                return 0
-                
+            # SCAN in batches rather than KEYS, which blocks Redis on large keyspaces
+            deleted_count = 0
+            batch: List[bytes] = []
+            for cache_key in self.redis_client.scan_iter(match=f"{namespace}:*", count=1000):
+                batch.append(cache_key)
+                if len(batch) >= 500:
+                    deleted_count += int(self.redis_client.delete(*batch) or 0)
+                    batch = []
+            if batch:
+                deleted_count += int(self.redis_client.delete(*batch) or 0)
+            logger.info(f"Cleared {deleted_count} keys from namespace {namespace}")
+            return deleted_count
+
         except Exception as e:
             logger.error(f"Error clearing namespace {namespace}: {e}")
             return 0
@@ -422,11 +715,52 @@ class PerformanceCache:
         """Increment scan counter for analytics"""
         return self.cache.increment(f"scan_count:{scanner_type}", 1, self.namespace)
 
+class ComplianceSeriesCache:
+    """
+    Per-tenant cache for compliance series and forecasts.
+
+    Keys carry the organization's current generation token; storing a scan
+    replaces the token, so every cached entry of that tenant is invalidated
+    at once (on all replicas when Redis is connected) without listing keys.
+    """
+    
+    def __init__(self, redis_cache: RedisCache):
+        self.cache = redis_cache
+        self.namespace = "compliance_series"
+        self.ttl = 3600  # 1 hour
+        self.generation_ttl = 7 * 86400  # outlives every entry keyed on it
+    
+    def generation(self, organization_id: str) -> str:
+        """Current scan-data generation token of the tenant"""
+        key = f"generation:{organization_id}"
+        generation = self.cache.get(key, self.namespace)
+        if generation is None:
+            generation = uuid.uuid4().hex[:12]
+            self.cache.set(key, generation, self.generation_ttl, self.namespace)
+        return generation
+    
+    def _key(self, organization_id: str, key: str) -> str:
+        return f"{organization_id}:{self.generation(organization_id)}:{key}"
+    
+    def get(self, organization_id: str, key: str) -> Any:
+        """Get a cached value for the tenant"""
+        return self.cache.get(self._key(organization_id, key), self.namespace)
+    
+    def set(self, organization_id: str, key: str, value: Any) -> bool:
+        """Cache a value for the tenant until its next scan"""
+        return self.cache.set(self._key(organization_id, key), value, self.ttl, self.namespace)
+    
+    def invalidate_tenant(self, organization_id: str) -> bool:
+        """Drop every cached series and forecast of the tenant"""
+        return self.cache.set(f"generation:{organization_id}", uuid.uuid4().hex[:12],
+                              self.generation_ttl, self.namespace)
+
 # Global cache instances
 redis_cache = RedisCache()
 scan_cache = ScanResultsCache(redis_cache)
 session_cache = SessionCache(redis_cache)
 performance_cache = PerformanceCache(redis_cache)
+compliance_cache = ComplianceSeriesCache(redis_cache)
 
 def get_cache():
     """Get the main Redis cache instance"""
@@ -442,4 +776,8 @@ def get_session_cache():
 
 def get_performance_cache():
     """Get the performance cache"""
-    return performance_cache
\ No newline at end of file
+    return performance_cache
+
+def get_compliance_cache():
+    """Get the per-tenant compliance series cache"""
+    return compliance_cache
\ No newline at end of file
@@ -0,0 +1,856 @@
+"""
+DataGuardian Pro - Compiled Regulatory Rule Engine
+
+Shared matcher for the regex rules of the regulatory validators (GDPR, EU AI
+Act, UAVG). The validators keep their per-article rules and scoring; they ask
+the engine instead of calling re.search/finditer/findall on the full content
+for every pattern.
+
+- Each validator module registers its rule tables (register_rules). Their
+  patterns are parsed once and reduced to the keywords any match must
+  contain: r"\\bdata\\s+subject\\b" needs "data" and "subject", an
+  alternation needs the keywords of one of its branches, optional parts need
+  nothing.
+- All keywords are compiled into one keyword automaton (a trie rendered as a
+  single regex). A document is lower-cased and split into its distinct
+  tokens once; the automaton reads each distinct token once and remembers
+  its keywords for later documents.
+- A rule whose keywords do not all occur cannot match and is answered without
+  running its regex. The remaining rules run their precompiled regex; search
+  results are memoised per document, as several articles share patterns.
+- A rule that can never match a newline (or a full stop) only needs the lines
+  (or sentences) holding all keywords of one of its alternatives, so its
+  regex reads those segments instead of the whole text. The segments holding
+  each keyword come from one pass over the tokens of every line (sentence),
+  made the first time a rule asks for that separator.
+- An alternation whose branches each stay within segments or start with
+  fixed text is split into its branches, and the next match is looked for
+  where the first branch next matches. On large documents a rule read across
+  the whole text that starts with fixed text is only tried where that text
+  occurs.
+- Compiled rule sets are cached per version (a digest of their patterns), so
+  validators sharing a rule set share the compiled engine.
+
+Answers are exactly those of the re module: keywords only decide which
+regexes can be skipped, and patterns the engine does not know fall back to re.
+"""
+
+import bisect
+import functools
+import hashlib
+import itertools
+import operator
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+# Shorter literal runs are not used as keywords (too common to filter anything)
+MIN_KEYWORD_LENGTH = 2
+
+# Cap on the alternatives of one requirement; larger products fall back to one side
+MAX_ALTERNATIVES = 32
+
+# Characters that split a document into segments for rules that cannot match
+# them (lines, then sentences); both are non-word characters, so \b behaves the
+# same at a segment end as before the separator
+SEPARATORS = ('\n', '.')
+
+# Rules read only the segments (lines, sentences) holding their keywords,
+# unless those make up more than this share of the document
+LOCAL_SCAN_SHARE = 0.5
+
+# In documents from this length on, rules that start with fixed text and are
+# read across the whole document are only tried where that text occurs
+LARGE_DOCUMENT_LENGTH = 65536
+
+# Distinct tokens whose keywords are remembered across documents
+TOKEN_CACHE_SIZE = 200000
+
+# Marks a keyword that starts a word (no word character right before it)
+WORD_START = '\x00'
+
+# Characters that re's IGNORECASE folds onto ASCII letters where str.lower() does not
+_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+_FOLD_CHARS = ''.join(chr(code) for code in _FOLD)
+
+_REPEATS = tuple(op for op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+                               getattr(sre_constants, 'POSSESSIVE_REPEAT', None)) if op is not None)
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+# Any-of list of all-of keyword sets; None when no keyword is required
+Requirement = Optional[List[FrozenSet[str]]]
+
+
+def _all_of(a: Requirement, b: Requirement) -> Requirement:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    product = list({x | y for x in a for y in b})
+    if len(product) <= MAX_ALTERNATIVES:
+        return product
+    return a if len(a) <= len(b) else b
+
+
+def _any_of(requirements: List[Requirement]) -> Requirement:
+    if any(requirement is None for requirement in requirements):
+        return None
+    return list({alternative for requirement in requirements for alternative in requirement})
+
+
+def _run_requirement(run: List[str], word_start: bool) -> Requirement:
+    if len(run) < MIN_KEYWORD_LENGTH:
+        return None
+    keyword = ''.join(run)
+    if word_start and _is_word_char(keyword[0]):
+        keyword = WORD_START + keyword
+    return [frozenset([keyword])]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _before_word(op: Any, av: Any) -> bool:
+    """Whether the text matched by an item ends where a word may start (\\b, \\s, \\s+)"""
+    if op is sre_constants.AT:
+        return av in (sre_constants.AT_BOUNDARY, sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING)
+    if op in _REPEATS:
+        return av[0] >= 1 and len(av[2]) == 1 and _before_word(*av[2][0])
+    if op is sre_constants.IN:
+        return av == [(sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE)]
+    return False
+
+
+def _sequence_requirement(items: Iterable[Any], word_start: bool = False) -> Requirement:
+    """
+    Args:
+        items: Parsed pattern sequence
+        word_start: Whether the sequence starts where no word character precedes it
+    """
+    requirement: Requirement = None
+    run: List[str] = []
+    run_word_start = False
+    for op, av in items:
+        if op is sre_constants.LITERAL and 0 < av < 128:
+            if not run:
+                run_word_start = word_start
+            run.append(chr(av).lower())
+            word_start = False
+            continue
+        if op is sre_constants.BRANCH and run:
+            # The parser moves the common prefix of the alternatives in front
+            # of the branch; put it back so every alternative keeps its keyword
+            prefix = [(sre_constants.AT, sre_constants.AT_BOUNDARY)] if run_word_start else []
+            prefix += [(sre_constants.LITERAL, ord(char)) for char in run]
+            requirement = _all_of(requirement, _any_of([_sequence_requirement(prefix + list(branch))
+                                                        for branch in av[1]]))
+            run = []
+            word_start = False
+            continue
+        requirement = _all_of(requirement, _run_requirement(run, run_word_start))
+        run = []
+        if op is sre_constants.SUBPATTERN:
+            requirement = _all_of(requirement, _sequence_requirement(av[-1], word_start))
+        elif op is sre_constants.BRANCH:
+            requirement = _all_of(requirement, _any_of([_sequence_requirement(branch, word_start)
+                                                        for branch in av[1]]))
+        elif op in _REPEATS and av[0] >= 1:
+            requirement = _all_of(requirement, _sequence_requirement(av[2], word_start))
+        elif op is _ATOMIC_GROUP:
+            requirement = _all_of(requirement, _sequence_requirement(av, word_start))
+        word_start = _before_word(op, av)
+    return _all_of(requirement, _run_requirement(run, run_word_start))
+
+
+def pattern_keywords(pattern: str) -> Requirement:
+    """
+    Keywords a match of pattern must contain (lower case).
+
+    Returns:
+        Alternatives of keyword sets, one of which occurs in any text the
+        pattern matches; None if no keyword is certain
+    """
+    try:
+        return _sequence_requirement(sre_parse.parse(pattern))
+    except (re.error, RecursionError, TypeError):
+        return None
+
+
+_CATEGORY_CLASSES = {
+    sre_constants.CATEGORY_DIGIT: r'\d', sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s', sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w', sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+
+def _set_matches(items: List[Any], char: str) -> bool:
+    code = ord(char)
+    negate = False
+    hits = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            hits = hits or av == code
+        elif op is sre_constants.RANGE:
+            hits = hits or av[0] <= code <= av[1]
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_CLASSES:
+            hits = hits or re.match(_CATEGORY_CLASSES[av], char) is not None
+        else:
+            return True
+    return hits != negate
+
+
+def _avoids(items: Iterable[Any], char: str, dotall: bool) -> bool:
+    """Whether no match of the sequence, lookaheads included, contains char"""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            if av == ord(char):
+                return False
+        elif op is sre_constants.NOT_LITERAL:
+            if av != ord(char):
+                return False
+        elif op is sre_constants.ANY:
+            if dotall or char != '\n':
+                return False
+        elif op is sre_constants.IN:
+            if _set_matches(av, char):
+                return False
+        elif op is sre_constants.AT:
+            # $ and \Z would also match at the end of a segment searched on its own
+            if av in (sre_constants.AT_END, sre_constants.AT_END_STRING):
+                return False
+        elif op is sre_constants.SUBPATTERN:
+            if not _avoids(av[-1], char, (dotall or bool(av[1] & re.DOTALL)) and not av[2] & re.DOTALL):
+                return False
+        elif op is sre_constants.BRANCH:
+            if not all(_avoids(branch, char, dotall) for branch in av[1]):
+                return False
+        elif op in _REPEATS:
+            if not _avoids(av[2], char, dotall):
+                return False
+        elif op is _ATOMIC_GROUP:
+            if not _avoids(av, char, dotall):
+                return False
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Lookbehinds see the text before a segment; lookaheads are cut at its end
+            if av[0] > 0 and not _avoids(av[1], char, dotall):
+                return False
+        elif op is sre_constants.GROUPREF_EXISTS:
+            if not all(_avoids(branch, char, dotall) for branch in av[1:] if branch is not None):
+                return False
+        elif op is not sre_constants.GROUPREF:
+            return False
+    return True
+
+
+def segment_separator(pattern: str, flags: int = 0) -> Optional[str]:
+    """The first of SEPARATORS no match of pattern contains, if any"""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, RecursionError, TypeError):
+        return None
+    dotall = bool(parsed.state.flags & re.DOTALL)
+    return next((char for char in SEPARATORS if _avoids(parsed, char, dotall)), None)
+
+
+def leading_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """
+    The text (lower case) every match of pattern starts with, after any
+    leading assertions; None if it is shorter than MIN_KEYWORD_LENGTH.
+    """
+    try:
+        items = sre_parse.parse(pattern, flags)
+    except (re.error, RecursionError, TypeError):
+        return None
+    run: List[str] = []
+    while items:
+        op, av = items[0]
+        if op is sre_constants.SUBPATTERN:
+            items = list(av[-1]) + list(items[1:])
+            continue
+        if op is sre_constants.AT and not run:
+            items = items[1:]
+            continue
+        if op is not sre_constants.LITERAL or not 0 < av < 128:
+            break
+        run.append(chr(av).lower())
+        items = items[1:]
+    return ''.join(run) if len(run) >= MIN_KEYWORD_LENGTH else None
+
+
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _top_level(pattern: str) -> Tuple[List[int], List[Tuple[int, int, List[int]]]]:
+    """
+    Positions of the top-level | of pattern, and the top-level groups as
+    (start, end, positions of their own |)
+    """
+    bars: List[int] = []
+    groups: List[Tuple[int, int, List[int]]] = []
+    stack: List[Tuple[int, List[int]]] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            index += 2
+            continue
+        if char == '[':
+            index += 2 if pattern.startswith('[^', index) else 1
+            index += 1 if pattern.startswith(']', index) else 0
+            while index < len(pattern) and pattern[index] != ']':
+                index += 2 if pattern[index] == '\\' else 1
+        elif char == '(':
+            stack.append((index, []))
+        elif char == ')':
+            start, group_bars = stack.pop()
+            if not stack:
+                groups.append((start, index + 1, group_bars))
+        elif char == '|':
+            (stack[-1][1] if stack else bars).append(index)
+        index += 1
+    return bars, groups
+
+
+def split_alternatives(pattern: str) -> Optional[List[str]]:
+    """
+    Split a rule on its top-level alternation: A|B gives [A, B] and
+    X(?:A|B)Y gives [X(?:A)Y, X(?:B)Y]. A text position starts a match of
+    pattern exactly where it starts a match of one of the parts.
+
+    Returns:
+        The parts, or None if pattern has no alternation that splits this way
+        (backreferences, inline flags, quantified or atomic groups)
+    """
+    if _BACKREFERENCE.search(pattern) or _GLOBAL_FLAGS.match(pattern):
+        return None
+    try:
+        bars, groups = _top_level(pattern)
+    except IndexError:
+        return None
+    if bars:
+        bounds = [-1] + bars + [len(pattern)]
+        return [pattern[start + 1:end] for start, end in zip(bounds, bounds[1:])]
+    for start, end, group_bars in groups:
+        if pattern.startswith('(?:', start):
+            body = start + 3
+        elif not pattern.startswith('(?', start):
+            body = start + 1
+        else:
+            continue
+        if not group_bars or pattern.startswith(('*', '+', '?', '{'), end):
+            continue
+        bounds = [body - 1] + group_bars + [end - 1]
+        return [f"{pattern[:start]}(?:{pattern[low + 1:high]}){pattern[end:]}"
+                for low, high in zip(bounds, bounds[1:])]
+    return None
+
+
+def fold_case(text: str) -> str:
+    """Lower-case text the way IGNORECASE matching sees ASCII letters"""
+    if any(char in text for char in _FOLD_CHARS):
+        text = text.translate(_FOLD)
+    return text.lower()
+
+
+def trie_pattern(node: Dict[str, Any]) -> str:
+    """
+    Regex source for a character trie (nested dicts, '' marking a word end)
+    that matches the longest word at the current position.
+    """
+    branches = [re.escape(char) + trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if '' in node:
+        # Longer words first; the prefix itself is implied by the longer match
+        return f"(?:{body})?" if len(branches) == 1 else f"{body}?"
+    return body
+
+
+def _trie_regex(keywords: Iterable[str]) -> Any:
+    """
+    Regex reporting, at every position where a keyword starts, the longest
+    one as (keyword, '') at the start of a word and ('', keyword) elsewhere
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    if not trie:
+        return None
+    body = trie_pattern(trie)
+    return re.compile(f"(?=(?<!\\w)({body})|({body}))")
+
+
+class KeywordAutomaton:
+    """Finds which of a set of keywords occur in a text"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = frozenset(keywords)
+        # Keywords without whitespace lie within one whitespace-separated token
+        self._spaced = [keyword for keyword in self.keywords if any(char.isspace() for char in keyword)]
+        words = {keyword.lstrip(WORD_START) for keyword in self.keywords.difference(self._spaced)}
+        self._regex = _trie_regex(words)
+        # A match reports the longest keyword starting at a position; shorter
+        # keywords starting there are its prefixes
+        self._prefixes = {word: self._known(word, '') for word in words}
+        self._word_prefixes = {word: self._known(word, WORD_START) for word in words}
+        self._tokens: Dict[str, FrozenSet[str]] = {}
+
+    def _known(self, word: str, mark: str) -> List[str]:
+        """Keywords among the prefixes of word (word included)"""
+        prefixes = (mark + word[:i] for i in range(1, len(word) + 1))
+        return [prefix for prefix in prefixes if prefix in self.keywords]
+
+    def _token_keywords(self, token: str) -> FrozenSet[str]:
+        found: Set[str] = set()
+        for word_start, word in set(self._regex.findall(token)):
+            if word_start:
+                found.update(self._prefixes[word_start])
+                found.update(self._word_prefixes[word_start])
+            else:
+                found.update(self._prefixes[word])
+        return frozenset(found)
+
+    def find(self, text: str) -> Set[str]:
+        """Keywords occurring in text (already case-folded)"""
+        # Word starts of spaced keywords are not checked; reporting one too many is safe
+        found = {keyword for keyword in self._spaced if keyword.lstrip(WORD_START) in text}
+        if self._regex is None:
+            return found
+        # Documents share most of their tokens; each distinct token is read once
+        for token in set(text.split()):
+            keywords = self.token_keywords(token)
+            if keywords:
+                found.update(keywords)
+        return found
+
+    def segment_keywords(self, segments: List[str]) -> Dict[str, int]:
+        """
+        Segments (already case-folded) holding each keyword without whitespace.
+
+        Returns:
+            Per keyword a mask: byte i of the little-endian int is 1 when
+            segment i holds the keyword, so masks intersect with &
+        """
+        marks: Dict[str, bytearray] = {}
+        count = len(segments)
+        tokens = self._tokens
+        for number, segment in enumerate(segments):
+            for token in segment.split():
+                keywords = tokens.get(token)
+                if keywords is None:
+                    keywords = self.token_keywords(token)
+                for keyword in keywords:
+                    found = marks.get(keyword)
+                    if found is None:
+                        found = marks[keyword] = bytearray(count)
+                    found[number] = 1
+        return {keyword: int.from_bytes(found, 'little') for keyword, found in marks.items()}
+
+    def token_keywords(self, token: str) -> FrozenSet[str]:
+        """Keywords without whitespace occurring in a token (already case-folded)"""
+        tokens = self._tokens
+        keywords = tokens.get(token)
+        if keywords is None:
+            if len(tokens) >= TOKEN_CACHE_SIZE:
+                tokens.clear()
+            keywords = tokens[token] = self._token_keywords(token)
+        return keywords
+
+
+_UNKNOWN = object()
+
+
+class Rule:
+    """
+    A compiled rule: its keyword requirement, regex and segment separator.
+    A rule that can match across every separator and is an alternation keeps
+    its parts (split_alternatives), each with its own requirement and
+    separator, so that it need not read the whole document.
+    """
+
+    __slots__ = ('requirement', 'keywords', 'single', 'regex', 'separator', 'anchor', 'parts')
+
+    def __init__(self, pattern: str, flags: int, requirement: Requirement, with_parts: bool = True):
+        self.requirement = requirement
+        self.keywords = frozenset().union(*requirement) if requirement else frozenset()
+        # Whether each alternative is a single keyword
+        self.single = requirement is not None and all(len(alternative) == 1 for alternative in requirement)
+        self.regex = re.compile(pattern, flags)
+        self.separator = segment_separator(pattern, flags)
+        # Text every match starts with, for rules read across the whole document
+        self.anchor = leading_literal(pattern, flags) if self.separator is None else None
+        self.parts: Optional[List['Rule']] = None
+        if with_parts and self.separator is None and requirement is not None:
+            parts = [Rule(part, flags, pattern_keywords(part), False) for part in split_alternatives(pattern) or ()]
+            # The document scan only looks for keywords of whole rules
+            if parts and all(part.requirement is not None and part.keywords <= self.keywords for part in parts) and \
+                    any(part.separator is not None or part.anchor is not None for part in parts):
+                self.parts = parts
+
+    def possible(self, scan: 'DocumentScan') -> bool:
+        """Whether the rule can match the scanned document"""
+        if self.requirement is None:
+            return True
+        if self.keywords.isdisjoint(scan.keywords):
+            return False
+        return self.single or scan.possible(self.requirement)
+
+
+class CompiledRules:
+    """Keyword requirements, automaton and regexes of one rule-set version"""
+
+    def __init__(self, patterns: Iterable[str], version: str):
+        self.version = version
+        self.requirements: Dict[str, Requirement] = {pattern: pattern_keywords(pattern) for pattern in patterns}
+        self.automaton = KeywordAutomaton(keyword for requirement in self.requirements.values() if requirement
+                                          for alternative in requirement for keyword in alternative)
+        self._rules: Dict[Any, Optional[Rule]] = {}
+
+    def rule(self, pattern: str, flags: int) -> Optional[Rule]:
+        """The compiled rule, None for rules not in the set"""
+        key = (pattern, flags)
+        rule = self._rules.get(key, _UNKNOWN)
+        if rule is _UNKNOWN:
+            requirement = self.requirements.get(pattern, _UNKNOWN)
+            if requirement is _UNKNOWN or flags & re.VERBOSE:
+                rule = None
+            else:
+                try:
+                    rule = Rule(pattern, flags, requirement)
+                except re.error:
+                    rule = None
+            self._rules[key] = rule
+        return rule
+
+
+class DocumentScan:
+    """Keywords found in one document, the segments holding them and memoised search results"""
+
+    __slots__ = ('content', 'version', 'keywords', 'searches', 'folded', 'segments', 'automaton')
+
+    def __init__(self, content: str, version: str, keywords: Set[str], folded: Optional[str] = None,
+                 automaton: Optional[KeywordAutomaton] = None):
+        self.content = content
+        self.version = version
+        self.keywords = keywords
+        self.searches: Dict[Any, Any] = {}
+        # Case-folded text, when its positions are those of content
+        self.folded = folded if folded is not None and len(folded) == len(content) else None
+        self.segments: Dict[str, Tuple[List[int], Dict[str, int]]] = {}
+        self.automaton = automaton
+
+    def possible(self, requirement: Requirement) -> bool:
+        """Whether a rule with this requirement can match the document"""
+        return requirement is None or any(alternative <= self.keywords for alternative in requirement)
+
+    def segment_index(self, separator: str) -> Tuple[List[int], Dict[str, int]]:
+        """
+        The segments between separators, read in one pass over their tokens.
+
+        Returns:
+            Start offset of each segment (and one past the end of the text),
+            and the mask of the segments holding each keyword
+        """
+        index = self.segments.get(separator)
+        if index is None:
+            pieces = self.folded.split(separator)
+            starts = list(itertools.accumulate((len(piece) + 1 for piece in pieces), initial=0))
+            index = self.segments[separator] = starts, self.automaton.segment_keywords(pieces)
+        return index
+
+    def spans(self, requirement: Requirement, separator: Optional[str]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Parts of the document a rule that never matches separator can match in:
+        the segments holding all keywords of a possible alternative, adjacent
+        segments merged.
+
+        Returns:
+            Sorted (start, end) spans, or None when the whole document is read
+        """
+        if requirement is None or separator is None or self.folded is None or self.automaton is None:
+            return None
+        starts, holding = self.segment_index(separator)
+        mask = 0
+        for alternative in requirement:
+            if alternative <= self.keywords:
+                # Keywords with whitespace are not read per token and do not narrow the segments
+                masks = [holding[keyword] for keyword in alternative if keyword in holding]
+                if not masks:
+                    return None
+                mask |= functools.reduce(operator.and_, masks)
+        marks = mask.to_bytes(len(starts) - 1, 'little')
+        spans: List[Tuple[int, int]] = []
+        covered = 0
+        first = marks.find(1)
+        while first != -1:
+            # A run of adjacent segments is one span
+            last = marks.find(0, first)
+            if last == -1:
+                last = len(marks)
+            start, end = starts[first], starts[last] - 1
+            covered += end - start
+            spans.append((start, end))
+            first = marks.find(1, last)
+        if covered > len(self.content) * LOCAL_SCAN_SHARE:
+            return None
+        return spans
+
+
+_compiled_cache: Dict[str, CompiledRules] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_rules(patterns: Iterable[str]) -> CompiledRules:
+    """Compiled rules for a pattern set, cached per rule-set version"""
+    patterns = sorted(set(patterns))
+    version = rule_set_version(patterns)
+    with _compiled_lock:
+        compiled = _compiled_cache.get(version)
+        if compiled is None:
+            compiled = _compiled_cache[version] = CompiledRules(patterns, version)
+        return compiled
+
+
+def rule_set_version(patterns: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for pattern in sorted(set(patterns)):
+        digest.update(pattern.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def table_patterns(table: Any, fields: Iterable[str] = ()) -> Set[str]:
+    """
+    Patterns of a rule table.
+
+    A table is a pattern, a list/tuple/set of tables, or a dict whose values
+    are tables. A dict holding any of fields is a rule entry: only those
+    fields hold patterns, its other values (descriptions, weights) are skipped.
+
+    Args:
+        table: Rule table
+        fields: Keys of rule entries that hold patterns
+
+    Returns:
+        Set of patterns
+
+    Raises:
+        TypeError: If the table holds a value that is not a pattern
+    """
+    fields = tuple(fields)
+    patterns: Set[str] = set()
+
+    def visit(value: Any) -> None:
+        if isinstance(value, str):
+            patterns.add(value)
+        elif isinstance(value, dict):
+            entry = [value[field] for field in fields if field in value]
+            for item in entry or value.values():
+                visit(item)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                visit(item)
+        else:
+            raise TypeError(f"Rule tables hold patterns, not {type(value).__name__}")
+
+    visit(table)
+    return patterns
+
+
+class RuleEngine:
+    """Drop-in for re.search/finditer/findall over the registered rule tables"""
+
+    def __init__(self):
+        self._patterns: Set[str] = set()
+        self._compiled: Optional[CompiledRules] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def register_rules(self, *tables: Any, fields: Iterable[str] = ()) -> 'RuleEngine':
+        """
+        Add rule tables to the rule set.
+
+        Args:
+            tables: Rule tables of a validator module (see table_patterns)
+            fields: Keys of rule entries that hold patterns
+
+        Returns:
+            The engine
+        """
+        patterns: Set[str] = set()
+        for table in tables:
+            patterns |= table_patterns(table, fields)
+        with self._lock:
+            if not patterns <= self._patterns:
+                self._patterns |= patterns
+                self._compiled = None
+        return self
+
+    @property
+    def version(self) -> str:
+        return self.compiled().version
+
+    def compiled(self) -> CompiledRules:
+        """Compiled rules of the current rule set (recompiled after new tables are registered)"""
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = compile_rules(self._patterns)
+                compiled = self._compiled
+        return compiled
+
+    def scan(self, content: str) -> DocumentScan:
+        """Keyword pass over a document, reused while the same document is queried"""
+        return self._scan(self.compiled(), content)
+
+    def _scan(self, compiled: CompiledRules, content: str) -> DocumentScan:
+        scan = getattr(self._local, 'scan', None)
+        if scan is None or scan.content is not content or scan.version != compiled.version:
+            folded = fold_case(content)
+            scan = DocumentScan(content, compiled.version, compiled.automaton.find(folded), folded,
+                                compiled.automaton)
+            self._local.scan = scan
+        return scan
+
+    def _candidate(self, pattern: str, content: str, flags: int) -> Optional[Tuple[Rule, DocumentScan]]:
+        """(rule, scan of content) for rules of the set, None for unknown rules"""
+        compiled = self.compiled()
+        rule = compiled.rule(pattern, flags)
+        if rule is None:
+            return None
+        return rule, self._scan(compiled, content)
+
+    @staticmethod
+    def _spans(rule: Rule, scan: DocumentScan) -> Optional[List[Tuple[int, int]]]:
+        """Parts of the document a rule can match in: [] for none, None for all of it"""
+        if not rule.possible(scan):
+            return []
+        return scan.spans(rule.requirement, rule.separator)
+
+    def _first(self, rule: Rule, scan: DocumentScan, pos: int) -> Optional[re.Match]:
+        """Leftmost match of a rule without parts starting at pos or later"""
+        spans = self._spans(rule, scan)
+        if spans is None:
+            if rule.anchor is not None and scan.folded is not None and len(scan.content) >= LARGE_DOCUMENT_LENGTH:
+                return self._anchored(rule, scan, pos)
+            return rule.regex.search(scan.content, pos)
+        first = max(bisect.bisect_right(spans, (pos, len(scan.content))) - 1, 0)
+        for start, end in itertools.islice(spans, first, None):
+            if end >= pos:
+                match = rule.regex.search(scan.content, max(start, pos), end)
+                if match is not None:
+                    return match
+        return None
+
+    @staticmethod
+    def _anchored(rule: Rule, scan: DocumentScan, pos: int) -> Optional[re.Match]:
+        """Leftmost match from pos, tried only where the rule's anchor text occurs"""
+        find = scan.folded.find
+        index = find(rule.anchor, pos)
+        while index != -1:
+            match = rule.regex.match(scan.content, index)
+            if match is not None:
+                return match
+            index = find(rule.anchor, index + 1)
+        return None
+
+    def _iter_parts(self, rule: Rule, scan: DocumentScan) -> Iterator[re.Match]:
+        """
+        Matches of a rule with parts: the next match starts where the first of
+        its parts next matches, and the rule's regex is run from there.
+        """
+        content = scan.content
+        upcoming: List[Any] = [_UNKNOWN] * len(rule.parts)
+        pos = 0
+        while True:
+            start = None
+            for index, part in enumerate(rule.parts):
+                match = upcoming[index]
+                if match is _UNKNOWN or match is not None and match.start() < pos:
+                    match = upcoming[index] = self._first(part, scan, pos)
+                if match is not None and (start is None or match.start() < start):
+                    start = match.start()
+            if start is None:
+                return
+            # No match starts before start, so searching from there finds the next one
+            match = rule.regex.search(content, start)
+            if match is None:
+                return
+            if match.end() == match.start():
+                yield from rule.regex.finditer(content, match.start())
+                return
+            yield match
+            pos = match.end()
+
+    def _finditer(self, rule: Rule, scan: DocumentScan) -> Iterator[re.Match]:
+        if rule.parts is not None:
+            return self._iter_parts(rule, scan) if rule.possible(scan) else iter(())
+        spans = self._spans(rule, scan)
+        if spans is None:
+            return rule.regex.finditer(scan.content)
+        return itertools.chain.from_iterable(rule.regex.finditer(scan.content, start, end) for start, end in spans)
+
+    def search(self, pattern: str, content: str, flags: int = re.IGNORECASE) -> Optional[re.Match]:
+        candidate = self._candidate(pattern, content, flags)
+        if candidate is None:
+            return re.search(pattern, content, flags)
+        rule, scan = candidate
+        key = (pattern, flags)
+        if key not in scan.searches:
+            if rule.parts is not None:
+                match = next(self._finditer(rule, scan), None)
+            else:
+                match = self._first(rule, scan, 0)
+            scan.searches[key] = match
+        return scan.searches[key]
+
+    def finditer(self, pattern: str, content: str, flags: int = re.IGNORECASE) -> Iterator[re.Match]:
+        candidate = self._candidate(pattern, content, flags)
+        if candidate is None:
+            return re.finditer(pattern, content, flags)
+        return self._finditer(*candidate)
+
+    def findall(self, pattern: str, content: str, flags: int = re.IGNORECASE) -> List[Any]:
+        candidate = self._candidate(pattern, content, flags)
+        if candidate is None:
+            return re.findall(pattern, content, flags)
+        rule, scan = candidate
+        if rule.parts is None:
+            spans = self._spans(rule, scan)
+            if spans is None:
+                return rule.regex.findall(content)
+            return [found for start, end in spans for found in rule.regex.findall(content, start, end)]
+        groups = rule.regex.groups
+        if groups == 0:
+            return [match.group() for match in self._finditer(rule, scan)]
+        if groups == 1:
+            return [match.group(1) or '' for match in self._finditer(rule, scan)]
+        return [match.groups('') for match in self._finditer(rule, scan)]
+
+
+_rule_engine = None
+_rule_engine_lock = threading.Lock()
+
+
+def get_rule_engine() -> RuleEngine:
+    """Get the rule engine shared by the regulatory validators"""
+    global _rule_engine
+    with _rule_engine_lock:
+        if _rule_engine is None:
+            _rule_engine = RuleEngine()
+        return _rule_engine